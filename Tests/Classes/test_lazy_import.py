@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+import subprocess
+import sys
+from json import loads
+
+import pytest
+
+from pyleecan.Classes._frozen import FrozenClass
+from pyleecan.Classes._lazy import LazyMethod
+from pyleecan.definitions import ROOT_DIR
+
+# Packages that must not be imported by the classes (only by some methods)
+HEAVY_MODULE_LIST = [
+    "SciDataTool",
+    "matplotlib.pyplot",
+    "pandas",
+    "scipy",
+    "sklearn",
+]
+
+# Code to run in a new interpreter: time to import and imported modules
+IMPORT_CODE = """
+import sys
+from json import dumps
+from time import perf_counter
+
+start = perf_counter()
+{code}
+duration = perf_counter() - start
+print(dumps({{"time": duration, "modules": list(sys.modules)}}))
+"""
+
+
+def run_import(code):
+    """Run the import code in a new interpreter
+
+    Parameters
+    ----------
+    code : str
+        import code to run
+
+    Returns
+    -------
+    duration : float
+        import time [s]
+    module_list : list
+        modules imported by the interpreter
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_CODE.format(code=code)],
+        capture_output=True,
+        check=True,
+        cwd=ROOT_DIR,
+        text=True,
+    )
+    result_dict = loads(result.stdout.splitlines()[-1])
+    return result_dict["time"], result_dict["modules"]
+
+
+def test_lazy_method():
+    """Check that the methods are imported on first use"""
+    from pyleecan.Classes.DataKeeper import DataKeeper
+
+    class LazyTest(FrozenClass):
+        get_begin = LazyMethod(
+            "pyleecan.Classes", "..Methods.Geometry.Segment.get_begin"
+        )
+        missing = LazyMethod("pyleecan.Classes", "..Methods.Missing.missing")
+
+    test_obj = LazyTest()
+    test_obj.begin = 1j
+    assert isinstance(LazyTest.__dict__["get_begin"], LazyMethod)
+    assert test_obj.get_begin() == 1j
+    # The LazyMethod is replaced by the method after the first use
+    assert LazyTest.get_begin is LazyTest.__dict__["get_begin"]
+    assert LazyTest.get_begin.__module__.endswith("Segment.get_begin")
+
+    # Method used as property setter
+    keeper = DataKeeper(symbol="N", keeper="lambda output: 2")
+    assert keeper.keeper(None) == 2
+
+    # The ImportError is raised on use
+    with pytest.raises(ImportError, match="Can't use LazyTest method missing"):
+        test_obj.missing()
+
+
+def test_load_switch():
+    """Check that load_switch imports the classes on first access"""
+    from pyleecan.Classes.Arc1 import Arc1
+    from pyleecan.Functions.load_switch import load_switch
+
+    assert "Arc1" in load_switch
+    assert "Arc42" not in load_switch
+    assert load_switch["Arc1"] is Arc1
+    assert load_switch.get("Arc42") is None
+    assert len(load_switch) == len(list(load_switch))
+
+
+def test_import_module():
+    """Check that importing the classes doesn't import the dependencies of the
+    methods"""
+    _, module_list = run_import(
+        "from pyleecan.Functions.load_switch import load_switch\n"
+        "from pyleecan.Classes.Simu1 import Simu1\n"
+        "from pyleecan.Classes.OutMag import OutMag\n"
+        "from pyleecan.Classes.OptiGenAlgNsga2Deap import OptiGenAlgNsga2Deap\n"
+        "from pyleecan.Functions.load import load\n"
+    )
+    for module_name in HEAVY_MODULE_LIST:
+        assert module_name not in module_list, module_name + " imported"
+
+
+@pytest.mark.long_5s
+def test_import_time():
+    """Import time of the classes (benchmark, the timings are only printed)"""
+    msg = "\nImport time (new interpreter):"
+    time_dict = dict()
+    for name, code in [
+        ("pyleecan", "import pyleecan"),
+        ("Functions.load_switch", "from pyleecan.Functions import load_switch"),
+        ("Classes.Simu1", "from pyleecan.Classes.Simu1 import Simu1"),
+        ("Classes.import_all", "import pyleecan.Classes.import_all"),
+    ]:
+        # Best of 3 (the first run fills the bytecode cache)
+        time_dict[name] = min(run_import(code)[0] for _ in range(3))
+        msg += "\n    " + name + ": " + str(round(time_dict[name] * 1000)) + " ms"
+    print(msg)
+
+
+if __name__ == "__main__":
+    test_lazy_method()
+    test_load_switch()
+    test_import_module()
+    test_import_time()
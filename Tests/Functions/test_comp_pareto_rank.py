@@ -0,0 +1,120 @@
+from time import time
+
+import pytest
+import numpy as np
+import matplotlib.pyplot as plt
+
+from pyleecan.Classes.XOutput import XOutput
+from pyleecan.Classes.DataKeeper import DataKeeper
+from pyleecan.Classes.OptiBayesAlgSmoot import OptiBayesAlgSmoot
+from pyleecan.Classes.OptiObjective import OptiObjective
+from pyleecan.Functions.Optimization.comp_non_dominated import comp_non_dominated
+from pyleecan.Functions.Optimization.comp_pareto_rank import comp_pareto_rank
+
+
+def get_rank_ref(fitness):
+    """Successive non dominated fronts by brute force"""
+    N = fitness.shape[0]
+    # dom[i, j] is True if j dominates i
+    dom = np.logical_and(
+        np.all(fitness[None, :, :] <= fitness[:, None, :], axis=2),
+        np.any(fitness[None, :, :] < fitness[:, None, :], axis=2),
+    )
+    rank = np.full(N, -1)
+    is_left = np.ones(N, dtype=bool)
+    r = 0
+    while np.any(is_left):
+        is_front = np.logical_and(is_left, ~np.any(dom[:, is_left], axis=1))
+        rank[is_front] = r
+        is_left[is_front] = False
+        r += 1
+    return rank
+
+
+@pytest.mark.parametrize("N_obj", [1, 2, 3, 4])
+def test_comp_pareto_rank(N_obj):
+    """Check the non dominated sorting against brute force"""
+    rng = np.random.default_rng(N_obj)
+    for N in [0, 1, 5, 200]:
+        # Rounded values to have duplicates and equal objectives
+        fitness = np.round(rng.random((N, N_obj)) * 10)
+        rank_ref = get_rank_ref(fitness)
+        np.testing.assert_array_equal(comp_pareto_rank(fitness), rank_ref)
+        np.testing.assert_array_equal(comp_non_dominated(fitness), rank_ref == 0)
+
+
+def get_xoutput():
+    """XOutput of an optimization with 2 objectives"""
+    fitness = np.array([[1, 5], [2, 2], [3, 1], [0, 0], [2, 3], [5, 1], [4, 4]])
+    is_valid = [True, True, True, False, True, True, True]
+
+    xoutput = XOutput()
+    xoutput["obj1"] = OptiObjective(symbol="obj1", result=fitness[:, 0].tolist())
+    xoutput["obj2"] = OptiObjective(symbol="obj2", result=fitness[:, 1].tolist())
+    xoutput["is_valid"] = DataKeeper(symbol="is_valid", result=is_valid)
+    xoutput["ngen"] = DataKeeper(symbol="ngen", result=[0, 0, 0, 1, 1, 1, 1])
+    return xoutput
+
+
+def test_get_pareto_index():
+    """Check the pareto front of a XOutput with invalid individuals"""
+    xoutput = get_xoutput()
+
+    # Index among valid individuals
+    assert xoutput.get_pareto_index() == [0, 1, 2]
+    rank, indx = xoutput.get_pareto_rank()
+    np.testing.assert_array_equal(indx, [0, 1, 2, 4, 5, 6])
+    np.testing.assert_array_equal(rank, [0, 0, 0, 1, 1, 2])
+
+
+def test_plot_generation_rank():
+    """Check the individuals colored by front"""
+    xoutput = get_xoutput()
+    fig, ax = plt.subplots()
+    xoutput.plot_generation("obj1", "obj2", ax=ax, is_rank=True)
+    np.testing.assert_array_equal(ax.collections[0].get_array(), [0, 0, 0, 1, 1, 2])
+    plt.close(fig)
+
+
+def test_plot_pareto_bayes_nb_front():
+    """Check that the Bayesian optimization can only plot the Pareto front"""
+    with pytest.raises(ValueError, match="only the Pareto front is available"):
+        OptiBayesAlgSmoot().plot_pareto("f1", "f2", nb_front=2)
+
+
+@pytest.mark.long_5s
+@pytest.mark.parametrize("N_obj", [2, 3])
+def test_comp_pareto_rank_benchmark(N_obj, N=20000):
+    """Sorting of 100 generations of 200 individuals"""
+    fitness = np.random.default_rng(0).random((N, N_obj))
+
+    start = time()
+    is_non_dom = comp_non_dominated(fitness)
+    time_front = time() - start
+    start = time()
+    rank = comp_pareto_rank(fitness)
+    time_rank = time() - start
+    print(
+        "\n"
+        + str(N_obj)
+        + " objectives, "
+        + str(N)
+        + " individuals: pareto front "
+        + format(time_front, ".3f")
+        + " s, "
+        + str(rank.max() + 1)
+        + " fronts "
+        + format(time_rank, ".3f")
+        + " s"
+    )
+    np.testing.assert_array_equal(is_non_dom, rank == 0)
+
+
+if __name__ == "__main__":
+    for N_obj in [1, 2, 3, 4]:
+        test_comp_pareto_rank(N_obj)
+    test_get_pareto_index()
+    test_plot_generation_rank()
+    test_plot_pareto_bayes_nb_front()
+    test_comp_pareto_rank_benchmark(2)
+    test_comp_pareto_rank_benchmark(3)
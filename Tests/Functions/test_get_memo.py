@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+import pytest
+import numpy as np
+
+from pyleecan.Classes.ImportMatrixVal import ImportMatrixVal
+from pyleecan.Functions.get_memo import StateKeyError, comp_state_key, get_memo
+
+
+def test_comp_state_key():
+    """Check that the keys compare the values and not the identity of the
+    objects"""
+    value = np.array([[1.0, 2.0], [3.0, 4.0]])
+    assert comp_state_key(ImportMatrixVal(value=value)) == comp_state_key(
+        ImportMatrixVal(value=value.copy())
+    )
+    assert comp_state_key(ImportMatrixVal(value=value)) != comp_state_key(
+        ImportMatrixVal(value=2 * value)
+    )
+
+    # Object arrays and sets are compared by value
+    obj_array = np.array([1, "a", None], dtype=object)
+    assert comp_state_key(obj_array) == comp_state_key(obj_array.copy())
+    assert comp_state_key(obj_array) != comp_state_key(obj_array[::-1])
+    assert comp_state_key({(1, 2), "a"}) == comp_state_key({"a", (1, 2)})
+
+    # The values that can't be hashed have no key (their id can be reused)
+    with pytest.raises(StateKeyError):
+        comp_state_key(bytearray(b"abc"))
+    obj_array[1] = bytearray(b"abc")
+    with pytest.raises(StateKeyError):
+        comp_state_key(obj_array)
+
+
+class Coeff:
+    """Unhashable argument"""
+
+    __hash__ = None
+
+    def __init__(self, value):
+        self.value = value
+
+
+def test_get_memo_unhashable():
+    """Check that get_memo calls the function at each call if the state of the
+    object or the arguments can't be compared"""
+    nb_call = [0]
+
+    def comp_sum(obj, coeff=Coeff(1)):
+        nb_call[0] += 1
+        return coeff.value * np.sum(obj.value)
+
+    obj = ImportMatrixVal(value=np.ones((2, 2)))
+    assert get_memo(obj, comp_sum) == 4
+    assert get_memo(obj, comp_sum) == 4
+    assert nb_call[0] == 1
+
+    # Unhashable argument
+    assert get_memo(obj, comp_sum, coeff=Coeff(2)) == 8
+    assert get_memo(obj, comp_sum, coeff=Coeff(3)) == 12
+    assert nb_call[0] == 3
+
+    # Unhashable property
+    obj.__dict__["_data"] = bytearray(b"abc")
+    assert get_memo(obj, comp_sum) == 4
+    assert get_memo(obj, comp_sum) == 4
+    assert nb_call[0] == 5
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+from os import replace
+from os.path import getsize, join
+from pickle import dumps, loads
+from time import time
+
+import pytest
+import numpy as np
+from h5py import File
+from SciDataTool import Data1D, DataTime, VectorField
+
+from pyleecan.Classes.CellMat import CellMat
+from pyleecan.Classes.DataKeeper import DataKeeper
+from pyleecan.Classes.MeshMat import MeshMat
+from pyleecan.Classes.MeshSolution import MeshSolution
+from pyleecan.Classes.NodeMat import NodeMat
+from pyleecan.Classes.OutMag import OutMag
+from pyleecan.Classes.Output import Output
+from pyleecan.Classes.SolutionMat import SolutionMat
+from pyleecan.Classes.XOutput import XOutput
+from pyleecan.Functions.load import load, load_file
+from pyleecan.Functions.Load.load_hdf5 import H5Array, read_lazy_array
+from pyleecan.Functions.Save.save_hdf5 import H5_FORMAT_VERSION, save_hdf5
+from pyleecan.definitions import DATA_DIR
+from Tests import save_load_path as save_path
+
+
+def get_xoutput(N=3, Nnode=5000, Nt=64, Na=256):
+    """XOutput with a torque DataKeeper and outputs with big fields"""
+    rng = np.random.default_rng(0)
+    xoutput = XOutput(nb_simu=N)
+    xoutput["Tem_av"] = DataKeeper(
+        name="Average torque", symbol="Tem_av", unit="N.m", result=[1.0, 2.0, None]
+    )
+    for ii in range(N):
+        Time = Data1D(name="time", unit="s", values=np.linspace(0, 1, Nt))
+        Angle = Data1D(name="angle", unit="rad", values=np.linspace(0, 6, Na))
+        Br = DataTime(
+            name="Airgap radial flux density",
+            unit="T",
+            symbol="B_r",
+            axes=[Time, Angle],
+            values=rng.random((Nt, Na)),
+        )
+        mesh = MeshMat(dimension=2)
+        mesh.node = NodeMat(
+            coordinate=rng.random((Nnode, 2)), nb_node=Nnode, indice=np.arange(Nnode)
+        )
+        mesh.cell["triangle"] = CellMat(
+            connectivity=rng.integers(0, Nnode, (2 * Nnode, 3)),
+            nb_cell=2 * Nnode,
+            nb_node_per_cell=3,
+            indice=np.arange(2 * Nnode),
+        )
+        solution = SolutionMat(
+            field=rng.random((Nt, 2 * Nnode)),
+            axis_name=["time", "indice"],
+            axis_size=[Nt, 2 * Nnode],
+            type_cell="triangle",
+            label="B",
+        )
+        output = Output()
+        output.mag = OutMag(
+            B=VectorField(name="B", symbol="B", components={"radial": Br}),
+            Tem_av=float(ii),
+            meshsolution=MeshSolution(mesh=[mesh], solution=[solution]),
+        )
+        xoutput.output_list.append(output)
+    return xoutput
+
+
+def test_save_load_hdf5_lazy():
+    """Check that the big arrays are read on first access"""
+    xoutput = get_xoutput()
+    file_path = join(save_path, "test_save_load_hdf5_lazy.h5")
+    xoutput.save(file_path)
+    with File(file_path, "r") as file:
+        assert file.attrs["__format_version__"] == H5_FORMAT_VERSION
+
+    xoutput2 = load(file_path)
+    assert xoutput2["Tem_av"].result == [1.0, 2.0, None]
+    node = xoutput2[0].mag.meshsolution.mesh[0].node
+    Br = xoutput2[0].mag.B.components["radial"]
+    # The mesh and the fields are not read
+    assert isinstance(node.__dict__["_coordinate"], H5Array)
+    assert not node.__dict__["_coordinate"].is_read()
+    assert isinstance(Br.__dict__["_values"], H5Array)
+    # Small arrays are read
+    assert isinstance(Br.axes[0].values, np.ndarray)
+
+    # Read on first access and replaced by the array
+    assert node.__dict__["_coordinate"].shape == (5000, 2)
+    assert not node.__dict__["_coordinate"].is_read()
+    assert type(node.coordinate) is np.ndarray
+    assert np.array_equal(
+        node.coordinate, xoutput[0].mag.meshsolution.mesh[0].node.coordinate
+    )
+    assert type(node.__dict__["_coordinate"]) is np.ndarray
+    assert np.array_equal(
+        Br.get_along("time", "angle")["B_r"],
+        xoutput[0].mag.B.components["radial"].values,
+    )
+    assert xoutput2 == xoutput
+
+    # Same objects with the lazy load, the copies and the pickle
+    xoutput3 = load(file_path)
+    assert xoutput3.copy() == xoutput
+    assert loads(dumps(xoutput3)) == xoutput
+    assert load_file(file_path) == xoutput
+
+
+def test_save_load_hdf5_lazy_array():
+    """Check the numpy operations on the arrays read on first access and the
+    dependency to the file"""
+    xoutput = get_xoutput(N=1)
+    file_path = join(save_path, "test_save_load_hdf5_lazy_array.h5")
+    xoutput.save(file_path)
+    node_ref = xoutput[0].mag.meshsolution.mesh[0].node
+    Br_ref = xoutput[0].mag.B.components["radial"]
+
+    # In-place operators on the property of a pyleecan object and of a
+    # SciDataTool object
+    xoutput2 = load(file_path)
+    node = xoutput2[0].mag.meshsolution.mesh[0].node
+    Br = xoutput2[0].mag.B.components["radial"]
+    node.coordinate += 1
+    assert type(node.coordinate) is np.ndarray
+    assert np.array_equal(node.coordinate, node_ref.coordinate + 1)
+    assert isinstance(Br.__dict__["_values"], H5Array)
+    Br.values *= 2
+    assert type(Br.values) is np.ndarray
+    assert np.array_equal(Br.values, 2 * Br_ref.values)
+
+    # Numpy functions and ufuncs
+    solution = load(file_path)[0].mag.meshsolution.solution[0]
+    field = solution.__dict__["_field"]
+    assert isinstance(field, H5Array)
+    assert np.concatenate([field, field]).shape == (128, 10000)
+    assert np.mean(field) == np.mean(xoutput[0].mag.meshsolution.solution[0].field)
+    assert np.array_equal(np.sqrt(field), np.sqrt(solution.field))
+
+    # The arrays must be read before moving the file
+    xoutput4 = load(file_path)
+    read_lazy_array(file_path)
+    xoutput3 = load(file_path)
+    move_path = join(save_path, "test_save_load_hdf5_lazy_array_moved.h5")
+    replace(file_path, move_path)
+    assert xoutput4 == xoutput
+    with pytest.raises(FileNotFoundError, match="moved or deleted"):
+        xoutput3[0].mag.meshsolution.mesh[0].node.coordinate
+
+
+def test_save_load_hdf5_overwrite():
+    """Check that an object can be saved in the file it was loaded from"""
+    file_path = join(save_path, "test_save_load_hdf5_overwrite.h5")
+    xoutput = get_xoutput(N=2)
+    xoutput.save(file_path)
+    xoutput2 = load(file_path)
+    xoutput2.output_list.pop(0)
+    xoutput2.save(file_path)
+    assert load(file_path)[0] == xoutput[1]
+
+
+def test_save_load_hdf5_compression():
+    """Check the streamed and the compressed formats"""
+    xoutput = get_xoutput(N=1)
+    file_path = join(save_path, "test_save_load_hdf5.h5")
+    file_dict_path = join(save_path, "test_save_load_hdf5_dict.h5")
+    file_gzip_path = join(save_path, "test_save_load_hdf5_gzip.h5")
+    xoutput.save(file_path)
+    save_hdf5(xoutput, file_dict_path, obj_dict=xoutput.as_dict(type_handle_ndarray=2))
+    xoutput.save(file_gzip_path, type_compression=1)
+    assert load(file_dict_path) == load(file_path) == xoutput
+    assert load(file_gzip_path) == xoutput
+    assert getsize(file_gzip_path) < getsize(file_path)
+    with File(file_gzip_path, "r") as file:
+        dataset = file[
+            "output_list/list_0/mag/meshsolution/mesh/list_0/node/coordinate"
+        ]
+        assert dataset.compression == "gzip"
+
+    # Machine (without big arrays)
+    machine = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    machine.save(file_path)
+    assert load(file_path) == machine
+
+
+@pytest.mark.long_5s
+def test_save_load_hdf5_benchmark():
+    """Compare the lazy and the full load of a XOutput (the timings are only
+    printed)"""
+    xoutput = get_xoutput(N=20, Nnode=20000)
+    file_path = join(save_path, "test_save_load_hdf5_benchmark.h5")
+    xoutput.save(file_path)
+
+    start = time()
+    xoutput2 = load_file(file_path)
+    Tem_av = xoutput2["Tem_av"].result
+    time_full = time() - start
+    start = time()
+    xoutput2 = load(file_path)
+    assert xoutput2["Tem_av"].result == Tem_av
+    time_lazy = time() - start
+    # The big arrays of the simulations are not read
+    for output in xoutput2.output_list:
+        node = output.mag.meshsolution.mesh[0].node
+        assert not node.__dict__["_coordinate"].is_read()
+        assert not output.mag.B.components["radial"].__dict__["_values"].is_read()
+    print(
+        "\nXOutput (20 simulations, "
+        + str(round(getsize(file_path) / 1e6))
+        + " MB): "
+        + str(round(time_full * 1000))
+        + " ms full load, "
+        + str(round(time_lazy * 1000))
+        + " ms lazy load"
+    )
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+from os.path import getsize, join
+from time import time
+import tracemalloc
+
+import pytest
+
+from pyleecan.Classes.DataKeeper import DataKeeper
+from pyleecan.Classes.Electrical import Electrical
+from pyleecan.Classes.LUTdq import LUTdq
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Functions.copy import copy_dict
+from pyleecan.Functions.load import load, load_file
+from pyleecan.Functions.Load.load_pkb import PkbFormatError, load_pkb
+from pyleecan.definitions import DATA_DIR
+from Tests import save_load_path as save_path
+from Tests.Functions.test_save_load_hdf5 import get_xoutput
+
+
+def test_save_load_pkb():
+    """Check the pkb format (the arrays are read in their own memory)"""
+    xoutput = get_xoutput(N=2)
+    file_path = join(save_path, "test_save_load_pkb.pkb")
+    xoutput.save(file_path)
+    xoutput2 = load(file_path)
+    assert xoutput2 == xoutput
+    assert xoutput2.parent is None
+    assert xoutput2[0].parent is xoutput2
+    assert xoutput2[0].mag.meshsolution.parent is xoutput2[0].mag
+    coordinate = xoutput2[0].mag.meshsolution.mesh[0].node.coordinate
+    assert coordinate.flags.writeable
+    coordinate[0, 0] = -1
+    assert xoutput2[1].mag.meshsolution.mesh[0].node.coordinate[0, 0] != -1
+
+    # Machine (the parent of the saved object is not saved)
+    machine = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    machine.stator.save(file_path)
+    stator = load(file_path)
+    assert stator == machine.stator
+    assert stator.parent is None
+    assert stator.winding.parent is stator
+
+    with pytest.raises(PkbFormatError):
+        load_pkb(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+
+
+def test_copy():
+    """Check the pickle copy against the as_dict/init_dict copy"""
+    machine = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    stator = machine.stator.copy()
+    assert stator == copy_dict(machine.stator) == machine.stator
+    assert stator.parent is None
+    assert machine.stator.parent is machine
+    assert stator.slot.parent is stator
+
+    # The copy has its own arrays and objects (even if they are shared)
+    xoutput = get_xoutput(N=1, Nnode=100)
+    Br = xoutput[0].mag.B.components["radial"]
+    xoutput[0].mag.B.components["tangential"] = Br
+    xoutput2 = xoutput.copy()
+    assert xoutput2 == xoutput
+    B = xoutput2[0].mag.B
+    assert B.components["radial"] is not B.components["tangential"]
+    B.components["radial"].values[0, 0] = -1
+    assert Br.values[0, 0] != -1
+    assert B.components["tangential"].values[0, 0] != -1
+
+    # The functions are kept
+    keeper = DataKeeper(symbol="N", keeper=lambda output: 2)
+    assert keeper.copy().keeper(None) == 2
+
+    # The LUT of the simulation is shared
+    simu = Simu1(machine=machine, elec=Electrical(LUT_enforced=LUTdq()))
+    simu2 = simu.copy()
+    assert simu2.elec.LUT_enforced is simu.elec.LUT_enforced
+    assert simu2.machine is not simu.machine
+    assert simu2.machine.parent is simu2
+
+
+@pytest.mark.long_5s
+def test_save_load_pkb_benchmark():
+    """Compare the pickle copy to the as_dict/init_dict copy and the pkb format
+    to the json and hdf5 formats (the timings are only printed)"""
+    xoutput = get_xoutput(N=4, Nnode=20000)
+
+    msg = "\nXOutput (4 simulations with meshsolution):"
+    time_dict = dict()
+    for name, copy_func in [("as_dict", copy_dict), ("pickle", type(xoutput).copy)]:
+        tracemalloc.start()
+        start = time()
+        assert copy_func(xoutput) == xoutput
+        time_dict[name] = time() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        msg += (
+            "\n    copy with "
+            + name
+            + ": "
+            + str(round(time_dict[name] * 1000))
+            + " ms, peak memory "
+            + str(round(peak / 1e6))
+            + " MB"
+        )
+
+    for ext in ["json", "h5", "pkb"]:
+        file_path = join(save_path, "test_save_load_pkb_benchmark." + ext)
+        start = time()
+        xoutput.save(file_path)
+        time_save = time() - start
+        start = time()
+        xoutput2 = load_file(file_path) if ext != "pkb" else load(file_path)
+        time_dict[ext] = time() - start
+        assert xoutput2 == xoutput
+        msg += (
+            "\n    "
+            + ext
+            + " ("
+            + str(round(getsize(file_path) / 1e6))
+            + " MB): save "
+            + str(round(time_save * 1000))
+            + " ms, load "
+            + str(round(time_dict[ext] * 1000))
+            + " ms"
+        )
+    print(msg)
+
+
+if __name__ == "__main__":
+    test_save_load_pkb()
+    test_copy()
+    test_save_load_pkb_benchmark()
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+from time import time
+
+import pytest
+import numpy as np
+
+from pyleecan.Classes.Arc1 import Arc1
+from pyleecan.Classes.Arc2 import Arc2
+from pyleecan.Classes.Arc3 import Arc3
+from pyleecan.Classes.Segment import Segment
+from pyleecan.Classes.SurfLine import SurfLine
+from pyleecan.Functions.Geometry.get_line_batch import get_line_batch, is_line_batch
+from pyleecan.Functions.load import load
+from pyleecan.Methods.Geometry.LineBatch import (
+    AngleRotationLineBatchError,
+    NbPointLineBatchError,
+)
+from pyleecan.definitions import DATA_DIR
+
+
+def get_line_list():
+    """Lines of every type (both directions, both radius signs)"""
+    return [
+        Segment(0, 1, prop_dict={"label": "seg"}),
+        Arc1(begin=1, end=1j, radius=1, is_trigo_direction=True),
+        Arc1(begin=1j, end=-1, radius=-1, is_trigo_direction=True),
+        Arc1(begin=-1, end=-1j, radius=2, is_trigo_direction=False),
+        Arc1(begin=2 + 1j, end=-2 + 1j, radius=2, is_trigo_direction=False),
+        Arc2(begin=-1j, center=0.5j, angle=-np.pi / 3),
+        Arc2(begin=2, center=1 + 1j, angle=5 * np.pi / 4),
+        Arc3(begin=-1j, end=1, is_trigo_direction=True),
+        Arc3(begin=1, end=3, is_trigo_direction=False),
+        Segment(-2 - 2j, 3 + 0.5j),
+    ]
+
+
+def test_line_batch_lossless():
+    """Check that the lines are recreated exactly from the batch"""
+    line_list = get_line_list()
+    batch = get_line_batch(line_list)
+    assert batch.line_type.tolist() == [0, 1, 1, 1, 1, 2, 2, 3, 3, 0]
+    new_list = batch.get_lines()
+    for line, new_line in zip(line_list, new_list):
+        assert new_line == line
+    # Copies of the property dict
+    assert new_list[0].prop_dict is not line_list[0].prop_dict
+
+
+def test_line_batch_meth():
+    """Check the batch methods against the methods of the lines"""
+    line_list = get_line_list()
+    batch = get_line_batch(line_list)
+
+    for ii, line in enumerate(line_list):
+        assert batch.begin[ii] == pytest.approx(line.get_begin(), abs=1e-12)
+        assert batch.end[ii] == pytest.approx(line.get_end(), abs=1e-12)
+        if not isinstance(line, Segment):
+            assert batch.center[ii] == pytest.approx(line.get_center(), abs=1e-12)
+            assert batch.angle[ii] == pytest.approx(line.get_angle(), abs=1e-12)
+    assert batch.comp_length() == pytest.approx(
+        [line.comp_length() for line in line_list], abs=1e-12
+    )
+    for nb_point in [None, 0, 7]:
+        if nb_point is None:
+            Z_ref = np.concatenate([line.discretize() for line in line_list])
+        else:
+            Z_ref = np.concatenate([line.discretize(nb_point) for line in line_list])
+        assert np.abs(batch.discretize(nb_point) - Z_ref).max() < 1e-12
+    with pytest.raises(NbPointLineBatchError):
+        batch.discretize(-1)
+
+    # Intersection with lines in all the directions
+    for Z1, Z2 in [(0, 1), (0, 1j), (-1, 1 + 2j), (0.5, 0.5 + 1j), (2j, 3 + 1j)]:
+        Z_int, line_index = batch.intersect_line(Z1, Z2)
+        Z_ref, index_ref = list(), list()
+        for ii, line in enumerate(line_list):
+            Z_line = line.intersect_line(Z1, Z2)
+            Z_ref.extend(Z_line)
+            index_ref.extend([ii] * len(Z_line))
+        assert line_index.tolist() == index_ref
+        assert Z_int == pytest.approx(Z_ref, abs=1e-12)
+
+    # Transformations
+    batch.rotate(0.3)
+    batch.translate(0.1 - 0.2j)
+    batch.scale(-1.5)
+    with pytest.raises(AngleRotationLineBatchError):
+        batch.rotate("error")
+    for line in line_list:
+        line.rotate(0.3)
+        line.translate(0.1 - 0.2j)
+        line.scale(-1.5)
+    new_list = batch.get_lines()
+    for line, new_line in zip(line_list, new_list):
+        assert new_line.get_begin() == pytest.approx(line.get_begin(), abs=1e-12)
+        assert new_line.get_end() == pytest.approx(line.get_end(), abs=1e-12)
+        assert new_line.comp_length() == pytest.approx(line.comp_length(), abs=1e-12)
+    # Same lines in place
+    batch.update_lines(new_list)
+    line_list = get_line_list()
+    batch.update_lines(line_list)
+    for line, new_line in zip(line_list, new_list):
+        assert line.get_begin() == pytest.approx(new_line.get_begin(), abs=1e-12)
+        assert line.get_end() == pytest.approx(new_line.get_end(), abs=1e-12)
+
+
+class SegmentUser(Segment):
+    """Line type that is not available in LineBatch"""
+
+    pass
+
+
+@pytest.mark.parametrize("nb_seg", [1, 6])
+def test_surfline_batch(nb_seg):
+    """Check the SurfLine methods computed line by line (few lines) and with a
+    LineBatch"""
+    Z_seg = np.linspace(-2 - 2j, -1j, nb_seg + 1)
+    line_list = [
+        Arc3(begin=-1j, end=1, is_trigo_direction=True),
+        Arc1(begin=1, end=3, radius=1.5, is_trigo_direction=False),
+        Segment(3, -2 - 2j),
+    ] + [Segment(Z_seg[ii], Z_seg[ii + 1]) for ii in range(nb_seg)]
+    assert is_line_batch(line_list) == (nb_seg > 1)
+    surf = SurfLine(line_list=[line.copy() for line in line_list], point_ref=1)
+    point_list = surf.discretize(10)
+    Z_ref = [line.discretize(10) for line in line_list]
+    Z_ref = np.concatenate([Z[:-1] for Z in Z_ref])
+    assert len(point_list) == Z_ref.size
+    assert np.abs(np.array(point_list) - Z_ref).max() < 1e-12
+
+    surf.rotate(1)
+    surf.translate(1j)
+    for line, surf_line in zip(line_list, surf.line_list):
+        line.rotate(1)
+        line.translate(1j)
+        assert surf_line.begin == pytest.approx(line.begin, abs=1e-12)
+        assert surf_line.end == pytest.approx(line.end, abs=1e-12)
+    assert surf.point_ref == pytest.approx(np.exp(1j) + 1j, abs=1e-12)
+
+
+def test_surfline_user_line():
+    """Check the SurfLine methods with lines that are not available in
+    LineBatch"""
+    Z = np.exp(1j * np.linspace(0, 2 * np.pi, 11)[:-1])
+    line_list = [SegmentUser(Z[ii - 1], Z[ii]) for ii in range(10)]
+    assert not is_line_batch(line_list)
+    surf = SurfLine(line_list=[line.copy() for line in line_list], point_ref=0)
+    np.testing.assert_allclose(surf.discretize(0), Z[[9] + list(range(9))])
+    assert len(surf.get_patches()) == 1
+    surf.rotate(1)
+    surf.translate(1j)
+    surf.scale(2)
+    for line, surf_line in zip(line_list, surf.line_list):
+        assert surf_line.begin == pytest.approx(2 * (line.begin * np.exp(1j) + 1j))
+
+
+@pytest.mark.long_5s
+def test_line_batch_benchmark():
+    """Compare the rotation/discretization of the lines of a machine one by
+    one and with a LineBatch"""
+    machine = load(DATA_DIR + "/Machine/Toyota_Prius.json")
+    line_list = list()
+    for surf in machine.build_geometry():
+        if hasattr(surf, "out_surf"):
+            line_list.extend(surf.out_surf.get_lines() + surf.in_surf.get_lines())
+        else:
+            line_list.extend(surf.get_lines())
+
+    copy_list = [line.copy() for line in line_list]
+    start = time()
+    Z_ref = list()
+    for line in line_list:
+        line.rotate(0.1)
+        Z_ref.extend(line.discretize())
+    time_line = time() - start
+
+    start = time()
+    batch = get_line_batch(copy_list)
+    batch.rotate(0.1)
+    Z_batch = batch.discretize()
+    batch.update_lines(copy_list)
+    time_batch = time() - start
+
+    assert np.abs(Z_batch - np.array(Z_ref)).max() < 1e-9
+    for line, copy_line in zip(line_list, copy_list):
+        assert copy_line.get_begin() == pytest.approx(line.get_begin(), abs=1e-12)
+        assert copy_line.get_end() == pytest.approx(line.get_end(), abs=1e-12)
+    print(
+        "\n"
+        + str(len(line_list))
+        + " lines: "
+        + str(round(time_line * 1000, 1))
+        + " ms one by one, "
+        + str(round(time_batch * 1000, 1))
+        + " ms with a LineBatch"
+    )
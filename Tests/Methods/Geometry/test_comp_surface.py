@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*
+from glob import glob
+from os.path import join
+from time import time
+
+import pytest
+import numpy as np
+
+from pyleecan.Classes.Arc1 import Arc1
+from pyleecan.Classes.Arc2 import Arc2
+from pyleecan.Classes.Arc3 import Arc3
+from pyleecan.Classes.Circle import Circle
+from pyleecan.Classes.Segment import Segment
+from pyleecan.Classes.SurfLine import SurfLine
+from pyleecan.Classes.SurfRing import SurfRing
+from pyleecan.Functions.Geometry.comp_surface_num import comp_surface_num
+from pyleecan.Functions.Geometry.is_surface_num import is_surface_num
+from pyleecan.Functions.load import load
+from pyleecan.definitions import DATA_DIR
+
+
+def get_machine_list():
+    """Machines of the data folder"""
+    return [load(path) for path in sorted(glob(join(DATA_DIR, "Machine", "*.json")))]
+
+
+def test_comp_surface_arc():
+    """Check the surface of chains of segments and arcs"""
+    # Half disk (Arc3) and quarter of disk (Arc1 and Arc2)
+    surf = SurfLine(line_list=[Arc3(begin=1, end=-1), Segment(-1, 1)])
+    assert surf.comp_surface() == pytest.approx(np.pi / 2, rel=1e-14)
+    surf = SurfLine(
+        line_list=[Segment(0, 1), Arc1(begin=1, end=1j, radius=1), Segment(1j, 0)]
+    )
+    assert surf.comp_surface() == pytest.approx(np.pi / 4, rel=1e-14)
+    surf = SurfLine(line_list=[Segment(0, 1), Arc2(begin=1, center=0, angle=np.pi / 2)])
+    assert surf.comp_surface() == pytest.approx(np.pi / 4, rel=1e-14)
+    # Arc of 3pi/2
+    surf = SurfLine(
+        line_list=[
+            Segment(0, 1j),
+            Arc1(begin=1j, end=1, radius=-1, is_trigo_direction=True),
+            Segment(1, 0),
+        ]
+    )
+    assert surf.comp_surface() == pytest.approx(3 * np.pi / 4, rel=1e-14)
+    # Ring with a square hole
+    ring = SurfRing(
+        out_surf=Circle(radius=2),
+        in_surf=SurfLine(
+            line_list=[Segment(0, 1), Segment(1, 1 + 1j), Segment(1 + 1j, 1j)]
+        ),
+    )
+    assert ring.comp_surface() == pytest.approx(4 * np.pi - 1, rel=1e-14)
+
+
+def test_comp_surface_machine():
+    """Check the analytical surface of the machine surfaces against the
+    numerical integration"""
+    for machine in get_machine_list():
+        for lam in machine.get_lam_list():
+            for surf in lam.build_geometry():
+                if isinstance(surf, SurfLine):
+                    S_num = comp_surface_num(surf.discretize(2000))
+                    assert surf.comp_surface() == pytest.approx(S_num, rel=1e-5)
+
+
+@pytest.mark.long_5s
+def test_comp_masses_benchmark(N=100):
+    """Masses of the laminations of the machines of the data folder: the
+    surfaces computed from the geometry are memoized, the analytical ones are
+    not (the timings are only printed)"""
+    lam_list = list()
+    for mach in get_machine_list():
+        for lam in mach.get_lam_list():
+            try:
+                lam.comp_masses()
+                lam_list.append(lam)
+            except Exception:  # Some materials are not fully defined
+                pass
+    lam_num = [lam for lam in lam_list if is_surface_num(lam)]
+    lam_ana = [lam for lam in lam_list if not is_surface_num(lam)]
+    assert len(lam_num) > 0 and len(lam_ana) > 0
+    for lam in lam_ana:
+        assert "memo" not in lam._get_cache()
+    M_ref = [lam.comp_masses() for lam in lam_num]
+
+    start = time()
+    for _ in range(N):
+        M_list = [lam.comp_masses() for lam in lam_num]
+    time_memo = (time() - start) / N
+    start = time()
+    for _ in range(N):
+        for lam in lam_num:
+            lam._clear_cache()
+            lam.comp_masses()
+    time_num = (time() - start) / N
+    start = time()
+    for _ in range(N):
+        for lam in lam_ana:
+            lam.comp_masses()
+    time_ana = (time() - start) / N
+    print(
+        "\n"
+        + str(len(lam_num))
+        + " laminations with numerical surfaces: "
+        + format(time_num * 1000, ".2f")
+        + " ms, memoized "
+        + format(time_memo * 1000, ".2f")
+        + " ms\n"
+        + str(len(lam_ana))
+        + " laminations with analytical surfaces: "
+        + format(time_ana * 1000, ".2f")
+        + " ms"
+    )
+    assert M_list == M_ref
+    for lam in lam_ana:
+        assert "memo" not in lam._get_cache()
+
+
+if __name__ == "__main__":
+    test_comp_surface_arc()
+    test_comp_surface_machine()
+    test_comp_masses_benchmark()
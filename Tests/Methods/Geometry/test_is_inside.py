@@ -1,10 +1,18 @@
 # -*- coding: utf-8 -*
 from os.path import join
+from time import time
 import pytest
+import numpy as np
+from matplotlib.path import Path
 from pyleecan.Classes.Circle import Circle
 from pyleecan.Classes.Segment import Segment
 from pyleecan.Classes.SurfLine import SurfLine
+from pyleecan.Classes.Arc1 import Arc1
+from pyleecan.Classes.SurfRing import SurfRing
+from pyleecan.Classes.PolarArc import PolarArc
 from pyleecan.Functions.load import load
+from pyleecan.Functions.Geometry.get_surface_index import get_surface_index
+from pyleecan.definitions import DATA_DIR
 from Tests import TEST_DATA_DIR
 
 # Configuring the test of is_inside
@@ -67,9 +75,102 @@ def test_is_inside(test_dict):
         assert result == surf.is_inside(Z)
 
 
+def is_inside_ref(surf, Z):
+    """Inside test with a fine discretization of the lines"""
+    point_list = list()
+    for line in surf.get_lines():
+        if isinstance(line, Segment):
+            point_list.extend([line.get_begin(), line.get_end()])
+        else:
+            point_list.extend(line.discretize(10000))
+    point = np.array(point_list)
+    path = Path(np.stack((point.real, point.imag), axis=1))
+    return path.contains_points(np.stack((Z.real, Z.imag), axis=1))
+
+
+def get_machine_surf(sym=8):
+    """Surfaces of the Toyota Prius with arcs, holes and magnets"""
+    machine = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    return machine.stator.build_geometry(sym=sym) + machine.rotor.build_geometry(
+        sym=sym
+    )
+
+
+def test_is_inside_array():
+    """Check the inside test of arrays of points against a fine discretization"""
+    rng = np.random.default_rng(0)
+    ring = SurfRing(out_surf=Circle(radius=2), in_surf=Circle(radius=1))
+    # Arc of more than pi (split in sub-arcs)
+    arc = Arc1(begin=1, end=-1j, radius=-1, is_trigo_direction=True)
+    surf_arc = SurfLine(line_list=[arc, Segment(-1j, 0), Segment(0, 1)])
+    polar = PolarArc(angle=2, height=1, point_ref=2)
+    for surf in [C1, C2, ring, surf_arc, polar, SCirc] + get_machine_surf():
+        Z0 = surf.point_ref
+        R = 2 * max(
+            [abs(Z - Z0) for line in surf.get_lines() for Z in line.discretize()]
+        )
+        Z = Z0 + R * (rng.random(2000) - 0.5 + 1j * (rng.random(2000) - 0.5))
+        is_in = surf.is_inside(Z)
+        assert is_in.shape == Z.shape
+        np.testing.assert_array_equal(is_in, is_inside_ref(surf, Z))
+        # Points on the lines
+        Zline = np.concatenate([line.discretize(5) for line in surf.get_lines()])
+        assert not np.any(surf.is_inside(Zline))
+        assert np.all(surf.is_inside(Zline, if_online=True))
+    # Point in the ring hole
+    assert not ring.is_inside(0)
+    assert ring.is_inside(1.5j)
+    assert not surf_arc.is_inside(0.5 - 0.5j)
+    assert surf_arc.is_inside(-0.5 - 0.5j)
+    # The polyline is updated if the lines are modified
+    assert polar.is_inside(2.4)
+    polar.height = 0.5
+    assert not polar.is_inside(2.4)
+
+
+def test_get_surface_index():
+    """Check the surface of the points of the machine"""
+    surf_list = get_machine_surf()
+    rng = np.random.default_rng(1)
+    Z = 0.14 * rng.random(1000) * np.exp(1j * np.pi / 4 * rng.random(1000))
+    surf_index = get_surface_index(surf_list, Z.reshape(10, 100))
+    assert surf_index.shape == (10, 100)
+    surf_index = surf_index.ravel()
+    for ii, surf in enumerate(surf_list):
+        is_in = surf.is_inside(Z)
+        assert np.all(surf_index[is_in] <= ii)
+    assert np.all(surf_index[surf_index >= 0] < len(surf_list))
+    is_none = surf_index == -1
+    assert not np.any([surf.is_inside(Z[is_none]) for surf in surf_list])
+
+
+@pytest.mark.long_5s
+def test_is_inside_benchmark(N=100000):
+    """Inside test of the points of a grid for all the surfaces of a machine"""
+    surf_list = get_machine_surf(sym=1)
+    x = np.linspace(-0.14, 0.14, int(N ** 0.5))
+    Z = (x[:, None] + 1j * x[None, :]).ravel()
+    start = time()
+    surf_index = get_surface_index(surf_list, Z)
+    time_index = time() - start
+    print(
+        "\n"
+        + str(Z.size)
+        + " points, "
+        + str(len(surf_list))
+        + " surfaces: "
+        + format(time_index, ".3f")
+        + " s"
+    )
+    assert np.count_nonzero(surf_index >= 0) > 0
+
+
 if __name__ == "__main__":
     for test_dict in inside_test:
         test_is_inside(test_dict)
+    test_is_inside_array()
+    test_get_surface_index()
+    test_is_inside_benchmark()
 
     # test_is_inside(inside_test[-1])
     print("Done")
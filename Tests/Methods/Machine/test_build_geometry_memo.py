@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+from importlib import import_module
+from os.path import join
+from time import time
+
+import pytest
+import numpy as np
+
+from pyleecan.Classes.NotchEvenDist import NotchEvenDist
+from pyleecan.Classes.SlotM10 import SlotM10
+from pyleecan.Classes.VentilationCirc import VentilationCirc
+from pyleecan.Functions.Geometry.rotate_copy import rotate_copy
+from pyleecan.Functions.load import load
+from pyleecan.Methods.Machine.LamSlotWind.build_geometry import _build_geometry
+from pyleecan.definitions import DATA_DIR
+
+
+def get_geo(surf_list):
+    """Labels and points of a list of surfaces"""
+    return [
+        (
+            surf.label,
+            surf.point_ref,
+            [(line.get_begin(), line.get_end()) for line in surf.get_lines()],
+        )
+        for surf in surf_list
+    ]
+
+
+def assert_geo_equal(surf_list, surf_list_ref):
+    """Check that two lists of surfaces have the same labels and points"""
+    geo, geo_ref = get_geo(surf_list), get_geo(surf_list_ref)
+    assert [g[0] for g in geo] == [g[0] for g in geo_ref]
+    for (_, Zref, lines), (_, Zref_ref, lines_ref) in zip(geo, geo_ref):
+        assert Zref == pytest.approx(Zref_ref, abs=1e-12)
+        np.testing.assert_allclose(lines, lines_ref, rtol=0, atol=1e-12)
+
+
+def count_call(func, call_list):
+    """Wrap func to append its first argument to call_list on each call"""
+
+    def func_count(self, *args, **kwargs):
+        call_list.append(self)
+        return func(self, *args, **kwargs)
+
+    return func_count
+
+
+def test_rotate_copy():
+    """Check the copies against the rotation of the objects"""
+    machine = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    surf_list = machine.rotor.build_geometry(sym=8)
+    angle_list = [0, 0.5, -2]
+    copy_list = rotate_copy(surf_list, angle_list)
+    assert len(copy_list) == 3
+    for angle, new_list in zip(angle_list, copy_list):
+        surf_ref = [surf.copy() for surf in surf_list]
+        for surf in surf_ref:
+            surf.rotate(angle)
+        assert_geo_equal(new_list, surf_ref)
+        assert new_list[0].line_list[0].parent is new_list[0]
+    # The copies are independent
+    copy_list[0][0].line_list[0].begin = 0
+    assert surf_list[0].line_list[0].begin != 0
+    assert rotate_copy(surf_list, []) == []
+
+
+@pytest.mark.long_5s
+def test_rotate_copy_benchmark(N=10):
+    """Copies of the holes of the Toyota Prius with rotate_copy and with a
+    copy and a rotation of each surface"""
+    machine = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    hole = machine.rotor.hole[0]
+    surf_list = hole.build_geometry()
+    angle_list = [ii * 2 * np.pi / hole.Zh for ii in range(hole.Zh)]
+    start = time()
+    for _ in range(N):
+        loop_list = list()
+        for angle in angle_list:
+            loop_list.append([surf.copy() for surf in surf_list])
+            for surf in loop_list[-1]:
+                surf.rotate(angle)
+    time_loop = (time() - start) / N
+    start = time()
+    for _ in range(N):
+        copy_list = rotate_copy(surf_list, angle_list)
+    time_copy = (time() - start) / N
+    print(
+        "\nToyota Prius holes copies: "
+        + format(time_loop * 1000, ".2f")
+        + " ms, rotate_copy "
+        + format(time_copy * 1000, ".2f")
+        + " ms"
+    )
+    assert len(copy_list) == len(loop_list)
+    for new_list, surf_ref in zip(copy_list, loop_list):
+        assert_geo_equal(new_list, surf_ref)
+
+
+def test_build_geometry_memo():
+    """Check that the memo of the geometry is updated with the parameters"""
+    machine = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    stator = machine.stator
+    surf_list = stator.build_geometry(sym=8)
+    assert_geo_equal(surf_list, _build_geometry(stator, sym=8))
+    # The returned surfaces can be modified
+    surf_list[0].rotate(1)
+    surf_list[1].label = "test"
+    assert_geo_equal(stator.build_geometry(sym=8), _build_geometry(stator, sym=8))
+    # The arguments are part of the key
+    assert_geo_equal(
+        stator.build_geometry(sym=4, alpha=0.1),
+        _build_geometry(stator, sym=4, alpha=0.1),
+    )
+
+    # Modification of the slot, notches, ventilations and winding
+    stator.slot.H2 *= 1.1
+    assert_geo_equal(stator.build_geometry(sym=8), _build_geometry(stator, sym=8))
+    stator.notch = [NotchEvenDist(notch_shape=SlotM10(Zs=48, W0=1e-3, H0=1e-3))]
+    assert_geo_equal(stator.build_geometry(sym=8), _build_geometry(stator, sym=8))
+    stator.axial_vent = [VentilationCirc(Zh=8, Alpha0=0, D0=5e-3, H0=0.12)]
+    assert_geo_equal(stator.build_geometry(sym=8), _build_geometry(stator, sym=8))
+    N = len(stator.build_geometry(sym=8))
+    stator.winding = None
+    assert len(stator.build_geometry(sym=8)) < N
+
+    # The label of the lamination (from the machine) is part of the key
+    assert stator.build_geometry()[0].label.startswith("Stator-0")
+    machine.stator = None
+    assert stator.build_geometry()[0].label.startswith("Stator_")
+
+    # The geometry of the laminations without copies of slot surfaces or holes
+    # is faster to build than to memoize
+    machine = load(join(DATA_DIR, "Machine", "SPMSM_001.json"))
+    machine.rotor.build_geometry()
+    assert "memo" not in machine.rotor._get_cache()
+
+
+@pytest.mark.long_5s
+def test_build_geometry_benchmark(N=10):
+    """Geometry of the Toyota Prius built N times (the timings are only
+    printed)"""
+    machine = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    start = time()
+    for _ in range(N):
+        for lam in machine.get_lam_list():
+            lam._clear_cache()
+        machine.build_geometry()
+    time_build = (time() - start) / N
+    start = time()
+    for _ in range(N):
+        surf_list = machine.build_geometry()
+    time_memo = (time() - start) / N
+    print(
+        "\nToyota Prius build_geometry: "
+        + format(time_build, ".4f")
+        + " s, memoized "
+        + format(time_memo, ".4f")
+        + " s"
+    )
+    assert len(surf_list) > 0
+
+    # The second call is a memo hit (the geometry is not built again)
+    call_list = list()
+    with pytest.MonkeyPatch.context() as mp:
+        for name in ["LamSlotWind", "LamHole"]:
+            module = import_module(
+                "pyleecan.Methods.Machine." + name + ".build_geometry"
+            )
+            mp.setattr(
+                module,
+                "_build_geometry",
+                count_call(module._build_geometry, call_list),
+            )
+        for lam in machine.get_lam_list():
+            lam._clear_cache()
+        surf_ref = machine.build_geometry()
+        nb_call = len(call_list)
+        surf_list = machine.build_geometry()
+    assert nb_call == 2
+    assert len(call_list) == nb_call
+    assert_geo_equal(surf_list, surf_ref)
+
+
+if __name__ == "__main__":
+    test_rotate_copy()
+    test_rotate_copy_benchmark()
+    test_build_geometry_memo()
+    test_build_geometry_benchmark()
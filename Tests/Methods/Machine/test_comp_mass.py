@@ -277,7 +277,41 @@ def test_comp_mass_shaft_none():
     assert result["Shaft"] == 0
 
 
+def test_comp_masses_memo():
+    """Check that the memo of the lamination masses is updated with the
+    parameters and can't be modified by the caller"""
+    machine = Toyota_Prius.copy()
+    lam = machine.rotor
+    M_dict = lam.comp_masses()
+    Mlam = M_dict["Mlam"]
+    M_dict["Mlam"] = 0
+    assert lam.comp_masses()["Mlam"] == Mlam
+    assert lam.comp_surfaces() == Toyota_Prius.rotor.comp_surfaces()
+
+    # Geometry, length and material modifications
+    lam.hole[0].H1 *= 1.1
+    S_dict = lam.comp_surfaces()
+    assert S_dict["Shole"] != Toyota_Prius.rotor.comp_surfaces()["Shole"]
+    assert lam.comp_masses()["Mlam"] != Mlam
+    lam.hole[0].H1 /= 1.1
+    assert lam.comp_masses()["Mlam"] == pytest.approx(Mlam, rel=1e-12)
+    lam.L1 *= 2
+    assert lam.comp_masses()["Mlam"] == pytest.approx(2 * Mlam, rel=1e-12)
+    # The materials are not part of the key of the surfaces and volumes
+    memo_dict = lam._get_cache()["memo"].copy()
+    lam.mat_type.struct.rho /= 2
+    assert lam.comp_masses()["Mlam"] == pytest.approx(Mlam, rel=1e-12)
+    assert lam._get_cache()["memo"] == memo_dict
+    # The memo is not saved or copied
+    assert lam.copy().comp_masses() == lam.comp_masses()
+    assert "memo" not in lam.copy()._get_cache()
+    # The analytical surfaces of the stator slots are not memoized
+    assert machine.stator.comp_masses() == Toyota_Prius.stator.comp_masses()
+    assert "memo" not in machine.stator._get_cache()
+
+
 if __name__ == "__main__":
+    test_comp_masses_memo()
     for test_dict in M_test:
         test_comp_surface_rotor(test_dict)
         test_comp_surface_stator(test_dict)
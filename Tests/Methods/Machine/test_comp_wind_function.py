@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+from os.path import join
+from time import time
+
+import pytest
+import numpy as np
+
+from pyleecan.Functions.load import load
+from pyleecan.Functions.Winding.comp_cond_function import comp_cond_function
+import pyleecan.Methods.Machine.LamSlotWind.comp_wind_function as wind_module
+from pyleecan.Methods.Machine.LamSlotWind.comp_wind_function import (
+    _comp_wind_function,
+)
+from pyleecan.definitions import DATA_DIR
+
+
+def comp_wind_function_ref(lam, Na):
+    """Winding function computed conductor by conductor"""
+    angle = np.linspace(0, 2 * np.pi, Na, endpoint=False)
+    Zs = lam.slot.Zs
+    _, Ntan = lam.winding.get_dim_wind()
+    wind_mat = np.sum(lam.winding.get_connection_mat(Zs), axis=0)
+    slot_angle = lam.slot.comp_angle_active_eq()
+    slot_opening = lam.slot.comp_angle_opening()
+    alpha_lay = np.linspace(-slot_angle / 2, slot_angle / 2, Ntan + 1, endpoint=False)[
+        1:
+    ]
+    wf = np.zeros((lam.winding.qs, Na))
+    for n in range(Ntan):
+        for z in range(Zs):
+            alpha = 2 * np.pi * z / Zs + np.pi / Zs + alpha_lay[n]
+            cf = -0.5 * comp_cond_function(alpha, slot_opening, angle)
+            wf += wind_mat[n, z, :, None] * cf[None, :]
+    return wf
+
+
+@pytest.mark.parametrize("name", ["Toyota_Prius", "SCIM_006", "IPMSM_B"])
+def test_comp_wind_function(name):
+    """Check the winding function against the conductor by conductor sum and
+    check the memo"""
+    machine = load(join(DATA_DIR, "Machine", name + ".json"))
+    stator = machine.stator
+
+    wf = stator.comp_wind_function(Na=1024)
+    wf_ref = comp_wind_function_ref(stator, 1024)
+    assert np.abs(wf - wf_ref).max() < 1e-10
+
+    # Memo (keyed on the angle values)
+    angle = np.linspace(0, 1, 100)
+    wf_angle = stator.comp_wind_function(angle=angle)
+    memo = stator._get_cache()["memo"][_comp_wind_function]
+    assert len(memo) == 2
+    wf_angle[0, 0] += 1  # The memo returns copies
+    wf_copy = stator.comp_wind_function(angle=angle.copy())
+    assert len(memo) == 2
+    assert wf_copy[0, 0] == wf_angle[0, 0] - 1
+    # Modified winding
+    stator.winding.wind_mat = stator.winding.wind_mat * 2
+    assert np.abs(stator.comp_wind_function(Na=1024) - 2 * wf).max() < 1e-10
+
+
+@pytest.mark.parametrize("name", ["Toyota_Prius", "SCIM_006"])
+def test_comp_wind_harmonics(name):
+    """Check the analytic harmonics of the winding function"""
+    machine = load(join(DATA_DIR, "Machine", name + ".json"))
+    stator = machine.stator
+    p = stator.get_pole_pair_number()
+
+    Na = 2 ** 14
+    wf = stator.comp_wind_function(Na=Na, alpha_mmf0=0.1)
+    wf_fft = 2 * np.fft.rfft(wf, axis=1) / Na
+    r = np.arange(1, 40)
+    wf_harm, ksi = stator.comp_wind_harmonics(r, alpha_mmf0=0.1)
+    assert wf_harm.shape == ksi.shape == (stator.winding.qs, r.size)
+    assert np.abs(wf_fft[:, r] - wf_harm).max() < 1e-4 * np.abs(wf_harm).max()
+
+    # Same winding factor as the Winding object for the layers at the center
+    # of the slots
+    _, ksi = stator.comp_wind_harmonics([p, 5 * p, 7 * p])
+    if stator.winding.get_dim_wind()[1] == 1:
+        ksi_ref = stator.winding.comp_winding_factor(Harmonics=[1, 5, 7])
+        assert ksi[0, :] == pytest.approx(ksi_ref, abs=1e-12)
+    assert np.all(ksi <= 1)
+
+
+@pytest.mark.long_5s
+def test_comp_wind_function_benchmark():
+    """Compare the winding function computation to the memo (the timings are
+    only printed)"""
+    machine = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    stator = machine.stator
+
+    # Number of computations of the winding function
+    call_list = list()
+
+    def comp_wind_function_count(self, *args, **kwargs):
+        call_list.append(self)
+        return _comp_wind_function(self, *args, **kwargs)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(wind_module, "_comp_wind_function", comp_wind_function_count)
+        start = time()
+        wf = stator.comp_wind_function(Na=2 ** 15)
+        time_comp = time() - start
+        start = time()
+        for ii in range(10):
+            assert np.array_equal(stator.comp_wind_function(Na=2 ** 15), wf)
+        time_memo = (time() - start) / 10
+    assert len(call_list) == 1
+    print(
+        "\nWinding function (Na=2**15): "
+        + str(round(time_comp * 1000, 1))
+        + " ms, "
+        + str(round(time_memo * 1000, 2))
+        + " ms with the memo"
+    )
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+from os.path import join
+
+import pytest
+from numpy import allclose, array, array_equal, linspace, tanh
+
+from pyleecan.Classes.ImportMatrixVal import ImportMatrixVal
+from pyleecan.Classes.ImportMatrixXls import ImportMatrixXls
+from pyleecan.Classes.MatMagnetics import MatMagnetics
+from pyleecan.Classes.ModelBH_Langevin import ModelBH_Langevin
+from pyleecan.Methods.Material.MatMagnetics.get_BH import BH_CACHE, comp_BH_key
+from Tests import save_load_path as save_path
+
+H = linspace(1, 5000, 40)
+BH_ref = array([H, 1.5 * tanh(H / 800)]).T
+
+
+@pytest.fixture
+def nb_fit(monkeypatch):
+    """Count the calls of ModelBH_Langevin.fit_model"""
+    count = [0]
+    fit_model = ModelBH_Langevin.fit_model
+
+    def count_fit(self, BH):
+        count[0] += 1
+        return fit_model(self, BH)
+
+    monkeypatch.setattr(ModelBH_Langevin, "fit_model", count_fit)
+    BH_CACHE.clear()
+    return count
+
+
+def test_get_BH_cache(nb_fit):
+    """Check that the B(H) curve is fitted once for all the copies of the
+    material and computed again when the material is modified"""
+    mag = MatMagnetics(
+        BH_curve=ImportMatrixVal(value=BH_ref),
+        ModelBH=ModelBH_Langevin(Bs=1.5, a=800, Bmax=2),
+        is_BH_extrapolate=True,
+    )
+    mag_copy = mag.copy()  # Copy before the fit (initial ModelBH parameters)
+
+    BH = mag.get_BH()
+    assert nb_fit[0] == 1
+    assert BH.shape[0] > BH_ref.shape[0]
+    param = (mag.ModelBH.param1, mag.ModelBH.param2)
+
+    # Same curve and parameters without fit
+    BH[0, 0] = -1  # The cache is not modified by the caller
+    for mag2 in [mag, mag.copy(), mag_copy]:
+        BH2 = mag2.get_BH()
+        assert BH2[0, 0] != -1
+        assert (mag2.ModelBH.param1, mag2.ModelBH.param2) == param
+    assert nb_fit[0] == 1
+    assert array_equal(mag_copy.get_BH(), mag.get_BH())
+
+    # The curve is fitted again when a property is modified
+    mag.ModelBH.Bmax = 2.1
+    mag.get_BH()
+    assert nb_fit[0] == 2
+    mag.BH_curve = ImportMatrixVal(value=BH_ref * [1, 1.01])
+    mag.get_BH()
+    assert nb_fit[0] == 3
+    mag.BH_curve.value[0, 1] = 0  # Modified in place
+    mag.get_BH()
+    assert nb_fit[0] == 4
+    mag.is_BH_extrapolate = False
+    assert array_equal(mag.get_BH(), mag.BH_curve.value)
+    assert nb_fit[0] == 4
+
+    # The curve is not stored if the properties can't be compared
+    BH_CACHE.clear()
+    mag_copy.BH_curve.__dict__["_data"] = bytearray(b"BH")
+    assert allclose(mag_copy.get_BH(), mag_copy.get_BH(), rtol=1e-5)
+    assert nb_fit[0] == 6
+    assert len(BH_CACHE) == 0
+
+
+def test_get_BH_file_key():
+    """Check that the key of the B(H) curve depends on the imported file"""
+    file_path = join(save_path, "test_get_BH_file_key.xlsx")
+    with open(file_path, "wb") as xls_file:
+        xls_file.write(b"BH")
+    mag = MatMagnetics(BH_curve=ImportMatrixXls(file_path=file_path))
+    key = comp_BH_key(mag)
+    assert comp_BH_key(mag.copy()) == key
+    with open(file_path, "wb") as xls_file:
+        xls_file.write(b"BH curve")
+    assert comp_BH_key(mag) != key
+
+
+if __name__ == "__main__":
+    test_get_BH_file_key()
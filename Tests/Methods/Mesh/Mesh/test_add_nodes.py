@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+from time import time
+
+import pytest
+import numpy as np
+
+from pyleecan.Classes.MeshMat import MeshMat
+from pyleecan.Classes.NodeMat import NodeMat
+from pyleecan.Classes.CellMat import CellMat
+
+
+def get_triangles(N):
+    """Vertices of the triangles of a N x N grid of squares (each triangle
+    defines its own vertices)"""
+    x, y = np.meshgrid(np.arange(N + 1) / N, np.arange(N + 1) / N, indexing="ij")
+    P = np.stack([x, y], axis=-1)
+    p0, p1, p2, p3 = P[:-1, :-1], P[1:, :-1], P[1:, 1:], P[:-1, 1:]
+    tri = np.concatenate([np.stack([p0, p1, p2], 2), np.stack([p0, p2, p3], 2)])
+    return tri.reshape(-1, 3, 2)
+
+
+def build_mesh(tri):
+    """Build the mesh from the vertices of the triangles"""
+    mesh = MeshMat()
+    mesh.node = NodeMat()
+    mesh.cell["triangle"] = CellMat(nb_node_per_cell=3)
+    node_indice = mesh.node.add_nodes(tri.reshape(-1, 2))
+    cell_indice = mesh.add_cells(node_indice.reshape(-1, 3), "triangle")
+    return mesh, cell_indice
+
+
+@pytest.mark.MeshSol
+def test_add_nodes():
+    """Check the bulk creation against the node by node creation"""
+    tri = get_triangles(4)
+    # Vertices moved by less than delta
+    rng = np.random.default_rng(0)
+    tri = tri + 1e-11 * rng.random(tri.shape)
+    mesh, cell_indice = build_mesh(tri)
+    assert mesh.node.nb_node == 25
+    assert mesh.cell["triangle"].nb_cell == 32
+    np.testing.assert_array_equal(cell_indice, np.arange(32))
+
+    mesh_ref = MeshMat()
+    mesh_ref.node = NodeMat()
+    mesh_ref.cell["triangle"] = CellMat(nb_node_per_cell=3)
+    for vertice in tri:
+        connect = list()
+        for point in vertice:
+            ind = mesh_ref.node.add_node(point)
+            if ind is None:
+                ind = mesh_ref.node.get_indice(point)
+            connect.append(ind)
+        mesh_ref.add_cell(connect, "triangle")
+    np.testing.assert_array_equal(mesh.node.coordinate, mesh_ref.node.coordinate)
+    np.testing.assert_array_equal(mesh.node.indice, mesh_ref.node.indice)
+    np.testing.assert_array_equal(
+        mesh.cell["triangle"].connectivity, mesh_ref.cell["triangle"].connectivity
+    )
+
+    # Nodes and cells that already exist (in any order) are not added
+    center = mesh.node.get_indice([0.5, 0.5])
+    assert np.all(abs(mesh.node.get_coord([center]) - 0.5) < 1e-10)
+    node_indice = mesh.node.add_nodes([[0.5, 0.5], [2, 2], [0.5, 0.5 + 1e-11]])
+    np.testing.assert_array_equal(node_indice, [center, 25, center])
+    assert mesh.node.get_indice([0.5, 0.6]) is None
+    np.testing.assert_array_equal(mesh.node.get_indice([[2, 2], [3, 3]]), [25, -1])
+    connect = mesh.cell["triangle"].connectivity[:2, ::-1]
+    new_ind = mesh.add_cells(np.vstack([connect, [[0, 1, 25], [0, 0, 25]]]), "triangle")
+    np.testing.assert_array_equal(new_ind, [-1, -1, 32, -1])
+    assert mesh.cell["triangle"].is_exist([25, 1, 0])
+    assert mesh.add_cell([1, 25, 0], "triangle") is None
+    assert mesh.cell["triangle"].nb_cell == 33
+
+    # The hash is rebuilt if the arrays are replaced
+    mesh.node.coordinate = mesh.node.coordinate + 1
+    assert mesh.node.get_indice([1.5, 1.5]) == center
+
+
+@pytest.mark.long_5s
+@pytest.mark.MeshSol
+def test_add_nodes_benchmark():
+    """Build a mesh of 100k triangles from the vertices of each triangle"""
+    N = 224
+    tri = get_triangles(N)
+
+    start = time()
+    mesh, cell_indice = build_mesh(tri)
+    time_bulk = time() - start
+    assert mesh.node.nb_node == (N + 1) ** 2
+    assert mesh.cell["triangle"].nb_cell == 2 * N ** 2
+
+    # Add nodes and cells one by one
+    start = time()
+    for ii in range(1000):
+        mesh.node.add_node(np.array([2 + ii, 0]))
+    for ii in range(1000):
+        mesh.add_cell([0, ii + 1, ii + 2], "triangle")
+    time_single = time() - start
+    assert mesh.node.nb_node == (N + 1) ** 2 + 1000
+    print(
+        "\n"
+        + str(tri.shape[0])
+        + " triangles: "
+        + format(time_bulk, ".2f")
+        + " s, 1000 nodes and cells one by one: "
+        + format(time_single, ".2f")
+        + " s"
+    )
+
+
+if __name__ == "__main__":
+    test_add_nodes()
+    test_add_nodes_benchmark()
@@ -1,13 +1,18 @@
 # -*- coding: utf-8 -*-
+from time import time
+
 import numpy as np
 import pytest
+from scipy.spatial import Delaunay
 
 from pyleecan.Classes.CellMat import CellMat
 from pyleecan.Classes.Interpolation import Interpolation
 from pyleecan.Classes.MeshMat import MeshMat
+from pyleecan.Classes.MeshSolution import MeshSolution
 from pyleecan.Classes.NodeMat import NodeMat
 from pyleecan.Classes.RefSegmentP1 import RefSegmentP1
 from pyleecan.Classes.RefTriangle3 import RefTriangle3
+from pyleecan.Classes.SolutionMat import SolutionMat
 
 
 @pytest.mark.MeshSol
@@ -105,7 +110,140 @@ def test_triangle3():
     assert testA is True
 
 
+def get_disk_mesh(N, seed=0):
+    """Delaunay triangle mesh of N random points in a disk (node indices are
+    not the node positions)"""
+    rng = np.random.default_rng(seed)
+    radius = np.sqrt(rng.random(N))
+    angle = 2 * np.pi * rng.random(N)
+    coord = np.stack((radius * np.cos(angle), radius * np.sin(angle)), axis=1)
+    connect = Delaunay(coord).simplices
+    node_indice = 2 * np.arange(N) + 1
+
+    mesh = MeshMat(dimension=2)
+    mesh.node = NodeMat(coordinate=coord, nb_node=N, indice=node_indice)
+    mesh.cell["triangle"] = CellMat(
+        connectivity=node_indice[connect],
+        nb_cell=connect.shape[0],
+        nb_node_per_cell=3,
+        indice=np.arange(connect.shape[0]) + 10,
+    )
+    mesh.cell["triangle"].interpolation = Interpolation()
+    mesh.cell["triangle"].interpolation.ref_cell = RefTriangle3(epsilon=1e-9)
+    return mesh, coord, connect
+
+
+@pytest.mark.MeshSol
+def test_find_cells():
+    """Check the batched location against a test on all the cells"""
+    mesh, coord, connect = get_disk_mesh(500)
+    rng = np.random.default_rng(1)
+    points = 2.2 * rng.random((300, 2)) - 1.1
+
+    cell_type, cell_indice, point_ref = mesh.find_cells(points)
+
+    # Barycentric coordinates of all the points in all the cells
+    vert = coord[connect]
+    u = vert[:, 1] - vert[:, 0]
+    v = vert[:, 2] - vert[:, 0]
+    w = points[:, None, :] - vert[None, :, 0]
+    det = u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0]
+    s = (w[..., 0] * v[:, 1] - w[..., 1] * v[:, 0]) / det
+    t = (u[:, 0] * w[..., 1] - u[:, 1] * w[..., 0]) / det
+    is_in = (s > -1e-9) & (t > -1e-9) & (1 - s - t > -1e-9)
+
+    is_found = cell_indice != -1
+    np.testing.assert_array_equal(is_found, np.any(is_in, axis=1))
+    assert 0 < is_found.sum() < points.shape[0]
+    assert np.all(cell_type[is_found] == "triangle")
+    assert np.all(cell_type[~is_found] == None)
+    assert np.all(is_in[is_found, cell_indice[is_found] - 10])
+    np.testing.assert_allclose(
+        point_ref[is_found, 0], s[is_found, cell_indice[is_found] - 10]
+    )
+    np.testing.assert_allclose(
+        point_ref[is_found, 1], t[is_found, cell_indice[is_found] - 10]
+    )
+    assert np.all(np.isnan(point_ref[~is_found]))
+
+    # The locator is reused until the mesh is modified
+    assert mesh._get_locator() is mesh._get_locator()
+    mesh.node.coordinate = 2 * coord
+    assert mesh.find_cells(2 * points[is_found])[1].tolist() == (
+        cell_indice[is_found].tolist()
+    )
+
+
+@pytest.mark.MeshSol
+def test_interpolate():
+    """Check the interpolation of nodal and cell solutions at points"""
+    mesh, coord, connect = get_disk_mesh(200)
+    nb_cell = connect.shape[0]
+    # Linear nodal field (2 time steps) and constant field on the cells
+    field_node = np.stack((coord[:, 0] + 2 * coord[:, 1], 3 * coord[:, 0]), axis=0)
+    field_cell = np.arange(nb_cell, dtype=float)
+
+    meshsol = MeshSolution(mesh=[mesh])
+    meshsol.solution = [
+        SolutionMat(
+            label="node",
+            type_cell="node",
+            field=field_node,
+            axis_name=["time", "indice"],
+            axis_size=[2, coord.shape[0]],
+        ),
+        SolutionMat(
+            label="cell",
+            type_cell="triangle",
+            field=field_cell,
+            axis_name=["indice"],
+            axis_size=[nb_cell],
+        ),
+    ]
+
+    points = np.array([[0.1, 0.2], [-0.3, 0.05], [2, 0]])
+    result = meshsol.interpolate(points, label="node")
+    assert result.shape == (3, 2)
+    np.testing.assert_allclose(result[:2, 0], points[:2, 0] + 2 * points[:2, 1])
+    np.testing.assert_allclose(result[:2, 1], 3 * points[:2, 0])
+    assert np.all(np.isnan(result[2]))
+
+    result = meshsol.interpolate(points, label="cell")
+    cell_indice = mesh.find_cells(points)[1]
+    np.testing.assert_array_equal(result[:2], cell_indice[:2] - 10)
+    assert np.isnan(result[2])
+
+
+@pytest.mark.long_5s
+@pytest.mark.MeshSol
+def test_find_cells_benchmark(N=100000, Npt=2000):
+    """Location of an airgap circle in a 100k nodes mesh"""
+    mesh, _, _ = get_disk_mesh(N)
+    angle = np.linspace(0, 2 * np.pi, Npt, endpoint=False)
+    points = 0.8 * np.stack((np.cos(angle), np.sin(angle)), axis=1)
+
+    start = time()
+    mesh._get_locator()
+    time_index = time() - start
+    start = time()
+    cell_type, cell_indice, _ = mesh.find_cells(points)
+    time_find = time() - start
+    print(
+        "\nLocator "
+        + format(time_index, ".3f")
+        + " s, "
+        + str(Npt)
+        + " points "
+        + format(time_find, ".3f")
+        + " s"
+    )
+    assert np.all(cell_indice != -1)
+
+
 if __name__ == "__main__":
 
     test_line()
     test_triangle3()
+    test_find_cells()
+    test_interpolate()
+    test_find_cells_benchmark()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+import pytest
+from pyleecan.Classes.MeshMat import MeshMat
+from pyleecan.Classes.CellMat import CellMat
+from pyleecan.Classes.NodeMat import NodeMat
+from pyleecan.Classes.RefTriangle3 import RefTriangle3
+import numpy as np
+
+
+def get_mesh():
+    """Square [0, 2] x [0, 1] with 4 triangles, cells 0 and 3 are clockwise"""
+    mesh = MeshMat()
+    mesh.node = NodeMat()
+    mesh.node.add_nodes(np.array([[0, 0], [1, 0], [1, 1], [0, 1], [2, 0], [2, 1]]))
+    mesh.cell["triangle"] = CellMat(nb_node_per_cell=3)
+    mesh.cell["triangle"].interpolation.ref_cell = RefTriangle3()
+    mesh.add_cells(np.array([[0, 2, 1], [0, 2, 3], [1, 4, 5], [1, 2, 5]]), "triangle")
+    return mesh
+
+
+@pytest.mark.MeshSol
+def test_cell_geometry():
+    """Check the cached areas, centers and jacobians"""
+    mesh = get_mesh()
+
+    area = mesh.get_cell_area()
+    np.testing.assert_allclose(area, [0.5, 0.5, 0.5, 0.5])
+    # The arrays are computed once and can't be modified
+    assert mesh.get_cell_area() is area
+    assert not area.flags.writeable
+    # The cache is not a property
+    assert "geometry" not in str(mesh.as_dict())
+    assert mesh.copy()._get_cache() == dict()
+
+    center = mesh.get_cell_center()
+    np.testing.assert_allclose(center[0], [2 / 3, 1 / 3])
+    np.testing.assert_allclose(center[2], [5 / 3, 1 / 3])
+
+    jacob, det_jacob = mesh.get_cell_jacobian()
+    np.testing.assert_allclose(jacob[0], [[1, 1], [1, 0]])
+    np.testing.assert_allclose(det_jacob, [-1, 1, 1, -1])
+
+    # Slicing with cell indices (e.g. a group)
+    group = np.array([3, 1])
+    np.testing.assert_allclose(mesh.get_cell_center(group), center[[3, 1]])
+    np.testing.assert_allclose(mesh.get_cell_jacobian(group)[1], [-1, 1])
+    np.testing.assert_allclose(mesh.get_cell_area(indices=[2, 99]), [0.5])
+
+    # The cache is emptied when the mesh is modified
+    mesh.node.add_node([3, 0])
+    mesh.add_cell([4, 6, 5], "triangle")
+    area = mesh.get_cell_area()
+    np.testing.assert_allclose(area, [0.5, 0.5, 0.5, 0.5, 0.5])
+    mesh.node.coordinate = 2 * mesh.node.coordinate
+    np.testing.assert_allclose(mesh.get_cell_area(), 4 * area)
+
+
+@pytest.mark.MeshSol
+def test_get_edge_normal():
+    """Check the outward normals of the boundary edges"""
+    mesh = get_mesh()
+    edge, edge2cell = mesh.get_edge2cell()
+    normal, length = mesh.get_edge_normal()
+    assert normal.shape == (edge.shape[0], 2)
+    assert mesh.get_edge_normal()[0] is normal
+
+    coord = mesh.node.coordinate[edge]
+    middle = coord.mean(axis=1)
+    is_bound = edge2cell[:, 1] == -1
+    assert is_bound.sum() == 6
+    # The boundary normals point out of the rectangle [0, 2] x [0, 1]
+    outside = middle[is_bound] + 0.1 * normal[is_bound]
+    assert np.all(
+        (outside[:, 0] < 0)
+        | (outside[:, 0] > 2)
+        | (outside[:, 1] < 0)
+        | (outside[:, 1] > 1)
+    )
+    np.testing.assert_allclose(
+        length, np.linalg.norm(coord[:, 1] - coord[:, 0], axis=1)
+    )
+    # Normals of the shared edges point out of the first cell
+    centers = mesh.get_cell_center(edge2cell[~is_bound, 0])
+    assert np.all(np.sum((middle[~is_bound] - centers) * normal[~is_bound], axis=1) > 0)
+
+
+if __name__ == "__main__":
+    test_cell_geometry()
+    test_get_edge_normal()
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+from itertools import combinations
+from time import time
+
+import pytest
+from pyleecan.Classes.MeshMat import MeshMat
+from pyleecan.Classes.CellMat import CellMat
+from pyleecan.Classes.NodeMat import NodeMat
+import numpy as np
+
+
+def get_grid_mesh(N):
+    """Triangle mesh of a N x N grid of squares"""
+    x, y = np.meshgrid(np.arange(N + 1), np.arange(N + 1), indexing="ij")
+    ind = np.arange((N + 1) ** 2).reshape(N + 1, N + 1)
+    n0 = ind[:-1, :-1].ravel()
+    n1 = ind[1:, :-1].ravel()
+    n2 = ind[1:, 1:].ravel()
+    n3 = ind[:-1, 1:].ravel()
+
+    mesh = MeshMat()
+    mesh.node = NodeMat()
+    mesh.cell["triangle"] = CellMat(nb_node_per_cell=3)
+    mesh.node.add_nodes(np.stack((x.ravel(), y.ravel()), axis=1))
+    mesh.add_cells(
+        np.concatenate((np.stack((n0, n1, n2), 1), np.stack((n0, n2, n3), 1))),
+        "triangle",
+    )
+    return mesh
+
+
+@pytest.mark.MeshSol
+def test_get_edge2cell():
+    """Check the edges of a triangle and a quad and the cache"""
+    mesh = MeshMat()
+    mesh.node = NodeMat()
+    mesh.node.add_nodes(np.array([[0, 0], [1, 0], [1, 1], [0, 1], [2, 0], [2, 1]]))
+    mesh.cell["triangle"] = CellMat(nb_node_per_cell=3)
+    mesh.cell["quad"] = CellMat(nb_node_per_cell=4)
+    mesh.add_cell([0, 1, 2], "triangle")
+    mesh.add_cell([0, 2, 3], "triangle")
+    mesh.add_cell([1, 4, 5, 2], "quad")
+
+    edge, edge2cell = mesh.get_edge2cell()
+    assert edge.shape == (8, 2)
+    edge_dict = {tuple(sorted(e)): tuple(c) for e, c in zip(edge, edge2cell)}
+    assert edge_dict[(0, 2)] == (0, 1)
+    assert edge_dict[(1, 2)] == (0, 2)
+    assert edge_dict[(0, 1)] == (0, -1)
+    assert edge_dict[(4, 5)] == (2, -1)
+    # 6 boundary edges, oriented as in the cells
+    is_bound = edge2cell[:, 1] == -1
+    assert is_bound.sum() == 6
+    assert [0, 1] in edge.tolist() and [4, 5] in edge.tolist()
+
+    # The adjacency is reused until the cells are modified
+    assert mesh.get_edge2cell()[0] is edge
+    mesh.add_cell([2, 5, 3], "triangle")
+    edge, edge2cell = mesh.get_edge2cell()
+    assert edge.shape == (9, 2)
+    assert (edge2cell[:, 1] == -1).sum() == 5
+
+
+@pytest.mark.MeshSol
+def test_renum():
+    """Check the renumbering against a relabelling with a dict"""
+    mesh = get_grid_mesh(4)
+    rng = np.random.default_rng(0)
+    node_indice = rng.permutation(100)[: mesh.node.nb_node] * 3
+    connect_ref = mesh.cell["triangle"].connectivity.copy()
+    mesh.node.indice = node_indice
+    mesh.cell["triangle"] = CellMat(
+        connectivity=node_indice[connect_ref],
+        nb_cell=connect_ref.shape[0],
+        nb_node_per_cell=3,
+        indice=mesh.cell["triangle"].indice,
+    )
+    mesh._is_renum = True
+    mesh.renum()
+    np.testing.assert_array_equal(mesh.cell["triangle"].connectivity, connect_ref)
+    np.testing.assert_array_equal(mesh.node.indice, np.arange(mesh.node.nb_node))
+    assert not mesh._is_renum
+
+
+def split_mesh(mesh, is_split):
+    """Meshes of the cells where is_split is True and False"""
+    connect = mesh.cell["triangle"].connectivity
+    mesh_list = list()
+    for is_cell in [is_split, ~is_split]:
+        mesh_new = MeshMat(_is_renum=True)
+        mesh_new.node = mesh.node
+        mesh_new.cell["triangle"] = CellMat(
+            connectivity=connect[is_cell],
+            nb_cell=int(is_cell.sum()),
+            nb_node_per_cell=3,
+            indice=mesh.cell["triangle"].indice[is_cell],
+        )
+        mesh_list.append(mesh_new)
+    return mesh_list
+
+
+def comp_interface_ref(connect, connect2):
+    """Lines of the interface with the loops of the original implementation"""
+    line_list = list()
+    for duo in combinations(range(3), 2):
+        edge_set = set(tuple(sorted(e)) for e in connect[:, duo].tolist())
+        for duo2 in combinations(range(3), 2):
+            for e in connect2[:, duo2].tolist():
+                if tuple(sorted(e)) in edge_set and not any(
+                    sorted(e) == sorted(line) for line in line_list
+                ):
+                    line_list.append(e)
+    return np.array(line_list)
+
+
+@pytest.mark.MeshSol
+@pytest.mark.parametrize("N", [3, 6, 10])
+def test_interface_order(N):
+    """Check the lines (order and orientation) on random splits of a grid"""
+    mesh = get_grid_mesh(N)
+    rng = np.random.default_rng(N)
+    for _ in range(3):
+        is_split = rng.random(mesh.cell["triangle"].nb_cell) < 0.5
+        mesh_list = split_mesh(mesh, is_split)
+        interf = mesh_list[0].interface(mesh_list[1])
+        line_ref = comp_interface_ref(
+            mesh_list[0].cell["triangle"].connectivity,
+            mesh_list[1].cell["triangle"].connectivity,
+        )
+        line = interf.cell["line"].connectivity
+        np.testing.assert_array_equal(np.reshape(line, (-1, 2)), line_ref)
+
+
+@pytest.mark.long_5s
+@pytest.mark.MeshSol
+def test_interface_benchmark(N=300):
+    """Interface and boundary of a grid split in two meshes"""
+    mesh = get_grid_mesh(N)
+    coord = mesh.node.coordinate
+    connect = mesh.cell["triangle"].connectivity
+    mesh_list = split_mesh(mesh, coord[connect].mean(axis=1)[:, 0] < N / 2)
+
+    start = time()
+    edge, edge2cell = mesh.get_edge2cell()
+    time_edge = time() - start
+    assert (edge2cell[:, 1] == -1).sum() == 4 * N
+
+    MeshMat().copy()  # Import of the classes used by copy
+    start = time()
+    interf = mesh_list[0].interface(mesh_list[1])
+    time_interf = time() - start
+    line = interf.cell["line"].connectivity
+    assert line.shape == (N, 2)
+    np.testing.assert_array_equal(coord[line][:, :, 0], N / 2)
+
+    start = time()
+    mesh_list[0].renum()
+    time_renum = time() - start
+    print(
+        "\nEdges "
+        + format(time_edge, ".3f")
+        + " s, interface "
+        + format(time_interf, ".3f")
+        + " s, renum "
+        + format(time_renum, ".3f")
+        + " s"
+    )
+
+
+if __name__ == "__main__":
+    test_get_edge2cell()
+    test_renum()
+    test_interface_order(6)
+    test_interface_benchmark()
@@ -6,6 +6,11 @@ from pyleecan.Classes.CellMat import CellMat
 from pyleecan.Classes.MeshSolution import MeshSolution
 from pyleecan.Classes.NodeMat import NodeMat
 from pyleecan.Classes.SolutionMat import SolutionMat
+from pyleecan.Classes.SolutionData import SolutionData
+from pyleecan.Functions.MeshSolution.build_solution_vector import (
+    build_solution_vector,
+)
+from SciDataTool import Data1D, DataTime
 import numpy as np
 
 
@@ -111,5 +116,113 @@ def test_MeshMat_2group():
     assert testA == pytest.approx(0, rel=DELTA), msg
 
 
+def get_meshsol_grid(N=20, Nt=5):
+    """MeshSolution of a N x N grid of triangles with a node solution, a cell
+    solution and a cell vector solution (the stator group is contiguous)"""
+    x, y = np.meshgrid(np.arange(N + 1), np.arange(N + 1), indexing="ij")
+    ind = np.arange((N + 1) ** 2).reshape(N + 1, N + 1)
+    n0, n1 = ind[:-1, :-1].ravel(), ind[1:, :-1].ravel()
+    n2, n3 = ind[1:, 1:].ravel(), ind[:-1, 1:].ravel()
+    connect = np.concatenate((np.stack((n0, n1, n2), 1), np.stack((n0, n2, n3), 1)))
+    Nc, Nn = connect.shape[0], ind.size
+
+    mesh = MeshMat()
+    mesh.node = NodeMat(
+        coordinate=np.stack((x.ravel(), y.ravel()), 1), nb_node=Nn, indice=np.arange(Nn)
+    )
+    mesh.cell["triangle"] = CellMat(
+        connectivity=connect, nb_cell=Nc, nb_node_per_cell=3, indice=np.arange(Nc)
+    )
+
+    rng = np.random.default_rng(0)
+    Time = Data1D(name="time", unit="s", values=np.linspace(0, 1, Nt))
+    Indices = Data1D(name="indice", values=np.arange(Nc), is_components=True)
+    meshsol = MeshSolution(mesh=[mesh])
+    meshsol.solution = [
+        SolutionMat(
+            label="node",
+            type_cell="node",
+            field=rng.random((Nt, Nn)),
+            axis_name=["time", "indice"],
+            axis_size=[Nt, Nn],
+        ),
+        SolutionData(
+            label="mu",
+            type_cell="triangle",
+            field=DataTime(
+                name="mu",
+                symbol="mu",
+                axes=[Time, Indices],
+                values=rng.random((Nt, Nc)),
+            ),
+        ),
+        build_solution_vector(
+            field=rng.random((Nt, Nc, 2)),
+            axis_list=[Time, Indices],
+            name="B",
+            symbol="B",
+        ),
+    ]
+    meshsol.solution[2].label = "B"
+    meshsol.group = {
+        "stator": np.arange(10, Nc // 2),
+        "rotor": rng.permutation(np.arange(Nc // 2, Nc))[: Nc // 4],
+    }
+    return meshsol
+
+
+@pytest.mark.MeshSol
+@pytest.mark.parametrize("group", ["stator", "rotor", ["stator", "rotor"]])
+def test_get_group_view(group):
+    """Check that the group views have the same data as the group copies"""
+    meshsol = get_meshsol_grid()
+    MS_ref = meshsol.get_group(group)
+    MS_view = meshsol.get_group(group, is_view=True)
+
+    mesh_ref, mesh_view = MS_ref.get_mesh(), MS_view.get_mesh()
+    np.testing.assert_array_equal(
+        mesh_view.cell["triangle"].connectivity, mesh_ref.cell["triangle"].connectivity
+    )
+    np.testing.assert_array_equal(
+        mesh_view.cell["triangle"].indice, mesh_ref.cell["triangle"].indice
+    )
+    np.testing.assert_array_equal(mesh_view.node.indice, mesh_ref.node.indice)
+    np.testing.assert_array_equal(mesh_view.node.coordinate, mesh_ref.node.coordinate)
+
+    assert len(MS_view.solution) == len(MS_ref.solution) == 3
+    for label in ["node", "mu", "B"]:
+        np.testing.assert_array_equal(
+            MS_view.get_field(label=label), MS_ref.get_field(label=label)
+        )
+
+    # The contiguous groups share the values of the solutions and all the
+    # view groups are read-only
+    field = meshsol.get_solution(label="mu").field.values
+    for field_view in [
+        MS_view.get_solution(label="node").field,
+        MS_view.get_solution(label="mu").field.values,
+        MS_view.get_solution(label="B").field.components["comp_x"].values,
+    ]:
+        with pytest.raises(ValueError):
+            field_view[0, 0] = 0
+    field_view = MS_view.get_solution(label="mu").field.values
+    assert np.shares_memory(field, field_view) == (group == "stator")
+    if group == "stator":
+        # The changes of the parent show through the view
+        field[0, 10] = -1
+        assert field_view[0, 0] == -1
+    # The parent is not modified
+    assert meshsol.get_solution(label="mu").field.axes[1].get_length() == 800
+
+    # The view can be saved and copied
+    MS_copy = MS_view.copy()
+    np.testing.assert_array_equal(
+        MS_copy.get_field(label="B"), MS_ref.get_field(label="B")
+    )
+    assert MS_copy.get_solution(label="mu").field.values.flags.writeable
+
+
 if __name__ == "__main__":
     Xout = test_MeshMat_2group()
+    for group in ["stator", "rotor", ["stator", "rotor"]]:
+        test_get_group_view(group)
@@ -0,0 +1,150 @@
+from os.path import join
+
+import pytest
+import numpy as np
+
+from pyleecan.Classes.LUTdq import LUTdq
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Classes.Output import Output
+from pyleecan.Classes.OutLoss import OutLoss
+from pyleecan.Classes.OPdq import OPdq
+from pyleecan.Classes.ElecLUTdq import ElecLUTdq
+from pyleecan.Classes.VarLoadCurrent import VarLoadCurrent
+
+from pyleecan.Functions.load import load
+
+from pyleecan.definitions import DATA_DIR
+
+N0_list = [500, 1500, 2500, 3500, 4500, 5500]
+
+
+def get_LUT(machine):
+    """LUT with analytical flux linkage and losses on a 11x11 Id/Iq grid"""
+    Id, Iq = np.meshgrid(np.linspace(-250, 0, 11), np.linspace(0, 250, 11))
+    OP_matrix = np.zeros((Id.size, 3))
+    OP_matrix[:, 1] = Id.ravel()
+    OP_matrix[:, 2] = Iq.ravel()
+    Id, Iq = OP_matrix[:, 1], OP_matrix[:, 2]
+
+    simu = Simu1(
+        machine=machine,
+        var_simu=VarLoadCurrent(OP_matrix=OP_matrix),
+    )
+    LUT = LUTdq(simu=simu)
+    LUT.Phi_dqh_mean = np.column_stack(
+        (0.1 + 2e-4 * Id - 1e-7 * Iq ** 2, 4e-4 * Iq / (1 + Iq / 500), 0 * Id)
+    )
+    LUT.output_list = list()
+    for id_val, iq_val in zip(Id, Iq):
+        coeff = {"A": 1e-2 * (1 + iq_val / 250), "a": 1, "B": 1e-5, "b": 2}
+        coeff.update({"C": 0, "c": 1})
+        LUT.output_list.append(
+            Output(
+                loss=OutLoss(
+                    coeff_dict={
+                        "stator core": coeff,
+                        "rotor core": {"A": 1e-3, "a": 1.5, "B": 0, "b": 1},
+                    }
+                )
+            )
+        )
+        LUT.output_list[-1].loss.coeff_dict["rotor core"].update({"C": 0, "c": 1})
+    return LUT
+
+
+def get_elec():
+    """ElecLUTdq with enforced LUT in a Simulation/Output"""
+    machine = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    elec = ElecLUTdq(
+        Urms_max=150,
+        Irms_max=250,
+        type_skin_effect=0,
+        n_Id=11,
+        n_Iq=11,
+        n_interp=20,
+        Id_min=-250,
+        Id_max=0,
+        Iq_min=0,
+        Iq_max=250,
+        LUT_enforced=get_LUT(machine),
+    )
+    # Simulation / Output to call solve_MTPA
+    simu = Simu1(machine=machine, elec=elec)
+    Output(simu=simu)
+    return elec
+
+
+@pytest.fixture(scope="module")
+def elec():
+    return get_elec()
+
+
+@pytest.mark.parametrize("load_rate", [1, 0])
+def test_solve_MTPA_vect(elec, load_rate):
+    """Check that the batched MTPA gives the same results as solve_MTPA"""
+
+    LUT = elec.LUT_enforced
+    output = elec.parent.parent
+    Rs = elec.parent.machine.stator.comp_resistance_wind(T=elec.Tsta)
+
+    out_dict = elec.solve_MTPA_vect(LUT, N0_list, load_rate=load_rate)
+    assert out_dict["Id"].shape == (len(N0_list),)
+
+    elec.load_rate = load_rate
+    for ii, N0 in enumerate(N0_list):
+        output.elec.OP = OPdq(N0=N0)
+        ref_dict = elec.solve_MTPA(LUT, Rs)
+        for key in ["Id", "Iq", "Ud", "Uq", "Tem_av", "Phid", "Phiq"]:
+            assert out_dict[key][ii] == pytest.approx(ref_dict[key], abs=0.5)
+    elec.load_rate = 1
+
+
+def test_solve_MTPA_vect_load_rate(elec):
+    """Check the torque of partial loads and the constraints"""
+
+    LUT = elec.LUT_enforced
+    N0, load_rate = np.meshgrid(N0_list, [0, 0.25, 0.5, 0.75, 1])
+    out_dict = elec.solve_MTPA_vect(LUT, N0.ravel(), load_rate=load_rate.ravel())
+
+    Tem = out_dict["Tem_av"].reshape(N0.shape)
+    np.testing.assert_allclose(Tem[0], 0, atol=1e-6)
+    for ii in range(1, 4):
+        np.testing.assert_allclose(Tem[ii], load_rate[ii] * Tem[-1], atol=0.2)
+    U = np.sqrt(out_dict["Ud"] ** 2 + out_dict["Uq"] ** 2)
+    assert np.all(U <= elec.Urms_max)
+    assert np.all(np.sqrt(out_dict["Id"] ** 2 + out_dict["Iq"] ** 2) <= 250)
+
+    # Flux weakening: Id decreases with speed at full load
+    Id = out_dict["Id"].reshape(N0.shape)
+    assert np.all(np.diff(Id[-1]) <= 0)
+
+    # Losses
+    Pjoule = 3 * elec.parent.machine.stator.comp_resistance_wind(T=elec.Tsta)
+    Pjoule *= out_dict["Id"] ** 2 + out_dict["Iq"] ** 2
+    np.testing.assert_allclose(out_dict["Pjoule"], Pjoule)
+    assert np.all(out_dict["Pstator"] > 0)
+    np.testing.assert_allclose(out_dict["Pmagnet"], 0)
+
+
+def test_interp_Ploss_dqh_vect(elec):
+    """Check the losses interpolation for several speeds at once"""
+
+    LUT = elec.LUT_enforced
+    Id = np.linspace(-240, -10, len(N0_list))
+    Iq = np.linspace(10, 240, len(N0_list))
+    Ploss = LUT.interp_Ploss_dqh_vect(Id, Iq, N0_list)
+    assert Ploss.shape == (len(N0_list), 4)
+    felec = np.array(N0_list) / 60 * elec.parent.machine.get_pole_pair_number()
+    # Stator core losses are linear in Iq
+    Pstator = 1e-2 * (1 + Iq / 250) * felec + 1e-5 * felec ** 2
+    np.testing.assert_allclose(Ploss[:, 0], Pstator)
+    np.testing.assert_allclose(Ploss[:, 1], 0)
+    np.testing.assert_allclose(Ploss[:, 2], 1e-3 * felec ** 1.5)
+
+
+if __name__ == "__main__":
+    elec_obj = get_elec()
+    test_solve_MTPA_vect(elec_obj, 1)
+    test_solve_MTPA_vect(elec_obj, 0)
+    test_solve_MTPA_vect_load_rate(elec_obj)
+    test_interp_Ploss_dqh_vect(elec_obj)
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+from time import time
+
+import pytest
+import numpy as np
+
+from pyleecan.Classes.ForceTensor import ForceTensor
+from pyleecan.Classes.NodeMat import NodeMat
+from pyleecan.Classes.MeshMat import MeshMat
+from pyleecan.Classes.CellMat import CellMat
+
+
+def generate_mesh(Nx, Ny, node_offset=0, cell_offset=0):
+    """Generate a rectangular triangle3 mesh of 2*Nx*Ny elements
+    (node and cell indices are shuffled to check the indices mapping)"""
+
+    x, y = np.meshgrid(np.linspace(0, 1, Nx + 1), np.linspace(0, 1, Ny + 1))
+    coordinate = np.column_stack((x.ravel(), y.ravel()))
+    node_indice = np.random.permutation(coordinate.shape[0]) + node_offset
+
+    # Two triangles per rectangle, half of them clockwise oriented
+    ii, jj = np.meshgrid(np.arange(Nx), np.arange(Ny))
+    n0 = (jj * (Nx + 1) + ii).ravel()
+    n1, n2, n3 = n0 + 1, n0 + Nx + 2, n0 + Nx + 1
+    connect_pos = np.concatenate(
+        (np.column_stack((n0, n1, n2)), np.column_stack((n0, n3, n2)))
+    )
+    nb_cell = connect_pos.shape[0]
+
+    mesh = MeshMat()
+    mesh.node = NodeMat(
+        coordinate=coordinate, nb_node=coordinate.shape[0], indice=node_indice
+    )
+    mesh.cell["triangle3"] = CellMat(
+        connectivity=node_indice[connect_pos],
+        nb_cell=nb_cell,
+        nb_node_per_cell=3,
+        indice=np.random.permutation(nb_cell) + cell_offset,
+    )
+    return mesh
+
+
+def generate_fields(mesh, Nt_tot, dim=2):
+    """Generate random B, H, mu fields on a random order of the cells"""
+    indice = np.random.permutation(mesh.cell["triangle3"].indice)
+    nb_elem = indice.size
+    B = np.random.uniform(-2, 2, (nb_elem, dim, Nt_tot))
+    H = np.random.uniform(-1e4, 1e4, (nb_elem, dim, Nt_tot))
+    mu = np.random.uniform(1e-4, 1e-2, (nb_elem, Nt_tot))
+    return B, H, mu, indice
+
+
+@pytest.mark.ForceTensor
+def test_element_loop_vect_compare():
+    """Check that element_loop_vect matches element_loop on a generated mesh"""
+
+    np.random.seed(0)
+    dim, Nt_tot = 2, 4
+    mesh = generate_mesh(6, 5, node_offset=10, cell_offset=3)
+    B, H, mu, indice = generate_fields(mesh, Nt_tot, dim=dim)
+
+    tensor = ForceTensor(tensor={"magnetostriction": True})
+    f_ref, connect_ref = tensor.element_loop(mesh, B, H, mu, indice, dim, Nt_tot)
+    f_vect, connect = tensor.element_loop_vect(mesh, B, H, mu, indice, dim, Nt_tot)
+
+    assert f_vect.shape == f_ref.shape
+    assert np.allclose(f_vect, f_ref, rtol=1e-10, atol=1e-12 * np.max(np.abs(f_ref)))
+    assert np.array_equal(connect, connect_ref)
+
+    # Only a subset of the elements
+    sub = slice(0, indice.size // 2)
+    f_ref, _ = tensor.element_loop(
+        mesh, B[sub], H[sub], mu[sub], indice[sub], dim, Nt_tot
+    )
+    f_vect, _ = tensor.element_loop_vect(
+        mesh, B[sub], H[sub], mu[sub], indice[sub], dim, Nt_tot
+    )
+    assert np.allclose(f_vect, f_ref, rtol=1e-10, atol=1e-12 * np.max(np.abs(f_ref)))
+
+
+@pytest.mark.ForceTensor
+def test_element_loop_vect_1cell():
+    """Validation of element_loop_vect on an elementary triangle (forces sum to 0)"""
+
+    mesh = generate_mesh(1, 1)
+    B, H, mu, indice = generate_fields(mesh, 3)
+    tensor = ForceTensor(tensor={"magnetostriction": True})
+    f, _ = tensor.element_loop_vect(mesh, B, H, mu, indice, 2, 3)
+
+    # Constant tensor on a closed contour => no resulting force
+    assert np.allclose(np.sum(f, axis=0), 0, atol=1e-12 * np.max(np.abs(f)))
+
+    tensor.tensor = {"magnetostriction": False}
+    f, _ = tensor.element_loop_vect(mesh, B, H, mu, indice, 2, 3)
+    assert not np.any(f)
+
+
+@pytest.mark.long_5s
+@pytest.mark.ForceTensor
+def test_element_loop_vect_benchmark(Nx=40, Ny=25, Nt_tot=20):
+    """Benchmark element_loop_vect against element_loop on a generated mesh
+    (the timings are only printed)"""
+
+    np.random.seed(1)
+    dim = 2
+    mesh = generate_mesh(Nx, Ny)
+    B, H, mu, indice = generate_fields(mesh, Nt_tot, dim=dim)
+    tensor = ForceTensor(tensor={"magnetostriction": True})
+
+    start = time()
+    f_ref, _ = tensor.element_loop(mesh, B, H, mu, indice, dim, Nt_tot)
+    t_loop = time() - start
+
+    start = time()
+    f_vect, _ = tensor.element_loop_vect(mesh, B, H, mu, indice, dim, Nt_tot)
+    t_vect = time() - start
+
+    print(
+        "\nelement_loop: "
+        + format(t_loop, ".3f")
+        + " s, element_loop_vect: "
+        + format(t_vect, ".3f")
+        + " s ("
+        + str(indice.size)
+        + " elements, "
+        + str(Nt_tot)
+        + " time steps)"
+    )
+    assert np.allclose(f_vect, f_ref, rtol=1e-10, atol=1e-12 * np.max(np.abs(f_ref)))
+
+
+if __name__ == "__main__":
+    test_element_loop_vect_compare()
+    test_element_loop_vect_1cell()
+    test_element_loop_vect_benchmark()
@@ -0,0 +1,192 @@
+import pickle
+
+import pytest
+import numpy as np
+
+from pyleecan.Classes.LossFEMM import LossFEMM
+from pyleecan.Classes.LUTdq import LUTdq
+from pyleecan.Classes.MachineIPMSM import MachineIPMSM
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Classes.VarLoadCurrent import VarLoadCurrent
+from pyleecan.Classes.Output import Output
+from pyleecan.Classes.OutMag import OutMag
+from pyleecan.Methods.Output.LUTdq.interp_Ploss_dqh import NB_PLOSS_MAX
+
+Phi_mag, Ld, Lq = 0.1, 1e-3, 2e-3
+
+
+def get_LUT(Id_vect, Iq_vect, is_axis=False):
+    """LUT with linear flux linkage on a regular grid (or on Id and Iq axes only)"""
+    if is_axis:
+        OP_list = [[0, Id, 0] for Id in Id_vect]
+        OP_list += [[0, 0, Iq] for Iq in Iq_vect if Iq != 0]
+        OP_matrix = np.array(OP_list, dtype=float)
+    else:
+        Id, Iq = np.meshgrid(Id_vect, Iq_vect)
+        OP_matrix = np.zeros((Id.size, 3))
+        OP_matrix[:, 1] = Id.ravel()
+        OP_matrix[:, 2] = Iq.ravel()
+    Id, Iq = OP_matrix[:, 1], OP_matrix[:, 2]
+    simu = Simu1(var_simu=VarLoadCurrent(OP_matrix=OP_matrix))
+    LUT = LUTdq(simu=simu)
+    LUT.Phi_dqh_mean = np.column_stack((Phi_mag + Ld * Id, Lq * Iq, 0 * Id))
+    LUT.output_list = [Output(mag=OutMag(Tem_rip_pp=0.5 * I)) for I in Iq]
+    return LUT
+
+
+@pytest.mark.parametrize("is_axis", [False, True])
+def test_LUTdq_interp_Phi_dqh(is_axis):
+    """Check the interpolation of the flux linkage and the reuse of the
+    interpolator"""
+
+    LUT = get_LUT(np.linspace(-100, 0, 5), np.linspace(0, 100, 6), is_axis)
+
+    Id = np.linspace(-100, 0, 21)
+    Iq = np.linspace(0, 100, 21)
+    Phi_dqh = LUT.interp_Phi_dqh(Id, Iq)
+    assert Phi_dqh.shape == (3, 21)
+    np.testing.assert_allclose(Phi_dqh[0], Phi_mag + Ld * Id)
+    np.testing.assert_allclose(Phi_dqh[1], Lq * Iq)
+    np.testing.assert_allclose(Phi_dqh[2], 0)
+
+    # Scalar input
+    Phi_dqh = LUT.interp_Phi_dqh(-50, 20)
+    assert Phi_dqh.shape == (3, 1)
+    np.testing.assert_allclose(Phi_dqh[:2, 0], [Phi_mag - 50 * Ld, 20 * Lq])
+
+    # The interpolator is built once
+    interp = LUT.get_interp_cache()["Phi_dqh"][1]
+    LUT.interp_Phi_dqh(Id, Iq)
+    assert LUT.get_interp_cache()["Phi_dqh"][1] is interp
+
+    # New flux table => new interpolator
+    LUT.Phi_dqh_mean = 2 * LUT.Phi_dqh_mean
+    np.testing.assert_allclose(LUT.interp_Phi_dqh(Id, Iq)[1], 2 * Lq * Iq)
+    assert LUT.get_interp_cache()["Phi_dqh"][1] is not interp
+
+    # Flux table modified in place => new interpolator
+    interp = LUT.get_interp_cache()["Phi_dqh"][1]
+    LUT.Phi_dqh_mean[:, 1] *= 2
+    np.testing.assert_allclose(LUT.interp_Phi_dqh(Id, Iq)[1], 4 * Lq * Iq)
+    assert LUT.get_interp_cache()["Phi_dqh"][1] is not interp
+
+    # New output_list => cache reset
+    LUT.output_list = LUT.output_list[:]
+    assert LUT.get_interp_cache() == dict()
+
+    # output_list or OP_matrix modified in place => cache reset
+    LUT.interp_Phi_dqh(Id, Iq)
+    LUT.output_list[0] = Output(mag=OutMag(Tem_rip_pp=0))
+    assert LUT.get_interp_cache() == dict()
+    LUT.interp_Phi_dqh(Id, Iq)
+    LUT.output_list.append(Output(mag=OutMag(Tem_rip_pp=0)))
+    assert LUT.get_interp_cache() == dict()
+    LUT.output_list.pop()
+    LUT.interp_Phi_dqh(Id, Iq)
+    assert "Phi_dqh" in LUT.get_interp_cache()
+    LUT.get_OP_matrix()[0, 0] = 1000
+    assert LUT.get_interp_cache() == dict()
+
+
+def test_LUTdq_interp_Tem_rip_dqh():
+    """Check the interpolation of the torque ripple"""
+
+    LUT = get_LUT(np.linspace(-100, 0, 5), np.linspace(0, 100, 6))
+
+    Iq = np.linspace(0, 100, 11)
+    np.testing.assert_allclose(LUT.interp_Tem_rip_dqh(-20 + 0 * Iq, Iq), 0.5 * Iq)
+    assert float(LUT.interp_Tem_rip_dqh(-20, 30)) == pytest.approx(15)
+
+    # The interpolator is built once and rebuilt if the torque ripple of an
+    # output is modified
+    interp = LUT.get_interp_cache()["Tem_rip_pp"][1]
+    LUT.interp_Tem_rip_dqh(-20, 30)
+    assert LUT.get_interp_cache()["Tem_rip_pp"][1] is interp
+    for out in LUT.output_list:
+        out.mag.Tem_rip_pp *= 2
+    np.testing.assert_allclose(LUT.interp_Tem_rip_dqh(-20 + 0 * Iq, Iq), Iq)
+
+    # 1D LUT along q axis
+    LUT = get_LUT(np.array([0]), np.linspace(0, 100, 6))
+    np.testing.assert_allclose(LUT.interp_Tem_rip_dqh(0 * Iq, Iq), 0.5 * Iq)
+
+
+def test_LUTdq_interp_Ploss_dqh(monkeypatch):
+    """Check that the losses interpolators depend on the speed, the loss model
+    and the machine and that the number of stored interpolators is limited"""
+
+    nb_comp = [0]
+
+    def comp_Ploss_dqh(self, N0):
+        """Losses proportional to the speed (N_OP, 5)"""
+        nb_comp[0] += 1
+        Iq = self.get_OP_matrix()[:, 2]
+        return np.outer(Iq, np.ones(5)) * N0 * self.simu.loss.Tsta
+
+    monkeypatch.setattr(LUTdq, "comp_Ploss_dqh", comp_Ploss_dqh)
+    LUT = get_LUT(np.linspace(-100, 0, 3), np.linspace(0, 100, 3))
+    LUT.simu.loss = LossFEMM(Tsta=1)
+    LUT.simu.machine = MachineIPMSM()
+
+    np.testing.assert_allclose(LUT.interp_Ploss_dqh(-50, 50, N0=10)[:, 0], 500)
+    np.testing.assert_allclose(LUT.interp_Ploss_dqh(-50, 20, N0=10)[:, 0], 200)
+    np.testing.assert_allclose(LUT.interp_Ploss_dqh(-50, 50, N0=20)[:, 0], 1000)
+    assert nb_comp[0] == 2
+
+    # Modified loss model or machine => new interpolators
+    LUT.simu.loss.Tsta = 2
+    np.testing.assert_allclose(LUT.interp_Ploss_dqh(-50, 50, N0=10)[:, 0], 1000)
+    assert nb_comp[0] == 3
+    LUT.simu.machine.stator.Rext = 0.2
+    LUT.interp_Ploss_dqh(-50, 50, N0=10)
+    assert nb_comp[0] == 4
+
+    # Limited number of speeds
+    for N0 in range(100):
+        LUT.interp_Ploss_dqh(-50, 50, N0=N0)
+    assert len(LUT.get_interp_cache()["Ploss_dqh"]["interp"]) == NB_PLOSS_MAX
+
+
+def test_LUTdq_interp_Ploss_dqh_error():
+    """Check that the losses can't be interpolated from nd + nq - 1 operating
+    points without the operating point Id=Iq=0"""
+
+    OP_matrix = np.array(
+        [[0, -100, 0], [0, -50, 0], [0, 0, 50], [0, 0, 100], [0, -50, 50]]
+    )
+    simu = Simu1(var_simu=VarLoadCurrent(OP_matrix=OP_matrix))
+    simu.loss = LossFEMM()
+    simu.machine = MachineIPMSM()
+    LUT = LUTdq(simu=simu, output_list=[Output() for _ in OP_matrix])
+    with pytest.raises(Exception, match="Id=Iq=0 is required"):
+        LUT.interp_Ploss_dqh(-50, 50, N0=10)
+    with pytest.raises(Exception, match="Id=Iq=0 is required"):
+        LUT.interp_Ploss_dqh_vect(np.array([-50]), np.array([50]), N0=10)
+
+
+def test_LUTdq_interp_cache_not_saved():
+    """Check that the interpolators are not saved, copied or pickled"""
+
+    LUT = get_LUT(np.linspace(-100, 0, 3), np.linspace(0, 100, 3))
+    LUT.interp_Phi_dqh(np.array([-10.0]), np.array([10.0]))
+    assert "Phi_dqh" in LUT.get_interp_cache()
+
+    LUT_dict = LUT.as_dict()
+    assert "_cache_dict" not in LUT_dict
+    LUT2 = LUT.copy()
+    assert "_cache_dict" not in LUT2.__dict__
+    assert LUT2.compare(LUT) == []
+
+    LUT3 = pickle.loads(pickle.dumps(LUT))
+    assert "_cache_dict" not in LUT3.__dict__
+    np.testing.assert_allclose(
+        LUT3.interp_Phi_dqh(-10, 10), LUT.interp_Phi_dqh(-10, 10)
+    )
+
+
+if __name__ == "__main__":
+    test_LUTdq_interp_Phi_dqh(False)
+    test_LUTdq_interp_Phi_dqh(True)
+    test_LUTdq_interp_Tem_rip_dqh()
+    test_LUTdq_interp_Ploss_dqh_error()
+    test_LUTdq_interp_cache_not_saved()
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+from os.path import join
+
+import pytest
+from numpy import zeros, cos, sin, newaxis
+from numpy.testing import assert_array_equal
+
+from pyleecan.Classes.InputCurrent import InputCurrent
+from pyleecan.Classes.MagFEMM import MagFEMM
+from pyleecan.Classes.Magnetics import Magnetics
+from pyleecan.Classes.OPdq import OPdq
+from pyleecan.Classes.Output import Output
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Classes.Skew import Skew
+
+from pyleecan.Functions.load import load
+from pyleecan.Methods.Simulation.Magnetics.comp_flux_airgap_parallel import (
+    set_slice_path,
+)
+from pyleecan.definitions import DATA_DIR
+from Tests import save_path
+
+
+class MagFake(Magnetics):
+    """Fake magnetic solver: analytic fields depending on the slice shift angles"""
+
+    def comp_flux_airgap(self, output, axes_dict, Is_val=None, Ir_val=None):
+        angle = axes_dict["angle"].get_values(is_oneperiod=self.is_periodicity_a)
+        time = axes_dict["time"].get_values(is_oneperiod=self.is_periodicity_t)
+        shift = self.angle_rotor_shift - self.angle_stator_shift
+        out_dict = dict()
+        out_dict["B_{rad}"] = cos(
+            4 * (angle[newaxis, :] - shift) + 100 * time[:, newaxis]
+        )
+        out_dict["B_{circ}"] = sin(4 * (angle[newaxis, :] + shift) - time[:, newaxis])
+        out_dict["Tem"] = 10 * cos(6 * shift + 50 * time)
+        Phi_wind = zeros((time.size, 3))
+        for ii in range(3):
+            Phi_wind[:, ii] = cos(shift + 100 * time + ii)
+        out_dict["Phi_wind"] = {"Stator-0": Phi_wind}
+        out_dict["Phi_wind_stator"] = Phi_wind
+        return out_dict
+
+
+def run_fake_skew(nb_worker_slice):
+    """Run a skewed machine with MagFake and nb_worker_slice processes"""
+    machine = load(join(DATA_DIR, "Machine", "SPMSM_skew.json"))
+    machine.rotor.skew = Skew(type_skew="linear", is_step=True, rate=0.5, Nstep=5)
+
+    simu = Simu1(name="test_Magnetics_slice_parallel", machine=machine)
+    simu.input = InputCurrent(OP=OPdq(N0=1200, Id_ref=0, Iq_ref=0), Na_tot=64, Nt_tot=8)
+    simu.mag = MagFake(
+        is_periodicity_a=False,
+        is_periodicity_t=False,
+        nb_worker_slice=nb_worker_slice,
+    )
+    return simu.run()
+
+
+@pytest.mark.SPMSM
+@pytest.mark.SliceModel
+@pytest.mark.parallel
+def test_Magnetics_slice_parallel():
+    """Check that the parallel slice loop gives the same results as the serial one"""
+
+    out_serial = run_fake_skew(nb_worker_slice=1)
+    out_parallel = run_fake_skew(nb_worker_slice=3)
+
+    B_serial = out_serial.mag.B.components["radial"].values
+    B_parallel = out_parallel.mag.B.components["radial"].values
+    assert B_serial.shape[-1] == 5  # 5 unique slices
+    assert_array_equal(B_parallel, B_serial)
+    assert_array_equal(
+        out_parallel.mag.B.components["tangential"].values,
+        out_serial.mag.B.components["tangential"].values,
+    )
+    assert_array_equal(out_parallel.mag.Tem.values, out_serial.mag.Tem.values)
+    assert_array_equal(
+        out_parallel.mag.Phi_wind_stator.values, out_serial.mag.Phi_wind_stator.values
+    )
+    assert out_parallel.simu.mag.angle_rotor_shift == (
+        out_serial.simu.mag.angle_rotor_shift
+    )
+
+
+@pytest.mark.SliceModel
+def test_slice_path():
+    """Check that each slice uses its own copy of the reused FEMM file"""
+    mag = MagFEMM()
+    output = Output(simu=Simu1(name="test_slice_path", mag=mag))
+    output.path_result = join(save_path, "test_slice_path")
+    save_dir = mag.get_path_save(output)
+    mag.import_file = join(save_dir, "model.fem")
+    with open(mag.import_file, "w") as fem_file:
+        fem_file.write("fem")
+
+    slice_path = join(output.path_result, "Slice_1")
+    set_slice_path(mag, output, slice_path, save_dir)
+    assert output.get_path_result() == slice_path
+    assert mag.import_file == join(slice_path, "Femm", "model.fem")
+    with open(mag.import_file) as fem_file:
+        assert fem_file.read() == "fem"
+
+
+if __name__ == "__main__":
+    test_Magnetics_slice_parallel()
+    test_slice_path()
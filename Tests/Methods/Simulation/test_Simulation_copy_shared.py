@@ -0,0 +1,177 @@
+from os.path import join
+from time import time
+import tracemalloc
+
+import pytest
+
+from pyleecan.Classes.FrameBar import FrameBar
+from pyleecan.Classes.OPdq import OPdq
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Classes.InputCurrent import InputCurrent
+from pyleecan.Classes.VarParam import VarParam
+from pyleecan.Classes.ParamExplorerSet import ParamExplorerSet
+
+from pyleecan.Functions.load import load
+
+from pyleecan.definitions import DATA_DIR
+
+
+def get_simu():
+    machine = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    simu = Simu1(name="test_Simulation_copy_shared", machine=machine)
+    simu.input = InputCurrent(
+        OP=OPdq(N0=1000, Id_ref=0, Iq_ref=0), Nt_tot=16, Na_tot=64
+    )
+    return simu
+
+
+def get_var_param(N, is_reuse_machine):
+    return VarParam(
+        is_reuse_machine=is_reuse_machine,
+        paramexplorer_list=[
+            ParamExplorerSet(
+                name="Speed",
+                symbol="N0",
+                unit="rpm",
+                setter="simu.input.OP.N0",
+                value=[1000 + 10 * ii for ii in range(N)],
+            ),
+            ParamExplorerSet(
+                name="Magnet width",
+                symbol="W1",
+                unit="m",
+                setter="simu.machine.rotor.hole[0].W1",
+                value=[0.009, 0.01],
+            ),
+        ],
+    )
+
+
+@pytest.mark.VarParam
+def test_copy_shared():
+    """Check which part of the machine is shared by copy_shared"""
+
+    simu = get_simu()
+
+    # Only the input is modified => machine is shared
+    other = simu.copy_shared(["simu.input.OP.N0"], keep_function=True)
+    assert other.machine is simu.machine
+    assert other.input is not simu.input
+    assert simu.machine.parent is simu
+    assert other.compare(simu) == []
+
+    # Rotor is modified => machine is copied, materials are shared
+    other = simu.copy_shared(["simu.machine.rotor.hole[0].W1"], keep_function=True)
+    assert other.machine is not simu.machine
+    assert other.machine.parent is other
+    assert other.machine.rotor is not simu.machine.rotor
+    assert other.machine.rotor.parent is other.machine
+    assert other.machine.stator.parent is other.machine
+    assert other.machine.stator.mat_type is simu.machine.stator.mat_type
+    assert other.machine.rotor.mat_type is simu.machine.rotor.mat_type
+    # The original objects keep their parent
+    assert simu.machine.stator.parent is simu.machine
+    assert simu.machine.stator.mat_type.parent is simu.machine.stator
+    assert other.compare(simu) == []
+
+    other.machine.rotor.hole[0].W1 = 0.005
+    assert simu.machine.rotor.hole[0].W1 != 0.005
+
+    # Modified material => not shared
+    other = simu.copy_shared(
+        ["simu.machine.rotor.mat_type.mag.mur_lin"], keep_function=True
+    )
+    assert other.machine.rotor.mat_type is not simu.machine.rotor.mat_type
+    assert other.machine.stator.mat_type is simu.machine.stator.mat_type
+
+    # Unknown modification => full copy
+    other = simu.copy_shared(None)
+    assert other.machine is not simu.machine
+    assert other.machine.stator is not simu.machine.stator
+
+
+@pytest.mark.VarParam
+def test_copy_shared_parent():
+    """Check that the objects of the copy reach the modified objects of the
+    copy through their parent"""
+
+    simu = get_simu()
+    Rext = simu.machine.stator.Rext
+    simu.machine.frame = FrameBar(Rint=Rext + 0.01, Rext=Rext + 0.02)
+    Hgap = simu.machine.frame.comp_height_gap()
+
+    other = simu.copy_shared(["simu.machine.stator.Rext"], keep_function=True)
+    other.machine.stator.Rext = Rext - 0.005
+    assert other.machine.frame.parent is other.machine
+    assert other.machine.frame.comp_height_gap() == pytest.approx(Hgap + 0.005)
+    assert simu.machine.frame.comp_height_gap() == pytest.approx(Hgap)
+
+
+@pytest.mark.VarParam
+def test_VarParam_reuse_machine():
+    """Check that sharing the machine generates the same simulations"""
+
+    simu = get_simu()
+    simu_dict = get_var_param(3, True).generate_simulation_list(simu)
+    simu_dict_ref = get_var_param(3, False).generate_simulation_list(simu)
+
+    simu_list = simu_dict["simulation_list"]
+    assert len(simu_list) == 6
+    for simu_shared, simu_ref in zip(simu_list, simu_dict_ref["simulation_list"]):
+        assert simu_shared.compare(simu_ref) == []
+        # Only the materials are shared
+        assert simu_shared.machine.rotor is not simu.machine.rotor
+        assert simu_shared.machine.stator.parent is simu_shared.machine
+        assert simu_shared.machine.stator.mat_type is simu.machine.stator.mat_type
+    assert simu_list[0].machine.rotor.hole[0].W1 == 0.009
+    assert simu_list[1].machine.rotor.hole[0].W1 == 0.01
+    assert simu.machine.rotor.hole[0].W1 not in [0.009, 0.01]
+
+    # Function setter => full copy
+    var_param = get_var_param(2, True)
+    var_param.paramexplorer_list[0].setter = "lambda simu, val: None"
+    simu_list = var_param.generate_simulation_list(simu)["simulation_list"]
+    assert simu_list[0].machine.stator.mat_type is not simu.machine.stator.mat_type
+
+
+@pytest.mark.long_5s
+@pytest.mark.VarParam
+def test_VarParam_reuse_machine_benchmark(N=50):
+    """Compare time and memory of the simulation list generation with and
+    without machine sharing"""
+
+    simu = get_simu()
+    result = dict()
+    for is_reuse_machine in [False, True]:
+        var_param = get_var_param(N, is_reuse_machine)
+        tracemalloc.start()
+        start = time()
+        simu_list = var_param.generate_simulation_list(simu)["simulation_list"]
+        duration = time() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result[is_reuse_machine] = (duration, peak)
+        assert len(simu_list) == 2 * N
+        del simu_list
+
+    print(
+        "\nGeneration of "
+        + str(2 * N)
+        + " simulations: full copy "
+        + format(result[False][0], ".3f")
+        + " s / "
+        + format(result[False][1] / 1e6, ".1f")
+        + " MB, shared machine "
+        + format(result[True][0], ".3f")
+        + " s / "
+        + format(result[True][1] / 1e6, ".1f")
+        + " MB"
+    )
+    assert result[True][1] < result[False][1]
+
+
+if __name__ == "__main__":
+    test_copy_shared()
+    test_copy_shared_parent()
+    test_VarParam_reuse_machine()
+    test_VarParam_reuse_machine_benchmark()
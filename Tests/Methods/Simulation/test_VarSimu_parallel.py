@@ -0,0 +1,138 @@
+from multiprocessing import Pool
+from os.path import join
+
+import pytest
+import numpy as np
+
+from pyleecan.Classes.OPdq import OPdq
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Classes.InputCurrent import InputCurrent
+from pyleecan.Classes.MagFEMM import MagFEMM
+from pyleecan.Classes.VarParam import VarParam
+from pyleecan.Classes.DataKeeper import DataKeeper
+from pyleecan.Classes.ParamExplorerSet import ParamExplorerSet
+from pyleecan.Classes.PostFunction import PostFunction
+
+from pyleecan.Functions.load import load
+from pyleecan.Methods.Simulation.VarSimu.run_parallel import set_step_path
+
+from pyleecan.definitions import DATA_DIR
+from Tests import save_path
+
+N0_list = [500, 1000, 2000, 3000, 4000, 6000]
+
+
+def fail_at_3000(output):
+    """Post-processing raising an error for one simulation of the list"""
+    if output.elec.OP.N0 == 3000:
+        raise Exception("Error on purpose for N0=3000")
+
+
+def get_simu(nb_worker, stop_if_error=False):
+    """Parameter sweep on the speed without physics (fast simulations)"""
+
+    machine = load(join(DATA_DIR, "Machine", "Toyota_Prius.json"))
+    simu = Simu1(name="test_VarSimu_parallel", machine=machine)
+    simu.input = InputCurrent(
+        OP=OPdq(N0=1000, Id_ref=0, Iq_ref=0), Nt_tot=16, Na_tot=64
+    )
+    simu.var_simu = VarParam(
+        stop_if_error=stop_if_error,
+        is_keep_all_output=True,
+        nb_worker=nb_worker,
+        datakeeper_list=[
+            DataKeeper(
+                name="Speed",
+                symbol="N",
+                unit="rpm",
+                keeper="lambda out: out.elec.OP.N0",
+                error_keeper="lambda simu: np.nan",
+            )
+        ],
+        paramexplorer_list=[
+            ParamExplorerSet(
+                name="Speed",
+                symbol="N0",
+                unit="rpm",
+                setter="simu.input.OP.N0",
+                value=N0_list,
+            )
+        ],
+        pre_keeper_postproc_list=[PostFunction(run=fail_at_3000)],
+    )
+    return simu
+
+
+@pytest.mark.VarParam
+@pytest.mark.parallel
+def test_VarSimu_parallel():
+    """Check that the parallel multi-simulation gives the same (ordered) results
+    as the sequential one, with the error isolated on the failing step"""
+
+    xout_serial = get_simu(nb_worker=1).run()
+    xout_parallel = get_simu(nb_worker=3).run()
+
+    N_ref = [N if N != 3000 else np.nan for N in N0_list]
+    assert xout_parallel.nb_simu == len(N0_list)
+    np.testing.assert_array_equal(xout_serial["N"].result, N_ref)
+    np.testing.assert_array_equal(xout_parallel["N"].result, N_ref)
+    assert xout_parallel["N"].result_ref == 1000
+    for key in ["Id", "Iq"]:
+        np.testing.assert_array_equal(
+            xout_parallel[key].result, xout_serial[key].result
+        )
+
+    # Outputs are sent back by the workers
+    for ii, N0 in enumerate(N0_list):
+        if N0 == 3000:
+            assert xout_parallel.output_list[ii] is None
+        else:
+            assert xout_parallel.output_list[ii].elec.OP.N0 == N0
+
+
+@pytest.mark.VarParam
+@pytest.mark.parallel
+def test_VarSimu_parallel_stop_if_error():
+    """Check that an error in a worker stops the multi-simulation (with the
+    traceback of the worker)"""
+
+    with pytest.raises(RuntimeError, match=r"Traceback[\s\S]*on purpose"):
+        get_simu(nb_worker=2, stop_if_error=True).run()
+
+
+def run_speed_list(nb_worker):
+    """Run the parameter sweep (in a worker process) and return the speeds"""
+    return list(get_simu(nb_worker=nb_worker).run()["N"].result)
+
+
+@pytest.mark.VarParam
+@pytest.mark.parallel
+def test_VarSimu_parallel_nested():
+    """Check that a parallel multi-simulation run in a worker process (that
+    can't start a process pool) is run sequentially"""
+
+    with Pool(1) as p:
+        N_list = p.apply(run_speed_list, (2,))
+    np.testing.assert_array_equal(N_list, [N if N != 3000 else np.nan for N in N0_list])
+
+
+def test_set_step_path():
+    """Check that each simulation uses its own copy of the reused FEMM file"""
+    fem_path = join(save_path, "test_set_step_path.fem")
+    with open(fem_path, "w") as fem_file:
+        fem_file.write("fem")
+    simu = Simu1(name="test_set_step_path", mag=MagFEMM(import_file=fem_path))
+
+    step_path = join(save_path, "test_set_step_path", "Step_2")
+    set_step_path(simu, step_path)
+    assert simu.path_result == step_path
+    assert simu.mag.import_file == join(step_path, "test_set_step_path.fem")
+    with open(simu.mag.import_file) as fem_file:
+        assert fem_file.read() == "fem"
+
+
+if __name__ == "__main__":
+    test_VarSimu_parallel()
+    test_VarSimu_parallel_stop_if_error()
+    test_VarSimu_parallel_nested()
+    test_set_step_path()
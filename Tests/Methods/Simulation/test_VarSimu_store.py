@@ -0,0 +1,112 @@
+from os.path import join
+
+import pytest
+import numpy as np
+from h5py import File
+
+from pyleecan.Classes.PostFunction import PostFunction
+from pyleecan.Classes.XOutputStore import XOutputStore
+from pyleecan.Methods.Output.XOutputStore import XOutputStoreError
+from Tests import save_load_path as save_path
+from Tests.Methods.Simulation.test_VarSimu_parallel import N0_list, get_simu
+
+# Speed of the simulations run in the main process
+N0_run = list()
+
+
+def count_run(output):
+    """Post-processing to count the simulations that are run"""
+    N0_run.append(output.elec.OP.N0)
+
+
+def get_simu_store(file_path, nb_worker=1, is_restart=False):
+    """Parameter sweep saving the results of each simulation in file_path"""
+    simu = get_simu(nb_worker=nb_worker)
+    simu.var_simu.pre_keeper_postproc_list.append(PostFunction(run=count_run))
+    simu.var_simu.store = XOutputStore(
+        save_path=file_path, is_save_output=True, is_restart=is_restart
+    )
+    return simu
+
+
+def interrupt(file_path):
+    """Remove the last steps of the file as if the run was interrupted (the
+    last step is not completely written)"""
+    with File(file_path, "a") as file:
+        del file["step/4"]
+        del file["step/5/data"]
+        file["step/5"].attrs["is_complete"] = False
+
+
+@pytest.mark.VarParam
+def test_VarSimu_store():
+    """Check that the results are saved as the simulations are done, that
+    the XOutput can be rebuilt from the file and that the simulations already
+    in the file are skipped on restart"""
+    file_path = join(save_path, "test_VarSimu_store.h5")
+    N_ref = [N if N != 3000 else np.nan for N in N0_list]
+
+    xout = get_simu_store(file_path).run()
+    np.testing.assert_array_equal(xout["N"].result, N_ref)
+    store = xout.simu.var_simu.store
+    assert store.get_step_index() == list(range(len(N0_list)))
+
+    # XOutput rebuilt from the file
+    xout_load = store.get_xoutput()
+    assert xout_load.nb_simu == len(N0_list)
+    assert [pe.symbol for pe in xout_load.paramexplorer_list] == ["N0"]
+    for key in ["N", "Id", "Iq"]:
+        np.testing.assert_array_equal(xout_load[key].result, xout[key].result)
+    for ii, N0 in enumerate(N0_list):
+        if N0 == 3000:
+            assert xout_load.output_list[ii] is None
+        else:
+            assert xout_load.output_list[ii].elec.OP.N0 == N0
+
+    # Restart: only the missing steps are run
+    interrupt(file_path)
+    assert store.get_step_index() == [0, 1, 2, 3]
+    N0_run.clear()
+    xout_restart = get_simu_store(file_path, is_restart=True).run()
+    assert N0_run == N0_list[4:]
+    np.testing.assert_array_equal(xout_restart["N"].result, N_ref)
+    assert xout_restart.output_list[0].elec.OP.N0 == N0_list[0]
+    assert store.get_step_index() == list(range(len(N0_list)))
+
+    # The file must match the multi-simulation
+    simu = get_simu_store(file_path, is_restart=True)
+    simu.var_simu.paramexplorer_list[0].value = N0_list[:3]
+    with pytest.raises(XOutputStoreError):
+        simu.run()
+    # Same number of simulations with other values
+    simu = get_simu_store(file_path, is_restart=True)
+    simu.var_simu.paramexplorer_list[0].value = [N0 + 17 for N0 in N0_list]
+    N0_run.clear()
+    with pytest.raises(XOutputStoreError):
+        simu.run()
+    assert N0_run == []
+
+
+@pytest.mark.VarParam
+@pytest.mark.parallel
+def test_VarSimu_store_parallel():
+    """Check that the results of the worker processes are saved and skipped on
+    restart"""
+    file_path = join(save_path, "test_VarSimu_store_parallel.h5")
+    N_ref = [N if N != 3000 else np.nan for N in N0_list]
+
+    xout = get_simu_store(file_path, nb_worker=2).run()
+    store = xout.simu.var_simu.store
+    np.testing.assert_array_equal(store.get_xoutput()["N"].result, N_ref)
+
+    interrupt(file_path)
+    xout_restart = get_simu_store(file_path, nb_worker=2, is_restart=True).run()
+    np.testing.assert_array_equal(xout_restart["N"].result, N_ref)
+    xout_load = store.get_xoutput()
+    np.testing.assert_array_equal(xout_load["N"].result, N_ref)
+    assert xout_load.output_list[5].elec.OP.N0 == N0_list[5]
+
+
+if __name__ == "__main__":
+    test_VarSimu_store()
+    test_VarSimu_store_parallel()
@@ -0,0 +1,163 @@
+from os.path import join
+
+import pytest
+import numpy as np
+from numpy import array, pi, zeros
+from scipy.io import loadmat
+
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Classes.InputCurrent import InputCurrent
+from pyleecan.Classes.ImportMatrixVal import ImportMatrixVal
+from pyleecan.Classes.ImportGenVectLin import ImportGenVectLin
+from pyleecan.Classes.OPdq import OPdq
+from pyleecan.Classes.OPslip import OPslip
+from pyleecan.Classes.LamSquirrelCage import LamSquirrelCage
+from pyleecan.Classes.MagPMMF import MagPMMF
+from pyleecan.Classes.VarLoadCurrent import VarLoadCurrent
+from pyleecan.Functions.load import load
+from pyleecan.Functions.Electrical.dqh_transformation import n2dqh_DataTime
+from pyleecan.definitions import DATA_DIR
+from Tests import TEST_DATA_DIR
+
+
+@pytest.mark.MagPMMF
+@pytest.mark.SPMSM
+@pytest.mark.SingleOP
+def test_MagPMMF_SDM():
+    """Validation of the analytical model on the polar SPMSM with surface
+    magnet of test_FEMM_compare.test_SPMSM_load against MANATEE semi-analytical
+    subdomain model
+    """
+    SPMSM_003 = load(join(DATA_DIR, "Machine", "SPMSM_003.json"))
+    simu = Simu1(name="test_MagPMMF_SDM", machine=SPMSM_003)
+
+    # Same currents as test_SPMSM_load (phases B and C are swapped since the
+    # subdomain model winding phases are in the opposite order)
+    Is = array(
+        [
+            [6.97244193e-06, 2.25353053e02, -2.25353060e02],
+            [-2.60215295e02, 1.30107654e02, 1.30107642e02],
+            [-6.97244208e-06, -2.25353053e02, 2.25353060e02],
+            [2.60215295e02, -1.30107654e02, -1.30107642e02],
+        ]
+    )
+    simu.input = InputCurrent(
+        Is=ImportMatrixVal(value=Is[:, [0, 2, 1]]),
+        Ir=None,
+        OP=OPdq(N0=3000),
+        time=ImportGenVectLin(start=0, stop=0.015, num=4, endpoint=True),
+        Na_tot=1024,
+        angle_rotor_initial=0.5216 + pi,
+    )
+    simu.mag = MagPMMF(is_periodicity_a=False)
+    simu.force = None
+    simu.struct = None
+    out = simu.run()
+
+    mat = loadmat(join(TEST_DATA_DIR, "EM_SPMSM_FL_001_MANATEE_SDM.mat"))
+    Br = out.mag.B.components["radial"].get_along("time", "angle")["B_{rad}"]
+    Bt = out.mag.B.components["tangential"].get_along("time", "angle")["B_{circ}"]
+    assert Br.shape == mat["XBr"].shape
+
+    # Fundamental of the flux density (p=1)
+    for B, B_ref, rtol in [(Br, mat["XBr"], 0.03), (Bt, mat["XBt"], 0.1)]:
+        B1 = np.fft.rfft(B, axis=1)[:, 1]
+        B1_ref = np.fft.rfft(B_ref, axis=1)[:, 1]
+        np.testing.assert_allclose(abs(B1), abs(B1_ref), rtol=rtol)
+        assert np.all(abs(np.angle(B1 / B1_ref)) < 0.1)
+    # Waveform (slotting effect)
+    assert np.sqrt(np.mean((Br - mat["XBr"]) ** 2) / np.mean(mat["XBr"] ** 2)) < 0.15
+
+    # Same results with the spatial periodicity
+    assert SPMSM_003.comp_periodicity_spatial() == (1, True)
+    simu_sym = simu.copy()
+    simu_sym.mag.is_periodicity_a = True
+    out_sym = simu_sym.run()
+    Br_sym = out_sym.mag.B.components["radial"].get_along("time", "angle")["B_{rad}"]
+    np.testing.assert_allclose(Br_sym, Br, atol=1e-10)
+    np.testing.assert_allclose(out_sym.mag.Tem.values, out.mag.Tem.values)
+
+
+@pytest.mark.MagPMMF
+@pytest.mark.SPMSM
+@pytest.mark.VarLoadCurrent
+def test_MagPMMF_varload():
+    """Check the torque and the winding flux over several operating points:
+    without slotting, the torque of the airgap field is the torque of the dq
+    winding flux
+    """
+    SPMSM_003 = load(join(DATA_DIR, "Machine", "SPMSM_003.json"))
+    simu = Simu1(name="test_MagPMMF_varload", machine=SPMSM_003)
+    simu.input = InputCurrent(OP=OPdq(N0=3000), Nt_tot=60, Na_tot=1024)
+    simu.mag = MagPMMF(is_remove_slotS=True)
+
+    OP_matrix = zeros((3, 3))
+    OP_matrix[:, 0] = 3000
+    OP_matrix[:, 1] = [0, -100, 0]  # Id
+    OP_matrix[:, 2] = [0, 150, -150]  # Iq
+    simu.var_simu = VarLoadCurrent(
+        OP_matrix=OP_matrix, type_OP_matrix=1, is_keep_all_output=True
+    )
+    simu.input.set_OP_from_array(OP_matrix, type_OP_matrix=1)
+    xout = simu.run()
+
+    Tem_av = xout.xoutput_dict["Tem_av"].result
+    assert abs(Tem_av[0]) < 1e-6 * abs(Tem_av[1])
+    assert Tem_av[1] > 0 and Tem_av[2] < 0
+    qs = SPMSM_003.stator.winding.qs
+    p = SPMSM_003.get_pole_pair_number()
+    for out, (_, Id, Iq) in zip(xout.output_list, OP_matrix):
+        Phi_dqh = n2dqh_DataTime(out.mag.Phi_wind_stator, phase_dir=out.elec.phase_dir)
+        Phid, Phiq = Phi_dqh.get_along("time", "phase")[Phi_dqh.symbol].mean(axis=0)[:2]
+        Tem_dq = qs * p * (Phid * Iq - Phiq * Id)
+        assert out.mag.Tem_av == pytest.approx(Tem_dq, rel=1e-3, abs=1e-6)
+        assert Phid > 0
+
+
+@pytest.mark.MagPMMF
+@pytest.mark.SCIM
+@pytest.mark.SingleOP
+def test_MagPMMF_wound_rotor(monkeypatch):
+    """Check the rotor winding flux of a SCIM: the rotor winding function is
+    computed once for all the time steps and rotating the rotor by one slot
+    pitch shifts the rotor bars
+    """
+    SCIM_006 = load(join(DATA_DIR, "Machine", "SCIM_006.json"))
+    Zr = SCIM_006.rotor.slot.Zs
+
+    nb_call = [0]
+    comp_wind_function = LamSquirrelCage.comp_wind_function
+
+    def count_wind_function(self, *args, **kwargs):
+        nb_call[0] += 1
+        return comp_wind_function(self, *args, **kwargs)
+
+    monkeypatch.setattr(LamSquirrelCage, "comp_wind_function", count_wind_function)
+
+    Phi_list = list()
+    for angle_rotor_initial in [0, 2 * pi / Zr]:
+        simu = Simu1(name="test_MagPMMF_wound_rotor", machine=SCIM_006)
+        simu.input = InputCurrent(
+            OP=OPslip(I0_ref=40, IPhi0_ref=0, N0=1000, slip_ref=0.05),
+            Nt_tot=8,
+            Na_tot=1024,
+            angle_rotor_initial=angle_rotor_initial,
+        )
+        simu.mag = MagPMMF(is_periodicity_a=False, is_periodicity_t=False)
+        simu.force = None
+        simu.struct = None
+        out = simu.run()
+        Phi_list.append(out.mag.Phi_wind["Rotor-0"].values)
+        assert nb_call[0] == len(Phi_list)
+
+    assert Phi_list[0].shape == (8, Zr)
+    np.testing.assert_allclose(
+        np.roll(Phi_list[0], -1, axis=1),
+        Phi_list[1],
+        atol=1e-4 * abs(Phi_list[0]).max(),
+    )
+
+
+if __name__ == "__main__":
+    test_MagPMMF_SDM()
+    test_MagPMMF_varload()
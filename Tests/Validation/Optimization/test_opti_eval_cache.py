@@ -0,0 +1,149 @@
+from os import remove
+from os.path import join, isfile
+import random
+
+import pytest
+import numpy as np
+from h5py import File
+
+from pyleecan.Classes.OptiEvalCache import OptiEvalCache
+from pyleecan.Classes.OptiGenAlgNsga2Deap import OptiGenAlgNsga2Deap
+from pyleecan.Classes.XOutputStore import XOutputStore
+from Tests import save_validation_path as save_path
+from Tests.Validation.Optimization.test_opti_parallel import evaluate, get_problem
+
+
+def test_eval_cache_key_lru():
+    """Check the rounding of the design variables and the LRU removal"""
+    cache = OptiEvalCache(tol=1e-3, size_max=2)
+    assert cache.get_key([1.0001, np.float64(2.0), "a"]) == (1000, 2000, "a")
+    assert cache.get_key([1.0001]) == cache.get_key([0.9999])
+    assert cache.get_key([1.0001]) != cache.get_key([1.001])
+    assert OptiEvalCache().get_key([1.0001]) == (1.0001,)
+
+    for ii in range(3):
+        cache.add((ii,), {"fitness": [ii]})
+    assert cache.get((0,)) is None
+    assert cache.get((1,)) == {"fitness": [1]}
+    # (2,) is now the least recently used
+    cache.add((3,), {"fitness": [3]})
+    assert cache.get((2,)) is None
+    assert cache.get((1,)) is not None
+    assert cache.get_stat_msg().startswith("Evaluation cache: 2 hits, 2 misses")
+
+
+def solve(problem, store=None, is_keep_all_output=False):
+    """Solve the problem with a fixed seed"""
+    random.seed(0)
+    solver = OptiGenAlgNsga2Deap(
+        problem=problem,
+        size_pop=8,
+        nb_gen=4,
+        p_mutate=0.5,
+        store=store,
+        is_keep_all_output=is_keep_all_output,
+    )
+    return solver.solve()
+
+
+@pytest.mark.SCIM
+@pytest.mark.SingleOP
+def test_opti_eval_cache():
+    """Check that the cache gives the same results and that the evaluations
+    are reused when the optimization is restarted"""
+    cache_path = join(save_path, "test_opti_eval_cache.pkl")
+    res_ref = solve(get_problem())
+
+    # Count the evaluations
+    eval_list = list()
+
+    def eval_func(output):
+        machine = output.simu.machine
+        eval_list.append((machine.rotor.slot.H0, machine.stator.slot.H0))
+        evaluate(output)
+
+    problem = get_problem()
+    problem.eval_func = eval_func
+    problem.eval_cache = OptiEvalCache(tol=1e-9, save_path=cache_path)
+    if isfile(cache_path):
+        remove(cache_path)
+    res = solve(problem)
+    assert isfile(cache_path)
+    for symbol in ["obj1", "obj2", "SH0_dk", "is_valid", "ngen"]:
+        np.testing.assert_array_equal(res[symbol].result, res_ref[symbol].result)
+    # Each valid design is evaluated once (failed evaluations are not stored)
+    valid_list = [H0 for H0 in eval_list if H0[0] <= 4.5]
+    assert len(valid_list) == len(set(valid_list))
+
+    # Restart: only the failed evaluations are run again
+    eval_list.clear()
+    problem = get_problem()
+    problem.eval_func = eval_func
+    problem.eval_cache = OptiEvalCache(tol=1e-9, save_path=cache_path)
+    res = solve(problem, is_keep_all_output=True)
+    for symbol in ["obj1", "obj2", "SH0_dk", "is_valid", "ngen"]:
+        np.testing.assert_array_equal(res[symbol].result, res_ref[symbol].result)
+    assert len(eval_list) > 0
+    assert all([H0[0] > 4.5 for H0 in eval_list])
+    # No Output for the results taken from the cache (simulation not run)
+    assert len(res.output_list) == res.nb_simu
+    output_list = [out for out in res.output_list if out is not None]
+    assert len(output_list) == len(eval_list)
+    for out in output_list:
+        assert out.simu.machine.rotor.slot.H0 > 4.5
+        assert out.mag.Tem_av is not None
+
+
+@pytest.mark.SCIM
+@pytest.mark.SingleOP
+def test_opti_store():
+    """Check that the evaluations are saved in the store and that the valid
+    ones are reused when the optimization is restarted"""
+    store_path = join(save_path, "test_opti_store.h5")
+    res_ref = solve(get_problem())
+    symbol_list = ["obj1", "obj2", "SH0_dk", "is_valid", "ngen"]
+
+    # Count the evaluations
+    eval_list = list()
+
+    def eval_func(output):
+        machine = output.simu.machine
+        eval_list.append((machine.rotor.slot.H0, machine.stator.slot.H0))
+        evaluate(output)
+
+    problem = get_problem()
+    problem.eval_func = eval_func
+    store = XOutputStore(save_path=store_path)
+    res = solve(problem, store=store)
+    res_load = store.get_xoutput()
+    assert res_load.nb_simu == res.nb_simu
+    for symbol in symbol_list:
+        np.testing.assert_array_equal(res_load[symbol].result, res_ref[symbol].result)
+    for pe_load, pe in zip(res_load.paramexplorer_list, res.paramexplorer_list):
+        assert pe_load.symbol == pe.symbol
+        np.testing.assert_array_equal(pe_load.value, pe.value)
+
+    # Restart after the first 10 evaluations
+    with File(store_path, "a") as file:
+        for index in range(10, res.nb_simu):
+            del file["step/" + str(index)]
+    H0_saved = list(zip(*[pe.value[:10] for pe in res_load.paramexplorer_list]))
+    eval_list.clear()
+    problem = get_problem()
+    problem.eval_func = eval_func
+    store.is_restart = True
+    res = solve(problem, store=store)
+    for symbol in symbol_list:
+        np.testing.assert_array_equal(res[symbol].result, res_ref[symbol].result)
+        np.testing.assert_array_equal(
+            store.get_xoutput()[symbol].result, res_ref[symbol].result
+        )
+    assert problem.eval_cache is None
+    assert not any(H0 in eval_list for H0 in H0_saved if H0[0] <= 4.5)
+    assert any(H0 in eval_list for H0 in H0_saved if H0[0] > 4.5)
+
+
+if __name__ == "__main__":
+    test_eval_cache_key_lru()
+    test_opti_eval_cache()
+    test_opti_store()
@@ -0,0 +1,151 @@
+from os.path import join
+from concurrent.futures import ThreadPoolExecutor
+import random
+
+import pytest
+import numpy as np
+
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Classes.DataKeeper import DataKeeper
+from pyleecan.Classes.OptiDesignVar import OptiDesignVar
+from pyleecan.Classes.OptiObjective import OptiObjective
+from pyleecan.Classes.OptiConstraint import OptiConstraint
+from pyleecan.Classes.OptiProblem import OptiProblem
+from pyleecan.Classes.OptiGenAlgNsga2Deap import OptiGenAlgNsga2Deap
+
+from pyleecan.Functions.load import load
+from pyleecan.Functions.Optimization.evaluate_pop import _evaluate_worker
+from pyleecan.definitions import DATA_DIR
+
+
+def evaluate(output):
+    """Binh and Korn function"""
+    x = output.simu.machine.rotor.slot.H0
+    y = output.simu.machine.stator.slot.H0
+    output.mag.Tem_av = 4 * x ** 2 + 4 * y ** 2
+    output.mag.Tem_rip_norm = (x - 5) ** 2 + (y - 5) ** 2
+    if x > 4.5:
+        raise ValueError("Failed simulation")
+
+
+def get_problem():
+    """Binh and Korn problem with an analytical evaluation"""
+    machine = load(join(DATA_DIR, "Machine", "Railway_Traction.json"))
+    simu = Simu1(name="test_opti_parallel", machine=machine)
+
+    my_vars = [
+        OptiDesignVar(
+            name="Rotor slot height",
+            symbol="RH0",
+            type_var="interval",
+            space=[0, 5],
+            get_value=lambda space: random.uniform(*space),
+            setter="simu.machine.rotor.slot.H0",
+        ),
+        OptiDesignVar(
+            name="Stator slot height",
+            symbol="SH0",
+            type_var="interval",
+            space=[0, 3],
+            get_value=lambda space: random.uniform(*space),
+            setter="simu.machine.stator.slot.H0",
+        ),
+    ]
+    cstrs = [
+        OptiConstraint(
+            name="first",
+            get_variable="lambda output: (output.simu.machine.rotor.slot.H0 - 5) ** 2 + output.simu.machine.stator.slot.H0 ** 2",
+            type_const="<=",
+            value=25,
+        )
+    ]
+    objs = [
+        OptiObjective(
+            name="Maximization of the torque average",
+            symbol="obj1",
+            unit="N.m",
+            keeper="lambda output: output.mag.Tem_av",
+        ),
+        OptiObjective(
+            name="Minimization of the torque ripple",
+            symbol="obj2",
+            unit="N.m",
+            keeper="lambda output: output.mag.Tem_rip_norm",
+        ),
+    ]
+    datakeeper_list = [
+        DataKeeper(
+            name="Stator slot height",
+            symbol="SH0_dk",
+            unit="m",
+            keeper="lambda output: output.simu.machine.stator.slot.H0",
+            error_keeper="lambda simu: -1",
+        )
+    ]
+    return OptiProblem(
+        simu=simu,
+        design_var=my_vars,
+        obj_func=objs,
+        constraint=cstrs,
+        datakeeper_list=datakeeper_list,
+        eval_func=evaluate,
+    )
+
+
+def solve(**kwargs):
+    """Solve the problem with a fixed seed"""
+    random.seed(0)
+    solver = OptiGenAlgNsga2Deap(
+        problem=get_problem(), size_pop=8, nb_gen=3, p_mutate=0.5, **kwargs
+    )
+    return solver.solve()
+
+
+@pytest.mark.SCIM
+@pytest.mark.SingleOP
+def test_opti_parallel():
+    """Check that the parallel evaluation gives the same results as the serial one"""
+    res_ref = solve()
+    res_pool = solve(nb_worker=2)
+    with ThreadPoolExecutor(2) as executor:
+        res_exec = solve(executor=executor.map)
+
+    # Some individuals failed
+    assert not all(res_ref["is_valid"].result)
+    for res in [res_pool, res_exec]:
+        assert res.nb_simu == res_ref.nb_simu
+        for symbol in ["obj1", "obj2", "SH0_dk", "is_valid", "ngen"]:
+            np.testing.assert_array_equal(res[symbol].result, res_ref[symbol].result)
+        for pe, pe_ref in zip(res.paramexplorer_list, res_ref.paramexplorer_list):
+            np.testing.assert_array_equal(pe.value, pe_ref.value)
+    # Outputs are only sent back if is_keep_all_output
+    assert len(res_pool.output_list) == 0
+
+
+@pytest.mark.SCIM
+@pytest.mark.SingleOP
+def test_opti_parallel_keep_output():
+    """Check the outputs sent back by the workers"""
+    res = solve(nb_worker=2, is_keep_all_output=True)
+    assert len(res.output_list) == res.nb_simu
+    for output, obj1 in zip(res.output_list, res["obj1"].result):
+        if np.isfinite(obj1):
+            assert output.mag.Tem_av == obj1
+
+
+def test_evaluate_worker_error():
+    """Check that a worker error sends back the design variables and the
+    traceback"""
+    # The solver of the worker is not loaded
+    result = _evaluate_worker((3, [1.5, 2], ["SH0", "RH0"], None))
+    assert result[0] == 3
+    assert result[1:6] == (None,) * 5
+    error = result[6]
+    assert "SH0 : 1.5\nRH0 : 2\n" in error
+    assert "Traceback" in error and "KeyError" in error
+
+
+if __name__ == "__main__":
+    test_opti_parallel()
+    test_opti_parallel_keep_output()
+    test_evaluate_worker_error()
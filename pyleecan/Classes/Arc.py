@@ -7,52 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Line import Line
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Geometry.Arc.draw_FEMM import draw_FEMM
-except ImportError as error:
-    draw_FEMM = error
-
-try:
-    from ..Methods.Geometry.Arc.intersect_line import intersect_line
-except ImportError as error:
-    intersect_line = error
-
-try:
-    from ..Methods.Geometry.Arc.is_on_line import is_on_line
-except ImportError as error:
-    is_on_line = error
-
-try:
-    from ..Methods.Geometry.Arc.split_line import split_line
-except ImportError as error:
-    split_line = error
-
-try:
-    from ..Methods.Geometry.Arc.comp_distance import comp_distance
-except ImportError as error:
-    comp_distance = error
-
-try:
-    from ..Methods.Geometry.Arc.plot import plot
-except ImportError as error:
-    plot = error
-
-try:
-    from ..Methods.Geometry.Arc.comp_maxseg import comp_maxseg
-except ImportError as error:
-    comp_maxseg = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -62,72 +25,14 @@ class Arc(Line):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Geometry.Arc.draw_FEMM
-    if isinstance(draw_FEMM, ImportError):
-        draw_FEMM = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc method draw_FEMM: " + str(draw_FEMM))
-            )
-        )
-    else:
-        draw_FEMM = draw_FEMM
-    # cf Methods.Geometry.Arc.intersect_line
-    if isinstance(intersect_line, ImportError):
-        intersect_line = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Arc method intersect_line: " + str(intersect_line)
-                )
-            )
-        )
-    else:
-        intersect_line = intersect_line
-    # cf Methods.Geometry.Arc.is_on_line
-    if isinstance(is_on_line, ImportError):
-        is_on_line = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc method is_on_line: " + str(is_on_line))
-            )
-        )
-    else:
-        is_on_line = is_on_line
-    # cf Methods.Geometry.Arc.split_line
-    if isinstance(split_line, ImportError):
-        split_line = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc method split_line: " + str(split_line))
-            )
-        )
-    else:
-        split_line = split_line
-    # cf Methods.Geometry.Arc.comp_distance
-    if isinstance(comp_distance, ImportError):
-        comp_distance = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc method comp_distance: " + str(comp_distance))
-            )
-        )
-    else:
-        comp_distance = comp_distance
-    # cf Methods.Geometry.Arc.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
-    # cf Methods.Geometry.Arc.comp_maxseg
-    if isinstance(comp_maxseg, ImportError):
-        comp_maxseg = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc method comp_maxseg: " + str(comp_maxseg))
-            )
-        )
-    else:
-        comp_maxseg = comp_maxseg
+    # Methods imported on first use to remove unnecessary dependencies
+    draw_FEMM = LazyMethod(__package__, "..Methods.Geometry.Arc.draw_FEMM")
+    intersect_line = LazyMethod(__package__, "..Methods.Geometry.Arc.intersect_line")
+    is_on_line = LazyMethod(__package__, "..Methods.Geometry.Arc.is_on_line")
+    split_line = LazyMethod(__package__, "..Methods.Geometry.Arc.split_line")
+    comp_distance = LazyMethod(__package__, "..Methods.Geometry.Arc.comp_distance")
+    plot = LazyMethod(__package__, "..Methods.Geometry.Arc.plot")
+    comp_maxseg = LazyMethod(__package__, "..Methods.Geometry.Arc.comp_maxseg")
     # save and copy methods are available in all object
     save = save
     copy = copy
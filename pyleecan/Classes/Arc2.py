@@ -7,87 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Arc import Arc
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Geometry.Arc2.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Geometry.Arc2.comp_length import comp_length
-except ImportError as error:
-    comp_length = error
-
-try:
-    from ..Methods.Geometry.Arc2.comp_radius import comp_radius
-except ImportError as error:
-    comp_radius = error
-
-try:
-    from ..Methods.Geometry.Arc2.discretize import discretize
-except ImportError as error:
-    discretize = error
-
-try:
-    from ..Methods.Geometry.Arc2.get_angle import get_angle
-except ImportError as error:
-    get_angle = error
-
-try:
-    from ..Methods.Geometry.Arc2.get_begin import get_begin
-except ImportError as error:
-    get_begin = error
-
-try:
-    from ..Methods.Geometry.Arc2.get_center import get_center
-except ImportError as error:
-    get_center = error
-
-try:
-    from ..Methods.Geometry.Arc2.get_end import get_end
-except ImportError as error:
-    get_end = error
-
-try:
-    from ..Methods.Geometry.Arc2.get_middle import get_middle
-except ImportError as error:
-    get_middle = error
-
-try:
-    from ..Methods.Geometry.Arc2.reverse import reverse
-except ImportError as error:
-    reverse = error
-
-try:
-    from ..Methods.Geometry.Arc2.rotate import rotate
-except ImportError as error:
-    rotate = error
-
-try:
-    from ..Methods.Geometry.Arc2.scale import scale
-except ImportError as error:
-    scale = error
-
-try:
-    from ..Methods.Geometry.Arc2.split_half import split_half
-except ImportError as error:
-    split_half = error
-
-try:
-    from ..Methods.Geometry.Arc2.translate import translate
-except ImportError as error:
-    translate = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -97,133 +25,21 @@ class Arc2(Arc):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Geometry.Arc2.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc2 method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Geometry.Arc2.comp_length
-    if isinstance(comp_length, ImportError):
-        comp_length = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc2 method comp_length: " + str(comp_length))
-            )
-        )
-    else:
-        comp_length = comp_length
-    # cf Methods.Geometry.Arc2.comp_radius
-    if isinstance(comp_radius, ImportError):
-        comp_radius = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc2 method comp_radius: " + str(comp_radius))
-            )
-        )
-    else:
-        comp_radius = comp_radius
-    # cf Methods.Geometry.Arc2.discretize
-    if isinstance(discretize, ImportError):
-        discretize = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc2 method discretize: " + str(discretize))
-            )
-        )
-    else:
-        discretize = discretize
-    # cf Methods.Geometry.Arc2.get_angle
-    if isinstance(get_angle, ImportError):
-        get_angle = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc2 method get_angle: " + str(get_angle))
-            )
-        )
-    else:
-        get_angle = get_angle
-    # cf Methods.Geometry.Arc2.get_begin
-    if isinstance(get_begin, ImportError):
-        get_begin = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc2 method get_begin: " + str(get_begin))
-            )
-        )
-    else:
-        get_begin = get_begin
-    # cf Methods.Geometry.Arc2.get_center
-    if isinstance(get_center, ImportError):
-        get_center = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc2 method get_center: " + str(get_center))
-            )
-        )
-    else:
-        get_center = get_center
-    # cf Methods.Geometry.Arc2.get_end
-    if isinstance(get_end, ImportError):
-        get_end = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc2 method get_end: " + str(get_end))
-            )
-        )
-    else:
-        get_end = get_end
-    # cf Methods.Geometry.Arc2.get_middle
-    if isinstance(get_middle, ImportError):
-        get_middle = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc2 method get_middle: " + str(get_middle))
-            )
-        )
-    else:
-        get_middle = get_middle
-    # cf Methods.Geometry.Arc2.reverse
-    if isinstance(reverse, ImportError):
-        reverse = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc2 method reverse: " + str(reverse))
-            )
-        )
-    else:
-        reverse = reverse
-    # cf Methods.Geometry.Arc2.rotate
-    if isinstance(rotate, ImportError):
-        rotate = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc2 method rotate: " + str(rotate))
-            )
-        )
-    else:
-        rotate = rotate
-    # cf Methods.Geometry.Arc2.scale
-    if isinstance(scale, ImportError):
-        scale = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc2 method scale: " + str(scale))
-            )
-        )
-    else:
-        scale = scale
-    # cf Methods.Geometry.Arc2.split_half
-    if isinstance(split_half, ImportError):
-        split_half = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc2 method split_half: " + str(split_half))
-            )
-        )
-    else:
-        split_half = split_half
-    # cf Methods.Geometry.Arc2.translate
-    if isinstance(translate, ImportError):
-        translate = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Arc2 method translate: " + str(translate))
-            )
-        )
-    else:
-        translate = translate
+    # Methods imported on first use to remove unnecessary dependencies
+    check = LazyMethod(__package__, "..Methods.Geometry.Arc2.check")
+    comp_length = LazyMethod(__package__, "..Methods.Geometry.Arc2.comp_length")
+    comp_radius = LazyMethod(__package__, "..Methods.Geometry.Arc2.comp_radius")
+    discretize = LazyMethod(__package__, "..Methods.Geometry.Arc2.discretize")
+    get_angle = LazyMethod(__package__, "..Methods.Geometry.Arc2.get_angle")
+    get_begin = LazyMethod(__package__, "..Methods.Geometry.Arc2.get_begin")
+    get_center = LazyMethod(__package__, "..Methods.Geometry.Arc2.get_center")
+    get_end = LazyMethod(__package__, "..Methods.Geometry.Arc2.get_end")
+    get_middle = LazyMethod(__package__, "..Methods.Geometry.Arc2.get_middle")
+    reverse = LazyMethod(__package__, "..Methods.Geometry.Arc2.reverse")
+    rotate = LazyMethod(__package__, "..Methods.Geometry.Arc2.rotate")
+    scale = LazyMethod(__package__, "..Methods.Geometry.Arc2.scale")
+    split_half = LazyMethod(__package__, "..Methods.Geometry.Arc2.split_half")
+    translate = LazyMethod(__package__, "..Methods.Geometry.Arc2.translate")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,22 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Bore import Bore
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.BoreLSRPM.get_bore_line import get_bore_line
-except ImportError as error:
-    get_bore_line = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -32,17 +25,8 @@ class BoreLSRPM(Bore):
 
     VERSION = 1
 
-    # cf Methods.Machine.BoreLSRPM.get_bore_line
-    if isinstance(get_bore_line, ImportError):
-        get_bore_line = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use BoreLSRPM method get_bore_line: " + str(get_bore_line)
-                )
-            )
-        )
-    else:
-        get_bore_line = get_bore_line
+    # Methods imported on first use to remove unnecessary dependencies
+    get_bore_line = LazyMethod(__package__, "..Methods.Machine.BoreLSRPM.get_bore_line")
     # save and copy methods are available in all object
     save = save
     copy = copy
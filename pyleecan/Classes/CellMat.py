@@ -7,37 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import set_array, check_var, raise_
+from ._check import set_array, check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyArray, LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Mesh.CellMat.add_cell import add_cell
-except ImportError as error:
-    add_cell = error
-
-try:
-    from ..Methods.Mesh.CellMat.get_connectivity import get_connectivity
-except ImportError as error:
-    get_connectivity = error
-
-try:
-    from ..Methods.Mesh.CellMat.get_node2cell import get_node2cell
-except ImportError as error:
-    get_node2cell = error
-
-try:
-    from ..Methods.Mesh.CellMat.is_exist import is_exist
-except ImportError as error:
-    is_exist = error
-
-
 from numpy import array, array_equal
 from numpy import isnan
 from ._check import InitUnKnowClassError
@@ -48,48 +26,15 @@ class CellMat(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Mesh.CellMat.add_cell
-    if isinstance(add_cell, ImportError):
-        add_cell = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use CellMat method add_cell: " + str(add_cell))
-            )
-        )
-    else:
-        add_cell = add_cell
-    # cf Methods.Mesh.CellMat.get_connectivity
-    if isinstance(get_connectivity, ImportError):
-        get_connectivity = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CellMat method get_connectivity: "
-                    + str(get_connectivity)
-                )
-            )
-        )
-    else:
-        get_connectivity = get_connectivity
-    # cf Methods.Mesh.CellMat.get_node2cell
-    if isinstance(get_node2cell, ImportError):
-        get_node2cell = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CellMat method get_node2cell: " + str(get_node2cell)
-                )
-            )
-        )
-    else:
-        get_node2cell = get_node2cell
-    # cf Methods.Mesh.CellMat.is_exist
-    if isinstance(is_exist, ImportError):
-        is_exist = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use CellMat method is_exist: " + str(is_exist))
-            )
-        )
-    else:
-        is_exist = is_exist
+    # Methods imported on first use to remove unnecessary dependencies
+    add_cell = LazyMethod(__package__, "..Methods.Mesh.CellMat.add_cell")
+    get_connectivity = LazyMethod(
+        __package__, "..Methods.Mesh.CellMat.get_connectivity"
+    )
+    get_node2cell = LazyMethod(__package__, "..Methods.Mesh.CellMat.get_node2cell")
+    is_exist = LazyMethod(__package__, "..Methods.Mesh.CellMat.is_exist")
+    add_cells = LazyMethod(__package__, "..Methods.Mesh.CellMat.add_cells")
+    _get_hash = LazyMethod(__package__, "..Methods.Mesh.CellMat._get_hash")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -322,6 +267,8 @@ class CellMat(FrozenClass):
 
     def _get_connectivity(self):
         """getter of connectivity"""
+        if isinstance(self._connectivity, LazyArray):
+            self._connectivity = self._connectivity.read()
         return self._connectivity
 
     def _set_connectivity(self, value):
@@ -383,6 +330,8 @@ class CellMat(FrozenClass):
 
     def _get_indice(self):
         """getter of indice"""
+        if isinstance(self._indice, LazyArray):
+            self._indice = self._indice.read()
         return self._indice
 
     def _set_indice(self, value):
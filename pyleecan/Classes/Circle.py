@@ -7,62 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Surface import Surface
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Geometry.Circle.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Geometry.Circle.comp_length import comp_length
-except ImportError as error:
-    comp_length = error
-
-try:
-    from ..Methods.Geometry.Circle.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from ..Methods.Geometry.Circle.discretize import discretize
-except ImportError as error:
-    discretize = error
-
-try:
-    from ..Methods.Geometry.Circle.get_lines import get_lines
-except ImportError as error:
-    get_lines = error
-
-try:
-    from ..Methods.Geometry.Circle.get_patches import get_patches
-except ImportError as error:
-    get_patches = error
-
-try:
-    from ..Methods.Geometry.Circle.rotate import rotate
-except ImportError as error:
-    rotate = error
-
-try:
-    from ..Methods.Geometry.Circle.translate import translate
-except ImportError as error:
-    translate = error
-
-try:
-    from ..Methods.Geometry.Circle.comp_point_ref import comp_point_ref
-except ImportError as error:
-    comp_point_ref = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -72,92 +25,16 @@ class Circle(Surface):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Geometry.Circle.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Circle method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Geometry.Circle.comp_length
-    if isinstance(comp_length, ImportError):
-        comp_length = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Circle method comp_length: " + str(comp_length))
-            )
-        )
-    else:
-        comp_length = comp_length
-    # cf Methods.Geometry.Circle.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Circle method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
-    # cf Methods.Geometry.Circle.discretize
-    if isinstance(discretize, ImportError):
-        discretize = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Circle method discretize: " + str(discretize))
-            )
-        )
-    else:
-        discretize = discretize
-    # cf Methods.Geometry.Circle.get_lines
-    if isinstance(get_lines, ImportError):
-        get_lines = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Circle method get_lines: " + str(get_lines))
-            )
-        )
-    else:
-        get_lines = get_lines
-    # cf Methods.Geometry.Circle.get_patches
-    if isinstance(get_patches, ImportError):
-        get_patches = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Circle method get_patches: " + str(get_patches))
-            )
-        )
-    else:
-        get_patches = get_patches
-    # cf Methods.Geometry.Circle.rotate
-    if isinstance(rotate, ImportError):
-        rotate = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Circle method rotate: " + str(rotate))
-            )
-        )
-    else:
-        rotate = rotate
-    # cf Methods.Geometry.Circle.translate
-    if isinstance(translate, ImportError):
-        translate = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Circle method translate: " + str(translate))
-            )
-        )
-    else:
-        translate = translate
-    # cf Methods.Geometry.Circle.comp_point_ref
-    if isinstance(comp_point_ref, ImportError):
-        comp_point_ref = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Circle method comp_point_ref: " + str(comp_point_ref)
-                )
-            )
-        )
-    else:
-        comp_point_ref = comp_point_ref
+    # Methods imported on first use to remove unnecessary dependencies
+    check = LazyMethod(__package__, "..Methods.Geometry.Circle.check")
+    comp_length = LazyMethod(__package__, "..Methods.Geometry.Circle.comp_length")
+    comp_surface = LazyMethod(__package__, "..Methods.Geometry.Circle.comp_surface")
+    discretize = LazyMethod(__package__, "..Methods.Geometry.Circle.discretize")
+    get_lines = LazyMethod(__package__, "..Methods.Geometry.Circle.get_lines")
+    get_patches = LazyMethod(__package__, "..Methods.Geometry.Circle.get_patches")
+    rotate = LazyMethod(__package__, "..Methods.Geometry.Circle.rotate")
+    translate = LazyMethod(__package__, "..Methods.Geometry.Circle.translate")
+    comp_point_ref = LazyMethod(__package__, "..Methods.Geometry.Circle.comp_point_ref")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,69 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Conductor import Conductor
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.CondType21.comp_surface_active import comp_surface_active
-except ImportError as error:
-    comp_surface_active = error
-
-try:
-    from ..Methods.Machine.CondType21.comp_height import comp_height
-except ImportError as error:
-    comp_height = error
-
-try:
-    from ..Methods.Machine.CondType21.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from ..Methods.Machine.CondType21.comp_width import comp_width
-except ImportError as error:
-    comp_width = error
-
-try:
-    from ..Methods.Machine.CondType21.plot import plot
-except ImportError as error:
-    plot = error
-
-try:
-    from ..Methods.Machine.CondType21.comp_width_wire import comp_width_wire
-except ImportError as error:
-    comp_width_wire = error
-
-try:
-    from ..Methods.Machine.CondType21.comp_height_wire import comp_height_wire
-except ImportError as error:
-    comp_height_wire = error
-
-try:
-    from ..Methods.Machine.CondType21.comp_nb_circumferential_wire import (
-        comp_nb_circumferential_wire,
-    )
-except ImportError as error:
-    comp_nb_circumferential_wire = error
-
-try:
-    from ..Methods.Machine.CondType21.comp_nb_radial_wire import comp_nb_radial_wire
-except ImportError as error:
-    comp_nb_radial_wire = error
-
-try:
-    from ..Methods.Machine.CondType21.is_round_wire import is_round_wire
-except ImportError as error:
-    is_round_wire = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -79,120 +25,29 @@ class CondType21(Conductor):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.CondType21.comp_surface_active
-    if isinstance(comp_surface_active, ImportError):
-        comp_surface_active = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CondType21 method comp_surface_active: "
-                    + str(comp_surface_active)
-                )
-            )
-        )
-    else:
-        comp_surface_active = comp_surface_active
-    # cf Methods.Machine.CondType21.comp_height
-    if isinstance(comp_height, ImportError):
-        comp_height = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CondType21 method comp_height: " + str(comp_height)
-                )
-            )
-        )
-    else:
-        comp_height = comp_height
-    # cf Methods.Machine.CondType21.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CondType21 method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
-    # cf Methods.Machine.CondType21.comp_width
-    if isinstance(comp_width, ImportError):
-        comp_width = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CondType21 method comp_width: " + str(comp_width)
-                )
-            )
-        )
-    else:
-        comp_width = comp_width
-    # cf Methods.Machine.CondType21.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use CondType21 method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
-    # cf Methods.Machine.CondType21.comp_width_wire
-    if isinstance(comp_width_wire, ImportError):
-        comp_width_wire = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CondType21 method comp_width_wire: "
-                    + str(comp_width_wire)
-                )
-            )
-        )
-    else:
-        comp_width_wire = comp_width_wire
-    # cf Methods.Machine.CondType21.comp_height_wire
-    if isinstance(comp_height_wire, ImportError):
-        comp_height_wire = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CondType21 method comp_height_wire: "
-                    + str(comp_height_wire)
-                )
-            )
-        )
-    else:
-        comp_height_wire = comp_height_wire
-    # cf Methods.Machine.CondType21.comp_nb_circumferential_wire
-    if isinstance(comp_nb_circumferential_wire, ImportError):
-        comp_nb_circumferential_wire = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CondType21 method comp_nb_circumferential_wire: "
-                    + str(comp_nb_circumferential_wire)
-                )
-            )
-        )
-    else:
-        comp_nb_circumferential_wire = comp_nb_circumferential_wire
-    # cf Methods.Machine.CondType21.comp_nb_radial_wire
-    if isinstance(comp_nb_radial_wire, ImportError):
-        comp_nb_radial_wire = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CondType21 method comp_nb_radial_wire: "
-                    + str(comp_nb_radial_wire)
-                )
-            )
-        )
-    else:
-        comp_nb_radial_wire = comp_nb_radial_wire
-    # cf Methods.Machine.CondType21.is_round_wire
-    if isinstance(is_round_wire, ImportError):
-        is_round_wire = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use CondType21 method is_round_wire: " + str(is_round_wire)
-                )
-            )
-        )
-    else:
-        is_round_wire = is_round_wire
+    # Methods imported on first use to remove unnecessary dependencies
+    comp_surface_active = LazyMethod(
+        __package__, "..Methods.Machine.CondType21.comp_surface_active"
+    )
+    comp_height = LazyMethod(__package__, "..Methods.Machine.CondType21.comp_height")
+    comp_surface = LazyMethod(__package__, "..Methods.Machine.CondType21.comp_surface")
+    comp_width = LazyMethod(__package__, "..Methods.Machine.CondType21.comp_width")
+    plot = LazyMethod(__package__, "..Methods.Machine.CondType21.plot")
+    comp_width_wire = LazyMethod(
+        __package__, "..Methods.Machine.CondType21.comp_width_wire"
+    )
+    comp_height_wire = LazyMethod(
+        __package__, "..Methods.Machine.CondType21.comp_height_wire"
+    )
+    comp_nb_circumferential_wire = LazyMethod(
+        __package__, "..Methods.Machine.CondType21.comp_nb_circumferential_wire"
+    )
+    comp_nb_radial_wire = LazyMethod(
+        __package__, "..Methods.Machine.CondType21.comp_nb_radial_wire"
+    )
+    is_round_wire = LazyMethod(
+        __package__, "..Methods.Machine.CondType21.is_round_wire"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,43 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.Conductor.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Machine.Conductor.comp_skin_effect_resistance import (
-        comp_skin_effect_resistance,
-    )
-except ImportError as error:
-    comp_skin_effect_resistance = error
-
-try:
-    from ..Methods.Machine.Conductor.comp_skin_effect_inductance import (
-        comp_skin_effect_inductance,
-    )
-except ImportError as error:
-    comp_skin_effect_inductance = error
-
-try:
-    from ..Methods.Machine.Conductor.comp_temperature_effect import (
-        comp_temperature_effect,
-    )
-except ImportError as error:
-    comp_temperature_effect = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -53,52 +25,17 @@ class Conductor(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.Conductor.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Conductor method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Machine.Conductor.comp_skin_effect_resistance
-    if isinstance(comp_skin_effect_resistance, ImportError):
-        comp_skin_effect_resistance = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Conductor method comp_skin_effect_resistance: "
-                    + str(comp_skin_effect_resistance)
-                )
-            )
-        )
-    else:
-        comp_skin_effect_resistance = comp_skin_effect_resistance
-    # cf Methods.Machine.Conductor.comp_skin_effect_inductance
-    if isinstance(comp_skin_effect_inductance, ImportError):
-        comp_skin_effect_inductance = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Conductor method comp_skin_effect_inductance: "
-                    + str(comp_skin_effect_inductance)
-                )
-            )
-        )
-    else:
-        comp_skin_effect_inductance = comp_skin_effect_inductance
-    # cf Methods.Machine.Conductor.comp_temperature_effect
-    if isinstance(comp_temperature_effect, ImportError):
-        comp_temperature_effect = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Conductor method comp_temperature_effect: "
-                    + str(comp_temperature_effect)
-                )
-            )
-        )
-    else:
-        comp_temperature_effect = comp_temperature_effect
+    # Methods imported on first use to remove unnecessary dependencies
+    check = LazyMethod(__package__, "..Methods.Machine.Conductor.check")
+    comp_skin_effect_resistance = LazyMethod(
+        __package__, "..Methods.Machine.Conductor.comp_skin_effect_resistance"
+    )
+    comp_skin_effect_inductance = LazyMethod(
+        __package__, "..Methods.Machine.Conductor.comp_skin_effect_inductance"
+    )
+    comp_temperature_effect = LazyMethod(
+        __package__, "..Methods.Machine.Conductor.comp_temperature_effect"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,22 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.DXFImport.get_surfaces import get_surfaces
-except ImportError as error:
-    get_surfaces = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -32,17 +25,10 @@ class DXFImport(FrozenClass):
 
     VERSION = 1
 
-    # cf Methods.Simulation.DXFImport.get_surfaces
-    if isinstance(get_surfaces, ImportError):
-        get_surfaces = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use DXFImport method get_surfaces: " + str(get_surfaces)
-                )
-            )
-        )
-    else:
-        get_surfaces = get_surfaces
+    # Methods imported on first use to remove unnecessary dependencies
+    get_surfaces = LazyMethod(
+        __package__, "..Methods.Simulation.DXFImport.get_surfaces"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
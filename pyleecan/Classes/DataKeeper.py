@@ -7,32 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.DataKeeper.as_dict import as_dict
-except ImportError as error:
-    as_dict = error
-
-try:
-    from ..Methods.Simulation.DataKeeper._set_result import _set_result
-except ImportError as error:
-    _set_result = error
-
-try:
-    from ..Methods.Simulation.DataKeeper._set_keeper import _set_keeper
-except ImportError as error:
-    _set_keeper = error
-
-
 from ntpath import basename
 from os.path import isfile
 from ._check import CheckTypeError
@@ -47,38 +30,10 @@ class DataKeeper(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.DataKeeper.as_dict
-    if isinstance(as_dict, ImportError):
-        as_dict = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use DataKeeper method as_dict: " + str(as_dict))
-            )
-        )
-    else:
-        as_dict = as_dict
-    # cf Methods.Simulation.DataKeeper._set_result
-    if isinstance(_set_result, ImportError):
-        _set_result = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use DataKeeper method _set_result: " + str(_set_result)
-                )
-            )
-        )
-    else:
-        _set_result = _set_result
-    # cf Methods.Simulation.DataKeeper._set_keeper
-    if isinstance(_set_keeper, ImportError):
-        _set_keeper = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use DataKeeper method _set_keeper: " + str(_set_keeper)
-                )
-            )
-        )
-    else:
-        _set_keeper = _set_keeper
+    # Methods imported on first use to remove unnecessary dependencies
+    as_dict = LazyMethod(__package__, "..Methods.Simulation.DataKeeper.as_dict")
+    _set_result = LazyMethod(__package__, "..Methods.Simulation.DataKeeper._set_result")
+    _set_keeper = LazyMethod(__package__, "..Methods.Simulation.DataKeeper._set_keeper")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,22 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Drive import Drive
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.DriveWave.get_wave import get_wave
-except ImportError as error:
-    get_wave = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -32,15 +25,8 @@ class DriveWave(Drive):
 
     VERSION = 1
 
-    # cf Methods.Simulation.DriveWave.get_wave
-    if isinstance(get_wave, ImportError):
-        get_wave = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use DriveWave method get_wave: " + str(get_wave))
-            )
-        )
-    else:
-        get_wave = get_wave
+    # Methods imported on first use to remove unnecessary dependencies
+    get_wave = LazyMethod(__package__, "..Methods.Simulation.DriveWave.get_wave")
     # save and copy methods are available in all object
     save = save
     copy = copy
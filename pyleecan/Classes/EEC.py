@@ -7,62 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.EEC.get_machine_from_parent import get_machine_from_parent
-except ImportError as error:
-    get_machine_from_parent = error
-
-try:
-    from ..Methods.Simulation.EEC.comp_R1 import comp_R1
-except ImportError as error:
-    comp_R1 = error
-
-try:
-    from ..Methods.Simulation.EEC.comp_skin_effect import comp_skin_effect
-except ImportError as error:
-    comp_skin_effect = error
-
-try:
-    from ..Methods.Simulation.EEC.comp_parameters import comp_parameters
-except ImportError as error:
-    comp_parameters = error
-
-try:
-    from ..Methods.Simulation.EEC.update_from_ref import update_from_ref
-except ImportError as error:
-    update_from_ref = error
-
-try:
-    from ..Methods.Simulation.EEC.solve import solve
-except ImportError as error:
-    solve = error
-
-try:
-    from ..Methods.Simulation.EEC.solve_PWM import solve_PWM
-except ImportError as error:
-    solve_PWM = error
-
-try:
-    from ..Methods.Simulation.EEC.comp_joule_losses import comp_joule_losses
-except ImportError as error:
-    comp_joule_losses = error
-
-try:
-    from ..Methods.Simulation.EEC.comp_fluxlinkage import comp_fluxlinkage
-except ImportError as error:
-    comp_fluxlinkage = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -72,101 +25,28 @@ class EEC(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.EEC.get_machine_from_parent
-    if isinstance(get_machine_from_parent, ImportError):
-        get_machine_from_parent = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use EEC method get_machine_from_parent: "
-                    + str(get_machine_from_parent)
-                )
-            )
-        )
-    else:
-        get_machine_from_parent = get_machine_from_parent
-    # cf Methods.Simulation.EEC.comp_R1
-    if isinstance(comp_R1, ImportError):
-        comp_R1 = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use EEC method comp_R1: " + str(comp_R1))
-            )
-        )
-    else:
-        comp_R1 = comp_R1
-    # cf Methods.Simulation.EEC.comp_skin_effect
-    if isinstance(comp_skin_effect, ImportError):
-        comp_skin_effect = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use EEC method comp_skin_effect: " + str(comp_skin_effect)
-                )
-            )
-        )
-    else:
-        comp_skin_effect = comp_skin_effect
-    # cf Methods.Simulation.EEC.comp_parameters
-    if isinstance(comp_parameters, ImportError):
-        comp_parameters = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use EEC method comp_parameters: " + str(comp_parameters)
-                )
-            )
-        )
-    else:
-        comp_parameters = comp_parameters
-    # cf Methods.Simulation.EEC.update_from_ref
-    if isinstance(update_from_ref, ImportError):
-        update_from_ref = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use EEC method update_from_ref: " + str(update_from_ref)
-                )
-            )
-        )
-    else:
-        update_from_ref = update_from_ref
-    # cf Methods.Simulation.EEC.solve
-    if isinstance(solve, ImportError):
-        solve = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use EEC method solve: " + str(solve))
-            )
-        )
-    else:
-        solve = solve
-    # cf Methods.Simulation.EEC.solve_PWM
-    if isinstance(solve_PWM, ImportError):
-        solve_PWM = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use EEC method solve_PWM: " + str(solve_PWM))
-            )
-        )
-    else:
-        solve_PWM = solve_PWM
-    # cf Methods.Simulation.EEC.comp_joule_losses
-    if isinstance(comp_joule_losses, ImportError):
-        comp_joule_losses = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use EEC method comp_joule_losses: " + str(comp_joule_losses)
-                )
-            )
-        )
-    else:
-        comp_joule_losses = comp_joule_losses
-    # cf Methods.Simulation.EEC.comp_fluxlinkage
-    if isinstance(comp_fluxlinkage, ImportError):
-        comp_fluxlinkage = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use EEC method comp_fluxlinkage: " + str(comp_fluxlinkage)
-                )
-            )
-        )
-    else:
-        comp_fluxlinkage = comp_fluxlinkage
+    # Methods imported on first use to remove unnecessary dependencies
+    get_machine_from_parent = LazyMethod(
+        __package__, "..Methods.Simulation.EEC.get_machine_from_parent"
+    )
+    comp_R1 = LazyMethod(__package__, "..Methods.Simulation.EEC.comp_R1")
+    comp_skin_effect = LazyMethod(
+        __package__, "..Methods.Simulation.EEC.comp_skin_effect"
+    )
+    comp_parameters = LazyMethod(
+        __package__, "..Methods.Simulation.EEC.comp_parameters"
+    )
+    update_from_ref = LazyMethod(
+        __package__, "..Methods.Simulation.EEC.update_from_ref"
+    )
+    solve = LazyMethod(__package__, "..Methods.Simulation.EEC.solve")
+    solve_PWM = LazyMethod(__package__, "..Methods.Simulation.EEC.solve_PWM")
+    comp_joule_losses = LazyMethod(
+        __package__, "..Methods.Simulation.EEC.comp_joule_losses"
+    )
+    comp_fluxlinkage = LazyMethod(
+        __package__, "..Methods.Simulation.EEC.comp_fluxlinkage"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
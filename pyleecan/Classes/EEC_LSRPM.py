@@ -7,32 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .EEC import EEC
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.EEC_LSRPM.comp_parameters import comp_parameters
-except ImportError as error:
-    comp_parameters = error
-
-try:
-    from ..Methods.Simulation.EEC_LSRPM.solve import solve
-except ImportError as error:
-    solve = error
-
-try:
-    from ..Methods.Simulation.EEC_LSRPM.comp_joule_losses import comp_joule_losses
-except ImportError as error:
-    comp_joule_losses = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -42,40 +25,14 @@ class EEC_LSRPM(EEC):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.EEC_LSRPM.comp_parameters
-    if isinstance(comp_parameters, ImportError):
-        comp_parameters = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use EEC_LSRPM method comp_parameters: "
-                    + str(comp_parameters)
-                )
-            )
-        )
-    else:
-        comp_parameters = comp_parameters
-    # cf Methods.Simulation.EEC_LSRPM.solve
-    if isinstance(solve, ImportError):
-        solve = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use EEC_LSRPM method solve: " + str(solve))
-            )
-        )
-    else:
-        solve = solve
-    # cf Methods.Simulation.EEC_LSRPM.comp_joule_losses
-    if isinstance(comp_joule_losses, ImportError):
-        comp_joule_losses = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use EEC_LSRPM method comp_joule_losses: "
-                    + str(comp_joule_losses)
-                )
-            )
-        )
-    else:
-        comp_joule_losses = comp_joule_losses
+    # Methods imported on first use to remove unnecessary dependencies
+    comp_parameters = LazyMethod(
+        __package__, "..Methods.Simulation.EEC_LSRPM.comp_parameters"
+    )
+    solve = LazyMethod(__package__, "..Methods.Simulation.EEC_LSRPM.solve")
+    comp_joule_losses = LazyMethod(
+        __package__, "..Methods.Simulation.EEC_LSRPM.comp_joule_losses"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
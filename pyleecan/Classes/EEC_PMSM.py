@@ -7,72 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .EEC import EEC
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.EEC_PMSM.comp_parameters import comp_parameters
-except ImportError as error:
-    comp_parameters = error
-
-try:
-    from ..Methods.Simulation.EEC_PMSM.solve import solve
-except ImportError as error:
-    solve = error
-
-try:
-    from ..Methods.Simulation.EEC_PMSM.solve_PWM import solve_PWM
-except ImportError as error:
-    solve_PWM = error
-
-try:
-    from ..Methods.Simulation.EEC_PMSM.comp_joule_losses import comp_joule_losses
-except ImportError as error:
-    comp_joule_losses = error
-
-try:
-    from ..Methods.Simulation.EEC_PMSM.comp_torque_sync_rel import comp_torque_sync_rel
-except ImportError as error:
-    comp_torque_sync_rel = error
-
-try:
-    from ..Methods.Simulation.EEC_PMSM.comp_BEMF_harmonics import comp_BEMF_harmonics
-except ImportError as error:
-    comp_BEMF_harmonics = error
-
-try:
-    from ..Methods.Simulation.EEC_PMSM.comp_Ld import comp_Ld
-except ImportError as error:
-    comp_Ld = error
-
-try:
-    from ..Methods.Simulation.EEC_PMSM.comp_Lq import comp_Lq
-except ImportError as error:
-    comp_Lq = error
-
-try:
-    from ..Methods.Simulation.EEC_PMSM.comp_Phidq import comp_Phidq
-except ImportError as error:
-    comp_Phidq = error
-
-try:
-    from ..Methods.Simulation.EEC_PMSM.comp_Phidq_mag import comp_Phidq_mag
-except ImportError as error:
-    comp_Phidq_mag = error
-
-try:
-    from ..Methods.Simulation.EEC_PMSM.update_from_ref import update_from_ref
-except ImportError as error:
-    update_from_ref = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -82,121 +25,30 @@ class EEC_PMSM(EEC):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.EEC_PMSM.comp_parameters
-    if isinstance(comp_parameters, ImportError):
-        comp_parameters = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use EEC_PMSM method comp_parameters: " + str(comp_parameters)
-                )
-            )
-        )
-    else:
-        comp_parameters = comp_parameters
-    # cf Methods.Simulation.EEC_PMSM.solve
-    if isinstance(solve, ImportError):
-        solve = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use EEC_PMSM method solve: " + str(solve))
-            )
-        )
-    else:
-        solve = solve
-    # cf Methods.Simulation.EEC_PMSM.solve_PWM
-    if isinstance(solve_PWM, ImportError):
-        solve_PWM = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use EEC_PMSM method solve_PWM: " + str(solve_PWM))
-            )
-        )
-    else:
-        solve_PWM = solve_PWM
-    # cf Methods.Simulation.EEC_PMSM.comp_joule_losses
-    if isinstance(comp_joule_losses, ImportError):
-        comp_joule_losses = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use EEC_PMSM method comp_joule_losses: "
-                    + str(comp_joule_losses)
-                )
-            )
-        )
-    else:
-        comp_joule_losses = comp_joule_losses
-    # cf Methods.Simulation.EEC_PMSM.comp_torque_sync_rel
-    if isinstance(comp_torque_sync_rel, ImportError):
-        comp_torque_sync_rel = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use EEC_PMSM method comp_torque_sync_rel: "
-                    + str(comp_torque_sync_rel)
-                )
-            )
-        )
-    else:
-        comp_torque_sync_rel = comp_torque_sync_rel
-    # cf Methods.Simulation.EEC_PMSM.comp_BEMF_harmonics
-    if isinstance(comp_BEMF_harmonics, ImportError):
-        comp_BEMF_harmonics = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use EEC_PMSM method comp_BEMF_harmonics: "
-                    + str(comp_BEMF_harmonics)
-                )
-            )
-        )
-    else:
-        comp_BEMF_harmonics = comp_BEMF_harmonics
-    # cf Methods.Simulation.EEC_PMSM.comp_Ld
-    if isinstance(comp_Ld, ImportError):
-        comp_Ld = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use EEC_PMSM method comp_Ld: " + str(comp_Ld))
-            )
-        )
-    else:
-        comp_Ld = comp_Ld
-    # cf Methods.Simulation.EEC_PMSM.comp_Lq
-    if isinstance(comp_Lq, ImportError):
-        comp_Lq = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use EEC_PMSM method comp_Lq: " + str(comp_Lq))
-            )
-        )
-    else:
-        comp_Lq = comp_Lq
-    # cf Methods.Simulation.EEC_PMSM.comp_Phidq
-    if isinstance(comp_Phidq, ImportError):
-        comp_Phidq = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use EEC_PMSM method comp_Phidq: " + str(comp_Phidq))
-            )
-        )
-    else:
-        comp_Phidq = comp_Phidq
-    # cf Methods.Simulation.EEC_PMSM.comp_Phidq_mag
-    if isinstance(comp_Phidq_mag, ImportError):
-        comp_Phidq_mag = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use EEC_PMSM method comp_Phidq_mag: " + str(comp_Phidq_mag)
-                )
-            )
-        )
-    else:
-        comp_Phidq_mag = comp_Phidq_mag
-    # cf Methods.Simulation.EEC_PMSM.update_from_ref
-    if isinstance(update_from_ref, ImportError):
-        update_from_ref = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use EEC_PMSM method update_from_ref: " + str(update_from_ref)
-                )
-            )
-        )
-    else:
-        update_from_ref = update_from_ref
+    # Methods imported on first use to remove unnecessary dependencies
+    comp_parameters = LazyMethod(
+        __package__, "..Methods.Simulation.EEC_PMSM.comp_parameters"
+    )
+    solve = LazyMethod(__package__, "..Methods.Simulation.EEC_PMSM.solve")
+    solve_PWM = LazyMethod(__package__, "..Methods.Simulation.EEC_PMSM.solve_PWM")
+    comp_joule_losses = LazyMethod(
+        __package__, "..Methods.Simulation.EEC_PMSM.comp_joule_losses"
+    )
+    comp_torque_sync_rel = LazyMethod(
+        __package__, "..Methods.Simulation.EEC_PMSM.comp_torque_sync_rel"
+    )
+    comp_BEMF_harmonics = LazyMethod(
+        __package__, "..Methods.Simulation.EEC_PMSM.comp_BEMF_harmonics"
+    )
+    comp_Ld = LazyMethod(__package__, "..Methods.Simulation.EEC_PMSM.comp_Ld")
+    comp_Lq = LazyMethod(__package__, "..Methods.Simulation.EEC_PMSM.comp_Lq")
+    comp_Phidq = LazyMethod(__package__, "..Methods.Simulation.EEC_PMSM.comp_Phidq")
+    comp_Phidq_mag = LazyMethod(
+        __package__, "..Methods.Simulation.EEC_PMSM.comp_Phidq_mag"
+    )
+    update_from_ref = LazyMethod(
+        __package__, "..Methods.Simulation.EEC_PMSM.update_from_ref"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
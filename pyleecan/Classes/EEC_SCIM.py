@@ -7,82 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import set_array, check_var, raise_
+from ._check import set_array, check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyArray, LazyMethod
 from .EEC import EEC
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.EEC_SCIM._comp_flux_mean import _comp_flux_mean
-except ImportError as error:
-    _comp_flux_mean = error
-
-try:
-    from ..Methods.Simulation.EEC_SCIM._comp_Lm_FEA import _comp_Lm_FEA
-except ImportError as error:
-    _comp_Lm_FEA = error
-
-try:
-    from ..Methods.Simulation.EEC_SCIM.clear_parameters import clear_parameters
-except ImportError as error:
-    clear_parameters = error
-
-try:
-    from ..Methods.Simulation.EEC_SCIM.comp_joule_losses import comp_joule_losses
-except ImportError as error:
-    comp_joule_losses = error
-
-try:
-    from ..Methods.Simulation.EEC_SCIM.comp_K21 import comp_K21
-except ImportError as error:
-    comp_K21 = error
-
-try:
-    from ..Methods.Simulation.EEC_SCIM.comp_L1 import comp_L1
-except ImportError as error:
-    comp_L1 = error
-
-try:
-    from ..Methods.Simulation.EEC_SCIM.comp_L2 import comp_L2
-except ImportError as error:
-    comp_L2 = error
-
-try:
-    from ..Methods.Simulation.EEC_SCIM.comp_parameters import comp_parameters
-except ImportError as error:
-    comp_parameters = error
-
-try:
-    from ..Methods.Simulation.EEC_SCIM.comp_R2 import comp_R2
-except ImportError as error:
-    comp_R2 = error
-
-try:
-    from ..Methods.Simulation.EEC_SCIM.comp_skin_effect import comp_skin_effect
-except ImportError as error:
-    comp_skin_effect = error
-
-try:
-    from ..Methods.Simulation.EEC_SCIM.solve import solve
-except ImportError as error:
-    solve = error
-
-try:
-    from ..Methods.Simulation.EEC_SCIM.solve_elementary import solve_elementary
-except ImportError as error:
-    solve_elementary = error
-
-try:
-    from ..Methods.Simulation.EEC_SCIM.update_from_ref import update_from_ref
-except ImportError as error:
-    update_from_ref = error
-
-
 from numpy import array, array_equal
 from numpy import isnan
 from ._check import InitUnKnowClassError
@@ -93,144 +26,34 @@ class EEC_SCIM(EEC):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.EEC_SCIM._comp_flux_mean
-    if isinstance(_comp_flux_mean, ImportError):
-        _comp_flux_mean = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use EEC_SCIM method _comp_flux_mean: " + str(_comp_flux_mean)
-                )
-            )
-        )
-    else:
-        _comp_flux_mean = _comp_flux_mean
-    # cf Methods.Simulation.EEC_SCIM._comp_Lm_FEA
-    if isinstance(_comp_Lm_FEA, ImportError):
-        _comp_Lm_FEA = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use EEC_SCIM method _comp_Lm_FEA: " + str(_comp_Lm_FEA)
-                )
-            )
-        )
-    else:
-        _comp_Lm_FEA = _comp_Lm_FEA
-    # cf Methods.Simulation.EEC_SCIM.clear_parameters
-    if isinstance(clear_parameters, ImportError):
-        clear_parameters = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use EEC_SCIM method clear_parameters: "
-                    + str(clear_parameters)
-                )
-            )
-        )
-    else:
-        clear_parameters = clear_parameters
-    # cf Methods.Simulation.EEC_SCIM.comp_joule_losses
-    if isinstance(comp_joule_losses, ImportError):
-        comp_joule_losses = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use EEC_SCIM method comp_joule_losses: "
-                    + str(comp_joule_losses)
-                )
-            )
-        )
-    else:
-        comp_joule_losses = comp_joule_losses
-    # cf Methods.Simulation.EEC_SCIM.comp_K21
-    if isinstance(comp_K21, ImportError):
-        comp_K21 = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use EEC_SCIM method comp_K21: " + str(comp_K21))
-            )
-        )
-    else:
-        comp_K21 = comp_K21
-    # cf Methods.Simulation.EEC_SCIM.comp_L1
-    if isinstance(comp_L1, ImportError):
-        comp_L1 = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use EEC_SCIM method comp_L1: " + str(comp_L1))
-            )
-        )
-    else:
-        comp_L1 = comp_L1
-    # cf Methods.Simulation.EEC_SCIM.comp_L2
-    if isinstance(comp_L2, ImportError):
-        comp_L2 = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use EEC_SCIM method comp_L2: " + str(comp_L2))
-            )
-        )
-    else:
-        comp_L2 = comp_L2
-    # cf Methods.Simulation.EEC_SCIM.comp_parameters
-    if isinstance(comp_parameters, ImportError):
-        comp_parameters = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use EEC_SCIM method comp_parameters: " + str(comp_parameters)
-                )
-            )
-        )
-    else:
-        comp_parameters = comp_parameters
-    # cf Methods.Simulation.EEC_SCIM.comp_R2
-    if isinstance(comp_R2, ImportError):
-        comp_R2 = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use EEC_SCIM method comp_R2: " + str(comp_R2))
-            )
-        )
-    else:
-        comp_R2 = comp_R2
-    # cf Methods.Simulation.EEC_SCIM.comp_skin_effect
-    if isinstance(comp_skin_effect, ImportError):
-        comp_skin_effect = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use EEC_SCIM method comp_skin_effect: "
-                    + str(comp_skin_effect)
-                )
-            )
-        )
-    else:
-        comp_skin_effect = comp_skin_effect
-    # cf Methods.Simulation.EEC_SCIM.solve
-    if isinstance(solve, ImportError):
-        solve = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use EEC_SCIM method solve: " + str(solve))
-            )
-        )
-    else:
-        solve = solve
-    # cf Methods.Simulation.EEC_SCIM.solve_elementary
-    if isinstance(solve_elementary, ImportError):
-        solve_elementary = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use EEC_SCIM method solve_elementary: "
-                    + str(solve_elementary)
-                )
-            )
-        )
-    else:
-        solve_elementary = solve_elementary
-    # cf Methods.Simulation.EEC_SCIM.update_from_ref
-    if isinstance(update_from_ref, ImportError):
-        update_from_ref = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use EEC_SCIM method update_from_ref: " + str(update_from_ref)
-                )
-            )
-        )
-    else:
-        update_from_ref = update_from_ref
+    # Methods imported on first use to remove unnecessary dependencies
+    _comp_flux_mean = LazyMethod(
+        __package__, "..Methods.Simulation.EEC_SCIM._comp_flux_mean"
+    )
+    _comp_Lm_FEA = LazyMethod(__package__, "..Methods.Simulation.EEC_SCIM._comp_Lm_FEA")
+    clear_parameters = LazyMethod(
+        __package__, "..Methods.Simulation.EEC_SCIM.clear_parameters"
+    )
+    comp_joule_losses = LazyMethod(
+        __package__, "..Methods.Simulation.EEC_SCIM.comp_joule_losses"
+    )
+    comp_K21 = LazyMethod(__package__, "..Methods.Simulation.EEC_SCIM.comp_K21")
+    comp_L1 = LazyMethod(__package__, "..Methods.Simulation.EEC_SCIM.comp_L1")
+    comp_L2 = LazyMethod(__package__, "..Methods.Simulation.EEC_SCIM.comp_L2")
+    comp_parameters = LazyMethod(
+        __package__, "..Methods.Simulation.EEC_SCIM.comp_parameters"
+    )
+    comp_R2 = LazyMethod(__package__, "..Methods.Simulation.EEC_SCIM.comp_R2")
+    comp_skin_effect = LazyMethod(
+        __package__, "..Methods.Simulation.EEC_SCIM.comp_skin_effect"
+    )
+    solve = LazyMethod(__package__, "..Methods.Simulation.EEC_SCIM.solve")
+    solve_elementary = LazyMethod(
+        __package__, "..Methods.Simulation.EEC_SCIM.solve_elementary"
+    )
+    update_from_ref = LazyMethod(
+        __package__, "..Methods.Simulation.EEC_SCIM.update_from_ref"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -842,6 +665,8 @@ class EEC_SCIM(EEC):
 
     def _get_Im_table(self):
         """getter of Im_table"""
+        if isinstance(self._Im_table, LazyArray):
+            self._Im_table = self._Im_table.read()
         return self._Im_table
 
     def _set_Im_table(self, value):
@@ -867,6 +692,8 @@ class EEC_SCIM(EEC):
 
     def _get_Lm_table(self):
         """getter of Lm_table"""
+        if isinstance(self._Lm_table, LazyArray):
+            self._Lm_table = self._Lm_table.read()
         return self._Lm_table
 
     def _set_Lm_table(self, value):
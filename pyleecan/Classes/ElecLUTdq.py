@@ -7,37 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Electrical import Electrical
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.ElecLUTdq.run import run
-except ImportError as error:
-    run = error
-
-try:
-    from ..Methods.Simulation.ElecLUTdq.comp_LUTdq import comp_LUTdq
-except ImportError as error:
-    comp_LUTdq = error
-
-try:
-    from ..Methods.Simulation.ElecLUTdq.solve_power import solve_power
-except ImportError as error:
-    solve_power = error
-
-try:
-    from ..Methods.Simulation.ElecLUTdq.solve_MTPA import solve_MTPA
-except ImportError as error:
-    solve_MTPA = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -47,45 +25,14 @@ class ElecLUTdq(Electrical):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.ElecLUTdq.run
-    if isinstance(run, ImportError):
-        run = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use ElecLUTdq method run: " + str(run))
-            )
-        )
-    else:
-        run = run
-    # cf Methods.Simulation.ElecLUTdq.comp_LUTdq
-    if isinstance(comp_LUTdq, ImportError):
-        comp_LUTdq = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use ElecLUTdq method comp_LUTdq: " + str(comp_LUTdq))
-            )
-        )
-    else:
-        comp_LUTdq = comp_LUTdq
-    # cf Methods.Simulation.ElecLUTdq.solve_power
-    if isinstance(solve_power, ImportError):
-        solve_power = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ElecLUTdq method solve_power: " + str(solve_power)
-                )
-            )
-        )
-    else:
-        solve_power = solve_power
-    # cf Methods.Simulation.ElecLUTdq.solve_MTPA
-    if isinstance(solve_MTPA, ImportError):
-        solve_MTPA = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use ElecLUTdq method solve_MTPA: " + str(solve_MTPA))
-            )
-        )
-    else:
-        solve_MTPA = solve_MTPA
+    # Methods imported on first use to remove unnecessary dependencies
+    run = LazyMethod(__package__, "..Methods.Simulation.ElecLUTdq.run")
+    comp_LUTdq = LazyMethod(__package__, "..Methods.Simulation.ElecLUTdq.comp_LUTdq")
+    solve_power = LazyMethod(__package__, "..Methods.Simulation.ElecLUTdq.solve_power")
+    solve_MTPA = LazyMethod(__package__, "..Methods.Simulation.ElecLUTdq.solve_MTPA")
+    solve_MTPA_vect = LazyMethod(
+        __package__, "..Methods.Simulation.ElecLUTdq.solve_MTPA_vect"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
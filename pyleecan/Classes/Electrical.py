@@ -7,37 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.Electrical.run import run
-except ImportError as error:
-    run = error
-
-try:
-    from ..Methods.Simulation.Electrical.comp_power import comp_power
-except ImportError as error:
-    comp_power = error
-
-try:
-    from ..Methods.Simulation.Electrical.comp_torque import comp_torque
-except ImportError as error:
-    comp_torque = error
-
-try:
-    from ..Methods.Simulation.Electrical.gen_drive import gen_drive
-except ImportError as error:
-    gen_drive = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -47,47 +25,11 @@ class Electrical(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.Electrical.run
-    if isinstance(run, ImportError):
-        run = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Electrical method run: " + str(run))
-            )
-        )
-    else:
-        run = run
-    # cf Methods.Simulation.Electrical.comp_power
-    if isinstance(comp_power, ImportError):
-        comp_power = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Electrical method comp_power: " + str(comp_power)
-                )
-            )
-        )
-    else:
-        comp_power = comp_power
-    # cf Methods.Simulation.Electrical.comp_torque
-    if isinstance(comp_torque, ImportError):
-        comp_torque = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Electrical method comp_torque: " + str(comp_torque)
-                )
-            )
-        )
-    else:
-        comp_torque = comp_torque
-    # cf Methods.Simulation.Electrical.gen_drive
-    if isinstance(gen_drive, ImportError):
-        gen_drive = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Electrical method gen_drive: " + str(gen_drive))
-            )
-        )
-    else:
-        gen_drive = gen_drive
+    # Methods imported on first use to remove unnecessary dependencies
+    run = LazyMethod(__package__, "..Methods.Simulation.Electrical.run")
+    comp_power = LazyMethod(__package__, "..Methods.Simulation.Electrical.comp_power")
+    comp_torque = LazyMethod(__package__, "..Methods.Simulation.Electrical.comp_torque")
+    gen_drive = LazyMethod(__package__, "..Methods.Simulation.Electrical.gen_drive")
     # save and copy methods are available in all object
     save = save
     copy = copy
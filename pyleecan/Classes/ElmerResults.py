@@ -7,32 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Elmer import Elmer
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Elmer.ElmerResults.load_data import load_data
-except ImportError as error:
-    load_data = error
-
-try:
-    from ..Methods.Elmer.ElmerResults.load_columns import load_columns
-except ImportError as error:
-    load_columns = error
-
-try:
-    from ..Methods.Elmer.ElmerResults.get_data import get_data
-except ImportError as error:
-    get_data = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -42,38 +25,10 @@ class ElmerResults(Elmer):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Elmer.ElmerResults.load_data
-    if isinstance(load_data, ImportError):
-        load_data = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ElmerResults method load_data: " + str(load_data)
-                )
-            )
-        )
-    else:
-        load_data = load_data
-    # cf Methods.Elmer.ElmerResults.load_columns
-    if isinstance(load_columns, ImportError):
-        load_columns = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ElmerResults method load_columns: " + str(load_columns)
-                )
-            )
-        )
-    else:
-        load_columns = load_columns
-    # cf Methods.Elmer.ElmerResults.get_data
-    if isinstance(get_data, ImportError):
-        get_data = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use ElmerResults method get_data: " + str(get_data))
-            )
-        )
-    else:
-        get_data = get_data
+    # Methods imported on first use to remove unnecessary dependencies
+    load_data = LazyMethod(__package__, "..Methods.Elmer.ElmerResults.load_data")
+    load_columns = LazyMethod(__package__, "..Methods.Elmer.ElmerResults.load_columns")
+    get_data = LazyMethod(__package__, "..Methods.Elmer.ElmerResults.get_data")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,22 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Elmer import Elmer
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Elmer.ElmerResultsVTU.build_meshsolution import build_meshsolution
-except ImportError as error:
-    build_meshsolution = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -32,18 +25,10 @@ class ElmerResultsVTU(Elmer):
 
     VERSION = 1
 
-    # cf Methods.Elmer.ElmerResultsVTU.build_meshsolution
-    if isinstance(build_meshsolution, ImportError):
-        build_meshsolution = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ElmerResultsVTU method build_meshsolution: "
-                    + str(build_meshsolution)
-                )
-            )
-        )
-    else:
-        build_meshsolution = build_meshsolution
+    # Methods imported on first use to remove unnecessary dependencies
+    build_meshsolution = LazyMethod(
+        __package__, "..Methods.Elmer.ElmerResultsVTU.build_meshsolution"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,27 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .EndWinding import EndWinding
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.EndWindingRect.comp_length import comp_length
-except ImportError as error:
-    comp_length = error
-
-try:
-    from ..Methods.Machine.EndWindingRect.comp_inductance import comp_inductance
-except ImportError as error:
-    comp_inductance = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -37,30 +25,13 @@ class EndWindingRect(EndWinding):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.EndWindingRect.comp_length
-    if isinstance(comp_length, ImportError):
-        comp_length = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use EndWindingRect method comp_length: " + str(comp_length)
-                )
-            )
-        )
-    else:
-        comp_length = comp_length
-    # cf Methods.Machine.EndWindingRect.comp_inductance
-    if isinstance(comp_inductance, ImportError):
-        comp_inductance = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use EndWindingRect method comp_inductance: "
-                    + str(comp_inductance)
-                )
-            )
-        )
-    else:
-        comp_inductance = comp_inductance
+    # Methods imported on first use to remove unnecessary dependencies
+    comp_length = LazyMethod(
+        __package__, "..Methods.Machine.EndWindingRect.comp_length"
+    )
+    comp_inductance = LazyMethod(
+        __package__, "..Methods.Machine.EndWindingRect.comp_inductance"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,22 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .GaussPoint import GaussPoint
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Mesh.FPGNSeg.get_gauss_points import get_gauss_points
-except ImportError as error:
-    get_gauss_points = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -32,18 +25,10 @@ class FPGNSeg(GaussPoint):
 
     VERSION = 1
 
-    # cf Methods.Mesh.FPGNSeg.get_gauss_points
-    if isinstance(get_gauss_points, ImportError):
-        get_gauss_points = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use FPGNSeg method get_gauss_points: "
-                    + str(get_gauss_points)
-                )
-            )
-        )
-    else:
-        get_gauss_points = get_gauss_points
+    # Methods imported on first use to remove unnecessary dependencies
+    get_gauss_points = LazyMethod(
+        __package__, "..Methods.Mesh.FPGNSeg.get_gauss_points"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,32 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.Force.run import run
-except ImportError as error:
-    run = error
-
-try:
-    from ..Methods.Simulation.Force.comp_axes import comp_axes
-except ImportError as error:
-    comp_axes = error
-
-try:
-    from ..Methods.Simulation.Force.comp_AGSF_transfer import comp_AGSF_transfer
-except ImportError as error:
-    comp_AGSF_transfer = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -42,37 +25,12 @@ class Force(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.Force.run
-    if isinstance(run, ImportError):
-        run = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Force method run: " + str(run))
-            )
-        )
-    else:
-        run = run
-    # cf Methods.Simulation.Force.comp_axes
-    if isinstance(comp_axes, ImportError):
-        comp_axes = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Force method comp_axes: " + str(comp_axes))
-            )
-        )
-    else:
-        comp_axes = comp_axes
-    # cf Methods.Simulation.Force.comp_AGSF_transfer
-    if isinstance(comp_AGSF_transfer, ImportError):
-        comp_AGSF_transfer = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Force method comp_AGSF_transfer: "
-                    + str(comp_AGSF_transfer)
-                )
-            )
-        )
-    else:
-        comp_AGSF_transfer = comp_AGSF_transfer
+    # Methods imported on first use to remove unnecessary dependencies
+    run = LazyMethod(__package__, "..Methods.Simulation.Force.run")
+    comp_axes = LazyMethod(__package__, "..Methods.Simulation.Force.comp_axes")
+    comp_AGSF_transfer = LazyMethod(
+        __package__, "..Methods.Simulation.Force.comp_AGSF_transfer"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,27 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Force import Force
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.ForceMT.comp_force import comp_force
-except ImportError as error:
-    comp_force = error
-
-try:
-    from ..Methods.Simulation.ForceMT.comp_force_nodal import comp_force_nodal
-except ImportError as error:
-    comp_force_nodal = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -37,28 +25,11 @@ class ForceMT(Force):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.ForceMT.comp_force
-    if isinstance(comp_force, ImportError):
-        comp_force = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use ForceMT method comp_force: " + str(comp_force))
-            )
-        )
-    else:
-        comp_force = comp_force
-    # cf Methods.Simulation.ForceMT.comp_force_nodal
-    if isinstance(comp_force_nodal, ImportError):
-        comp_force_nodal = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ForceMT method comp_force_nodal: "
-                    + str(comp_force_nodal)
-                )
-            )
-        )
-    else:
-        comp_force_nodal = comp_force_nodal
+    # Methods imported on first use to remove unnecessary dependencies
+    comp_force = LazyMethod(__package__, "..Methods.Simulation.ForceMT.comp_force")
+    comp_force_nodal = LazyMethod(
+        __package__, "..Methods.Simulation.ForceMT.comp_force_nodal"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,39 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Force import Force
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.ForceTensor.comp_force import comp_force
-except ImportError as error:
-    comp_force = error
-
-try:
-    from ..Methods.Simulation.ForceTensor.comp_force_nodal import comp_force_nodal
-except ImportError as error:
-    comp_force_nodal = error
-
-try:
-    from ..Methods.Simulation.ForceTensor.comp_magnetostrictive_tensor import (
-        comp_magnetostrictive_tensor,
-    )
-except ImportError as error:
-    comp_magnetostrictive_tensor = error
-
-try:
-    from ..Methods.Simulation.ForceTensor.element_loop import element_loop
-except ImportError as error:
-    element_loop = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -49,53 +25,20 @@ class ForceTensor(Force):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.ForceTensor.comp_force
-    if isinstance(comp_force, ImportError):
-        comp_force = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ForceTensor method comp_force: " + str(comp_force)
-                )
-            )
-        )
-    else:
-        comp_force = comp_force
-    # cf Methods.Simulation.ForceTensor.comp_force_nodal
-    if isinstance(comp_force_nodal, ImportError):
-        comp_force_nodal = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ForceTensor method comp_force_nodal: "
-                    + str(comp_force_nodal)
-                )
-            )
-        )
-    else:
-        comp_force_nodal = comp_force_nodal
-    # cf Methods.Simulation.ForceTensor.comp_magnetostrictive_tensor
-    if isinstance(comp_magnetostrictive_tensor, ImportError):
-        comp_magnetostrictive_tensor = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ForceTensor method comp_magnetostrictive_tensor: "
-                    + str(comp_magnetostrictive_tensor)
-                )
-            )
-        )
-    else:
-        comp_magnetostrictive_tensor = comp_magnetostrictive_tensor
-    # cf Methods.Simulation.ForceTensor.element_loop
-    if isinstance(element_loop, ImportError):
-        element_loop = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ForceTensor method element_loop: " + str(element_loop)
-                )
-            )
-        )
-    else:
-        element_loop = element_loop
+    # Methods imported on first use to remove unnecessary dependencies
+    comp_force = LazyMethod(__package__, "..Methods.Simulation.ForceTensor.comp_force")
+    comp_force_nodal = LazyMethod(
+        __package__, "..Methods.Simulation.ForceTensor.comp_force_nodal"
+    )
+    comp_magnetostrictive_tensor = LazyMethod(
+        __package__, "..Methods.Simulation.ForceTensor.comp_magnetostrictive_tensor"
+    )
+    element_loop = LazyMethod(
+        __package__, "..Methods.Simulation.ForceTensor.element_loop"
+    )
+    element_loop_vect = LazyMethod(
+        __package__, "..Methods.Simulation.ForceTensor.element_loop_vect"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -106,6 +49,7 @@ class ForceTensor(Force):
         self,
         group="stator core",
         tensor=None,
+        is_vectorized=True,
         is_periodicity_t=None,
         is_periodicity_a=None,
         is_agsf_transfer=False,
@@ -134,6 +78,8 @@ class ForceTensor(Force):
                 group = init_dict["group"]
             if "tensor" in list(init_dict.keys()):
                 tensor = init_dict["tensor"]
+            if "is_vectorized" in list(init_dict.keys()):
+                is_vectorized = init_dict["is_vectorized"]
             if "is_periodicity_t" in list(init_dict.keys()):
                 is_periodicity_t = init_dict["is_periodicity_t"]
             if "is_periodicity_a" in list(init_dict.keys()):
@@ -149,6 +95,7 @@ class ForceTensor(Force):
         # Set the properties (value check and convertion are done in setter)
         self.group = group
         self.tensor = tensor
+        self.is_vectorized = is_vectorized
         # Call Force init
         super(ForceTensor, self).__init__(
             is_periodicity_t=is_periodicity_t,
@@ -169,6 +116,7 @@ class ForceTensor(Force):
         ForceTensor_str += super(ForceTensor, self).__str__()
         ForceTensor_str += 'group = "' + str(self.group) + '"' + linesep
         ForceTensor_str += "tensor = " + str(self.tensor) + linesep
+        ForceTensor_str += "is_vectorized = " + str(self.is_vectorized) + linesep
         return ForceTensor_str
 
     def __eq__(self, other):
@@ -184,6 +132,8 @@ class ForceTensor(Force):
             return False
         if other.tensor != self.tensor:
             return False
+        if other.is_vectorized != self.is_vectorized:
+            return False
         return True
 
     def compare(self, other, name="self", ignore_list=None, is_add_value=False):
@@ -221,6 +171,18 @@ class ForceTensor(Force):
                 diff_list.append(name + ".tensor" + val_str)
             else:
                 diff_list.append(name + ".tensor")
+        if other._is_vectorized != self._is_vectorized:
+            if is_add_value:
+                val_str = (
+                    " (self="
+                    + str(self._is_vectorized)
+                    + ", other="
+                    + str(other._is_vectorized)
+                    + ")"
+                )
+                diff_list.append(name + ".is_vectorized" + val_str)
+            else:
+                diff_list.append(name + ".is_vectorized")
         # Filter ignore differences
         diff_list = list(filter(lambda x: x not in ignore_list, diff_list))
         return diff_list
@@ -236,6 +198,7 @@ class ForceTensor(Force):
         if self.tensor is not None:
             for key, value in self.tensor.items():
                 S += getsizeof(value) + getsizeof(key)
+        S += getsizeof(self.is_vectorized)
         return S
 
     def as_dict(self, type_handle_ndarray=0, keep_function=False, **kwargs):
@@ -259,6 +222,7 @@ class ForceTensor(Force):
         ForceTensor_dict["tensor"] = (
             self.tensor.copy() if self.tensor is not None else None
         )
+        ForceTensor_dict["is_vectorized"] = self.is_vectorized
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         ForceTensor_dict["__class__"] = "ForceTensor"
@@ -269,6 +233,7 @@ class ForceTensor(Force):
 
         self.group = None
         self.tensor = None
+        self.is_vectorized = None
         # Set to None the properties inherited from Force
         super(ForceTensor, self)._set_None()
 
@@ -309,3 +274,21 @@ class ForceTensor(Force):
         :Type: dict
         """,
     )
+
+    def _get_is_vectorized(self):
+        """getter of is_vectorized"""
+        return self._is_vectorized
+
+    def _set_is_vectorized(self, value):
+        """setter of is_vectorized"""
+        check_var("is_vectorized", value, "bool")
+        self._is_vectorized = value
+
+    is_vectorized = property(
+        fget=_get_is_vectorized,
+        fset=_set_is_vectorized,
+        doc=u"""True to compute the nodal forces with the vectorized element engine (element_loop_vect) instead of the per-element loop
+
+        :Type: bool
+        """,
+    )
@@ -7,52 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.Frame.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from ..Methods.Machine.Frame.comp_height_eq import comp_height_eq
-except ImportError as error:
-    comp_height_eq = error
-
-try:
-    from ..Methods.Machine.Frame.comp_mass import comp_mass
-except ImportError as error:
-    comp_mass = error
-
-try:
-    from ..Methods.Machine.Frame.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from ..Methods.Machine.Frame.comp_volume import comp_volume
-except ImportError as error:
-    comp_volume = error
-
-try:
-    from ..Methods.Machine.Frame.get_length import get_length
-except ImportError as error:
-    get_length = error
-
-try:
-    from ..Methods.Machine.Frame.plot import plot
-except ImportError as error:
-    plot = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -62,74 +25,14 @@ class Frame(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.Frame.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Frame method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
-    # cf Methods.Machine.Frame.comp_height_eq
-    if isinstance(comp_height_eq, ImportError):
-        comp_height_eq = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Frame method comp_height_eq: " + str(comp_height_eq)
-                )
-            )
-        )
-    else:
-        comp_height_eq = comp_height_eq
-    # cf Methods.Machine.Frame.comp_mass
-    if isinstance(comp_mass, ImportError):
-        comp_mass = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Frame method comp_mass: " + str(comp_mass))
-            )
-        )
-    else:
-        comp_mass = comp_mass
-    # cf Methods.Machine.Frame.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Frame method comp_surface: " + str(comp_surface))
-            )
-        )
-    else:
-        comp_surface = comp_surface
-    # cf Methods.Machine.Frame.comp_volume
-    if isinstance(comp_volume, ImportError):
-        comp_volume = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Frame method comp_volume: " + str(comp_volume))
-            )
-        )
-    else:
-        comp_volume = comp_volume
-    # cf Methods.Machine.Frame.get_length
-    if isinstance(get_length, ImportError):
-        get_length = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Frame method get_length: " + str(get_length))
-            )
-        )
-    else:
-        get_length = get_length
-    # cf Methods.Machine.Frame.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Frame method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
+    # Methods imported on first use to remove unnecessary dependencies
+    build_geometry = LazyMethod(__package__, "..Methods.Machine.Frame.build_geometry")
+    comp_height_eq = LazyMethod(__package__, "..Methods.Machine.Frame.comp_height_eq")
+    comp_mass = LazyMethod(__package__, "..Methods.Machine.Frame.comp_mass")
+    comp_surface = LazyMethod(__package__, "..Methods.Machine.Frame.comp_surface")
+    comp_volume = LazyMethod(__package__, "..Methods.Machine.Frame.comp_volume")
+    get_length = LazyMethod(__package__, "..Methods.Machine.Frame.get_length")
+    plot = LazyMethod(__package__, "..Methods.Machine.Frame.plot")
     # save and copy methods are available in all object
     save = save
     copy = copy
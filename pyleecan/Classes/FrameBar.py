@@ -7,47 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Frame import Frame
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.FrameBar.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from ..Methods.Machine.FrameBar.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from ..Methods.Machine.FrameBar.comp_height_gap import comp_height_gap
-except ImportError as error:
-    comp_height_gap = error
-
-try:
-    from ..Methods.Machine.FrameBar.build_geometry_bar import build_geometry_bar
-except ImportError as error:
-    build_geometry_bar = error
-
-try:
-    from ..Methods.Machine.FrameBar.comp_surface_bar import comp_surface_bar
-except ImportError as error:
-    comp_surface_bar = error
-
-try:
-    from ..Methods.Machine.FrameBar.comp_surface_gap import comp_surface_gap
-except ImportError as error:
-    comp_surface_gap = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -57,76 +25,23 @@ class FrameBar(Frame):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.FrameBar.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use FrameBar method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
-    # cf Methods.Machine.FrameBar.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use FrameBar method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
-    # cf Methods.Machine.FrameBar.comp_height_gap
-    if isinstance(comp_height_gap, ImportError):
-        comp_height_gap = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use FrameBar method comp_height_gap: " + str(comp_height_gap)
-                )
-            )
-        )
-    else:
-        comp_height_gap = comp_height_gap
-    # cf Methods.Machine.FrameBar.build_geometry_bar
-    if isinstance(build_geometry_bar, ImportError):
-        build_geometry_bar = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use FrameBar method build_geometry_bar: "
-                    + str(build_geometry_bar)
-                )
-            )
-        )
-    else:
-        build_geometry_bar = build_geometry_bar
-    # cf Methods.Machine.FrameBar.comp_surface_bar
-    if isinstance(comp_surface_bar, ImportError):
-        comp_surface_bar = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use FrameBar method comp_surface_bar: "
-                    + str(comp_surface_bar)
-                )
-            )
-        )
-    else:
-        comp_surface_bar = comp_surface_bar
-    # cf Methods.Machine.FrameBar.comp_surface_gap
-    if isinstance(comp_surface_gap, ImportError):
-        comp_surface_gap = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use FrameBar method comp_surface_gap: "
-                    + str(comp_surface_gap)
-                )
-            )
-        )
-    else:
-        comp_surface_gap = comp_surface_gap
+    # Methods imported on first use to remove unnecessary dependencies
+    build_geometry = LazyMethod(
+        __package__, "..Methods.Machine.FrameBar.build_geometry"
+    )
+    comp_surface = LazyMethod(__package__, "..Methods.Machine.FrameBar.comp_surface")
+    comp_height_gap = LazyMethod(
+        __package__, "..Methods.Machine.FrameBar.comp_height_gap"
+    )
+    build_geometry_bar = LazyMethod(
+        __package__, "..Methods.Machine.FrameBar.build_geometry_bar"
+    )
+    comp_surface_bar = LazyMethod(
+        __package__, "..Methods.Machine.FrameBar.comp_surface_bar"
+    )
+    comp_surface_gap = LazyMethod(
+        __package__, "..Methods.Machine.FrameBar.comp_surface_gap"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
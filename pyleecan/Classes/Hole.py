@@ -7,87 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Slot.Hole.comp_height import comp_height
-except ImportError as error:
-    comp_height = error
-
-try:
-    from ..Methods.Slot.Hole.comp_magnetization_dict import comp_magnetization_dict
-except ImportError as error:
-    comp_magnetization_dict = error
-
-try:
-    from ..Methods.Slot.Hole.comp_radius import comp_radius
-except ImportError as error:
-    comp_radius = error
-
-try:
-    from ..Methods.Slot.Hole.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from ..Methods.Slot.Hole.convert_to_UD import convert_to_UD
-except ImportError as error:
-    convert_to_UD = error
-
-try:
-    from ..Methods.Slot.Hole.get_is_stator import get_is_stator
-except ImportError as error:
-    get_is_stator = error
-
-try:
-    from ..Methods.Slot.Hole.get_magnet_by_id import get_magnet_by_id
-except ImportError as error:
-    get_magnet_by_id = error
-
-try:
-    from ..Methods.Slot.Hole.get_magnet_dict import get_magnet_dict
-except ImportError as error:
-    get_magnet_dict = error
-
-try:
-    from ..Methods.Slot.Hole.get_Rbo import get_Rbo
-except ImportError as error:
-    get_Rbo = error
-
-try:
-    from ..Methods.Slot.Hole.get_Rext import get_Rext
-except ImportError as error:
-    get_Rext = error
-
-try:
-    from ..Methods.Slot.Hole.has_magnet import has_magnet
-except ImportError as error:
-    has_magnet = error
-
-try:
-    from ..Methods.Slot.Hole.plot import plot
-except ImportError as error:
-    plot = error
-
-try:
-    from ..Methods.Slot.Hole.set_magnet_by_id import set_magnet_by_id
-except ImportError as error:
-    set_magnet_by_id = error
-
-try:
-    from ..Methods.Slot.Hole.get_R_id import get_R_id
-except ImportError as error:
-    get_R_id = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -97,146 +25,23 @@ class Hole(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Slot.Hole.comp_height
-    if isinstance(comp_height, ImportError):
-        comp_height = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Hole method comp_height: " + str(comp_height))
-            )
-        )
-    else:
-        comp_height = comp_height
-    # cf Methods.Slot.Hole.comp_magnetization_dict
-    if isinstance(comp_magnetization_dict, ImportError):
-        comp_magnetization_dict = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Hole method comp_magnetization_dict: "
-                    + str(comp_magnetization_dict)
-                )
-            )
-        )
-    else:
-        comp_magnetization_dict = comp_magnetization_dict
-    # cf Methods.Slot.Hole.comp_radius
-    if isinstance(comp_radius, ImportError):
-        comp_radius = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Hole method comp_radius: " + str(comp_radius))
-            )
-        )
-    else:
-        comp_radius = comp_radius
-    # cf Methods.Slot.Hole.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Hole method comp_surface: " + str(comp_surface))
-            )
-        )
-    else:
-        comp_surface = comp_surface
-    # cf Methods.Slot.Hole.convert_to_UD
-    if isinstance(convert_to_UD, ImportError):
-        convert_to_UD = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Hole method convert_to_UD: " + str(convert_to_UD)
-                )
-            )
-        )
-    else:
-        convert_to_UD = convert_to_UD
-    # cf Methods.Slot.Hole.get_is_stator
-    if isinstance(get_is_stator, ImportError):
-        get_is_stator = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Hole method get_is_stator: " + str(get_is_stator)
-                )
-            )
-        )
-    else:
-        get_is_stator = get_is_stator
-    # cf Methods.Slot.Hole.get_magnet_by_id
-    if isinstance(get_magnet_by_id, ImportError):
-        get_magnet_by_id = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Hole method get_magnet_by_id: " + str(get_magnet_by_id)
-                )
-            )
-        )
-    else:
-        get_magnet_by_id = get_magnet_by_id
-    # cf Methods.Slot.Hole.get_magnet_dict
-    if isinstance(get_magnet_dict, ImportError):
-        get_magnet_dict = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Hole method get_magnet_dict: " + str(get_magnet_dict)
-                )
-            )
-        )
-    else:
-        get_magnet_dict = get_magnet_dict
-    # cf Methods.Slot.Hole.get_Rbo
-    if isinstance(get_Rbo, ImportError):
-        get_Rbo = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Hole method get_Rbo: " + str(get_Rbo))
-            )
-        )
-    else:
-        get_Rbo = get_Rbo
-    # cf Methods.Slot.Hole.get_Rext
-    if isinstance(get_Rext, ImportError):
-        get_Rext = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Hole method get_Rext: " + str(get_Rext))
-            )
-        )
-    else:
-        get_Rext = get_Rext
-    # cf Methods.Slot.Hole.has_magnet
-    if isinstance(has_magnet, ImportError):
-        has_magnet = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Hole method has_magnet: " + str(has_magnet))
-            )
-        )
-    else:
-        has_magnet = has_magnet
-    # cf Methods.Slot.Hole.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Hole method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
-    # cf Methods.Slot.Hole.set_magnet_by_id
-    if isinstance(set_magnet_by_id, ImportError):
-        set_magnet_by_id = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Hole method set_magnet_by_id: " + str(set_magnet_by_id)
-                )
-            )
-        )
-    else:
-        set_magnet_by_id = set_magnet_by_id
-    # cf Methods.Slot.Hole.get_R_id
-    if isinstance(get_R_id, ImportError):
-        get_R_id = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Hole method get_R_id: " + str(get_R_id))
-            )
-        )
-    else:
-        get_R_id = get_R_id
+    # Methods imported on first use to remove unnecessary dependencies
+    comp_height = LazyMethod(__package__, "..Methods.Slot.Hole.comp_height")
+    comp_magnetization_dict = LazyMethod(
+        __package__, "..Methods.Slot.Hole.comp_magnetization_dict"
+    )
+    comp_radius = LazyMethod(__package__, "..Methods.Slot.Hole.comp_radius")
+    comp_surface = LazyMethod(__package__, "..Methods.Slot.Hole.comp_surface")
+    convert_to_UD = LazyMethod(__package__, "..Methods.Slot.Hole.convert_to_UD")
+    get_is_stator = LazyMethod(__package__, "..Methods.Slot.Hole.get_is_stator")
+    get_magnet_by_id = LazyMethod(__package__, "..Methods.Slot.Hole.get_magnet_by_id")
+    get_magnet_dict = LazyMethod(__package__, "..Methods.Slot.Hole.get_magnet_dict")
+    get_Rbo = LazyMethod(__package__, "..Methods.Slot.Hole.get_Rbo")
+    get_Rext = LazyMethod(__package__, "..Methods.Slot.Hole.get_Rext")
+    has_magnet = LazyMethod(__package__, "..Methods.Slot.Hole.has_magnet")
+    plot = LazyMethod(__package__, "..Methods.Slot.Hole.plot")
+    set_magnet_by_id = LazyMethod(__package__, "..Methods.Slot.Hole.set_magnet_by_id")
+    get_R_id = LazyMethod(__package__, "..Methods.Slot.Hole.get_R_id")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,72 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .HoleMag import HoleMag
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Slot.HoleM50._comp_point_coordinate import _comp_point_coordinate
-except ImportError as error:
-    _comp_point_coordinate = error
-
-try:
-    from ..Methods.Slot.HoleM50.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from ..Methods.Slot.HoleM50.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Slot.HoleM50.comp_alpha import comp_alpha
-except ImportError as error:
-    comp_alpha = error
-
-try:
-    from ..Methods.Slot.HoleM50.comp_magnetization_dict import comp_magnetization_dict
-except ImportError as error:
-    comp_magnetization_dict = error
-
-try:
-    from ..Methods.Slot.HoleM50.comp_radius import comp_radius
-except ImportError as error:
-    comp_radius = error
-
-try:
-    from ..Methods.Slot.HoleM50.comp_surface_magnet_id import comp_surface_magnet_id
-except ImportError as error:
-    comp_surface_magnet_id = error
-
-try:
-    from ..Methods.Slot.HoleM50.comp_W5 import comp_W5
-except ImportError as error:
-    comp_W5 = error
-
-try:
-    from ..Methods.Slot.HoleM50.has_magnet import has_magnet
-except ImportError as error:
-    has_magnet = error
-
-try:
-    from ..Methods.Slot.HoleM50.plot_schematics import plot_schematics
-except ImportError as error:
-    plot_schematics = error
-
-try:
-    from ..Methods.Slot.HoleM50.remove_magnet import remove_magnet
-except ImportError as error:
-    remove_magnet = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -83,121 +26,24 @@ class HoleM50(HoleMag):
     VERSION = 1
     IS_SYMMETRICAL = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Slot.HoleM50._comp_point_coordinate
-    if isinstance(_comp_point_coordinate, ImportError):
-        _comp_point_coordinate = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM50 method _comp_point_coordinate: "
-                    + str(_comp_point_coordinate)
-                )
-            )
-        )
-    else:
-        _comp_point_coordinate = _comp_point_coordinate
-    # cf Methods.Slot.HoleM50.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM50 method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
-    # cf Methods.Slot.HoleM50.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use HoleM50 method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Slot.HoleM50.comp_alpha
-    if isinstance(comp_alpha, ImportError):
-        comp_alpha = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use HoleM50 method comp_alpha: " + str(comp_alpha))
-            )
-        )
-    else:
-        comp_alpha = comp_alpha
-    # cf Methods.Slot.HoleM50.comp_magnetization_dict
-    if isinstance(comp_magnetization_dict, ImportError):
-        comp_magnetization_dict = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM50 method comp_magnetization_dict: "
-                    + str(comp_magnetization_dict)
-                )
-            )
-        )
-    else:
-        comp_magnetization_dict = comp_magnetization_dict
-    # cf Methods.Slot.HoleM50.comp_radius
-    if isinstance(comp_radius, ImportError):
-        comp_radius = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use HoleM50 method comp_radius: " + str(comp_radius))
-            )
-        )
-    else:
-        comp_radius = comp_radius
-    # cf Methods.Slot.HoleM50.comp_surface_magnet_id
-    if isinstance(comp_surface_magnet_id, ImportError):
-        comp_surface_magnet_id = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM50 method comp_surface_magnet_id: "
-                    + str(comp_surface_magnet_id)
-                )
-            )
-        )
-    else:
-        comp_surface_magnet_id = comp_surface_magnet_id
-    # cf Methods.Slot.HoleM50.comp_W5
-    if isinstance(comp_W5, ImportError):
-        comp_W5 = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use HoleM50 method comp_W5: " + str(comp_W5))
-            )
-        )
-    else:
-        comp_W5 = comp_W5
-    # cf Methods.Slot.HoleM50.has_magnet
-    if isinstance(has_magnet, ImportError):
-        has_magnet = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use HoleM50 method has_magnet: " + str(has_magnet))
-            )
-        )
-    else:
-        has_magnet = has_magnet
-    # cf Methods.Slot.HoleM50.plot_schematics
-    if isinstance(plot_schematics, ImportError):
-        plot_schematics = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM50 method plot_schematics: " + str(plot_schematics)
-                )
-            )
-        )
-    else:
-        plot_schematics = plot_schematics
-    # cf Methods.Slot.HoleM50.remove_magnet
-    if isinstance(remove_magnet, ImportError):
-        remove_magnet = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleM50 method remove_magnet: " + str(remove_magnet)
-                )
-            )
-        )
-    else:
-        remove_magnet = remove_magnet
+    # Methods imported on first use to remove unnecessary dependencies
+    _comp_point_coordinate = LazyMethod(
+        __package__, "..Methods.Slot.HoleM50._comp_point_coordinate"
+    )
+    build_geometry = LazyMethod(__package__, "..Methods.Slot.HoleM50.build_geometry")
+    check = LazyMethod(__package__, "..Methods.Slot.HoleM50.check")
+    comp_alpha = LazyMethod(__package__, "..Methods.Slot.HoleM50.comp_alpha")
+    comp_magnetization_dict = LazyMethod(
+        __package__, "..Methods.Slot.HoleM50.comp_magnetization_dict"
+    )
+    comp_radius = LazyMethod(__package__, "..Methods.Slot.HoleM50.comp_radius")
+    comp_surface_magnet_id = LazyMethod(
+        __package__, "..Methods.Slot.HoleM50.comp_surface_magnet_id"
+    )
+    comp_W5 = LazyMethod(__package__, "..Methods.Slot.HoleM50.comp_W5")
+    has_magnet = LazyMethod(__package__, "..Methods.Slot.HoleM50.has_magnet")
+    plot_schematics = LazyMethod(__package__, "..Methods.Slot.HoleM50.plot_schematics")
+    remove_magnet = LazyMethod(__package__, "..Methods.Slot.HoleM50.remove_magnet")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,69 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .HoleMag import HoleMag
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Slot.HoleMLSRPM._comp_point_coordinate import _comp_point_coordinate
-except ImportError as error:
-    _comp_point_coordinate = error
-
-try:
-    from ..Methods.Slot.HoleMLSRPM.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from ..Methods.Slot.HoleMLSRPM.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Slot.HoleMLSRPM.comp_magnetization_dict import (
-        comp_magnetization_dict,
-    )
-except ImportError as error:
-    comp_magnetization_dict = error
-
-try:
-    from ..Methods.Slot.HoleMLSRPM.comp_mass_magnet import comp_mass_magnet
-except ImportError as error:
-    comp_mass_magnet = error
-
-try:
-    from ..Methods.Slot.HoleMLSRPM.comp_surface_magnet import comp_surface_magnet
-except ImportError as error:
-    comp_surface_magnet = error
-
-try:
-    from ..Methods.Slot.HoleMLSRPM.comp_volume_magnet import comp_volume_magnet
-except ImportError as error:
-    comp_volume_magnet = error
-
-try:
-    from ..Methods.Slot.HoleMLSRPM.plot_schematics import plot_schematics
-except ImportError as error:
-    plot_schematics = error
-
-try:
-    from ..Methods.Slot.HoleMLSRPM.remove_magnet import remove_magnet
-except ImportError as error:
-    remove_magnet = error
-
-try:
-    from ..Methods.Slot.HoleMLSRPM.has_magnet import has_magnet
-except ImportError as error:
-    has_magnet = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -80,121 +26,29 @@ class HoleMLSRPM(HoleMag):
     VERSION = 1
     IS_SYMMETRICAL = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Slot.HoleMLSRPM._comp_point_coordinate
-    if isinstance(_comp_point_coordinate, ImportError):
-        _comp_point_coordinate = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleMLSRPM method _comp_point_coordinate: "
-                    + str(_comp_point_coordinate)
-                )
-            )
-        )
-    else:
-        _comp_point_coordinate = _comp_point_coordinate
-    # cf Methods.Slot.HoleMLSRPM.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleMLSRPM method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
-    # cf Methods.Slot.HoleMLSRPM.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use HoleMLSRPM method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Slot.HoleMLSRPM.comp_magnetization_dict
-    if isinstance(comp_magnetization_dict, ImportError):
-        comp_magnetization_dict = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleMLSRPM method comp_magnetization_dict: "
-                    + str(comp_magnetization_dict)
-                )
-            )
-        )
-    else:
-        comp_magnetization_dict = comp_magnetization_dict
-    # cf Methods.Slot.HoleMLSRPM.comp_mass_magnet
-    if isinstance(comp_mass_magnet, ImportError):
-        comp_mass_magnet = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleMLSRPM method comp_mass_magnet: "
-                    + str(comp_mass_magnet)
-                )
-            )
-        )
-    else:
-        comp_mass_magnet = comp_mass_magnet
-    # cf Methods.Slot.HoleMLSRPM.comp_surface_magnet
-    if isinstance(comp_surface_magnet, ImportError):
-        comp_surface_magnet = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleMLSRPM method comp_surface_magnet: "
-                    + str(comp_surface_magnet)
-                )
-            )
-        )
-    else:
-        comp_surface_magnet = comp_surface_magnet
-    # cf Methods.Slot.HoleMLSRPM.comp_volume_magnet
-    if isinstance(comp_volume_magnet, ImportError):
-        comp_volume_magnet = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleMLSRPM method comp_volume_magnet: "
-                    + str(comp_volume_magnet)
-                )
-            )
-        )
-    else:
-        comp_volume_magnet = comp_volume_magnet
-    # cf Methods.Slot.HoleMLSRPM.plot_schematics
-    if isinstance(plot_schematics, ImportError):
-        plot_schematics = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleMLSRPM method plot_schematics: "
-                    + str(plot_schematics)
-                )
-            )
-        )
-    else:
-        plot_schematics = plot_schematics
-    # cf Methods.Slot.HoleMLSRPM.remove_magnet
-    if isinstance(remove_magnet, ImportError):
-        remove_magnet = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleMLSRPM method remove_magnet: " + str(remove_magnet)
-                )
-            )
-        )
-    else:
-        remove_magnet = remove_magnet
-    # cf Methods.Slot.HoleMLSRPM.has_magnet
-    if isinstance(has_magnet, ImportError):
-        has_magnet = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleMLSRPM method has_magnet: " + str(has_magnet)
-                )
-            )
-        )
-    else:
-        has_magnet = has_magnet
+    # Methods imported on first use to remove unnecessary dependencies
+    _comp_point_coordinate = LazyMethod(
+        __package__, "..Methods.Slot.HoleMLSRPM._comp_point_coordinate"
+    )
+    build_geometry = LazyMethod(__package__, "..Methods.Slot.HoleMLSRPM.build_geometry")
+    check = LazyMethod(__package__, "..Methods.Slot.HoleMLSRPM.check")
+    comp_magnetization_dict = LazyMethod(
+        __package__, "..Methods.Slot.HoleMLSRPM.comp_magnetization_dict"
+    )
+    comp_mass_magnet = LazyMethod(
+        __package__, "..Methods.Slot.HoleMLSRPM.comp_mass_magnet"
+    )
+    comp_surface_magnet = LazyMethod(
+        __package__, "..Methods.Slot.HoleMLSRPM.comp_surface_magnet"
+    )
+    comp_volume_magnet = LazyMethod(
+        __package__, "..Methods.Slot.HoleMLSRPM.comp_volume_magnet"
+    )
+    plot_schematics = LazyMethod(
+        __package__, "..Methods.Slot.HoleMLSRPM.plot_schematics"
+    )
+    remove_magnet = LazyMethod(__package__, "..Methods.Slot.HoleMLSRPM.remove_magnet")
+    has_magnet = LazyMethod(__package__, "..Methods.Slot.HoleMLSRPM.has_magnet")
     # save and copy methods are available in all object
     save = save
     copy = copy
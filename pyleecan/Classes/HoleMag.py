@@ -7,47 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Hole import Hole
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Slot.HoleMag.comp_mass_magnet_id import comp_mass_magnet_id
-except ImportError as error:
-    comp_mass_magnet_id = error
-
-try:
-    from ..Methods.Slot.HoleMag.comp_mass_magnets import comp_mass_magnets
-except ImportError as error:
-    comp_mass_magnets = error
-
-try:
-    from ..Methods.Slot.HoleMag.comp_surface_magnets import comp_surface_magnets
-except ImportError as error:
-    comp_surface_magnets = error
-
-try:
-    from ..Methods.Slot.HoleMag.comp_volume_magnets import comp_volume_magnets
-except ImportError as error:
-    comp_volume_magnets = error
-
-try:
-    from ..Methods.Slot.HoleMag.get_magnet_list import get_magnet_list
-except ImportError as error:
-    get_magnet_list = error
-
-try:
-    from ..Methods.Slot.HoleMag.has_magnet import has_magnet
-except ImportError as error:
-    has_magnet = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -57,75 +25,21 @@ class HoleMag(Hole):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Slot.HoleMag.comp_mass_magnet_id
-    if isinstance(comp_mass_magnet_id, ImportError):
-        comp_mass_magnet_id = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleMag method comp_mass_magnet_id: "
-                    + str(comp_mass_magnet_id)
-                )
-            )
-        )
-    else:
-        comp_mass_magnet_id = comp_mass_magnet_id
-    # cf Methods.Slot.HoleMag.comp_mass_magnets
-    if isinstance(comp_mass_magnets, ImportError):
-        comp_mass_magnets = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleMag method comp_mass_magnets: "
-                    + str(comp_mass_magnets)
-                )
-            )
-        )
-    else:
-        comp_mass_magnets = comp_mass_magnets
-    # cf Methods.Slot.HoleMag.comp_surface_magnets
-    if isinstance(comp_surface_magnets, ImportError):
-        comp_surface_magnets = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleMag method comp_surface_magnets: "
-                    + str(comp_surface_magnets)
-                )
-            )
-        )
-    else:
-        comp_surface_magnets = comp_surface_magnets
-    # cf Methods.Slot.HoleMag.comp_volume_magnets
-    if isinstance(comp_volume_magnets, ImportError):
-        comp_volume_magnets = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleMag method comp_volume_magnets: "
-                    + str(comp_volume_magnets)
-                )
-            )
-        )
-    else:
-        comp_volume_magnets = comp_volume_magnets
-    # cf Methods.Slot.HoleMag.get_magnet_list
-    if isinstance(get_magnet_list, ImportError):
-        get_magnet_list = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use HoleMag method get_magnet_list: " + str(get_magnet_list)
-                )
-            )
-        )
-    else:
-        get_magnet_list = get_magnet_list
-    # cf Methods.Slot.HoleMag.has_magnet
-    if isinstance(has_magnet, ImportError):
-        has_magnet = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use HoleMag method has_magnet: " + str(has_magnet))
-            )
-        )
-    else:
-        has_magnet = has_magnet
+    # Methods imported on first use to remove unnecessary dependencies
+    comp_mass_magnet_id = LazyMethod(
+        __package__, "..Methods.Slot.HoleMag.comp_mass_magnet_id"
+    )
+    comp_mass_magnets = LazyMethod(
+        __package__, "..Methods.Slot.HoleMag.comp_mass_magnets"
+    )
+    comp_surface_magnets = LazyMethod(
+        __package__, "..Methods.Slot.HoleMag.comp_surface_magnets"
+    )
+    comp_volume_magnets = LazyMethod(
+        __package__, "..Methods.Slot.HoleMag.comp_volume_magnets"
+    )
+    get_magnet_list = LazyMethod(__package__, "..Methods.Slot.HoleMag.get_magnet_list")
+    has_magnet = LazyMethod(__package__, "..Methods.Slot.HoleMag.has_magnet")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,27 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .ImportMatrix import ImportMatrix
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Import.ImportGenMatrixSin.get_data import get_data
-except ImportError as error:
-    get_data = error
-
-try:
-    from ..Methods.Import.ImportGenMatrixSin.init_vector import init_vector
-except ImportError as error:
-    init_vector = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -37,30 +25,11 @@ class ImportGenMatrixSin(ImportMatrix):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Import.ImportGenMatrixSin.get_data
-    if isinstance(get_data, ImportError):
-        get_data = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ImportGenMatrixSin method get_data: " + str(get_data)
-                )
-            )
-        )
-    else:
-        get_data = get_data
-    # cf Methods.Import.ImportGenMatrixSin.init_vector
-    if isinstance(init_vector, ImportError):
-        init_vector = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ImportGenMatrixSin method init_vector: "
-                    + str(init_vector)
-                )
-            )
-        )
-    else:
-        init_vector = init_vector
+    # Methods imported on first use to remove unnecessary dependencies
+    get_data = LazyMethod(__package__, "..Methods.Import.ImportGenMatrixSin.get_data")
+    init_vector = LazyMethod(
+        __package__, "..Methods.Import.ImportGenMatrixSin.init_vector"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
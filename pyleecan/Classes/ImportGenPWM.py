@@ -7,37 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .ImportMatrix import ImportMatrix
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Import.ImportGenPWM.get_data import get_data
-except ImportError as error:
-    get_data = error
-
-try:
-    from ..Methods.Import.ImportGenPWM.comp_voltage import comp_voltage
-except ImportError as error:
-    comp_voltage = error
-
-try:
-    from ..Methods.Import.ImportGenPWM.get_modulation_index import get_modulation_index
-except ImportError as error:
-    get_modulation_index = error
-
-try:
-    from ..Methods.Import.ImportGenPWM.comp_carrier import comp_carrier
-except ImportError as error:
-    comp_carrier = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -47,50 +25,13 @@ class ImportGenPWM(ImportMatrix):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Import.ImportGenPWM.get_data
-    if isinstance(get_data, ImportError):
-        get_data = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use ImportGenPWM method get_data: " + str(get_data))
-            )
-        )
-    else:
-        get_data = get_data
-    # cf Methods.Import.ImportGenPWM.comp_voltage
-    if isinstance(comp_voltage, ImportError):
-        comp_voltage = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ImportGenPWM method comp_voltage: " + str(comp_voltage)
-                )
-            )
-        )
-    else:
-        comp_voltage = comp_voltage
-    # cf Methods.Import.ImportGenPWM.get_modulation_index
-    if isinstance(get_modulation_index, ImportError):
-        get_modulation_index = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ImportGenPWM method get_modulation_index: "
-                    + str(get_modulation_index)
-                )
-            )
-        )
-    else:
-        get_modulation_index = get_modulation_index
-    # cf Methods.Import.ImportGenPWM.comp_carrier
-    if isinstance(comp_carrier, ImportError):
-        comp_carrier = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ImportGenPWM method comp_carrier: " + str(comp_carrier)
-                )
-            )
-        )
-    else:
-        comp_carrier = comp_carrier
+    # Methods imported on first use to remove unnecessary dependencies
+    get_data = LazyMethod(__package__, "..Methods.Import.ImportGenPWM.get_data")
+    comp_voltage = LazyMethod(__package__, "..Methods.Import.ImportGenPWM.comp_voltage")
+    get_modulation_index = LazyMethod(
+        __package__, "..Methods.Import.ImportGenPWM.get_modulation_index"
+    )
+    comp_carrier = LazyMethod(__package__, "..Methods.Import.ImportGenPWM.comp_carrier")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,32 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .ImportMatrix import ImportMatrix
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Import.ImportGenVectLin.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Import.ImportGenVectLin.comp_step import comp_step
-except ImportError as error:
-    comp_step = error
-
-try:
-    from ..Methods.Import.ImportGenVectLin.get_data import get_data
-except ImportError as error:
-    get_data = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -42,38 +25,10 @@ class ImportGenVectLin(ImportMatrix):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Import.ImportGenVectLin.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use ImportGenVectLin method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Import.ImportGenVectLin.comp_step
-    if isinstance(comp_step, ImportError):
-        comp_step = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ImportGenVectLin method comp_step: " + str(comp_step)
-                )
-            )
-        )
-    else:
-        comp_step = comp_step
-    # cf Methods.Import.ImportGenVectLin.get_data
-    if isinstance(get_data, ImportError):
-        get_data = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ImportGenVectLin method get_data: " + str(get_data)
-                )
-            )
-        )
-    else:
-        get_data = get_data
+    # Methods imported on first use to remove unnecessary dependencies
+    check = LazyMethod(__package__, "..Methods.Import.ImportGenVectLin.check")
+    comp_step = LazyMethod(__package__, "..Methods.Import.ImportGenVectLin.comp_step")
+    get_data = LazyMethod(__package__, "..Methods.Import.ImportGenVectLin.get_data")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,22 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Import import Import
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Import.ImportMatrix.edit_matrix import edit_matrix
-except ImportError as error:
-    edit_matrix = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -32,17 +25,8 @@ class ImportMatrix(Import):
 
     VERSION = 1
 
-    # cf Methods.Import.ImportMatrix.edit_matrix
-    if isinstance(edit_matrix, ImportError):
-        edit_matrix = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ImportMatrix method edit_matrix: " + str(edit_matrix)
-                )
-            )
-        )
-    else:
-        edit_matrix = edit_matrix
+    # Methods imported on first use to remove unnecessary dependencies
+    edit_matrix = LazyMethod(__package__, "..Methods.Import.ImportMatrix.edit_matrix")
     # save and copy methods are available in all object
     save = save
     copy = copy
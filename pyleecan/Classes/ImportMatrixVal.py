@@ -7,22 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import set_array, check_var, raise_
+from ._check import set_array, check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyArray, LazyMethod
 from .ImportMatrix import ImportMatrix
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Import.ImportMatrixVal.get_data import get_data
-except ImportError as error:
-    get_data = error
-
-
 from numpy import array, array_equal
 from numpy import isnan
 from ._check import InitUnKnowClassError
@@ -33,17 +26,8 @@ class ImportMatrixVal(ImportMatrix):
 
     VERSION = 1
 
-    # cf Methods.Import.ImportMatrixVal.get_data
-    if isinstance(get_data, ImportError):
-        get_data = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ImportMatrixVal method get_data: " + str(get_data)
-                )
-            )
-        )
-    else:
-        get_data = get_data
+    # Methods imported on first use to remove unnecessary dependencies
+    get_data = LazyMethod(__package__, "..Methods.Import.ImportMatrixVal.get_data")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -180,6 +164,8 @@ class ImportMatrixVal(ImportMatrix):
 
     def _get_value(self):
         """getter of value"""
+        if isinstance(self._value, LazyArray):
+            self._value = self._value.read()
         return self._value
 
     def _set_value(self, value):
@@ -7,37 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.Input.comp_axes import comp_axes
-except ImportError as error:
-    comp_axes = error
-
-try:
-    from ..Methods.Simulation.Input.comp_axis_time import comp_axis_time
-except ImportError as error:
-    comp_axis_time = error
-
-try:
-    from ..Methods.Simulation.Input.comp_axis_angle import comp_axis_angle
-except ImportError as error:
-    comp_axis_angle = error
-
-try:
-    from ..Methods.Simulation.Input.comp_axis_phase import comp_axis_phase
-except ImportError as error:
-    comp_axis_phase = error
-
-
 from ..Classes.ImportMatrixVal import ImportMatrixVal
 from numpy import ndarray
 from numpy import array, array_equal
@@ -50,49 +28,17 @@ class Input(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.Input.comp_axes
-    if isinstance(comp_axes, ImportError):
-        comp_axes = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Input method comp_axes: " + str(comp_axes))
-            )
-        )
-    else:
-        comp_axes = comp_axes
-    # cf Methods.Simulation.Input.comp_axis_time
-    if isinstance(comp_axis_time, ImportError):
-        comp_axis_time = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Input method comp_axis_time: " + str(comp_axis_time)
-                )
-            )
-        )
-    else:
-        comp_axis_time = comp_axis_time
-    # cf Methods.Simulation.Input.comp_axis_angle
-    if isinstance(comp_axis_angle, ImportError):
-        comp_axis_angle = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Input method comp_axis_angle: " + str(comp_axis_angle)
-                )
-            )
-        )
-    else:
-        comp_axis_angle = comp_axis_angle
-    # cf Methods.Simulation.Input.comp_axis_phase
-    if isinstance(comp_axis_phase, ImportError):
-        comp_axis_phase = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Input method comp_axis_phase: " + str(comp_axis_phase)
-                )
-            )
-        )
-    else:
-        comp_axis_phase = comp_axis_phase
+    # Methods imported on first use to remove unnecessary dependencies
+    comp_axes = LazyMethod(__package__, "..Methods.Simulation.Input.comp_axes")
+    comp_axis_time = LazyMethod(
+        __package__, "..Methods.Simulation.Input.comp_axis_time"
+    )
+    comp_axis_angle = LazyMethod(
+        __package__, "..Methods.Simulation.Input.comp_axis_angle"
+    )
+    comp_axis_phase = LazyMethod(
+        __package__, "..Methods.Simulation.Input.comp_axis_phase"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
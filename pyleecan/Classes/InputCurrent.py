@@ -7,32 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .InputVoltage import InputVoltage
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.InputCurrent.gen_input import gen_input
-except ImportError as error:
-    gen_input = error
-
-try:
-    from ..Methods.Simulation.InputCurrent.set_Id_Iq import set_Id_Iq
-except ImportError as error:
-    set_Id_Iq = error
-
-try:
-    from ..Methods.Simulation.InputCurrent.set_OP_from_array import set_OP_from_array
-except ImportError as error:
-    set_OP_from_array = error
-
-
 from ..Classes.ImportMatrixVal import ImportMatrixVal
 from numpy import ndarray
 from numpy import array, array_equal
@@ -45,41 +28,12 @@ class InputCurrent(InputVoltage):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.InputCurrent.gen_input
-    if isinstance(gen_input, ImportError):
-        gen_input = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use InputCurrent method gen_input: " + str(gen_input)
-                )
-            )
-        )
-    else:
-        gen_input = gen_input
-    # cf Methods.Simulation.InputCurrent.set_Id_Iq
-    if isinstance(set_Id_Iq, ImportError):
-        set_Id_Iq = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use InputCurrent method set_Id_Iq: " + str(set_Id_Iq)
-                )
-            )
-        )
-    else:
-        set_Id_Iq = set_Id_Iq
-    # cf Methods.Simulation.InputCurrent.set_OP_from_array
-    if isinstance(set_OP_from_array, ImportError):
-        set_OP_from_array = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use InputCurrent method set_OP_from_array: "
-                    + str(set_OP_from_array)
-                )
-            )
-        )
-    else:
-        set_OP_from_array = set_OP_from_array
+    # Methods imported on first use to remove unnecessary dependencies
+    gen_input = LazyMethod(__package__, "..Methods.Simulation.InputCurrent.gen_input")
+    set_Id_Iq = LazyMethod(__package__, "..Methods.Simulation.InputCurrent.set_Id_Iq")
+    set_OP_from_array = LazyMethod(
+        __package__, "..Methods.Simulation.InputCurrent.set_OP_from_array"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,22 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import set_array, check_var, raise_
+from ._check import set_array, check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyArray, LazyMethod
 from .InputCurrent import InputCurrent
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.InputFlux.gen_input import gen_input
-except ImportError as error:
-    gen_input = error
-
-
 from ..Classes.ImportMatrixVal import ImportMatrixVal
 from numpy import ndarray
 from numpy import array, array_equal
@@ -35,15 +28,8 @@ class InputFlux(InputCurrent):
 
     VERSION = 1
 
-    # cf Methods.Simulation.InputFlux.gen_input
-    if isinstance(gen_input, ImportError):
-        gen_input = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use InputFlux method gen_input: " + str(gen_input))
-            )
-        )
-    else:
-        gen_input = gen_input
+    # Methods imported on first use to remove unnecessary dependencies
+    gen_input = LazyMethod(__package__, "..Methods.Simulation.InputFlux.gen_input")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -520,6 +506,8 @@ class InputFlux(InputCurrent):
 
     def _get_slice(self):
         """getter of slice"""
+        if isinstance(self._slice, LazyArray):
+            self._slice = self._slice.read()
         return self._slice
 
     def _set_slice(self, value):
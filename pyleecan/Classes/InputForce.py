@@ -7,22 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Input import Input
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.InputForce.gen_input import gen_input
-except ImportError as error:
-    gen_input = error
-
-
 from ..Classes.ImportMatrixVal import ImportMatrixVal
 from numpy import ndarray
 from numpy import array, array_equal
@@ -35,15 +28,8 @@ class InputForce(Input):
 
     VERSION = 1
 
-    # cf Methods.Simulation.InputForce.gen_input
-    if isinstance(gen_input, ImportError):
-        gen_input = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use InputForce method gen_input: " + str(gen_input))
-            )
-        )
-    else:
-        gen_input = gen_input
+    # Methods imported on first use to remove unnecessary dependencies
+    gen_input = LazyMethod(__package__, "..Methods.Simulation.InputForce.gen_input")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,32 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Input import Input
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.InputVoltage.gen_input import gen_input
-except ImportError as error:
-    gen_input = error
-
-try:
-    from ..Methods.Simulation.InputVoltage.set_OP_from_array import set_OP_from_array
-except ImportError as error:
-    set_OP_from_array = error
-
-try:
-    from ..Methods.Simulation.InputVoltage.set_Ud_Uq import set_Ud_Uq
-except ImportError as error:
-    set_Ud_Uq = error
-
-
 from ..Classes.ImportMatrixVal import ImportMatrixVal
 from numpy import ndarray
 from numpy import array, array_equal
@@ -45,41 +28,12 @@ class InputVoltage(Input):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.InputVoltage.gen_input
-    if isinstance(gen_input, ImportError):
-        gen_input = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use InputVoltage method gen_input: " + str(gen_input)
-                )
-            )
-        )
-    else:
-        gen_input = gen_input
-    # cf Methods.Simulation.InputVoltage.set_OP_from_array
-    if isinstance(set_OP_from_array, ImportError):
-        set_OP_from_array = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use InputVoltage method set_OP_from_array: "
-                    + str(set_OP_from_array)
-                )
-            )
-        )
-    else:
-        set_OP_from_array = set_OP_from_array
-    # cf Methods.Simulation.InputVoltage.set_Ud_Uq
-    if isinstance(set_Ud_Uq, ImportError):
-        set_Ud_Uq = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use InputVoltage method set_Ud_Uq: " + str(set_Ud_Uq)
-                )
-            )
-        )
-    else:
-        set_Ud_Uq = set_Ud_Uq
+    # Methods imported on first use to remove unnecessary dependencies
+    gen_input = LazyMethod(__package__, "..Methods.Simulation.InputVoltage.gen_input")
+    set_OP_from_array = LazyMethod(
+        __package__, "..Methods.Simulation.InputVoltage.set_OP_from_array"
+    )
+    set_Ud_Uq = LazyMethod(__package__, "..Methods.Simulation.InputVoltage.set_Ud_Uq")
     # save and copy methods are available in all object
     save = save
     copy = copy
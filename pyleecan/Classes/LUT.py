@@ -7,37 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .XOutput import XOutput
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Output.LUT.get_eec import get_eec
-except ImportError as error:
-    get_eec = error
-
-try:
-    from ..Methods.Output.LUT.get_OP_matrix import get_OP_matrix
-except ImportError as error:
-    get_OP_matrix = error
-
-try:
-    from ..Methods.Output.LUT.set_default_simulation import set_default_simulation
-except ImportError as error:
-    set_default_simulation = error
-
-try:
-    from ..Methods.Output.LUT.get_phase_dir import get_phase_dir
-except ImportError as error:
-    get_phase_dir = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -47,46 +25,13 @@ class LUT(XOutput):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Output.LUT.get_eec
-    if isinstance(get_eec, ImportError):
-        get_eec = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LUT method get_eec: " + str(get_eec))
-            )
-        )
-    else:
-        get_eec = get_eec
-    # cf Methods.Output.LUT.get_OP_matrix
-    if isinstance(get_OP_matrix, ImportError):
-        get_OP_matrix = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LUT method get_OP_matrix: " + str(get_OP_matrix))
-            )
-        )
-    else:
-        get_OP_matrix = get_OP_matrix
-    # cf Methods.Output.LUT.set_default_simulation
-    if isinstance(set_default_simulation, ImportError):
-        set_default_simulation = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LUT method set_default_simulation: "
-                    + str(set_default_simulation)
-                )
-            )
-        )
-    else:
-        set_default_simulation = set_default_simulation
-    # cf Methods.Output.LUT.get_phase_dir
-    if isinstance(get_phase_dir, ImportError):
-        get_phase_dir = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LUT method get_phase_dir: " + str(get_phase_dir))
-            )
-        )
-    else:
-        get_phase_dir = get_phase_dir
+    # Methods imported on first use to remove unnecessary dependencies
+    get_eec = LazyMethod(__package__, "..Methods.Output.LUT.get_eec")
+    get_OP_matrix = LazyMethod(__package__, "..Methods.Output.LUT.get_OP_matrix")
+    set_default_simulation = LazyMethod(
+        __package__, "..Methods.Output.LUT.set_default_simulation"
+    )
+    get_phase_dir = LazyMethod(__package__, "..Methods.Output.LUT.get_phase_dir")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,57 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import set_array, check_var, raise_
+from ._check import set_array, check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyArray, LazyMethod
 from .LUT import LUT
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Output.LUTdq.get_L_dqh import get_L_dqh
-except ImportError as error:
-    get_L_dqh = error
-
-try:
-    from ..Methods.Output.LUTdq.get_Lm_dqh import get_Lm_dqh
-except ImportError as error:
-    get_Lm_dqh = error
-
-try:
-    from ..Methods.Output.LUTdq.get_Phi_dqh_mean import get_Phi_dqh_mean
-except ImportError as error:
-    get_Phi_dqh_mean = error
-
-try:
-    from ..Methods.Output.LUTdq.get_Phi_dqh_mag import get_Phi_dqh_mag
-except ImportError as error:
-    get_Phi_dqh_mag = error
-
-try:
-    from ..Methods.Output.LUTdq.get_Phi_dqh_mag_mean import get_Phi_dqh_mag_mean
-except ImportError as error:
-    get_Phi_dqh_mag_mean = error
-
-try:
-    from ..Methods.Output.LUTdq.interp_Phi_dqh import interp_Phi_dqh
-except ImportError as error:
-    interp_Phi_dqh = error
-
-try:
-    from ..Methods.Output.LUTdq.interp_Ploss_dqh import interp_Ploss_dqh
-except ImportError as error:
-    interp_Ploss_dqh = error
-
-try:
-    from ..Methods.Output.LUTdq.interp_Tem_rip_dqh import interp_Tem_rip_dqh
-except ImportError as error:
-    interp_Tem_rip_dqh = error
-
-
 from numpy import array, array_equal
 from numpy import isnan
 from ._check import InitUnKnowClassError
@@ -68,93 +26,32 @@ class LUTdq(LUT):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Output.LUTdq.get_L_dqh
-    if isinstance(get_L_dqh, ImportError):
-        get_L_dqh = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LUTdq method get_L_dqh: " + str(get_L_dqh))
-            )
-        )
-    else:
-        get_L_dqh = get_L_dqh
-    # cf Methods.Output.LUTdq.get_Lm_dqh
-    if isinstance(get_Lm_dqh, ImportError):
-        get_Lm_dqh = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LUTdq method get_Lm_dqh: " + str(get_Lm_dqh))
-            )
-        )
-    else:
-        get_Lm_dqh = get_Lm_dqh
-    # cf Methods.Output.LUTdq.get_Phi_dqh_mean
-    if isinstance(get_Phi_dqh_mean, ImportError):
-        get_Phi_dqh_mean = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LUTdq method get_Phi_dqh_mean: " + str(get_Phi_dqh_mean)
-                )
-            )
-        )
-    else:
-        get_Phi_dqh_mean = get_Phi_dqh_mean
-    # cf Methods.Output.LUTdq.get_Phi_dqh_mag
-    if isinstance(get_Phi_dqh_mag, ImportError):
-        get_Phi_dqh_mag = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LUTdq method get_Phi_dqh_mag: " + str(get_Phi_dqh_mag)
-                )
-            )
-        )
-    else:
-        get_Phi_dqh_mag = get_Phi_dqh_mag
-    # cf Methods.Output.LUTdq.get_Phi_dqh_mag_mean
-    if isinstance(get_Phi_dqh_mag_mean, ImportError):
-        get_Phi_dqh_mag_mean = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LUTdq method get_Phi_dqh_mag_mean: "
-                    + str(get_Phi_dqh_mag_mean)
-                )
-            )
-        )
-    else:
-        get_Phi_dqh_mag_mean = get_Phi_dqh_mag_mean
-    # cf Methods.Output.LUTdq.interp_Phi_dqh
-    if isinstance(interp_Phi_dqh, ImportError):
-        interp_Phi_dqh = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LUTdq method interp_Phi_dqh: " + str(interp_Phi_dqh)
-                )
-            )
-        )
-    else:
-        interp_Phi_dqh = interp_Phi_dqh
-    # cf Methods.Output.LUTdq.interp_Ploss_dqh
-    if isinstance(interp_Ploss_dqh, ImportError):
-        interp_Ploss_dqh = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LUTdq method interp_Ploss_dqh: " + str(interp_Ploss_dqh)
-                )
-            )
-        )
-    else:
-        interp_Ploss_dqh = interp_Ploss_dqh
-    # cf Methods.Output.LUTdq.interp_Tem_rip_dqh
-    if isinstance(interp_Tem_rip_dqh, ImportError):
-        interp_Tem_rip_dqh = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LUTdq method interp_Tem_rip_dqh: "
-                    + str(interp_Tem_rip_dqh)
-                )
-            )
-        )
-    else:
-        interp_Tem_rip_dqh = interp_Tem_rip_dqh
+    # Methods imported on first use to remove unnecessary dependencies
+    get_L_dqh = LazyMethod(__package__, "..Methods.Output.LUTdq.get_L_dqh")
+    get_Lm_dqh = LazyMethod(__package__, "..Methods.Output.LUTdq.get_Lm_dqh")
+    get_Phi_dqh_mean = LazyMethod(
+        __package__, "..Methods.Output.LUTdq.get_Phi_dqh_mean"
+    )
+    get_Phi_dqh_mag = LazyMethod(__package__, "..Methods.Output.LUTdq.get_Phi_dqh_mag")
+    get_Phi_dqh_mag_mean = LazyMethod(
+        __package__, "..Methods.Output.LUTdq.get_Phi_dqh_mag_mean"
+    )
+    interp_Phi_dqh = LazyMethod(__package__, "..Methods.Output.LUTdq.interp_Phi_dqh")
+    interp_Ploss_dqh = LazyMethod(
+        __package__, "..Methods.Output.LUTdq.interp_Ploss_dqh"
+    )
+    interp_Tem_rip_dqh = LazyMethod(
+        __package__, "..Methods.Output.LUTdq.interp_Tem_rip_dqh"
+    )
+    get_interp_cache = LazyMethod(
+        __package__, "..Methods.Output.LUTdq.get_interp_cache"
+    )
+    get_interp_grid = LazyMethod(__package__, "..Methods.Output.LUTdq.get_interp_grid")
+    comp_interp = LazyMethod(__package__, "..Methods.Output.LUTdq.comp_interp")
+    comp_Ploss_dqh = LazyMethod(__package__, "..Methods.Output.LUTdq.comp_Ploss_dqh")
+    interp_Ploss_dqh_vect = LazyMethod(
+        __package__, "..Methods.Output.LUTdq.interp_Ploss_dqh_vect"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -389,6 +286,8 @@ class LUTdq(LUT):
 
     def _get_Phi_dqh_mean(self):
         """getter of Phi_dqh_mean"""
+        if isinstance(self._Phi_dqh_mean, LazyArray):
+            self._Phi_dqh_mean = self._Phi_dqh_mean.read()
         return self._Phi_dqh_mean
 
     def _set_Phi_dqh_mean(self, value):
@@ -7,77 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Lamination import Lamination
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.LamHole.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from ..Methods.Machine.LamHole.comp_height_yoke import comp_height_yoke
-except ImportError as error:
-    comp_height_yoke = error
-
-try:
-    from ..Methods.Machine.LamHole.comp_masses import comp_masses
-except ImportError as error:
-    comp_masses = error
-
-try:
-    from ..Methods.Machine.LamHole.comp_surfaces import comp_surfaces
-except ImportError as error:
-    comp_surfaces = error
-
-try:
-    from ..Methods.Machine.LamHole.comp_volumes import comp_volumes
-except ImportError as error:
-    comp_volumes = error
-
-try:
-    from ..Methods.Machine.LamHole.get_pole_pair_number import get_pole_pair_number
-except ImportError as error:
-    get_pole_pair_number = error
-
-try:
-    from ..Methods.Machine.LamHole.plot import plot
-except ImportError as error:
-    plot = error
-
-try:
-    from ..Methods.Machine.LamHole.comp_radius_mid_yoke import comp_radius_mid_yoke
-except ImportError as error:
-    comp_radius_mid_yoke = error
-
-try:
-    from ..Methods.Machine.LamHole.has_magnet import has_magnet
-except ImportError as error:
-    has_magnet = error
-
-try:
-    from ..Methods.Machine.LamHole.comp_angle_d_axis import comp_angle_d_axis
-except ImportError as error:
-    comp_angle_d_axis = error
-
-try:
-    from ..Methods.Machine.LamHole.set_pole_pair_number import set_pole_pair_number
-except ImportError as error:
-    set_pole_pair_number = error
-
-try:
-    from ..Methods.Machine.LamHole.get_Zs import get_Zs
-except ImportError as error:
-    get_Zs = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -87,136 +25,29 @@ class LamHole(Lamination):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.LamHole.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamHole method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
-    # cf Methods.Machine.LamHole.comp_height_yoke
-    if isinstance(comp_height_yoke, ImportError):
-        comp_height_yoke = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamHole method comp_height_yoke: "
-                    + str(comp_height_yoke)
-                )
-            )
-        )
-    else:
-        comp_height_yoke = comp_height_yoke
-    # cf Methods.Machine.LamHole.comp_masses
-    if isinstance(comp_masses, ImportError):
-        comp_masses = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamHole method comp_masses: " + str(comp_masses))
-            )
-        )
-    else:
-        comp_masses = comp_masses
-    # cf Methods.Machine.LamHole.comp_surfaces
-    if isinstance(comp_surfaces, ImportError):
-        comp_surfaces = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamHole method comp_surfaces: " + str(comp_surfaces)
-                )
-            )
-        )
-    else:
-        comp_surfaces = comp_surfaces
-    # cf Methods.Machine.LamHole.comp_volumes
-    if isinstance(comp_volumes, ImportError):
-        comp_volumes = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamHole method comp_volumes: " + str(comp_volumes)
-                )
-            )
-        )
-    else:
-        comp_volumes = comp_volumes
-    # cf Methods.Machine.LamHole.get_pole_pair_number
-    if isinstance(get_pole_pair_number, ImportError):
-        get_pole_pair_number = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamHole method get_pole_pair_number: "
-                    + str(get_pole_pair_number)
-                )
-            )
-        )
-    else:
-        get_pole_pair_number = get_pole_pair_number
-    # cf Methods.Machine.LamHole.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamHole method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
-    # cf Methods.Machine.LamHole.comp_radius_mid_yoke
-    if isinstance(comp_radius_mid_yoke, ImportError):
-        comp_radius_mid_yoke = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamHole method comp_radius_mid_yoke: "
-                    + str(comp_radius_mid_yoke)
-                )
-            )
-        )
-    else:
-        comp_radius_mid_yoke = comp_radius_mid_yoke
-    # cf Methods.Machine.LamHole.has_magnet
-    if isinstance(has_magnet, ImportError):
-        has_magnet = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamHole method has_magnet: " + str(has_magnet))
-            )
-        )
-    else:
-        has_magnet = has_magnet
-    # cf Methods.Machine.LamHole.comp_angle_d_axis
-    if isinstance(comp_angle_d_axis, ImportError):
-        comp_angle_d_axis = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamHole method comp_angle_d_axis: "
-                    + str(comp_angle_d_axis)
-                )
-            )
-        )
-    else:
-        comp_angle_d_axis = comp_angle_d_axis
-    # cf Methods.Machine.LamHole.set_pole_pair_number
-    if isinstance(set_pole_pair_number, ImportError):
-        set_pole_pair_number = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamHole method set_pole_pair_number: "
-                    + str(set_pole_pair_number)
-                )
-            )
-        )
-    else:
-        set_pole_pair_number = set_pole_pair_number
-    # cf Methods.Machine.LamHole.get_Zs
-    if isinstance(get_Zs, ImportError):
-        get_Zs = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamHole method get_Zs: " + str(get_Zs))
-            )
-        )
-    else:
-        get_Zs = get_Zs
+    # Methods imported on first use to remove unnecessary dependencies
+    build_geometry = LazyMethod(__package__, "..Methods.Machine.LamHole.build_geometry")
+    comp_height_yoke = LazyMethod(
+        __package__, "..Methods.Machine.LamHole.comp_height_yoke"
+    )
+    comp_masses = LazyMethod(__package__, "..Methods.Machine.LamHole.comp_masses")
+    comp_surfaces = LazyMethod(__package__, "..Methods.Machine.LamHole.comp_surfaces")
+    comp_volumes = LazyMethod(__package__, "..Methods.Machine.LamHole.comp_volumes")
+    get_pole_pair_number = LazyMethod(
+        __package__, "..Methods.Machine.LamHole.get_pole_pair_number"
+    )
+    plot = LazyMethod(__package__, "..Methods.Machine.LamHole.plot")
+    comp_radius_mid_yoke = LazyMethod(
+        __package__, "..Methods.Machine.LamHole.comp_radius_mid_yoke"
+    )
+    has_magnet = LazyMethod(__package__, "..Methods.Machine.LamHole.has_magnet")
+    comp_angle_d_axis = LazyMethod(
+        __package__, "..Methods.Machine.LamHole.comp_angle_d_axis"
+    )
+    set_pole_pair_number = LazyMethod(
+        __package__, "..Methods.Machine.LamHole.set_pole_pair_number"
+    )
+    get_Zs = LazyMethod(__package__, "..Methods.Machine.LamHole.get_Zs")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,77 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Lamination import Lamination
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.LamSlot.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Machine.LamSlot.comp_radius_mec import comp_radius_mec
-except ImportError as error:
-    comp_radius_mec = error
-
-try:
-    from ..Methods.Machine.LamSlot.comp_surfaces import comp_surfaces
-except ImportError as error:
-    comp_surfaces = error
-
-try:
-    from ..Methods.Machine.LamSlot.get_pole_pair_number import get_pole_pair_number
-except ImportError as error:
-    get_pole_pair_number = error
-
-try:
-    from ..Methods.Machine.LamSlot.plot import plot
-except ImportError as error:
-    plot = error
-
-try:
-    from ..Methods.Machine.LamSlot.comp_height_yoke import comp_height_yoke
-except ImportError as error:
-    comp_height_yoke = error
-
-try:
-    from ..Methods.Machine.LamSlot.get_Zs import get_Zs
-except ImportError as error:
-    get_Zs = error
-
-try:
-    from ..Methods.Machine.LamSlot.get_bore_desc import get_bore_desc
-except ImportError as error:
-    get_bore_desc = error
-
-try:
-    from ..Methods.Machine.LamSlot.set_pole_pair_number import set_pole_pair_number
-except ImportError as error:
-    set_pole_pair_number = error
-
-try:
-    from ..Methods.Machine.LamSlot.comp_angle_d_axis import comp_angle_d_axis
-except ImportError as error:
-    comp_angle_d_axis = error
-
-try:
-    from ..Methods.Machine.LamSlot.get_surfaces_closing import get_surfaces_closing
-except ImportError as error:
-    get_surfaces_closing = error
-
-try:
-    from ..Methods.Machine.LamSlot.has_magnet import has_magnet
-except ImportError as error:
-    has_magnet = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -87,136 +25,31 @@ class LamSlot(Lamination):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.LamSlot.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSlot method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Machine.LamSlot.comp_radius_mec
-    if isinstance(comp_radius_mec, ImportError):
-        comp_radius_mec = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlot method comp_radius_mec: " + str(comp_radius_mec)
-                )
-            )
-        )
-    else:
-        comp_radius_mec = comp_radius_mec
-    # cf Methods.Machine.LamSlot.comp_surfaces
-    if isinstance(comp_surfaces, ImportError):
-        comp_surfaces = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlot method comp_surfaces: " + str(comp_surfaces)
-                )
-            )
-        )
-    else:
-        comp_surfaces = comp_surfaces
-    # cf Methods.Machine.LamSlot.get_pole_pair_number
-    if isinstance(get_pole_pair_number, ImportError):
-        get_pole_pair_number = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlot method get_pole_pair_number: "
-                    + str(get_pole_pair_number)
-                )
-            )
-        )
-    else:
-        get_pole_pair_number = get_pole_pair_number
-    # cf Methods.Machine.LamSlot.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSlot method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
-    # cf Methods.Machine.LamSlot.comp_height_yoke
-    if isinstance(comp_height_yoke, ImportError):
-        comp_height_yoke = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlot method comp_height_yoke: "
-                    + str(comp_height_yoke)
-                )
-            )
-        )
-    else:
-        comp_height_yoke = comp_height_yoke
-    # cf Methods.Machine.LamSlot.get_Zs
-    if isinstance(get_Zs, ImportError):
-        get_Zs = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSlot method get_Zs: " + str(get_Zs))
-            )
-        )
-    else:
-        get_Zs = get_Zs
-    # cf Methods.Machine.LamSlot.get_bore_desc
-    if isinstance(get_bore_desc, ImportError):
-        get_bore_desc = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlot method get_bore_desc: " + str(get_bore_desc)
-                )
-            )
-        )
-    else:
-        get_bore_desc = get_bore_desc
-    # cf Methods.Machine.LamSlot.set_pole_pair_number
-    if isinstance(set_pole_pair_number, ImportError):
-        set_pole_pair_number = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlot method set_pole_pair_number: "
-                    + str(set_pole_pair_number)
-                )
-            )
-        )
-    else:
-        set_pole_pair_number = set_pole_pair_number
-    # cf Methods.Machine.LamSlot.comp_angle_d_axis
-    if isinstance(comp_angle_d_axis, ImportError):
-        comp_angle_d_axis = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlot method comp_angle_d_axis: "
-                    + str(comp_angle_d_axis)
-                )
-            )
-        )
-    else:
-        comp_angle_d_axis = comp_angle_d_axis
-    # cf Methods.Machine.LamSlot.get_surfaces_closing
-    if isinstance(get_surfaces_closing, ImportError):
-        get_surfaces_closing = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlot method get_surfaces_closing: "
-                    + str(get_surfaces_closing)
-                )
-            )
-        )
-    else:
-        get_surfaces_closing = get_surfaces_closing
-    # cf Methods.Machine.LamSlot.has_magnet
-    if isinstance(has_magnet, ImportError):
-        has_magnet = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSlot method has_magnet: " + str(has_magnet))
-            )
-        )
-    else:
-        has_magnet = has_magnet
+    # Methods imported on first use to remove unnecessary dependencies
+    check = LazyMethod(__package__, "..Methods.Machine.LamSlot.check")
+    comp_radius_mec = LazyMethod(
+        __package__, "..Methods.Machine.LamSlot.comp_radius_mec"
+    )
+    comp_surfaces = LazyMethod(__package__, "..Methods.Machine.LamSlot.comp_surfaces")
+    get_pole_pair_number = LazyMethod(
+        __package__, "..Methods.Machine.LamSlot.get_pole_pair_number"
+    )
+    plot = LazyMethod(__package__, "..Methods.Machine.LamSlot.plot")
+    comp_height_yoke = LazyMethod(
+        __package__, "..Methods.Machine.LamSlot.comp_height_yoke"
+    )
+    get_Zs = LazyMethod(__package__, "..Methods.Machine.LamSlot.get_Zs")
+    get_bore_desc = LazyMethod(__package__, "..Methods.Machine.LamSlot.get_bore_desc")
+    set_pole_pair_number = LazyMethod(
+        __package__, "..Methods.Machine.LamSlot.set_pole_pair_number"
+    )
+    comp_angle_d_axis = LazyMethod(
+        __package__, "..Methods.Machine.LamSlot.comp_angle_d_axis"
+    )
+    get_surfaces_closing = LazyMethod(
+        __package__, "..Methods.Machine.LamSlot.get_surfaces_closing"
+    )
+    has_magnet = LazyMethod(__package__, "..Methods.Machine.LamSlot.has_magnet")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,57 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .LamSlot import LamSlot
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.LamSlotMag.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from ..Methods.Machine.LamSlotMag.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Machine.LamSlotMag.comp_masses import comp_masses
-except ImportError as error:
-    comp_masses = error
-
-try:
-    from ..Methods.Machine.LamSlotMag.comp_radius_mec import comp_radius_mec
-except ImportError as error:
-    comp_radius_mec = error
-
-try:
-    from ..Methods.Machine.LamSlotMag.comp_surfaces import comp_surfaces
-except ImportError as error:
-    comp_surfaces = error
-
-try:
-    from ..Methods.Machine.LamSlotMag.comp_volumes import comp_volumes
-except ImportError as error:
-    comp_volumes = error
-
-try:
-    from ..Methods.Machine.LamSlotMag.plot import plot
-except ImportError as error:
-    plot = error
-
-try:
-    from ..Methods.Machine.LamSlotMag.comp_angle_d_axis import comp_angle_d_axis
-except ImportError as error:
-    comp_angle_d_axis = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -67,93 +25,23 @@ class LamSlotMag(LamSlot):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.LamSlotMag.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMag method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
-    # cf Methods.Machine.LamSlotMag.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSlotMag method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Machine.LamSlotMag.comp_masses
-    if isinstance(comp_masses, ImportError):
-        comp_masses = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMag method comp_masses: " + str(comp_masses)
-                )
-            )
-        )
-    else:
-        comp_masses = comp_masses
-    # cf Methods.Machine.LamSlotMag.comp_radius_mec
-    if isinstance(comp_radius_mec, ImportError):
-        comp_radius_mec = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMag method comp_radius_mec: "
-                    + str(comp_radius_mec)
-                )
-            )
-        )
-    else:
-        comp_radius_mec = comp_radius_mec
-    # cf Methods.Machine.LamSlotMag.comp_surfaces
-    if isinstance(comp_surfaces, ImportError):
-        comp_surfaces = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMag method comp_surfaces: " + str(comp_surfaces)
-                )
-            )
-        )
-    else:
-        comp_surfaces = comp_surfaces
-    # cf Methods.Machine.LamSlotMag.comp_volumes
-    if isinstance(comp_volumes, ImportError):
-        comp_volumes = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMag method comp_volumes: " + str(comp_volumes)
-                )
-            )
-        )
-    else:
-        comp_volumes = comp_volumes
-    # cf Methods.Machine.LamSlotMag.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSlotMag method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
-    # cf Methods.Machine.LamSlotMag.comp_angle_d_axis
-    if isinstance(comp_angle_d_axis, ImportError):
-        comp_angle_d_axis = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMag method comp_angle_d_axis: "
-                    + str(comp_angle_d_axis)
-                )
-            )
-        )
-    else:
-        comp_angle_d_axis = comp_angle_d_axis
+    # Methods imported on first use to remove unnecessary dependencies
+    build_geometry = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotMag.build_geometry"
+    )
+    check = LazyMethod(__package__, "..Methods.Machine.LamSlotMag.check")
+    comp_masses = LazyMethod(__package__, "..Methods.Machine.LamSlotMag.comp_masses")
+    comp_radius_mec = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotMag.comp_radius_mec"
+    )
+    comp_surfaces = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotMag.comp_surfaces"
+    )
+    comp_volumes = LazyMethod(__package__, "..Methods.Machine.LamSlotMag.comp_volumes")
+    plot = LazyMethod(__package__, "..Methods.Machine.LamSlotMag.plot")
+    comp_angle_d_axis = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotMag.comp_angle_d_axis"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,64 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import set_array, check_var, raise_
+from ._check import set_array, check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyArray, LazyMethod
 from .Lamination import Lamination
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.LamSlotMulti.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Machine.LamSlotMulti.comp_radius_mec import comp_radius_mec
-except ImportError as error:
-    comp_radius_mec = error
-
-try:
-    from ..Methods.Machine.LamSlotMulti.comp_surfaces import comp_surfaces
-except ImportError as error:
-    comp_surfaces = error
-
-try:
-    from ..Methods.Machine.LamSlotMulti.get_pole_pair_number import get_pole_pair_number
-except ImportError as error:
-    get_pole_pair_number = error
-
-try:
-    from ..Methods.Machine.LamSlotMulti.plot import plot
-except ImportError as error:
-    plot = error
-
-try:
-    from ..Methods.Machine.LamSlotMulti.comp_height_yoke import comp_height_yoke
-except ImportError as error:
-    comp_height_yoke = error
-
-try:
-    from ..Methods.Machine.LamSlotMulti.get_Zs import get_Zs
-except ImportError as error:
-    get_Zs = error
-
-try:
-    from ..Methods.Machine.LamSlotMulti.get_bore_desc import get_bore_desc
-except ImportError as error:
-    get_bore_desc = error
-
-try:
-    from ..Methods.Machine.LamSlotMulti.comp_periodicity_spatial import (
-        comp_periodicity_spatial,
-    )
-except ImportError as error:
-    comp_periodicity_spatial = error
-
-
 from numpy import array, array_equal
 from numpy import isnan
 from ._check import InitUnKnowClassError
@@ -75,104 +26,28 @@ class LamSlotMulti(Lamination):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.LamSlotMulti.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSlotMulti method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Machine.LamSlotMulti.comp_radius_mec
-    if isinstance(comp_radius_mec, ImportError):
-        comp_radius_mec = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMulti method comp_radius_mec: "
-                    + str(comp_radius_mec)
-                )
-            )
-        )
-    else:
-        comp_radius_mec = comp_radius_mec
-    # cf Methods.Machine.LamSlotMulti.comp_surfaces
-    if isinstance(comp_surfaces, ImportError):
-        comp_surfaces = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMulti method comp_surfaces: " + str(comp_surfaces)
-                )
-            )
-        )
-    else:
-        comp_surfaces = comp_surfaces
-    # cf Methods.Machine.LamSlotMulti.get_pole_pair_number
-    if isinstance(get_pole_pair_number, ImportError):
-        get_pole_pair_number = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMulti method get_pole_pair_number: "
-                    + str(get_pole_pair_number)
-                )
-            )
-        )
-    else:
-        get_pole_pair_number = get_pole_pair_number
-    # cf Methods.Machine.LamSlotMulti.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSlotMulti method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
-    # cf Methods.Machine.LamSlotMulti.comp_height_yoke
-    if isinstance(comp_height_yoke, ImportError):
-        comp_height_yoke = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMulti method comp_height_yoke: "
-                    + str(comp_height_yoke)
-                )
-            )
-        )
-    else:
-        comp_height_yoke = comp_height_yoke
-    # cf Methods.Machine.LamSlotMulti.get_Zs
-    if isinstance(get_Zs, ImportError):
-        get_Zs = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSlotMulti method get_Zs: " + str(get_Zs))
-            )
-        )
-    else:
-        get_Zs = get_Zs
-    # cf Methods.Machine.LamSlotMulti.get_bore_desc
-    if isinstance(get_bore_desc, ImportError):
-        get_bore_desc = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMulti method get_bore_desc: " + str(get_bore_desc)
-                )
-            )
-        )
-    else:
-        get_bore_desc = get_bore_desc
-    # cf Methods.Machine.LamSlotMulti.comp_periodicity_spatial
-    if isinstance(comp_periodicity_spatial, ImportError):
-        comp_periodicity_spatial = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMulti method comp_periodicity_spatial: "
-                    + str(comp_periodicity_spatial)
-                )
-            )
-        )
-    else:
-        comp_periodicity_spatial = comp_periodicity_spatial
+    # Methods imported on first use to remove unnecessary dependencies
+    check = LazyMethod(__package__, "..Methods.Machine.LamSlotMulti.check")
+    comp_radius_mec = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotMulti.comp_radius_mec"
+    )
+    comp_surfaces = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotMulti.comp_surfaces"
+    )
+    get_pole_pair_number = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotMulti.get_pole_pair_number"
+    )
+    plot = LazyMethod(__package__, "..Methods.Machine.LamSlotMulti.plot")
+    comp_height_yoke = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotMulti.comp_height_yoke"
+    )
+    get_Zs = LazyMethod(__package__, "..Methods.Machine.LamSlotMulti.get_Zs")
+    get_bore_desc = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotMulti.get_bore_desc"
+    )
+    comp_periodicity_spatial = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotMulti.comp_periodicity_spatial"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -491,6 +366,8 @@ class LamSlotMulti(Lamination):
 
     def _get_alpha(self):
         """getter of alpha"""
+        if isinstance(self._alpha, LazyArray):
+            self._alpha = self._alpha.read()
         return self._alpha
 
     def _set_alpha(self, value):
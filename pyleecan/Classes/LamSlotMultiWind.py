@@ -7,59 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import set_array, check_var, raise_
+from ._check import set_array, check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyArray, LazyMethod
 from .LamSlotMulti import LamSlotMulti
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.LamSlotMultiWind.plot import plot
-except ImportError as error:
-    plot = error
-
-try:
-    from ..Methods.Machine.LamSlotMultiWind.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from ..Methods.Machine.LamSlotMultiWind.get_pole_pair_number import (
-        get_pole_pair_number,
-    )
-except ImportError as error:
-    get_pole_pair_number = error
-
-try:
-    from ..Methods.Machine.LamSlotMultiWind.comp_mmf_dir import comp_mmf_dir
-except ImportError as error:
-    comp_mmf_dir = error
-
-try:
-    from ..Methods.Machine.LamSlotMultiWind.plot_mmf_unit import plot_mmf_unit
-except ImportError as error:
-    plot_mmf_unit = error
-
-try:
-    from ..Methods.Machine.LamSlotMultiWind.comp_mmf_unit import comp_mmf_unit
-except ImportError as error:
-    comp_mmf_unit = error
-
-try:
-    from ..Methods.Machine.LamSlotMultiWind.comp_wind_function import comp_wind_function
-except ImportError as error:
-    comp_wind_function = error
-
-try:
-    from ..Methods.Machine.LamSlotMultiWind.comp_angle_d_axis import comp_angle_d_axis
-except ImportError as error:
-    comp_angle_d_axis = error
-
-
 from numpy import array, array_equal
 from numpy import isnan
 from ._check import InitUnKnowClassError
@@ -70,100 +26,29 @@ class LamSlotMultiWind(LamSlotMulti):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.LamSlotMultiWind.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSlotMultiWind method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
-    # cf Methods.Machine.LamSlotMultiWind.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMultiWind method build_geometry: "
-                    + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
-    # cf Methods.Machine.LamSlotMultiWind.get_pole_pair_number
-    if isinstance(get_pole_pair_number, ImportError):
-        get_pole_pair_number = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMultiWind method get_pole_pair_number: "
-                    + str(get_pole_pair_number)
-                )
-            )
-        )
-    else:
-        get_pole_pair_number = get_pole_pair_number
-    # cf Methods.Machine.LamSlotMultiWind.comp_mmf_dir
-    if isinstance(comp_mmf_dir, ImportError):
-        comp_mmf_dir = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMultiWind method comp_mmf_dir: "
-                    + str(comp_mmf_dir)
-                )
-            )
-        )
-    else:
-        comp_mmf_dir = comp_mmf_dir
-    # cf Methods.Machine.LamSlotMultiWind.plot_mmf_unit
-    if isinstance(plot_mmf_unit, ImportError):
-        plot_mmf_unit = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMultiWind method plot_mmf_unit: "
-                    + str(plot_mmf_unit)
-                )
-            )
-        )
-    else:
-        plot_mmf_unit = plot_mmf_unit
-    # cf Methods.Machine.LamSlotMultiWind.comp_mmf_unit
-    if isinstance(comp_mmf_unit, ImportError):
-        comp_mmf_unit = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMultiWind method comp_mmf_unit: "
-                    + str(comp_mmf_unit)
-                )
-            )
-        )
-    else:
-        comp_mmf_unit = comp_mmf_unit
-    # cf Methods.Machine.LamSlotMultiWind.comp_wind_function
-    if isinstance(comp_wind_function, ImportError):
-        comp_wind_function = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMultiWind method comp_wind_function: "
-                    + str(comp_wind_function)
-                )
-            )
-        )
-    else:
-        comp_wind_function = comp_wind_function
-    # cf Methods.Machine.LamSlotMultiWind.comp_angle_d_axis
-    if isinstance(comp_angle_d_axis, ImportError):
-        comp_angle_d_axis = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotMultiWind method comp_angle_d_axis: "
-                    + str(comp_angle_d_axis)
-                )
-            )
-        )
-    else:
-        comp_angle_d_axis = comp_angle_d_axis
+    # Methods imported on first use to remove unnecessary dependencies
+    plot = LazyMethod(__package__, "..Methods.Machine.LamSlotMultiWind.plot")
+    build_geometry = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotMultiWind.build_geometry"
+    )
+    get_pole_pair_number = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotMultiWind.get_pole_pair_number"
+    )
+    comp_mmf_dir = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotMultiWind.comp_mmf_dir"
+    )
+    plot_mmf_unit = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotMultiWind.plot_mmf_unit"
+    )
+    comp_mmf_unit = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotMultiWind.comp_mmf_unit"
+    )
+    comp_wind_function = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotMultiWind.comp_wind_function"
+    )
+    comp_angle_d_axis = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotMultiWind.comp_angle_d_axis"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,124 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .LamSlot import LamSlot
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.LamSlotWind.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from ..Methods.Machine.LamSlotWind.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Machine.LamSlotWind.comp_masses import comp_masses
-except ImportError as error:
-    comp_masses = error
-
-try:
-    from ..Methods.Machine.LamSlotWind.comp_surfaces import comp_surfaces
-except ImportError as error:
-    comp_surfaces = error
-
-try:
-    from ..Methods.Machine.LamSlotWind.comp_volumes import comp_volumes
-except ImportError as error:
-    comp_volumes = error
-
-try:
-    from ..Methods.Machine.LamSlotWind.get_pole_pair_number import get_pole_pair_number
-except ImportError as error:
-    get_pole_pair_number = error
-
-try:
-    from ..Methods.Machine.LamSlotWind.plot import plot
-except ImportError as error:
-    plot = error
-
-try:
-    from ..Methods.Machine.LamSlotWind.plot_winding import plot_winding
-except ImportError as error:
-    plot_winding = error
-
-try:
-    from ..Methods.Machine.LamSlotWind.comp_fill_factor import comp_fill_factor
-except ImportError as error:
-    comp_fill_factor = error
-
-try:
-    from ..Methods.Machine.LamSlotWind.comp_output_geo import comp_output_geo
-except ImportError as error:
-    comp_output_geo = error
-
-try:
-    from ..Methods.Machine.LamSlotWind.get_polar_eq import get_polar_eq
-except ImportError as error:
-    get_polar_eq = error
-
-try:
-    from ..Methods.Machine.LamSlotWind.comp_wind_function import comp_wind_function
-except ImportError as error:
-    comp_wind_function = error
-
-try:
-    from ..Methods.Machine.LamSlotWind.plot_mmf_unit import plot_mmf_unit
-except ImportError as error:
-    plot_mmf_unit = error
-
-try:
-    from ..Methods.Machine.LamSlotWind.comp_resistance_wind import comp_resistance_wind
-except ImportError as error:
-    comp_resistance_wind = error
-
-try:
-    from ..Methods.Machine.LamSlotWind.comp_angle_d_axis import comp_angle_d_axis
-except ImportError as error:
-    comp_angle_d_axis = error
-
-try:
-    from ..Methods.Machine.LamSlotWind.comp_mmf_unit import comp_mmf_unit
-except ImportError as error:
-    comp_mmf_unit = error
-
-try:
-    from ..Methods.Machine.LamSlotWind.comp_mmf_dir import comp_mmf_dir
-except ImportError as error:
-    comp_mmf_dir = error
-
-try:
-    from ..Methods.Machine.LamSlotWind.comp_lengths_winding import comp_lengths_winding
-except ImportError as error:
-    comp_lengths_winding = error
-
-try:
-    from ..Methods.Machine.LamSlotWind.comp_number_phase_eq import comp_number_phase_eq
-except ImportError as error:
-    comp_number_phase_eq = error
-
-try:
-    from ..Methods.Machine.LamSlotWind.comp_periodicity_spatial import (
-        comp_periodicity_spatial,
-    )
-except ImportError as error:
-    comp_periodicity_spatial = error
-
-try:
-    from ..Methods.Machine.LamSlotWind.set_pole_pair_number import set_pole_pair_number
-except ImportError as error:
-    set_pole_pair_number = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -134,245 +25,59 @@ class LamSlotWind(LamSlot):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.LamSlotWind.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method build_geometry: "
-                    + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
-    # cf Methods.Machine.LamSlotWind.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSlotWind method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Machine.LamSlotWind.comp_masses
-    if isinstance(comp_masses, ImportError):
-        comp_masses = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method comp_masses: " + str(comp_masses)
-                )
-            )
-        )
-    else:
-        comp_masses = comp_masses
-    # cf Methods.Machine.LamSlotWind.comp_surfaces
-    if isinstance(comp_surfaces, ImportError):
-        comp_surfaces = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method comp_surfaces: " + str(comp_surfaces)
-                )
-            )
-        )
-    else:
-        comp_surfaces = comp_surfaces
-    # cf Methods.Machine.LamSlotWind.comp_volumes
-    if isinstance(comp_volumes, ImportError):
-        comp_volumes = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method comp_volumes: " + str(comp_volumes)
-                )
-            )
-        )
-    else:
-        comp_volumes = comp_volumes
-    # cf Methods.Machine.LamSlotWind.get_pole_pair_number
-    if isinstance(get_pole_pair_number, ImportError):
-        get_pole_pair_number = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method get_pole_pair_number: "
-                    + str(get_pole_pair_number)
-                )
-            )
-        )
-    else:
-        get_pole_pair_number = get_pole_pair_number
-    # cf Methods.Machine.LamSlotWind.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSlotWind method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
-    # cf Methods.Machine.LamSlotWind.plot_winding
-    if isinstance(plot_winding, ImportError):
-        plot_winding = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method plot_winding: " + str(plot_winding)
-                )
-            )
-        )
-    else:
-        plot_winding = plot_winding
-    # cf Methods.Machine.LamSlotWind.comp_fill_factor
-    if isinstance(comp_fill_factor, ImportError):
-        comp_fill_factor = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method comp_fill_factor: "
-                    + str(comp_fill_factor)
-                )
-            )
-        )
-    else:
-        comp_fill_factor = comp_fill_factor
-    # cf Methods.Machine.LamSlotWind.comp_output_geo
-    if isinstance(comp_output_geo, ImportError):
-        comp_output_geo = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method comp_output_geo: "
-                    + str(comp_output_geo)
-                )
-            )
-        )
-    else:
-        comp_output_geo = comp_output_geo
-    # cf Methods.Machine.LamSlotWind.get_polar_eq
-    if isinstance(get_polar_eq, ImportError):
-        get_polar_eq = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method get_polar_eq: " + str(get_polar_eq)
-                )
-            )
-        )
-    else:
-        get_polar_eq = get_polar_eq
-    # cf Methods.Machine.LamSlotWind.comp_wind_function
-    if isinstance(comp_wind_function, ImportError):
-        comp_wind_function = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method comp_wind_function: "
-                    + str(comp_wind_function)
-                )
-            )
-        )
-    else:
-        comp_wind_function = comp_wind_function
-    # cf Methods.Machine.LamSlotWind.plot_mmf_unit
-    if isinstance(plot_mmf_unit, ImportError):
-        plot_mmf_unit = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method plot_mmf_unit: " + str(plot_mmf_unit)
-                )
-            )
-        )
-    else:
-        plot_mmf_unit = plot_mmf_unit
-    # cf Methods.Machine.LamSlotWind.comp_resistance_wind
-    if isinstance(comp_resistance_wind, ImportError):
-        comp_resistance_wind = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method comp_resistance_wind: "
-                    + str(comp_resistance_wind)
-                )
-            )
-        )
-    else:
-        comp_resistance_wind = comp_resistance_wind
-    # cf Methods.Machine.LamSlotWind.comp_angle_d_axis
-    if isinstance(comp_angle_d_axis, ImportError):
-        comp_angle_d_axis = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method comp_angle_d_axis: "
-                    + str(comp_angle_d_axis)
-                )
-            )
-        )
-    else:
-        comp_angle_d_axis = comp_angle_d_axis
-    # cf Methods.Machine.LamSlotWind.comp_mmf_unit
-    if isinstance(comp_mmf_unit, ImportError):
-        comp_mmf_unit = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method comp_mmf_unit: " + str(comp_mmf_unit)
-                )
-            )
-        )
-    else:
-        comp_mmf_unit = comp_mmf_unit
-    # cf Methods.Machine.LamSlotWind.comp_mmf_dir
-    if isinstance(comp_mmf_dir, ImportError):
-        comp_mmf_dir = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method comp_mmf_dir: " + str(comp_mmf_dir)
-                )
-            )
-        )
-    else:
-        comp_mmf_dir = comp_mmf_dir
-    # cf Methods.Machine.LamSlotWind.comp_lengths_winding
-    if isinstance(comp_lengths_winding, ImportError):
-        comp_lengths_winding = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method comp_lengths_winding: "
-                    + str(comp_lengths_winding)
-                )
-            )
-        )
-    else:
-        comp_lengths_winding = comp_lengths_winding
-    # cf Methods.Machine.LamSlotWind.comp_number_phase_eq
-    if isinstance(comp_number_phase_eq, ImportError):
-        comp_number_phase_eq = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method comp_number_phase_eq: "
-                    + str(comp_number_phase_eq)
-                )
-            )
-        )
-    else:
-        comp_number_phase_eq = comp_number_phase_eq
-    # cf Methods.Machine.LamSlotWind.comp_periodicity_spatial
-    if isinstance(comp_periodicity_spatial, ImportError):
-        comp_periodicity_spatial = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method comp_periodicity_spatial: "
-                    + str(comp_periodicity_spatial)
-                )
-            )
-        )
-    else:
-        comp_periodicity_spatial = comp_periodicity_spatial
-    # cf Methods.Machine.LamSlotWind.set_pole_pair_number
-    if isinstance(set_pole_pair_number, ImportError):
-        set_pole_pair_number = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSlotWind method set_pole_pair_number: "
-                    + str(set_pole_pair_number)
-                )
-            )
-        )
-    else:
-        set_pole_pair_number = set_pole_pair_number
+    # Methods imported on first use to remove unnecessary dependencies
+    build_geometry = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotWind.build_geometry"
+    )
+    check = LazyMethod(__package__, "..Methods.Machine.LamSlotWind.check")
+    comp_masses = LazyMethod(__package__, "..Methods.Machine.LamSlotWind.comp_masses")
+    comp_surfaces = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotWind.comp_surfaces"
+    )
+    comp_volumes = LazyMethod(__package__, "..Methods.Machine.LamSlotWind.comp_volumes")
+    get_pole_pair_number = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotWind.get_pole_pair_number"
+    )
+    plot = LazyMethod(__package__, "..Methods.Machine.LamSlotWind.plot")
+    plot_winding = LazyMethod(__package__, "..Methods.Machine.LamSlotWind.plot_winding")
+    comp_fill_factor = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotWind.comp_fill_factor"
+    )
+    comp_output_geo = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotWind.comp_output_geo"
+    )
+    get_polar_eq = LazyMethod(__package__, "..Methods.Machine.LamSlotWind.get_polar_eq")
+    comp_wind_function = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotWind.comp_wind_function"
+    )
+    plot_mmf_unit = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotWind.plot_mmf_unit"
+    )
+    comp_resistance_wind = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotWind.comp_resistance_wind"
+    )
+    comp_angle_d_axis = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotWind.comp_angle_d_axis"
+    )
+    comp_mmf_unit = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotWind.comp_mmf_unit"
+    )
+    comp_mmf_dir = LazyMethod(__package__, "..Methods.Machine.LamSlotWind.comp_mmf_dir")
+    comp_lengths_winding = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotWind.comp_lengths_winding"
+    )
+    comp_number_phase_eq = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotWind.comp_number_phase_eq"
+    )
+    comp_periodicity_spatial = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotWind.comp_periodicity_spatial"
+    )
+    set_pole_pair_number = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotWind.set_pole_pair_number"
+    )
+    comp_wind_harmonics = LazyMethod(
+        __package__, "..Methods.Machine.LamSlotWind.comp_wind_harmonics"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
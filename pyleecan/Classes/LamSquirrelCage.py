@@ -7,90 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .LamSlotWind import LamSlotWind
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.LamSquirrelCage.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from ..Methods.Machine.LamSquirrelCage.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Machine.LamSquirrelCage.comp_length_ring import comp_length_ring
-except ImportError as error:
-    comp_length_ring = error
-
-try:
-    from ..Methods.Machine.LamSquirrelCage.plot import plot
-except ImportError as error:
-    plot = error
-
-try:
-    from ..Methods.Machine.LamSquirrelCage.comp_number_phase_eq import (
-        comp_number_phase_eq,
-    )
-except ImportError as error:
-    comp_number_phase_eq = error
-
-try:
-    from ..Methods.Machine.LamSquirrelCage.comp_surface_ring import comp_surface_ring
-except ImportError as error:
-    comp_surface_ring = error
-
-try:
-    from ..Methods.Machine.LamSquirrelCage.comp_resistance_wind import (
-        comp_resistance_wind,
-    )
-except ImportError as error:
-    comp_resistance_wind = error
-
-try:
-    from ..Methods.Machine.LamSquirrelCage.get_name_phase import get_name_phase
-except ImportError as error:
-    get_name_phase = error
-
-try:
-    from ..Methods.Machine.LamSquirrelCage.comp_angle_d_axis import comp_angle_d_axis
-except ImportError as error:
-    comp_angle_d_axis = error
-
-try:
-    from ..Methods.Machine.LamSquirrelCage.comp_periodicity_spatial import (
-        comp_periodicity_spatial,
-    )
-except ImportError as error:
-    comp_periodicity_spatial = error
-
-try:
-    from ..Methods.Machine.LamSquirrelCage.comp_masses import comp_masses
-except ImportError as error:
-    comp_masses = error
-
-try:
-    from ..Methods.Machine.LamSquirrelCage.plot_schematics_scr import (
-        plot_schematics_scr,
-    )
-except ImportError as error:
-    plot_schematics_scr = error
-
-try:
-    from ..Methods.Machine.LamSquirrelCage.plot_side import plot_side
-except ImportError as error:
-    plot_side = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -100,155 +25,40 @@ class LamSquirrelCage(LamSlotWind):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.LamSquirrelCage.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSquirrelCage method build_geometry: "
-                    + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
-    # cf Methods.Machine.LamSquirrelCage.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSquirrelCage method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Machine.LamSquirrelCage.comp_length_ring
-    if isinstance(comp_length_ring, ImportError):
-        comp_length_ring = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSquirrelCage method comp_length_ring: "
-                    + str(comp_length_ring)
-                )
-            )
-        )
-    else:
-        comp_length_ring = comp_length_ring
-    # cf Methods.Machine.LamSquirrelCage.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSquirrelCage method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
-    # cf Methods.Machine.LamSquirrelCage.comp_number_phase_eq
-    if isinstance(comp_number_phase_eq, ImportError):
-        comp_number_phase_eq = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSquirrelCage method comp_number_phase_eq: "
-                    + str(comp_number_phase_eq)
-                )
-            )
-        )
-    else:
-        comp_number_phase_eq = comp_number_phase_eq
-    # cf Methods.Machine.LamSquirrelCage.comp_surface_ring
-    if isinstance(comp_surface_ring, ImportError):
-        comp_surface_ring = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSquirrelCage method comp_surface_ring: "
-                    + str(comp_surface_ring)
-                )
-            )
-        )
-    else:
-        comp_surface_ring = comp_surface_ring
-    # cf Methods.Machine.LamSquirrelCage.comp_resistance_wind
-    if isinstance(comp_resistance_wind, ImportError):
-        comp_resistance_wind = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSquirrelCage method comp_resistance_wind: "
-                    + str(comp_resistance_wind)
-                )
-            )
-        )
-    else:
-        comp_resistance_wind = comp_resistance_wind
-    # cf Methods.Machine.LamSquirrelCage.get_name_phase
-    if isinstance(get_name_phase, ImportError):
-        get_name_phase = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSquirrelCage method get_name_phase: "
-                    + str(get_name_phase)
-                )
-            )
-        )
-    else:
-        get_name_phase = get_name_phase
-    # cf Methods.Machine.LamSquirrelCage.comp_angle_d_axis
-    if isinstance(comp_angle_d_axis, ImportError):
-        comp_angle_d_axis = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSquirrelCage method comp_angle_d_axis: "
-                    + str(comp_angle_d_axis)
-                )
-            )
-        )
-    else:
-        comp_angle_d_axis = comp_angle_d_axis
-    # cf Methods.Machine.LamSquirrelCage.comp_periodicity_spatial
-    if isinstance(comp_periodicity_spatial, ImportError):
-        comp_periodicity_spatial = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSquirrelCage method comp_periodicity_spatial: "
-                    + str(comp_periodicity_spatial)
-                )
-            )
-        )
-    else:
-        comp_periodicity_spatial = comp_periodicity_spatial
-    # cf Methods.Machine.LamSquirrelCage.comp_masses
-    if isinstance(comp_masses, ImportError):
-        comp_masses = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSquirrelCage method comp_masses: " + str(comp_masses)
-                )
-            )
-        )
-    else:
-        comp_masses = comp_masses
-    # cf Methods.Machine.LamSquirrelCage.plot_schematics_scr
-    if isinstance(plot_schematics_scr, ImportError):
-        plot_schematics_scr = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSquirrelCage method plot_schematics_scr: "
-                    + str(plot_schematics_scr)
-                )
-            )
-        )
-    else:
-        plot_schematics_scr = plot_schematics_scr
-    # cf Methods.Machine.LamSquirrelCage.plot_side
-    if isinstance(plot_side, ImportError):
-        plot_side = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSquirrelCage method plot_side: " + str(plot_side)
-                )
-            )
-        )
-    else:
-        plot_side = plot_side
+    # Methods imported on first use to remove unnecessary dependencies
+    build_geometry = LazyMethod(
+        __package__, "..Methods.Machine.LamSquirrelCage.build_geometry"
+    )
+    check = LazyMethod(__package__, "..Methods.Machine.LamSquirrelCage.check")
+    comp_length_ring = LazyMethod(
+        __package__, "..Methods.Machine.LamSquirrelCage.comp_length_ring"
+    )
+    plot = LazyMethod(__package__, "..Methods.Machine.LamSquirrelCage.plot")
+    comp_number_phase_eq = LazyMethod(
+        __package__, "..Methods.Machine.LamSquirrelCage.comp_number_phase_eq"
+    )
+    comp_surface_ring = LazyMethod(
+        __package__, "..Methods.Machine.LamSquirrelCage.comp_surface_ring"
+    )
+    comp_resistance_wind = LazyMethod(
+        __package__, "..Methods.Machine.LamSquirrelCage.comp_resistance_wind"
+    )
+    get_name_phase = LazyMethod(
+        __package__, "..Methods.Machine.LamSquirrelCage.get_name_phase"
+    )
+    comp_angle_d_axis = LazyMethod(
+        __package__, "..Methods.Machine.LamSquirrelCage.comp_angle_d_axis"
+    )
+    comp_periodicity_spatial = LazyMethod(
+        __package__, "..Methods.Machine.LamSquirrelCage.comp_periodicity_spatial"
+    )
+    comp_masses = LazyMethod(
+        __package__, "..Methods.Machine.LamSquirrelCage.comp_masses"
+    )
+    plot_schematics_scr = LazyMethod(
+        __package__, "..Methods.Machine.LamSquirrelCage.plot_schematics_scr"
+    )
+    plot_side = LazyMethod(__package__, "..Methods.Machine.LamSquirrelCage.plot_side")
     # save and copy methods are available in all object
     save = save
     copy = copy
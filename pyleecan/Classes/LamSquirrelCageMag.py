@@ -7,51 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .LamSquirrelCage import LamSquirrelCage
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.LamSquirrelCageMag.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from ..Methods.Machine.LamSquirrelCageMag.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Machine.LamSquirrelCageMag.comp_surfaces import comp_surfaces
-except ImportError as error:
-    comp_surfaces = error
-
-try:
-    from ..Methods.Machine.LamSquirrelCageMag.plot import plot
-except ImportError as error:
-    plot = error
-
-try:
-    from ..Methods.Machine.LamSquirrelCageMag.get_pole_pair_number import (
-        get_pole_pair_number,
-    )
-except ImportError as error:
-    get_pole_pair_number = error
-
-try:
-    from ..Methods.Machine.LamSquirrelCageMag.set_pole_pair_number import (
-        set_pole_pair_number,
-    )
-except ImportError as error:
-    set_pole_pair_number = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -61,73 +25,21 @@ class LamSquirrelCageMag(LamSquirrelCage):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.LamSquirrelCageMag.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSquirrelCageMag method build_geometry: "
-                    + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
-    # cf Methods.Machine.LamSquirrelCageMag.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSquirrelCageMag method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Machine.LamSquirrelCageMag.comp_surfaces
-    if isinstance(comp_surfaces, ImportError):
-        comp_surfaces = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSquirrelCageMag method comp_surfaces: "
-                    + str(comp_surfaces)
-                )
-            )
-        )
-    else:
-        comp_surfaces = comp_surfaces
-    # cf Methods.Machine.LamSquirrelCageMag.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LamSquirrelCageMag method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
-    # cf Methods.Machine.LamSquirrelCageMag.get_pole_pair_number
-    if isinstance(get_pole_pair_number, ImportError):
-        get_pole_pair_number = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSquirrelCageMag method get_pole_pair_number: "
-                    + str(get_pole_pair_number)
-                )
-            )
-        )
-    else:
-        get_pole_pair_number = get_pole_pair_number
-    # cf Methods.Machine.LamSquirrelCageMag.set_pole_pair_number
-    if isinstance(set_pole_pair_number, ImportError):
-        set_pole_pair_number = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LamSquirrelCageMag method set_pole_pair_number: "
-                    + str(set_pole_pair_number)
-                )
-            )
-        )
-    else:
-        set_pole_pair_number = set_pole_pair_number
+    # Methods imported on first use to remove unnecessary dependencies
+    build_geometry = LazyMethod(
+        __package__, "..Methods.Machine.LamSquirrelCageMag.build_geometry"
+    )
+    check = LazyMethod(__package__, "..Methods.Machine.LamSquirrelCageMag.check")
+    comp_surfaces = LazyMethod(
+        __package__, "..Methods.Machine.LamSquirrelCageMag.comp_surfaces"
+    )
+    plot = LazyMethod(__package__, "..Methods.Machine.LamSquirrelCageMag.plot")
+    get_pole_pair_number = LazyMethod(
+        __package__, "..Methods.Machine.LamSquirrelCageMag.get_pole_pair_number"
+    )
+    set_pole_pair_number = LazyMethod(
+        __package__, "..Methods.Machine.LamSquirrelCageMag.set_pole_pair_number"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
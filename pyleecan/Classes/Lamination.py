@@ -7,173 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.Lamination.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from ..Methods.Machine.Lamination.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Machine.Lamination.comp_length import comp_length
-except ImportError as error:
-    comp_length = error
-
-try:
-    from ..Methods.Machine.Lamination.comp_masses import comp_masses
-except ImportError as error:
-    comp_masses = error
-
-try:
-    from ..Methods.Machine.Lamination.comp_radius_mec import comp_radius_mec
-except ImportError as error:
-    comp_radius_mec = error
-
-try:
-    from ..Methods.Machine.Lamination.comp_surface_axial_vent import (
-        comp_surface_axial_vent,
-    )
-except ImportError as error:
-    comp_surface_axial_vent = error
-
-try:
-    from ..Methods.Machine.Lamination.comp_surfaces import comp_surfaces
-except ImportError as error:
-    comp_surfaces = error
-
-try:
-    from ..Methods.Machine.Lamination.comp_volumes import comp_volumes
-except ImportError as error:
-    comp_volumes = error
-
-try:
-    from ..Methods.Machine.Lamination.get_bore_line import get_bore_line
-except ImportError as error:
-    get_bore_line = error
-
-try:
-    from ..Methods.Machine.Lamination.get_Rbo import get_Rbo
-except ImportError as error:
-    get_Rbo = error
-
-try:
-    from ..Methods.Machine.Lamination.get_Ryoke import get_Ryoke
-except ImportError as error:
-    get_Ryoke = error
-
-try:
-    from ..Methods.Machine.Lamination.get_name_phase import get_name_phase
-except ImportError as error:
-    get_name_phase = error
-
-try:
-    from ..Methods.Machine.Lamination.plot import plot
-except ImportError as error:
-    plot = error
-
-try:
-    from ..Methods.Machine.Lamination.comp_output_geo import comp_output_geo
-except ImportError as error:
-    comp_output_geo = error
-
-try:
-    from ..Methods.Machine.Lamination.get_polar_eq import get_polar_eq
-except ImportError as error:
-    get_polar_eq = error
-
-try:
-    from ..Methods.Machine.Lamination.is_outwards import is_outwards
-except ImportError as error:
-    is_outwards = error
-
-try:
-    from ..Methods.Machine.Lamination.comp_height_yoke import comp_height_yoke
-except ImportError as error:
-    comp_height_yoke = error
-
-try:
-    from ..Methods.Machine.Lamination.get_notch_list import get_notch_list
-except ImportError as error:
-    get_notch_list = error
-
-try:
-    from ..Methods.Machine.Lamination.comp_angle_q_axis import comp_angle_q_axis
-except ImportError as error:
-    comp_angle_q_axis = error
-
-try:
-    from ..Methods.Machine.Lamination.comp_radius_mid_yoke import comp_radius_mid_yoke
-except ImportError as error:
-    comp_radius_mid_yoke = error
-
-try:
-    from ..Methods.Machine.Lamination.get_yoke_desc import get_yoke_desc
-except ImportError as error:
-    get_yoke_desc = error
-
-try:
-    from ..Methods.Machine.Lamination.get_bore_desc import get_bore_desc
-except ImportError as error:
-    get_bore_desc = error
-
-try:
-    from ..Methods.Machine.Lamination.comp_point_ref import comp_point_ref
-except ImportError as error:
-    comp_point_ref = error
-
-try:
-    from ..Methods.Machine.Lamination.comp_periodicity_spatial import (
-        comp_periodicity_spatial,
-    )
-except ImportError as error:
-    comp_periodicity_spatial = error
-
-try:
-    from ..Methods.Machine.Lamination.get_label import get_label
-except ImportError as error:
-    get_label = error
-
-try:
-    from ..Methods.Machine.Lamination.get_yoke_side_line import get_yoke_side_line
-except ImportError as error:
-    get_yoke_side_line = error
-
-try:
-    from ..Methods.Machine.Lamination.get_notches_surf import get_notches_surf
-except ImportError as error:
-    get_notches_surf = error
-
-try:
-    from ..Methods.Machine.Lamination.comp_periodicity_duct_spatial import (
-        comp_periodicity_duct_spatial,
-    )
-except ImportError as error:
-    comp_periodicity_duct_spatial = error
-
-try:
-    from ..Methods.Machine.Lamination.get_surfaces_closing import get_surfaces_closing
-except ImportError as error:
-    get_surfaces_closing = error
-
-try:
-    from ..Methods.Machine.Lamination.comp_periodicity_geo import comp_periodicity_geo
-except ImportError as error:
-    comp_periodicity_geo = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -183,339 +25,77 @@ class Lamination(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.Lamination.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
-    # cf Methods.Machine.Lamination.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Lamination method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Machine.Lamination.comp_length
-    if isinstance(comp_length, ImportError):
-        comp_length = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method comp_length: " + str(comp_length)
-                )
-            )
-        )
-    else:
-        comp_length = comp_length
-    # cf Methods.Machine.Lamination.comp_masses
-    if isinstance(comp_masses, ImportError):
-        comp_masses = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method comp_masses: " + str(comp_masses)
-                )
-            )
-        )
-    else:
-        comp_masses = comp_masses
-    # cf Methods.Machine.Lamination.comp_radius_mec
-    if isinstance(comp_radius_mec, ImportError):
-        comp_radius_mec = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method comp_radius_mec: "
-                    + str(comp_radius_mec)
-                )
-            )
-        )
-    else:
-        comp_radius_mec = comp_radius_mec
-    # cf Methods.Machine.Lamination.comp_surface_axial_vent
-    if isinstance(comp_surface_axial_vent, ImportError):
-        comp_surface_axial_vent = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method comp_surface_axial_vent: "
-                    + str(comp_surface_axial_vent)
-                )
-            )
-        )
-    else:
-        comp_surface_axial_vent = comp_surface_axial_vent
-    # cf Methods.Machine.Lamination.comp_surfaces
-    if isinstance(comp_surfaces, ImportError):
-        comp_surfaces = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method comp_surfaces: " + str(comp_surfaces)
-                )
-            )
-        )
-    else:
-        comp_surfaces = comp_surfaces
-    # cf Methods.Machine.Lamination.comp_volumes
-    if isinstance(comp_volumes, ImportError):
-        comp_volumes = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method comp_volumes: " + str(comp_volumes)
-                )
-            )
-        )
-    else:
-        comp_volumes = comp_volumes
-    # cf Methods.Machine.Lamination.get_bore_line
-    if isinstance(get_bore_line, ImportError):
-        get_bore_line = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method get_bore_line: " + str(get_bore_line)
-                )
-            )
-        )
-    else:
-        get_bore_line = get_bore_line
-    # cf Methods.Machine.Lamination.get_Rbo
-    if isinstance(get_Rbo, ImportError):
-        get_Rbo = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Lamination method get_Rbo: " + str(get_Rbo))
-            )
-        )
-    else:
-        get_Rbo = get_Rbo
-    # cf Methods.Machine.Lamination.get_Ryoke
-    if isinstance(get_Ryoke, ImportError):
-        get_Ryoke = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Lamination method get_Ryoke: " + str(get_Ryoke))
-            )
-        )
-    else:
-        get_Ryoke = get_Ryoke
-    # cf Methods.Machine.Lamination.get_name_phase
-    if isinstance(get_name_phase, ImportError):
-        get_name_phase = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method get_name_phase: " + str(get_name_phase)
-                )
-            )
-        )
-    else:
-        get_name_phase = get_name_phase
-    # cf Methods.Machine.Lamination.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Lamination method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
-    # cf Methods.Machine.Lamination.comp_output_geo
-    if isinstance(comp_output_geo, ImportError):
-        comp_output_geo = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method comp_output_geo: "
-                    + str(comp_output_geo)
-                )
-            )
-        )
-    else:
-        comp_output_geo = comp_output_geo
-    # cf Methods.Machine.Lamination.get_polar_eq
-    if isinstance(get_polar_eq, ImportError):
-        get_polar_eq = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method get_polar_eq: " + str(get_polar_eq)
-                )
-            )
-        )
-    else:
-        get_polar_eq = get_polar_eq
-    # cf Methods.Machine.Lamination.is_outwards
-    if isinstance(is_outwards, ImportError):
-        is_outwards = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method is_outwards: " + str(is_outwards)
-                )
-            )
-        )
-    else:
-        is_outwards = is_outwards
-    # cf Methods.Machine.Lamination.comp_height_yoke
-    if isinstance(comp_height_yoke, ImportError):
-        comp_height_yoke = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method comp_height_yoke: "
-                    + str(comp_height_yoke)
-                )
-            )
-        )
-    else:
-        comp_height_yoke = comp_height_yoke
-    # cf Methods.Machine.Lamination.get_notch_list
-    if isinstance(get_notch_list, ImportError):
-        get_notch_list = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method get_notch_list: " + str(get_notch_list)
-                )
-            )
-        )
-    else:
-        get_notch_list = get_notch_list
-    # cf Methods.Machine.Lamination.comp_angle_q_axis
-    if isinstance(comp_angle_q_axis, ImportError):
-        comp_angle_q_axis = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method comp_angle_q_axis: "
-                    + str(comp_angle_q_axis)
-                )
-            )
-        )
-    else:
-        comp_angle_q_axis = comp_angle_q_axis
-    # cf Methods.Machine.Lamination.comp_radius_mid_yoke
-    if isinstance(comp_radius_mid_yoke, ImportError):
-        comp_radius_mid_yoke = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method comp_radius_mid_yoke: "
-                    + str(comp_radius_mid_yoke)
-                )
-            )
-        )
-    else:
-        comp_radius_mid_yoke = comp_radius_mid_yoke
-    # cf Methods.Machine.Lamination.get_yoke_desc
-    if isinstance(get_yoke_desc, ImportError):
-        get_yoke_desc = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method get_yoke_desc: " + str(get_yoke_desc)
-                )
-            )
-        )
-    else:
-        get_yoke_desc = get_yoke_desc
-    # cf Methods.Machine.Lamination.get_bore_desc
-    if isinstance(get_bore_desc, ImportError):
-        get_bore_desc = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method get_bore_desc: " + str(get_bore_desc)
-                )
-            )
-        )
-    else:
-        get_bore_desc = get_bore_desc
-    # cf Methods.Machine.Lamination.comp_point_ref
-    if isinstance(comp_point_ref, ImportError):
-        comp_point_ref = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method comp_point_ref: " + str(comp_point_ref)
-                )
-            )
-        )
-    else:
-        comp_point_ref = comp_point_ref
-    # cf Methods.Machine.Lamination.comp_periodicity_spatial
-    if isinstance(comp_periodicity_spatial, ImportError):
-        comp_periodicity_spatial = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method comp_periodicity_spatial: "
-                    + str(comp_periodicity_spatial)
-                )
-            )
-        )
-    else:
-        comp_periodicity_spatial = comp_periodicity_spatial
-    # cf Methods.Machine.Lamination.get_label
-    if isinstance(get_label, ImportError):
-        get_label = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Lamination method get_label: " + str(get_label))
-            )
-        )
-    else:
-        get_label = get_label
-    # cf Methods.Machine.Lamination.get_yoke_side_line
-    if isinstance(get_yoke_side_line, ImportError):
-        get_yoke_side_line = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method get_yoke_side_line: "
-                    + str(get_yoke_side_line)
-                )
-            )
-        )
-    else:
-        get_yoke_side_line = get_yoke_side_line
-    # cf Methods.Machine.Lamination.get_notches_surf
-    if isinstance(get_notches_surf, ImportError):
-        get_notches_surf = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method get_notches_surf: "
-                    + str(get_notches_surf)
-                )
-            )
-        )
-    else:
-        get_notches_surf = get_notches_surf
-    # cf Methods.Machine.Lamination.comp_periodicity_duct_spatial
-    if isinstance(comp_periodicity_duct_spatial, ImportError):
-        comp_periodicity_duct_spatial = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method comp_periodicity_duct_spatial: "
-                    + str(comp_periodicity_duct_spatial)
-                )
-            )
-        )
-    else:
-        comp_periodicity_duct_spatial = comp_periodicity_duct_spatial
-    # cf Methods.Machine.Lamination.get_surfaces_closing
-    if isinstance(get_surfaces_closing, ImportError):
-        get_surfaces_closing = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method get_surfaces_closing: "
-                    + str(get_surfaces_closing)
-                )
-            )
-        )
-    else:
-        get_surfaces_closing = get_surfaces_closing
-    # cf Methods.Machine.Lamination.comp_periodicity_geo
-    if isinstance(comp_periodicity_geo, ImportError):
-        comp_periodicity_geo = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Lamination method comp_periodicity_geo: "
-                    + str(comp_periodicity_geo)
-                )
-            )
-        )
-    else:
-        comp_periodicity_geo = comp_periodicity_geo
+    # Methods imported on first use to remove unnecessary dependencies
+    build_geometry = LazyMethod(
+        __package__, "..Methods.Machine.Lamination.build_geometry"
+    )
+    check = LazyMethod(__package__, "..Methods.Machine.Lamination.check")
+    comp_length = LazyMethod(__package__, "..Methods.Machine.Lamination.comp_length")
+    comp_masses = LazyMethod(__package__, "..Methods.Machine.Lamination.comp_masses")
+    comp_radius_mec = LazyMethod(
+        __package__, "..Methods.Machine.Lamination.comp_radius_mec"
+    )
+    comp_surface_axial_vent = LazyMethod(
+        __package__, "..Methods.Machine.Lamination.comp_surface_axial_vent"
+    )
+    comp_surfaces = LazyMethod(
+        __package__, "..Methods.Machine.Lamination.comp_surfaces"
+    )
+    comp_volumes = LazyMethod(__package__, "..Methods.Machine.Lamination.comp_volumes")
+    get_bore_line = LazyMethod(
+        __package__, "..Methods.Machine.Lamination.get_bore_line"
+    )
+    get_Rbo = LazyMethod(__package__, "..Methods.Machine.Lamination.get_Rbo")
+    get_Ryoke = LazyMethod(__package__, "..Methods.Machine.Lamination.get_Ryoke")
+    get_name_phase = LazyMethod(
+        __package__, "..Methods.Machine.Lamination.get_name_phase"
+    )
+    plot = LazyMethod(__package__, "..Methods.Machine.Lamination.plot")
+    comp_output_geo = LazyMethod(
+        __package__, "..Methods.Machine.Lamination.comp_output_geo"
+    )
+    get_polar_eq = LazyMethod(__package__, "..Methods.Machine.Lamination.get_polar_eq")
+    is_outwards = LazyMethod(__package__, "..Methods.Machine.Lamination.is_outwards")
+    comp_height_yoke = LazyMethod(
+        __package__, "..Methods.Machine.Lamination.comp_height_yoke"
+    )
+    get_notch_list = LazyMethod(
+        __package__, "..Methods.Machine.Lamination.get_notch_list"
+    )
+    comp_angle_q_axis = LazyMethod(
+        __package__, "..Methods.Machine.Lamination.comp_angle_q_axis"
+    )
+    comp_radius_mid_yoke = LazyMethod(
+        __package__, "..Methods.Machine.Lamination.comp_radius_mid_yoke"
+    )
+    get_yoke_desc = LazyMethod(
+        __package__, "..Methods.Machine.Lamination.get_yoke_desc"
+    )
+    get_bore_desc = LazyMethod(
+        __package__, "..Methods.Machine.Lamination.get_bore_desc"
+    )
+    comp_point_ref = LazyMethod(
+        __package__, "..Methods.Machine.Lamination.comp_point_ref"
+    )
+    comp_periodicity_spatial = LazyMethod(
+        __package__, "..Methods.Machine.Lamination.comp_periodicity_spatial"
+    )
+    get_label = LazyMethod(__package__, "..Methods.Machine.Lamination.get_label")
+    get_yoke_side_line = LazyMethod(
+        __package__, "..Methods.Machine.Lamination.get_yoke_side_line"
+    )
+    get_notches_surf = LazyMethod(
+        __package__, "..Methods.Machine.Lamination.get_notches_surf"
+    )
+    comp_periodicity_duct_spatial = LazyMethod(
+        __package__, "..Methods.Machine.Lamination.comp_periodicity_duct_spatial"
+    )
+    get_surfaces_closing = LazyMethod(
+        __package__, "..Methods.Machine.Lamination.get_surfaces_closing"
+    )
+    comp_periodicity_geo = LazyMethod(
+        __package__, "..Methods.Machine.Lamination.comp_periodicity_geo"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
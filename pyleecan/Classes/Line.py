@@ -7,22 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Geometry.Line.comp_normal import comp_normal
-except ImportError as error:
-    comp_normal = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -32,15 +25,8 @@ class Line(FrozenClass):
 
     VERSION = 1
 
-    # cf Methods.Geometry.Line.comp_normal
-    if isinstance(comp_normal, ImportError):
-        comp_normal = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Line method comp_normal: " + str(comp_normal))
-            )
-        )
-    else:
-        comp_normal = comp_normal
+    # Methods imported on first use to remove unnecessary dependencies
+    comp_normal = LazyMethod(__package__, "..Methods.Geometry.Line.comp_normal")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -0,0 +1,518 @@
+# -*- coding: utf-8 -*-
+# File generated according to Generator/ClassesRef/Geometry/LineBatch.csv
+# WARNING! All changes made in this file will be lost!
+"""Method code available at https://github.com/Eomys/pyleecan/tree/master/pyleecan/Methods/Geometry/LineBatch
+"""
+
+from os import linesep
+from sys import getsizeof
+from logging import getLogger
+from ._check import set_array, check_var
+from ..Functions.get_logger import get_logger
+from ..Functions.save import save
+from ..Functions.copy import copy
+from ..Functions.load import load_init_dict
+from ..Functions.Load.import_class import import_class
+from ._lazy import LazyArray, LazyMethod
+from ._frozen import FrozenClass
+
+from numpy import array, array_equal
+from numpy import isnan
+from ._check import InitUnKnowClassError
+
+
+class LineBatch(FrozenClass):
+    """Batch of lines stored as arrays (one value per line) to compute on many lines at once (cf Functions.Geometry.get_line_batch)"""
+
+    VERSION = 1
+
+    # Methods imported on first use to remove unnecessary dependencies
+    comp_length = LazyMethod(__package__, "..Methods.Geometry.LineBatch.comp_length")
+    discretize = LazyMethod(__package__, "..Methods.Geometry.LineBatch.discretize")
+    get_lines = LazyMethod(__package__, "..Methods.Geometry.LineBatch.get_lines")
+    intersect_line = LazyMethod(
+        __package__, "..Methods.Geometry.LineBatch.intersect_line"
+    )
+    rotate = LazyMethod(__package__, "..Methods.Geometry.LineBatch.rotate")
+    scale = LazyMethod(__package__, "..Methods.Geometry.LineBatch.scale")
+    translate = LazyMethod(__package__, "..Methods.Geometry.LineBatch.translate")
+    update_lines = LazyMethod(__package__, "..Methods.Geometry.LineBatch.update_lines")
+    # save and copy methods are available in all object
+    save = save
+    copy = copy
+    # get_logger method is available in all object
+    get_logger = get_logger
+
+    def __init__(
+        self,
+        begin=None,
+        end=None,
+        center=None,
+        radius=None,
+        angle=None,
+        line_type=None,
+        prop_dict=None,
+        init_dict=None,
+        init_str=None,
+    ):
+        """Constructor of the class. Can be use in three ways :
+        - __init__ (arg1 = 1, arg3 = 5) every parameters have name and default values
+            for pyleecan type, -1 will call the default constructor
+        - __init__ (init_dict = d) d must be a dictionary with property names as keys
+        - __init__ (init_str = s) s must be a string
+        s is the file path to load
+
+        ndarray or list can be given for Vector and Matrix
+        object or dict can be given for pyleecan Object"""
+
+        if init_str is not None:  # Load from a file
+            init_dict = load_init_dict(init_str)[1]
+        if init_dict is not None:  # Initialisation by dict
+            assert type(init_dict) is dict
+            # Overwrite default value with init_dict content
+            if "begin" in list(init_dict.keys()):
+                begin = init_dict["begin"]
+            if "end" in list(init_dict.keys()):
+                end = init_dict["end"]
+            if "center" in list(init_dict.keys()):
+                center = init_dict["center"]
+            if "radius" in list(init_dict.keys()):
+                radius = init_dict["radius"]
+            if "angle" in list(init_dict.keys()):
+                angle = init_dict["angle"]
+            if "line_type" in list(init_dict.keys()):
+                line_type = init_dict["line_type"]
+            if "prop_dict" in list(init_dict.keys()):
+                prop_dict = init_dict["prop_dict"]
+        # Set the properties (value check and convertion are done in setter)
+        self.parent = None
+        self.begin = begin
+        self.end = end
+        self.center = center
+        self.radius = radius
+        self.angle = angle
+        self.line_type = line_type
+        self.prop_dict = prop_dict
+
+        # The class is frozen, for now it's impossible to add new properties
+        self._freeze()
+
+    def __str__(self):
+        """Convert this object in a readeable string (for print)"""
+
+        LineBatch_str = ""
+        if self.parent is None:
+            LineBatch_str += "parent = None " + linesep
+        else:
+            LineBatch_str += "parent = " + str(type(self.parent)) + " object" + linesep
+        LineBatch_str += (
+            "begin = "
+            + linesep
+            + str(self.begin).replace(linesep, linesep + "\t")
+            + linesep
+            + linesep
+        )
+        LineBatch_str += (
+            "end = "
+            + linesep
+            + str(self.end).replace(linesep, linesep + "\t")
+            + linesep
+            + linesep
+        )
+        LineBatch_str += (
+            "center = "
+            + linesep
+            + str(self.center).replace(linesep, linesep + "\t")
+            + linesep
+            + linesep
+        )
+        LineBatch_str += (
+            "radius = "
+            + linesep
+            + str(self.radius).replace(linesep, linesep + "\t")
+            + linesep
+            + linesep
+        )
+        LineBatch_str += (
+            "angle = "
+            + linesep
+            + str(self.angle).replace(linesep, linesep + "\t")
+            + linesep
+            + linesep
+        )
+        LineBatch_str += (
+            "line_type = "
+            + linesep
+            + str(self.line_type).replace(linesep, linesep + "\t")
+            + linesep
+            + linesep
+        )
+        LineBatch_str += (
+            "prop_dict = "
+            + linesep
+            + str(self.prop_dict).replace(linesep, linesep + "\t")
+            + linesep
+        )
+        return LineBatch_str
+
+    def __eq__(self, other):
+        """Compare two objects (skip parent)"""
+
+        if type(other) != type(self):
+            return False
+        if not array_equal(other.begin, self.begin):
+            return False
+        if not array_equal(other.end, self.end):
+            return False
+        if not array_equal(other.center, self.center):
+            return False
+        if not array_equal(other.radius, self.radius):
+            return False
+        if not array_equal(other.angle, self.angle):
+            return False
+        if not array_equal(other.line_type, self.line_type):
+            return False
+        if other.prop_dict != self.prop_dict:
+            return False
+        return True
+
+    def compare(self, other, name="self", ignore_list=None, is_add_value=False):
+        """Compare two objects and return list of differences"""
+
+        if ignore_list is None:
+            ignore_list = list()
+        if type(other) != type(self):
+            return ["type(" + name + ")"]
+        diff_list = list()
+        if not array_equal(other.begin, self.begin):
+            diff_list.append(name + ".begin")
+        if not array_equal(other.end, self.end):
+            diff_list.append(name + ".end")
+        if not array_equal(other.center, self.center):
+            diff_list.append(name + ".center")
+        if not array_equal(other.radius, self.radius):
+            diff_list.append(name + ".radius")
+        if not array_equal(other.angle, self.angle):
+            diff_list.append(name + ".angle")
+        if not array_equal(other.line_type, self.line_type):
+            diff_list.append(name + ".line_type")
+        if other._prop_dict != self._prop_dict:
+            if is_add_value:
+                val_str = (
+                    " (self="
+                    + str(self._prop_dict)
+                    + ", other="
+                    + str(other._prop_dict)
+                    + ")"
+                )
+                diff_list.append(name + ".prop_dict" + val_str)
+            else:
+                diff_list.append(name + ".prop_dict")
+        # Filter ignore differences
+        diff_list = list(filter(lambda x: x not in ignore_list, diff_list))
+        return diff_list
+
+    def __sizeof__(self):
+        """Return the size in memory of the object (including all subobject)"""
+
+        S = 0  # Full size of the object
+        S += getsizeof(self.begin)
+        S += getsizeof(self.end)
+        S += getsizeof(self.center)
+        S += getsizeof(self.radius)
+        S += getsizeof(self.angle)
+        S += getsizeof(self.line_type)
+        if self.prop_dict is not None:
+            for value in self.prop_dict:
+                S += getsizeof(value)
+        return S
+
+    def as_dict(self, type_handle_ndarray=0, keep_function=False, **kwargs):
+        """
+        Convert this object in a json serializable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        keep_function : bool
+            True to keep the function object, else return str
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
+
+        LineBatch_dict = dict()
+        if self.begin is None:
+            LineBatch_dict["begin"] = None
+        else:
+            if type_handle_ndarray == 0:
+                LineBatch_dict["begin"] = self.begin.tolist()
+            elif type_handle_ndarray == 1:
+                LineBatch_dict["begin"] = self.begin.copy()
+            elif type_handle_ndarray == 2:
+                LineBatch_dict["begin"] = self.begin
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
+        if self.end is None:
+            LineBatch_dict["end"] = None
+        else:
+            if type_handle_ndarray == 0:
+                LineBatch_dict["end"] = self.end.tolist()
+            elif type_handle_ndarray == 1:
+                LineBatch_dict["end"] = self.end.copy()
+            elif type_handle_ndarray == 2:
+                LineBatch_dict["end"] = self.end
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
+        if self.center is None:
+            LineBatch_dict["center"] = None
+        else:
+            if type_handle_ndarray == 0:
+                LineBatch_dict["center"] = self.center.tolist()
+            elif type_handle_ndarray == 1:
+                LineBatch_dict["center"] = self.center.copy()
+            elif type_handle_ndarray == 2:
+                LineBatch_dict["center"] = self.center
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
+        if self.radius is None:
+            LineBatch_dict["radius"] = None
+        else:
+            if type_handle_ndarray == 0:
+                LineBatch_dict["radius"] = self.radius.tolist()
+            elif type_handle_ndarray == 1:
+                LineBatch_dict["radius"] = self.radius.copy()
+            elif type_handle_ndarray == 2:
+                LineBatch_dict["radius"] = self.radius
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
+        if self.angle is None:
+            LineBatch_dict["angle"] = None
+        else:
+            if type_handle_ndarray == 0:
+                LineBatch_dict["angle"] = self.angle.tolist()
+            elif type_handle_ndarray == 1:
+                LineBatch_dict["angle"] = self.angle.copy()
+            elif type_handle_ndarray == 2:
+                LineBatch_dict["angle"] = self.angle
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
+        if self.line_type is None:
+            LineBatch_dict["line_type"] = None
+        else:
+            if type_handle_ndarray == 0:
+                LineBatch_dict["line_type"] = self.line_type.tolist()
+            elif type_handle_ndarray == 1:
+                LineBatch_dict["line_type"] = self.line_type.copy()
+            elif type_handle_ndarray == 2:
+                LineBatch_dict["line_type"] = self.line_type
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
+        LineBatch_dict["prop_dict"] = (
+            self.prop_dict.copy() if self.prop_dict is not None else None
+        )
+        # The class name is added to the dict for deserialisation purpose
+        LineBatch_dict["__class__"] = "LineBatch"
+        return LineBatch_dict
+
+    def _set_None(self):
+        """Set all the properties to None (except pyleecan object)"""
+
+        self.begin = None
+        self.end = None
+        self.center = None
+        self.radius = None
+        self.angle = None
+        self.line_type = None
+        self.prop_dict = None
+
+    def _get_begin(self):
+        """getter of begin"""
+        if isinstance(self._begin, LazyArray):
+            self._begin = self._begin.read()
+        return self._begin
+
+    def _set_begin(self, value):
+        """setter of begin"""
+        if type(value) is int and value == -1:
+            value = array([])
+        elif type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        check_var("begin", value, "ndarray")
+        self._begin = value
+
+    begin = property(
+        fget=_get_begin,
+        fset=_set_begin,
+        doc=u"""Complex coordinates of the begin points of the lines
+
+        :Type: ndarray
+        """,
+    )
+
+    def _get_end(self):
+        """getter of end"""
+        if isinstance(self._end, LazyArray):
+            self._end = self._end.read()
+        return self._end
+
+    def _set_end(self, value):
+        """setter of end"""
+        if type(value) is int and value == -1:
+            value = array([])
+        elif type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        check_var("end", value, "ndarray")
+        self._end = value
+
+    end = property(
+        fget=_get_end,
+        fset=_set_end,
+        doc=u"""Complex coordinates of the end points of the lines
+
+        :Type: ndarray
+        """,
+    )
+
+    def _get_center(self):
+        """getter of center"""
+        if isinstance(self._center, LazyArray):
+            self._center = self._center.read()
+        return self._center
+
+    def _set_center(self, value):
+        """setter of center"""
+        if type(value) is int and value == -1:
+            value = array([])
+        elif type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        check_var("center", value, "ndarray")
+        self._center = value
+
+    center = property(
+        fget=_get_center,
+        fset=_set_center,
+        doc=u"""Complex coordinates of the centers of the arcs (0 for the segments)
+
+        :Type: ndarray
+        """,
+    )
+
+    def _get_radius(self):
+        """getter of radius"""
+        if isinstance(self._radius, LazyArray):
+            self._radius = self._radius.read()
+        return self._radius
+
+    def _set_radius(self, value):
+        """setter of radius"""
+        if type(value) is int and value == -1:
+            value = array([])
+        elif type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        check_var("radius", value, "ndarray")
+        self._radius = value
+
+    radius = property(
+        fget=_get_radius,
+        fset=_set_radius,
+        doc=u"""Radius of the arcs (signed radius for Arc1 cf Arc1.radius; 0 for the segments)
+
+        :Type: ndarray
+        """,
+    )
+
+    def _get_angle(self):
+        """getter of angle"""
+        if isinstance(self._angle, LazyArray):
+            self._angle = self._angle.read()
+        return self._angle
+
+    def _set_angle(self, value):
+        """setter of angle"""
+        if type(value) is int and value == -1:
+            value = array([])
+        elif type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        check_var("angle", value, "ndarray")
+        self._angle = value
+
+    angle = property(
+        fget=_get_angle,
+        fset=_set_angle,
+        doc=u"""Signed opening angle of the arcs (0 for the segments)
+
+        :Type: ndarray
+        """,
+    )
+
+    def _get_line_type(self):
+        """getter of line_type"""
+        if isinstance(self._line_type, LazyArray):
+            self._line_type = self._line_type.read()
+        return self._line_type
+
+    def _set_line_type(self, value):
+        """setter of line_type"""
+        if type(value) is int and value == -1:
+            value = array([])
+        elif type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        check_var("line_type", value, "ndarray")
+        self._line_type = value
+
+    line_type = property(
+        fget=_get_line_type,
+        fset=_set_line_type,
+        doc=u"""Type of the lines (index in LINE_TYPE_LIST: 0 Segment, 1 Arc1, 2 Arc2, 3 Arc3)
+
+        :Type: ndarray
+        """,
+    )
+
+    def _get_prop_dict(self):
+        """getter of prop_dict"""
+        return self._prop_dict
+
+    def _set_prop_dict(self, value):
+        """setter of prop_dict"""
+        if type(value) is int and value == -1:
+            value = list()
+        check_var("prop_dict", value, "list")
+        self._prop_dict = value
+
+    prop_dict = property(
+        fget=_get_prop_dict,
+        fset=_set_prop_dict,
+        doc=u"""Property dictionary of the lines
+
+        :Type: list
+        """,
+    )
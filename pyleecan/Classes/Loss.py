@@ -7,32 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.Loss.run import run
-except ImportError as error:
-    run = error
-
-try:
-    from ..Methods.Simulation.Loss.add_model import add_model
-except ImportError as error:
-    add_model = error
-
-try:
-    from ..Methods.Simulation.Loss.remove_model import remove_model
-except ImportError as error:
-    remove_model = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -42,32 +25,10 @@ class Loss(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.Loss.run
-    if isinstance(run, ImportError):
-        run = property(
-            fget=lambda x: raise_(ImportError("Can't use Loss method run: " + str(run)))
-        )
-    else:
-        run = run
-    # cf Methods.Simulation.Loss.add_model
-    if isinstance(add_model, ImportError):
-        add_model = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Loss method add_model: " + str(add_model))
-            )
-        )
-    else:
-        add_model = add_model
-    # cf Methods.Simulation.Loss.remove_model
-    if isinstance(remove_model, ImportError):
-        remove_model = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Loss method remove_model: " + str(remove_model))
-            )
-        )
-    else:
-        remove_model = remove_model
+    # Methods imported on first use to remove unnecessary dependencies
+    run = LazyMethod(__package__, "..Methods.Simulation.Loss.run")
+    add_model = LazyMethod(__package__, "..Methods.Simulation.Loss.add_model")
+    remove_model = LazyMethod(__package__, "..Methods.Simulation.Loss.remove_model")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,53 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Loss import Loss
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.LossFEMM.run import run
-except ImportError as error:
-    run = error
-
-try:
-    from ..Methods.Simulation.LossFEMM.comp_axes import comp_axes
-except ImportError as error:
-    comp_axes = error
-
-try:
-    from ..Methods.Simulation.LossFEMM.comp_loss import comp_loss
-except ImportError as error:
-    comp_loss = error
-
-try:
-    from ..Methods.Simulation.LossFEMM.comp_loss_density_core import (
-        comp_loss_density_core,
-    )
-except ImportError as error:
-    comp_loss_density_core = error
-
-try:
-    from ..Methods.Simulation.LossFEMM.comp_loss_density_joule import (
-        comp_loss_density_joule,
-    )
-except ImportError as error:
-    comp_loss_density_joule = error
-
-try:
-    from ..Methods.Simulation.LossFEMM.comp_loss_density_magnet import (
-        comp_loss_density_magnet,
-    )
-except ImportError as error:
-    comp_loss_density_magnet = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -63,70 +25,19 @@ class LossFEMM(Loss):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.LossFEMM.run
-    if isinstance(run, ImportError):
-        run = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LossFEMM method run: " + str(run))
-            )
-        )
-    else:
-        run = run
-    # cf Methods.Simulation.LossFEMM.comp_axes
-    if isinstance(comp_axes, ImportError):
-        comp_axes = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LossFEMM method comp_axes: " + str(comp_axes))
-            )
-        )
-    else:
-        comp_axes = comp_axes
-    # cf Methods.Simulation.LossFEMM.comp_loss
-    if isinstance(comp_loss, ImportError):
-        comp_loss = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use LossFEMM method comp_loss: " + str(comp_loss))
-            )
-        )
-    else:
-        comp_loss = comp_loss
-    # cf Methods.Simulation.LossFEMM.comp_loss_density_core
-    if isinstance(comp_loss_density_core, ImportError):
-        comp_loss_density_core = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LossFEMM method comp_loss_density_core: "
-                    + str(comp_loss_density_core)
-                )
-            )
-        )
-    else:
-        comp_loss_density_core = comp_loss_density_core
-    # cf Methods.Simulation.LossFEMM.comp_loss_density_joule
-    if isinstance(comp_loss_density_joule, ImportError):
-        comp_loss_density_joule = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LossFEMM method comp_loss_density_joule: "
-                    + str(comp_loss_density_joule)
-                )
-            )
-        )
-    else:
-        comp_loss_density_joule = comp_loss_density_joule
-    # cf Methods.Simulation.LossFEMM.comp_loss_density_magnet
-    if isinstance(comp_loss_density_magnet, ImportError):
-        comp_loss_density_magnet = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LossFEMM method comp_loss_density_magnet: "
-                    + str(comp_loss_density_magnet)
-                )
-            )
-        )
-    else:
-        comp_loss_density_magnet = comp_loss_density_magnet
+    # Methods imported on first use to remove unnecessary dependencies
+    run = LazyMethod(__package__, "..Methods.Simulation.LossFEMM.run")
+    comp_axes = LazyMethod(__package__, "..Methods.Simulation.LossFEMM.comp_axes")
+    comp_loss = LazyMethod(__package__, "..Methods.Simulation.LossFEMM.comp_loss")
+    comp_loss_density_core = LazyMethod(
+        __package__, "..Methods.Simulation.LossFEMM.comp_loss_density_core"
+    )
+    comp_loss_density_joule = LazyMethod(
+        __package__, "..Methods.Simulation.LossFEMM.comp_loss_density_joule"
+    )
+    comp_loss_density_magnet = LazyMethod(
+        __package__, "..Methods.Simulation.LossFEMM.comp_loss_density_magnet"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,36 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .LossModel import LossModel
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.LossModelBertotti.comp_loss import comp_loss
-except ImportError as error:
-    comp_loss = error
-
-try:
-    from ..Methods.Simulation.LossModelBertotti.comp_coeff_Bertotti import (
-        comp_coeff_Bertotti,
-    )
-except ImportError as error:
-    comp_coeff_Bertotti = error
-
-try:
-    from ..Methods.Simulation.LossModelBertotti.comp_loss_density import (
-        comp_loss_density,
-    )
-except ImportError as error:
-    comp_loss_density = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -48,42 +27,16 @@ class LossModelBertotti(LossModel):
     F_REF = 50
     B_REF = 1.5
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.LossModelBertotti.comp_loss
-    if isinstance(comp_loss, ImportError):
-        comp_loss = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LossModelBertotti method comp_loss: " + str(comp_loss)
-                )
-            )
-        )
-    else:
-        comp_loss = comp_loss
-    # cf Methods.Simulation.LossModelBertotti.comp_coeff_Bertotti
-    if isinstance(comp_coeff_Bertotti, ImportError):
-        comp_coeff_Bertotti = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LossModelBertotti method comp_coeff_Bertotti: "
-                    + str(comp_coeff_Bertotti)
-                )
-            )
-        )
-    else:
-        comp_coeff_Bertotti = comp_coeff_Bertotti
-    # cf Methods.Simulation.LossModelBertotti.comp_loss_density
-    if isinstance(comp_loss_density, ImportError):
-        comp_loss_density = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LossModelBertotti method comp_loss_density: "
-                    + str(comp_loss_density)
-                )
-            )
-        )
-    else:
-        comp_loss_density = comp_loss_density
+    # Methods imported on first use to remove unnecessary dependencies
+    comp_loss = LazyMethod(
+        __package__, "..Methods.Simulation.LossModelBertotti.comp_loss"
+    )
+    comp_coeff_Bertotti = LazyMethod(
+        __package__, "..Methods.Simulation.LossModelBertotti.comp_coeff_Bertotti"
+    )
+    comp_loss_density = LazyMethod(
+        __package__, "..Methods.Simulation.LossModelBertotti.comp_loss_density"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
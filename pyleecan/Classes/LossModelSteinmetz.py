@@ -7,22 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .LossModel import LossModel
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.LossModelSteinmetz.comp_coeff import comp_coeff
-except ImportError as error:
-    comp_coeff = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -32,17 +25,10 @@ class LossModelSteinmetz(LossModel):
 
     VERSION = 1
 
-    # cf Methods.Simulation.LossModelSteinmetz.comp_coeff
-    if isinstance(comp_coeff, ImportError):
-        comp_coeff = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LossModelSteinmetz method comp_coeff: " + str(comp_coeff)
-                )
-            )
-        )
-    else:
-        comp_coeff = comp_coeff
+    # Methods imported on first use to remove unnecessary dependencies
+    comp_coeff = LazyMethod(
+        __package__, "..Methods.Simulation.LossModelSteinmetz.comp_coeff"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,22 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .LossModel import LossModel
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.LossModelWinding.comp_loss import comp_loss
-except ImportError as error:
-    comp_loss = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -32,17 +25,10 @@ class LossModelWinding(LossModel):
 
     VERSION = 1
 
-    # cf Methods.Simulation.LossModelWinding.comp_loss
-    if isinstance(comp_loss, ImportError):
-        comp_loss = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use LossModelWinding method comp_loss: " + str(comp_loss)
-                )
-            )
-        )
-    else:
-        comp_loss = comp_loss
+    # Methods imported on first use to remove unnecessary dependencies
+    comp_loss = LazyMethod(
+        __package__, "..Methods.Simulation.LossModelWinding.comp_loss"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,133 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.Machine.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from ..Methods.Machine.Machine.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Machine.Machine.comp_angle_rotor_initial import (
-        comp_angle_rotor_initial,
-    )
-except ImportError as error:
-    comp_angle_rotor_initial = error
-
-try:
-    from ..Methods.Machine.Machine.comp_desc_dict import comp_desc_dict
-except ImportError as error:
-    comp_desc_dict = error
-
-try:
-    from ..Methods.Machine.Machine.comp_length_airgap_active import (
-        comp_length_airgap_active,
-    )
-except ImportError as error:
-    comp_length_airgap_active = error
-
-try:
-    from ..Methods.Machine.Machine.comp_masses import comp_masses
-except ImportError as error:
-    comp_masses = error
-
-try:
-    from ..Methods.Machine.Machine.comp_output_geo import comp_output_geo
-except ImportError as error:
-    comp_output_geo = error
-
-try:
-    from ..Methods.Machine.Machine.comp_Rgap_mec import comp_Rgap_mec
-except ImportError as error:
-    comp_Rgap_mec = error
-
-try:
-    from ..Methods.Machine.Machine.comp_periodicity_spatial import (
-        comp_periodicity_spatial,
-    )
-except ImportError as error:
-    comp_periodicity_spatial = error
-
-try:
-    from ..Methods.Machine.Machine.comp_width_airgap_mag import comp_width_airgap_mag
-except ImportError as error:
-    comp_width_airgap_mag = error
-
-try:
-    from ..Methods.Machine.Machine.comp_width_airgap_mec import comp_width_airgap_mec
-except ImportError as error:
-    comp_width_airgap_mec = error
-
-try:
-    from ..Methods.Machine.Machine.get_material_dict import get_material_dict
-except ImportError as error:
-    get_material_dict = error
-
-try:
-    from ..Methods.Machine.Machine.get_polar_eq import get_polar_eq
-except ImportError as error:
-    get_polar_eq = error
-
-try:
-    from ..Methods.Machine.Machine.plot import plot
-except ImportError as error:
-    plot = error
-
-try:
-    from ..Methods.Machine.Machine.plot_anim_rotor import plot_anim_rotor
-except ImportError as error:
-    plot_anim_rotor = error
-
-try:
-    from ..Methods.Machine.Machine.get_lam_list import get_lam_list
-except ImportError as error:
-    get_lam_list = error
-
-try:
-    from ..Methods.Machine.Machine.get_lam_list_label import get_lam_list_label
-except ImportError as error:
-    get_lam_list_label = error
-
-try:
-    from ..Methods.Machine.Machine.get_lam_by_label import get_lam_by_label
-except ImportError as error:
-    get_lam_by_label = error
-
-try:
-    from ..Methods.Machine.Machine.get_lam_index import get_lam_index
-except ImportError as error:
-    get_lam_index = error
-
-try:
-    from ..Methods.Machine.Machine.get_pole_pair_number import get_pole_pair_number
-except ImportError as error:
-    get_pole_pair_number = error
-
-try:
-    from ..Methods.Machine.Machine.set_pole_pair_number import set_pole_pair_number
-except ImportError as error:
-    set_pole_pair_number = error
-
-try:
-    from ..Methods.Machine.Machine.comp_periodicity_time import comp_periodicity_time
-except ImportError as error:
-    comp_periodicity_time = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -143,254 +25,55 @@ class Machine(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.Machine.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
-    # cf Methods.Machine.Machine.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Machine method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Machine.Machine.comp_angle_rotor_initial
-    if isinstance(comp_angle_rotor_initial, ImportError):
-        comp_angle_rotor_initial = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method comp_angle_rotor_initial: "
-                    + str(comp_angle_rotor_initial)
-                )
-            )
-        )
-    else:
-        comp_angle_rotor_initial = comp_angle_rotor_initial
-    # cf Methods.Machine.Machine.comp_desc_dict
-    if isinstance(comp_desc_dict, ImportError):
-        comp_desc_dict = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method comp_desc_dict: " + str(comp_desc_dict)
-                )
-            )
-        )
-    else:
-        comp_desc_dict = comp_desc_dict
-    # cf Methods.Machine.Machine.comp_length_airgap_active
-    if isinstance(comp_length_airgap_active, ImportError):
-        comp_length_airgap_active = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method comp_length_airgap_active: "
-                    + str(comp_length_airgap_active)
-                )
-            )
-        )
-    else:
-        comp_length_airgap_active = comp_length_airgap_active
-    # cf Methods.Machine.Machine.comp_masses
-    if isinstance(comp_masses, ImportError):
-        comp_masses = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Machine method comp_masses: " + str(comp_masses))
-            )
-        )
-    else:
-        comp_masses = comp_masses
-    # cf Methods.Machine.Machine.comp_output_geo
-    if isinstance(comp_output_geo, ImportError):
-        comp_output_geo = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method comp_output_geo: " + str(comp_output_geo)
-                )
-            )
-        )
-    else:
-        comp_output_geo = comp_output_geo
-    # cf Methods.Machine.Machine.comp_Rgap_mec
-    if isinstance(comp_Rgap_mec, ImportError):
-        comp_Rgap_mec = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method comp_Rgap_mec: " + str(comp_Rgap_mec)
-                )
-            )
-        )
-    else:
-        comp_Rgap_mec = comp_Rgap_mec
-    # cf Methods.Machine.Machine.comp_periodicity_spatial
-    if isinstance(comp_periodicity_spatial, ImportError):
-        comp_periodicity_spatial = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method comp_periodicity_spatial: "
-                    + str(comp_periodicity_spatial)
-                )
-            )
-        )
-    else:
-        comp_periodicity_spatial = comp_periodicity_spatial
-    # cf Methods.Machine.Machine.comp_width_airgap_mag
-    if isinstance(comp_width_airgap_mag, ImportError):
-        comp_width_airgap_mag = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method comp_width_airgap_mag: "
-                    + str(comp_width_airgap_mag)
-                )
-            )
-        )
-    else:
-        comp_width_airgap_mag = comp_width_airgap_mag
-    # cf Methods.Machine.Machine.comp_width_airgap_mec
-    if isinstance(comp_width_airgap_mec, ImportError):
-        comp_width_airgap_mec = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method comp_width_airgap_mec: "
-                    + str(comp_width_airgap_mec)
-                )
-            )
-        )
-    else:
-        comp_width_airgap_mec = comp_width_airgap_mec
-    # cf Methods.Machine.Machine.get_material_dict
-    if isinstance(get_material_dict, ImportError):
-        get_material_dict = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method get_material_dict: "
-                    + str(get_material_dict)
-                )
-            )
-        )
-    else:
-        get_material_dict = get_material_dict
-    # cf Methods.Machine.Machine.get_polar_eq
-    if isinstance(get_polar_eq, ImportError):
-        get_polar_eq = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method get_polar_eq: " + str(get_polar_eq)
-                )
-            )
-        )
-    else:
-        get_polar_eq = get_polar_eq
-    # cf Methods.Machine.Machine.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Machine method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
-    # cf Methods.Machine.Machine.plot_anim_rotor
-    if isinstance(plot_anim_rotor, ImportError):
-        plot_anim_rotor = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method plot_anim_rotor: " + str(plot_anim_rotor)
-                )
-            )
-        )
-    else:
-        plot_anim_rotor = plot_anim_rotor
-    # cf Methods.Machine.Machine.get_lam_list
-    if isinstance(get_lam_list, ImportError):
-        get_lam_list = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method get_lam_list: " + str(get_lam_list)
-                )
-            )
-        )
-    else:
-        get_lam_list = get_lam_list
-    # cf Methods.Machine.Machine.get_lam_list_label
-    if isinstance(get_lam_list_label, ImportError):
-        get_lam_list_label = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method get_lam_list_label: "
-                    + str(get_lam_list_label)
-                )
-            )
-        )
-    else:
-        get_lam_list_label = get_lam_list_label
-    # cf Methods.Machine.Machine.get_lam_by_label
-    if isinstance(get_lam_by_label, ImportError):
-        get_lam_by_label = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method get_lam_by_label: "
-                    + str(get_lam_by_label)
-                )
-            )
-        )
-    else:
-        get_lam_by_label = get_lam_by_label
-    # cf Methods.Machine.Machine.get_lam_index
-    if isinstance(get_lam_index, ImportError):
-        get_lam_index = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method get_lam_index: " + str(get_lam_index)
-                )
-            )
-        )
-    else:
-        get_lam_index = get_lam_index
-    # cf Methods.Machine.Machine.get_pole_pair_number
-    if isinstance(get_pole_pair_number, ImportError):
-        get_pole_pair_number = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method get_pole_pair_number: "
-                    + str(get_pole_pair_number)
-                )
-            )
-        )
-    else:
-        get_pole_pair_number = get_pole_pair_number
-    # cf Methods.Machine.Machine.set_pole_pair_number
-    if isinstance(set_pole_pair_number, ImportError):
-        set_pole_pair_number = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method set_pole_pair_number: "
-                    + str(set_pole_pair_number)
-                )
-            )
-        )
-    else:
-        set_pole_pair_number = set_pole_pair_number
-    # cf Methods.Machine.Machine.comp_periodicity_time
-    if isinstance(comp_periodicity_time, ImportError):
-        comp_periodicity_time = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Machine method comp_periodicity_time: "
-                    + str(comp_periodicity_time)
-                )
-            )
-        )
-    else:
-        comp_periodicity_time = comp_periodicity_time
+    # Methods imported on first use to remove unnecessary dependencies
+    build_geometry = LazyMethod(__package__, "..Methods.Machine.Machine.build_geometry")
+    check = LazyMethod(__package__, "..Methods.Machine.Machine.check")
+    comp_angle_rotor_initial = LazyMethod(
+        __package__, "..Methods.Machine.Machine.comp_angle_rotor_initial"
+    )
+    comp_desc_dict = LazyMethod(__package__, "..Methods.Machine.Machine.comp_desc_dict")
+    comp_length_airgap_active = LazyMethod(
+        __package__, "..Methods.Machine.Machine.comp_length_airgap_active"
+    )
+    comp_masses = LazyMethod(__package__, "..Methods.Machine.Machine.comp_masses")
+    comp_output_geo = LazyMethod(
+        __package__, "..Methods.Machine.Machine.comp_output_geo"
+    )
+    comp_Rgap_mec = LazyMethod(__package__, "..Methods.Machine.Machine.comp_Rgap_mec")
+    comp_periodicity_spatial = LazyMethod(
+        __package__, "..Methods.Machine.Machine.comp_periodicity_spatial"
+    )
+    comp_width_airgap_mag = LazyMethod(
+        __package__, "..Methods.Machine.Machine.comp_width_airgap_mag"
+    )
+    comp_width_airgap_mec = LazyMethod(
+        __package__, "..Methods.Machine.Machine.comp_width_airgap_mec"
+    )
+    get_material_dict = LazyMethod(
+        __package__, "..Methods.Machine.Machine.get_material_dict"
+    )
+    get_polar_eq = LazyMethod(__package__, "..Methods.Machine.Machine.get_polar_eq")
+    plot = LazyMethod(__package__, "..Methods.Machine.Machine.plot")
+    plot_anim_rotor = LazyMethod(
+        __package__, "..Methods.Machine.Machine.plot_anim_rotor"
+    )
+    get_lam_list = LazyMethod(__package__, "..Methods.Machine.Machine.get_lam_list")
+    get_lam_list_label = LazyMethod(
+        __package__, "..Methods.Machine.Machine.get_lam_list_label"
+    )
+    get_lam_by_label = LazyMethod(
+        __package__, "..Methods.Machine.Machine.get_lam_by_label"
+    )
+    get_lam_index = LazyMethod(__package__, "..Methods.Machine.Machine.get_lam_index")
+    get_pole_pair_number = LazyMethod(
+        __package__, "..Methods.Machine.Machine.get_pole_pair_number"
+    )
+    set_pole_pair_number = LazyMethod(
+        __package__, "..Methods.Machine.Machine.set_pole_pair_number"
+    )
+    comp_periodicity_time = LazyMethod(
+        __package__, "..Methods.Machine.Machine.comp_periodicity_time"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
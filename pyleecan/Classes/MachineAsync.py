@@ -7,27 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Machine import Machine
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.MachineAsync.is_synchronous import is_synchronous
-except ImportError as error:
-    is_synchronous = error
-
-try:
-    from ..Methods.Machine.MachineAsync.comp_desc_dict import comp_desc_dict
-except ImportError as error:
-    comp_desc_dict = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -37,31 +25,13 @@ class MachineAsync(Machine):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.MachineAsync.is_synchronous
-    if isinstance(is_synchronous, ImportError):
-        is_synchronous = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MachineAsync method is_synchronous: "
-                    + str(is_synchronous)
-                )
-            )
-        )
-    else:
-        is_synchronous = is_synchronous
-    # cf Methods.Machine.MachineAsync.comp_desc_dict
-    if isinstance(comp_desc_dict, ImportError):
-        comp_desc_dict = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MachineAsync method comp_desc_dict: "
-                    + str(comp_desc_dict)
-                )
-            )
-        )
-    else:
-        comp_desc_dict = comp_desc_dict
+    # Methods imported on first use to remove unnecessary dependencies
+    is_synchronous = LazyMethod(
+        __package__, "..Methods.Machine.MachineAsync.is_synchronous"
+    )
+    comp_desc_dict = LazyMethod(
+        __package__, "..Methods.Machine.MachineAsync.comp_desc_dict"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
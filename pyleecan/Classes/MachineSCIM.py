@@ -7,27 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .MachineDFIM import MachineDFIM
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.MachineSCIM.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Machine.MachineSCIM.get_machine_type import get_machine_type
-except ImportError as error:
-    get_machine_type = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -37,28 +25,11 @@ class MachineSCIM(MachineDFIM):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.MachineSCIM.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MachineSCIM method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Machine.MachineSCIM.get_machine_type
-    if isinstance(get_machine_type, ImportError):
-        get_machine_type = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MachineSCIM method get_machine_type: "
-                    + str(get_machine_type)
-                )
-            )
-        )
-    else:
-        get_machine_type = get_machine_type
+    # Methods imported on first use to remove unnecessary dependencies
+    check = LazyMethod(__package__, "..Methods.Machine.MachineSCIM.check")
+    get_machine_type = LazyMethod(
+        __package__, "..Methods.Machine.MachineSCIM.get_machine_type"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
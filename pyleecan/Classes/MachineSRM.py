@@ -7,37 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .MachineSync import MachineSync
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.MachineSRM.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Machine.MachineSRM.get_machine_type import get_machine_type
-except ImportError as error:
-    get_machine_type = error
-
-try:
-    from ..Methods.Machine.MachineSRM.get_pole_pair_number import get_pole_pair_number
-except ImportError as error:
-    get_pole_pair_number = error
-
-try:
-    from ..Methods.Machine.MachineSRM.set_pole_pair_number import set_pole_pair_number
-except ImportError as error:
-    set_pole_pair_number = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -47,52 +25,17 @@ class MachineSRM(MachineSync):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.MachineSRM.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MachineSRM method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Machine.MachineSRM.get_machine_type
-    if isinstance(get_machine_type, ImportError):
-        get_machine_type = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MachineSRM method get_machine_type: "
-                    + str(get_machine_type)
-                )
-            )
-        )
-    else:
-        get_machine_type = get_machine_type
-    # cf Methods.Machine.MachineSRM.get_pole_pair_number
-    if isinstance(get_pole_pair_number, ImportError):
-        get_pole_pair_number = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MachineSRM method get_pole_pair_number: "
-                    + str(get_pole_pair_number)
-                )
-            )
-        )
-    else:
-        get_pole_pair_number = get_pole_pair_number
-    # cf Methods.Machine.MachineSRM.set_pole_pair_number
-    if isinstance(set_pole_pair_number, ImportError):
-        set_pole_pair_number = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MachineSRM method set_pole_pair_number: "
-                    + str(set_pole_pair_number)
-                )
-            )
-        )
-    else:
-        set_pole_pair_number = set_pole_pair_number
+    # Methods imported on first use to remove unnecessary dependencies
+    check = LazyMethod(__package__, "..Methods.Machine.MachineSRM.check")
+    get_machine_type = LazyMethod(
+        __package__, "..Methods.Machine.MachineSRM.get_machine_type"
+    )
+    get_pole_pair_number = LazyMethod(
+        __package__, "..Methods.Machine.MachineSRM.get_pole_pair_number"
+    )
+    set_pole_pair_number = LazyMethod(
+        __package__, "..Methods.Machine.MachineSRM.set_pole_pair_number"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
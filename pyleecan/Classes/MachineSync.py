@@ -7,29 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Machine import Machine
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.MachineSync.is_synchronous import is_synchronous
-except ImportError as error:
-    is_synchronous = error
-
-try:
-    from ..Methods.Machine.MachineSync.comp_angle_rotor_initial import (
-        comp_angle_rotor_initial,
-    )
-except ImportError as error:
-    comp_angle_rotor_initial = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -39,31 +25,13 @@ class MachineSync(Machine):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.MachineSync.is_synchronous
-    if isinstance(is_synchronous, ImportError):
-        is_synchronous = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MachineSync method is_synchronous: "
-                    + str(is_synchronous)
-                )
-            )
-        )
-    else:
-        is_synchronous = is_synchronous
-    # cf Methods.Machine.MachineSync.comp_angle_rotor_initial
-    if isinstance(comp_angle_rotor_initial, ImportError):
-        comp_angle_rotor_initial = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MachineSync method comp_angle_rotor_initial: "
-                    + str(comp_angle_rotor_initial)
-                )
-            )
-        )
-    else:
-        comp_angle_rotor_initial = comp_angle_rotor_initial
+    # Methods imported on first use to remove unnecessary dependencies
+    is_synchronous = LazyMethod(
+        __package__, "..Methods.Machine.MachineSync.is_synchronous"
+    )
+    comp_angle_rotor_initial = LazyMethod(
+        __package__, "..Methods.Machine.MachineSync.comp_angle_rotor_initial"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
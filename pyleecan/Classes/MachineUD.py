@@ -7,27 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Machine import Machine
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.MachineUD.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from ..Methods.Machine.MachineUD.is_synchronous import is_synchronous
-except ImportError as error:
-    is_synchronous = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -37,29 +25,13 @@ class MachineUD(Machine):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.MachineUD.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MachineUD method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
-    # cf Methods.Machine.MachineUD.is_synchronous
-    if isinstance(is_synchronous, ImportError):
-        is_synchronous = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MachineUD method is_synchronous: " + str(is_synchronous)
-                )
-            )
-        )
-    else:
-        is_synchronous = is_synchronous
+    # Methods imported on first use to remove unnecessary dependencies
+    build_geometry = LazyMethod(
+        __package__, "..Methods.Machine.MachineUD.build_geometry"
+    )
+    is_synchronous = LazyMethod(
+        __package__, "..Methods.Machine.MachineUD.is_synchronous"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,47 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Magnetics import Magnetics
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.MagElmer.comp_flux_airgap import comp_flux_airgap
-except ImportError as error:
-    comp_flux_airgap = error
-
-try:
-    from ..Methods.Simulation.MagElmer.solve_FEA import solve_FEA
-except ImportError as error:
-    solve_FEA = error
-
-try:
-    from ..Methods.Simulation.MagElmer.get_meshsolution import get_meshsolution
-except ImportError as error:
-    get_meshsolution = error
-
-try:
-    from ..Methods.Simulation.MagElmer.get_path_save_fea import get_path_save_fea
-except ImportError as error:
-    get_path_save_fea = error
-
-try:
-    from ..Methods.Simulation.MagElmer.get_path_save import get_path_save
-except ImportError as error:
-    get_path_save = error
-
-try:
-    from ..Methods.Simulation.MagElmer.gen_elmer_mesh import gen_elmer_mesh
-except ImportError as error:
-    gen_elmer_mesh = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -57,74 +25,23 @@ class MagElmer(Magnetics):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.MagElmer.comp_flux_airgap
-    if isinstance(comp_flux_airgap, ImportError):
-        comp_flux_airgap = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MagElmer method comp_flux_airgap: "
-                    + str(comp_flux_airgap)
-                )
-            )
-        )
-    else:
-        comp_flux_airgap = comp_flux_airgap
-    # cf Methods.Simulation.MagElmer.solve_FEA
-    if isinstance(solve_FEA, ImportError):
-        solve_FEA = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MagElmer method solve_FEA: " + str(solve_FEA))
-            )
-        )
-    else:
-        solve_FEA = solve_FEA
-    # cf Methods.Simulation.MagElmer.get_meshsolution
-    if isinstance(get_meshsolution, ImportError):
-        get_meshsolution = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MagElmer method get_meshsolution: "
-                    + str(get_meshsolution)
-                )
-            )
-        )
-    else:
-        get_meshsolution = get_meshsolution
-    # cf Methods.Simulation.MagElmer.get_path_save_fea
-    if isinstance(get_path_save_fea, ImportError):
-        get_path_save_fea = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MagElmer method get_path_save_fea: "
-                    + str(get_path_save_fea)
-                )
-            )
-        )
-    else:
-        get_path_save_fea = get_path_save_fea
-    # cf Methods.Simulation.MagElmer.get_path_save
-    if isinstance(get_path_save, ImportError):
-        get_path_save = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MagElmer method get_path_save: " + str(get_path_save)
-                )
-            )
-        )
-    else:
-        get_path_save = get_path_save
-    # cf Methods.Simulation.MagElmer.gen_elmer_mesh
-    if isinstance(gen_elmer_mesh, ImportError):
-        gen_elmer_mesh = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MagElmer method gen_elmer_mesh: " + str(gen_elmer_mesh)
-                )
-            )
-        )
-    else:
-        gen_elmer_mesh = gen_elmer_mesh
+    # Methods imported on first use to remove unnecessary dependencies
+    comp_flux_airgap = LazyMethod(
+        __package__, "..Methods.Simulation.MagElmer.comp_flux_airgap"
+    )
+    solve_FEA = LazyMethod(__package__, "..Methods.Simulation.MagElmer.solve_FEA")
+    get_meshsolution = LazyMethod(
+        __package__, "..Methods.Simulation.MagElmer.get_meshsolution"
+    )
+    get_path_save_fea = LazyMethod(
+        __package__, "..Methods.Simulation.MagElmer.get_path_save_fea"
+    )
+    get_path_save = LazyMethod(
+        __package__, "..Methods.Simulation.MagElmer.get_path_save"
+    )
+    gen_elmer_mesh = LazyMethod(
+        __package__, "..Methods.Simulation.MagElmer.gen_elmer_mesh"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -163,6 +80,7 @@ class MagElmer(Magnetics):
         is_current_harm=True,
         T_mag=20,
         is_periodicity_rotor=False,
+        nb_worker_slice=1,
         init_dict=None,
         init_str=None,
     ):
@@ -241,6 +159,8 @@ class MagElmer(Magnetics):
                 T_mag = init_dict["T_mag"]
             if "is_periodicity_rotor" in list(init_dict.keys()):
                 is_periodicity_rotor = init_dict["is_periodicity_rotor"]
+            if "nb_worker_slice" in list(init_dict.keys()):
+                nb_worker_slice = init_dict["nb_worker_slice"]
         # Set the properties (value check and convertion are done in setter)
         self.Kmesh_fineness = Kmesh_fineness
         self.Kgeo_fineness = Kgeo_fineness
@@ -274,6 +194,7 @@ class MagElmer(Magnetics):
             is_current_harm=is_current_harm,
             T_mag=T_mag,
             is_periodicity_rotor=is_periodicity_rotor,
+            nb_worker_slice=nb_worker_slice,
         )
         # The class is frozen (in Magnetics init), for now it's impossible to
         # add new properties
@@ -7,47 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Magnetics import Magnetics
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.MagFEMM.comp_flux_airgap import comp_flux_airgap
-except ImportError as error:
-    comp_flux_airgap = error
-
-try:
-    from ..Methods.Simulation.MagFEMM.get_path_save import get_path_save
-except ImportError as error:
-    get_path_save = error
-
-try:
-    from ..Methods.Simulation.MagFEMM.solve_FEMM import solve_FEMM
-except ImportError as error:
-    solve_FEMM = error
-
-try:
-    from ..Methods.Simulation.MagFEMM.get_meshsolution import get_meshsolution
-except ImportError as error:
-    get_meshsolution = error
-
-try:
-    from ..Methods.Simulation.MagFEMM.get_path_save_fem import get_path_save_fem
-except ImportError as error:
-    get_path_save_fem = error
-
-try:
-    from ..Methods.Simulation.MagFEMM.solve_FEMM_parallel import solve_FEMM_parallel
-except ImportError as error:
-    solve_FEMM_parallel = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -57,75 +25,23 @@ class MagFEMM(Magnetics):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.MagFEMM.comp_flux_airgap
-    if isinstance(comp_flux_airgap, ImportError):
-        comp_flux_airgap = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MagFEMM method comp_flux_airgap: "
-                    + str(comp_flux_airgap)
-                )
-            )
-        )
-    else:
-        comp_flux_airgap = comp_flux_airgap
-    # cf Methods.Simulation.MagFEMM.get_path_save
-    if isinstance(get_path_save, ImportError):
-        get_path_save = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MagFEMM method get_path_save: " + str(get_path_save)
-                )
-            )
-        )
-    else:
-        get_path_save = get_path_save
-    # cf Methods.Simulation.MagFEMM.solve_FEMM
-    if isinstance(solve_FEMM, ImportError):
-        solve_FEMM = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MagFEMM method solve_FEMM: " + str(solve_FEMM))
-            )
-        )
-    else:
-        solve_FEMM = solve_FEMM
-    # cf Methods.Simulation.MagFEMM.get_meshsolution
-    if isinstance(get_meshsolution, ImportError):
-        get_meshsolution = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MagFEMM method get_meshsolution: "
-                    + str(get_meshsolution)
-                )
-            )
-        )
-    else:
-        get_meshsolution = get_meshsolution
-    # cf Methods.Simulation.MagFEMM.get_path_save_fem
-    if isinstance(get_path_save_fem, ImportError):
-        get_path_save_fem = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MagFEMM method get_path_save_fem: "
-                    + str(get_path_save_fem)
-                )
-            )
-        )
-    else:
-        get_path_save_fem = get_path_save_fem
-    # cf Methods.Simulation.MagFEMM.solve_FEMM_parallel
-    if isinstance(solve_FEMM_parallel, ImportError):
-        solve_FEMM_parallel = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MagFEMM method solve_FEMM_parallel: "
-                    + str(solve_FEMM_parallel)
-                )
-            )
-        )
-    else:
-        solve_FEMM_parallel = solve_FEMM_parallel
+    # Methods imported on first use to remove unnecessary dependencies
+    comp_flux_airgap = LazyMethod(
+        __package__, "..Methods.Simulation.MagFEMM.comp_flux_airgap"
+    )
+    get_path_save = LazyMethod(
+        __package__, "..Methods.Simulation.MagFEMM.get_path_save"
+    )
+    solve_FEMM = LazyMethod(__package__, "..Methods.Simulation.MagFEMM.solve_FEMM")
+    get_meshsolution = LazyMethod(
+        __package__, "..Methods.Simulation.MagFEMM.get_meshsolution"
+    )
+    get_path_save_fem = LazyMethod(
+        __package__, "..Methods.Simulation.MagFEMM.get_path_save_fem"
+    )
+    solve_FEMM_parallel = LazyMethod(
+        __package__, "..Methods.Simulation.MagFEMM.solve_FEMM_parallel"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -171,6 +87,7 @@ class MagFEMM(Magnetics):
         is_current_harm=True,
         T_mag=20,
         is_periodicity_rotor=False,
+        nb_worker_slice=1,
         init_dict=None,
         init_str=None,
     ):
@@ -263,6 +180,8 @@ class MagFEMM(Magnetics):
                 T_mag = init_dict["T_mag"]
             if "is_periodicity_rotor" in list(init_dict.keys()):
                 is_periodicity_rotor = init_dict["is_periodicity_rotor"]
+            if "nb_worker_slice" in list(init_dict.keys()):
+                nb_worker_slice = init_dict["nb_worker_slice"]
         # Set the properties (value check and convertion are done in setter)
         self.Kmesh_fineness = Kmesh_fineness
         self.Kgeo_fineness = Kgeo_fineness
@@ -303,6 +222,7 @@ class MagFEMM(Magnetics):
             is_current_harm=is_current_harm,
             T_mag=T_mag,
             is_periodicity_rotor=is_periodicity_rotor,
+            nb_worker_slice=nb_worker_slice,
         )
         # The class is frozen (in Magnetics init), for now it's impossible to
         # add new properties
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+# File generated according to Generator/ClassesRef/Simulation/MagPMMF.csv
+# WARNING! All changes made in this file will be lost!
+"""Method code available at https://github.com/Eomys/pyleecan/tree/master/pyleecan/Methods/Simulation/MagPMMF
+"""
+
+from os import linesep
+from sys import getsizeof
+from logging import getLogger
+from ._check import check_var
+from ..Functions.get_logger import get_logger
+from ..Functions.save import save
+from ..Functions.copy import copy
+from ..Functions.load import load_init_dict
+from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
+from .Magnetics import Magnetics
+
+from numpy import isnan
+from ._check import InitUnKnowClassError
+
+
+class MagPMMF(Magnetics):
+    """Magnetic module: analytical model of the airgap field (2D harmonic solution of the slotless airgap with magnets and winding current sheets, slotting effect with relative permeance functions)"""
+
+    VERSION = 1
+
+    # Methods imported on first use to remove unnecessary dependencies
+    comp_flux_airgap = LazyMethod(
+        __package__, "..Methods.Simulation.MagPMMF.comp_flux_airgap"
+    )
+    comp_magnetization = LazyMethod(
+        __package__, "..Methods.Simulation.MagPMMF.comp_magnetization"
+    )
+    comp_permeance_slot = LazyMethod(
+        __package__, "..Methods.Simulation.MagPMMF.comp_permeance_slot"
+    )
+    solve_field_harm = LazyMethod(
+        __package__, "..Methods.Simulation.MagPMMF.solve_field_harm"
+    )
+    # save and copy methods are available in all object
+    save = save
+    copy = copy
+    # get_logger method is available in all object
+    get_logger = get_logger
+
+    def __init__(
+        self,
+        Nharm_max=None,
+        Rag_enforced=None,
+        is_remove_slotS=False,
+        is_remove_slotR=False,
+        is_remove_ventS=False,
+        is_remove_ventR=False,
+        is_mmfs=True,
+        is_mmfr=True,
+        type_BH_stator=0,
+        type_BH_rotor=0,
+        is_periodicity_t=False,
+        is_periodicity_a=False,
+        angle_stator_shift=0,
+        angle_rotor_shift=0,
+        logger_name="Pyleecan.Magnetics",
+        Slice_enforced=None,
+        Nslices_enforced=None,
+        type_distribution_enforced=None,
+        is_current_harm=True,
+        T_mag=20,
+        is_periodicity_rotor=False,
+        nb_worker_slice=1,
+        init_dict=None,
+        init_str=None,
+    ):
+        """Constructor of the class. Can be use in three ways :
+        - __init__ (arg1 = 1, arg3 = 5) every parameters have name and default values
+            for pyleecan type, -1 will call the default constructor
+        - __init__ (init_dict = d) d must be a dictionary with property names as keys
+        - __init__ (init_str = s) s must be a string
+        s is the file path to load
+
+        ndarray or list can be given for Vector and Matrix
+        object or dict can be given for pyleecan Object"""
+
+        if init_str is not None:  # Load from a file
+            init_dict = load_init_dict(init_str)[1]
+        if init_dict is not None:  # Initialisation by dict
+            assert type(init_dict) is dict
+            # Overwrite default value with init_dict content
+            if "Nharm_max" in list(init_dict.keys()):
+                Nharm_max = init_dict["Nharm_max"]
+            if "Rag_enforced" in list(init_dict.keys()):
+                Rag_enforced = init_dict["Rag_enforced"]
+            if "is_remove_slotS" in list(init_dict.keys()):
+                is_remove_slotS = init_dict["is_remove_slotS"]
+            if "is_remove_slotR" in list(init_dict.keys()):
+                is_remove_slotR = init_dict["is_remove_slotR"]
+            if "is_remove_ventS" in list(init_dict.keys()):
+                is_remove_ventS = init_dict["is_remove_ventS"]
+            if "is_remove_ventR" in list(init_dict.keys()):
+                is_remove_ventR = init_dict["is_remove_ventR"]
+            if "is_mmfs" in list(init_dict.keys()):
+                is_mmfs = init_dict["is_mmfs"]
+            if "is_mmfr" in list(init_dict.keys()):
+                is_mmfr = init_dict["is_mmfr"]
+            if "type_BH_stator" in list(init_dict.keys()):
+                type_BH_stator = init_dict["type_BH_stator"]
+            if "type_BH_rotor" in list(init_dict.keys()):
+                type_BH_rotor = init_dict["type_BH_rotor"]
+            if "is_periodicity_t" in list(init_dict.keys()):
+                is_periodicity_t = init_dict["is_periodicity_t"]
+            if "is_periodicity_a" in list(init_dict.keys()):
+                is_periodicity_a = init_dict["is_periodicity_a"]
+            if "angle_stator_shift" in list(init_dict.keys()):
+                angle_stator_shift = init_dict["angle_stator_shift"]
+            if "angle_rotor_shift" in list(init_dict.keys()):
+                angle_rotor_shift = init_dict["angle_rotor_shift"]
+            if "logger_name" in list(init_dict.keys()):
+                logger_name = init_dict["logger_name"]
+            if "Slice_enforced" in list(init_dict.keys()):
+                Slice_enforced = init_dict["Slice_enforced"]
+            if "Nslices_enforced" in list(init_dict.keys()):
+                Nslices_enforced = init_dict["Nslices_enforced"]
+            if "type_distribution_enforced" in list(init_dict.keys()):
+                type_distribution_enforced = init_dict["type_distribution_enforced"]
+            if "is_current_harm" in list(init_dict.keys()):
+                is_current_harm = init_dict["is_current_harm"]
+            if "T_mag" in list(init_dict.keys()):
+                T_mag = init_dict["T_mag"]
+            if "is_periodicity_rotor" in list(init_dict.keys()):
+                is_periodicity_rotor = init_dict["is_periodicity_rotor"]
+            if "nb_worker_slice" in list(init_dict.keys()):
+                nb_worker_slice = init_dict["nb_worker_slice"]
+        # Set the properties (value check and convertion are done in setter)
+        self.Nharm_max = Nharm_max
+        self.Rag_enforced = Rag_enforced
+        # Call Magnetics init
+        super(MagPMMF, self).__init__(
+            is_remove_slotS=is_remove_slotS,
+            is_remove_slotR=is_remove_slotR,
+            is_remove_ventS=is_remove_ventS,
+            is_remove_ventR=is_remove_ventR,
+            is_mmfs=is_mmfs,
+            is_mmfr=is_mmfr,
+            type_BH_stator=type_BH_stator,
+            type_BH_rotor=type_BH_rotor,
+            is_periodicity_t=is_periodicity_t,
+            is_periodicity_a=is_periodicity_a,
+            angle_stator_shift=angle_stator_shift,
+            angle_rotor_shift=angle_rotor_shift,
+            logger_name=logger_name,
+            Slice_enforced=Slice_enforced,
+            Nslices_enforced=Nslices_enforced,
+            type_distribution_enforced=type_distribution_enforced,
+            is_current_harm=is_current_harm,
+            T_mag=T_mag,
+            is_periodicity_rotor=is_periodicity_rotor,
+            nb_worker_slice=nb_worker_slice,
+        )
+        # The class is frozen (in Magnetics init), for now it's impossible to
+        # add new properties
+
+    def __str__(self):
+        """Convert this object in a readeable string (for print)"""
+
+        MagPMMF_str = ""
+        # Get the properties inherited from Magnetics
+        MagPMMF_str += super(MagPMMF, self).__str__()
+        MagPMMF_str += "Nharm_max = " + str(self.Nharm_max) + linesep
+        MagPMMF_str += "Rag_enforced = " + str(self.Rag_enforced) + linesep
+        return MagPMMF_str
+
+    def __eq__(self, other):
+        """Compare two objects (skip parent)"""
+
+        if type(other) != type(self):
+            return False
+
+        # Check the properties inherited from Magnetics
+        if not super(MagPMMF, self).__eq__(other):
+            return False
+        if other.Nharm_max != self.Nharm_max:
+            return False
+        if other.Rag_enforced != self.Rag_enforced:
+            return False
+        return True
+
+    def compare(self, other, name="self", ignore_list=None, is_add_value=False):
+        """Compare two objects and return list of differences"""
+
+        if ignore_list is None:
+            ignore_list = list()
+        if type(other) != type(self):
+            return ["type(" + name + ")"]
+        diff_list = list()
+
+        # Check the properties inherited from Magnetics
+        diff_list.extend(
+            super(MagPMMF, self).compare(
+                other, name=name, ignore_list=ignore_list, is_add_value=is_add_value
+            )
+        )
+        if other._Nharm_max != self._Nharm_max:
+            if is_add_value:
+                val_str = (
+                    " (self="
+                    + str(self._Nharm_max)
+                    + ", other="
+                    + str(other._Nharm_max)
+                    + ")"
+                )
+                diff_list.append(name + ".Nharm_max" + val_str)
+            else:
+                diff_list.append(name + ".Nharm_max")
+        if (
+            other._Rag_enforced is not None
+            and self._Rag_enforced is not None
+            and isnan(other._Rag_enforced)
+            and isnan(self._Rag_enforced)
+        ):
+            pass
+        elif other._Rag_enforced != self._Rag_enforced:
+            if is_add_value:
+                val_str = (
+                    " (self="
+                    + str(self._Rag_enforced)
+                    + ", other="
+                    + str(other._Rag_enforced)
+                    + ")"
+                )
+                diff_list.append(name + ".Rag_enforced" + val_str)
+            else:
+                diff_list.append(name + ".Rag_enforced")
+        # Filter ignore differences
+        diff_list = list(filter(lambda x: x not in ignore_list, diff_list))
+        return diff_list
+
+    def __sizeof__(self):
+        """Return the size in memory of the object (including all subobject)"""
+
+        S = 0  # Full size of the object
+
+        # Get size of the properties inherited from Magnetics
+        S += super(MagPMMF, self).__sizeof__()
+        S += getsizeof(self.Nharm_max)
+        S += getsizeof(self.Rag_enforced)
+        return S
+
+    def as_dict(self, type_handle_ndarray=0, keep_function=False, **kwargs):
+        """
+        Convert this object in a json serializable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        keep_function : bool
+            True to keep the function object, else return str
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
+
+        # Get the properties inherited from Magnetics
+        MagPMMF_dict = super(MagPMMF, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray,
+            keep_function=keep_function,
+            **kwargs
+        )
+        MagPMMF_dict["Nharm_max"] = self.Nharm_max
+        MagPMMF_dict["Rag_enforced"] = self.Rag_enforced
+        # The class name is added to the dict for deserialisation purpose
+        # Overwrite the mother class name
+        MagPMMF_dict["__class__"] = "MagPMMF"
+        return MagPMMF_dict
+
+    def _set_None(self):
+        """Set all the properties to None (except pyleecan object)"""
+
+        self.Nharm_max = None
+        self.Rag_enforced = None
+        # Set to None the properties inherited from Magnetics
+        super(MagPMMF, self)._set_None()
+
+    def _get_Nharm_max(self):
+        """getter of Nharm_max"""
+        return self._Nharm_max
+
+    def _set_Nharm_max(self, value):
+        """setter of Nharm_max"""
+        check_var("Nharm_max", value, "int", Vmin=1)
+        self._Nharm_max = value
+
+    Nharm_max = property(
+        fget=_get_Nharm_max,
+        fset=_set_Nharm_max,
+        doc=u"""Maximum spatial harmonic order of the airgap flux density (None to use half of the number of angular points)
+
+        :Type: int
+        :min: 1
+        """,
+    )
+
+    def _get_Rag_enforced(self):
+        """getter of Rag_enforced"""
+        return self._Rag_enforced
+
+    def _set_Rag_enforced(self, value):
+        """setter of Rag_enforced"""
+        check_var("Rag_enforced", value, "float")
+        self._Rag_enforced = value
+
+    Rag_enforced = property(
+        fget=_get_Rag_enforced,
+        fset=_set_Rag_enforced,
+        doc=u"""To enforce a different radius value for air-gap outputs
+
+        :Type: float
+        """,
+    )
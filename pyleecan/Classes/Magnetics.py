@@ -7,37 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.Magnetics.run import run
-except ImportError as error:
-    run = error
-
-try:
-    from ..Methods.Simulation.Magnetics.comp_axes import comp_axes
-except ImportError as error:
-    comp_axes = error
-
-try:
-    from ..Methods.Simulation.Magnetics.get_slice_model import get_slice_model
-except ImportError as error:
-    get_slice_model = error
-
-try:
-    from ..Methods.Simulation.Magnetics.comp_I_mag import comp_I_mag
-except ImportError as error:
-    comp_I_mag = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -47,46 +25,16 @@ class Magnetics(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.Magnetics.run
-    if isinstance(run, ImportError):
-        run = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Magnetics method run: " + str(run))
-            )
-        )
-    else:
-        run = run
-    # cf Methods.Simulation.Magnetics.comp_axes
-    if isinstance(comp_axes, ImportError):
-        comp_axes = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Magnetics method comp_axes: " + str(comp_axes))
-            )
-        )
-    else:
-        comp_axes = comp_axes
-    # cf Methods.Simulation.Magnetics.get_slice_model
-    if isinstance(get_slice_model, ImportError):
-        get_slice_model = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Magnetics method get_slice_model: "
-                    + str(get_slice_model)
-                )
-            )
-        )
-    else:
-        get_slice_model = get_slice_model
-    # cf Methods.Simulation.Magnetics.comp_I_mag
-    if isinstance(comp_I_mag, ImportError):
-        comp_I_mag = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Magnetics method comp_I_mag: " + str(comp_I_mag))
-            )
-        )
-    else:
-        comp_I_mag = comp_I_mag
+    # Methods imported on first use to remove unnecessary dependencies
+    run = LazyMethod(__package__, "..Methods.Simulation.Magnetics.run")
+    comp_axes = LazyMethod(__package__, "..Methods.Simulation.Magnetics.comp_axes")
+    get_slice_model = LazyMethod(
+        __package__, "..Methods.Simulation.Magnetics.get_slice_model"
+    )
+    comp_I_mag = LazyMethod(__package__, "..Methods.Simulation.Magnetics.comp_I_mag")
+    comp_flux_airgap_parallel = LazyMethod(
+        __package__, "..Methods.Simulation.Magnetics.comp_flux_airgap_parallel"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -114,6 +62,7 @@ class Magnetics(FrozenClass):
         is_current_harm=True,
         T_mag=20,
         is_periodicity_rotor=False,
+        nb_worker_slice=1,
         init_dict=None,
         init_str=None,
     ):
@@ -170,6 +119,8 @@ class Magnetics(FrozenClass):
                 T_mag = init_dict["T_mag"]
             if "is_periodicity_rotor" in list(init_dict.keys()):
                 is_periodicity_rotor = init_dict["is_periodicity_rotor"]
+            if "nb_worker_slice" in list(init_dict.keys()):
+                nb_worker_slice = init_dict["nb_worker_slice"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
         self.is_remove_slotS = is_remove_slotS
@@ -191,6 +142,7 @@ class Magnetics(FrozenClass):
         self.is_current_harm = is_current_harm
         self.T_mag = T_mag
         self.is_periodicity_rotor = is_periodicity_rotor
+        self.nb_worker_slice = nb_worker_slice
 
         # The class is frozen, for now it's impossible to add new properties
         self._freeze()
@@ -239,6 +191,7 @@ class Magnetics(FrozenClass):
         Magnetics_str += (
             "is_periodicity_rotor = " + str(self.is_periodicity_rotor) + linesep
         )
+        Magnetics_str += "nb_worker_slice = " + str(self.nb_worker_slice) + linesep
         return Magnetics_str
 
     def __eq__(self, other):
@@ -284,6 +237,8 @@ class Magnetics(FrozenClass):
             return False
         if other.is_periodicity_rotor != self.is_periodicity_rotor:
             return False
+        if other.nb_worker_slice != self.nb_worker_slice:
+            return False
         return True
 
     def compare(self, other, name="self", ignore_list=None, is_add_value=False):
@@ -540,6 +495,18 @@ class Magnetics(FrozenClass):
                 diff_list.append(name + ".is_periodicity_rotor" + val_str)
             else:
                 diff_list.append(name + ".is_periodicity_rotor")
+        if other._nb_worker_slice != self._nb_worker_slice:
+            if is_add_value:
+                val_str = (
+                    " (self="
+                    + str(self._nb_worker_slice)
+                    + ", other="
+                    + str(other._nb_worker_slice)
+                    + ")"
+                )
+                diff_list.append(name + ".nb_worker_slice" + val_str)
+            else:
+                diff_list.append(name + ".nb_worker_slice")
         # Filter ignore differences
         diff_list = list(filter(lambda x: x not in ignore_list, diff_list))
         return diff_list
@@ -567,6 +534,7 @@ class Magnetics(FrozenClass):
         S += getsizeof(self.is_current_harm)
         S += getsizeof(self.T_mag)
         S += getsizeof(self.is_periodicity_rotor)
+        S += getsizeof(self.nb_worker_slice)
         return S
 
     def as_dict(self, type_handle_ndarray=0, keep_function=False, **kwargs):
@@ -607,6 +575,7 @@ class Magnetics(FrozenClass):
         Magnetics_dict["is_current_harm"] = self.is_current_harm
         Magnetics_dict["T_mag"] = self.T_mag
         Magnetics_dict["is_periodicity_rotor"] = self.is_periodicity_rotor
+        Magnetics_dict["nb_worker_slice"] = self.nb_worker_slice
         # The class name is added to the dict for deserialisation purpose
         Magnetics_dict["__class__"] = "Magnetics"
         return Magnetics_dict
@@ -634,6 +603,7 @@ class Magnetics(FrozenClass):
         self.is_current_harm = None
         self.T_mag = None
         self.is_periodicity_rotor = None
+        self.nb_worker_slice = None
 
     def _get_is_remove_slotS(self):
         """getter of is_remove_slotS"""
@@ -1001,3 +971,22 @@ class Magnetics(FrozenClass):
         :Type: bool
         """,
     )
+
+    def _get_nb_worker_slice(self):
+        """getter of nb_worker_slice"""
+        return self._nb_worker_slice
+
+    def _set_nb_worker_slice(self, value):
+        """setter of nb_worker_slice"""
+        check_var("nb_worker_slice", value, "int", Vmin=1)
+        self._nb_worker_slice = value
+
+    nb_worker_slice = property(
+        fget=_get_nb_worker_slice,
+        fset=_set_nb_worker_slice,
+        doc=u"""To solve the slices in parallel with a process pool (the parallelization is on the slice loop)
+
+        :Type: int
+        :min: 1
+        """,
+    )
@@ -7,27 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Material.MatElectrical.get_conductivity import get_conductivity
-except ImportError as error:
-    get_conductivity = error
-
-try:
-    from ..Methods.Material.MatElectrical.get_resistivity import get_resistivity
-except ImportError as error:
-    get_resistivity = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -37,31 +25,13 @@ class MatElectrical(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Material.MatElectrical.get_conductivity
-    if isinstance(get_conductivity, ImportError):
-        get_conductivity = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MatElectrical method get_conductivity: "
-                    + str(get_conductivity)
-                )
-            )
-        )
-    else:
-        get_conductivity = get_conductivity
-    # cf Methods.Material.MatElectrical.get_resistivity
-    if isinstance(get_resistivity, ImportError):
-        get_resistivity = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MatElectrical method get_resistivity: "
-                    + str(get_resistivity)
-                )
-            )
-        )
-    else:
-        get_resistivity = get_resistivity
+    # Methods imported on first use to remove unnecessary dependencies
+    get_conductivity = LazyMethod(
+        __package__, "..Methods.Material.MatElectrical.get_conductivity"
+    )
+    get_resistivity = LazyMethod(
+        __package__, "..Methods.Material.MatElectrical.get_resistivity"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
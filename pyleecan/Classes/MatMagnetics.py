@@ -7,37 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Material.MatMagnetics.get_BH import get_BH
-except ImportError as error:
-    get_BH = error
-
-try:
-    from ..Methods.Material.MatMagnetics.plot_BH import plot_BH
-except ImportError as error:
-    plot_BH = error
-
-try:
-    from ..Methods.Material.MatMagnetics.get_Hc import get_Hc
-except ImportError as error:
-    get_Hc = error
-
-try:
-    from ..Methods.Material.MatMagnetics.get_Brm import get_Brm
-except ImportError as error:
-    get_Brm = error
-
-
 from ..Classes.ImportMatrixVal import ImportMatrixVal
 from numpy import ndarray
 from numpy import array, array_equal
@@ -50,43 +28,11 @@ class MatMagnetics(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Material.MatMagnetics.get_BH
-    if isinstance(get_BH, ImportError):
-        get_BH = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MatMagnetics method get_BH: " + str(get_BH))
-            )
-        )
-    else:
-        get_BH = get_BH
-    # cf Methods.Material.MatMagnetics.plot_BH
-    if isinstance(plot_BH, ImportError):
-        plot_BH = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MatMagnetics method plot_BH: " + str(plot_BH))
-            )
-        )
-    else:
-        plot_BH = plot_BH
-    # cf Methods.Material.MatMagnetics.get_Hc
-    if isinstance(get_Hc, ImportError):
-        get_Hc = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MatMagnetics method get_Hc: " + str(get_Hc))
-            )
-        )
-    else:
-        get_Hc = get_Hc
-    # cf Methods.Material.MatMagnetics.get_Brm
-    if isinstance(get_Brm, ImportError):
-        get_Brm = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MatMagnetics method get_Brm: " + str(get_Brm))
-            )
-        )
-    else:
-        get_Brm = get_Brm
+    # Methods imported on first use to remove unnecessary dependencies
+    get_BH = LazyMethod(__package__, "..Methods.Material.MatMagnetics.get_BH")
+    plot_BH = LazyMethod(__package__, "..Methods.Material.MatMagnetics.plot_BH")
+    get_Hc = LazyMethod(__package__, "..Methods.Material.MatMagnetics.get_Hc")
+    get_Brm = LazyMethod(__package__, "..Methods.Material.MatMagnetics.get_Brm")
     # save and copy methods are available in all object
     save = save
     copy = copy
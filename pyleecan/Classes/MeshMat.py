@@ -7,82 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Mesh import Mesh
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Mesh.MeshMat.get_node import get_node
-except ImportError as error:
-    get_node = error
-
-try:
-    from ..Methods.Mesh.MeshMat.get_node_indice import get_node_indice
-except ImportError as error:
-    get_node_indice = error
-
-try:
-    from ..Methods.Mesh.MeshMat.get_cell import get_cell
-except ImportError as error:
-    get_cell = error
-
-try:
-    from ..Methods.Mesh.MeshMat.get_mesh_pv import get_mesh_pv
-except ImportError as error:
-    get_mesh_pv = error
-
-try:
-    from ..Methods.Mesh.MeshMat.get_cell_area import get_cell_area
-except ImportError as error:
-    get_cell_area = error
-
-try:
-    from ..Methods.Mesh.MeshMat.get_vertice import get_vertice
-except ImportError as error:
-    get_vertice = error
-
-try:
-    from ..Methods.Mesh.MeshMat.get_node2cell import get_node2cell
-except ImportError as error:
-    get_node2cell = error
-
-try:
-    from ..Methods.Mesh.MeshMat.add_cell import add_cell
-except ImportError as error:
-    add_cell = error
-
-try:
-    from ..Methods.Mesh.MeshMat.renum import renum
-except ImportError as error:
-    renum = error
-
-try:
-    from ..Methods.Mesh.MeshMat.find_cell import find_cell
-except ImportError as error:
-    find_cell = error
-
-try:
-    from ..Methods.Mesh.MeshMat.interface import interface
-except ImportError as error:
-    interface = error
-
-try:
-    from ..Methods.Mesh.MeshMat.clear_node import clear_node
-except ImportError as error:
-    clear_node = error
-
-try:
-    from ..Methods.Mesh.MeshMat.clear_cell import clear_cell
-except ImportError as error:
-    clear_cell = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -92,130 +25,30 @@ class MeshMat(Mesh):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Mesh.MeshMat.get_node
-    if isinstance(get_node, ImportError):
-        get_node = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MeshMat method get_node: " + str(get_node))
-            )
-        )
-    else:
-        get_node = get_node
-    # cf Methods.Mesh.MeshMat.get_node_indice
-    if isinstance(get_node_indice, ImportError):
-        get_node_indice = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MeshMat method get_node_indice: " + str(get_node_indice)
-                )
-            )
-        )
-    else:
-        get_node_indice = get_node_indice
-    # cf Methods.Mesh.MeshMat.get_cell
-    if isinstance(get_cell, ImportError):
-        get_cell = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MeshMat method get_cell: " + str(get_cell))
-            )
-        )
-    else:
-        get_cell = get_cell
-    # cf Methods.Mesh.MeshMat.get_mesh_pv
-    if isinstance(get_mesh_pv, ImportError):
-        get_mesh_pv = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MeshMat method get_mesh_pv: " + str(get_mesh_pv))
-            )
-        )
-    else:
-        get_mesh_pv = get_mesh_pv
-    # cf Methods.Mesh.MeshMat.get_cell_area
-    if isinstance(get_cell_area, ImportError):
-        get_cell_area = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MeshMat method get_cell_area: " + str(get_cell_area)
-                )
-            )
-        )
-    else:
-        get_cell_area = get_cell_area
-    # cf Methods.Mesh.MeshMat.get_vertice
-    if isinstance(get_vertice, ImportError):
-        get_vertice = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MeshMat method get_vertice: " + str(get_vertice))
-            )
-        )
-    else:
-        get_vertice = get_vertice
-    # cf Methods.Mesh.MeshMat.get_node2cell
-    if isinstance(get_node2cell, ImportError):
-        get_node2cell = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MeshMat method get_node2cell: " + str(get_node2cell)
-                )
-            )
-        )
-    else:
-        get_node2cell = get_node2cell
-    # cf Methods.Mesh.MeshMat.add_cell
-    if isinstance(add_cell, ImportError):
-        add_cell = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MeshMat method add_cell: " + str(add_cell))
-            )
-        )
-    else:
-        add_cell = add_cell
-    # cf Methods.Mesh.MeshMat.renum
-    if isinstance(renum, ImportError):
-        renum = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MeshMat method renum: " + str(renum))
-            )
-        )
-    else:
-        renum = renum
-    # cf Methods.Mesh.MeshMat.find_cell
-    if isinstance(find_cell, ImportError):
-        find_cell = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MeshMat method find_cell: " + str(find_cell))
-            )
-        )
-    else:
-        find_cell = find_cell
-    # cf Methods.Mesh.MeshMat.interface
-    if isinstance(interface, ImportError):
-        interface = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MeshMat method interface: " + str(interface))
-            )
-        )
-    else:
-        interface = interface
-    # cf Methods.Mesh.MeshMat.clear_node
-    if isinstance(clear_node, ImportError):
-        clear_node = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MeshMat method clear_node: " + str(clear_node))
-            )
-        )
-    else:
-        clear_node = clear_node
-    # cf Methods.Mesh.MeshMat.clear_cell
-    if isinstance(clear_cell, ImportError):
-        clear_cell = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MeshMat method clear_cell: " + str(clear_cell))
-            )
-        )
-    else:
-        clear_cell = clear_cell
+    # Methods imported on first use to remove unnecessary dependencies
+    get_node = LazyMethod(__package__, "..Methods.Mesh.MeshMat.get_node")
+    get_node_indice = LazyMethod(__package__, "..Methods.Mesh.MeshMat.get_node_indice")
+    get_cell = LazyMethod(__package__, "..Methods.Mesh.MeshMat.get_cell")
+    get_mesh_pv = LazyMethod(__package__, "..Methods.Mesh.MeshMat.get_mesh_pv")
+    get_cell_area = LazyMethod(__package__, "..Methods.Mesh.MeshMat.get_cell_area")
+    get_vertice = LazyMethod(__package__, "..Methods.Mesh.MeshMat.get_vertice")
+    get_node2cell = LazyMethod(__package__, "..Methods.Mesh.MeshMat.get_node2cell")
+    add_cell = LazyMethod(__package__, "..Methods.Mesh.MeshMat.add_cell")
+    renum = LazyMethod(__package__, "..Methods.Mesh.MeshMat.renum")
+    find_cell = LazyMethod(__package__, "..Methods.Mesh.MeshMat.find_cell")
+    interface = LazyMethod(__package__, "..Methods.Mesh.MeshMat.interface")
+    clear_node = LazyMethod(__package__, "..Methods.Mesh.MeshMat.clear_node")
+    clear_cell = LazyMethod(__package__, "..Methods.Mesh.MeshMat.clear_cell")
+    add_cells = LazyMethod(__package__, "..Methods.Mesh.MeshMat.add_cells")
+    get_edge2cell = LazyMethod(__package__, "..Methods.Mesh.MeshMat.get_edge2cell")
+    find_cells = LazyMethod(__package__, "..Methods.Mesh.MeshMat.find_cells")
+    _get_locator = LazyMethod(__package__, "..Methods.Mesh.MeshMat._get_locator")
+    _get_geometry = LazyMethod(__package__, "..Methods.Mesh.MeshMat._get_geometry")
+    get_cell_center = LazyMethod(__package__, "..Methods.Mesh.MeshMat.get_cell_center")
+    get_cell_jacobian = LazyMethod(
+        __package__, "..Methods.Mesh.MeshMat.get_cell_jacobian"
+    )
+    get_edge_normal = LazyMethod(__package__, "..Methods.Mesh.MeshMat.get_edge_normal")
     # save and copy methods are available in all object
     save = save
     copy = copy
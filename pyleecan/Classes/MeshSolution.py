@@ -7,77 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Mesh.MeshSolution.get_mesh import get_mesh
-except ImportError as error:
-    get_mesh = error
-
-try:
-    from ..Methods.Mesh.MeshSolution.get_solution import get_solution
-except ImportError as error:
-    get_solution = error
-
-try:
-    from ..Methods.Mesh.MeshSolution.get_field import get_field
-except ImportError as error:
-    get_field = error
-
-try:
-    from ..Methods.Mesh.MeshSolution.get_group import get_group
-except ImportError as error:
-    get_group = error
-
-try:
-    from ..Methods.Mesh.MeshSolution.get_mesh_field_pv import get_mesh_field_pv
-except ImportError as error:
-    get_mesh_field_pv = error
-
-try:
-    from ..Methods.Mesh.MeshSolution.plot_mesh import plot_mesh
-except ImportError as error:
-    plot_mesh = error
-
-try:
-    from ..Methods.Mesh.MeshSolution.plot_contour import plot_contour
-except ImportError as error:
-    plot_contour = error
-
-try:
-    from ..Methods.Mesh.MeshSolution.plot_deflection import plot_deflection
-except ImportError as error:
-    plot_deflection = error
-
-try:
-    from ..Methods.Mesh.MeshSolution.plot_glyph import plot_glyph
-except ImportError as error:
-    plot_glyph = error
-
-try:
-    from ..Methods.Mesh.MeshSolution.perm_coord import perm_coord
-except ImportError as error:
-    perm_coord = error
-
-try:
-    from ..Methods.Mesh.MeshSolution.get_deflection import get_deflection
-except ImportError as error:
-    get_deflection = error
-
-try:
-    from ..Methods.Mesh.MeshSolution.get_glyph import get_glyph
-except ImportError as error:
-    get_glyph = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -87,140 +25,26 @@ class MeshSolution(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Mesh.MeshSolution.get_mesh
-    if isinstance(get_mesh, ImportError):
-        get_mesh = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MeshSolution method get_mesh: " + str(get_mesh))
-            )
-        )
-    else:
-        get_mesh = get_mesh
-    # cf Methods.Mesh.MeshSolution.get_solution
-    if isinstance(get_solution, ImportError):
-        get_solution = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MeshSolution method get_solution: " + str(get_solution)
-                )
-            )
-        )
-    else:
-        get_solution = get_solution
-    # cf Methods.Mesh.MeshSolution.get_field
-    if isinstance(get_field, ImportError):
-        get_field = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MeshSolution method get_field: " + str(get_field)
-                )
-            )
-        )
-    else:
-        get_field = get_field
-    # cf Methods.Mesh.MeshSolution.get_group
-    if isinstance(get_group, ImportError):
-        get_group = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MeshSolution method get_group: " + str(get_group)
-                )
-            )
-        )
-    else:
-        get_group = get_group
-    # cf Methods.Mesh.MeshSolution.get_mesh_field_pv
-    if isinstance(get_mesh_field_pv, ImportError):
-        get_mesh_field_pv = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MeshSolution method get_mesh_field_pv: "
-                    + str(get_mesh_field_pv)
-                )
-            )
-        )
-    else:
-        get_mesh_field_pv = get_mesh_field_pv
-    # cf Methods.Mesh.MeshSolution.plot_mesh
-    if isinstance(plot_mesh, ImportError):
-        plot_mesh = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MeshSolution method plot_mesh: " + str(plot_mesh)
-                )
-            )
-        )
-    else:
-        plot_mesh = plot_mesh
-    # cf Methods.Mesh.MeshSolution.plot_contour
-    if isinstance(plot_contour, ImportError):
-        plot_contour = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MeshSolution method plot_contour: " + str(plot_contour)
-                )
-            )
-        )
-    else:
-        plot_contour = plot_contour
-    # cf Methods.Mesh.MeshSolution.plot_deflection
-    if isinstance(plot_deflection, ImportError):
-        plot_deflection = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MeshSolution method plot_deflection: "
-                    + str(plot_deflection)
-                )
-            )
-        )
-    else:
-        plot_deflection = plot_deflection
-    # cf Methods.Mesh.MeshSolution.plot_glyph
-    if isinstance(plot_glyph, ImportError):
-        plot_glyph = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MeshSolution method plot_glyph: " + str(plot_glyph)
-                )
-            )
-        )
-    else:
-        plot_glyph = plot_glyph
-    # cf Methods.Mesh.MeshSolution.perm_coord
-    if isinstance(perm_coord, ImportError):
-        perm_coord = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MeshSolution method perm_coord: " + str(perm_coord)
-                )
-            )
-        )
-    else:
-        perm_coord = perm_coord
-    # cf Methods.Mesh.MeshSolution.get_deflection
-    if isinstance(get_deflection, ImportError):
-        get_deflection = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MeshSolution method get_deflection: "
-                    + str(get_deflection)
-                )
-            )
-        )
-    else:
-        get_deflection = get_deflection
-    # cf Methods.Mesh.MeshSolution.get_glyph
-    if isinstance(get_glyph, ImportError):
-        get_glyph = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MeshSolution method get_glyph: " + str(get_glyph)
-                )
-            )
-        )
-    else:
-        get_glyph = get_glyph
+    # Methods imported on first use to remove unnecessary dependencies
+    get_mesh = LazyMethod(__package__, "..Methods.Mesh.MeshSolution.get_mesh")
+    get_solution = LazyMethod(__package__, "..Methods.Mesh.MeshSolution.get_solution")
+    get_field = LazyMethod(__package__, "..Methods.Mesh.MeshSolution.get_field")
+    get_group = LazyMethod(__package__, "..Methods.Mesh.MeshSolution.get_group")
+    get_mesh_field_pv = LazyMethod(
+        __package__, "..Methods.Mesh.MeshSolution.get_mesh_field_pv"
+    )
+    plot_mesh = LazyMethod(__package__, "..Methods.Mesh.MeshSolution.plot_mesh")
+    plot_contour = LazyMethod(__package__, "..Methods.Mesh.MeshSolution.plot_contour")
+    plot_deflection = LazyMethod(
+        __package__, "..Methods.Mesh.MeshSolution.plot_deflection"
+    )
+    plot_glyph = LazyMethod(__package__, "..Methods.Mesh.MeshSolution.plot_glyph")
+    perm_coord = LazyMethod(__package__, "..Methods.Mesh.MeshSolution.perm_coord")
+    get_deflection = LazyMethod(
+        __package__, "..Methods.Mesh.MeshSolution.get_deflection"
+    )
+    get_glyph = LazyMethod(__package__, "..Methods.Mesh.MeshSolution.get_glyph")
+    interpolate = LazyMethod(__package__, "..Methods.Mesh.MeshSolution.interpolate")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,67 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import set_array, check_var, raise_
+from ._check import set_array, check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyArray, LazyMethod
 from .Mesh import Mesh
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Mesh.MeshVTK.get_mesh_pv import get_mesh_pv
-except ImportError as error:
-    get_mesh_pv = error
-
-try:
-    from ..Methods.Mesh.MeshVTK.get_node import get_node
-except ImportError as error:
-    get_node = error
-
-try:
-    from ..Methods.Mesh.MeshVTK.get_cell import get_cell
-except ImportError as error:
-    get_cell = error
-
-try:
-    from ..Methods.Mesh.MeshVTK.get_normals import get_normals
-except ImportError as error:
-    get_normals = error
-
-try:
-    from ..Methods.Mesh.MeshVTK.get_surf import get_surf
-except ImportError as error:
-    get_surf = error
-
-try:
-    from ..Methods.Mesh.MeshVTK.get_cell_area import get_cell_area
-except ImportError as error:
-    get_cell_area = error
-
-try:
-    from ..Methods.Mesh.MeshVTK.convert import convert
-except ImportError as error:
-    convert = error
-
-try:
-    from ..Methods.Mesh.MeshVTK.as_dict import as_dict
-except ImportError as error:
-    as_dict = error
-
-try:
-    from ..Methods.Mesh.MeshVTK.perm_coord import perm_coord
-except ImportError as error:
-    perm_coord = error
-
-try:
-    from ..Methods.Mesh.MeshVTK.get_path import get_path
-except ImportError as error:
-    get_path = error
-
-
 from numpy import array, array_equal
 from numpy import isnan
 from cloudpickle import dumps, loads
@@ -92,99 +40,17 @@ class MeshVTK(Mesh):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Mesh.MeshVTK.get_mesh_pv
-    if isinstance(get_mesh_pv, ImportError):
-        get_mesh_pv = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MeshVTK method get_mesh_pv: " + str(get_mesh_pv))
-            )
-        )
-    else:
-        get_mesh_pv = get_mesh_pv
-    # cf Methods.Mesh.MeshVTK.get_node
-    if isinstance(get_node, ImportError):
-        get_node = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MeshVTK method get_node: " + str(get_node))
-            )
-        )
-    else:
-        get_node = get_node
-    # cf Methods.Mesh.MeshVTK.get_cell
-    if isinstance(get_cell, ImportError):
-        get_cell = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MeshVTK method get_cell: " + str(get_cell))
-            )
-        )
-    else:
-        get_cell = get_cell
-    # cf Methods.Mesh.MeshVTK.get_normals
-    if isinstance(get_normals, ImportError):
-        get_normals = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MeshVTK method get_normals: " + str(get_normals))
-            )
-        )
-    else:
-        get_normals = get_normals
-    # cf Methods.Mesh.MeshVTK.get_surf
-    if isinstance(get_surf, ImportError):
-        get_surf = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MeshVTK method get_surf: " + str(get_surf))
-            )
-        )
-    else:
-        get_surf = get_surf
-    # cf Methods.Mesh.MeshVTK.get_cell_area
-    if isinstance(get_cell_area, ImportError):
-        get_cell_area = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use MeshVTK method get_cell_area: " + str(get_cell_area)
-                )
-            )
-        )
-    else:
-        get_cell_area = get_cell_area
-    # cf Methods.Mesh.MeshVTK.convert
-    if isinstance(convert, ImportError):
-        convert = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MeshVTK method convert: " + str(convert))
-            )
-        )
-    else:
-        convert = convert
-    # cf Methods.Mesh.MeshVTK.as_dict
-    if isinstance(as_dict, ImportError):
-        as_dict = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MeshVTK method as_dict: " + str(as_dict))
-            )
-        )
-    else:
-        as_dict = as_dict
-    # cf Methods.Mesh.MeshVTK.perm_coord
-    if isinstance(perm_coord, ImportError):
-        perm_coord = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MeshVTK method perm_coord: " + str(perm_coord))
-            )
-        )
-    else:
-        perm_coord = perm_coord
-    # cf Methods.Mesh.MeshVTK.get_path
-    if isinstance(get_path, ImportError):
-        get_path = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use MeshVTK method get_path: " + str(get_path))
-            )
-        )
-    else:
-        get_path = get_path
+    # Methods imported on first use to remove unnecessary dependencies
+    get_mesh_pv = LazyMethod(__package__, "..Methods.Mesh.MeshVTK.get_mesh_pv")
+    get_node = LazyMethod(__package__, "..Methods.Mesh.MeshVTK.get_node")
+    get_cell = LazyMethod(__package__, "..Methods.Mesh.MeshVTK.get_cell")
+    get_normals = LazyMethod(__package__, "..Methods.Mesh.MeshVTK.get_normals")
+    get_surf = LazyMethod(__package__, "..Methods.Mesh.MeshVTK.get_surf")
+    get_cell_area = LazyMethod(__package__, "..Methods.Mesh.MeshVTK.get_cell_area")
+    convert = LazyMethod(__package__, "..Methods.Mesh.MeshVTK.convert")
+    as_dict = LazyMethod(__package__, "..Methods.Mesh.MeshVTK.as_dict")
+    perm_coord = LazyMethod(__package__, "..Methods.Mesh.MeshVTK.perm_coord")
+    get_path = LazyMethod(__package__, "..Methods.Mesh.MeshVTK.get_path")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -630,6 +496,8 @@ class MeshVTK(Mesh):
 
     def _get_node_normals(self):
         """getter of node_normals"""
+        if isinstance(self._node_normals, LazyArray):
+            self._node_normals = self._node_normals.read()
         return self._node_normals
 
     def _set_node_normals(self, value):
@@ -7,37 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import set_array, check_var, raise_
+from ._check import set_array, check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyArray, LazyMethod
 from .SolutionMat import SolutionMat
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.Mode.plot import plot
-except ImportError as error:
-    plot = error
-
-try:
-    from ..Methods.Simulation.Mode.plot_animated import plot_animated
-except ImportError as error:
-    plot_animated = error
-
-try:
-    from ..Methods.Simulation.Mode.get_shape_xyz import get_shape_xyz
-except ImportError as error:
-    get_shape_xyz = error
-
-try:
-    from ..Methods.Simulation.Mode.get_shape_pol import get_shape_pol
-except ImportError as error:
-    get_shape_pol = error
-
-
 from numpy import array, array_equal
 from numpy import isnan
 from ._check import InitUnKnowClassError
@@ -48,49 +26,11 @@ class Mode(SolutionMat):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.Mode.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Mode method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
-    # cf Methods.Simulation.Mode.plot_animated
-    if isinstance(plot_animated, ImportError):
-        plot_animated = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Mode method plot_animated: " + str(plot_animated)
-                )
-            )
-        )
-    else:
-        plot_animated = plot_animated
-    # cf Methods.Simulation.Mode.get_shape_xyz
-    if isinstance(get_shape_xyz, ImportError):
-        get_shape_xyz = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Mode method get_shape_xyz: " + str(get_shape_xyz)
-                )
-            )
-        )
-    else:
-        get_shape_xyz = get_shape_xyz
-    # cf Methods.Simulation.Mode.get_shape_pol
-    if isinstance(get_shape_pol, ImportError):
-        get_shape_pol = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Mode method get_shape_pol: " + str(get_shape_pol)
-                )
-            )
-        )
-    else:
-        get_shape_pol = get_shape_pol
+    # Methods imported on first use to remove unnecessary dependencies
+    plot = LazyMethod(__package__, "..Methods.Simulation.Mode.plot")
+    plot_animated = LazyMethod(__package__, "..Methods.Simulation.Mode.plot_animated")
+    get_shape_xyz = LazyMethod(__package__, "..Methods.Simulation.Mode.get_shape_xyz")
+    get_shape_pol = LazyMethod(__package__, "..Methods.Simulation.Mode.get_shape_pol")
     # save and copy methods are available in all object
     save = save
     copy = copy
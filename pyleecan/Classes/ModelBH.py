@@ -7,27 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Material.ModelBH.get_BH import get_BH
-except ImportError as error:
-    get_BH = error
-
-try:
-    from ..Methods.Material.ModelBH.fit_model import fit_model
-except ImportError as error:
-    fit_model = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -37,25 +25,9 @@ class ModelBH(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Material.ModelBH.get_BH
-    if isinstance(get_BH, ImportError):
-        get_BH = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use ModelBH method get_BH: " + str(get_BH))
-            )
-        )
-    else:
-        get_BH = get_BH
-    # cf Methods.Material.ModelBH.fit_model
-    if isinstance(fit_model, ImportError):
-        fit_model = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use ModelBH method fit_model: " + str(fit_model))
-            )
-        )
-    else:
-        fit_model = fit_model
+    # Methods imported on first use to remove unnecessary dependencies
+    get_BH = LazyMethod(__package__, "..Methods.Material.ModelBH.get_BH")
+    fit_model = LazyMethod(__package__, "..Methods.Material.ModelBH.fit_model")
     # save and copy methods are available in all object
     save = save
     copy = copy
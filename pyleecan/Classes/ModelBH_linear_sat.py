@@ -7,27 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .ModelBH import ModelBH
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Material.ModelBH_linear_sat.get_BH import get_BH
-except ImportError as error:
-    get_BH = error
-
-try:
-    from ..Methods.Material.ModelBH_linear_sat.BH_func import BH_func
-except ImportError as error:
-    BH_func = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -37,29 +25,9 @@ class ModelBH_linear_sat(ModelBH):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Material.ModelBH_linear_sat.get_BH
-    if isinstance(get_BH, ImportError):
-        get_BH = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ModelBH_linear_sat method get_BH: " + str(get_BH)
-                )
-            )
-        )
-    else:
-        get_BH = get_BH
-    # cf Methods.Material.ModelBH_linear_sat.BH_func
-    if isinstance(BH_func, ImportError):
-        BH_func = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ModelBH_linear_sat method BH_func: " + str(BH_func)
-                )
-            )
-        )
-    else:
-        BH_func = BH_func
+    # Methods imported on first use to remove unnecessary dependencies
+    get_BH = LazyMethod(__package__, "..Methods.Material.ModelBH_linear_sat.get_BH")
+    BH_func = LazyMethod(__package__, "..Methods.Material.ModelBH_linear_sat.BH_func")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,37 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import set_array, check_var, raise_
+from ._check import set_array, check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyArray, LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Mesh.NodeMat.add_node import add_node
-except ImportError as error:
-    add_node = error
-
-try:
-    from ..Methods.Mesh.NodeMat.get_coord import get_coord
-except ImportError as error:
-    get_coord = error
-
-try:
-    from ..Methods.Mesh.NodeMat.is_exist import is_exist
-except ImportError as error:
-    is_exist = error
-
-try:
-    from ..Methods.Mesh.NodeMat.get_indice import get_indice
-except ImportError as error:
-    get_indice = error
-
-
 from numpy import array, array_equal
 from numpy import isnan
 from ._check import InitUnKnowClassError
@@ -48,43 +26,14 @@ class NodeMat(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Mesh.NodeMat.add_node
-    if isinstance(add_node, ImportError):
-        add_node = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use NodeMat method add_node: " + str(add_node))
-            )
-        )
-    else:
-        add_node = add_node
-    # cf Methods.Mesh.NodeMat.get_coord
-    if isinstance(get_coord, ImportError):
-        get_coord = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use NodeMat method get_coord: " + str(get_coord))
-            )
-        )
-    else:
-        get_coord = get_coord
-    # cf Methods.Mesh.NodeMat.is_exist
-    if isinstance(is_exist, ImportError):
-        is_exist = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use NodeMat method is_exist: " + str(is_exist))
-            )
-        )
-    else:
-        is_exist = is_exist
-    # cf Methods.Mesh.NodeMat.get_indice
-    if isinstance(get_indice, ImportError):
-        get_indice = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use NodeMat method get_indice: " + str(get_indice))
-            )
-        )
-    else:
-        get_indice = get_indice
+    # Methods imported on first use to remove unnecessary dependencies
+    add_node = LazyMethod(__package__, "..Methods.Mesh.NodeMat.add_node")
+    get_coord = LazyMethod(__package__, "..Methods.Mesh.NodeMat.get_coord")
+    is_exist = LazyMethod(__package__, "..Methods.Mesh.NodeMat.is_exist")
+    get_indice = LazyMethod(__package__, "..Methods.Mesh.NodeMat.get_indice")
+    add_nodes = LazyMethod(__package__, "..Methods.Mesh.NodeMat.add_nodes")
+    _get_hash = LazyMethod(__package__, "..Methods.Mesh.NodeMat._get_hash")
+    _find_node = LazyMethod(__package__, "..Methods.Mesh.NodeMat._find_node")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -281,6 +230,8 @@ class NodeMat(FrozenClass):
 
     def _get_coordinate(self):
         """getter of coordinate"""
+        if isinstance(self._coordinate, LazyArray):
+            self._coordinate = self._coordinate.read()
         return self._coordinate
 
     def _set_coordinate(self, value):
@@ -342,6 +293,8 @@ class NodeMat(FrozenClass):
 
     def _get_indice(self):
         """getter of indice"""
+        if isinstance(self._indice, LazyArray):
+            self._indice = self._indice.read()
         return self._indice
 
     def _set_indice(self, value):
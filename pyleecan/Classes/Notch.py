@@ -7,27 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.Notch.get_Rbo import get_Rbo
-except ImportError as error:
-    get_Rbo = error
-
-try:
-    from ..Methods.Machine.Notch.is_outwards import is_outwards
-except ImportError as error:
-    is_outwards = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -37,25 +25,9 @@ class Notch(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.Notch.get_Rbo
-    if isinstance(get_Rbo, ImportError):
-        get_Rbo = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Notch method get_Rbo: " + str(get_Rbo))
-            )
-        )
-    else:
-        get_Rbo = get_Rbo
-    # cf Methods.Machine.Notch.is_outwards
-    if isinstance(is_outwards, ImportError):
-        is_outwards = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Notch method is_outwards: " + str(is_outwards))
-            )
-        )
-    else:
-        is_outwards = is_outwards
+    # Methods imported on first use to remove unnecessary dependencies
+    get_Rbo = LazyMethod(__package__, "..Methods.Machine.Notch.get_Rbo")
+    is_outwards = LazyMethod(__package__, "..Methods.Machine.Notch.is_outwards")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,27 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Notch import Notch
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.NotchEvenDist.get_notch_list import get_notch_list
-except ImportError as error:
-    get_notch_list = error
-
-try:
-    from ..Methods.Machine.NotchEvenDist.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -37,30 +25,13 @@ class NotchEvenDist(Notch):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.NotchEvenDist.get_notch_list
-    if isinstance(get_notch_list, ImportError):
-        get_notch_list = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use NotchEvenDist method get_notch_list: "
-                    + str(get_notch_list)
-                )
-            )
-        )
-    else:
-        get_notch_list = get_notch_list
-    # cf Methods.Machine.NotchEvenDist.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use NotchEvenDist method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
+    # Methods imported on first use to remove unnecessary dependencies
+    get_notch_list = LazyMethod(
+        __package__, "..Methods.Machine.NotchEvenDist.get_notch_list"
+    )
+    comp_surface = LazyMethod(
+        __package__, "..Methods.Machine.NotchEvenDist.comp_surface"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
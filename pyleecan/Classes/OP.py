@@ -7,22 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.OP.get_machine_from_parent import get_machine_from_parent
-except ImportError as error:
-    get_machine_from_parent = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -32,18 +25,10 @@ class OP(FrozenClass):
 
     VERSION = 1
 
-    # cf Methods.Simulation.OP.get_machine_from_parent
-    if isinstance(get_machine_from_parent, ImportError):
-        get_machine_from_parent = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use OP method get_machine_from_parent: "
-                    + str(get_machine_from_parent)
-                )
-            )
-        )
-    else:
-        get_machine_from_parent = get_machine_from_parent
+    # Methods imported on first use to remove unnecessary dependencies
+    get_machine_from_parent = LazyMethod(
+        __package__, "..Methods.Simulation.OP.get_machine_from_parent"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
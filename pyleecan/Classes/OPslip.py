@@ -7,72 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .OP import OP
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.OPslip.get_Id_Iq import get_Id_Iq
-except ImportError as error:
-    get_Id_Iq = error
-
-try:
-    from ..Methods.Simulation.OPslip.get_felec import get_felec
-except ImportError as error:
-    get_felec = error
-
-try:
-    from ..Methods.Simulation.OPslip.get_N0 import get_N0
-except ImportError as error:
-    get_N0 = error
-
-try:
-    from ..Methods.Simulation.OPslip.get_Ud_Uq import get_Ud_Uq
-except ImportError as error:
-    get_Ud_Uq = error
-
-try:
-    from ..Methods.Simulation.OPslip.set_Id_Iq import set_Id_Iq
-except ImportError as error:
-    set_Id_Iq = error
-
-try:
-    from ..Methods.Simulation.OPslip.get_I0_Phi0 import get_I0_Phi0
-except ImportError as error:
-    get_I0_Phi0 = error
-
-try:
-    from ..Methods.Simulation.OPslip.get_slip import get_slip
-except ImportError as error:
-    get_slip = error
-
-try:
-    from ..Methods.Simulation.OPslip.set_I0_Phi0 import set_I0_Phi0
-except ImportError as error:
-    set_I0_Phi0 = error
-
-try:
-    from ..Methods.Simulation.OPslip.set_Ud_Uq import set_Ud_Uq
-except ImportError as error:
-    set_Ud_Uq = error
-
-try:
-    from ..Methods.Simulation.OPslip.get_U0_UPhi0 import get_U0_UPhi0
-except ImportError as error:
-    get_U0_UPhi0 = error
-
-try:
-    from ..Methods.Simulation.OPslip.set_U0_UPhi0 import set_U0_UPhi0
-except ImportError as error:
-    set_U0_UPhi0 = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -82,110 +25,18 @@ class OPslip(OP):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.OPslip.get_Id_Iq
-    if isinstance(get_Id_Iq, ImportError):
-        get_Id_Iq = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OPslip method get_Id_Iq: " + str(get_Id_Iq))
-            )
-        )
-    else:
-        get_Id_Iq = get_Id_Iq
-    # cf Methods.Simulation.OPslip.get_felec
-    if isinstance(get_felec, ImportError):
-        get_felec = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OPslip method get_felec: " + str(get_felec))
-            )
-        )
-    else:
-        get_felec = get_felec
-    # cf Methods.Simulation.OPslip.get_N0
-    if isinstance(get_N0, ImportError):
-        get_N0 = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OPslip method get_N0: " + str(get_N0))
-            )
-        )
-    else:
-        get_N0 = get_N0
-    # cf Methods.Simulation.OPslip.get_Ud_Uq
-    if isinstance(get_Ud_Uq, ImportError):
-        get_Ud_Uq = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OPslip method get_Ud_Uq: " + str(get_Ud_Uq))
-            )
-        )
-    else:
-        get_Ud_Uq = get_Ud_Uq
-    # cf Methods.Simulation.OPslip.set_Id_Iq
-    if isinstance(set_Id_Iq, ImportError):
-        set_Id_Iq = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OPslip method set_Id_Iq: " + str(set_Id_Iq))
-            )
-        )
-    else:
-        set_Id_Iq = set_Id_Iq
-    # cf Methods.Simulation.OPslip.get_I0_Phi0
-    if isinstance(get_I0_Phi0, ImportError):
-        get_I0_Phi0 = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OPslip method get_I0_Phi0: " + str(get_I0_Phi0))
-            )
-        )
-    else:
-        get_I0_Phi0 = get_I0_Phi0
-    # cf Methods.Simulation.OPslip.get_slip
-    if isinstance(get_slip, ImportError):
-        get_slip = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OPslip method get_slip: " + str(get_slip))
-            )
-        )
-    else:
-        get_slip = get_slip
-    # cf Methods.Simulation.OPslip.set_I0_Phi0
-    if isinstance(set_I0_Phi0, ImportError):
-        set_I0_Phi0 = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OPslip method set_I0_Phi0: " + str(set_I0_Phi0))
-            )
-        )
-    else:
-        set_I0_Phi0 = set_I0_Phi0
-    # cf Methods.Simulation.OPslip.set_Ud_Uq
-    if isinstance(set_Ud_Uq, ImportError):
-        set_Ud_Uq = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OPslip method set_Ud_Uq: " + str(set_Ud_Uq))
-            )
-        )
-    else:
-        set_Ud_Uq = set_Ud_Uq
-    # cf Methods.Simulation.OPslip.get_U0_UPhi0
-    if isinstance(get_U0_UPhi0, ImportError):
-        get_U0_UPhi0 = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use OPslip method get_U0_UPhi0: " + str(get_U0_UPhi0)
-                )
-            )
-        )
-    else:
-        get_U0_UPhi0 = get_U0_UPhi0
-    # cf Methods.Simulation.OPslip.set_U0_UPhi0
-    if isinstance(set_U0_UPhi0, ImportError):
-        set_U0_UPhi0 = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use OPslip method set_U0_UPhi0: " + str(set_U0_UPhi0)
-                )
-            )
-        )
-    else:
-        set_U0_UPhi0 = set_U0_UPhi0
+    # Methods imported on first use to remove unnecessary dependencies
+    get_Id_Iq = LazyMethod(__package__, "..Methods.Simulation.OPslip.get_Id_Iq")
+    get_felec = LazyMethod(__package__, "..Methods.Simulation.OPslip.get_felec")
+    get_N0 = LazyMethod(__package__, "..Methods.Simulation.OPslip.get_N0")
+    get_Ud_Uq = LazyMethod(__package__, "..Methods.Simulation.OPslip.get_Ud_Uq")
+    set_Id_Iq = LazyMethod(__package__, "..Methods.Simulation.OPslip.set_Id_Iq")
+    get_I0_Phi0 = LazyMethod(__package__, "..Methods.Simulation.OPslip.get_I0_Phi0")
+    get_slip = LazyMethod(__package__, "..Methods.Simulation.OPslip.get_slip")
+    set_I0_Phi0 = LazyMethod(__package__, "..Methods.Simulation.OPslip.set_I0_Phi0")
+    set_Ud_Uq = LazyMethod(__package__, "..Methods.Simulation.OPslip.set_Ud_Uq")
+    get_U0_UPhi0 = LazyMethod(__package__, "..Methods.Simulation.OPslip.get_U0_UPhi0")
+    set_U0_UPhi0 = LazyMethod(__package__, "..Methods.Simulation.OPslip.set_U0_UPhi0")
     # save and copy methods are available in all object
     save = save
     copy = copy
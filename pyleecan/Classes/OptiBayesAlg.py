@@ -7,7 +7,7 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
@@ -40,6 +40,7 @@ class OptiBayesAlg(OptiSolver):
         xoutput=-1,
         logger_name="Pyleecan.OptiSolver",
         is_keep_all_output=False,
+        store=None,
         init_dict=None,
         init_str=None,
     ):
@@ -74,6 +75,8 @@ class OptiBayesAlg(OptiSolver):
                 logger_name = init_dict["logger_name"]
             if "is_keep_all_output" in list(init_dict.keys()):
                 is_keep_all_output = init_dict["is_keep_all_output"]
+            if "store" in list(init_dict.keys()):
+                store = init_dict["store"]
         # Set the properties (value check and convertion are done in setter)
         self.nb_iter = nb_iter
         self.nb_start = nb_start
@@ -85,6 +88,7 @@ class OptiBayesAlg(OptiSolver):
             xoutput=xoutput,
             logger_name=logger_name,
             is_keep_all_output=is_keep_all_output,
+            store=store,
         )
         # The class is frozen (in OptiSolver init), for now it's impossible to
         # add new properties
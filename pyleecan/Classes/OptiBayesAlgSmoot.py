@@ -7,44 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .OptiBayesAlg import OptiBayesAlg
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Optimization.OptiBayesAlgSmoot.solve import solve
-except ImportError as error:
-    solve = error
-
-try:
-    from ..Methods.Optimization.OptiBayesAlgSmoot.check_optimization_input import (
-        check_optimization_input,
-    )
-except ImportError as error:
-    check_optimization_input = error
-
-try:
-    from ..Methods.Optimization.OptiBayesAlgSmoot.evaluate import evaluate
-except ImportError as error:
-    evaluate = error
-
-try:
-    from ..Methods.Optimization.OptiBayesAlgSmoot.plot_pareto import plot_pareto
-except ImportError as error:
-    plot_pareto = error
-
-try:
-    from ..Methods.Optimization.OptiBayesAlgSmoot.eval_const import eval_const
-except ImportError as error:
-    eval_const = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -54,62 +25,20 @@ class OptiBayesAlgSmoot(OptiBayesAlg):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Optimization.OptiBayesAlgSmoot.solve
-    if isinstance(solve, ImportError):
-        solve = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OptiBayesAlgSmoot method solve: " + str(solve))
-            )
-        )
-    else:
-        solve = solve
-    # cf Methods.Optimization.OptiBayesAlgSmoot.check_optimization_input
-    if isinstance(check_optimization_input, ImportError):
-        check_optimization_input = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use OptiBayesAlgSmoot method check_optimization_input: "
-                    + str(check_optimization_input)
-                )
-            )
-        )
-    else:
-        check_optimization_input = check_optimization_input
-    # cf Methods.Optimization.OptiBayesAlgSmoot.evaluate
-    if isinstance(evaluate, ImportError):
-        evaluate = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use OptiBayesAlgSmoot method evaluate: " + str(evaluate)
-                )
-            )
-        )
-    else:
-        evaluate = evaluate
-    # cf Methods.Optimization.OptiBayesAlgSmoot.plot_pareto
-    if isinstance(plot_pareto, ImportError):
-        plot_pareto = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use OptiBayesAlgSmoot method plot_pareto: "
-                    + str(plot_pareto)
-                )
-            )
-        )
-    else:
-        plot_pareto = plot_pareto
-    # cf Methods.Optimization.OptiBayesAlgSmoot.eval_const
-    if isinstance(eval_const, ImportError):
-        eval_const = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use OptiBayesAlgSmoot method eval_const: " + str(eval_const)
-                )
-            )
-        )
-    else:
-        eval_const = eval_const
+    # Methods imported on first use to remove unnecessary dependencies
+    solve = LazyMethod(__package__, "..Methods.Optimization.OptiBayesAlgSmoot.solve")
+    check_optimization_input = LazyMethod(
+        __package__, "..Methods.Optimization.OptiBayesAlgSmoot.check_optimization_input"
+    )
+    evaluate = LazyMethod(
+        __package__, "..Methods.Optimization.OptiBayesAlgSmoot.evaluate"
+    )
+    plot_pareto = LazyMethod(
+        __package__, "..Methods.Optimization.OptiBayesAlgSmoot.plot_pareto"
+    )
+    eval_const = LazyMethod(
+        __package__, "..Methods.Optimization.OptiBayesAlgSmoot.eval_const"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -128,6 +57,7 @@ class OptiBayesAlgSmoot(OptiBayesAlg):
         xoutput=-1,
         logger_name="Pyleecan.OptiSolver",
         is_keep_all_output=False,
+        store=None,
         init_dict=None,
         init_str=None,
     ):
@@ -166,6 +96,8 @@ class OptiBayesAlgSmoot(OptiBayesAlg):
                 logger_name = init_dict["logger_name"]
             if "is_keep_all_output" in list(init_dict.keys()):
                 is_keep_all_output = init_dict["is_keep_all_output"]
+            if "store" in list(init_dict.keys()):
+                store = init_dict["store"]
         # Set the properties (value check and convertion are done in setter)
         self.size_pop = size_pop
         self.nb_gen = nb_gen
@@ -179,6 +111,7 @@ class OptiBayesAlgSmoot(OptiBayesAlg):
             xoutput=xoutput,
             logger_name=logger_name,
             is_keep_all_output=is_keep_all_output,
+            store=store,
         )
         # The class is frozen (in OptiBayesAlg init), for now it's impossible to
         # add new properties
@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+# File generated according to Generator/ClassesRef/Optimization/OptiEvalCache.csv
+# WARNING! All changes made in this file will be lost!
+"""Method code available at https://github.com/Eomys/pyleecan/tree/master/pyleecan/Methods/Optimization/OptiEvalCache
+"""
+
+from os import linesep
+from sys import getsizeof
+from logging import getLogger
+from ._check import check_var
+from ..Functions.get_logger import get_logger
+from ..Functions.save import save
+from ..Functions.copy import copy
+from ..Functions.load import load_init_dict
+from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
+from ._frozen import FrozenClass
+
+from numpy import isnan
+from ._check import InitUnKnowClassError
+
+
+class OptiEvalCache(FrozenClass):
+    """Evaluation cache of an optimization problem (fitness and constraints results of the already evaluated design variables)"""
+
+    VERSION = 1
+
+    # Methods imported on first use to remove unnecessary dependencies
+    get_key = LazyMethod(__package__, "..Methods.Optimization.OptiEvalCache.get_key")
+    get = LazyMethod(__package__, "..Methods.Optimization.OptiEvalCache.get")
+    add = LazyMethod(__package__, "..Methods.Optimization.OptiEvalCache.add")
+    load_eval = LazyMethod(
+        __package__, "..Methods.Optimization.OptiEvalCache.load_eval"
+    )
+    save_eval = LazyMethod(
+        __package__, "..Methods.Optimization.OptiEvalCache.save_eval"
+    )
+    clear = LazyMethod(__package__, "..Methods.Optimization.OptiEvalCache.clear")
+    get_stat_msg = LazyMethod(
+        __package__, "..Methods.Optimization.OptiEvalCache.get_stat_msg"
+    )
+    # save and copy methods are available in all object
+    save = save
+    copy = copy
+    # get_logger method is available in all object
+    get_logger = get_logger
+
+    def __init__(
+        self, tol=0, size_max=10000, save_path="", init_dict=None, init_str=None
+    ):
+        """Constructor of the class. Can be use in three ways :
+        - __init__ (arg1 = 1, arg3 = 5) every parameters have name and default values
+            for pyleecan type, -1 will call the default constructor
+        - __init__ (init_dict = d) d must be a dictionary with property names as keys
+        - __init__ (init_str = s) s must be a string
+        s is the file path to load
+
+        ndarray or list can be given for Vector and Matrix
+        object or dict can be given for pyleecan Object"""
+
+        if init_str is not None:  # Load from a file
+            init_dict = load_init_dict(init_str)[1]
+        if init_dict is not None:  # Initialisation by dict
+            assert type(init_dict) is dict
+            # Overwrite default value with init_dict content
+            if "tol" in list(init_dict.keys()):
+                tol = init_dict["tol"]
+            if "size_max" in list(init_dict.keys()):
+                size_max = init_dict["size_max"]
+            if "save_path" in list(init_dict.keys()):
+                save_path = init_dict["save_path"]
+        # Set the properties (value check and convertion are done in setter)
+        self.parent = None
+        self.tol = tol
+        self.size_max = size_max
+        self.save_path = save_path
+
+        # The class is frozen, for now it's impossible to add new properties
+        self._freeze()
+
+    def __str__(self):
+        """Convert this object in a readeable string (for print)"""
+
+        OptiEvalCache_str = ""
+        if self.parent is None:
+            OptiEvalCache_str += "parent = None " + linesep
+        else:
+            OptiEvalCache_str += (
+                "parent = " + str(type(self.parent)) + " object" + linesep
+            )
+        OptiEvalCache_str += "tol = " + str(self.tol) + linesep
+        OptiEvalCache_str += "size_max = " + str(self.size_max) + linesep
+        OptiEvalCache_str += 'save_path = "' + str(self.save_path) + '"' + linesep
+        return OptiEvalCache_str
+
+    def __eq__(self, other):
+        """Compare two objects (skip parent)"""
+
+        if type(other) != type(self):
+            return False
+        if other.tol != self.tol:
+            return False
+        if other.size_max != self.size_max:
+            return False
+        if other.save_path != self.save_path:
+            return False
+        return True
+
+    def compare(self, other, name="self", ignore_list=None, is_add_value=False):
+        """Compare two objects and return list of differences"""
+
+        if ignore_list is None:
+            ignore_list = list()
+        if type(other) != type(self):
+            return ["type(" + name + ")"]
+        diff_list = list()
+        if (
+            other._tol is not None
+            and self._tol is not None
+            and isnan(other._tol)
+            and isnan(self._tol)
+        ):
+            pass
+        elif other._tol != self._tol:
+            if is_add_value:
+                val_str = (
+                    " (self=" + str(self._tol) + ", other=" + str(other._tol) + ")"
+                )
+                diff_list.append(name + ".tol" + val_str)
+            else:
+                diff_list.append(name + ".tol")
+        if other._size_max != self._size_max:
+            if is_add_value:
+                val_str = (
+                    " (self="
+                    + str(self._size_max)
+                    + ", other="
+                    + str(other._size_max)
+                    + ")"
+                )
+                diff_list.append(name + ".size_max" + val_str)
+            else:
+                diff_list.append(name + ".size_max")
+        if other._save_path != self._save_path:
+            if is_add_value:
+                val_str = (
+                    " (self="
+                    + str(self._save_path)
+                    + ", other="
+                    + str(other._save_path)
+                    + ")"
+                )
+                diff_list.append(name + ".save_path" + val_str)
+            else:
+                diff_list.append(name + ".save_path")
+        # Filter ignore differences
+        diff_list = list(filter(lambda x: x not in ignore_list, diff_list))
+        return diff_list
+
+    def __sizeof__(self):
+        """Return the size in memory of the object (including all subobject)"""
+
+        S = 0  # Full size of the object
+        S += getsizeof(self.tol)
+        S += getsizeof(self.size_max)
+        S += getsizeof(self.save_path)
+        return S
+
+    def as_dict(self, type_handle_ndarray=0, keep_function=False, **kwargs):
+        """
+        Convert this object in a json serializable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        keep_function : bool
+            True to keep the function object, else return str
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
+
+        OptiEvalCache_dict = dict()
+        OptiEvalCache_dict["tol"] = self.tol
+        OptiEvalCache_dict["size_max"] = self.size_max
+        OptiEvalCache_dict["save_path"] = self.save_path
+        # The class name is added to the dict for deserialisation purpose
+        OptiEvalCache_dict["__class__"] = "OptiEvalCache"
+        return OptiEvalCache_dict
+
+    def _set_None(self):
+        """Set all the properties to None (except pyleecan object)"""
+
+        self.tol = None
+        self.size_max = None
+        self.save_path = None
+
+    def _get_tol(self):
+        """getter of tol"""
+        return self._tol
+
+    def _set_tol(self, value):
+        """setter of tol"""
+        check_var("tol", value, "float", Vmin=0)
+        self._tol = value
+
+    tol = property(
+        fget=_get_tol,
+        fset=_set_tol,
+        doc=u"""Tolerance on the design variables: the values are rounded to multiples of tol to build the cache key (0 to use the exact values)
+
+        :Type: float
+        :min: 0
+        """,
+    )
+
+    def _get_size_max(self):
+        """getter of size_max"""
+        return self._size_max
+
+    def _set_size_max(self, value):
+        """setter of size_max"""
+        check_var("size_max", value, "int", Vmin=0)
+        self._size_max = value
+
+    size_max = property(
+        fget=_get_size_max,
+        fset=_set_size_max,
+        doc=u"""Maximum number of evaluations in the cache (the least recently used ones are removed), 0 for no limit
+
+        :Type: int
+        :min: 0
+        """,
+    )
+
+    def _get_save_path(self):
+        """getter of save_path"""
+        return self._save_path
+
+    def _set_save_path(self, value):
+        """setter of save_path"""
+        check_var("save_path", value, "str")
+        self._save_path = value
+
+    save_path = property(
+        fget=_get_save_path,
+        fset=_set_save_path,
+        doc=u"""Path of the pkl file to persist the cache (loaded at the beginning of the optimization if it exists and saved after each generation), empty to not save the cache
+
+        :Type: str
+        """,
+    )
@@ -7,7 +7,7 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
@@ -44,10 +44,13 @@ class OptiGenAlg(OptiSolver):
         p_mutate=0.1,
         size_pop=40,
         nb_gen=100,
+        nb_worker=1,
+        executor=None,
         problem=-1,
         xoutput=-1,
         logger_name="Pyleecan.OptiSolver",
         is_keep_all_output=False,
+        store=None,
         init_dict=None,
         init_str=None,
     ):
@@ -80,6 +83,10 @@ class OptiGenAlg(OptiSolver):
                 size_pop = init_dict["size_pop"]
             if "nb_gen" in list(init_dict.keys()):
                 nb_gen = init_dict["nb_gen"]
+            if "nb_worker" in list(init_dict.keys()):
+                nb_worker = init_dict["nb_worker"]
+            if "executor" in list(init_dict.keys()):
+                executor = init_dict["executor"]
             if "problem" in list(init_dict.keys()):
                 problem = init_dict["problem"]
             if "xoutput" in list(init_dict.keys()):
@@ -88,6 +95,8 @@ class OptiGenAlg(OptiSolver):
                 logger_name = init_dict["logger_name"]
             if "is_keep_all_output" in list(init_dict.keys()):
                 is_keep_all_output = init_dict["is_keep_all_output"]
+            if "store" in list(init_dict.keys()):
+                store = init_dict["store"]
         # Set the properties (value check and convertion are done in setter)
         self.selector = selector
         self.crossover = crossover
@@ -96,12 +105,15 @@ class OptiGenAlg(OptiSolver):
         self.p_mutate = p_mutate
         self.size_pop = size_pop
         self.nb_gen = nb_gen
+        self.nb_worker = nb_worker
+        self.executor = executor
         # Call OptiSolver init
         super(OptiGenAlg, self).__init__(
             problem=problem,
             xoutput=xoutput,
             logger_name=logger_name,
             is_keep_all_output=is_keep_all_output,
+            store=store,
         )
         # The class is frozen (in OptiSolver init), for now it's impossible to
         # add new properties
@@ -134,6 +146,13 @@ class OptiGenAlg(OptiSolver):
         OptiGenAlg_str += "p_mutate = " + str(self.p_mutate) + linesep
         OptiGenAlg_str += "size_pop = " + str(self.size_pop) + linesep
         OptiGenAlg_str += "nb_gen = " + str(self.nb_gen) + linesep
+        OptiGenAlg_str += "nb_worker = " + str(self.nb_worker) + linesep
+        if self._executor_str is not None:
+            OptiGenAlg_str += "executor = " + self._executor_str + linesep
+        elif self._executor_func is not None:
+            OptiGenAlg_str += "executor = " + str(self._executor_func) + linesep
+        else:
+            OptiGenAlg_str += "executor = None" + linesep + linesep
         return OptiGenAlg_str
 
     def __eq__(self, other):
@@ -159,6 +178,10 @@ class OptiGenAlg(OptiSolver):
             return False
         if other.nb_gen != self.nb_gen:
             return False
+        if other.nb_worker != self.nb_worker:
+            return False
+        if other._executor_str != self._executor_str:
+            return False
         return True
 
     def compare(self, other, name="self", ignore_list=None, is_add_value=False):
@@ -244,6 +267,20 @@ class OptiGenAlg(OptiSolver):
                 diff_list.append(name + ".nb_gen" + val_str)
             else:
                 diff_list.append(name + ".nb_gen")
+        if other._nb_worker != self._nb_worker:
+            if is_add_value:
+                val_str = (
+                    " (self="
+                    + str(self._nb_worker)
+                    + ", other="
+                    + str(other._nb_worker)
+                    + ")"
+                )
+                diff_list.append(name + ".nb_worker" + val_str)
+            else:
+                diff_list.append(name + ".nb_worker")
+        if other._executor_str != self._executor_str:
+            diff_list.append(name + ".executor")
         # Filter ignore differences
         diff_list = list(filter(lambda x: x not in ignore_list, diff_list))
         return diff_list
@@ -262,6 +299,8 @@ class OptiGenAlg(OptiSolver):
         S += getsizeof(self.p_mutate)
         S += getsizeof(self.size_pop)
         S += getsizeof(self.nb_gen)
+        S += getsizeof(self.nb_worker)
+        S += getsizeof(self._executor_str)
         return S
 
     def as_dict(self, type_handle_ndarray=0, keep_function=False, **kwargs):
@@ -321,6 +360,19 @@ class OptiGenAlg(OptiSolver):
         OptiGenAlg_dict["p_mutate"] = self.p_mutate
         OptiGenAlg_dict["size_pop"] = self.size_pop
         OptiGenAlg_dict["nb_gen"] = self.nb_gen
+        OptiGenAlg_dict["nb_worker"] = self.nb_worker
+        if self._executor_str is not None:
+            OptiGenAlg_dict["executor"] = self._executor_str
+        elif "keep_function" in kwargs and kwargs["keep_function"]:
+            OptiGenAlg_dict["executor"] = self.executor
+        else:
+            OptiGenAlg_dict["executor"] = None
+            if self.executor is not None:
+                self.get_logger().warning(
+                    "OptiGenAlg.as_dict(): "
+                    + f"Function {self.executor.__name__} is not serializable "
+                    + "and will be converted to None."
+                )
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         OptiGenAlg_dict["__class__"] = "OptiGenAlg"
@@ -336,6 +388,8 @@ class OptiGenAlg(OptiSolver):
         self.p_mutate = None
         self.size_pop = None
         self.nb_gen = None
+        self.nb_worker = None
+        self.executor = None
         # Set to None the properties inherited from OptiSolver
         super(OptiGenAlg, self)._set_None()
 
@@ -521,3 +575,57 @@ class OptiGenAlg(OptiSolver):
         :min: 1
         """,
     )
+
+    def _get_nb_worker(self):
+        """getter of nb_worker"""
+        return self._nb_worker
+
+    def _set_nb_worker(self, value):
+        """setter of nb_worker"""
+        check_var("nb_worker", value, "int", Vmin=1)
+        self._nb_worker = value
+
+    nb_worker = property(
+        fget=_get_nb_worker,
+        fset=_set_nb_worker,
+        doc="""To evaluate the individuals of each generation in parallel with a process pool (only the fitness, constraints and DataKeeper results and the outputs if is_keep_all_output are sent back)
+
+        :Type: int
+        :min: 1
+        """,
+    )
+
+    def _get_executor(self):
+        """getter of executor"""
+        return self._executor_func
+
+    def _set_executor(self, value):
+        """setter of executor"""
+        if value is None:
+            self._executor_str = None
+            self._executor_func = None
+        elif isinstance(value, str) and "lambda" in value:
+            self._executor_str = value
+            self._executor_func = eval(value)
+        elif isinstance(value, str) and isfile(value) and value[-3:] == ".py":
+            self._executor_str = value
+            f = open(value, "r")
+            exec(f.read(), globals())
+            self._executor_func = eval(basename(value[:-3]))
+        elif callable(value):
+            self._executor_str = None
+            self._executor_func = value
+        else:
+            raise CheckTypeError(
+                "For property executor Expected function or str (path to python file or lambda), got: "
+                + str(type(value))
+            )
+
+    executor = property(
+        fget=_get_executor,
+        fset=_set_executor,
+        doc="""Function to evaluate the individuals in parallel instead of the process pool: executor(func, arg_list) must return the list of func(arg) (ex: map method of a concurrent.futures executor)
+
+        :Type: function
+        """,
+    )
@@ -7,54 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .OptiGenAlg import OptiGenAlg
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Optimization.OptiGenAlgNsga2Deap.solve import solve
-except ImportError as error:
-    solve = error
-
-try:
-    from ..Methods.Optimization.OptiGenAlgNsga2Deap.mutate import mutate
-except ImportError as error:
-    mutate = error
-
-try:
-    from ..Methods.Optimization.OptiGenAlgNsga2Deap.cross import cross
-except ImportError as error:
-    cross = error
-
-try:
-    from ..Methods.Optimization.OptiGenAlgNsga2Deap.create_toolbox import create_toolbox
-except ImportError as error:
-    create_toolbox = error
-
-try:
-    from ..Methods.Optimization.OptiGenAlgNsga2Deap.check_optimization_input import (
-        check_optimization_input,
-    )
-except ImportError as error:
-    check_optimization_input = error
-
-try:
-    from ..Methods.Optimization.OptiGenAlgNsga2Deap.delete_toolbox import delete_toolbox
-except ImportError as error:
-    delete_toolbox = error
-
-try:
-    from ..Methods.Optimization.OptiGenAlgNsga2Deap.plot_pareto import plot_pareto
-except ImportError as error:
-    plot_pareto = error
-
-
 from ntpath import basename
 from os.path import isfile
 from ._check import CheckTypeError
@@ -76,84 +37,25 @@ class OptiGenAlgNsga2Deap(OptiGenAlg):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Optimization.OptiGenAlgNsga2Deap.solve
-    if isinstance(solve, ImportError):
-        solve = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OptiGenAlgNsga2Deap method solve: " + str(solve))
-            )
-        )
-    else:
-        solve = solve
-    # cf Methods.Optimization.OptiGenAlgNsga2Deap.mutate
-    if isinstance(mutate, ImportError):
-        mutate = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use OptiGenAlgNsga2Deap method mutate: " + str(mutate)
-                )
-            )
-        )
-    else:
-        mutate = mutate
-    # cf Methods.Optimization.OptiGenAlgNsga2Deap.cross
-    if isinstance(cross, ImportError):
-        cross = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OptiGenAlgNsga2Deap method cross: " + str(cross))
-            )
-        )
-    else:
-        cross = cross
-    # cf Methods.Optimization.OptiGenAlgNsga2Deap.create_toolbox
-    if isinstance(create_toolbox, ImportError):
-        create_toolbox = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use OptiGenAlgNsga2Deap method create_toolbox: "
-                    + str(create_toolbox)
-                )
-            )
-        )
-    else:
-        create_toolbox = create_toolbox
-    # cf Methods.Optimization.OptiGenAlgNsga2Deap.check_optimization_input
-    if isinstance(check_optimization_input, ImportError):
-        check_optimization_input = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use OptiGenAlgNsga2Deap method check_optimization_input: "
-                    + str(check_optimization_input)
-                )
-            )
-        )
-    else:
-        check_optimization_input = check_optimization_input
-    # cf Methods.Optimization.OptiGenAlgNsga2Deap.delete_toolbox
-    if isinstance(delete_toolbox, ImportError):
-        delete_toolbox = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use OptiGenAlgNsga2Deap method delete_toolbox: "
-                    + str(delete_toolbox)
-                )
-            )
-        )
-    else:
-        delete_toolbox = delete_toolbox
-    # cf Methods.Optimization.OptiGenAlgNsga2Deap.plot_pareto
-    if isinstance(plot_pareto, ImportError):
-        plot_pareto = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use OptiGenAlgNsga2Deap method plot_pareto: "
-                    + str(plot_pareto)
-                )
-            )
-        )
-    else:
-        plot_pareto = plot_pareto
+    # Methods imported on first use to remove unnecessary dependencies
+    solve = LazyMethod(__package__, "..Methods.Optimization.OptiGenAlgNsga2Deap.solve")
+    mutate = LazyMethod(
+        __package__, "..Methods.Optimization.OptiGenAlgNsga2Deap.mutate"
+    )
+    cross = LazyMethod(__package__, "..Methods.Optimization.OptiGenAlgNsga2Deap.cross")
+    create_toolbox = LazyMethod(
+        __package__, "..Methods.Optimization.OptiGenAlgNsga2Deap.create_toolbox"
+    )
+    check_optimization_input = LazyMethod(
+        __package__,
+        "..Methods.Optimization.OptiGenAlgNsga2Deap.check_optimization_input",
+    )
+    delete_toolbox = LazyMethod(
+        __package__, "..Methods.Optimization.OptiGenAlgNsga2Deap.delete_toolbox"
+    )
+    plot_pareto = LazyMethod(
+        __package__, "..Methods.Optimization.OptiGenAlgNsga2Deap.plot_pareto"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -170,10 +72,13 @@ class OptiGenAlgNsga2Deap(OptiGenAlg):
         p_mutate=0.1,
         size_pop=40,
         nb_gen=100,
+        nb_worker=1,
+        executor=None,
         problem=-1,
         xoutput=-1,
         logger_name="Pyleecan.OptiSolver",
         is_keep_all_output=False,
+        store=None,
         init_dict=None,
         init_str=None,
     ):
@@ -208,6 +113,10 @@ class OptiGenAlgNsga2Deap(OptiGenAlg):
                 size_pop = init_dict["size_pop"]
             if "nb_gen" in list(init_dict.keys()):
                 nb_gen = init_dict["nb_gen"]
+            if "nb_worker" in list(init_dict.keys()):
+                nb_worker = init_dict["nb_worker"]
+            if "executor" in list(init_dict.keys()):
+                executor = init_dict["executor"]
             if "problem" in list(init_dict.keys()):
                 problem = init_dict["problem"]
             if "xoutput" in list(init_dict.keys()):
@@ -216,6 +125,8 @@ class OptiGenAlgNsga2Deap(OptiGenAlg):
                 logger_name = init_dict["logger_name"]
             if "is_keep_all_output" in list(init_dict.keys()):
                 is_keep_all_output = init_dict["is_keep_all_output"]
+            if "store" in list(init_dict.keys()):
+                store = init_dict["store"]
         # Set the properties (value check and convertion are done in setter)
         self.toolbox = toolbox
         # Call OptiGenAlg init
@@ -227,10 +138,13 @@ class OptiGenAlgNsga2Deap(OptiGenAlg):
             p_mutate=p_mutate,
             size_pop=size_pop,
             nb_gen=nb_gen,
+            nb_worker=nb_worker,
+            executor=executor,
             problem=problem,
             xoutput=xoutput,
             logger_name=logger_name,
             is_keep_all_output=is_keep_all_output,
+            store=store,
         )
         # The class is frozen (in OptiGenAlg init), for now it's impossible to
         # add new properties
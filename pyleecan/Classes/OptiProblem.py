@@ -7,7 +7,7 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
@@ -44,6 +44,7 @@ class OptiProblem(FrozenClass):
         constraint=-1,
         preprocessing=None,
         datakeeper_list=-1,
+        eval_cache=None,
         init_dict=None,
         init_str=None,
     ):
@@ -76,6 +77,8 @@ class OptiProblem(FrozenClass):
                 preprocessing = init_dict["preprocessing"]
             if "datakeeper_list" in list(init_dict.keys()):
                 datakeeper_list = init_dict["datakeeper_list"]
+            if "eval_cache" in list(init_dict.keys()):
+                eval_cache = init_dict["eval_cache"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
         self.simu = simu
@@ -85,6 +88,7 @@ class OptiProblem(FrozenClass):
         self.constraint = constraint
         self.preprocessing = preprocessing
         self.datakeeper_list = datakeeper_list
+        self.eval_cache = eval_cache
 
         # The class is frozen, for now it's impossible to add new properties
         self._freeze()
@@ -147,6 +151,13 @@ class OptiProblem(FrozenClass):
             OptiProblem_str += (
                 "datakeeper_list[" + str(ii) + "] =" + tmp + linesep + linesep
             )
+        if self.eval_cache is not None:
+            tmp = (
+                self.eval_cache.__str__().replace(linesep, linesep + "\t").rstrip("\t")
+            )
+            OptiProblem_str += "eval_cache = " + tmp
+        else:
+            OptiProblem_str += "eval_cache = None" + linesep + linesep
         return OptiProblem_str
 
     def __eq__(self, other):
@@ -168,6 +179,8 @@ class OptiProblem(FrozenClass):
             return False
         if other.datakeeper_list != self.datakeeper_list:
             return False
+        if other.eval_cache != self.eval_cache:
+            return False
         return True
 
     def compare(self, other, name="self", ignore_list=None, is_add_value=False):
@@ -267,6 +280,19 @@ class OptiProblem(FrozenClass):
                         is_add_value=is_add_value,
                     )
                 )
+        if (other.eval_cache is None and self.eval_cache is not None) or (
+            other.eval_cache is not None and self.eval_cache is None
+        ):
+            diff_list.append(name + ".eval_cache None mismatch")
+        elif self.eval_cache is not None:
+            diff_list.extend(
+                self.eval_cache.compare(
+                    other.eval_cache,
+                    name=name + ".eval_cache",
+                    ignore_list=ignore_list,
+                    is_add_value=is_add_value,
+                )
+            )
         # Filter ignore differences
         diff_list = list(filter(lambda x: x not in ignore_list, diff_list))
         return diff_list
@@ -290,6 +316,7 @@ class OptiProblem(FrozenClass):
         if self.datakeeper_list is not None:
             for value in self.datakeeper_list:
                 S += getsizeof(value)
+        S += getsizeof(self.eval_cache)
         return S
 
     def as_dict(self, type_handle_ndarray=0, keep_function=False, **kwargs):
@@ -396,6 +423,14 @@ class OptiProblem(FrozenClass):
                     )
                 else:
                     OptiProblem_dict["datakeeper_list"].append(None)
+        if self.eval_cache is None:
+            OptiProblem_dict["eval_cache"] = None
+        else:
+            OptiProblem_dict["eval_cache"] = self.eval_cache.as_dict(
+                type_handle_ndarray=type_handle_ndarray,
+                keep_function=keep_function,
+                **kwargs,
+            )
         # The class name is added to the dict for deserialisation purpose
         OptiProblem_dict["__class__"] = "OptiProblem"
         return OptiProblem_dict
@@ -411,6 +446,8 @@ class OptiProblem(FrozenClass):
         self.constraint = None
         self.preprocessing = None
         self.datakeeper_list = None
+        if self.eval_cache is not None:
+            self.eval_cache._set_None()
 
     def _get_simu(self):
         """getter of simu"""
@@ -684,3 +721,42 @@ class OptiProblem(FrozenClass):
         :Type: [DataKeeper]
         """,
     )
+
+    def _get_eval_cache(self):
+        """getter of eval_cache"""
+        return self._eval_cache
+
+    def _set_eval_cache(self, value):
+        """setter of eval_cache"""
+        if isinstance(value, str):  # Load from file
+            try:
+                value = load_init_dict(value)[1]
+            except Exception as e:
+                self.get_logger().error(
+                    "Error while loading " + value + ", setting None instead"
+                )
+                value = None
+        if isinstance(value, dict) and "__class__" in value:
+            class_obj = import_class(
+                "pyleecan.Classes", value.get("__class__"), "eval_cache"
+            )
+            value = class_obj(init_dict=value)
+        elif type(value) is int and value == -1:  # Default constructor
+            OptiEvalCache = import_class(
+                "pyleecan.Classes", "OptiEvalCache", "eval_cache"
+            )
+            value = OptiEvalCache()
+        check_var("eval_cache", value, "OptiEvalCache")
+        self._eval_cache = value
+
+        if self._eval_cache is not None:
+            self._eval_cache.parent = self
+
+    eval_cache = property(
+        fget=_get_eval_cache,
+        fset=_set_eval_cache,
+        doc="""Cache of the evaluations to not evaluate the same design variables twice (None to deactivate)
+
+        :Type: OptiEvalCache
+        """,
+    )
@@ -7,7 +7,7 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
@@ -36,6 +36,7 @@ class OptiSolver(FrozenClass):
         xoutput=-1,
         logger_name="Pyleecan.OptiSolver",
         is_keep_all_output=False,
+        store=None,
         init_dict=None,
         init_str=None,
     ):
@@ -62,12 +63,15 @@ class OptiSolver(FrozenClass):
                 logger_name = init_dict["logger_name"]
             if "is_keep_all_output" in list(init_dict.keys()):
                 is_keep_all_output = init_dict["is_keep_all_output"]
+            if "store" in list(init_dict.keys()):
+                store = init_dict["store"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
         self.problem = problem
         self.xoutput = xoutput
         self.logger_name = logger_name
         self.is_keep_all_output = is_keep_all_output
+        self.store = store
 
         # The class is frozen, for now it's impossible to add new properties
         self._freeze()
@@ -94,6 +98,11 @@ class OptiSolver(FrozenClass):
         OptiSolver_str += (
             "is_keep_all_output = " + str(self.is_keep_all_output) + linesep
         )
+        if self.store is not None:
+            tmp = self.store.__str__().replace(linesep, linesep + "\t").rstrip("\t")
+            OptiSolver_str += "store = " + tmp
+        else:
+            OptiSolver_str += "store = None" + linesep + linesep
         return OptiSolver_str
 
     def __eq__(self, other):
@@ -109,6 +118,8 @@ class OptiSolver(FrozenClass):
             return False
         if other.is_keep_all_output != self.is_keep_all_output:
             return False
+        if other.store != self.store:
+            return False
         return True
 
     def compare(self, other, name="self", ignore_list=None, is_add_value=False):
@@ -169,6 +180,19 @@ class OptiSolver(FrozenClass):
                 diff_list.append(name + ".is_keep_all_output" + val_str)
             else:
                 diff_list.append(name + ".is_keep_all_output")
+        if (other.store is None and self.store is not None) or (
+            other.store is not None and self.store is None
+        ):
+            diff_list.append(name + ".store None mismatch")
+        elif self.store is not None:
+            diff_list.extend(
+                self.store.compare(
+                    other.store,
+                    name=name + ".store",
+                    ignore_list=ignore_list,
+                    is_add_value=is_add_value,
+                )
+            )
         # Filter ignore differences
         diff_list = list(filter(lambda x: x not in ignore_list, diff_list))
         return diff_list
@@ -181,6 +205,7 @@ class OptiSolver(FrozenClass):
         S += getsizeof(self.xoutput)
         S += getsizeof(self.logger_name)
         S += getsizeof(self.is_keep_all_output)
+        S += getsizeof(self.store)
         return S
 
     def as_dict(self, type_handle_ndarray=0, keep_function=False, **kwargs):
@@ -213,6 +238,14 @@ class OptiSolver(FrozenClass):
             )
         OptiSolver_dict["logger_name"] = self.logger_name
         OptiSolver_dict["is_keep_all_output"] = self.is_keep_all_output
+        if self.store is None:
+            OptiSolver_dict["store"] = None
+        else:
+            OptiSolver_dict["store"] = self.store.as_dict(
+                type_handle_ndarray=type_handle_ndarray,
+                keep_function=keep_function,
+                **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         OptiSolver_dict["__class__"] = "OptiSolver"
         return OptiSolver_dict
@@ -226,6 +259,8 @@ class OptiSolver(FrozenClass):
             self.xoutput._set_None()
         self.logger_name = None
         self.is_keep_all_output = None
+        if self.store is not None:
+            self.store._set_None()
 
     def _get_problem(self):
         """getter of problem"""
@@ -336,3 +371,40 @@ class OptiSolver(FrozenClass):
         :Type: bool
         """,
     )
+
+    def _get_store(self):
+        """getter of store"""
+        return self._store
+
+    def _set_store(self, value):
+        """setter of store"""
+        if isinstance(value, str):  # Load from file
+            try:
+                value = load_init_dict(value)[1]
+            except Exception as e:
+                self.get_logger().error(
+                    "Error while loading " + value + ", setting None instead"
+                )
+                value = None
+        if isinstance(value, dict) and "__class__" in value:
+            class_obj = import_class(
+                "pyleecan.Classes", value.get("__class__"), "store"
+            )
+            value = class_obj(init_dict=value)
+        elif type(value) is int and value == -1:  # Default constructor
+            XOutputStore = import_class("pyleecan.Classes", "XOutputStore", "store")
+            value = XOutputStore()
+        check_var("store", value, "XOutputStore")
+        self._store = value
+
+        if self._store is not None:
+            self._store.parent = self
+
+    store = property(
+        fget=_get_store,
+        fset=_set_store,
+        doc=u"""Store to save the results of each evaluation as soon as its generation is done (and to resume an interrupted optimization), None to only keep the results in the XOutput
+
+        :Type: XOutputStore
+        """,
+    )
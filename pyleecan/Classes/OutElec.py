@@ -7,47 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Output.OutElec.get_Nr import get_Nr
-except ImportError as error:
-    get_Nr = error
-
-try:
-    from ..Methods.Output.OutElec.get_Is import get_Is
-except ImportError as error:
-    get_Is = error
-
-try:
-    from ..Methods.Output.OutElec.get_Us import get_Us
-except ImportError as error:
-    get_Us = error
-
-try:
-    from ..Methods.Output.OutElec.store import store
-except ImportError as error:
-    store = error
-
-try:
-    from ..Methods.Output.OutElec.get_electrical import get_electrical
-except ImportError as error:
-    get_electrical = error
-
-try:
-    from ..Methods.Output.OutElec.get_Jrms import get_Jrms
-except ImportError as error:
-    get_Jrms = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -57,63 +25,13 @@ class OutElec(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Output.OutElec.get_Nr
-    if isinstance(get_Nr, ImportError):
-        get_Nr = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OutElec method get_Nr: " + str(get_Nr))
-            )
-        )
-    else:
-        get_Nr = get_Nr
-    # cf Methods.Output.OutElec.get_Is
-    if isinstance(get_Is, ImportError):
-        get_Is = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OutElec method get_Is: " + str(get_Is))
-            )
-        )
-    else:
-        get_Is = get_Is
-    # cf Methods.Output.OutElec.get_Us
-    if isinstance(get_Us, ImportError):
-        get_Us = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OutElec method get_Us: " + str(get_Us))
-            )
-        )
-    else:
-        get_Us = get_Us
-    # cf Methods.Output.OutElec.store
-    if isinstance(store, ImportError):
-        store = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OutElec method store: " + str(store))
-            )
-        )
-    else:
-        store = store
-    # cf Methods.Output.OutElec.get_electrical
-    if isinstance(get_electrical, ImportError):
-        get_electrical = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use OutElec method get_electrical: " + str(get_electrical)
-                )
-            )
-        )
-    else:
-        get_electrical = get_electrical
-    # cf Methods.Output.OutElec.get_Jrms
-    if isinstance(get_Jrms, ImportError):
-        get_Jrms = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OutElec method get_Jrms: " + str(get_Jrms))
-            )
-        )
-    else:
-        get_Jrms = get_Jrms
+    # Methods imported on first use to remove unnecessary dependencies
+    get_Nr = LazyMethod(__package__, "..Methods.Output.OutElec.get_Nr")
+    get_Is = LazyMethod(__package__, "..Methods.Output.OutElec.get_Is")
+    get_Us = LazyMethod(__package__, "..Methods.Output.OutElec.get_Us")
+    store = LazyMethod(__package__, "..Methods.Output.OutElec.store")
+    get_electrical = LazyMethod(__package__, "..Methods.Output.OutElec.get_electrical")
+    get_Jrms = LazyMethod(__package__, "..Methods.Output.OutElec.get_Jrms")
     # save and copy methods are available in all object
     save = save
     copy = copy
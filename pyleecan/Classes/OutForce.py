@@ -7,22 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Output.OutForce.store import store
-except ImportError as error:
-    store = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -32,15 +25,8 @@ class OutForce(FrozenClass):
 
     VERSION = 1
 
-    # cf Methods.Output.OutForce.store
-    if isinstance(store, ImportError):
-        store = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OutForce method store: " + str(store))
-            )
-        )
-    else:
-        store = store
+    # Methods imported on first use to remove unnecessary dependencies
+    store = LazyMethod(__package__, "..Methods.Output.OutForce.store")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,12 +7,13 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import set_array, check_var, raise_
+from ._check import set_array, check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyArray
 from ._frozen import FrozenClass
 
 from numpy import array, array_equal
@@ -391,6 +392,8 @@ class OutGeoLam(FrozenClass):
 
     def _get_BH_curve(self):
         """getter of BH_curve"""
+        if isinstance(self._BH_curve, LazyArray):
+            self._BH_curve = self._BH_curve.read()
         return self._BH_curve
 
     def _set_BH_curve(self, value):
@@ -7,47 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Output.OutLoss.get_loss import get_loss
-except ImportError as error:
-    get_loss = error
-
-try:
-    from ..Methods.Output.OutLoss.get_loss_density_ag import get_loss_density_ag
-except ImportError as error:
-    get_loss_density_ag = error
-
-try:
-    from ..Methods.Output.OutLoss.get_loss_dist import get_loss_dist
-except ImportError as error:
-    get_loss_dist = error
-
-try:
-    from ..Methods.Output.OutLoss.get_loss_group import get_loss_group
-except ImportError as error:
-    get_loss_group = error
-
-try:
-    from ..Methods.Output.OutLoss.get_loss_overall import get_loss_overall
-except ImportError as error:
-    get_loss_overall = error
-
-try:
-    from ..Methods.Output.OutLoss.store import store
-except ImportError as error:
-    store = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -57,71 +25,17 @@ class OutLoss(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Output.OutLoss.get_loss
-    if isinstance(get_loss, ImportError):
-        get_loss = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OutLoss method get_loss: " + str(get_loss))
-            )
-        )
-    else:
-        get_loss = get_loss
-    # cf Methods.Output.OutLoss.get_loss_density_ag
-    if isinstance(get_loss_density_ag, ImportError):
-        get_loss_density_ag = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use OutLoss method get_loss_density_ag: "
-                    + str(get_loss_density_ag)
-                )
-            )
-        )
-    else:
-        get_loss_density_ag = get_loss_density_ag
-    # cf Methods.Output.OutLoss.get_loss_dist
-    if isinstance(get_loss_dist, ImportError):
-        get_loss_dist = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use OutLoss method get_loss_dist: " + str(get_loss_dist)
-                )
-            )
-        )
-    else:
-        get_loss_dist = get_loss_dist
-    # cf Methods.Output.OutLoss.get_loss_group
-    if isinstance(get_loss_group, ImportError):
-        get_loss_group = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use OutLoss method get_loss_group: " + str(get_loss_group)
-                )
-            )
-        )
-    else:
-        get_loss_group = get_loss_group
-    # cf Methods.Output.OutLoss.get_loss_overall
-    if isinstance(get_loss_overall, ImportError):
-        get_loss_overall = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use OutLoss method get_loss_overall: "
-                    + str(get_loss_overall)
-                )
-            )
-        )
-    else:
-        get_loss_overall = get_loss_overall
-    # cf Methods.Output.OutLoss.store
-    if isinstance(store, ImportError):
-        store = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OutLoss method store: " + str(store))
-            )
-        )
-    else:
-        store = store
+    # Methods imported on first use to remove unnecessary dependencies
+    get_loss = LazyMethod(__package__, "..Methods.Output.OutLoss.get_loss")
+    get_loss_density_ag = LazyMethod(
+        __package__, "..Methods.Output.OutLoss.get_loss_density_ag"
+    )
+    get_loss_dist = LazyMethod(__package__, "..Methods.Output.OutLoss.get_loss_dist")
+    get_loss_group = LazyMethod(__package__, "..Methods.Output.OutLoss.get_loss_group")
+    get_loss_overall = LazyMethod(
+        __package__, "..Methods.Output.OutLoss.get_loss_overall"
+    )
+    store = LazyMethod(__package__, "..Methods.Output.OutLoss.store")
     # save and copy methods are available in all object
     save = save
     copy = copy
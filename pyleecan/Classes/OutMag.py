@@ -7,47 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Output.OutMag.clean import clean
-except ImportError as error:
-    clean = error
-
-try:
-    from ..Methods.Output.OutMag.comp_emf import comp_emf
-except ImportError as error:
-    comp_emf = error
-
-try:
-    from ..Methods.Output.OutMag.comp_power import comp_power
-except ImportError as error:
-    comp_power = error
-
-try:
-    from ..Methods.Output.OutMag.get_demag import get_demag
-except ImportError as error:
-    get_demag = error
-
-try:
-    from ..Methods.Output.OutMag.store import store
-except ImportError as error:
-    store = error
-
-try:
-    from ..Methods.Output.OutMag.comp_torque_MT import comp_torque_MT
-except ImportError as error:
-    comp_torque_MT = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -57,63 +25,13 @@ class OutMag(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Output.OutMag.clean
-    if isinstance(clean, ImportError):
-        clean = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OutMag method clean: " + str(clean))
-            )
-        )
-    else:
-        clean = clean
-    # cf Methods.Output.OutMag.comp_emf
-    if isinstance(comp_emf, ImportError):
-        comp_emf = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OutMag method comp_emf: " + str(comp_emf))
-            )
-        )
-    else:
-        comp_emf = comp_emf
-    # cf Methods.Output.OutMag.comp_power
-    if isinstance(comp_power, ImportError):
-        comp_power = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OutMag method comp_power: " + str(comp_power))
-            )
-        )
-    else:
-        comp_power = comp_power
-    # cf Methods.Output.OutMag.get_demag
-    if isinstance(get_demag, ImportError):
-        get_demag = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OutMag method get_demag: " + str(get_demag))
-            )
-        )
-    else:
-        get_demag = get_demag
-    # cf Methods.Output.OutMag.store
-    if isinstance(store, ImportError):
-        store = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OutMag method store: " + str(store))
-            )
-        )
-    else:
-        store = store
-    # cf Methods.Output.OutMag.comp_torque_MT
-    if isinstance(comp_torque_MT, ImportError):
-        comp_torque_MT = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use OutMag method comp_torque_MT: " + str(comp_torque_MT)
-                )
-            )
-        )
-    else:
-        comp_torque_MT = comp_torque_MT
+    # Methods imported on first use to remove unnecessary dependencies
+    clean = LazyMethod(__package__, "..Methods.Output.OutMag.clean")
+    comp_emf = LazyMethod(__package__, "..Methods.Output.OutMag.comp_emf")
+    comp_power = LazyMethod(__package__, "..Methods.Output.OutMag.comp_power")
+    get_demag = LazyMethod(__package__, "..Methods.Output.OutMag.get_demag")
+    store = LazyMethod(__package__, "..Methods.Output.OutMag.store")
+    comp_torque_MT = LazyMethod(__package__, "..Methods.Output.OutMag.comp_torque_MT")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,22 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .OutInternal import OutInternal
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Output.OutMagElmer.clean import clean
-except ImportError as error:
-    clean = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -32,15 +25,8 @@ class OutMagElmer(OutInternal):
 
     VERSION = 1
 
-    # cf Methods.Output.OutMagElmer.clean
-    if isinstance(clean, ImportError):
-        clean = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use OutMagElmer method clean: " + str(clean))
-            )
-        )
-    else:
-        clean = clean
+    # Methods imported on first use to remove unnecessary dependencies
+    clean = LazyMethod(__package__, "..Methods.Output.OutMagElmer.clean")
     # save and copy methods are available in all object
     save = save
     copy = copy
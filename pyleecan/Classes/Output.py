@@ -7,76 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Output.Output.getter.comp_angle_rotor import comp_angle_rotor
-except ImportError as error:
-    comp_angle_rotor = error
-
-try:
-    from ..Methods.Output.Output.getter.get_angle_rotor_initial import (
-        get_angle_rotor_initial,
-    )
-except ImportError as error:
-    get_angle_rotor_initial = error
-
-try:
-    from ..Methods.Output.Output.getter.get_angle_rotor import get_angle_rotor
-except ImportError as error:
-    get_angle_rotor = error
-
-try:
-    from ..Methods.Output.Output.getter.get_BH_rotor import get_BH_rotor
-except ImportError as error:
-    get_BH_rotor = error
-
-try:
-    from ..Methods.Output.Output.getter.get_BH_stator import get_BH_stator
-except ImportError as error:
-    get_BH_stator = error
-
-try:
-    from ..Methods.Output.Output.getter.get_path_result import get_path_result
-except ImportError as error:
-    get_path_result = error
-
-try:
-    from ..Methods.Output.Output.getter.get_machine_periodicity import (
-        get_machine_periodicity,
-    )
-except ImportError as error:
-    get_machine_periodicity = error
-
-try:
-    from ..Methods.Output.Output.getter.get_fund_harm import get_fund_harm
-except ImportError as error:
-    get_fund_harm = error
-
-try:
-    from ..Methods.Output.Output.getter.get_data_from_str import get_data_from_str
-except ImportError as error:
-    get_data_from_str = error
-
-try:
-    from ..Methods.Output.Output.plot.Magnetic.plot_B_mesh import plot_B_mesh
-except ImportError as error:
-    plot_B_mesh = error
-
-try:
-    from ..Methods.Output.Output.print_memory import print_memory
-except ImportError as error:
-    print_memory = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -86,129 +25,38 @@ class Output(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Output.Output.getter.comp_angle_rotor
-    if isinstance(comp_angle_rotor, ImportError):
-        comp_angle_rotor = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Output method comp_angle_rotor: " + str(comp_angle_rotor)
-                )
-            )
-        )
-    else:
-        comp_angle_rotor = comp_angle_rotor
-    # cf Methods.Output.Output.getter.get_angle_rotor_initial
-    if isinstance(get_angle_rotor_initial, ImportError):
-        get_angle_rotor_initial = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Output method get_angle_rotor_initial: "
-                    + str(get_angle_rotor_initial)
-                )
-            )
-        )
-    else:
-        get_angle_rotor_initial = get_angle_rotor_initial
-    # cf Methods.Output.Output.getter.get_angle_rotor
-    if isinstance(get_angle_rotor, ImportError):
-        get_angle_rotor = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Output method get_angle_rotor: " + str(get_angle_rotor)
-                )
-            )
-        )
-    else:
-        get_angle_rotor = get_angle_rotor
-    # cf Methods.Output.Output.getter.get_BH_rotor
-    if isinstance(get_BH_rotor, ImportError):
-        get_BH_rotor = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Output method get_BH_rotor: " + str(get_BH_rotor)
-                )
-            )
-        )
-    else:
-        get_BH_rotor = get_BH_rotor
-    # cf Methods.Output.Output.getter.get_BH_stator
-    if isinstance(get_BH_stator, ImportError):
-        get_BH_stator = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Output method get_BH_stator: " + str(get_BH_stator)
-                )
-            )
-        )
-    else:
-        get_BH_stator = get_BH_stator
-    # cf Methods.Output.Output.getter.get_path_result
-    if isinstance(get_path_result, ImportError):
-        get_path_result = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Output method get_path_result: " + str(get_path_result)
-                )
-            )
-        )
-    else:
-        get_path_result = get_path_result
-    # cf Methods.Output.Output.getter.get_machine_periodicity
-    if isinstance(get_machine_periodicity, ImportError):
-        get_machine_periodicity = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Output method get_machine_periodicity: "
-                    + str(get_machine_periodicity)
-                )
-            )
-        )
-    else:
-        get_machine_periodicity = get_machine_periodicity
-    # cf Methods.Output.Output.getter.get_fund_harm
-    if isinstance(get_fund_harm, ImportError):
-        get_fund_harm = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Output method get_fund_harm: " + str(get_fund_harm)
-                )
-            )
-        )
-    else:
-        get_fund_harm = get_fund_harm
-    # cf Methods.Output.Output.getter.get_data_from_str
-    if isinstance(get_data_from_str, ImportError):
-        get_data_from_str = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Output method get_data_from_str: "
-                    + str(get_data_from_str)
-                )
-            )
-        )
-    else:
-        get_data_from_str = get_data_from_str
-    # cf Methods.Output.Output.plot.Magnetic.plot_B_mesh
-    if isinstance(plot_B_mesh, ImportError):
-        plot_B_mesh = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Output method plot_B_mesh: " + str(plot_B_mesh))
-            )
-        )
-    else:
-        plot_B_mesh = plot_B_mesh
-    # cf Methods.Output.Output.print_memory
-    if isinstance(print_memory, ImportError):
-        print_memory = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Output method print_memory: " + str(print_memory)
-                )
-            )
-        )
-    else:
-        print_memory = print_memory
+    # Methods imported on first use to remove unnecessary dependencies
+    comp_angle_rotor = LazyMethod(
+        __package__, "..Methods.Output.Output.getter.comp_angle_rotor"
+    )
+    get_angle_rotor_initial = LazyMethod(
+        __package__, "..Methods.Output.Output.getter.get_angle_rotor_initial"
+    )
+    get_angle_rotor = LazyMethod(
+        __package__, "..Methods.Output.Output.getter.get_angle_rotor"
+    )
+    get_BH_rotor = LazyMethod(
+        __package__, "..Methods.Output.Output.getter.get_BH_rotor"
+    )
+    get_BH_stator = LazyMethod(
+        __package__, "..Methods.Output.Output.getter.get_BH_stator"
+    )
+    get_path_result = LazyMethod(
+        __package__, "..Methods.Output.Output.getter.get_path_result"
+    )
+    get_machine_periodicity = LazyMethod(
+        __package__, "..Methods.Output.Output.getter.get_machine_periodicity"
+    )
+    get_fund_harm = LazyMethod(
+        __package__, "..Methods.Output.Output.getter.get_fund_harm"
+    )
+    get_data_from_str = LazyMethod(
+        __package__, "..Methods.Output.Output.getter.get_data_from_str"
+    )
+    plot_B_mesh = LazyMethod(
+        __package__, "..Methods.Output.Output.plot.Magnetic.plot_B_mesh"
+    )
+    print_memory = LazyMethod(__package__, "..Methods.Output.Output.print_memory")
     # save and copy methods are available in all object
     save = save
     copy = copy
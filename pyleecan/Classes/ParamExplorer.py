@@ -7,32 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.ParamExplorer._set_setter import _set_setter
-except ImportError as error:
-    _set_setter = error
-
-try:
-    from ..Methods.Simulation.ParamExplorer._set_getter import _set_getter
-except ImportError as error:
-    _set_getter = error
-
-try:
-    from ..Methods.Simulation.ParamExplorer.get_desc import get_desc
-except ImportError as error:
-    get_desc = error
-
-
 from ntpath import basename
 from os.path import isfile
 from ._check import CheckTypeError
@@ -47,38 +30,17 @@ class ParamExplorer(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.ParamExplorer._set_setter
-    if isinstance(_set_setter, ImportError):
-        _set_setter = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ParamExplorer method _set_setter: " + str(_set_setter)
-                )
-            )
-        )
-    else:
-        _set_setter = _set_setter
-    # cf Methods.Simulation.ParamExplorer._set_getter
-    if isinstance(_set_getter, ImportError):
-        _set_getter = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ParamExplorer method _set_getter: " + str(_set_getter)
-                )
-            )
-        )
-    else:
-        _set_getter = _set_getter
-    # cf Methods.Simulation.ParamExplorer.get_desc
-    if isinstance(get_desc, ImportError):
-        get_desc = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use ParamExplorer method get_desc: " + str(get_desc))
-            )
-        )
-    else:
-        get_desc = get_desc
+    # Methods imported on first use to remove unnecessary dependencies
+    _set_setter = LazyMethod(
+        __package__, "..Methods.Simulation.ParamExplorer._set_setter"
+    )
+    _set_getter = LazyMethod(
+        __package__, "..Methods.Simulation.ParamExplorer._set_getter"
+    )
+    get_desc = LazyMethod(__package__, "..Methods.Simulation.ParamExplorer.get_desc")
+    get_setter_path = LazyMethod(
+        __package__, "..Methods.Simulation.ParamExplorer.get_setter_path"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,37 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .ParamExplorer import ParamExplorer
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.ParamExplorerInterval.get_value import get_value
-except ImportError as error:
-    get_value = error
-
-try:
-    from ..Methods.Simulation.ParamExplorerInterval.get_min import get_min
-except ImportError as error:
-    get_min = error
-
-try:
-    from ..Methods.Simulation.ParamExplorerInterval.get_max import get_max
-except ImportError as error:
-    get_max = error
-
-try:
-    from ..Methods.Simulation.ParamExplorerInterval.get_N import get_N
-except ImportError as error:
-    get_N = error
-
-
 from ntpath import basename
 from os.path import isfile
 from ._check import CheckTypeError
@@ -52,52 +30,17 @@ class ParamExplorerInterval(ParamExplorer):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.ParamExplorerInterval.get_value
-    if isinstance(get_value, ImportError):
-        get_value = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ParamExplorerInterval method get_value: "
-                    + str(get_value)
-                )
-            )
-        )
-    else:
-        get_value = get_value
-    # cf Methods.Simulation.ParamExplorerInterval.get_min
-    if isinstance(get_min, ImportError):
-        get_min = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ParamExplorerInterval method get_min: " + str(get_min)
-                )
-            )
-        )
-    else:
-        get_min = get_min
-    # cf Methods.Simulation.ParamExplorerInterval.get_max
-    if isinstance(get_max, ImportError):
-        get_max = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ParamExplorerInterval method get_max: " + str(get_max)
-                )
-            )
-        )
-    else:
-        get_max = get_max
-    # cf Methods.Simulation.ParamExplorerInterval.get_N
-    if isinstance(get_N, ImportError):
-        get_N = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ParamExplorerInterval method get_N: " + str(get_N)
-                )
-            )
-        )
-    else:
-        get_N = get_N
+    # Methods imported on first use to remove unnecessary dependencies
+    get_value = LazyMethod(
+        __package__, "..Methods.Simulation.ParamExplorerInterval.get_value"
+    )
+    get_min = LazyMethod(
+        __package__, "..Methods.Simulation.ParamExplorerInterval.get_min"
+    )
+    get_max = LazyMethod(
+        __package__, "..Methods.Simulation.ParamExplorerInterval.get_max"
+    )
+    get_N = LazyMethod(__package__, "..Methods.Simulation.ParamExplorerInterval.get_N")
     # save and copy methods are available in all object
     save = save
     copy = copy
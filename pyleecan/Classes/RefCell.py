@@ -7,22 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Mesh.RefCell.interpolation import interpolation
-except ImportError as error:
-    interpolation = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -32,17 +25,8 @@ class RefCell(FrozenClass):
 
     VERSION = 1
 
-    # cf Methods.Mesh.RefCell.interpolation
-    if isinstance(interpolation, ImportError):
-        interpolation = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use RefCell method interpolation: " + str(interpolation)
-                )
-            )
-        )
-    else:
-        interpolation = interpolation
+    # Methods imported on first use to remove unnecessary dependencies
+    interpolation = LazyMethod(__package__, "..Methods.Mesh.RefCell.interpolation")
     # save and copy methods are available in all object
     save = save
     copy = copy
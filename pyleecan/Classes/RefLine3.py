@@ -7,47 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .RefCell import RefCell
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Mesh.RefLine3.shape_function import shape_function
-except ImportError as error:
-    shape_function = error
-
-try:
-    from ..Methods.Mesh.RefLine3.jacobian import jacobian
-except ImportError as error:
-    jacobian = error
-
-try:
-    from ..Methods.Mesh.RefLine3.grad_shape_function import grad_shape_function
-except ImportError as error:
-    grad_shape_function = error
-
-try:
-    from ..Methods.Mesh.RefLine3.get_real_point import get_real_point
-except ImportError as error:
-    get_real_point = error
-
-try:
-    from ..Methods.Mesh.RefLine3.get_ref_point import get_ref_point
-except ImportError as error:
-    get_ref_point = error
-
-try:
-    from ..Methods.Mesh.RefLine3.is_inside import is_inside
-except ImportError as error:
-    is_inside = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -57,70 +25,15 @@ class RefLine3(RefCell):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Mesh.RefLine3.shape_function
-    if isinstance(shape_function, ImportError):
-        shape_function = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use RefLine3 method shape_function: " + str(shape_function)
-                )
-            )
-        )
-    else:
-        shape_function = shape_function
-    # cf Methods.Mesh.RefLine3.jacobian
-    if isinstance(jacobian, ImportError):
-        jacobian = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use RefLine3 method jacobian: " + str(jacobian))
-            )
-        )
-    else:
-        jacobian = jacobian
-    # cf Methods.Mesh.RefLine3.grad_shape_function
-    if isinstance(grad_shape_function, ImportError):
-        grad_shape_function = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use RefLine3 method grad_shape_function: "
-                    + str(grad_shape_function)
-                )
-            )
-        )
-    else:
-        grad_shape_function = grad_shape_function
-    # cf Methods.Mesh.RefLine3.get_real_point
-    if isinstance(get_real_point, ImportError):
-        get_real_point = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use RefLine3 method get_real_point: " + str(get_real_point)
-                )
-            )
-        )
-    else:
-        get_real_point = get_real_point
-    # cf Methods.Mesh.RefLine3.get_ref_point
-    if isinstance(get_ref_point, ImportError):
-        get_ref_point = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use RefLine3 method get_ref_point: " + str(get_ref_point)
-                )
-            )
-        )
-    else:
-        get_ref_point = get_ref_point
-    # cf Methods.Mesh.RefLine3.is_inside
-    if isinstance(is_inside, ImportError):
-        is_inside = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use RefLine3 method is_inside: " + str(is_inside))
-            )
-        )
-    else:
-        is_inside = is_inside
+    # Methods imported on first use to remove unnecessary dependencies
+    shape_function = LazyMethod(__package__, "..Methods.Mesh.RefLine3.shape_function")
+    jacobian = LazyMethod(__package__, "..Methods.Mesh.RefLine3.jacobian")
+    grad_shape_function = LazyMethod(
+        __package__, "..Methods.Mesh.RefLine3.grad_shape_function"
+    )
+    get_real_point = LazyMethod(__package__, "..Methods.Mesh.RefLine3.get_real_point")
+    get_ref_point = LazyMethod(__package__, "..Methods.Mesh.RefLine3.get_ref_point")
+    is_inside = LazyMethod(__package__, "..Methods.Mesh.RefLine3.is_inside")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,22 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .ScalarProduct import ScalarProduct
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Mesh.ScalarProductL2.scalar_product import scalar_product
-except ImportError as error:
-    scalar_product = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -32,18 +25,10 @@ class ScalarProductL2(ScalarProduct):
 
     VERSION = 1
 
-    # cf Methods.Mesh.ScalarProductL2.scalar_product
-    if isinstance(scalar_product, ImportError):
-        scalar_product = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use ScalarProductL2 method scalar_product: "
-                    + str(scalar_product)
-                )
-            )
-        )
-    else:
-        scalar_product = scalar_product
+    # Methods imported on first use to remove unnecessary dependencies
+    scalar_product = LazyMethod(
+        __package__, "..Methods.Mesh.ScalarProductL2.scalar_product"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
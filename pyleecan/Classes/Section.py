@@ -7,67 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Elmer import Elmer
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Elmer.Section.__delitem__ import __delitem__
-except ImportError as error:
-    __delitem__ = error
-
-try:
-    from ..Methods.Elmer.Section.__getitem__ import __getitem__
-except ImportError as error:
-    __getitem__ = error
-
-try:
-    from ..Methods.Elmer.Section.__iter__ import __iter__
-except ImportError as error:
-    __iter__ = error
-
-try:
-    from ..Methods.Elmer.Section.__len__ import __len__
-except ImportError as error:
-    __len__ = error
-
-try:
-    from ..Methods.Elmer.Section.__missing__ import __missing__
-except ImportError as error:
-    __missing__ = error
-
-try:
-    from ..Methods.Elmer.Section.__reversed__ import __reversed__
-except ImportError as error:
-    __reversed__ = error
-
-try:
-    from ..Methods.Elmer.Section.__setitem__ import __setitem__
-except ImportError as error:
-    __setitem__ = error
-
-try:
-    from ..Methods.Elmer.Section.pop import pop
-except ImportError as error:
-    pop = error
-
-try:
-    from ..Methods.Elmer.Section.keys import keys
-except ImportError as error:
-    keys = error
-
-try:
-    from ..Methods.Elmer.Section.write import write
-except ImportError as error:
-    write = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -77,99 +25,17 @@ class Section(Elmer):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Elmer.Section.__delitem__
-    if isinstance(__delitem__, ImportError):
-        __delitem__ = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Section method __delitem__: " + str(__delitem__))
-            )
-        )
-    else:
-        __delitem__ = __delitem__
-    # cf Methods.Elmer.Section.__getitem__
-    if isinstance(__getitem__, ImportError):
-        __getitem__ = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Section method __getitem__: " + str(__getitem__))
-            )
-        )
-    else:
-        __getitem__ = __getitem__
-    # cf Methods.Elmer.Section.__iter__
-    if isinstance(__iter__, ImportError):
-        __iter__ = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Section method __iter__: " + str(__iter__))
-            )
-        )
-    else:
-        __iter__ = __iter__
-    # cf Methods.Elmer.Section.__len__
-    if isinstance(__len__, ImportError):
-        __len__ = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Section method __len__: " + str(__len__))
-            )
-        )
-    else:
-        __len__ = __len__
-    # cf Methods.Elmer.Section.__missing__
-    if isinstance(__missing__, ImportError):
-        __missing__ = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Section method __missing__: " + str(__missing__))
-            )
-        )
-    else:
-        __missing__ = __missing__
-    # cf Methods.Elmer.Section.__reversed__
-    if isinstance(__reversed__, ImportError):
-        __reversed__ = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Section method __reversed__: " + str(__reversed__)
-                )
-            )
-        )
-    else:
-        __reversed__ = __reversed__
-    # cf Methods.Elmer.Section.__setitem__
-    if isinstance(__setitem__, ImportError):
-        __setitem__ = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Section method __setitem__: " + str(__setitem__))
-            )
-        )
-    else:
-        __setitem__ = __setitem__
-    # cf Methods.Elmer.Section.pop
-    if isinstance(pop, ImportError):
-        pop = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Section method pop: " + str(pop))
-            )
-        )
-    else:
-        pop = pop
-    # cf Methods.Elmer.Section.keys
-    if isinstance(keys, ImportError):
-        keys = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Section method keys: " + str(keys))
-            )
-        )
-    else:
-        keys = keys
-    # cf Methods.Elmer.Section.write
-    if isinstance(write, ImportError):
-        write = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Section method write: " + str(write))
-            )
-        )
-    else:
-        write = write
+    # Methods imported on first use to remove unnecessary dependencies
+    __delitem__ = LazyMethod(__package__, "..Methods.Elmer.Section.__delitem__")
+    __getitem__ = LazyMethod(__package__, "..Methods.Elmer.Section.__getitem__")
+    __iter__ = LazyMethod(__package__, "..Methods.Elmer.Section.__iter__")
+    __len__ = LazyMethod(__package__, "..Methods.Elmer.Section.__len__")
+    __missing__ = LazyMethod(__package__, "..Methods.Elmer.Section.__missing__")
+    __reversed__ = LazyMethod(__package__, "..Methods.Elmer.Section.__reversed__")
+    __setitem__ = LazyMethod(__package__, "..Methods.Elmer.Section.__setitem__")
+    pop = LazyMethod(__package__, "..Methods.Elmer.Section.pop")
+    keys = LazyMethod(__package__, "..Methods.Elmer.Section.keys")
+    write = LazyMethod(__package__, "..Methods.Elmer.Section.write")
     # save and copy methods are available in all object
     save = save
     copy = copy
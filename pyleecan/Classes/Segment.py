@@ -7,102 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Line import Line
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Geometry.Segment.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Geometry.Segment.comp_distance import comp_distance
-except ImportError as error:
-    comp_distance = error
-
-try:
-    from ..Methods.Geometry.Segment.comp_length import comp_length
-except ImportError as error:
-    comp_length = error
-
-try:
-    from ..Methods.Geometry.Segment.discretize import discretize
-except ImportError as error:
-    discretize = error
-
-try:
-    from ..Methods.Geometry.Segment.draw_FEMM import draw_FEMM
-except ImportError as error:
-    draw_FEMM = error
-
-try:
-    from ..Methods.Geometry.Segment.get_begin import get_begin
-except ImportError as error:
-    get_begin = error
-
-try:
-    from ..Methods.Geometry.Segment.get_end import get_end
-except ImportError as error:
-    get_end = error
-
-try:
-    from ..Methods.Geometry.Segment.get_middle import get_middle
-except ImportError as error:
-    get_middle = error
-
-try:
-    from ..Methods.Geometry.Segment.intersect_line import intersect_line
-except ImportError as error:
-    intersect_line = error
-
-try:
-    from ..Methods.Geometry.Segment.is_on_line import is_on_line
-except ImportError as error:
-    is_on_line = error
-
-try:
-    from ..Methods.Geometry.Segment.plot import plot
-except ImportError as error:
-    plot = error
-
-try:
-    from ..Methods.Geometry.Segment.reverse import reverse
-except ImportError as error:
-    reverse = error
-
-try:
-    from ..Methods.Geometry.Segment.rotate import rotate
-except ImportError as error:
-    rotate = error
-
-try:
-    from ..Methods.Geometry.Segment.scale import scale
-except ImportError as error:
-    scale = error
-
-try:
-    from ..Methods.Geometry.Segment.split_half import split_half
-except ImportError as error:
-    split_half = error
-
-try:
-    from ..Methods.Geometry.Segment.split_line import split_line
-except ImportError as error:
-    split_line = error
-
-try:
-    from ..Methods.Geometry.Segment.translate import translate
-except ImportError as error:
-    translate = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -112,164 +25,26 @@ class Segment(Line):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Geometry.Segment.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Geometry.Segment.comp_distance
-    if isinstance(comp_distance, ImportError):
-        comp_distance = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Segment method comp_distance: " + str(comp_distance)
-                )
-            )
-        )
-    else:
-        comp_distance = comp_distance
-    # cf Methods.Geometry.Segment.comp_length
-    if isinstance(comp_length, ImportError):
-        comp_length = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method comp_length: " + str(comp_length))
-            )
-        )
-    else:
-        comp_length = comp_length
-    # cf Methods.Geometry.Segment.discretize
-    if isinstance(discretize, ImportError):
-        discretize = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method discretize: " + str(discretize))
-            )
-        )
-    else:
-        discretize = discretize
-    # cf Methods.Geometry.Segment.draw_FEMM
-    if isinstance(draw_FEMM, ImportError):
-        draw_FEMM = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method draw_FEMM: " + str(draw_FEMM))
-            )
-        )
-    else:
-        draw_FEMM = draw_FEMM
-    # cf Methods.Geometry.Segment.get_begin
-    if isinstance(get_begin, ImportError):
-        get_begin = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method get_begin: " + str(get_begin))
-            )
-        )
-    else:
-        get_begin = get_begin
-    # cf Methods.Geometry.Segment.get_end
-    if isinstance(get_end, ImportError):
-        get_end = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method get_end: " + str(get_end))
-            )
-        )
-    else:
-        get_end = get_end
-    # cf Methods.Geometry.Segment.get_middle
-    if isinstance(get_middle, ImportError):
-        get_middle = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method get_middle: " + str(get_middle))
-            )
-        )
-    else:
-        get_middle = get_middle
-    # cf Methods.Geometry.Segment.intersect_line
-    if isinstance(intersect_line, ImportError):
-        intersect_line = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Segment method intersect_line: " + str(intersect_line)
-                )
-            )
-        )
-    else:
-        intersect_line = intersect_line
-    # cf Methods.Geometry.Segment.is_on_line
-    if isinstance(is_on_line, ImportError):
-        is_on_line = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method is_on_line: " + str(is_on_line))
-            )
-        )
-    else:
-        is_on_line = is_on_line
-    # cf Methods.Geometry.Segment.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
-    # cf Methods.Geometry.Segment.reverse
-    if isinstance(reverse, ImportError):
-        reverse = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method reverse: " + str(reverse))
-            )
-        )
-    else:
-        reverse = reverse
-    # cf Methods.Geometry.Segment.rotate
-    if isinstance(rotate, ImportError):
-        rotate = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method rotate: " + str(rotate))
-            )
-        )
-    else:
-        rotate = rotate
-    # cf Methods.Geometry.Segment.scale
-    if isinstance(scale, ImportError):
-        scale = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method scale: " + str(scale))
-            )
-        )
-    else:
-        scale = scale
-    # cf Methods.Geometry.Segment.split_half
-    if isinstance(split_half, ImportError):
-        split_half = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method split_half: " + str(split_half))
-            )
-        )
-    else:
-        split_half = split_half
-    # cf Methods.Geometry.Segment.split_line
-    if isinstance(split_line, ImportError):
-        split_line = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method split_line: " + str(split_line))
-            )
-        )
-    else:
-        split_line = split_line
-    # cf Methods.Geometry.Segment.translate
-    if isinstance(translate, ImportError):
-        translate = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Segment method translate: " + str(translate))
-            )
-        )
-    else:
-        translate = translate
+    # Methods imported on first use to remove unnecessary dependencies
+    check = LazyMethod(__package__, "..Methods.Geometry.Segment.check")
+    comp_distance = LazyMethod(__package__, "..Methods.Geometry.Segment.comp_distance")
+    comp_length = LazyMethod(__package__, "..Methods.Geometry.Segment.comp_length")
+    discretize = LazyMethod(__package__, "..Methods.Geometry.Segment.discretize")
+    draw_FEMM = LazyMethod(__package__, "..Methods.Geometry.Segment.draw_FEMM")
+    get_begin = LazyMethod(__package__, "..Methods.Geometry.Segment.get_begin")
+    get_end = LazyMethod(__package__, "..Methods.Geometry.Segment.get_end")
+    get_middle = LazyMethod(__package__, "..Methods.Geometry.Segment.get_middle")
+    intersect_line = LazyMethod(
+        __package__, "..Methods.Geometry.Segment.intersect_line"
+    )
+    is_on_line = LazyMethod(__package__, "..Methods.Geometry.Segment.is_on_line")
+    plot = LazyMethod(__package__, "..Methods.Geometry.Segment.plot")
+    reverse = LazyMethod(__package__, "..Methods.Geometry.Segment.reverse")
+    rotate = LazyMethod(__package__, "..Methods.Geometry.Segment.rotate")
+    scale = LazyMethod(__package__, "..Methods.Geometry.Segment.scale")
+    split_half = LazyMethod(__package__, "..Methods.Geometry.Segment.split_half")
+    split_line = LazyMethod(__package__, "..Methods.Geometry.Segment.split_line")
+    translate = LazyMethod(__package__, "..Methods.Geometry.Segment.translate")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,32 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.Shaft.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from ..Methods.Machine.Shaft.comp_mass import comp_mass
-except ImportError as error:
-    comp_mass = error
-
-try:
-    from ..Methods.Machine.Shaft.plot import plot
-except ImportError as error:
-    plot = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -42,36 +25,10 @@ class Shaft(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.Shaft.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Shaft method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
-    # cf Methods.Machine.Shaft.comp_mass
-    if isinstance(comp_mass, ImportError):
-        comp_mass = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Shaft method comp_mass: " + str(comp_mass))
-            )
-        )
-    else:
-        comp_mass = comp_mass
-    # cf Methods.Machine.Shaft.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Shaft method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
+    # Methods imported on first use to remove unnecessary dependencies
+    build_geometry = LazyMethod(__package__, "..Methods.Machine.Shaft.build_geometry")
+    comp_mass = LazyMethod(__package__, "..Methods.Machine.Shaft.comp_mass")
+    plot = LazyMethod(__package__, "..Methods.Machine.Shaft.plot")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,22 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Simulation import Simulation
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.Simu1.run_single import run_single
-except ImportError as error:
-    run_single = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -32,15 +25,8 @@ class Simu1(Simulation):
 
     VERSION = 1
 
-    # cf Methods.Simulation.Simu1.run_single
-    if isinstance(run_single, ImportError):
-        run_single = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Simu1 method run_single: " + str(run_single))
-            )
-        )
-    else:
-        run_single = run_single
+    # Methods imported on first use to remove unnecessary dependencies
+    run_single = LazyMethod(__package__, "..Methods.Simulation.Simu1.run_single")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,32 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.Simulation.run import run
-except ImportError as error:
-    run = error
-
-try:
-    from ..Methods.Simulation.Simulation.init_logger import init_logger
-except ImportError as error:
-    init_logger = error
-
-try:
-    from ..Methods.Simulation.Simulation.get_var_load import get_var_load
-except ImportError as error:
-    get_var_load = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -42,38 +25,13 @@ class Simulation(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.Simulation.run
-    if isinstance(run, ImportError):
-        run = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Simulation method run: " + str(run))
-            )
-        )
-    else:
-        run = run
-    # cf Methods.Simulation.Simulation.init_logger
-    if isinstance(init_logger, ImportError):
-        init_logger = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Simulation method init_logger: " + str(init_logger)
-                )
-            )
-        )
-    else:
-        init_logger = init_logger
-    # cf Methods.Simulation.Simulation.get_var_load
-    if isinstance(get_var_load, ImportError):
-        get_var_load = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Simulation method get_var_load: " + str(get_var_load)
-                )
-            )
-        )
-    else:
-        get_var_load = get_var_load
+    # Methods imported on first use to remove unnecessary dependencies
+    run = LazyMethod(__package__, "..Methods.Simulation.Simulation.run")
+    init_logger = LazyMethod(__package__, "..Methods.Simulation.Simulation.init_logger")
+    get_var_load = LazyMethod(
+        __package__, "..Methods.Simulation.Simulation.get_var_load"
+    )
+    copy_shared = LazyMethod(__package__, "..Methods.Simulation.Simulation.copy_shared")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,32 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.Skew.comp_angle import comp_angle
-except ImportError as error:
-    comp_angle = error
-
-try:
-    from ..Methods.Machine.Skew.comp_pattern import comp_pattern
-except ImportError as error:
-    comp_pattern = error
-
-try:
-    from ..Methods.Machine.Skew.plot import plot
-except ImportError as error:
-    plot = error
-
-
 from ntpath import basename
 from os.path import isfile
 from ._check import CheckTypeError
@@ -47,34 +30,10 @@ class Skew(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.Skew.comp_angle
-    if isinstance(comp_angle, ImportError):
-        comp_angle = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Skew method comp_angle: " + str(comp_angle))
-            )
-        )
-    else:
-        comp_angle = comp_angle
-    # cf Methods.Machine.Skew.comp_pattern
-    if isinstance(comp_pattern, ImportError):
-        comp_pattern = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Skew method comp_pattern: " + str(comp_pattern))
-            )
-        )
-    else:
-        comp_pattern = comp_pattern
-    # cf Methods.Machine.Skew.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Skew method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
+    # Methods imported on first use to remove unnecessary dependencies
+    comp_angle = LazyMethod(__package__, "..Methods.Machine.Skew.comp_angle")
+    comp_pattern = LazyMethod(__package__, "..Methods.Machine.Skew.comp_pattern")
+    plot = LazyMethod(__package__, "..Methods.Machine.Skew.plot")
     # save and copy methods are available in all object
     save = save
     copy = copy
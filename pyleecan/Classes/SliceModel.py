@@ -7,32 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import set_array, check_var, raise_
+from ._check import set_array, check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyArray, LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.SliceModel.get_distribution import get_distribution
-except ImportError as error:
-    get_distribution = error
-
-try:
-    from ..Methods.Simulation.SliceModel.get_data import get_data
-except ImportError as error:
-    get_data = error
-
-try:
-    from ..Methods.Simulation.SliceModel.plot import plot
-except ImportError as error:
-    plot = error
-
-
 from numpy import array, array_equal
 from numpy import isnan
 from ._check import InitUnKnowClassError
@@ -43,37 +26,12 @@ class SliceModel(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.SliceModel.get_distribution
-    if isinstance(get_distribution, ImportError):
-        get_distribution = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SliceModel method get_distribution: "
-                    + str(get_distribution)
-                )
-            )
-        )
-    else:
-        get_distribution = get_distribution
-    # cf Methods.Simulation.SliceModel.get_data
-    if isinstance(get_data, ImportError):
-        get_data = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SliceModel method get_data: " + str(get_data))
-            )
-        )
-    else:
-        get_data = get_data
-    # cf Methods.Simulation.SliceModel.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SliceModel method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
+    # Methods imported on first use to remove unnecessary dependencies
+    get_distribution = LazyMethod(
+        __package__, "..Methods.Simulation.SliceModel.get_distribution"
+    )
+    get_data = LazyMethod(__package__, "..Methods.Simulation.SliceModel.get_data")
+    plot = LazyMethod(__package__, "..Methods.Simulation.SliceModel.plot")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -423,6 +381,8 @@ class SliceModel(FrozenClass):
 
     def _get_angle_rotor(self):
         """getter of angle_rotor"""
+        if isinstance(self._angle_rotor, LazyArray):
+            self._angle_rotor = self._angle_rotor.read()
         return self._angle_rotor
 
     def _set_angle_rotor(self, value):
@@ -448,6 +408,8 @@ class SliceModel(FrozenClass):
 
     def _get_angle_stator(self):
         """getter of angle_stator"""
+        if isinstance(self._angle_stator, LazyArray):
+            self._angle_stator = self._angle_stator.read()
         return self._angle_stator
 
     def _set_angle_stator(self, value):
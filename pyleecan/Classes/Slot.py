@@ -7,152 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Slot.Slot.build_geometry_active import build_geometry_active
-except ImportError as error:
-    build_geometry_active = error
-
-try:
-    from ..Methods.Slot.Slot.build_geometry_half_tooth import build_geometry_half_tooth
-except ImportError as error:
-    build_geometry_half_tooth = error
-
-try:
-    from ..Methods.Slot.Slot.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Slot.Slot.comp_angle_active_eq import comp_angle_active_eq
-except ImportError as error:
-    comp_angle_active_eq = error
-
-try:
-    from ..Methods.Slot.Slot.comp_angle_opening import comp_angle_opening
-except ImportError as error:
-    comp_angle_opening = error
-
-try:
-    from ..Methods.Slot.Slot.comp_height import comp_height
-except ImportError as error:
-    comp_height = error
-
-try:
-    from ..Methods.Slot.Slot.comp_height_active import comp_height_active
-except ImportError as error:
-    comp_height_active = error
-
-try:
-    from ..Methods.Slot.Slot.comp_height_opening import comp_height_opening
-except ImportError as error:
-    comp_height_opening = error
-
-try:
-    from ..Methods.Slot.Slot.comp_radius import comp_radius
-except ImportError as error:
-    comp_radius = error
-
-try:
-    from ..Methods.Slot.Slot.comp_radius_mid_active import comp_radius_mid_active
-except ImportError as error:
-    comp_radius_mid_active = error
-
-try:
-    from ..Methods.Slot.Slot.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from ..Methods.Slot.Slot.comp_surface_active import comp_surface_active
-except ImportError as error:
-    comp_surface_active = error
-
-try:
-    from ..Methods.Slot.Slot.comp_surface_opening import comp_surface_opening
-except ImportError as error:
-    comp_surface_opening = error
-
-try:
-    from ..Methods.Slot.Slot.comp_surface_wedges import comp_surface_wedges
-except ImportError as error:
-    comp_surface_wedges = error
-
-try:
-    from ..Methods.Slot.Slot.comp_width import comp_width
-except ImportError as error:
-    comp_width = error
-
-try:
-    from ..Methods.Slot.Slot.comp_width_opening import comp_width_opening
-except ImportError as error:
-    comp_width_opening = error
-
-try:
-    from ..Methods.Slot.Slot.convert_to_SlotUD2 import convert_to_SlotUD2
-except ImportError as error:
-    convert_to_SlotUD2 = error
-
-try:
-    from ..Methods.Slot.Slot.get_is_stator import get_is_stator
-except ImportError as error:
-    get_is_stator = error
-
-try:
-    from ..Methods.Slot.Slot.get_name_lam import get_name_lam
-except ImportError as error:
-    get_name_lam = error
-
-try:
-    from ..Methods.Slot.Slot.get_Rbo import get_Rbo
-except ImportError as error:
-    get_Rbo = error
-
-try:
-    from ..Methods.Slot.Slot.get_surface import get_surface
-except ImportError as error:
-    get_surface = error
-
-try:
-    from ..Methods.Slot.Slot.get_surface_tooth import get_surface_tooth
-except ImportError as error:
-    get_surface_tooth = error
-
-try:
-    from ..Methods.Slot.Slot.get_surface_wedges import get_surface_wedges
-except ImportError as error:
-    get_surface_wedges = error
-
-try:
-    from ..Methods.Slot.Slot.is_outwards import is_outwards
-except ImportError as error:
-    is_outwards = error
-
-try:
-    from ..Methods.Slot.Slot.plot import plot
-except ImportError as error:
-    plot = error
-
-try:
-    from ..Methods.Slot.Slot.plot_active import plot_active
-except ImportError as error:
-    plot_active = error
-
-try:
-    from ..Methods.Slot.Slot.set_label import set_label
-except ImportError as error:
-    set_label = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -162,293 +25,60 @@ class Slot(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Slot.Slot.build_geometry_active
-    if isinstance(build_geometry_active, ImportError):
-        build_geometry_active = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot method build_geometry_active: "
-                    + str(build_geometry_active)
-                )
-            )
-        )
-    else:
-        build_geometry_active = build_geometry_active
-    # cf Methods.Slot.Slot.build_geometry_half_tooth
-    if isinstance(build_geometry_half_tooth, ImportError):
-        build_geometry_half_tooth = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot method build_geometry_half_tooth: "
-                    + str(build_geometry_half_tooth)
-                )
-            )
-        )
-    else:
-        build_geometry_half_tooth = build_geometry_half_tooth
-    # cf Methods.Slot.Slot.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Slot method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Slot.Slot.comp_angle_active_eq
-    if isinstance(comp_angle_active_eq, ImportError):
-        comp_angle_active_eq = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot method comp_angle_active_eq: "
-                    + str(comp_angle_active_eq)
-                )
-            )
-        )
-    else:
-        comp_angle_active_eq = comp_angle_active_eq
-    # cf Methods.Slot.Slot.comp_angle_opening
-    if isinstance(comp_angle_opening, ImportError):
-        comp_angle_opening = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot method comp_angle_opening: "
-                    + str(comp_angle_opening)
-                )
-            )
-        )
-    else:
-        comp_angle_opening = comp_angle_opening
-    # cf Methods.Slot.Slot.comp_height
-    if isinstance(comp_height, ImportError):
-        comp_height = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Slot method comp_height: " + str(comp_height))
-            )
-        )
-    else:
-        comp_height = comp_height
-    # cf Methods.Slot.Slot.comp_height_active
-    if isinstance(comp_height_active, ImportError):
-        comp_height_active = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot method comp_height_active: "
-                    + str(comp_height_active)
-                )
-            )
-        )
-    else:
-        comp_height_active = comp_height_active
-    # cf Methods.Slot.Slot.comp_height_opening
-    if isinstance(comp_height_opening, ImportError):
-        comp_height_opening = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot method comp_height_opening: "
-                    + str(comp_height_opening)
-                )
-            )
-        )
-    else:
-        comp_height_opening = comp_height_opening
-    # cf Methods.Slot.Slot.comp_radius
-    if isinstance(comp_radius, ImportError):
-        comp_radius = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Slot method comp_radius: " + str(comp_radius))
-            )
-        )
-    else:
-        comp_radius = comp_radius
-    # cf Methods.Slot.Slot.comp_radius_mid_active
-    if isinstance(comp_radius_mid_active, ImportError):
-        comp_radius_mid_active = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot method comp_radius_mid_active: "
-                    + str(comp_radius_mid_active)
-                )
-            )
-        )
-    else:
-        comp_radius_mid_active = comp_radius_mid_active
-    # cf Methods.Slot.Slot.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Slot method comp_surface: " + str(comp_surface))
-            )
-        )
-    else:
-        comp_surface = comp_surface
-    # cf Methods.Slot.Slot.comp_surface_active
-    if isinstance(comp_surface_active, ImportError):
-        comp_surface_active = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot method comp_surface_active: "
-                    + str(comp_surface_active)
-                )
-            )
-        )
-    else:
-        comp_surface_active = comp_surface_active
-    # cf Methods.Slot.Slot.comp_surface_opening
-    if isinstance(comp_surface_opening, ImportError):
-        comp_surface_opening = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot method comp_surface_opening: "
-                    + str(comp_surface_opening)
-                )
-            )
-        )
-    else:
-        comp_surface_opening = comp_surface_opening
-    # cf Methods.Slot.Slot.comp_surface_wedges
-    if isinstance(comp_surface_wedges, ImportError):
-        comp_surface_wedges = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot method comp_surface_wedges: "
-                    + str(comp_surface_wedges)
-                )
-            )
-        )
-    else:
-        comp_surface_wedges = comp_surface_wedges
-    # cf Methods.Slot.Slot.comp_width
-    if isinstance(comp_width, ImportError):
-        comp_width = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Slot method comp_width: " + str(comp_width))
-            )
-        )
-    else:
-        comp_width = comp_width
-    # cf Methods.Slot.Slot.comp_width_opening
-    if isinstance(comp_width_opening, ImportError):
-        comp_width_opening = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot method comp_width_opening: "
-                    + str(comp_width_opening)
-                )
-            )
-        )
-    else:
-        comp_width_opening = comp_width_opening
-    # cf Methods.Slot.Slot.convert_to_SlotUD2
-    if isinstance(convert_to_SlotUD2, ImportError):
-        convert_to_SlotUD2 = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot method convert_to_SlotUD2: "
-                    + str(convert_to_SlotUD2)
-                )
-            )
-        )
-    else:
-        convert_to_SlotUD2 = convert_to_SlotUD2
-    # cf Methods.Slot.Slot.get_is_stator
-    if isinstance(get_is_stator, ImportError):
-        get_is_stator = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot method get_is_stator: " + str(get_is_stator)
-                )
-            )
-        )
-    else:
-        get_is_stator = get_is_stator
-    # cf Methods.Slot.Slot.get_name_lam
-    if isinstance(get_name_lam, ImportError):
-        get_name_lam = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Slot method get_name_lam: " + str(get_name_lam))
-            )
-        )
-    else:
-        get_name_lam = get_name_lam
-    # cf Methods.Slot.Slot.get_Rbo
-    if isinstance(get_Rbo, ImportError):
-        get_Rbo = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Slot method get_Rbo: " + str(get_Rbo))
-            )
-        )
-    else:
-        get_Rbo = get_Rbo
-    # cf Methods.Slot.Slot.get_surface
-    if isinstance(get_surface, ImportError):
-        get_surface = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Slot method get_surface: " + str(get_surface))
-            )
-        )
-    else:
-        get_surface = get_surface
-    # cf Methods.Slot.Slot.get_surface_tooth
-    if isinstance(get_surface_tooth, ImportError):
-        get_surface_tooth = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot method get_surface_tooth: " + str(get_surface_tooth)
-                )
-            )
-        )
-    else:
-        get_surface_tooth = get_surface_tooth
-    # cf Methods.Slot.Slot.get_surface_wedges
-    if isinstance(get_surface_wedges, ImportError):
-        get_surface_wedges = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot method get_surface_wedges: "
-                    + str(get_surface_wedges)
-                )
-            )
-        )
-    else:
-        get_surface_wedges = get_surface_wedges
-    # cf Methods.Slot.Slot.is_outwards
-    if isinstance(is_outwards, ImportError):
-        is_outwards = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Slot method is_outwards: " + str(is_outwards))
-            )
-        )
-    else:
-        is_outwards = is_outwards
-    # cf Methods.Slot.Slot.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Slot method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
-    # cf Methods.Slot.Slot.plot_active
-    if isinstance(plot_active, ImportError):
-        plot_active = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Slot method plot_active: " + str(plot_active))
-            )
-        )
-    else:
-        plot_active = plot_active
-    # cf Methods.Slot.Slot.set_label
-    if isinstance(set_label, ImportError):
-        set_label = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Slot method set_label: " + str(set_label))
-            )
-        )
-    else:
-        set_label = set_label
+    # Methods imported on first use to remove unnecessary dependencies
+    build_geometry_active = LazyMethod(
+        __package__, "..Methods.Slot.Slot.build_geometry_active"
+    )
+    build_geometry_half_tooth = LazyMethod(
+        __package__, "..Methods.Slot.Slot.build_geometry_half_tooth"
+    )
+    check = LazyMethod(__package__, "..Methods.Slot.Slot.check")
+    comp_angle_active_eq = LazyMethod(
+        __package__, "..Methods.Slot.Slot.comp_angle_active_eq"
+    )
+    comp_angle_opening = LazyMethod(
+        __package__, "..Methods.Slot.Slot.comp_angle_opening"
+    )
+    comp_height = LazyMethod(__package__, "..Methods.Slot.Slot.comp_height")
+    comp_height_active = LazyMethod(
+        __package__, "..Methods.Slot.Slot.comp_height_active"
+    )
+    comp_height_opening = LazyMethod(
+        __package__, "..Methods.Slot.Slot.comp_height_opening"
+    )
+    comp_radius = LazyMethod(__package__, "..Methods.Slot.Slot.comp_radius")
+    comp_radius_mid_active = LazyMethod(
+        __package__, "..Methods.Slot.Slot.comp_radius_mid_active"
+    )
+    comp_surface = LazyMethod(__package__, "..Methods.Slot.Slot.comp_surface")
+    comp_surface_active = LazyMethod(
+        __package__, "..Methods.Slot.Slot.comp_surface_active"
+    )
+    comp_surface_opening = LazyMethod(
+        __package__, "..Methods.Slot.Slot.comp_surface_opening"
+    )
+    comp_surface_wedges = LazyMethod(
+        __package__, "..Methods.Slot.Slot.comp_surface_wedges"
+    )
+    comp_width = LazyMethod(__package__, "..Methods.Slot.Slot.comp_width")
+    comp_width_opening = LazyMethod(
+        __package__, "..Methods.Slot.Slot.comp_width_opening"
+    )
+    convert_to_SlotUD2 = LazyMethod(
+        __package__, "..Methods.Slot.Slot.convert_to_SlotUD2"
+    )
+    get_is_stator = LazyMethod(__package__, "..Methods.Slot.Slot.get_is_stator")
+    get_name_lam = LazyMethod(__package__, "..Methods.Slot.Slot.get_name_lam")
+    get_Rbo = LazyMethod(__package__, "..Methods.Slot.Slot.get_Rbo")
+    get_surface = LazyMethod(__package__, "..Methods.Slot.Slot.get_surface")
+    get_surface_tooth = LazyMethod(__package__, "..Methods.Slot.Slot.get_surface_tooth")
+    get_surface_wedges = LazyMethod(
+        __package__, "..Methods.Slot.Slot.get_surface_wedges"
+    )
+    is_outwards = LazyMethod(__package__, "..Methods.Slot.Slot.is_outwards")
+    plot = LazyMethod(__package__, "..Methods.Slot.Slot.plot")
+    plot_active = LazyMethod(__package__, "..Methods.Slot.Slot.plot_active")
+    set_label = LazyMethod(__package__, "..Methods.Slot.Slot.set_label")
     # save and copy methods are available in all object
     save = save
     copy = copy
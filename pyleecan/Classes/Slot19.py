@@ -7,52 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Slot import Slot
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Slot.Slot19._comp_point_coordinate import _comp_point_coordinate
-except ImportError as error:
-    _comp_point_coordinate = error
-
-try:
-    from ..Methods.Slot.Slot19.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from ..Methods.Slot.Slot19.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Slot.Slot19.comp_angle_opening import comp_angle_opening
-except ImportError as error:
-    comp_angle_opening = error
-
-try:
-    from ..Methods.Slot.Slot19.comp_angle_bottom import comp_angle_bottom
-except ImportError as error:
-    comp_angle_bottom = error
-
-try:
-    from ..Methods.Slot.Slot19.comp_height import comp_height
-except ImportError as error:
-    comp_height = error
-
-try:
-    from ..Methods.Slot.Slot19.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -63,83 +26,20 @@ class Slot19(Slot):
     VERSION = 1
     IS_SYMMETRICAL = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Slot.Slot19._comp_point_coordinate
-    if isinstance(_comp_point_coordinate, ImportError):
-        _comp_point_coordinate = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot19 method _comp_point_coordinate: "
-                    + str(_comp_point_coordinate)
-                )
-            )
-        )
-    else:
-        _comp_point_coordinate = _comp_point_coordinate
-    # cf Methods.Slot.Slot19.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot19 method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
-    # cf Methods.Slot.Slot19.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Slot19 method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Slot.Slot19.comp_angle_opening
-    if isinstance(comp_angle_opening, ImportError):
-        comp_angle_opening = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot19 method comp_angle_opening: "
-                    + str(comp_angle_opening)
-                )
-            )
-        )
-    else:
-        comp_angle_opening = comp_angle_opening
-    # cf Methods.Slot.Slot19.comp_angle_bottom
-    if isinstance(comp_angle_bottom, ImportError):
-        comp_angle_bottom = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot19 method comp_angle_bottom: "
-                    + str(comp_angle_bottom)
-                )
-            )
-        )
-    else:
-        comp_angle_bottom = comp_angle_bottom
-    # cf Methods.Slot.Slot19.comp_height
-    if isinstance(comp_height, ImportError):
-        comp_height = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Slot19 method comp_height: " + str(comp_height))
-            )
-        )
-    else:
-        comp_height = comp_height
-    # cf Methods.Slot.Slot19.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Slot19 method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
+    # Methods imported on first use to remove unnecessary dependencies
+    _comp_point_coordinate = LazyMethod(
+        __package__, "..Methods.Slot.Slot19._comp_point_coordinate"
+    )
+    build_geometry = LazyMethod(__package__, "..Methods.Slot.Slot19.build_geometry")
+    check = LazyMethod(__package__, "..Methods.Slot.Slot19.check")
+    comp_angle_opening = LazyMethod(
+        __package__, "..Methods.Slot.Slot19.comp_angle_opening"
+    )
+    comp_angle_bottom = LazyMethod(
+        __package__, "..Methods.Slot.Slot19.comp_angle_bottom"
+    )
+    comp_height = LazyMethod(__package__, "..Methods.Slot.Slot19.comp_height")
+    comp_surface = LazyMethod(__package__, "..Methods.Slot.Slot19.comp_surface")
     # save and copy methods are available in all object
     save = save
     copy = copy
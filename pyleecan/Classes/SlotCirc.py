@@ -7,82 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Slot import Slot
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Slot.SlotCirc._comp_line_dict import _comp_line_dict
-except ImportError as error:
-    _comp_line_dict = error
-
-try:
-    from ..Methods.Slot.SlotCirc._comp_point_coordinate import _comp_point_coordinate
-except ImportError as error:
-    _comp_point_coordinate = error
-
-try:
-    from ..Methods.Slot.SlotCirc._comp_R0 import _comp_R0
-except ImportError as error:
-    _comp_R0 = error
-
-try:
-    from ..Methods.Slot.SlotCirc.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from ..Methods.Slot.SlotCirc.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Slot.SlotCirc.comp_angle_opening import comp_angle_opening
-except ImportError as error:
-    comp_angle_opening = error
-
-try:
-    from ..Methods.Slot.SlotCirc.comp_height import comp_height
-except ImportError as error:
-    comp_height = error
-
-try:
-    from ..Methods.Slot.SlotCirc.comp_height_active import comp_height_active
-except ImportError as error:
-    comp_height_active = error
-
-try:
-    from ..Methods.Slot.SlotCirc.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from ..Methods.Slot.SlotCirc.comp_surface_active import comp_surface_active
-except ImportError as error:
-    comp_surface_active = error
-
-try:
-    from ..Methods.Slot.SlotCirc.comp_surface_opening import comp_surface_opening
-except ImportError as error:
-    comp_surface_opening = error
-
-try:
-    from ..Methods.Slot.SlotCirc.get_surface_active import get_surface_active
-except ImportError as error:
-    get_surface_active = error
-
-try:
-    from ..Methods.Slot.SlotCirc.get_surface_opening import get_surface_opening
-except ImportError as error:
-    get_surface_opening = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -93,153 +26,34 @@ class SlotCirc(Slot):
     VERSION = 1
     IS_SYMMETRICAL = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Slot.SlotCirc._comp_line_dict
-    if isinstance(_comp_line_dict, ImportError):
-        _comp_line_dict = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotCirc method _comp_line_dict: " + str(_comp_line_dict)
-                )
-            )
-        )
-    else:
-        _comp_line_dict = _comp_line_dict
-    # cf Methods.Slot.SlotCirc._comp_point_coordinate
-    if isinstance(_comp_point_coordinate, ImportError):
-        _comp_point_coordinate = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotCirc method _comp_point_coordinate: "
-                    + str(_comp_point_coordinate)
-                )
-            )
-        )
-    else:
-        _comp_point_coordinate = _comp_point_coordinate
-    # cf Methods.Slot.SlotCirc._comp_R0
-    if isinstance(_comp_R0, ImportError):
-        _comp_R0 = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SlotCirc method _comp_R0: " + str(_comp_R0))
-            )
-        )
-    else:
-        _comp_R0 = _comp_R0
-    # cf Methods.Slot.SlotCirc.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotCirc method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
-    # cf Methods.Slot.SlotCirc.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SlotCirc method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Slot.SlotCirc.comp_angle_opening
-    if isinstance(comp_angle_opening, ImportError):
-        comp_angle_opening = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotCirc method comp_angle_opening: "
-                    + str(comp_angle_opening)
-                )
-            )
-        )
-    else:
-        comp_angle_opening = comp_angle_opening
-    # cf Methods.Slot.SlotCirc.comp_height
-    if isinstance(comp_height, ImportError):
-        comp_height = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotCirc method comp_height: " + str(comp_height)
-                )
-            )
-        )
-    else:
-        comp_height = comp_height
-    # cf Methods.Slot.SlotCirc.comp_height_active
-    if isinstance(comp_height_active, ImportError):
-        comp_height_active = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotCirc method comp_height_active: "
-                    + str(comp_height_active)
-                )
-            )
-        )
-    else:
-        comp_height_active = comp_height_active
-    # cf Methods.Slot.SlotCirc.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotCirc method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
-    # cf Methods.Slot.SlotCirc.comp_surface_active
-    if isinstance(comp_surface_active, ImportError):
-        comp_surface_active = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotCirc method comp_surface_active: "
-                    + str(comp_surface_active)
-                )
-            )
-        )
-    else:
-        comp_surface_active = comp_surface_active
-    # cf Methods.Slot.SlotCirc.comp_surface_opening
-    if isinstance(comp_surface_opening, ImportError):
-        comp_surface_opening = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotCirc method comp_surface_opening: "
-                    + str(comp_surface_opening)
-                )
-            )
-        )
-    else:
-        comp_surface_opening = comp_surface_opening
-    # cf Methods.Slot.SlotCirc.get_surface_active
-    if isinstance(get_surface_active, ImportError):
-        get_surface_active = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotCirc method get_surface_active: "
-                    + str(get_surface_active)
-                )
-            )
-        )
-    else:
-        get_surface_active = get_surface_active
-    # cf Methods.Slot.SlotCirc.get_surface_opening
-    if isinstance(get_surface_opening, ImportError):
-        get_surface_opening = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotCirc method get_surface_opening: "
-                    + str(get_surface_opening)
-                )
-            )
-        )
-    else:
-        get_surface_opening = get_surface_opening
+    # Methods imported on first use to remove unnecessary dependencies
+    _comp_line_dict = LazyMethod(__package__, "..Methods.Slot.SlotCirc._comp_line_dict")
+    _comp_point_coordinate = LazyMethod(
+        __package__, "..Methods.Slot.SlotCirc._comp_point_coordinate"
+    )
+    _comp_R0 = LazyMethod(__package__, "..Methods.Slot.SlotCirc._comp_R0")
+    build_geometry = LazyMethod(__package__, "..Methods.Slot.SlotCirc.build_geometry")
+    check = LazyMethod(__package__, "..Methods.Slot.SlotCirc.check")
+    comp_angle_opening = LazyMethod(
+        __package__, "..Methods.Slot.SlotCirc.comp_angle_opening"
+    )
+    comp_height = LazyMethod(__package__, "..Methods.Slot.SlotCirc.comp_height")
+    comp_height_active = LazyMethod(
+        __package__, "..Methods.Slot.SlotCirc.comp_height_active"
+    )
+    comp_surface = LazyMethod(__package__, "..Methods.Slot.SlotCirc.comp_surface")
+    comp_surface_active = LazyMethod(
+        __package__, "..Methods.Slot.SlotCirc.comp_surface_active"
+    )
+    comp_surface_opening = LazyMethod(
+        __package__, "..Methods.Slot.SlotCirc.comp_surface_opening"
+    )
+    get_surface_active = LazyMethod(
+        __package__, "..Methods.Slot.SlotCirc.get_surface_active"
+    )
+    get_surface_opening = LazyMethod(
+        __package__, "..Methods.Slot.SlotCirc.get_surface_opening"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,42 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Slot import Slot
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Slot.SlotUD.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from ..Methods.Slot.SlotUD.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Slot.SlotUD.get_surface_active import get_surface_active
-except ImportError as error:
-    get_surface_active = error
-
-try:
-    from ..Methods.Slot.SlotUD.get_surface_opening import get_surface_opening
-except ImportError as error:
-    get_surface_opening = error
-
-try:
-    from ..Methods.Slot.SlotUD.set_from_point_list import set_from_point_list
-except ImportError as error:
-    set_from_point_list = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -52,63 +25,18 @@ class SlotUD(Slot):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Slot.SlotUD.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotUD method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
-    # cf Methods.Slot.SlotUD.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SlotUD method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Slot.SlotUD.get_surface_active
-    if isinstance(get_surface_active, ImportError):
-        get_surface_active = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotUD method get_surface_active: "
-                    + str(get_surface_active)
-                )
-            )
-        )
-    else:
-        get_surface_active = get_surface_active
-    # cf Methods.Slot.SlotUD.get_surface_opening
-    if isinstance(get_surface_opening, ImportError):
-        get_surface_opening = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotUD method get_surface_opening: "
-                    + str(get_surface_opening)
-                )
-            )
-        )
-    else:
-        get_surface_opening = get_surface_opening
-    # cf Methods.Slot.SlotUD.set_from_point_list
-    if isinstance(set_from_point_list, ImportError):
-        set_from_point_list = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotUD method set_from_point_list: "
-                    + str(set_from_point_list)
-                )
-            )
-        )
-    else:
-        set_from_point_list = set_from_point_list
+    # Methods imported on first use to remove unnecessary dependencies
+    build_geometry = LazyMethod(__package__, "..Methods.Slot.SlotUD.build_geometry")
+    check = LazyMethod(__package__, "..Methods.Slot.SlotUD.check")
+    get_surface_active = LazyMethod(
+        __package__, "..Methods.Slot.SlotUD.get_surface_active"
+    )
+    get_surface_opening = LazyMethod(
+        __package__, "..Methods.Slot.SlotUD.get_surface_opening"
+    )
+    set_from_point_list = LazyMethod(
+        __package__, "..Methods.Slot.SlotUD.set_from_point_list"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
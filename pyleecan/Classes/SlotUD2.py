@@ -7,44 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Slot import Slot
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Slot.SlotUD2.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from ..Methods.Slot.SlotUD2.build_geometry_active import build_geometry_active
-except ImportError as error:
-    build_geometry_active = error
-
-try:
-    from ..Methods.Slot.SlotUD2.get_surface_active import get_surface_active
-except ImportError as error:
-    get_surface_active = error
-
-try:
-    from ..Methods.Slot.SlotUD2.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Slot.SlotUD2._set_split_active_surf_dict import (
-        _set_split_active_surf_dict,
-    )
-except ImportError as error:
-    _set_split_active_surf_dict = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -54,63 +25,18 @@ class SlotUD2(Slot):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Slot.SlotUD2.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotUD2 method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
-    # cf Methods.Slot.SlotUD2.build_geometry_active
-    if isinstance(build_geometry_active, ImportError):
-        build_geometry_active = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotUD2 method build_geometry_active: "
-                    + str(build_geometry_active)
-                )
-            )
-        )
-    else:
-        build_geometry_active = build_geometry_active
-    # cf Methods.Slot.SlotUD2.get_surface_active
-    if isinstance(get_surface_active, ImportError):
-        get_surface_active = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotUD2 method get_surface_active: "
-                    + str(get_surface_active)
-                )
-            )
-        )
-    else:
-        get_surface_active = get_surface_active
-    # cf Methods.Slot.SlotUD2.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SlotUD2 method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Slot.SlotUD2._set_split_active_surf_dict
-    if isinstance(_set_split_active_surf_dict, ImportError):
-        _set_split_active_surf_dict = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotUD2 method _set_split_active_surf_dict: "
-                    + str(_set_split_active_surf_dict)
-                )
-            )
-        )
-    else:
-        _set_split_active_surf_dict = _set_split_active_surf_dict
+    # Methods imported on first use to remove unnecessary dependencies
+    build_geometry = LazyMethod(__package__, "..Methods.Slot.SlotUD2.build_geometry")
+    build_geometry_active = LazyMethod(
+        __package__, "..Methods.Slot.SlotUD2.build_geometry_active"
+    )
+    get_surface_active = LazyMethod(
+        __package__, "..Methods.Slot.SlotUD2.get_surface_active"
+    )
+    check = LazyMethod(__package__, "..Methods.Slot.SlotUD2.check")
+    _set_split_active_surf_dict = LazyMethod(
+        __package__, "..Methods.Slot.SlotUD2._set_split_active_surf_dict"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,67 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Slot import Slot
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Slot.SlotWLSRPM._comp_point_coordinate import _comp_point_coordinate
-except ImportError as error:
-    _comp_point_coordinate = error
-
-try:
-    from ..Methods.Slot.SlotWLSRPM.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from ..Methods.Slot.SlotWLSRPM.build_geometry_active import build_geometry_active
-except ImportError as error:
-    build_geometry_active = error
-
-try:
-    from ..Methods.Slot.SlotWLSRPM.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Slot.SlotWLSRPM.comp_angle_opening import comp_angle_opening
-except ImportError as error:
-    comp_angle_opening = error
-
-try:
-    from ..Methods.Slot.SlotWLSRPM.comp_height_damper import comp_height_damper
-except ImportError as error:
-    comp_height_damper = error
-
-try:
-    from ..Methods.Slot.SlotWLSRPM.comp_height_wind import comp_height_wind
-except ImportError as error:
-    comp_height_wind = error
-
-try:
-    from ..Methods.Slot.SlotWLSRPM.comp_height import comp_height
-except ImportError as error:
-    comp_height = error
-
-try:
-    from ..Methods.Slot.SlotWLSRPM.get_surface_active import get_surface_active
-except ImportError as error:
-    get_surface_active = error
-
-try:
-    from ..Methods.Slot.SlotWLSRPM.plot_schematics import plot_schematics
-except ImportError as error:
-    plot_schematics = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -78,122 +26,31 @@ class SlotWLSRPM(Slot):
     VERSION = 1
     IS_SYMMETRICAL = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Slot.SlotWLSRPM._comp_point_coordinate
-    if isinstance(_comp_point_coordinate, ImportError):
-        _comp_point_coordinate = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotWLSRPM method _comp_point_coordinate: "
-                    + str(_comp_point_coordinate)
-                )
-            )
-        )
-    else:
-        _comp_point_coordinate = _comp_point_coordinate
-    # cf Methods.Slot.SlotWLSRPM.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotWLSRPM method build_geometry: " + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
-    # cf Methods.Slot.SlotWLSRPM.build_geometry_active
-    if isinstance(build_geometry_active, ImportError):
-        build_geometry_active = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotWLSRPM method build_geometry_active: "
-                    + str(build_geometry_active)
-                )
-            )
-        )
-    else:
-        build_geometry_active = build_geometry_active
-    # cf Methods.Slot.SlotWLSRPM.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SlotWLSRPM method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Slot.SlotWLSRPM.comp_angle_opening
-    if isinstance(comp_angle_opening, ImportError):
-        comp_angle_opening = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotWLSRPM method comp_angle_opening: "
-                    + str(comp_angle_opening)
-                )
-            )
-        )
-    else:
-        comp_angle_opening = comp_angle_opening
-    # cf Methods.Slot.SlotWLSRPM.comp_height_damper
-    if isinstance(comp_height_damper, ImportError):
-        comp_height_damper = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotWLSRPM method comp_height_damper: "
-                    + str(comp_height_damper)
-                )
-            )
-        )
-    else:
-        comp_height_damper = comp_height_damper
-    # cf Methods.Slot.SlotWLSRPM.comp_height_wind
-    if isinstance(comp_height_wind, ImportError):
-        comp_height_wind = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotWLSRPM method comp_height_wind: "
-                    + str(comp_height_wind)
-                )
-            )
-        )
-    else:
-        comp_height_wind = comp_height_wind
-    # cf Methods.Slot.SlotWLSRPM.comp_height
-    if isinstance(comp_height, ImportError):
-        comp_height = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotWLSRPM method comp_height: " + str(comp_height)
-                )
-            )
-        )
-    else:
-        comp_height = comp_height
-    # cf Methods.Slot.SlotWLSRPM.get_surface_active
-    if isinstance(get_surface_active, ImportError):
-        get_surface_active = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotWLSRPM method get_surface_active: "
-                    + str(get_surface_active)
-                )
-            )
-        )
-    else:
-        get_surface_active = get_surface_active
-    # cf Methods.Slot.SlotWLSRPM.plot_schematics
-    if isinstance(plot_schematics, ImportError):
-        plot_schematics = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SlotWLSRPM method plot_schematics: "
-                    + str(plot_schematics)
-                )
-            )
-        )
-    else:
-        plot_schematics = plot_schematics
+    # Methods imported on first use to remove unnecessary dependencies
+    _comp_point_coordinate = LazyMethod(
+        __package__, "..Methods.Slot.SlotWLSRPM._comp_point_coordinate"
+    )
+    build_geometry = LazyMethod(__package__, "..Methods.Slot.SlotWLSRPM.build_geometry")
+    build_geometry_active = LazyMethod(
+        __package__, "..Methods.Slot.SlotWLSRPM.build_geometry_active"
+    )
+    check = LazyMethod(__package__, "..Methods.Slot.SlotWLSRPM.check")
+    comp_angle_opening = LazyMethod(
+        __package__, "..Methods.Slot.SlotWLSRPM.comp_angle_opening"
+    )
+    comp_height_damper = LazyMethod(
+        __package__, "..Methods.Slot.SlotWLSRPM.comp_height_damper"
+    )
+    comp_height_wind = LazyMethod(
+        __package__, "..Methods.Slot.SlotWLSRPM.comp_height_wind"
+    )
+    comp_height = LazyMethod(__package__, "..Methods.Slot.SlotWLSRPM.comp_height")
+    get_surface_active = LazyMethod(
+        __package__, "..Methods.Slot.SlotWLSRPM.get_surface_active"
+    )
+    plot_schematics = LazyMethod(
+        __package__, "..Methods.Slot.SlotWLSRPM.plot_schematics"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,32 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Solution import Solution
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Mesh.SolutionVector.get_field import get_field
-except ImportError as error:
-    get_field = error
-
-try:
-    from ..Methods.Mesh.SolutionVector.get_axes_list import get_axes_list
-except ImportError as error:
-    get_axes_list = error
-
-try:
-    from ..Methods.Mesh.SolutionVector.get_solution import get_solution
-except ImportError as error:
-    get_solution = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -42,41 +25,12 @@ class SolutionVector(Solution):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Mesh.SolutionVector.get_field
-    if isinstance(get_field, ImportError):
-        get_field = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SolutionVector method get_field: " + str(get_field)
-                )
-            )
-        )
-    else:
-        get_field = get_field
-    # cf Methods.Mesh.SolutionVector.get_axes_list
-    if isinstance(get_axes_list, ImportError):
-        get_axes_list = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SolutionVector method get_axes_list: "
-                    + str(get_axes_list)
-                )
-            )
-        )
-    else:
-        get_axes_list = get_axes_list
-    # cf Methods.Mesh.SolutionVector.get_solution
-    if isinstance(get_solution, ImportError):
-        get_solution = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SolutionVector method get_solution: " + str(get_solution)
-                )
-            )
-        )
-    else:
-        get_solution = get_solution
+    # Methods imported on first use to remove unnecessary dependencies
+    get_field = LazyMethod(__package__, "..Methods.Mesh.SolutionVector.get_field")
+    get_axes_list = LazyMethod(
+        __package__, "..Methods.Mesh.SolutionVector.get_axes_list"
+    )
+    get_solution = LazyMethod(__package__, "..Methods.Mesh.SolutionVector.get_solution")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,22 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Elmer import Elmer
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Elmer.SolverInputFile.write import write
-except ImportError as error:
-    write = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -32,15 +25,8 @@ class SolverInputFile(Elmer):
 
     VERSION = 1
 
-    # cf Methods.Elmer.SolverInputFile.write
-    if isinstance(write, ImportError):
-        write = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SolverInputFile method write: " + str(write))
-            )
-        )
-    else:
-        write = write
+    # Methods imported on first use to remove unnecessary dependencies
+    write = LazyMethod(__package__, "..Methods.Elmer.SolverInputFile.write")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,52 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Structural import Structural
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.StructElmer.run import run
-except ImportError as error:
-    run = error
-
-try:
-    from ..Methods.Simulation.StructElmer.get_meshsolution import get_meshsolution
-except ImportError as error:
-    get_meshsolution = error
-
-try:
-    from ..Methods.Simulation.StructElmer.get_path_save_fea import get_path_save_fea
-except ImportError as error:
-    get_path_save_fea = error
-
-try:
-    from ..Methods.Simulation.StructElmer.solve_FEA import solve_FEA
-except ImportError as error:
-    solve_FEA = error
-
-try:
-    from ..Methods.Simulation.StructElmer.gen_mesh import gen_mesh
-except ImportError as error:
-    gen_mesh = error
-
-try:
-    from ..Methods.Simulation.StructElmer.gen_case import gen_case
-except ImportError as error:
-    gen_case = error
-
-try:
-    from ..Methods.Simulation.StructElmer.process_mesh import process_mesh
-except ImportError as error:
-    process_mesh = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -62,78 +25,20 @@ class StructElmer(Structural):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.StructElmer.run
-    if isinstance(run, ImportError):
-        run = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use StructElmer method run: " + str(run))
-            )
-        )
-    else:
-        run = run
-    # cf Methods.Simulation.StructElmer.get_meshsolution
-    if isinstance(get_meshsolution, ImportError):
-        get_meshsolution = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use StructElmer method get_meshsolution: "
-                    + str(get_meshsolution)
-                )
-            )
-        )
-    else:
-        get_meshsolution = get_meshsolution
-    # cf Methods.Simulation.StructElmer.get_path_save_fea
-    if isinstance(get_path_save_fea, ImportError):
-        get_path_save_fea = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use StructElmer method get_path_save_fea: "
-                    + str(get_path_save_fea)
-                )
-            )
-        )
-    else:
-        get_path_save_fea = get_path_save_fea
-    # cf Methods.Simulation.StructElmer.solve_FEA
-    if isinstance(solve_FEA, ImportError):
-        solve_FEA = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use StructElmer method solve_FEA: " + str(solve_FEA))
-            )
-        )
-    else:
-        solve_FEA = solve_FEA
-    # cf Methods.Simulation.StructElmer.gen_mesh
-    if isinstance(gen_mesh, ImportError):
-        gen_mesh = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use StructElmer method gen_mesh: " + str(gen_mesh))
-            )
-        )
-    else:
-        gen_mesh = gen_mesh
-    # cf Methods.Simulation.StructElmer.gen_case
-    if isinstance(gen_case, ImportError):
-        gen_case = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use StructElmer method gen_case: " + str(gen_case))
-            )
-        )
-    else:
-        gen_case = gen_case
-    # cf Methods.Simulation.StructElmer.process_mesh
-    if isinstance(process_mesh, ImportError):
-        process_mesh = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use StructElmer method process_mesh: " + str(process_mesh)
-                )
-            )
-        )
-    else:
-        process_mesh = process_mesh
+    # Methods imported on first use to remove unnecessary dependencies
+    run = LazyMethod(__package__, "..Methods.Simulation.StructElmer.run")
+    get_meshsolution = LazyMethod(
+        __package__, "..Methods.Simulation.StructElmer.get_meshsolution"
+    )
+    get_path_save_fea = LazyMethod(
+        __package__, "..Methods.Simulation.StructElmer.get_path_save_fea"
+    )
+    solve_FEA = LazyMethod(__package__, "..Methods.Simulation.StructElmer.solve_FEA")
+    gen_mesh = LazyMethod(__package__, "..Methods.Simulation.StructElmer.gen_mesh")
+    gen_case = LazyMethod(__package__, "..Methods.Simulation.StructElmer.gen_case")
+    process_mesh = LazyMethod(
+        __package__, "..Methods.Simulation.StructElmer.process_mesh"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,27 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.Structural.run import run
-except ImportError as error:
-    run = error
-
-try:
-    from ..Methods.Simulation.Structural.comp_axes import comp_axes
-except ImportError as error:
-    comp_axes = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -37,25 +25,9 @@ class Structural(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.Structural.run
-    if isinstance(run, ImportError):
-        run = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Structural method run: " + str(run))
-            )
-        )
-    else:
-        run = run
-    # cf Methods.Simulation.Structural.comp_axes
-    if isinstance(comp_axes, ImportError):
-        comp_axes = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Structural method comp_axes: " + str(comp_axes))
-            )
-        )
-    else:
-        comp_axes = comp_axes
+    # Methods imported on first use to remove unnecessary dependencies
+    run = LazyMethod(__package__, "..Methods.Simulation.Structural.run")
+    comp_axes = LazyMethod(__package__, "..Methods.Simulation.Structural.comp_axes")
     # save and copy methods are available in all object
     save = save
     copy = copy
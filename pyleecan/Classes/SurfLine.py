@@ -7,72 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Surface import Surface
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Geometry.SurfLine.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Geometry.SurfLine.comp_length import comp_length
-except ImportError as error:
-    comp_length = error
-
-try:
-    from ..Methods.Geometry.SurfLine.comp_point_ref import comp_point_ref
-except ImportError as error:
-    comp_point_ref = error
-
-try:
-    from ..Methods.Geometry.SurfLine.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from ..Methods.Geometry.SurfLine.discretize import discretize
-except ImportError as error:
-    discretize = error
-
-try:
-    from ..Methods.Geometry.SurfLine.get_lines import get_lines
-except ImportError as error:
-    get_lines = error
-
-try:
-    from ..Methods.Geometry.SurfLine.get_patches import get_patches
-except ImportError as error:
-    get_patches = error
-
-try:
-    from ..Methods.Geometry.SurfLine.plot_lines import plot_lines
-except ImportError as error:
-    plot_lines = error
-
-try:
-    from ..Methods.Geometry.SurfLine.rotate import rotate
-except ImportError as error:
-    rotate = error
-
-try:
-    from ..Methods.Geometry.SurfLine.scale import scale
-except ImportError as error:
-    scale = error
-
-try:
-    from ..Methods.Geometry.SurfLine.translate import translate
-except ImportError as error:
-    translate = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -82,114 +25,20 @@ class SurfLine(Surface):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Geometry.SurfLine.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SurfLine method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Geometry.SurfLine.comp_length
-    if isinstance(comp_length, ImportError):
-        comp_length = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SurfLine method comp_length: " + str(comp_length)
-                )
-            )
-        )
-    else:
-        comp_length = comp_length
-    # cf Methods.Geometry.SurfLine.comp_point_ref
-    if isinstance(comp_point_ref, ImportError):
-        comp_point_ref = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SurfLine method comp_point_ref: " + str(comp_point_ref)
-                )
-            )
-        )
-    else:
-        comp_point_ref = comp_point_ref
-    # cf Methods.Geometry.SurfLine.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SurfLine method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
-    # cf Methods.Geometry.SurfLine.discretize
-    if isinstance(discretize, ImportError):
-        discretize = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SurfLine method discretize: " + str(discretize))
-            )
-        )
-    else:
-        discretize = discretize
-    # cf Methods.Geometry.SurfLine.get_lines
-    if isinstance(get_lines, ImportError):
-        get_lines = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SurfLine method get_lines: " + str(get_lines))
-            )
-        )
-    else:
-        get_lines = get_lines
-    # cf Methods.Geometry.SurfLine.get_patches
-    if isinstance(get_patches, ImportError):
-        get_patches = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SurfLine method get_patches: " + str(get_patches)
-                )
-            )
-        )
-    else:
-        get_patches = get_patches
-    # cf Methods.Geometry.SurfLine.plot_lines
-    if isinstance(plot_lines, ImportError):
-        plot_lines = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SurfLine method plot_lines: " + str(plot_lines))
-            )
-        )
-    else:
-        plot_lines = plot_lines
-    # cf Methods.Geometry.SurfLine.rotate
-    if isinstance(rotate, ImportError):
-        rotate = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SurfLine method rotate: " + str(rotate))
-            )
-        )
-    else:
-        rotate = rotate
-    # cf Methods.Geometry.SurfLine.scale
-    if isinstance(scale, ImportError):
-        scale = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SurfLine method scale: " + str(scale))
-            )
-        )
-    else:
-        scale = scale
-    # cf Methods.Geometry.SurfLine.translate
-    if isinstance(translate, ImportError):
-        translate = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SurfLine method translate: " + str(translate))
-            )
-        )
-    else:
-        translate = translate
+    # Methods imported on first use to remove unnecessary dependencies
+    check = LazyMethod(__package__, "..Methods.Geometry.SurfLine.check")
+    comp_length = LazyMethod(__package__, "..Methods.Geometry.SurfLine.comp_length")
+    comp_point_ref = LazyMethod(
+        __package__, "..Methods.Geometry.SurfLine.comp_point_ref"
+    )
+    comp_surface = LazyMethod(__package__, "..Methods.Geometry.SurfLine.comp_surface")
+    discretize = LazyMethod(__package__, "..Methods.Geometry.SurfLine.discretize")
+    get_lines = LazyMethod(__package__, "..Methods.Geometry.SurfLine.get_lines")
+    get_patches = LazyMethod(__package__, "..Methods.Geometry.SurfLine.get_patches")
+    plot_lines = LazyMethod(__package__, "..Methods.Geometry.SurfLine.plot_lines")
+    rotate = LazyMethod(__package__, "..Methods.Geometry.SurfLine.rotate")
+    scale = LazyMethod(__package__, "..Methods.Geometry.SurfLine.scale")
+    translate = LazyMethod(__package__, "..Methods.Geometry.SurfLine.translate")
     # save and copy methods are available in all object
     save = save
     copy = copy
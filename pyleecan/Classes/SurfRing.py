@@ -7,67 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Surface import Surface
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Geometry.SurfRing.get_lines import get_lines
-except ImportError as error:
-    get_lines = error
-
-try:
-    from ..Methods.Geometry.SurfRing.rotate import rotate
-except ImportError as error:
-    rotate = error
-
-try:
-    from ..Methods.Geometry.SurfRing.translate import translate
-except ImportError as error:
-    translate = error
-
-try:
-    from ..Methods.Geometry.SurfRing.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Geometry.SurfRing.comp_length import comp_length
-except ImportError as error:
-    comp_length = error
-
-try:
-    from ..Methods.Geometry.SurfRing.get_patches import get_patches
-except ImportError as error:
-    get_patches = error
-
-try:
-    from ..Methods.Geometry.SurfRing.discretize import discretize
-except ImportError as error:
-    discretize = error
-
-try:
-    from ..Methods.Geometry.SurfRing.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from ..Methods.Geometry.SurfRing.plot_lines import plot_lines
-except ImportError as error:
-    plot_lines = error
-
-try:
-    from ..Methods.Geometry.SurfRing.comp_point_ref import comp_point_ref
-except ImportError as error:
-    comp_point_ref = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -77,105 +25,19 @@ class SurfRing(Surface):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Geometry.SurfRing.get_lines
-    if isinstance(get_lines, ImportError):
-        get_lines = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SurfRing method get_lines: " + str(get_lines))
-            )
-        )
-    else:
-        get_lines = get_lines
-    # cf Methods.Geometry.SurfRing.rotate
-    if isinstance(rotate, ImportError):
-        rotate = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SurfRing method rotate: " + str(rotate))
-            )
-        )
-    else:
-        rotate = rotate
-    # cf Methods.Geometry.SurfRing.translate
-    if isinstance(translate, ImportError):
-        translate = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SurfRing method translate: " + str(translate))
-            )
-        )
-    else:
-        translate = translate
-    # cf Methods.Geometry.SurfRing.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SurfRing method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Geometry.SurfRing.comp_length
-    if isinstance(comp_length, ImportError):
-        comp_length = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SurfRing method comp_length: " + str(comp_length)
-                )
-            )
-        )
-    else:
-        comp_length = comp_length
-    # cf Methods.Geometry.SurfRing.get_patches
-    if isinstance(get_patches, ImportError):
-        get_patches = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SurfRing method get_patches: " + str(get_patches)
-                )
-            )
-        )
-    else:
-        get_patches = get_patches
-    # cf Methods.Geometry.SurfRing.discretize
-    if isinstance(discretize, ImportError):
-        discretize = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SurfRing method discretize: " + str(discretize))
-            )
-        )
-    else:
-        discretize = discretize
-    # cf Methods.Geometry.SurfRing.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SurfRing method comp_surface: " + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
-    # cf Methods.Geometry.SurfRing.plot_lines
-    if isinstance(plot_lines, ImportError):
-        plot_lines = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use SurfRing method plot_lines: " + str(plot_lines))
-            )
-        )
-    else:
-        plot_lines = plot_lines
-    # cf Methods.Geometry.SurfRing.comp_point_ref
-    if isinstance(comp_point_ref, ImportError):
-        comp_point_ref = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use SurfRing method comp_point_ref: " + str(comp_point_ref)
-                )
-            )
-        )
-    else:
-        comp_point_ref = comp_point_ref
+    # Methods imported on first use to remove unnecessary dependencies
+    get_lines = LazyMethod(__package__, "..Methods.Geometry.SurfRing.get_lines")
+    rotate = LazyMethod(__package__, "..Methods.Geometry.SurfRing.rotate")
+    translate = LazyMethod(__package__, "..Methods.Geometry.SurfRing.translate")
+    check = LazyMethod(__package__, "..Methods.Geometry.SurfRing.check")
+    comp_length = LazyMethod(__package__, "..Methods.Geometry.SurfRing.comp_length")
+    get_patches = LazyMethod(__package__, "..Methods.Geometry.SurfRing.get_patches")
+    discretize = LazyMethod(__package__, "..Methods.Geometry.SurfRing.discretize")
+    comp_surface = LazyMethod(__package__, "..Methods.Geometry.SurfRing.comp_surface")
+    plot_lines = LazyMethod(__package__, "..Methods.Geometry.SurfRing.plot_lines")
+    comp_point_ref = LazyMethod(
+        __package__, "..Methods.Geometry.SurfRing.comp_point_ref"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
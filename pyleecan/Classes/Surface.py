@@ -7,42 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Geometry.Surface.comp_mesh_dict import comp_mesh_dict
-except ImportError as error:
-    comp_mesh_dict = error
-
-try:
-    from ..Methods.Geometry.Surface.draw_FEMM import draw_FEMM
-except ImportError as error:
-    draw_FEMM = error
-
-try:
-    from ..Methods.Geometry.Surface.plot import plot
-except ImportError as error:
-    plot = error
-
-try:
-    from ..Methods.Geometry.Surface.split_line import split_line
-except ImportError as error:
-    split_line = error
-
-try:
-    from ..Methods.Geometry.Surface.is_inside import is_inside
-except ImportError as error:
-    is_inside = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -52,54 +25,15 @@ class Surface(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Geometry.Surface.comp_mesh_dict
-    if isinstance(comp_mesh_dict, ImportError):
-        comp_mesh_dict = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Surface method comp_mesh_dict: " + str(comp_mesh_dict)
-                )
-            )
-        )
-    else:
-        comp_mesh_dict = comp_mesh_dict
-    # cf Methods.Geometry.Surface.draw_FEMM
-    if isinstance(draw_FEMM, ImportError):
-        draw_FEMM = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Surface method draw_FEMM: " + str(draw_FEMM))
-            )
-        )
-    else:
-        draw_FEMM = draw_FEMM
-    # cf Methods.Geometry.Surface.plot
-    if isinstance(plot, ImportError):
-        plot = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Surface method plot: " + str(plot))
-            )
-        )
-    else:
-        plot = plot
-    # cf Methods.Geometry.Surface.split_line
-    if isinstance(split_line, ImportError):
-        split_line = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Surface method split_line: " + str(split_line))
-            )
-        )
-    else:
-        split_line = split_line
-    # cf Methods.Geometry.Surface.is_inside
-    if isinstance(is_inside, ImportError):
-        is_inside = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Surface method is_inside: " + str(is_inside))
-            )
-        )
-    else:
-        is_inside = is_inside
+    # Methods imported on first use to remove unnecessary dependencies
+    comp_mesh_dict = LazyMethod(
+        __package__, "..Methods.Geometry.Surface.comp_mesh_dict"
+    )
+    draw_FEMM = LazyMethod(__package__, "..Methods.Geometry.Surface.draw_FEMM")
+    plot = LazyMethod(__package__, "..Methods.Geometry.Surface.plot")
+    split_line = LazyMethod(__package__, "..Methods.Geometry.Surface.split_line")
+    is_inside = LazyMethod(__package__, "..Methods.Geometry.Surface.is_inside")
+    get_polyline = LazyMethod(__package__, "..Methods.Geometry.Surface.get_polyline")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,47 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.GUI_Option.Unit.get_m import get_m
-except ImportError as error:
-    get_m = error
-
-try:
-    from ..Methods.GUI_Option.Unit.get_m2 import get_m2
-except ImportError as error:
-    get_m2 = error
-
-try:
-    from ..Methods.GUI_Option.Unit.get_m_name import get_m_name
-except ImportError as error:
-    get_m_name = error
-
-try:
-    from ..Methods.GUI_Option.Unit.get_m2_name import get_m2_name
-except ImportError as error:
-    get_m2_name = error
-
-try:
-    from ..Methods.GUI_Option.Unit.set_m import set_m
-except ImportError as error:
-    set_m = error
-
-try:
-    from ..Methods.GUI_Option.Unit.set_m2 import set_m2
-except ImportError as error:
-    set_m2 = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -56,61 +24,13 @@ class Unit(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.GUI_Option.Unit.get_m
-    if isinstance(get_m, ImportError):
-        get_m = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Unit method get_m: " + str(get_m))
-            )
-        )
-    else:
-        get_m = get_m
-    # cf Methods.GUI_Option.Unit.get_m2
-    if isinstance(get_m2, ImportError):
-        get_m2 = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Unit method get_m2: " + str(get_m2))
-            )
-        )
-    else:
-        get_m2 = get_m2
-    # cf Methods.GUI_Option.Unit.get_m_name
-    if isinstance(get_m_name, ImportError):
-        get_m_name = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Unit method get_m_name: " + str(get_m_name))
-            )
-        )
-    else:
-        get_m_name = get_m_name
-    # cf Methods.GUI_Option.Unit.get_m2_name
-    if isinstance(get_m2_name, ImportError):
-        get_m2_name = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Unit method get_m2_name: " + str(get_m2_name))
-            )
-        )
-    else:
-        get_m2_name = get_m2_name
-    # cf Methods.GUI_Option.Unit.set_m
-    if isinstance(set_m, ImportError):
-        set_m = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Unit method set_m: " + str(set_m))
-            )
-        )
-    else:
-        set_m = set_m
-    # cf Methods.GUI_Option.Unit.set_m2
-    if isinstance(set_m2, ImportError):
-        set_m2 = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Unit method set_m2: " + str(set_m2))
-            )
-        )
-    else:
-        set_m2 = set_m2
+    # Methods imported on first use to remove unnecessary dependencies
+    get_m = LazyMethod(__package__, "..Methods.GUI_Option.Unit.get_m")
+    get_m2 = LazyMethod(__package__, "..Methods.GUI_Option.Unit.get_m2")
+    get_m_name = LazyMethod(__package__, "..Methods.GUI_Option.Unit.get_m_name")
+    get_m2_name = LazyMethod(__package__, "..Methods.GUI_Option.Unit.get_m2_name")
+    set_m = LazyMethod(__package__, "..Methods.GUI_Option.Unit.set_m")
+    set_m2 = LazyMethod(__package__, "..Methods.GUI_Option.Unit.set_m2")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,27 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import set_array, check_var, raise_
+from ._check import set_array, check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyArray, LazyMethod
 from .VarSimu import VarSimu
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.VarLoad.get_ref_simu_index import get_ref_simu_index
-except ImportError as error:
-    get_ref_simu_index = error
-
-try:
-    from ..Methods.Simulation.VarLoad.get_OP_matrix import get_OP_matrix
-except ImportError as error:
-    get_OP_matrix = error
-
-
 from numpy import array, array_equal
 from numpy import isnan
 from ._check import InitUnKnowClassError
@@ -39,30 +27,13 @@ class VarLoad(VarSimu):
     VERSION = 1
     NAME = "Variable Load"
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.VarLoad.get_ref_simu_index
-    if isinstance(get_ref_simu_index, ImportError):
-        get_ref_simu_index = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VarLoad method get_ref_simu_index: "
-                    + str(get_ref_simu_index)
-                )
-            )
-        )
-    else:
-        get_ref_simu_index = get_ref_simu_index
-    # cf Methods.Simulation.VarLoad.get_OP_matrix
-    if isinstance(get_OP_matrix, ImportError):
-        get_OP_matrix = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VarLoad method get_OP_matrix: " + str(get_OP_matrix)
-                )
-            )
-        )
-    else:
-        get_OP_matrix = get_OP_matrix
+    # Methods imported on first use to remove unnecessary dependencies
+    get_ref_simu_index = LazyMethod(
+        __package__, "..Methods.Simulation.VarLoad.get_ref_simu_index"
+    )
+    get_OP_matrix = LazyMethod(
+        __package__, "..Methods.Simulation.VarLoad.get_OP_matrix"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -86,6 +57,9 @@ class VarLoad(VarSimu):
         pre_keeper_postproc_list=None,
         post_keeper_postproc_list=None,
         is_reuse_LUT=True,
+        nb_worker=1,
+        is_reuse_machine=True,
+        store=None,
         init_dict=None,
         init_str=None,
     ):
@@ -134,6 +108,12 @@ class VarLoad(VarSimu):
                 post_keeper_postproc_list = init_dict["post_keeper_postproc_list"]
             if "is_reuse_LUT" in list(init_dict.keys()):
                 is_reuse_LUT = init_dict["is_reuse_LUT"]
+            if "nb_worker" in list(init_dict.keys()):
+                nb_worker = init_dict["nb_worker"]
+            if "is_reuse_machine" in list(init_dict.keys()):
+                is_reuse_machine = init_dict["is_reuse_machine"]
+            if "store" in list(init_dict.keys()):
+                store = init_dict["store"]
         # Set the properties (value check and convertion are done in setter)
         self.OP_matrix = OP_matrix
         self.type_OP_matrix = type_OP_matrix
@@ -152,6 +132,9 @@ class VarLoad(VarSimu):
             pre_keeper_postproc_list=pre_keeper_postproc_list,
             post_keeper_postproc_list=post_keeper_postproc_list,
             is_reuse_LUT=is_reuse_LUT,
+            nb_worker=nb_worker,
+            is_reuse_machine=is_reuse_machine,
+            store=store,
         )
         # The class is frozen (in VarSimu init), for now it's impossible to
         # add new properties
@@ -295,6 +278,8 @@ class VarLoad(VarSimu):
 
     def _get_OP_matrix(self):
         """getter of OP_matrix"""
+        if isinstance(self._OP_matrix, LazyArray):
+            self._OP_matrix = self._OP_matrix.read()
         return self._OP_matrix
 
     def _set_OP_matrix(self, value):
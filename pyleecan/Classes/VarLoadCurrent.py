@@ -7,36 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import set_array, check_var, raise_
+from ._check import set_array, check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyArray, LazyMethod
 from .VarLoad import VarLoad
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.VarLoadCurrent.generate_simulation_list import (
-        generate_simulation_list,
-    )
-except ImportError as error:
-    generate_simulation_list = error
-
-try:
-    from ..Methods.Simulation.VarLoadCurrent.get_elec_datakeeper import (
-        get_elec_datakeeper,
-    )
-except ImportError as error:
-    get_elec_datakeeper = error
-
-try:
-    from ..Methods.Simulation.VarLoadCurrent.get_input_list import get_input_list
-except ImportError as error:
-    get_input_list = error
-
-
 from numpy import array, array_equal
 from numpy import isnan
 from ._check import InitUnKnowClassError
@@ -47,43 +26,16 @@ class VarLoadCurrent(VarLoad):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.VarLoadCurrent.generate_simulation_list
-    if isinstance(generate_simulation_list, ImportError):
-        generate_simulation_list = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VarLoadCurrent method generate_simulation_list: "
-                    + str(generate_simulation_list)
-                )
-            )
-        )
-    else:
-        generate_simulation_list = generate_simulation_list
-    # cf Methods.Simulation.VarLoadCurrent.get_elec_datakeeper
-    if isinstance(get_elec_datakeeper, ImportError):
-        get_elec_datakeeper = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VarLoadCurrent method get_elec_datakeeper: "
-                    + str(get_elec_datakeeper)
-                )
-            )
-        )
-    else:
-        get_elec_datakeeper = get_elec_datakeeper
-    # cf Methods.Simulation.VarLoadCurrent.get_input_list
-    if isinstance(get_input_list, ImportError):
-        get_input_list = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VarLoadCurrent method get_input_list: "
-                    + str(get_input_list)
-                )
-            )
-        )
-    else:
-        get_input_list = get_input_list
+    # Methods imported on first use to remove unnecessary dependencies
+    generate_simulation_list = LazyMethod(
+        __package__, "..Methods.Simulation.VarLoadCurrent.generate_simulation_list"
+    )
+    get_elec_datakeeper = LazyMethod(
+        __package__, "..Methods.Simulation.VarLoadCurrent.get_elec_datakeeper"
+    )
+    get_input_list = LazyMethod(
+        __package__, "..Methods.Simulation.VarLoadCurrent.get_input_list"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -107,6 +59,9 @@ class VarLoadCurrent(VarLoad):
         pre_keeper_postproc_list=None,
         post_keeper_postproc_list=None,
         is_reuse_LUT=True,
+        nb_worker=1,
+        is_reuse_machine=True,
+        store=None,
         init_dict=None,
         init_str=None,
     ):
@@ -155,6 +110,12 @@ class VarLoadCurrent(VarLoad):
                 post_keeper_postproc_list = init_dict["post_keeper_postproc_list"]
             if "is_reuse_LUT" in list(init_dict.keys()):
                 is_reuse_LUT = init_dict["is_reuse_LUT"]
+            if "nb_worker" in list(init_dict.keys()):
+                nb_worker = init_dict["nb_worker"]
+            if "is_reuse_machine" in list(init_dict.keys()):
+                is_reuse_machine = init_dict["is_reuse_machine"]
+            if "store" in list(init_dict.keys()):
+                store = init_dict["store"]
         # Set the properties (value check and convertion are done in setter)
         # Call VarLoad init
         super(VarLoadCurrent, self).__init__(
@@ -173,6 +134,9 @@ class VarLoadCurrent(VarLoad):
             pre_keeper_postproc_list=pre_keeper_postproc_list,
             post_keeper_postproc_list=post_keeper_postproc_list,
             is_reuse_LUT=is_reuse_LUT,
+            nb_worker=nb_worker,
+            is_reuse_machine=is_reuse_machine,
+            store=store,
         )
         # The class is frozen (in VarLoad init), for now it's impossible to
         # add new properties
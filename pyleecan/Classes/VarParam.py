@@ -7,34 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .VarSimu import VarSimu
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.VarParam.check_param import check_param
-except ImportError as error:
-    check_param = error
-
-try:
-    from ..Methods.Simulation.VarParam.generate_simulation_list import (
-        generate_simulation_list,
-    )
-except ImportError as error:
-    generate_simulation_list = error
-
-try:
-    from ..Methods.Simulation.VarParam.get_simu_number import get_simu_number
-except ImportError as error:
-    get_simu_number = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -45,41 +26,14 @@ class VarParam(VarSimu):
     VERSION = 1
     NAME = "Parameter Sweep"
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.VarParam.check_param
-    if isinstance(check_param, ImportError):
-        check_param = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VarParam method check_param: " + str(check_param)
-                )
-            )
-        )
-    else:
-        check_param = check_param
-    # cf Methods.Simulation.VarParam.generate_simulation_list
-    if isinstance(generate_simulation_list, ImportError):
-        generate_simulation_list = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VarParam method generate_simulation_list: "
-                    + str(generate_simulation_list)
-                )
-            )
-        )
-    else:
-        generate_simulation_list = generate_simulation_list
-    # cf Methods.Simulation.VarParam.get_simu_number
-    if isinstance(get_simu_number, ImportError):
-        get_simu_number = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VarParam method get_simu_number: " + str(get_simu_number)
-                )
-            )
-        )
-    else:
-        get_simu_number = get_simu_number
+    # Methods imported on first use to remove unnecessary dependencies
+    check_param = LazyMethod(__package__, "..Methods.Simulation.VarParam.check_param")
+    generate_simulation_list = LazyMethod(
+        __package__, "..Methods.Simulation.VarParam.generate_simulation_list"
+    )
+    get_simu_number = LazyMethod(
+        __package__, "..Methods.Simulation.VarParam.get_simu_number"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -101,6 +55,9 @@ class VarParam(VarSimu):
         pre_keeper_postproc_list=None,
         post_keeper_postproc_list=None,
         is_reuse_LUT=True,
+        nb_worker=1,
+        is_reuse_machine=True,
+        store=None,
         init_dict=None,
         init_str=None,
     ):
@@ -145,6 +102,12 @@ class VarParam(VarSimu):
                 post_keeper_postproc_list = init_dict["post_keeper_postproc_list"]
             if "is_reuse_LUT" in list(init_dict.keys()):
                 is_reuse_LUT = init_dict["is_reuse_LUT"]
+            if "nb_worker" in list(init_dict.keys()):
+                nb_worker = init_dict["nb_worker"]
+            if "is_reuse_machine" in list(init_dict.keys()):
+                is_reuse_machine = init_dict["is_reuse_machine"]
+            if "store" in list(init_dict.keys()):
+                store = init_dict["store"]
         # Set the properties (value check and convertion are done in setter)
         self.paramexplorer_list = paramexplorer_list
         # Call VarSimu init
@@ -161,6 +124,9 @@ class VarParam(VarSimu):
             pre_keeper_postproc_list=pre_keeper_postproc_list,
             post_keeper_postproc_list=post_keeper_postproc_list,
             is_reuse_LUT=is_reuse_LUT,
+            nb_worker=nb_worker,
+            is_reuse_machine=is_reuse_machine,
+            store=store,
         )
         # The class is frozen (in VarSimu init), for now it's impossible to
         # add new properties
@@ -7,64 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Simulation.VarSimu.run import run
-except ImportError as error:
-    run = error
-
-try:
-    from ..Methods.Simulation.VarSimu.set_reused_data import set_reused_data
-except ImportError as error:
-    set_reused_data = error
-
-try:
-    from ..Methods.Simulation.VarSimu.check_param import check_param
-except ImportError as error:
-    check_param = error
-
-try:
-    from ..Methods.Simulation.VarSimu.generate_simulation_list import (
-        generate_simulation_list,
-    )
-except ImportError as error:
-    generate_simulation_list = error
-
-try:
-    from ..Methods.Simulation.VarSimu.gen_datakeeper_list import gen_datakeeper_list
-except ImportError as error:
-    gen_datakeeper_list = error
-
-try:
-    from ..Methods.Simulation.VarSimu.get_elec_datakeeper import get_elec_datakeeper
-except ImportError as error:
-    get_elec_datakeeper = error
-
-try:
-    from ..Methods.Simulation.VarSimu.get_mag_datakeeper import get_mag_datakeeper
-except ImportError as error:
-    get_mag_datakeeper = error
-
-try:
-    from ..Methods.Simulation.VarSimu.get_force_datakeeper import get_force_datakeeper
-except ImportError as error:
-    get_force_datakeeper = error
-
-try:
-    from ..Methods.Simulation.VarSimu.get_ref_simu_index import get_ref_simu_index
-except ImportError as error:
-    get_ref_simu_index = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -74,108 +25,31 @@ class VarSimu(FrozenClass):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Simulation.VarSimu.run
-    if isinstance(run, ImportError):
-        run = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use VarSimu method run: " + str(run))
-            )
-        )
-    else:
-        run = run
-    # cf Methods.Simulation.VarSimu.set_reused_data
-    if isinstance(set_reused_data, ImportError):
-        set_reused_data = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VarSimu method set_reused_data: " + str(set_reused_data)
-                )
-            )
-        )
-    else:
-        set_reused_data = set_reused_data
-    # cf Methods.Simulation.VarSimu.check_param
-    if isinstance(check_param, ImportError):
-        check_param = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use VarSimu method check_param: " + str(check_param))
-            )
-        )
-    else:
-        check_param = check_param
-    # cf Methods.Simulation.VarSimu.generate_simulation_list
-    if isinstance(generate_simulation_list, ImportError):
-        generate_simulation_list = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VarSimu method generate_simulation_list: "
-                    + str(generate_simulation_list)
-                )
-            )
-        )
-    else:
-        generate_simulation_list = generate_simulation_list
-    # cf Methods.Simulation.VarSimu.gen_datakeeper_list
-    if isinstance(gen_datakeeper_list, ImportError):
-        gen_datakeeper_list = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VarSimu method gen_datakeeper_list: "
-                    + str(gen_datakeeper_list)
-                )
-            )
-        )
-    else:
-        gen_datakeeper_list = gen_datakeeper_list
-    # cf Methods.Simulation.VarSimu.get_elec_datakeeper
-    if isinstance(get_elec_datakeeper, ImportError):
-        get_elec_datakeeper = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VarSimu method get_elec_datakeeper: "
-                    + str(get_elec_datakeeper)
-                )
-            )
-        )
-    else:
-        get_elec_datakeeper = get_elec_datakeeper
-    # cf Methods.Simulation.VarSimu.get_mag_datakeeper
-    if isinstance(get_mag_datakeeper, ImportError):
-        get_mag_datakeeper = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VarSimu method get_mag_datakeeper: "
-                    + str(get_mag_datakeeper)
-                )
-            )
-        )
-    else:
-        get_mag_datakeeper = get_mag_datakeeper
-    # cf Methods.Simulation.VarSimu.get_force_datakeeper
-    if isinstance(get_force_datakeeper, ImportError):
-        get_force_datakeeper = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VarSimu method get_force_datakeeper: "
-                    + str(get_force_datakeeper)
-                )
-            )
-        )
-    else:
-        get_force_datakeeper = get_force_datakeeper
-    # cf Methods.Simulation.VarSimu.get_ref_simu_index
-    if isinstance(get_ref_simu_index, ImportError):
-        get_ref_simu_index = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VarSimu method get_ref_simu_index: "
-                    + str(get_ref_simu_index)
-                )
-            )
-        )
-    else:
-        get_ref_simu_index = get_ref_simu_index
+    # Methods imported on first use to remove unnecessary dependencies
+    run = LazyMethod(__package__, "..Methods.Simulation.VarSimu.run")
+    set_reused_data = LazyMethod(
+        __package__, "..Methods.Simulation.VarSimu.set_reused_data"
+    )
+    check_param = LazyMethod(__package__, "..Methods.Simulation.VarSimu.check_param")
+    generate_simulation_list = LazyMethod(
+        __package__, "..Methods.Simulation.VarSimu.generate_simulation_list"
+    )
+    gen_datakeeper_list = LazyMethod(
+        __package__, "..Methods.Simulation.VarSimu.gen_datakeeper_list"
+    )
+    get_elec_datakeeper = LazyMethod(
+        __package__, "..Methods.Simulation.VarSimu.get_elec_datakeeper"
+    )
+    get_mag_datakeeper = LazyMethod(
+        __package__, "..Methods.Simulation.VarSimu.get_mag_datakeeper"
+    )
+    get_force_datakeeper = LazyMethod(
+        __package__, "..Methods.Simulation.VarSimu.get_force_datakeeper"
+    )
+    get_ref_simu_index = LazyMethod(
+        __package__, "..Methods.Simulation.VarSimu.get_ref_simu_index"
+    )
+    run_parallel = LazyMethod(__package__, "..Methods.Simulation.VarSimu.run_parallel")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -196,6 +70,9 @@ class VarSimu(FrozenClass):
         pre_keeper_postproc_list=None,
         post_keeper_postproc_list=None,
         is_reuse_LUT=True,
+        nb_worker=1,
+        is_reuse_machine=True,
+        store=None,
         init_dict=None,
         init_str=None,
     ):
@@ -238,6 +115,12 @@ class VarSimu(FrozenClass):
                 post_keeper_postproc_list = init_dict["post_keeper_postproc_list"]
             if "is_reuse_LUT" in list(init_dict.keys()):
                 is_reuse_LUT = init_dict["is_reuse_LUT"]
+            if "nb_worker" in list(init_dict.keys()):
+                nb_worker = init_dict["nb_worker"]
+            if "is_reuse_machine" in list(init_dict.keys()):
+                is_reuse_machine = init_dict["is_reuse_machine"]
+            if "store" in list(init_dict.keys()):
+                store = init_dict["store"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
         self.name = name
@@ -252,6 +135,9 @@ class VarSimu(FrozenClass):
         self.pre_keeper_postproc_list = pre_keeper_postproc_list
         self.post_keeper_postproc_list = post_keeper_postproc_list
         self.is_reuse_LUT = is_reuse_LUT
+        self.nb_worker = nb_worker
+        self.is_reuse_machine = is_reuse_machine
+        self.store = store
 
         # The class is frozen, for now it's impossible to add new properties
         self._freeze()
@@ -318,6 +204,13 @@ class VarSimu(FrozenClass):
                 "post_keeper_postproc_list[" + str(ii) + "] =" + tmp + linesep + linesep
             )
         VarSimu_str += "is_reuse_LUT = " + str(self.is_reuse_LUT) + linesep
+        VarSimu_str += "nb_worker = " + str(self.nb_worker) + linesep
+        VarSimu_str += "is_reuse_machine = " + str(self.is_reuse_machine) + linesep
+        if self.store is not None:
+            tmp = self.store.__str__().replace(linesep, linesep + "\t").rstrip("\t")
+            VarSimu_str += "store = " + tmp
+        else:
+            VarSimu_str += "store = None" + linesep + linesep
         return VarSimu_str
 
     def __eq__(self, other):
@@ -349,6 +242,12 @@ class VarSimu(FrozenClass):
             return False
         if other.is_reuse_LUT != self.is_reuse_LUT:
             return False
+        if other.nb_worker != self.nb_worker:
+            return False
+        if other.is_reuse_machine != self.is_reuse_machine:
+            return False
+        if other.store != self.store:
+            return False
         return True
 
     def compare(self, other, name="self", ignore_list=None, is_add_value=False):
@@ -530,6 +429,43 @@ class VarSimu(FrozenClass):
                 diff_list.append(name + ".is_reuse_LUT" + val_str)
             else:
                 diff_list.append(name + ".is_reuse_LUT")
+        if other._nb_worker != self._nb_worker:
+            if is_add_value:
+                val_str = (
+                    " (self="
+                    + str(self._nb_worker)
+                    + ", other="
+                    + str(other._nb_worker)
+                    + ")"
+                )
+                diff_list.append(name + ".nb_worker" + val_str)
+            else:
+                diff_list.append(name + ".nb_worker")
+        if other._is_reuse_machine != self._is_reuse_machine:
+            if is_add_value:
+                val_str = (
+                    " (self="
+                    + str(self._is_reuse_machine)
+                    + ", other="
+                    + str(other._is_reuse_machine)
+                    + ")"
+                )
+                diff_list.append(name + ".is_reuse_machine" + val_str)
+            else:
+                diff_list.append(name + ".is_reuse_machine")
+        if (other.store is None and self.store is not None) or (
+            other.store is not None and self.store is None
+        ):
+            diff_list.append(name + ".store None mismatch")
+        elif self.store is not None:
+            diff_list.extend(
+                self.store.compare(
+                    other.store,
+                    name=name + ".store",
+                    ignore_list=ignore_list,
+                    is_add_value=is_add_value,
+                )
+            )
         # Filter ignore differences
         diff_list = list(filter(lambda x: x not in ignore_list, diff_list))
         return diff_list
@@ -558,6 +494,9 @@ class VarSimu(FrozenClass):
             for value in self.post_keeper_postproc_list:
                 S += getsizeof(value)
         S += getsizeof(self.is_reuse_LUT)
+        S += getsizeof(self.nb_worker)
+        S += getsizeof(self.is_reuse_machine)
+        S += getsizeof(self.store)
         return S
 
     def as_dict(self, type_handle_ndarray=0, keep_function=False, **kwargs):
@@ -647,6 +586,16 @@ class VarSimu(FrozenClass):
                 else:
                     VarSimu_dict["post_keeper_postproc_list"].append(None)
         VarSimu_dict["is_reuse_LUT"] = self.is_reuse_LUT
+        VarSimu_dict["nb_worker"] = self.nb_worker
+        VarSimu_dict["is_reuse_machine"] = self.is_reuse_machine
+        if self.store is None:
+            VarSimu_dict["store"] = None
+        else:
+            VarSimu_dict["store"] = self.store.as_dict(
+                type_handle_ndarray=type_handle_ndarray,
+                keep_function=keep_function,
+                **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         VarSimu_dict["__class__"] = "VarSimu"
         return VarSimu_dict
@@ -667,6 +616,10 @@ class VarSimu(FrozenClass):
         self.pre_keeper_postproc_list = None
         self.post_keeper_postproc_list = None
         self.is_reuse_LUT = None
+        self.nb_worker = None
+        self.is_reuse_machine = None
+        if self.store is not None:
+            self.store._set_None()
 
     def _get_name(self):
         """getter of name"""
@@ -1002,3 +955,77 @@ class VarSimu(FrozenClass):
         :Type: bool
         """,
     )
+
+    def _get_nb_worker(self):
+        """getter of nb_worker"""
+        return self._nb_worker
+
+    def _set_nb_worker(self, value):
+        """setter of nb_worker"""
+        check_var("nb_worker", value, "int", Vmin=1)
+        self._nb_worker = value
+
+    nb_worker = property(
+        fget=_get_nb_worker,
+        fset=_set_nb_worker,
+        doc=u"""To run the simulations of the simulation list in parallel with a process pool (only the DataKeeper results and the outputs if is_keep_all_output are sent back)
+
+        :Type: int
+        :min: 1
+        """,
+    )
+
+    def _get_is_reuse_machine(self):
+        """getter of is_reuse_machine"""
+        return self._is_reuse_machine
+
+    def _set_is_reuse_machine(self, value):
+        """setter of is_reuse_machine"""
+        check_var("is_reuse_machine", value, "bool")
+        self._is_reuse_machine = value
+
+    is_reuse_machine = property(
+        fget=_get_is_reuse_machine,
+        fset=_set_is_reuse_machine,
+        doc=u"""True to share the machine between the generated simulations (the machine is copied if a setter modifies it but the materials that are not modified are shared)
+
+        :Type: bool
+        """,
+    )
+
+    def _get_store(self):
+        """getter of store"""
+        return self._store
+
+    def _set_store(self, value):
+        """setter of store"""
+        if isinstance(value, str):  # Load from file
+            try:
+                value = load_init_dict(value)[1]
+            except Exception as e:
+                self.get_logger().error(
+                    "Error while loading " + value + ", setting None instead"
+                )
+                value = None
+        if isinstance(value, dict) and "__class__" in value:
+            class_obj = import_class(
+                "pyleecan.Classes", value.get("__class__"), "store"
+            )
+            value = class_obj(init_dict=value)
+        elif type(value) is int and value == -1:  # Default constructor
+            XOutputStore = import_class("pyleecan.Classes", "XOutputStore", "store")
+            value = XOutputStore()
+        check_var("store", value, "XOutputStore")
+        self._store = value
+
+        if self._store is not None:
+            self._store.parent = self
+
+    store = property(
+        fget=_get_store,
+        fset=_set_store,
+        doc=u"""Store to save the results of each simulation as soon as it is done (and to resume an interrupted multi-simulation), None to only keep the results in the XOutput
+
+        :Type: XOutputStore
+        """,
+    )
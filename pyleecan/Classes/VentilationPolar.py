@@ -7,54 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Hole import Hole
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Slot.VentilationPolar.build_geometry import build_geometry
-except ImportError as error:
-    build_geometry = error
-
-try:
-    from ..Methods.Slot.VentilationPolar.check import check
-except ImportError as error:
-    check = error
-
-try:
-    from ..Methods.Slot.VentilationPolar.comp_radius import comp_radius
-except ImportError as error:
-    comp_radius = error
-
-try:
-    from ..Methods.Slot.VentilationPolar.comp_surface import comp_surface
-except ImportError as error:
-    comp_surface = error
-
-try:
-    from ..Methods.Slot.VentilationPolar.get_center import get_center
-except ImportError as error:
-    get_center = error
-
-try:
-    from ..Methods.Slot.VentilationPolar._comp_point_coordinate import (
-        _comp_point_coordinate,
-    )
-except ImportError as error:
-    _comp_point_coordinate = error
-
-try:
-    from ..Methods.Slot.VentilationPolar.plot_schematics import plot_schematics
-except ImportError as error:
-    plot_schematics = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -64,86 +25,22 @@ class VentilationPolar(Hole):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Slot.VentilationPolar.build_geometry
-    if isinstance(build_geometry, ImportError):
-        build_geometry = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VentilationPolar method build_geometry: "
-                    + str(build_geometry)
-                )
-            )
-        )
-    else:
-        build_geometry = build_geometry
-    # cf Methods.Slot.VentilationPolar.check
-    if isinstance(check, ImportError):
-        check = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use VentilationPolar method check: " + str(check))
-            )
-        )
-    else:
-        check = check
-    # cf Methods.Slot.VentilationPolar.comp_radius
-    if isinstance(comp_radius, ImportError):
-        comp_radius = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VentilationPolar method comp_radius: " + str(comp_radius)
-                )
-            )
-        )
-    else:
-        comp_radius = comp_radius
-    # cf Methods.Slot.VentilationPolar.comp_surface
-    if isinstance(comp_surface, ImportError):
-        comp_surface = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VentilationPolar method comp_surface: "
-                    + str(comp_surface)
-                )
-            )
-        )
-    else:
-        comp_surface = comp_surface
-    # cf Methods.Slot.VentilationPolar.get_center
-    if isinstance(get_center, ImportError):
-        get_center = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VentilationPolar method get_center: " + str(get_center)
-                )
-            )
-        )
-    else:
-        get_center = get_center
-    # cf Methods.Slot.VentilationPolar._comp_point_coordinate
-    if isinstance(_comp_point_coordinate, ImportError):
-        _comp_point_coordinate = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VentilationPolar method _comp_point_coordinate: "
-                    + str(_comp_point_coordinate)
-                )
-            )
-        )
-    else:
-        _comp_point_coordinate = _comp_point_coordinate
-    # cf Methods.Slot.VentilationPolar.plot_schematics
-    if isinstance(plot_schematics, ImportError):
-        plot_schematics = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use VentilationPolar method plot_schematics: "
-                    + str(plot_schematics)
-                )
-            )
-        )
-    else:
-        plot_schematics = plot_schematics
+    # Methods imported on first use to remove unnecessary dependencies
+    build_geometry = LazyMethod(
+        __package__, "..Methods.Slot.VentilationPolar.build_geometry"
+    )
+    check = LazyMethod(__package__, "..Methods.Slot.VentilationPolar.check")
+    comp_radius = LazyMethod(__package__, "..Methods.Slot.VentilationPolar.comp_radius")
+    comp_surface = LazyMethod(
+        __package__, "..Methods.Slot.VentilationPolar.comp_surface"
+    )
+    get_center = LazyMethod(__package__, "..Methods.Slot.VentilationPolar.get_center")
+    _comp_point_coordinate = LazyMethod(
+        __package__, "..Methods.Slot.VentilationPolar._comp_point_coordinate"
+    )
+    plot_schematics = LazyMethod(
+        __package__, "..Methods.Slot.VentilationPolar.plot_schematics"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
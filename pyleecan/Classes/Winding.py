@@ -7,77 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import set_array, check_var, raise_
+from ._check import set_array, check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyArray, LazyMethod
 from ._frozen import FrozenClass
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.Winding.comp_connection_mat import comp_connection_mat
-except ImportError as error:
-    comp_connection_mat = error
-
-try:
-    from ..Methods.Machine.Winding.comp_length_endwinding import comp_length_endwinding
-except ImportError as error:
-    comp_length_endwinding = error
-
-try:
-    from ..Methods.Machine.Winding.comp_Ncspc import comp_Ncspc
-except ImportError as error:
-    comp_Ncspc = error
-
-try:
-    from ..Methods.Machine.Winding.comp_Ntsp import comp_Ntsp
-except ImportError as error:
-    comp_Ntsp = error
-
-try:
-    from ..Methods.Machine.Winding.comp_periodicity import comp_periodicity
-except ImportError as error:
-    comp_periodicity = error
-
-try:
-    from ..Methods.Machine.Winding.comp_phasor_angle import comp_phasor_angle
-except ImportError as error:
-    comp_phasor_angle = error
-
-try:
-    from ..Methods.Machine.Winding.comp_winding_factor import comp_winding_factor
-except ImportError as error:
-    comp_winding_factor = error
-
-try:
-    from ..Methods.Machine.Winding.get_connection_mat import get_connection_mat
-except ImportError as error:
-    get_connection_mat = error
-
-try:
-    from ..Methods.Machine.Winding.get_dim_wind import get_dim_wind
-except ImportError as error:
-    get_dim_wind = error
-
-try:
-    from ..Methods.Machine.Winding.get_periodicity import get_periodicity
-except ImportError as error:
-    get_periodicity = error
-
-try:
-    from ..Methods.Machine.Winding.export_to_csv import export_to_csv
-except ImportError as error:
-    export_to_csv = error
-
-try:
-    from ..Methods.Machine.Winding.clean import clean
-except ImportError as error:
-    clean = error
-
-
 from numpy import array, array_equal
 from numpy import isnan
 from ._check import InitUnKnowClassError
@@ -89,139 +27,33 @@ class Winding(FrozenClass):
     VERSION = 1
     NAME = "Star of slots"
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.Winding.comp_connection_mat
-    if isinstance(comp_connection_mat, ImportError):
-        comp_connection_mat = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Winding method comp_connection_mat: "
-                    + str(comp_connection_mat)
-                )
-            )
-        )
-    else:
-        comp_connection_mat = comp_connection_mat
-    # cf Methods.Machine.Winding.comp_length_endwinding
-    if isinstance(comp_length_endwinding, ImportError):
-        comp_length_endwinding = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Winding method comp_length_endwinding: "
-                    + str(comp_length_endwinding)
-                )
-            )
-        )
-    else:
-        comp_length_endwinding = comp_length_endwinding
-    # cf Methods.Machine.Winding.comp_Ncspc
-    if isinstance(comp_Ncspc, ImportError):
-        comp_Ncspc = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Winding method comp_Ncspc: " + str(comp_Ncspc))
-            )
-        )
-    else:
-        comp_Ncspc = comp_Ncspc
-    # cf Methods.Machine.Winding.comp_Ntsp
-    if isinstance(comp_Ntsp, ImportError):
-        comp_Ntsp = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Winding method comp_Ntsp: " + str(comp_Ntsp))
-            )
-        )
-    else:
-        comp_Ntsp = comp_Ntsp
-    # cf Methods.Machine.Winding.comp_periodicity
-    if isinstance(comp_periodicity, ImportError):
-        comp_periodicity = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Winding method comp_periodicity: "
-                    + str(comp_periodicity)
-                )
-            )
-        )
-    else:
-        comp_periodicity = comp_periodicity
-    # cf Methods.Machine.Winding.comp_phasor_angle
-    if isinstance(comp_phasor_angle, ImportError):
-        comp_phasor_angle = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Winding method comp_phasor_angle: "
-                    + str(comp_phasor_angle)
-                )
-            )
-        )
-    else:
-        comp_phasor_angle = comp_phasor_angle
-    # cf Methods.Machine.Winding.comp_winding_factor
-    if isinstance(comp_winding_factor, ImportError):
-        comp_winding_factor = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Winding method comp_winding_factor: "
-                    + str(comp_winding_factor)
-                )
-            )
-        )
-    else:
-        comp_winding_factor = comp_winding_factor
-    # cf Methods.Machine.Winding.get_connection_mat
-    if isinstance(get_connection_mat, ImportError):
-        get_connection_mat = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Winding method get_connection_mat: "
-                    + str(get_connection_mat)
-                )
-            )
-        )
-    else:
-        get_connection_mat = get_connection_mat
-    # cf Methods.Machine.Winding.get_dim_wind
-    if isinstance(get_dim_wind, ImportError):
-        get_dim_wind = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Winding method get_dim_wind: " + str(get_dim_wind)
-                )
-            )
-        )
-    else:
-        get_dim_wind = get_dim_wind
-    # cf Methods.Machine.Winding.get_periodicity
-    if isinstance(get_periodicity, ImportError):
-        get_periodicity = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Winding method get_periodicity: " + str(get_periodicity)
-                )
-            )
-        )
-    else:
-        get_periodicity = get_periodicity
-    # cf Methods.Machine.Winding.export_to_csv
-    if isinstance(export_to_csv, ImportError):
-        export_to_csv = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use Winding method export_to_csv: " + str(export_to_csv)
-                )
-            )
-        )
-    else:
-        export_to_csv = export_to_csv
-    # cf Methods.Machine.Winding.clean
-    if isinstance(clean, ImportError):
-        clean = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use Winding method clean: " + str(clean))
-            )
-        )
-    else:
-        clean = clean
+    # Methods imported on first use to remove unnecessary dependencies
+    comp_connection_mat = LazyMethod(
+        __package__, "..Methods.Machine.Winding.comp_connection_mat"
+    )
+    comp_length_endwinding = LazyMethod(
+        __package__, "..Methods.Machine.Winding.comp_length_endwinding"
+    )
+    comp_Ncspc = LazyMethod(__package__, "..Methods.Machine.Winding.comp_Ncspc")
+    comp_Ntsp = LazyMethod(__package__, "..Methods.Machine.Winding.comp_Ntsp")
+    comp_periodicity = LazyMethod(
+        __package__, "..Methods.Machine.Winding.comp_periodicity"
+    )
+    comp_phasor_angle = LazyMethod(
+        __package__, "..Methods.Machine.Winding.comp_phasor_angle"
+    )
+    comp_winding_factor = LazyMethod(
+        __package__, "..Methods.Machine.Winding.comp_winding_factor"
+    )
+    get_connection_mat = LazyMethod(
+        __package__, "..Methods.Machine.Winding.get_connection_mat"
+    )
+    get_dim_wind = LazyMethod(__package__, "..Methods.Machine.Winding.get_dim_wind")
+    get_periodicity = LazyMethod(
+        __package__, "..Methods.Machine.Winding.get_periodicity"
+    )
+    export_to_csv = LazyMethod(__package__, "..Methods.Machine.Winding.export_to_csv")
+    clean = LazyMethod(__package__, "..Methods.Machine.Winding.clean")
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -936,6 +768,8 @@ class Winding(FrozenClass):
 
     def _get_wind_mat(self):
         """getter of wind_mat"""
+        if isinstance(self._wind_mat, LazyArray):
+            self._wind_mat = self._wind_mat.read()
         return self._wind_mat
 
     def _set_wind_mat(self, value):
@@ -7,32 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import set_array, check_var, raise_
+from ._check import set_array, check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyArray, LazyMethod
 from .Winding import Winding
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.WindingSC.comp_connection_mat import comp_connection_mat
-except ImportError as error:
-    comp_connection_mat = error
-
-try:
-    from ..Methods.Machine.WindingSC.get_dim_wind import get_dim_wind
-except ImportError as error:
-    get_dim_wind = error
-
-try:
-    from ..Methods.Machine.WindingSC.comp_periodicity import comp_periodicity
-except ImportError as error:
-    comp_periodicity = error
-
-
 from numpy import array, array_equal
 from numpy import isnan
 from ._check import InitUnKnowClassError
@@ -44,42 +27,14 @@ class WindingSC(Winding):
     VERSION = 1
     NAME = "short-circuit"
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.WindingSC.comp_connection_mat
-    if isinstance(comp_connection_mat, ImportError):
-        comp_connection_mat = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use WindingSC method comp_connection_mat: "
-                    + str(comp_connection_mat)
-                )
-            )
-        )
-    else:
-        comp_connection_mat = comp_connection_mat
-    # cf Methods.Machine.WindingSC.get_dim_wind
-    if isinstance(get_dim_wind, ImportError):
-        get_dim_wind = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use WindingSC method get_dim_wind: " + str(get_dim_wind)
-                )
-            )
-        )
-    else:
-        get_dim_wind = get_dim_wind
-    # cf Methods.Machine.WindingSC.comp_periodicity
-    if isinstance(comp_periodicity, ImportError):
-        comp_periodicity = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use WindingSC method comp_periodicity: "
-                    + str(comp_periodicity)
-                )
-            )
-        )
-    else:
-        comp_periodicity = comp_periodicity
+    # Methods imported on first use to remove unnecessary dependencies
+    comp_connection_mat = LazyMethod(
+        __package__, "..Methods.Machine.WindingSC.comp_connection_mat"
+    )
+    get_dim_wind = LazyMethod(__package__, "..Methods.Machine.WindingSC.get_dim_wind")
+    comp_periodicity = LazyMethod(
+        __package__, "..Methods.Machine.WindingSC.comp_periodicity"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -7,42 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import set_array, check_var, raise_
+from ._check import set_array, check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyArray, LazyMethod
 from .Winding import Winding
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Machine.WindingUD.init_as_CW1L import init_as_CW1L
-except ImportError as error:
-    init_as_CW1L = error
-
-try:
-    from ..Methods.Machine.WindingUD.init_as_CW2LR import init_as_CW2LR
-except ImportError as error:
-    init_as_CW2LR = error
-
-try:
-    from ..Methods.Machine.WindingUD.init_as_CW2LT import init_as_CW2LT
-except ImportError as error:
-    init_as_CW2LT = error
-
-try:
-    from ..Methods.Machine.WindingUD.init_as_DWL import init_as_DWL
-except ImportError as error:
-    init_as_DWL = error
-
-try:
-    from ..Methods.Machine.WindingUD.import_from_csv import import_from_csv
-except ImportError as error:
-    import_from_csv = error
-
-
 from numpy import array, array_equal
 from numpy import isnan
 from ._check import InitUnKnowClassError
@@ -54,63 +27,14 @@ class WindingUD(Winding):
     VERSION = 1
     NAME = "User defined"
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Machine.WindingUD.init_as_CW1L
-    if isinstance(init_as_CW1L, ImportError):
-        init_as_CW1L = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use WindingUD method init_as_CW1L: " + str(init_as_CW1L)
-                )
-            )
-        )
-    else:
-        init_as_CW1L = init_as_CW1L
-    # cf Methods.Machine.WindingUD.init_as_CW2LR
-    if isinstance(init_as_CW2LR, ImportError):
-        init_as_CW2LR = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use WindingUD method init_as_CW2LR: " + str(init_as_CW2LR)
-                )
-            )
-        )
-    else:
-        init_as_CW2LR = init_as_CW2LR
-    # cf Methods.Machine.WindingUD.init_as_CW2LT
-    if isinstance(init_as_CW2LT, ImportError):
-        init_as_CW2LT = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use WindingUD method init_as_CW2LT: " + str(init_as_CW2LT)
-                )
-            )
-        )
-    else:
-        init_as_CW2LT = init_as_CW2LT
-    # cf Methods.Machine.WindingUD.init_as_DWL
-    if isinstance(init_as_DWL, ImportError):
-        init_as_DWL = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use WindingUD method init_as_DWL: " + str(init_as_DWL)
-                )
-            )
-        )
-    else:
-        init_as_DWL = init_as_DWL
-    # cf Methods.Machine.WindingUD.import_from_csv
-    if isinstance(import_from_csv, ImportError):
-        import_from_csv = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use WindingUD method import_from_csv: "
-                    + str(import_from_csv)
-                )
-            )
-        )
-    else:
-        import_from_csv = import_from_csv
+    # Methods imported on first use to remove unnecessary dependencies
+    init_as_CW1L = LazyMethod(__package__, "..Methods.Machine.WindingUD.init_as_CW1L")
+    init_as_CW2LR = LazyMethod(__package__, "..Methods.Machine.WindingUD.init_as_CW2LR")
+    init_as_CW2LT = LazyMethod(__package__, "..Methods.Machine.WindingUD.init_as_CW2LT")
+    init_as_DWL = LazyMethod(__package__, "..Methods.Machine.WindingUD.init_as_DWL")
+    import_from_csv = LazyMethod(
+        __package__, "..Methods.Machine.WindingUD.import_from_csv"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
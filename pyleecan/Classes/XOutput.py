@@ -7,142 +7,15 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import check_var
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
 from ..Functions.load import load_init_dict
 from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
 from .Output import Output
 
-# Import all class method
-# Try/catch to remove unnecessary dependencies in unused method
-try:
-    from ..Methods.Output.XOutput.__delitem__ import __delitem__
-except ImportError as error:
-    __delitem__ = error
-
-try:
-    from ..Methods.Output.XOutput.__getitem__ import __getitem__
-except ImportError as error:
-    __getitem__ = error
-
-try:
-    from ..Methods.Output.XOutput.__iter__ import __iter__
-except ImportError as error:
-    __iter__ = error
-
-try:
-    from ..Methods.Output.XOutput.__len__ import __len__
-except ImportError as error:
-    __len__ = error
-
-try:
-    from ..Methods.Output.XOutput.__missing__ import __missing__
-except ImportError as error:
-    __missing__ = error
-
-try:
-    from ..Methods.Output.XOutput.__next__ import __next__
-except ImportError as error:
-    __next__ = error
-
-try:
-    from ..Methods.Output.XOutput.__reversed__ import __reversed__
-except ImportError as error:
-    __reversed__ = error
-
-try:
-    from ..Methods.Output.XOutput.__setitem__ import __setitem__
-except ImportError as error:
-    __setitem__ = error
-
-try:
-    from ..Methods.Output.XOutput.append import append
-except ImportError as error:
-    append = error
-
-try:
-    from ..Methods.Output.XOutput.count import count
-except ImportError as error:
-    count = error
-
-try:
-    from ..Methods.Output.XOutput.get_param_simu import get_param_simu
-except ImportError as error:
-    get_param_simu = error
-
-try:
-    from ..Methods.Output.XOutput.get_paramexplorer import get_paramexplorer
-except ImportError as error:
-    get_paramexplorer = error
-
-try:
-    from ..Methods.Output.XOutput.get_pareto_index import get_pareto_index
-except ImportError as error:
-    get_pareto_index = error
-
-try:
-    from ..Methods.Output.XOutput.get_simu import get_simu
-except ImportError as error:
-    get_simu = error
-
-try:
-    from ..Methods.Output.XOutput.get_symbol_list import get_symbol_list
-except ImportError as error:
-    get_symbol_list = error
-
-try:
-    from ..Methods.Output.XOutput.get_xoutput_ref import get_xoutput_ref
-except ImportError as error:
-    get_xoutput_ref = error
-
-try:
-    from ..Methods.Output.XOutput.insert import insert
-except ImportError as error:
-    insert = error
-
-try:
-    from ..Methods.Output.XOutput.items import items
-except ImportError as error:
-    items = error
-
-try:
-    from ..Methods.Output.XOutput.keys import keys
-except ImportError as error:
-    keys = error
-
-try:
-    from ..Methods.Output.XOutput.plot_generation import plot_generation
-except ImportError as error:
-    plot_generation = error
-
-try:
-    from ..Methods.Output.XOutput.plot_multi import plot_multi
-except ImportError as error:
-    plot_multi = error
-
-try:
-    from ..Methods.Output.XOutput.plot_pareto import plot_pareto
-except ImportError as error:
-    plot_pareto = error
-
-try:
-    from ..Methods.Output.XOutput.pop import pop
-except ImportError as error:
-    pop = error
-
-try:
-    from ..Methods.Output.XOutput.print_memory import print_memory
-except ImportError as error:
-    print_memory = error
-
-try:
-    from ..Methods.Output.XOutput.remove import remove
-except ImportError as error:
-    remove = error
-
-
 from numpy import isnan
 from ._check import InitUnKnowClassError
 
@@ -152,250 +25,45 @@ class XOutput(Output):
 
     VERSION = 1
 
-    # Check ImportError to remove unnecessary dependencies in unused method
-    # cf Methods.Output.XOutput.__delitem__
-    if isinstance(__delitem__, ImportError):
-        __delitem__ = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use XOutput method __delitem__: " + str(__delitem__))
-            )
-        )
-    else:
-        __delitem__ = __delitem__
-    # cf Methods.Output.XOutput.__getitem__
-    if isinstance(__getitem__, ImportError):
-        __getitem__ = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use XOutput method __getitem__: " + str(__getitem__))
-            )
-        )
-    else:
-        __getitem__ = __getitem__
-    # cf Methods.Output.XOutput.__iter__
-    if isinstance(__iter__, ImportError):
-        __iter__ = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use XOutput method __iter__: " + str(__iter__))
-            )
-        )
-    else:
-        __iter__ = __iter__
-    # cf Methods.Output.XOutput.__len__
-    if isinstance(__len__, ImportError):
-        __len__ = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use XOutput method __len__: " + str(__len__))
-            )
-        )
-    else:
-        __len__ = __len__
-    # cf Methods.Output.XOutput.__missing__
-    if isinstance(__missing__, ImportError):
-        __missing__ = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use XOutput method __missing__: " + str(__missing__))
-            )
-        )
-    else:
-        __missing__ = __missing__
-    # cf Methods.Output.XOutput.__next__
-    if isinstance(__next__, ImportError):
-        __next__ = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use XOutput method __next__: " + str(__next__))
-            )
-        )
-    else:
-        __next__ = __next__
-    # cf Methods.Output.XOutput.__reversed__
-    if isinstance(__reversed__, ImportError):
-        __reversed__ = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use XOutput method __reversed__: " + str(__reversed__)
-                )
-            )
-        )
-    else:
-        __reversed__ = __reversed__
-    # cf Methods.Output.XOutput.__setitem__
-    if isinstance(__setitem__, ImportError):
-        __setitem__ = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use XOutput method __setitem__: " + str(__setitem__))
-            )
-        )
-    else:
-        __setitem__ = __setitem__
-    # cf Methods.Output.XOutput.append
-    if isinstance(append, ImportError):
-        append = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use XOutput method append: " + str(append))
-            )
-        )
-    else:
-        append = append
-    # cf Methods.Output.XOutput.count
-    if isinstance(count, ImportError):
-        count = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use XOutput method count: " + str(count))
-            )
-        )
-    else:
-        count = count
-    # cf Methods.Output.XOutput.get_param_simu
-    if isinstance(get_param_simu, ImportError):
-        get_param_simu = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use XOutput method get_param_simu: " + str(get_param_simu)
-                )
-            )
-        )
-    else:
-        get_param_simu = get_param_simu
-    # cf Methods.Output.XOutput.get_paramexplorer
-    if isinstance(get_paramexplorer, ImportError):
-        get_paramexplorer = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use XOutput method get_paramexplorer: "
-                    + str(get_paramexplorer)
-                )
-            )
-        )
-    else:
-        get_paramexplorer = get_paramexplorer
-    # cf Methods.Output.XOutput.get_pareto_index
-    if isinstance(get_pareto_index, ImportError):
-        get_pareto_index = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use XOutput method get_pareto_index: "
-                    + str(get_pareto_index)
-                )
-            )
-        )
-    else:
-        get_pareto_index = get_pareto_index
-    # cf Methods.Output.XOutput.get_simu
-    if isinstance(get_simu, ImportError):
-        get_simu = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use XOutput method get_simu: " + str(get_simu))
-            )
-        )
-    else:
-        get_simu = get_simu
-    # cf Methods.Output.XOutput.get_symbol_list
-    if isinstance(get_symbol_list, ImportError):
-        get_symbol_list = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use XOutput method get_symbol_list: " + str(get_symbol_list)
-                )
-            )
-        )
-    else:
-        get_symbol_list = get_symbol_list
-    # cf Methods.Output.XOutput.get_xoutput_ref
-    if isinstance(get_xoutput_ref, ImportError):
-        get_xoutput_ref = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use XOutput method get_xoutput_ref: " + str(get_xoutput_ref)
-                )
-            )
-        )
-    else:
-        get_xoutput_ref = get_xoutput_ref
-    # cf Methods.Output.XOutput.insert
-    if isinstance(insert, ImportError):
-        insert = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use XOutput method insert: " + str(insert))
-            )
-        )
-    else:
-        insert = insert
-    # cf Methods.Output.XOutput.items
-    if isinstance(items, ImportError):
-        items = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use XOutput method items: " + str(items))
-            )
-        )
-    else:
-        items = items
-    # cf Methods.Output.XOutput.keys
-    if isinstance(keys, ImportError):
-        keys = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use XOutput method keys: " + str(keys))
-            )
-        )
-    else:
-        keys = keys
-    # cf Methods.Output.XOutput.plot_generation
-    if isinstance(plot_generation, ImportError):
-        plot_generation = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use XOutput method plot_generation: " + str(plot_generation)
-                )
-            )
-        )
-    else:
-        plot_generation = plot_generation
-    # cf Methods.Output.XOutput.plot_multi
-    if isinstance(plot_multi, ImportError):
-        plot_multi = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use XOutput method plot_multi: " + str(plot_multi))
-            )
-        )
-    else:
-        plot_multi = plot_multi
-    # cf Methods.Output.XOutput.plot_pareto
-    if isinstance(plot_pareto, ImportError):
-        plot_pareto = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use XOutput method plot_pareto: " + str(plot_pareto))
-            )
-        )
-    else:
-        plot_pareto = plot_pareto
-    # cf Methods.Output.XOutput.pop
-    if isinstance(pop, ImportError):
-        pop = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use XOutput method pop: " + str(pop))
-            )
-        )
-    else:
-        pop = pop
-    # cf Methods.Output.XOutput.print_memory
-    if isinstance(print_memory, ImportError):
-        print_memory = property(
-            fget=lambda x: raise_(
-                ImportError(
-                    "Can't use XOutput method print_memory: " + str(print_memory)
-                )
-            )
-        )
-    else:
-        print_memory = print_memory
-    # cf Methods.Output.XOutput.remove
-    if isinstance(remove, ImportError):
-        remove = property(
-            fget=lambda x: raise_(
-                ImportError("Can't use XOutput method remove: " + str(remove))
-            )
-        )
-    else:
-        remove = remove
+    # Methods imported on first use to remove unnecessary dependencies
+    __delitem__ = LazyMethod(__package__, "..Methods.Output.XOutput.__delitem__")
+    __getitem__ = LazyMethod(__package__, "..Methods.Output.XOutput.__getitem__")
+    __iter__ = LazyMethod(__package__, "..Methods.Output.XOutput.__iter__")
+    __len__ = LazyMethod(__package__, "..Methods.Output.XOutput.__len__")
+    __missing__ = LazyMethod(__package__, "..Methods.Output.XOutput.__missing__")
+    __next__ = LazyMethod(__package__, "..Methods.Output.XOutput.__next__")
+    __reversed__ = LazyMethod(__package__, "..Methods.Output.XOutput.__reversed__")
+    __setitem__ = LazyMethod(__package__, "..Methods.Output.XOutput.__setitem__")
+    append = LazyMethod(__package__, "..Methods.Output.XOutput.append")
+    count = LazyMethod(__package__, "..Methods.Output.XOutput.count")
+    get_param_simu = LazyMethod(__package__, "..Methods.Output.XOutput.get_param_simu")
+    get_paramexplorer = LazyMethod(
+        __package__, "..Methods.Output.XOutput.get_paramexplorer"
+    )
+    get_pareto_index = LazyMethod(
+        __package__, "..Methods.Output.XOutput.get_pareto_index"
+    )
+    get_simu = LazyMethod(__package__, "..Methods.Output.XOutput.get_simu")
+    get_symbol_list = LazyMethod(
+        __package__, "..Methods.Output.XOutput.get_symbol_list"
+    )
+    get_xoutput_ref = LazyMethod(
+        __package__, "..Methods.Output.XOutput.get_xoutput_ref"
+    )
+    insert = LazyMethod(__package__, "..Methods.Output.XOutput.insert")
+    items = LazyMethod(__package__, "..Methods.Output.XOutput.items")
+    keys = LazyMethod(__package__, "..Methods.Output.XOutput.keys")
+    plot_generation = LazyMethod(
+        __package__, "..Methods.Output.XOutput.plot_generation"
+    )
+    plot_multi = LazyMethod(__package__, "..Methods.Output.XOutput.plot_multi")
+    plot_pareto = LazyMethod(__package__, "..Methods.Output.XOutput.plot_pareto")
+    pop = LazyMethod(__package__, "..Methods.Output.XOutput.pop")
+    print_memory = LazyMethod(__package__, "..Methods.Output.XOutput.print_memory")
+    remove = LazyMethod(__package__, "..Methods.Output.XOutput.remove")
+    get_pareto_rank = LazyMethod(
+        __package__, "..Methods.Output.XOutput.get_pareto_rank"
+    )
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+# File generated according to Generator/ClassesRef/Output/XOutputStore.csv
+# WARNING! All changes made in this file will be lost!
+"""Method code available at https://github.com/Eomys/pyleecan/tree/master/pyleecan/Methods/Output/XOutputStore
+"""
+
+from os import linesep
+from sys import getsizeof
+from logging import getLogger
+from ._check import check_var
+from ..Functions.get_logger import get_logger
+from ..Functions.save import save
+from ..Functions.copy import copy
+from ..Functions.load import load_init_dict
+from ..Functions.Load.import_class import import_class
+from ._lazy import LazyMethod
+from ._frozen import FrozenClass
+
+from numpy import isnan
+from ._check import InitUnKnowClassError
+
+
+class XOutputStore(FrozenClass):
+    """Append-mode hdf5 store of the results of a multi-simulation (VarSimu) or an optimization: the results of each step are written as soon as the step is done"""
+
+    VERSION = 1
+
+    # Methods imported on first use to remove unnecessary dependencies
+    init_file = LazyMethod(__package__, "..Methods.Output.XOutputStore.init_file")
+    add_step = LazyMethod(__package__, "..Methods.Output.XOutputStore.add_step")
+    get_step_index = LazyMethod(
+        __package__, "..Methods.Output.XOutputStore.get_step_index"
+    )
+    get_step = LazyMethod(__package__, "..Methods.Output.XOutputStore.get_step")
+    get_xoutput = LazyMethod(__package__, "..Methods.Output.XOutputStore.get_xoutput")
+    # save and copy methods are available in all object
+    save = save
+    copy = copy
+    # get_logger method is available in all object
+    get_logger = get_logger
+
+    def __init__(
+        self,
+        save_path="",
+        is_save_output=False,
+        is_restart=False,
+        type_compression=0,
+        init_dict=None,
+        init_str=None,
+    ):
+        """Constructor of the class. Can be use in three ways :
+        - __init__ (arg1 = 1, arg3 = 5) every parameters have name and default values
+            for pyleecan type, -1 will call the default constructor
+        - __init__ (init_dict = d) d must be a dictionary with property names as keys
+        - __init__ (init_str = s) s must be a string
+        s is the file path to load
+
+        ndarray or list can be given for Vector and Matrix
+        object or dict can be given for pyleecan Object"""
+
+        if init_str is not None:  # Load from a file
+            init_dict = load_init_dict(init_str)[1]
+        if init_dict is not None:  # Initialisation by dict
+            assert type(init_dict) is dict
+            # Overwrite default value with init_dict content
+            if "save_path" in list(init_dict.keys()):
+                save_path = init_dict["save_path"]
+            if "is_save_output" in list(init_dict.keys()):
+                is_save_output = init_dict["is_save_output"]
+            if "is_restart" in list(init_dict.keys()):
+                is_restart = init_dict["is_restart"]
+            if "type_compression" in list(init_dict.keys()):
+                type_compression = init_dict["type_compression"]
+        # Set the properties (value check and convertion are done in setter)
+        self.parent = None
+        self.save_path = save_path
+        self.is_save_output = is_save_output
+        self.is_restart = is_restart
+        self.type_compression = type_compression
+
+        # The class is frozen, for now it's impossible to add new properties
+        self._freeze()
+
+    def __str__(self):
+        """Convert this object in a readeable string (for print)"""
+
+        XOutputStore_str = ""
+        if self.parent is None:
+            XOutputStore_str += "parent = None " + linesep
+        else:
+            XOutputStore_str += (
+                "parent = " + str(type(self.parent)) + " object" + linesep
+            )
+        XOutputStore_str += 'save_path = "' + str(self.save_path) + '"' + linesep
+        XOutputStore_str += "is_save_output = " + str(self.is_save_output) + linesep
+        XOutputStore_str += "is_restart = " + str(self.is_restart) + linesep
+        XOutputStore_str += "type_compression = " + str(self.type_compression) + linesep
+        return XOutputStore_str
+
+    def __eq__(self, other):
+        """Compare two objects (skip parent)"""
+
+        if type(other) != type(self):
+            return False
+        if other.save_path != self.save_path:
+            return False
+        if other.is_save_output != self.is_save_output:
+            return False
+        if other.is_restart != self.is_restart:
+            return False
+        if other.type_compression != self.type_compression:
+            return False
+        return True
+
+    def compare(self, other, name="self", ignore_list=None, is_add_value=False):
+        """Compare two objects and return list of differences"""
+
+        if ignore_list is None:
+            ignore_list = list()
+        if type(other) != type(self):
+            return ["type(" + name + ")"]
+        diff_list = list()
+        if other._save_path != self._save_path:
+            if is_add_value:
+                val_str = (
+                    " (self="
+                    + str(self._save_path)
+                    + ", other="
+                    + str(other._save_path)
+                    + ")"
+                )
+                diff_list.append(name + ".save_path" + val_str)
+            else:
+                diff_list.append(name + ".save_path")
+        if other._is_save_output != self._is_save_output:
+            if is_add_value:
+                val_str = (
+                    " (self="
+                    + str(self._is_save_output)
+                    + ", other="
+                    + str(other._is_save_output)
+                    + ")"
+                )
+                diff_list.append(name + ".is_save_output" + val_str)
+            else:
+                diff_list.append(name + ".is_save_output")
+        if other._is_restart != self._is_restart:
+            if is_add_value:
+                val_str = (
+                    " (self="
+                    + str(self._is_restart)
+                    + ", other="
+                    + str(other._is_restart)
+                    + ")"
+                )
+                diff_list.append(name + ".is_restart" + val_str)
+            else:
+                diff_list.append(name + ".is_restart")
+        if other._type_compression != self._type_compression:
+            if is_add_value:
+                val_str = (
+                    " (self="
+                    + str(self._type_compression)
+                    + ", other="
+                    + str(other._type_compression)
+                    + ")"
+                )
+                diff_list.append(name + ".type_compression" + val_str)
+            else:
+                diff_list.append(name + ".type_compression")
+        # Filter ignore differences
+        diff_list = list(filter(lambda x: x not in ignore_list, diff_list))
+        return diff_list
+
+    def __sizeof__(self):
+        """Return the size in memory of the object (including all subobject)"""
+
+        S = 0  # Full size of the object
+        S += getsizeof(self.save_path)
+        S += getsizeof(self.is_save_output)
+        S += getsizeof(self.is_restart)
+        S += getsizeof(self.type_compression)
+        return S
+
+    def as_dict(self, type_handle_ndarray=0, keep_function=False, **kwargs):
+        """
+        Convert this object in a json serializable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        keep_function : bool
+            True to keep the function object, else return str
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
+
+        XOutputStore_dict = dict()
+        XOutputStore_dict["save_path"] = self.save_path
+        XOutputStore_dict["is_save_output"] = self.is_save_output
+        XOutputStore_dict["is_restart"] = self.is_restart
+        XOutputStore_dict["type_compression"] = self.type_compression
+        # The class name is added to the dict for deserialisation purpose
+        XOutputStore_dict["__class__"] = "XOutputStore"
+        return XOutputStore_dict
+
+    def _set_None(self):
+        """Set all the properties to None (except pyleecan object)"""
+
+        self.save_path = None
+        self.is_save_output = None
+        self.is_restart = None
+        self.type_compression = None
+
+    def _get_save_path(self):
+        """getter of save_path"""
+        return self._save_path
+
+    def _set_save_path(self, value):
+        """setter of save_path"""
+        check_var("save_path", value, "str")
+        self._save_path = value
+
+    save_path = property(
+        fget=_get_save_path,
+        fset=_set_save_path,
+        doc=u"""Path of the hdf5 file to store the results of the multi-simulation steps
+
+        :Type: str
+        """,
+    )
+
+    def _get_is_save_output(self):
+        """getter of is_save_output"""
+        return self._is_save_output
+
+    def _set_is_save_output(self, value):
+        """setter of is_save_output"""
+        check_var("is_save_output", value, "bool")
+        self._is_save_output = value
+
+    is_save_output = property(
+        fget=_get_is_save_output,
+        fset=_set_is_save_output,
+        doc=u"""True to save the Output of each step (else only the DataKeeper results are saved)
+
+        :Type: bool
+        """,
+    )
+
+    def _get_is_restart(self):
+        """getter of is_restart"""
+        return self._is_restart
+
+    def _set_is_restart(self, value):
+        """setter of is_restart"""
+        check_var("is_restart", value, "bool")
+        self._is_restart = value
+
+    is_restart = property(
+        fget=_get_is_restart,
+        fset=_set_is_restart,
+        doc=u"""True to keep the steps already in the file and skip them (to resume an interrupted run), else the file is overwritten at the beginning of the run
+
+        :Type: bool
+        """,
+    )
+
+    def _get_type_compression(self):
+        """getter of type_compression"""
+        return self._type_compression
+
+    def _set_type_compression(self, value):
+        """setter of type_compression"""
+        check_var("type_compression", value, "int", Vmin=0, Vmax=1)
+        self._type_compression = value
+
+    type_compression = property(
+        fget=_get_type_compression,
+        fset=_set_type_compression,
+        doc=u"""Compression of the big arrays of the saved Output (0: no compression, 1: gzip)
+
+        :Type: int
+        :min: 0
+        :max: 1
+        """,
+    )
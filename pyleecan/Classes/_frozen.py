@@ -50,6 +50,59 @@ class FrozenClass(object):
 
         self.__isfrozen = True
 
+    def _get_cache(self):
+        """Return the dict used by the methods of the object to store computed
+        data (interpolators, geometry...). The cache is not a property: it is not
+        saved, copied, compared or pickled.
+
+        Parameters
+        ----------
+        self : FrozenClass
+            A FrozenClass object
+
+        Returns
+        -------
+        cache_dict : dict
+            Cache of the object
+        """
+
+        if "_cache_dict" not in self.__dict__:
+            object.__setattr__(self, "_cache_dict", dict())
+        return self.__dict__["_cache_dict"]
+
+    def _clear_cache(self):
+        """Remove all the data stored in the cache of the object
+
+        Parameters
+        ----------
+        self : FrozenClass
+            A FrozenClass object
+
+        Returns
+        -------
+        None
+        """
+
+        self.__dict__.pop("_cache_dict", None)
+
+    def __getstate__(self):
+        """Remove the cache from the pickled state
+
+        Parameters
+        ----------
+        self : FrozenClass
+            A FrozenClass object
+
+        Returns
+        -------
+        state : dict
+            State of the object to pickle
+        """
+
+        state = self.__dict__.copy()
+        state.pop("_cache_dict", None)
+        return state
+
     def __eq__(self, other):
         """Two FrozenClass instance are equal if they have the same __dict__
 
@@ -68,6 +121,8 @@ class FrozenClass(object):
 
         if isinstance(other, self.__class__):
             for attr in self.__dict__:
+                if attr == "_cache_dict":
+                    continue
                 if isinstance(self.__dict__[attr], ndarray):
                     if not array_equal(self.__dict__[attr], other.__dict__[attr]):
                         return False
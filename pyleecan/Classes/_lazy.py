@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+from collections.abc import Mapping
+from importlib import import_module
+from importlib.util import resolve_name
+
+
+class LazyMethod(object):
+    """Method of a generated class imported on first use: the method module
+    (and its dependencies) is imported on the first access to the method, then
+    the function replaces the LazyMethod in the class
+    """
+
+    def __init__(self, package, module_name):
+        """Create the method to import on first use
+
+        Parameters
+        ----------
+        package : str
+            Package of the class module (to resolve module_name)
+        module_name : str
+            Relative name of the method module (the method has the name of
+            the last part of the module name)
+        """
+        self.package = package
+        self.module_name = module_name
+        self.meth_name = module_name.split(".")[-1]
+        self.owner = None
+        self.name = self.meth_name
+
+    def __set_name__(self, owner, name):
+        self.owner = owner
+        self.name = name
+
+    def load(self):
+        """Import the method and replace the LazyMethod in the class
+
+        Returns
+        -------
+        meth : function
+            Method of the class
+
+        Raises
+        ------
+        ImportError
+            The method (or one of its dependencies) can't be imported
+        """
+        owner_name = "" if self.owner is None else self.owner.__name__
+        try:
+            module = import_module(self.module_name, package=self.package)
+        except ImportError as error:
+            raise ImportError(
+                "Can't use "
+                + owner_name
+                + " method "
+                + self.meth_name
+                + ": "
+                + str(error)
+            ) from error
+        meth = getattr(module, self.meth_name)
+        if self.owner is not None and self.owner.__dict__.get(self.name) is self:
+            setattr(self.owner, self.name, meth)
+        return meth
+
+    def __get__(self, obj, objtype=None):
+        meth = self.load()
+        if obj is None or not hasattr(meth, "__get__"):
+            return meth
+        return meth.__get__(obj, objtype)
+
+    def __call__(self, *args, **kwargs):
+        # Methods used in the class body (for instance property setters)
+        return self.load()(*args, **kwargs)
+
+    def __repr__(self):
+        return (
+            "<LazyMethod "
+            + self.name
+            + " ("
+            + resolve_name(self.module_name, self.package)
+            + ", not imported)>"
+        )
+
+
+class LazyArray(object):
+    """Array of a file read on first access (cf H5Array): the getters of the
+    ndarray properties of the generated classes replace it by its values, so
+    the objects only return ndarray. The file must be available until the
+    array is read.
+    """
+
+    def read(self):
+        """Read the array (only on the first call)
+
+        Returns
+        -------
+        value: ndarray
+            Values of the array
+        """
+        raise NotImplementedError(type(self).__name__ + " must define read")
+
+
+class LazyClassDict(Mapping):
+    """Dict {class name: class} of the generated classes: each class module is
+    imported on the first access to the class
+    """
+
+    def __init__(self, package, class_name_list):
+        """Create the dict of the classes to import on first access
+
+        Parameters
+        ----------
+        package : str
+            Package of the class modules (one module per class)
+        class_name_list : list
+            Name of the classes
+        """
+        self.package = package
+        self.class_dict = dict.fromkeys(class_name_list)
+
+    def __getitem__(self, class_name):
+        cls = self.class_dict[class_name]
+        if cls is None:
+            module = import_module(self.package + "." + class_name)
+            cls = self.class_dict[class_name] = getattr(module, class_name)
+        return cls
+
+    def __contains__(self, class_name):
+        return class_name in self.class_dict
+
+    def __iter__(self):
+        return iter(self.class_dict)
+
+    def __len__(self):
+        return len(self.class_dict)
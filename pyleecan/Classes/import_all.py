@@ -89,6 +89,7 @@ from ..Classes.LamSquirrelCage import LamSquirrelCage
 from ..Classes.LamSquirrelCageMag import LamSquirrelCageMag
 from ..Classes.Lamination import Lamination
 from ..Classes.Line import Line
+from ..Classes.LineBatch import LineBatch
 from ..Classes.Loss import Loss
 from ..Classes.LossFEMM import LossFEMM
 from ..Classes.LossModel import LossModel
@@ -109,6 +110,7 @@ from ..Classes.MachineUD import MachineUD
 from ..Classes.MachineWRSM import MachineWRSM
 from ..Classes.MagElmer import MagElmer
 from ..Classes.MagFEMM import MagFEMM
+from ..Classes.MagPMMF import MagPMMF
 from ..Classes.Magnet import Magnet
 from ..Classes.Magnetics import Magnetics
 from ..Classes.MatEconomical import MatEconomical
@@ -137,6 +139,7 @@ from ..Classes.OptiBayesAlg import OptiBayesAlg
 from ..Classes.OptiBayesAlgSmoot import OptiBayesAlgSmoot
 from ..Classes.OptiConstraint import OptiConstraint
 from ..Classes.OptiDesignVar import OptiDesignVar
+from ..Classes.OptiEvalCache import OptiEvalCache
 from ..Classes.OptiGenAlg import OptiGenAlg
 from ..Classes.OptiGenAlgNsga2Deap import OptiGenAlgNsga2Deap
 from ..Classes.OptiObjective import OptiObjective
@@ -237,3 +240,4 @@ from ..Classes.Winding import Winding
 from ..Classes.WindingSC import WindingSC
 from ..Classes.WindingUD import WindingUD
 from ..Classes.XOutput import XOutput
+from ..Classes.XOutputStore import XOutputStore
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from ...Classes.LineBatch import LineBatch
+from ...Methods.Geometry.LineBatch import LINE_TYPE_LIST
+
+# Minimum number of lines to discretize with a LineBatch (below, the lines are
+# faster one by one)
+NB_LINE_BATCH_MIN = 8
+
+
+def is_line_batch(line_list):
+    """Return True if the lines are worth discretizing with a LineBatch: enough
+    lines and only Segment, Arc1, Arc2 and Arc3 (the other lines are
+    discretized by their own methods)
+
+    Parameters
+    ----------
+    line_list : list
+        List of lines
+
+    Returns
+    -------
+    is_batch : bool
+        True to use a LineBatch
+    """
+
+    return len(line_list) >= NB_LINE_BATCH_MIN and all(
+        type(line).__name__ in LINE_TYPE_LIST for line in line_list
+    )
+
+
+def get_line_batch(line_list):
+    """Create a LineBatch from a list of lines (Segment, Arc1, Arc2, Arc3):
+    the properties of the lines are read once and the centers, ends and angles
+    of the arcs are computed for all the lines at once
+
+    Parameters
+    ----------
+    line_list : list
+        List of lines
+
+    Returns
+    -------
+    batch : LineBatch
+        Batch of the lines (in the same order)
+    """
+
+    N = len(line_list)
+    line_type = np.zeros(N, dtype=int)
+    begin = np.zeros(N, dtype=complex)
+    end = np.zeros(N, dtype=complex)
+    center = np.zeros(N, dtype=complex)
+    radius = np.zeros(N, dtype=float)
+    angle = np.zeros(N, dtype=float)
+    is_trigo = np.zeros(N, dtype=bool)
+    for ii, line in enumerate(line_list):
+        name = type(line).__name__
+        if name not in LINE_TYPE_LIST:
+            raise NotImplementedError(
+                "get_line_batch: " + name + " lines are not available in LineBatch"
+            )
+        line_type[ii] = LINE_TYPE_LIST.index(name)
+        begin[ii] = line.begin
+        if name == "Arc2":
+            center[ii] = line.center
+            angle[ii] = line.angle
+        else:
+            end[ii] = line.end
+            if name == "Arc1":
+                radius[ii] = line.radius
+            if name != "Segment":
+                is_trigo[ii] = line.is_trigo_direction
+
+    # Arc1: center on the bisection of [begin, end] (cf Arc1.get_center)
+    ind = np.nonzero(line_type == 1)[0]
+    if ind.size > 0:
+        Z1, Z2, R = begin[ind], end[ind], radius[ind]
+        D12 = np.abs(Z2 - Z1)
+        with np.errstate(invalid="ignore"):
+            H = np.where(R > 0, 1, -1) * np.sqrt(R ** 2 - (D12 / 2) ** 2)
+        Zc = np.where(
+            np.abs(D12 - np.abs(2 * R)) < 1e-6,
+            (Z2 + Z1) / 2.0,
+            (D12 / 2 + 1j * H) * np.exp(1j * np.angle(Z2 - Z1)) + Z1,
+        )
+        Zc[np.abs(Zc) < 1e-6] = 0
+        center[ind] = Zc
+        # Signed angle according to the direction (cf Arc1.get_angle)
+        a = np.angle((Z2 - Zc) * np.exp(-1j * np.angle(Z1 - Zc)))
+        trigo = is_trigo[ind]
+        angle[ind] = np.select(
+            [
+                (a > 0) & trigo,
+                (a > 0) & ~trigo,
+                (a < 0) & trigo,
+                (a < 0) & ~trigo,
+                trigo,
+            ],
+            [a, -(2 * np.pi - a), 2 * np.pi - np.abs(a), a, np.abs(a)],
+            -np.abs(a),
+        )
+
+    # Arc2: end from the center and the angle (cf Arc2.get_end)
+    ind = np.nonzero(line_type == 2)[0]
+    if ind.size > 0:
+        Z2 = (begin[ind] - center[ind]) * np.exp(1j * angle[ind]) + center[ind]
+        Z2[np.abs(Z2) < 1e-6] = 0
+        end[ind] = Z2
+        radius[ind] = np.abs(begin[ind] - center[ind])
+
+    # Arc3: half circle (cf Arc3.get_center)
+    ind = np.nonzero(line_type == 3)[0]
+    if ind.size > 0:
+        Zc = (begin[ind] + end[ind]) / 2.0
+        Zc[np.abs(Zc) < 1e-6] = 0
+        center[ind] = Zc
+        radius[ind] = np.abs(begin[ind] - Zc)
+        angle[ind] = np.where(is_trigo[ind], np.pi, -np.pi)
+
+    return LineBatch(
+        begin=begin,
+        end=end,
+        center=center,
+        radius=radius,
+        angle=angle,
+        line_type=line_type,
+        prop_dict=[line.prop_dict for line in line_list],
+    )
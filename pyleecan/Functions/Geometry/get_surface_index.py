@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from .is_inside_polyline import is_inside_polyline
+
+
+def get_surface_index(surf_list, Z, if_online=False):
+    """Find the surface containing each point (for instance among the surfaces
+    of Lamination.build_geometry)
+
+    Parameters
+    ----------
+    surf_list : list
+        List of Surface objects
+    Z : ndarray
+        Complex coordinates of the points (any shape)
+    if_online : bool
+        True to consider the points on the lines as in the surfaces
+
+    Returns
+    -------
+    surf_index : ndarray
+        Index in surf_list of the first surface containing each point, -1 if
+        the point is in none of the surfaces (same shape as Z)
+    """
+
+    Z = np.asarray(Z, dtype=complex)
+    surf_index = np.full(Z.shape, -1, dtype=int)
+    is_left = np.ones(Z.shape, dtype=bool)
+    for ii, surf in enumerate(surf_list):
+        if not np.any(is_left):
+            break
+        is_in = is_inside_polyline(Z[is_left], surf.get_polyline(), if_online=if_online)
+        ind = np.nonzero(is_left)
+        ind = tuple(idx[is_in] for idx in ind)
+        surf_index[ind] = ii
+        is_left[ind] = False
+    return surf_index
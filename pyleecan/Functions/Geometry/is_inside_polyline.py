@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+# Maximum number of (point, chord) pairs computed at once
+NB_PAIR_MAX = 2 ** 21
+
+
+def is_inside_polyline(Z, polyline, if_online=False, tol=None):
+    """Determine which points are inside the closed curves described by a
+    polyline (cf Surface.get_polyline) with the even-odd rule: the parity of
+    the crossings of an horizontal ray with the chords is corrected by the
+    circular segments between the chords and the arcs, so the arcs are handled
+    exactly.
+
+    Parameters
+    ----------
+    Z : ndarray
+        Complex coordinates of the points (any shape)
+    polyline : dict
+        Polyline of the surface (cf Surface.get_polyline)
+    if_online : bool
+        True to consider the points on the lines as in the surface
+    tol : float
+        Distance under which a point is on a line (default: 1e-9 times the
+        size of the polyline)
+
+    Returns
+    -------
+    is_inside : ndarray
+        Boolean mask of the points inside the surface (same shape as Z)
+    """
+
+    Z = np.asarray(Z, dtype=complex)
+    shape = Z.shape
+    Z = Z.ravel()
+    A, B = polyline["begin"], polyline["end"]
+    is_arc = polyline["is_arc"]
+    Zc, R, alpha = polyline["center"], polyline["radius"], polyline["angle"]
+    if A.size == 0 or Z.size == 0:
+        return np.zeros(shape, dtype=bool)
+
+    if tol is None:
+        Zall = np.concatenate((A, B))
+        tol = 1e-9 * max(np.ptp(Zall.real), np.ptp(Zall.imag))
+    AB = B - A
+    AB2 = np.abs(AB) ** 2
+    # Middle of the sub-arcs (side of the circular segment)
+    M = Zc + (A - Zc) * np.exp(0.5j * alpha)
+    side_M = np.sign(cross(AB, M - A))
+
+    # Each chord is only compared to the points in its horizontal band: the
+    # arcs are closer to their chord than the sagitta of the sub-arcs
+    margin = R * (1 - np.cos(alpha / 2)) + tol
+    y_min = np.minimum(A.imag, B.imag) - margin
+    y_max = np.maximum(A.imag, B.imag) + margin
+    order = np.argsort(Z.imag, kind="stable")
+    y_sort = Z.imag[order]
+    start = np.searchsorted(y_sort, y_min, side="left")
+    count = np.searchsorted(y_sort, y_max, side="right") - start
+
+    # Number of crossings and of circular segments containing the points
+    nb_cross = np.zeros(Z.size, dtype=int)
+    is_online = np.zeros(Z.size, dtype=bool)
+    count_cum = np.cumsum(count)
+    bound = np.searchsorted(
+        count_cum, np.arange(0, count_cum[-1], NB_PAIR_MAX), side="right"
+    )
+    for ii, jj in zip(bound, np.append(bound[1:], A.size)):
+        # Pairs (chord, point) of the chords ii to jj
+        Nc = count[ii:jj]
+        chord = np.repeat(np.arange(ii, jj), Nc)
+        offset = np.repeat(start[ii:jj] - np.cumsum(Nc) + Nc, Nc)
+        point = order[np.arange(chord.size) + offset]
+        P = Z[point]
+        Ap, Bp, ABp = A[chord], B[chord], AB[chord]
+
+        # Crossings of the horizontal ray [P, +inf[ with the chords
+        is_cross = (Ap.imag > P.imag) != (Bp.imag > P.imag)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_inter = Ap.real + (P.imag - Ap.imag) * ABp.real / ABp.imag
+        is_cross &= P.real < x_inter
+
+        # Distance to the chords
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.clip(((P - Ap) * ABp.conj()).real / AB2[chord], 0, 1)
+        dist = np.abs(P - (Ap + np.nan_to_num(t) * ABp))
+
+        is_pair_arc = is_arc[chord]
+        if np.any(is_pair_arc):
+            ind = np.nonzero(is_pair_arc)[0]
+            arc = chord[ind]
+            Pc = P[ind] - Zc[arc]
+            # Points in the circular segments between the chords and the arcs
+            is_cross[ind] ^= (np.abs(Pc) < R[arc]) & (
+                np.sign(cross(ABp[ind], P[ind] - Ap[ind])) == side_M[arc]
+            )
+            # Distance to the arcs
+            theta = np.angle(Pc * (A[arc] - Zc[arc]).conj()) * np.sign(alpha[arc])
+            dist[ind] = np.where(
+                (theta >= 0) & (theta <= np.abs(alpha[arc])),
+                np.abs(np.abs(Pc) - R[arc]),
+                np.minimum(np.abs(P[ind] - Ap[ind]), np.abs(P[ind] - Bp[ind])),
+            )
+
+        nb_cross += np.bincount(point[is_cross], minlength=Z.size)
+        is_online[point[dist <= tol]] = True
+
+    is_inside = np.where(is_online, if_online, nb_cross % 2 == 1)
+
+    return is_inside.reshape(shape)
+
+
+def cross(Z1, Z2):
+    """Cross product of the vectors defined by their complex coordinates"""
+    return Z1.real * Z2.imag - Z1.imag * Z2.real
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+from ...Classes.Hole import Hole
+from ...Classes.Slot import Slot
+
+
+def is_surface_num(lam):
+    """Check if some surfaces of a lamination are computed from the geometry
+    (build the surfaces of a slot, notch or hole and sum their areas) instead
+    of an analytical formula of the slot or hole type
+
+    Parameters
+    ----------
+    lam : Lamination
+        A Lamination object
+
+    Returns
+    -------
+    is_num : bool
+        True if a slot, notch or hole surface is computed from the geometry
+    """
+
+    obj_list = list()
+    if getattr(lam, "slot", None) is not None:
+        obj_list.append(lam.slot)
+    obj_list.extend(getattr(lam, "slot_list", None) or list())
+    obj_list.extend(getattr(lam, "hole", None) or list())
+    for notch in (lam.notch or list()) + (lam.yoke_notch or list()):
+        obj_list.append(notch.notch_shape)
+
+    for obj_type in set(type(obj) for obj in obj_list):
+        if obj_type.comp_surface in (Slot.comp_surface, Hole.comp_surface):
+            return True
+        if issubclass(obj_type, Slot) and (
+            obj_type.comp_surface_active is Slot.comp_surface_active
+        ):
+            return True
+    return False
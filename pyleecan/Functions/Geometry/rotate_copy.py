@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+from pickle import HIGHEST_PROTOCOL, dumps, loads
+
+from numpy import array, exp
+
+# Properties of the lines and surfaces that are positions
+POINT_PROP_LIST = ["begin", "end", "center", "point_ref"]
+
+
+def rotate_copy(obj_list, angle_list):
+    """Copy a list of lines or surfaces for each angle and rotate the copies:
+    the positions of the objects are rotated for all the angles at once and
+    set in copies of the objects (the objects are copied with pickle)
+
+    Parameters
+    ----------
+    obj_list : list
+        List of lines and/or surfaces to copy
+    angle_list : list
+        Rotation angle of each copy [rad]
+
+    Returns
+    -------
+    copy_list : list
+        List of the rotated copies of obj_list (one list per angle)
+    """
+
+    if len(angle_list) == 0:
+        return list()
+
+    # The objects are copied without their parent
+    parent_list = [obj.parent for obj in obj_list]
+    for obj in obj_list:
+        obj.parent = None
+    try:
+        data = dumps(obj_list, protocol=HIGHEST_PROTOCOL)
+    finally:
+        for obj, parent in zip(obj_list, parent_list):
+            obj.parent = parent
+
+    # Rotation of all the positions for all the angles
+    Z = array([getattr(obj, name) for obj, name in get_point_prop(obj_list)])
+    Z_rot = exp(1j * array(angle_list, dtype=float))[:, None] * Z[None, :]
+
+    copy_list = list()
+    for Z_copy in Z_rot.tolist():
+        new_list = loads(data)
+        for (obj, name), value in zip(get_point_prop(new_list), Z_copy):
+            setattr(obj, name, value)
+        copy_list.append(new_list)
+    return copy_list
+
+
+def get_point_prop(obj_list):
+    """Return the positions of the lines and surfaces of a list (the positions
+    set to None are skipped)
+
+    Parameters
+    ----------
+    obj_list : list
+        List of lines and/or surfaces
+
+    Returns
+    -------
+    point_list : list
+        List of (object, property name) of the positions
+    """
+
+    point_list = list()
+    for obj in obj_list:
+        for name in POINT_PROP_LIST:
+            if getattr(obj, name, None) is not None:
+                point_list.append((obj, name))
+        # Lines of SurfLine, surfaces of SurfRing
+        if hasattr(obj, "line_list"):
+            point_list.extend(get_point_prop(obj.line_list))
+        if hasattr(obj, "out_surf"):
+            point_list.extend(get_point_prop([obj.out_surf, obj.in_surf]))
+    return point_list
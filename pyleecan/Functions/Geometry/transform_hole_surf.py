@@ -6,6 +6,7 @@ from ...Functions.labels import (
     YSR_LAB,
     YSL_LAB,
 )
+from .rotate_copy import rotate_copy
 
 
 def transform_hole_surf(
@@ -63,10 +64,11 @@ def transform_hole_surf(
 
     # Duplicate to have Zh/sym all the hole surfaces
     surf_list = list()
-    for ii in range(Zh // sym):
-        for surf in hole_surf_list:
-            new_surf = surf.copy()
-            new_surf.rotate(ii * 2 * pi / Zh)
+    copy_list = rotate_copy(
+        hole_surf_list, [ii * 2 * pi / Zh for ii in range(Zh // sym)]
+    )
+    for ii, new_list in enumerate(copy_list):
+        for new_surf in new_list:
             # Update label like "Rotor-0_HoleVoid_R0-T0-S0"
             new_surf.label = update_RTS_index(label=new_surf.label, S_id=ii)
             surf_list.append(new_surf)
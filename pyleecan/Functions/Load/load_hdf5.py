@@ -1,9 +1,21 @@
+from os.path import abspath, isfile
+from weakref import WeakValueDictionary
+
 from h5py import File, Group
-from numpy import bool_, int32, int64, string_, array
+from numpy import bool_, int32, int64, string_, array, broadcast_to, ndarray, zeros
+from numpy.lib.mixins import NDArrayOperatorsMixin
 from cloudpickle import loads
 
+from ...Classes._lazy import LazyArray
+
+# Minimum size [bytes] of the datasets to read on first access (lazy loading)
+LAZY_NBYTES_MIN = 2 ** 16
+
+# Arrays of the loaded objects that are not read yet (key: id)
+_LAZY_ARRAY_DICT = WeakValueDictionary()
 
-def load_hdf5(file_path):
+
+def load_hdf5(file_path, is_lazy=False, group_name=None):
     """
     Load pyleecan object from h5 file
 
@@ -12,6 +24,11 @@ def load_hdf5(file_path):
 
     file_path: str
         file path
+    is_lazy: bool
+        True to replace the big datasets by read-only placeholders (cf
+        set_lazy_array to read them on first access)
+    group_name: str
+        name of the group of the object to load (None for the full file)
 
     Returns
     -------
@@ -22,12 +39,16 @@ def load_hdf5(file_path):
     """
     with File(file_path, "r") as file:
         # file is a group
-        obj_dict = construct_dict_from_group(file)
+        group = file if group_name is None else file[group_name]
+        if is_lazy:
+            obj_dict = construct_dict_from_group(group, file_path=abspath(file_path))
+        else:
+            obj_dict = construct_dict_from_group(group)
 
     return file_path, obj_dict
 
 
-def construct_dict_from_group(group):
+def construct_dict_from_group(group, file_path=None):
     """
     construct_dict_from_group create a dictionary and extract datasets and groups from the group
 
@@ -35,6 +56,9 @@ def construct_dict_from_group(group):
     ----------
     group: h5py.Group
         group to browse
+    file_path: str
+        path of the file to replace the big datasets by placeholders (None to
+        read all the datasets)
 
     Returns
     -------
@@ -49,10 +73,12 @@ def construct_dict_from_group(group):
 
         for i in range(group.attrs["length_list"]):
             if hasattr(group["list_" + str(i)], "items"):  # Group in list
-                list_.append(construct_dict_from_group(group["list_" + str(i)]))
+                list_.append(
+                    construct_dict_from_group(group["list_" + str(i)], file_path)
+                )
             else:  # Dataset
                 dataset = group["list_" + str(i)]
-                value = dataset[()]
+                value = read_dataset(dataset, file_path)
                 if "array_list" in dataset.attrs.keys():  # List saved as an array
                     value = value.tolist()
                 elif isinstance(value, bool_):  # bool
@@ -77,11 +103,13 @@ def construct_dict_from_group(group):
             # Check if val is a group or a dataset
             if isinstance(val, Group):  # Group
                 # Call the function recursively to load group
-                dict_[key] = construct_dict_from_group(val)
+                dict_[key] = construct_dict_from_group(val, file_path)
             else:  # Dataset
-                value = val[()]
+                value = read_dataset(val, file_path)
                 if "array_list" in val.attrs.keys():  # List saved as an array
                     value = value.tolist()
+                elif isinstance(value, ndarray):  # Array (or placeholder)
+                    pass
                 elif value == "NoneValue":  # Handle None values
                     value = None
                 elif isinstance(value, bool_):  # bool
@@ -99,6 +127,319 @@ def construct_dict_from_group(group):
         return dict_
 
 
+def read_dataset(dataset, file_path=None):
+    """
+    Read a dataset or return a placeholder of the big arrays (lazy loading)
+
+    Parameters
+    ----------
+    dataset: h5py.Dataset
+        dataset to read
+    file_path: str
+        path of the file (None to read the dataset)
+
+    Returns
+    -------
+    value : object
+        value of the dataset or H5Placeholder
+    """
+    if file_path is None:
+        return dataset[()]
+    dtype = dataset.dtype
+    if (
+        dtype.kind not in "biufc"
+        or dataset.size * dtype.itemsize < LAZY_NBYTES_MIN
+        or "array_list" in dataset.attrs
+    ):
+        return dataset[()]
+    return H5Placeholder.create(file_path, dataset.name, dataset.shape, dtype)
+
+
+def set_lazy_array(obj):
+    """
+    Replace the placeholders of the big arrays in the loaded objects (cf
+    load_hdf5 with is_lazy=True) by H5Array that read the datasets on first
+    access
+
+    Parameters
+    ----------
+    obj: object
+        Pyleecan object (or list/dict of objects) loaded from a hdf5 file
+
+    Returns
+    -------
+    name_set: set
+        Names of the datasets of the replaced placeholders
+    """
+    name_set = set()
+    for container, key, placeholder in iter_placeholder(obj):
+        if placeholder.size != placeholder.dataset_size:
+            # Only views of the full dataset can be read later
+            raise H5PlaceholderError(
+                "Part of the dataset " + placeholder.name + " used before being read"
+            )
+        container[key] = H5Array(
+            placeholder.file_path,
+            placeholder.name,
+            placeholder.shape,
+            placeholder.dtype,
+            owner=(container, key),
+        )
+        name_set.add(placeholder.name)
+    return name_set
+
+
+def iter_placeholder(obj):
+    """
+    Iterate over the placeholders of the big arrays in the loaded data
+
+    Parameters
+    ----------
+    obj: object
+        Pyleecan object, list or dict (init_dict) loaded from a hdf5 file
+
+    Returns
+    -------
+    placeholder_iter: iterator
+        Iterator of (container, key, placeholder) with container[key] the
+        placeholder (container is a list, a dict or the __dict__ of an object)
+    """
+    obj_list = [obj]
+    id_set = set()
+    while len(obj_list) > 0:
+        container = obj_list.pop()
+        if id(container) in id_set:
+            continue
+        id_set.add(id(container))
+        if isinstance(container, list):
+            item_list = list(enumerate(container))
+        elif isinstance(container, dict):
+            item_list = list(container.items())
+        elif hasattr(container, "__dict__"):
+            # Pyleecan and SciDataTool objects (the parents are skipped)
+            container = container.__dict__
+            item_list = [
+                (key, val)
+                for key, val in container.items()
+                if key not in ["parent", "_cache_dict"]
+            ]
+        else:
+            continue
+        for key, val in item_list:
+            if isinstance(val, H5Placeholder):
+                yield container, key, val
+            elif isinstance(val, (list, dict)) or (
+                hasattr(val, "as_dict") and hasattr(val, "__dict__")
+            ):
+                obj_list.append(val)
+
+
+def read_lazy_array(file_path):
+    """
+    Read all the arrays that are not read yet from a hdf5 file (for instance
+    before overwriting the file)
+
+    Parameters
+    ----------
+    file_path: str
+        path of the hdf5 file
+    """
+    file_path = abspath(file_path)
+    for h5array in list(_LAZY_ARRAY_DICT.values()):
+        if h5array.file_path == file_path:
+            h5array.read()
+
+
+class H5Placeholder(ndarray):
+    """Read-only array of zeros (without memory) with the shape and dtype of a
+    dataset: used to create the objects before replacing it by a H5Array"""
+
+    @staticmethod
+    def create(file_path, name, shape, dtype):
+        """Create the placeholder of the dataset name of the file file_path"""
+        placeholder = broadcast_to(zeros((), dtype=dtype), shape).view(H5Placeholder)
+        placeholder.file_path = file_path
+        placeholder.name = name
+        placeholder.dataset_size = placeholder.size
+        return placeholder
+
+    def __array_finalize__(self, obj):
+        # Views (squeeze, reshape...) keep the dataset
+        self.file_path = getattr(obj, "file_path", None)
+        self.name = getattr(obj, "name", None)
+        self.dataset_size = getattr(obj, "dataset_size", None)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        # The values of the dataset must not be used before set_lazy_array
+        raise H5PlaceholderError(
+            "Values of the dataset " + str(self.name) + " used before being read"
+        )
+
+
+class H5Array(LazyArray, NDArrayOperatorsMixin):
+    """Array of a hdf5 file dataset read on first access: once read, the
+    H5Array is replaced by the ndarray in the object containing it (the
+    getters of the pyleecan objects only return the ndarray). The numpy
+    functions and operators (in-place ones included) read the dataset and
+    use the ndarray.
+    The file must not be moved, deleted or modified until the dataset is
+    read: call read_lazy_array(file_path) first (or load the file with
+    load_file(file_path) to read all the datasets).
+    """
+
+    def __init__(self, file_path, name, shape, dtype, owner=None):
+        """Create an array to read on first access
+
+        Parameters
+        ----------
+        file_path: str
+            path of the hdf5 file
+        name: str
+            name of the dataset in the file
+        shape: tuple
+            shape of the array (the dataset can be reshaped)
+        dtype: numpy.dtype
+            dtype of the array
+        owner: tuple
+            (container, key) where the H5Array is stored (container is a
+            list, a dict or the __dict__ of an object)
+        """
+        self.file_path = file_path
+        self.name = name
+        self.shape = tuple(shape)
+        self.dtype = dtype
+        self.owner = owner
+        self.value = None
+        _LAZY_ARRAY_DICT[id(self)] = self
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        size = 1
+        for dim in self.shape:
+            size *= dim
+        return size
+
+    def read(self):
+        """Read the dataset (only on the first call)
+
+        Returns
+        -------
+        value: ndarray
+            Values of the dataset
+        """
+        if self.value is None:
+            if not isfile(self.file_path):
+                raise FileNotFoundError(
+                    "Can't read the dataset "
+                    + self.name
+                    + ": the file "
+                    + self.file_path
+                    + " has been moved or deleted since it was loaded (cf"
+                    + " read_lazy_array to read the datasets first)"
+                )
+            with File(self.file_path, "r") as file:
+                self.value = file[self.name][()].reshape(self.shape)
+            _LAZY_ARRAY_DICT.pop(id(self), None)
+            if self.owner is not None:
+                container, key = self.owner
+                if container[key] is self:
+                    container[key] = self.value
+                self.owner = None
+        return self.value
+
+    def is_read(self):
+        """Return True if the dataset is already read"""
+        return self.value is not None
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None:
+            return self.read()
+        return self.read().astype(dtype, copy=False)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        # Computed on the ndarray (out=self for in-place operators)
+        inputs = read_h5array(inputs)
+        if "out" in kwargs:
+            kwargs["out"] = read_h5array(kwargs["out"])
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    def __array_function__(self, func, types, args, kwargs):
+        return func(*read_h5array(args), **read_h5array(kwargs))
+
+    def __getattr__(self, name):
+        # Called only for the attributes that are not defined in H5Array
+        if name.startswith("__") or not hasattr(ndarray, name):
+            raise AttributeError(name)
+        return getattr(self.read(), name)
+
+    def __getitem__(self, key):
+        return self.read()[key]
+
+    def __setitem__(self, key, value):
+        self.read()[key] = value
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __iter__(self):
+        return iter(self.read())
+
+    def __bool__(self):
+        return bool(self.read())
+
+    def __float__(self):
+        return float(self.read())
+
+    def __int__(self):
+        return int(self.read())
+
+    def __complex__(self):
+        return complex(self.read())
+
+    def __repr__(self):
+        if self.value is None:
+            return "H5Array(" + self.name + ", shape=" + str(self.shape) + ", not read)"
+        return repr(self.value)
+
+    def __reduce__(self):
+        # Pickled as an array if already read, else as a H5Array
+        if self.value is None:
+            return (H5Array, (self.file_path, self.name, self.shape, self.dtype))
+        return self.value.__reduce__()
+
+
+def read_h5array(value):
+    """Replace the H5Array of the arguments of a numpy function by their ndarray
+
+    Parameters
+    ----------
+    value: object
+        H5Array, list, tuple or dict of arguments (or any other argument)
+
+    Returns
+    -------
+    value: object
+        Arguments with the ndarray of the H5Array
+    """
+    if isinstance(value, H5Array):
+        return value.read()
+    if isinstance(value, (list, tuple)):
+        return type(value)(read_h5array(val) for val in value)
+    if isinstance(value, dict):
+        return {key: read_h5array(val) for key, val in value.items()}
+    return value
+
+
+class H5PlaceholderError(Exception):
+    """Raised when the values of a H5Placeholder are used"""
+
+    pass
+
+
 def is_int(inputString):
     """Check if a string is an int"""
     # first check if string contains numbers
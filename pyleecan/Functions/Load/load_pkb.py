@@ -0,0 +1,131 @@
+from pickle import Unpickler, loads
+from io import BytesIO
+from struct import calcsize, unpack
+
+from numpy import frombuffer
+
+from ...Classes._frozen import FrozenClass
+
+# Header of the pkb files: magic, format version, size of the pickle data,
+# number of out-of-band buffers (followed by the size of each buffer)
+PKB_MAGIC = b"PYLEECAN_PKB"
+PKB_FORMAT_VERSION = 1
+PKB_HEADER = "<IQQ"
+# Alignment [bytes] of the buffers in the file
+PKB_ALIGN = 64
+
+
+def load_pkb(file_path):
+    """
+    Load pyleecan object from pkb file: the arrays are read directly in their
+    memory (without copy)
+
+    Warning: the pkb files are read with pickle, which can execute arbitrary
+    code while loading. Only load pkb files from a trusted source (files saved
+    by yourself), use json or h5 files to exchange data.
+
+    Parameters
+    ----------
+    file_path: str
+        file path
+
+    Returns
+    -------
+    obj: Pyleecan object
+    """
+    with open(file_path, "rb") as file_:
+        if file_.read(len(PKB_MAGIC)) != PKB_MAGIC:
+            raise PkbFormatError(file_path + " is not a pkb file")
+        version, nb_data, nb_buffer = unpack(
+            PKB_HEADER, file_.read(calcsize(PKB_HEADER))
+        )
+        if version > PKB_FORMAT_VERSION:
+            raise PkbFormatError(
+                file_path
+                + " was saved with a newer format version ("
+                + str(version)
+                + ")"
+            )
+        size_list = unpack("<" + "Q" * nb_buffer, file_.read(8 * nb_buffer))
+        data = file_.read(nb_data)
+        buffer_list = list()
+        for size in size_list:
+            file_.seek(-file_.tell() % PKB_ALIGN, 1)
+            buffer = bytearray(size)
+            file_.readinto(buffer)
+            buffer_list.append(buffer)
+
+    return loads_pkb(data, buffer_list)
+
+
+def loads_pkb(data, buffer_list, shared_list=None):
+    """
+    Create the objects pickled by dumps_pkb (pickle: the data must come from a
+    trusted source, e.g. dumps_pkb in the same process)
+
+    Parameters
+    ----------
+    data: bytes
+        pickle data
+    buffer_list: list
+        out-of-band buffers of the arrays (the arrays use their memory)
+    shared_list: list
+        objects that were not pickled (same list as dumps_pkb)
+
+    Returns
+    -------
+    obj: Pyleecan object
+    """
+    if not shared_list:
+        return loads(data, buffers=buffer_list)
+    unpickler = _PkbSharedUnpickler(BytesIO(data), buffers=buffer_list)
+    unpickler.shared_list = shared_list
+    return unpickler.load()
+
+
+def build_object(cls, state):
+    """Create a pyleecan (or SciDataTool) object pickled by dumps_pkb: the state
+    is set without the property checks and the parent of the sub-objects is set
+    (cf generated setters)"""
+    obj = cls.__new__(cls)
+    obj.__dict__.update(state)
+    obj.__dict__["parent"] = None
+    # The pyleecan setters don't set the parent of the SciDataTool objects
+    if isinstance(obj, FrozenClass):
+        base = FrozenClass
+    else:
+        from SciDataTool.Classes._frozen import FrozenClass as base
+    for value in state.values():
+        if isinstance(value, base):
+            value.__dict__["parent"] = obj
+        elif isinstance(value, list):
+            for val in value:
+                if isinstance(val, base):
+                    val.__dict__["parent"] = obj
+        elif isinstance(value, dict):
+            for val in value.values():
+                if isinstance(val, base):
+                    val.__dict__["parent"] = obj
+    return obj
+
+
+def build_array(buffer, dtype, shape, order):
+    """Create an ndarray pickled by dumps_pkb in the memory of its out-of-band
+    buffer: the read-only arrays (e.g. views of a MeshSolution group) are
+    restored writable since the loaded buffers are owned by the new arrays"""
+    if isinstance(buffer, memoryview) and isinstance(buffer.obj, bytearray):
+        buffer = buffer.obj
+    return frombuffer(buffer, dtype=dtype).reshape(shape, order=order)
+
+
+class _PkbSharedUnpickler(Unpickler):
+    """Unpickler of the pkb data with shared objects"""
+
+    def persistent_load(self, pid):
+        return self.shared_list[pid]
+
+
+class PkbFormatError(Exception):
+    """Raised when a file is not a valid pkb file"""
+
+    pass
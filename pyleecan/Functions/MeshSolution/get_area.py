@@ -22,7 +22,7 @@ def get_area(meshsolution, group_names=None, indices=None):
 
     """
     if group_names is not None:
-        meshsol = meshsolution.get_group(group_names=group_names)
+        meshsol = meshsolution.get_group(group_names=group_names, is_view=True)
     else:
         meshsol = meshsolution
 
@@ -34,7 +34,7 @@ def get_indices_limited(
         surface area of the specified groups and indices
 
     """
-    grp = meshsolution.get_group(group_names=group_names)
+    grp = meshsolution.get_group(group_names=group_names, is_view=True)
     msh = grp.get_mesh()
 
     indices = msh.cell["triangle"].indice
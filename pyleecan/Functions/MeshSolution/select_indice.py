@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+from copy import copy
+
+import numpy as np
+from SciDataTool import Data1D
+
+
+def get_indice_pos(indice_ref, indice):
+    """Return the positions of indices in an array of indices
+
+    Parameters
+    ----------
+    indice_ref : array_like
+        Indices of the nodes or cells of a solution or a mesh
+    indice : array_like
+        Indices to find
+
+    Returns
+    -------
+    pos : ndarray
+        Positions of the indices in indice_ref (0 if not found)
+    is_found : ndarray
+        True if the indice is in indice_ref
+    """
+    indice_ref = np.reshape(np.asarray(indice_ref), -1)
+    indice = np.reshape(np.asarray(indice), -1)
+    if indice_ref.size == 0:
+        return np.zeros(indice.size, dtype=int), np.zeros(indice.size, dtype=bool)
+    order = np.argsort(indice_ref, kind="stable")
+    indice_sorted = indice_ref[order]
+    pos = np.minimum(np.searchsorted(indice_sorted, indice), indice_ref.size - 1)
+    is_found = indice_sorted[pos] == indice
+    pos = order[pos]
+    pos[~is_found] = 0
+    return pos, is_found
+
+
+def take_indice(values, pos, axis, is_view=False):
+    """Select positions along an axis of an array. If is_view, the selected
+    values are read-only: a view of the array (no copy) when the positions are
+    contiguous, a read-only copy otherwise.
+
+    Parameters
+    ----------
+    values : ndarray
+        Array to select
+    pos : ndarray
+        Positions to select
+    axis : int
+        Axis of the positions
+    is_view : bool
+        True to return read-only values (view of the array when possible)
+
+    Returns
+    -------
+    values_sel : ndarray
+        Selected values
+    """
+    pos = np.asarray(pos, dtype=int)
+    if is_view and pos.size > 0 and np.all(np.diff(pos) == 1):
+        index = [slice(None)] * values.ndim
+        index[axis] = slice(pos[0], pos[-1] + 1)
+        values_sel = values[tuple(index)]
+    else:
+        values_sel = np.take(values, pos, axis=axis)
+    if is_view:
+        values_sel.flags.writeable = False
+    return values_sel
+
+
+def select_data(data, indice, is_view=False):
+    """Return a Data object with only some indices of its "indice" axis. The
+    object is a shallow copy of data: the other axes are shared and the values
+    are selected with take_indice.
+
+    Parameters
+    ----------
+    data : DataND
+        SciDataTool Data object with an "indice" axis
+    indice : array_like
+        Indices to keep (the indices that are not in data are skipped)
+    is_view : bool
+        True to select read-only values (shared with data when possible)
+
+    Returns
+    -------
+    data_sel : DataND
+        Data object on the selected indices
+    is_missing : bool
+        True if at least one indice is not in data
+    """
+    axes = data.axes
+    ax_idx = [axis.name for axis in axes].index("indice")
+    axis = axes[ax_idx]
+    pos, is_found = get_indice_pos(axis.get_values(), indice)
+    new_indice = np.reshape(np.asarray(indice), -1)[is_found]
+
+    data_sel = copy(data)
+    data_sel.axes = list(axes)
+    data_sel.axes[ax_idx] = Data1D(
+        values=new_indice,
+        is_components=axis.is_components,
+        symmetries=axis.symmetries,
+        symbol=axis.symbol,
+        name=axis.name,
+        unit=axis.unit,
+        normalizations=axis.normalizations,
+    )
+    data_sel.values = take_indice(data.values, pos[is_found], ax_idx, is_view)
+    return data_sel, not np.all(is_found)
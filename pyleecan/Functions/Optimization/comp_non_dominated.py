@@ -0,0 +1,69 @@
+import numpy as np
+
+
+def comp_non_dominated(fitness):
+    """Find the non dominated individuals (Pareto front) for minimized objectives
+    - 2 objectives: sweep on the individuals sorted along the first objective,
+    O(N log N)
+    - k objectives: each individual (sorted in lexicographic order) is only
+    compared to the non dominated individuals already found, O(N log N + N.F.k)
+    where F is the size of the Pareto front (O(N^2.k) if all the individuals are
+    non dominated)
+
+    Parameters
+    ----------
+    fitness : ndarray
+        Fitness values (N_indiv, N_obj)
+
+    Returns
+    -------
+    is_non_dom : ndarray
+        Boolean array, True if the individual is not dominated (N_indiv,)
+    """
+
+    fitness = np.asarray(fitness, dtype=float)
+    if fitness.ndim == 1:
+        fitness = fitness[:, None]
+    N, N_obj = fitness.shape
+    is_non_dom = np.zeros(N, dtype=bool)
+    if N == 0:
+        return is_non_dom
+
+    if N_obj == 1:
+        is_non_dom[:] = fitness[:, 0] == fitness[:, 0].min()
+
+    elif N_obj == 2:
+        # Sort along 1st objective then 2nd objective
+        order = np.lexsort((fitness[:, 1], fitness[:, 0]))
+        f0, f1 = fitness[order, 0], fitness[order, 1]
+        # First individual of each group of equal 1st objective
+        start = np.searchsorted(f0, f0, side="left")
+        # Minimum of 2nd objective among the individuals with lower 1st objective
+        f1_min = np.minimum.accumulate(f1)
+        f1_min_prev = np.full(N, np.inf)
+        f1_min_prev[start > 0] = f1_min[start[start > 0] - 1]
+        # Dominated by an individual with lower 1st objective (lower or equal 2nd
+        # objective) or with equal 1st objective and lower 2nd objective
+        is_dom = np.logical_or(f1_min_prev <= f1, f1[start] < f1)
+        is_non_dom[order] = np.logical_not(is_dom)
+
+    else:
+        # An individual can only be dominated by the individuals before him in
+        # lexicographic order
+        order = np.lexsort(fitness.T[::-1])
+        front = np.zeros((N, N_obj))
+        N_front = 0
+        for ii in order:
+            fit = fitness[ii]
+            is_dom = np.any(
+                np.logical_and(
+                    np.all(front[:N_front] <= fit, axis=1),
+                    np.any(front[:N_front] < fit, axis=1),
+                )
+            )
+            if not is_dom:
+                is_non_dom[ii] = True
+                front[N_front] = fit
+                N_front += 1
+
+    return is_non_dom
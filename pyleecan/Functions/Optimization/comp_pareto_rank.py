@@ -0,0 +1,88 @@
+from bisect import bisect_left
+
+import numpy as np
+
+
+def comp_pareto_rank(fitness):
+    """Sort the individuals in successive non dominated fronts for minimized
+    objectives (rank 0 is the Pareto front, rank 1 the Pareto front without
+    rank 0...)
+    - 2 objectives: the individuals are sorted along the first objective then
+    each individual is added to the first front whose last individual does not
+    dominate it (binary search), O(N log N)
+    - k objectives: the individuals are sorted in lexicographic order then the
+    front of each individual is found by binary search on the fronts (each
+    step compares the individual to all the individuals of a front),
+    O(N.log(R).F.k) where R is the number of fronts and F the size of the
+    largest front (O(N^2.k) in the worst case)
+
+    Parameters
+    ----------
+    fitness : ndarray
+        Fitness values (N_indiv, N_obj)
+
+    Returns
+    -------
+    rank : ndarray
+        Index of the front of each individual (N_indiv,)
+    """
+
+    fitness = np.asarray(fitness, dtype=float)
+    if fitness.ndim == 1:
+        fitness = fitness[:, None]
+    N, N_obj = fitness.shape
+    rank = np.zeros(N, dtype=int)
+    if N == 0:
+        return rank
+
+    if N_obj == 1:
+        # Equal values have the same rank
+        rank[:] = np.unique(fitness[:, 0], return_inverse=True)[1]
+
+    elif N_obj == 2:
+        order = np.lexsort((fitness[:, 1], fitness[:, 0]))
+        # Last individual of each front (2nd objective, 1st objective): an
+        # individual is dominated by a front if the last individual is lower in
+        # this order, and the last individuals are sorted along the fronts
+        last_list = list()
+        for ii in order:
+            key = (fitness[ii, 1], fitness[ii, 0])
+            jj = bisect_left(last_list, key)
+            if jj == len(last_list):
+                last_list.append(key)
+            else:
+                last_list[jj] = key
+            rank[ii] = jj
+
+    else:
+        # An individual can only be dominated by the individuals before him in
+        # lexicographic order. If an individual is dominated by a front, it is
+        # dominated by all the previous fronts => binary search on the fronts
+        order = np.lexsort(fitness.T[::-1])
+        front_list = list()  # Fitness of the individuals of each front
+        size_list = list()  # Number of individuals in each front
+        for ii in order:
+            fit = fitness[ii]
+            low, high = 0, len(front_list)
+            while low < high:
+                mid = (low + high) // 2
+                front = front_list[mid][: size_list[mid]]
+                if np.any(
+                    np.logical_and(
+                        np.all(front <= fit, axis=1), np.any(front < fit, axis=1)
+                    )
+                ):
+                    low = mid + 1
+                else:
+                    high = mid
+            if low == len(front_list):
+                front_list.append(np.zeros((1, N_obj)))
+                size_list.append(0)
+            elif size_list[low] == front_list[low].shape[0]:
+                # Double the size of the front array
+                front_list[low] = np.vstack((front_list[low], front_list[low]))
+            front_list[low][size_list[low]] = fit
+            size_list[low] += 1
+            rank[ii] = low
+
+    return rank
@@ -0,0 +1,354 @@
+# -*- coding: utf-8 -*-
+from multiprocessing import Pool, cpu_count
+from datetime import datetime
+from traceback import format_exc
+
+from cloudpickle import dumps, loads
+from numpy import nan
+
+from .evaluate import evaluate
+from .check_cstr import check_cstr
+
+# Data shared by all the evaluations of a worker process (set by _init_worker)
+_worker_dict = dict()
+
+
+def evaluate_pop(solver, indiv_list, ngen, print_gen_simu=None, print_obj=None):
+    """Evaluate the fitness, the constraints and the validity of a list of
+    individuals (one generation).
+    - solver.executor is None and solver.nb_worker == 1: serial evaluation
+    - otherwise the individuals are evaluated concurrently in worker processes
+    (process pool with nb_worker processes or solver.executor). Only the
+    fitness, constraints, validity and DataKeeper results are sent back (and
+    the Output if is_keep_output)
+
+    If not is_keep_output, the results of the evaluated individuals are not
+    kept (indiv.output only contains the simulation) to bound memory
+
+    If solver.problem.eval_cache is set, the fitness, constraints and DataKeeper
+    results of the design variables already evaluated are taken from the cache:
+    the Output of these individuals is not computed (indiv.is_cached is True)
+
+    Parameters
+    ----------
+    solver : OptiGenAlg
+        Genetic algorithm solver
+    indiv_list : list
+        Individuals to evaluate
+    ngen : int
+        Generation number (for display)
+    print_gen_simu : function
+        Function to display the progress of the serial evaluation
+    print_obj : function
+        Function to display the objectives of an individual
+
+    Returns
+    -------
+    nb_error : int
+        Number of evaluation failures
+    nb_infeasible : int
+        Number of individuals violating the constraints
+    """
+
+    if len(indiv_list) == 0:
+        return 0, 0
+
+    cache = solver.problem.eval_cache
+    if cache is None:
+        return evaluate_pop_no_cache(
+            solver, indiv_list, ngen, print_gen_simu=print_gen_simu, print_obj=print_obj
+        )
+
+    # Only evaluate the individuals that are not in the cache (once per key)
+    key_list = [cache.get_key(indiv) for indiv in indiv_list]
+    result_dict = dict()  # Evaluation results of the individuals per key
+    eval_dict = dict()  # Individuals to evaluate per key
+    for key, indiv in zip(key_list, indiv_list):
+        if key not in result_dict and key not in eval_dict:
+            result = cache.get(key)
+            if result is None:
+                eval_dict[key] = indiv
+            else:
+                result_dict[key] = result
+
+    # Evaluate the individuals, the DataKeeper results are reordered afterwards
+    dk_list = solver.problem.datakeeper_list
+    nb_result = [len(dk.result) for dk in dk_list]
+    eval_list = list(eval_dict.values())
+    evaluate_pop_no_cache(
+        solver, eval_list, ngen, print_gen_simu=print_gen_simu, print_obj=print_obj
+    )
+    dk_result_list = list()
+    for dk, N in zip(dk_list, nb_result):
+        dk_result_list.append(dk.result[N:])
+        del dk.result[N:]
+    for ii, (key, indiv) in enumerate(eval_dict.items()):
+        result = {
+            "fitness": list(indiv.fitness.values),
+            "is_simu_valid": indiv.is_simu_valid,
+            "cstr_viol": indiv.cstr_viol,
+            "datakeeper": [dk_result[ii] for dk_result in dk_result_list],
+        }
+        result_dict[key] = result
+        # Failed evaluations are not stored (the error may not be reproducible)
+        if indiv.is_simu_valid:
+            cache.add(key, result)
+
+    # Set the results of all the individuals
+    nb_error, nb_infeasible = 0, 0
+    for key, indiv in zip(key_list, indiv_list):
+        result = result_dict[key]
+        indiv.is_cached = eval_dict.get(key) is not indiv
+        if indiv.is_cached:
+            indiv.fitness.values = result["fitness"]
+            indiv.is_simu_valid = result["is_simu_valid"]
+            indiv.cstr_viol = result["cstr_viol"]
+        for dk, value in zip(dk_list, result["datakeeper"]):
+            dk.result.append(value)
+        nb_error += not indiv.is_simu_valid
+        nb_infeasible += indiv.is_simu_valid and indiv.cstr_viol > 0
+
+    cache.save_eval()
+    solver.get_logger().info(cache.get_stat_msg())
+    return nb_error, nb_infeasible
+
+
+def evaluate_pop_no_cache(
+    solver, indiv_list, ngen, print_gen_simu=None, print_obj=None
+):
+    """Evaluate all the individuals (serial or parallel, cf evaluate_pop)"""
+
+    if len(indiv_list) == 0:
+        return 0, 0
+
+    if solver.executor is None and solver.nb_worker == 1:
+        nb_error = 0
+        for i, indiv in enumerate(indiv_list):
+            if print_gen_simu is not None:
+                time = datetime.now().strftime("%H:%M:%S")
+                print_gen_simu(time, ngen, i, solver.size_pop, nb_error, indiv_list)
+            nb_error += evaluate(solver, indiv)
+            if print_obj is not None:
+                print_obj(solver.problem.obj_func, indiv)
+        # Check the constraints violation
+        nb_infeasible = 0
+        if len(solver.problem.constraint) > 0:
+            for indiv in indiv_list:
+                nb_infeasible += check_cstr(solver, indiv) == False
+        if not is_keep_output(solver):
+            for indiv in indiv_list:
+                indiv.output = type(indiv.output)(simu=indiv.output.simu)
+        return nb_error, nb_infeasible
+
+    return evaluate_pop_parallel(solver, indiv_list, ngen, print_obj=print_obj)
+
+
+def is_keep_output(solver):
+    """Return True if the Output of the evaluated individuals must be kept
+    (solver.is_keep_all_output or Output saved in the store)"""
+    return solver.is_keep_all_output or (
+        solver.store is not None and solver.store.is_save_output
+    )
+
+
+def evaluate_pop_parallel(solver, indiv_list, ngen, print_obj=None):
+    """Evaluate the individuals in worker processes (cf evaluate_pop)"""
+
+    logger = solver.get_logger()
+    problem = solver.problem
+
+    # Data common to all the individuals (serialized once per worker), the
+    # problem is detached from the solver to not serialize it
+    problem.parent = None
+    try:
+        common = dumps(
+            (
+                problem.preprocessing,
+                problem.eval_func,
+                problem.obj_func,
+                problem.constraint,
+                problem.datakeeper_list,
+                solver.logger_name,
+                is_keep_output(solver),
+            )
+        )
+    finally:
+        problem.parent = solver
+    args = [
+        (idx, list(indiv), indiv.design_var_name_list, dumps(indiv.output))
+        for idx, indiv in enumerate(indiv_list)
+    ]
+
+    if solver.executor is not None:
+        logger.info(
+            "Evaluating " + str(len(indiv_list)) + " individuals with the executor"
+        )
+        # The common data is sent with each individual
+        result_list = list(
+            solver.executor(_evaluate_worker, [(common,) + arg for arg in args])
+        )
+    else:
+        nb_worker = solver.nb_worker
+        if nb_worker > cpu_count():
+            logger.warning(
+                f"Parallelization is set on {nb_worker} processes while "
+                + f"your computer only has {cpu_count()}."
+            )
+        if nb_worker > len(indiv_list):
+            nb_worker = len(indiv_list)
+        logger.info(
+            "Evaluating "
+            + str(len(indiv_list))
+            + " individuals on "
+            + str(nb_worker)
+            + " processes"
+        )
+        with Pool(nb_worker, initializer=_init_worker, initargs=(common,)) as p:
+            result_list = list(p.imap_unordered(_evaluate_worker, args))
+
+    # Store the results in the individual order (DataKeeper results order)
+    result_list.sort(key=lambda result: result[0])
+    nb_error, nb_infeasible = 0, 0
+    for idx, fitness, is_simu_valid, cstr_viol, dk_result, output, error in result_list:
+        indiv = indiv_list[idx]
+        if error is not None:
+            logger.error(
+                "Evaluation of individual "
+                + str(idx)
+                + " of generation "
+                + str(ngen)
+                + " failed in worker process:\n"
+                + error
+            )
+            fitness = [float("inf") for _ in problem.obj_func]
+            is_simu_valid = False
+            cstr_viol = len(problem.constraint)
+            dk_result = [nan for _ in problem.datakeeper_list]
+        indiv.fitness.values = fitness
+        indiv.is_simu_valid = is_simu_valid
+        indiv.cstr_viol = cstr_viol
+        for datakeeper, value in zip(problem.datakeeper_list, dk_result):
+            datakeeper.result.append(value)
+        if output is not None:
+            indiv.output = loads(output)
+        nb_error += not is_simu_valid
+        nb_infeasible += is_simu_valid and cstr_viol > 0
+        if print_obj is not None:
+            print_obj(problem.obj_func, indiv)
+
+    return nb_error, nb_infeasible
+
+
+class _Fitness(object):
+    """Fitness of an individual in a worker process"""
+
+    def __init__(self):
+        self.values = tuple()
+
+
+class _Individual(list):
+    """Individual in a worker process (the DEAP classes are created in the main
+    process only)"""
+
+    def __init__(self, value_list, design_var_name_list, output):
+        super(_Individual, self).__init__(value_list)
+        self.design_var_name_list = design_var_name_list
+        self.output = output
+        self.fitness = _Fitness()
+        self.is_simu_valid = False
+        self.cstr_viol = 0
+
+
+def _init_worker(common):
+    """Load the data shared by all the evaluations of the worker"""
+    _worker_dict["solver"] = _load_solver(common)
+
+
+def _load_solver(common):
+    """Create a solver in the worker process with the objectives, constraints
+    and DataKeepers of the problem"""
+    # Import here to avoid circular import with the classes
+    from ...Classes.OptiProblem import OptiProblem
+    from ...Classes.OptiSolver import OptiSolver
+
+    (
+        preprocessing,
+        eval_func,
+        obj_func,
+        constraint,
+        datakeeper_list,
+        logger_name,
+        is_keep_all_output,
+    ) = loads(common)
+    problem = OptiProblem(
+        simu=None,
+        obj_func=obj_func,
+        eval_func=eval_func,
+        constraint=constraint,
+        preprocessing=preprocessing,
+        datakeeper_list=datakeeper_list,
+    )
+    return OptiSolver(
+        problem=problem,
+        logger_name=logger_name,
+        is_keep_all_output=is_keep_all_output,
+    )
+
+
+def _evaluate_worker(args):
+    """Evaluate one individual in a worker process
+
+    Returns
+    -------
+    idx : int
+        Index of the individual
+    fitness : list
+        Fitness values
+    is_simu_valid : bool
+        True if the evaluation succeeded
+    cstr_viol : int
+        Number of constraints violations
+    dk_result : list
+        DataKeeper results (same order as datakeeper_list)
+    output : bytes
+        Serialized Output (None if not is_keep_all_output or error)
+    error : str
+        Design variables and traceback of the error (None if no error)
+    """
+    idx, value_list, design_var_name_list = args[-4:-1]
+    try:
+        if len(args) == 5:
+            # Executor: common data sent with each individual (no shared state
+            # for thread based executors)
+            common, _, value_list, design_var_name_list, output = args
+            solver = _load_solver(common)
+        else:
+            _, value_list, design_var_name_list, output = args
+            solver = _worker_dict["solver"]
+        indiv = _Individual(value_list, design_var_name_list, loads(output))
+        for datakeeper in solver.problem.datakeeper_list:
+            datakeeper.result = list()
+        evaluate(solver, indiv)
+        if len(solver.problem.constraint) > 0:
+            check_cstr(solver, indiv)
+        dk_result = [dk.result[-1] for dk in solver.problem.datakeeper_list]
+        if solver.is_keep_all_output:
+            output = dumps(indiv.output)
+        else:
+            output = None
+        return (
+            idx,
+            list(indiv.fitness.values),
+            indiv.is_simu_valid,
+            indiv.cstr_viol,
+            dk_result,
+            output,
+            None,
+        )
+    except Exception:
+        # Same message as the failed simulations of evaluate
+        error = "The following simulation failed :\nDesign variables :\n"
+        for name, value in zip(design_var_name_list, value_list):
+            error += name + " : " + str(value) + "\n"
+        error += format_exc()
+        return idx, None, None, None, None, None, error
@@ -17,6 +17,7 @@ def update(indiv):
 
     indiv.is_simu_valid = False
     indiv.cstr_viol = 0
+    indiv.is_cached = False
 
     # Delete the fitness
     del indiv.fitness.values
@@ -1,12 +1,29 @@
-import h5py
+import warnings
+from datetime import datetime
+
 import numpy as np
+from cloudpickle import dumps
 from h5py import File as FileH5
+
+from ...Classes._ClassInfo import ClassInfo
 from ...definitions import PACKAGE_NAME
 from ... import __version__
-from datetime import datetime
+from ..Load.load_hdf5 import H5Array, read_lazy_array
 
+# Version of the hdf5 format (2: the objects are written property by property
+# and the big arrays are chunked and optionally compressed)
+H5_FORMAT_VERSION = 2
+# Minimum size [bytes] of the arrays to chunk (and compress)
+CHUNK_NBYTES_MIN = 2 ** 16
+# Compression filter of the big arrays (type_compression=1)
+COMPRESSION_DICT = {"compression": "gzip", "compression_opts": 1, "shuffle": True}
 
-def save_hdf5(obj, save_path, obj_dict=None):
+# Properties (name, type) of each pyleecan class (None if the class or one of
+# its mothers has its own as_dict method)
+_PROP_DICT = dict()
+
+
+def save_hdf5(obj, save_path, obj_dict=None, type_compression=0):
     """
     Save a pyleecan obj in hdf5 format
 
@@ -18,12 +35,23 @@ def save_hdf5(obj, save_path, obj_dict=None):
         file path
     obj_dict : dict
         obj.as_dict to save (optionnal to skip call to as_dict)
+    type_compression: int
+        0: no compression, 1: gzip (big arrays only)
     """
 
+    # The arrays of the objects loaded from save_path must be read before
+    # overwriting the file
+    read_lazy_array(save_path)
+
     file5 = None
     try:
         file5 = FileH5(save_path, "w")
-        pyleecan_dict_to_hdf5(file5, obj, obj_dict=obj_dict)
+        # Compression of the big arrays (cf array_to_hdf5)
+        file5.attrs["__compression__"] = type_compression
+        if obj_dict is None:
+            pyleecan_obj_to_hdf5(file5, obj)
+        else:
+            pyleecan_dict_to_hdf5(file5, obj, obj_dict=obj_dict)
         file5.close()
     except Exception as err:
         if file5:
@@ -31,6 +59,27 @@ def save_hdf5(obj, save_path, obj_dict=None):
         raise (err)
 
 
+def pyleecan_obj_to_hdf5(file, obj):
+    """
+    Save a pyleecan object (or a dict of pyleecan objects) in the hdf5 file.
+    The objects are written property by property (same content as as_dict
+    without building the dict of the full object)
+
+    Parameters
+    ----------
+    file:
+        hdf5 file
+    obj: Pyleecan object
+        object to save
+    """
+    if isinstance(obj, dict):
+        for key, val in obj.items():
+            object_to_hdf5(file, str(key), val)
+    else:
+        properties_to_hdf5(file, obj)
+    add_save_info(file)
+
+
 def pyleecan_dict_to_hdf5(file, obj, obj_dict=None):
     """
     Save a dict from a pyleecan object in the hdf5 file
@@ -52,23 +101,200 @@ def pyleecan_dict_to_hdf5(file, obj, obj_dict=None):
             obj_dict[key] = val.as_dict(type_handle_ndarray=2)
     else:
         obj_dict = obj.as_dict(type_handle_ndarray=2)
-    now = datetime.now()
-    obj_dict["__save_date__"] = now.strftime("%Y_%m_%d %Hh%Mmin%Ss ")
-    obj_dict["__version__"] = PACKAGE_NAME + "_" + __version__
     for key, val in obj_dict.items():
-        # Object that need groups
-        if isinstance(val, dict) or isinstance(val, list):
-            variable_to_hdf5(file, "", val, key)
-        # Dataset
-        elif isinstance(val, np.ndarray):
-            file[key] = val
-        elif val == None:
-            # None is not available in H5 => we use a string
-            file[key] = np.string_("NoneValue".encode("ISO-8859-2"))
-        elif isinstance(val, str):
-            file[key] = np.string_(val.encode("ISO-8859-2"))
+        variable_to_hdf5(file, "", val, key)
+    add_save_info(file)
+
+
+def add_save_info(file):
+    """
+    Add the save date, the pyleecan version and the format version in the
+    hdf5 file
+
+    Parameters
+    ----------
+    file:
+        hdf5 file
+    """
+    now = datetime.now()
+    variable_to_hdf5(file, "", now.strftime("%Y_%m_%d %Hh%Mmin%Ss "), "__save_date__")
+    variable_to_hdf5(file, "", PACKAGE_NAME + "_" + __version__, "__version__")
+    file.attrs["__format_version__"] = H5_FORMAT_VERSION
+
+
+def get_prop_list(obj):
+    """
+    Return the properties of a pyleecan object
+
+    Parameters
+    ----------
+    obj: Pyleecan object
+        object to save
+
+    Returns
+    -------
+    prop_list: list
+        list of (name, type) of the properties, None if obj is not a pyleecan
+        object or if it has its own as_dict method
+    """
+    if len(_PROP_DICT) == 0:
+        class_dict = ClassInfo().get_dict()
+        for name, cls_dict in class_dict.items():
+            if any(
+                "as_dict" in class_dict[cls_name]["methods"]
+                for cls_name in [name] + cls_dict["inherit"]
+            ):
+                _PROP_DICT[name] = None
+            else:
+                _PROP_DICT[name] = [
+                    (prop["name"], prop["type"]) for prop in cls_dict["properties"]
+                ]
+
+    cls_name = type(obj).__name__
+    if type(obj).__module__ != PACKAGE_NAME + ".Classes." + cls_name:
+        return None  # SciDataTool or user defined classes
+    return _PROP_DICT.get(cls_name)
+
+
+def get_group(file, prefix):
+    """Return the group of the hdf5 file at prefix ("" for the root)"""
+    if prefix == "":
+        return file["/"]
+    return file[prefix]
+
+
+def object_to_hdf5(file, name, obj, prefix=""):
+    """
+    Save a pyleecan object in a new group of the hdf5 file
+
+    Parameters
+    ----------
+    file: HDF5 file
+        file to save the data
+    name: str
+        name of the group of the object
+    obj: Pyleecan object
+        object to save
+    prefix: str
+        name of the group containing the object
+    """
+    prop_list = get_prop_list(obj)
+    if prop_list is None:
+        # SciDataTool objects or object with a specific as_dict
+        variable_to_hdf5(file, prefix, obj.as_dict(type_handle_ndarray=2), name)
+    else:
+        group_name = prefix + "/" + name
+        file.create_group(group_name)
+        properties_to_hdf5(file, obj, prefix=group_name, prop_list=prop_list)
+
+
+def properties_to_hdf5(file, obj, prefix="", prop_list=None):
+    """
+    Save the properties of a pyleecan object in a group of the hdf5 file
+    (cf the generated as_dict methods)
+
+    Parameters
+    ----------
+    file: HDF5 file
+        file to save the data
+    obj: Pyleecan object
+        object to save
+    prefix: str
+        name of the group of the object
+    prop_list: list
+        list of (name, type) of the properties (None to get them)
+    """
+    if prop_list is None:
+        prop_list = get_prop_list(obj)
+    if prop_list is None:
+        for key, val in obj.as_dict(type_handle_ndarray=2).items():
+            variable_to_hdf5(file, prefix, val, key)
+        return
+
+    for prop, prop_type in prop_list:
+        value = getattr(obj, prop)
+        if value is None:
+            pass
+        elif prop_type == "function":
+            if getattr(obj, "_" + prop + "_str") is not None:
+                value = getattr(obj, "_" + prop + "_str")
+            else:
+                obj.get_logger().warning(
+                    type(obj).__name__
+                    + ".as_dict(): "
+                    + f"Function {value.__name__} is not serializable "
+                    + "and will be converted to None."
+                )
+                value = None
+        elif prop_type == "complex" and not isinstance(value, float):
+            value = str(value)
+        elif "." in prop_type and "SciDataTool" not in prop_type:
+            # Store serialized data (using cloudpickle) and str
+            value = {
+                "__class__": str(type(value)),
+                "__repr__": str(value.__repr__()),
+                "serialized": dumps(value).decode("ISO-8859-2"),
+            }
+        value_to_hdf5(file, prefix, value, prop)
+    variable_to_hdf5(file, prefix, type(obj).__name__, "__class__")
+
+
+def value_to_hdf5(file, prefix, value, name):
+    """
+    Save a value in the hdf5 file: the pyleecan objects (also in lists and
+    dicts) are written property by property
+
+    Parameters
+    ----------
+    file: HDF5 file
+        file to save the data
+    prefix: str
+        name of the group containing the value
+    value: object
+        value to save
+    name: str
+        name of the dataset or group of the value
+    """
+    if hasattr(value, "as_dict"):
+        object_to_hdf5(file, name, value, prefix=prefix)
+    elif isinstance(value, list) and any(hasattr(val, "as_dict") for val in value):
+        group_name = prefix + "/" + name
+        grp = file.create_group(group_name)
+        grp.attrs["length_list"] = len(value)
+        for i, val in enumerate(value):
+            value_to_hdf5(file, group_name, val, "list_{}".format(i))
+    elif isinstance(value, dict) and any(
+        hasattr(val, "as_dict") for val in value.values()
+    ):
+        group_name = prefix + "/" + name
+        file.create_group(group_name)
+        for key, val in value.items():
+            value_to_hdf5(file, group_name, val, str(key))
+    else:
+        variable_to_hdf5(file, prefix, value, name)
+
+
+def array_to_hdf5(group, name, value):
+    """
+    Save an array in a dataset of the group: the big arrays are chunked (and
+    compressed according to the __compression__ attribute of the file)
+
+    Parameters
+    ----------
+    group: h5py.Group
+        group to contain the dataset
+    name: str
+        name of the dataset
+    value: ndarray
+        array to save
+    """
+    if value.nbytes >= CHUNK_NBYTES_MIN and value.dtype.kind in "biufc":
+        if group.file.attrs.get("__compression__", 0) == 1:
+            group.create_dataset(name, data=value, chunks=True, **COMPRESSION_DICT)
         else:
-            file[key] = val
+            group.create_dataset(name, data=value, chunks=True)
+    else:
+        group[name] = value
 
 
 def list_to_hdf5(file, group_name, name, list_to_save):
@@ -88,10 +314,13 @@ def list_to_hdf5(file, group_name, name, list_to_save):
 
     """
 
-    np.warnings.filterwarnings("ignore", category=np.VisibleDeprecationWarning)
-
     # Convert into array
-    array_list = np.array(list_to_save)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=np.VisibleDeprecationWarning)
+            array_list = np.array(list_to_save)
+    except ValueError:  # Ragged list
+        array_list = np.array(None)
 
     # Check the type to split or save as an array
     if array_list.dtype.kind in ["O", "U"]:
@@ -108,14 +337,10 @@ def list_to_hdf5(file, group_name, name, list_to_save):
             variable_to_hdf5(file, group_name, element, "list_{}".format(i))
 
     else:  # Save as an array
-        if group_name == "":
-            file[name] = array_list
-            file[name].attrs["array_list"] = True
-        else:
-            grp = file[group_name]
-            grp[name] = array_list
-            # Add an attribute to load correctly
-            grp[name].attrs["array_list"] = True
+        grp = get_group(file, group_name)
+        array_to_hdf5(grp, name, array_list)
+        # Add an attribute to load correctly
+        grp[name].attrs["array_list"] = True
 
 
 def dict_to_hdf5(file, prefix, dict_to_save):
@@ -129,6 +354,9 @@ def dict_to_hdf5(file, prefix, dict_to_save):
 
 
 def variable_to_hdf5(file, prefix, variable, name):
+    # Arrays read from a hdf5 file on demand
+    if isinstance(variable, H5Array):
+        variable = variable.read()
     # Unable to save matrix of string (U=unicode) => Convert to list
     if isinstance(variable, np.ndarray) and "U" in str(variable.dtype):
         variable = variable.tolist()
@@ -149,19 +377,23 @@ def variable_to_hdf5(file, prefix, variable, name):
     # Str
     elif isinstance(variable, str):
         if len(variable) == 0:
-            grp = file[prefix]
+            grp = get_group(file, prefix)
             grp[name] = variable
         else:
-            grp = file[prefix]
+            grp = get_group(file, prefix)
             # Create a fixed-width ASCII string according
             # to http://docs.h5py.org/en/stable/strings.html#exceptions-for-python-3
             grp[name] = np.string_(variable.encode("ISO-8859-2"))
     # None
     elif variable is None:
         # Create dataset
-        grp = file[prefix]
-        grp[name] = "NoneValue"
+        # None is not available in H5 => we use a string
+        grp = get_group(file, prefix)
+        grp[name] = np.string_("NoneValue".encode("ISO-8859-2"))
+    # Array
+    elif isinstance(variable, np.ndarray):
+        array_to_hdf5(get_group(file, prefix), name, variable)
     else:
         # Create dataset
-        grp = file[prefix]
+        grp = get_group(file, prefix)
         grp[name] = variable
@@ -0,0 +1,148 @@
+from io import BytesIO
+from pickle import PickleBuffer, Pickler, loads
+from struct import pack
+from sys import modules
+from types import FunctionType
+
+from cloudpickle import dumps
+from numpy import ndarray
+
+from ...Classes._frozen import FrozenClass
+from ..Load.load_pkb import (
+    PKB_ALIGN,
+    PKB_FORMAT_VERSION,
+    PKB_HEADER,
+    PKB_MAGIC,
+    build_array,
+    build_object,
+)
+
+# Pickle protocol with the out-of-band buffers
+PKB_PROTOCOL = 5
+
+
+def save_pkb(obj, save_path):
+    """Save a Pyleecan object in a pkb file: pickle data (protocol 5) followed
+    by the arrays (out-of-band buffers, aligned)
+
+    Warning: loading a pkb file can execute arbitrary code (pickle), the pkb
+    files must only be loaded from a trusted source.
+
+    Parameters
+    ----------
+    obj: Pyleecan object
+        object to save
+    save_path: str
+        file path
+    """
+
+    data, buffer_list = dumps_pkb(obj)
+    view_list = [buffer.raw() for buffer in buffer_list]
+    with open(save_path, "wb") as save_file:
+        save_file.write(PKB_MAGIC)
+        save_file.write(pack(PKB_HEADER, PKB_FORMAT_VERSION, len(data), len(view_list)))
+        save_file.write(
+            pack("<" + "Q" * len(view_list), *[v.nbytes for v in view_list])
+        )
+        save_file.write(data)
+        for view in view_list:
+            save_file.write(b"\0" * (-save_file.tell() % PKB_ALIGN))
+            save_file.write(view)
+
+
+def dumps_pkb(obj, shared_list=None):
+    """Pickle a Pyleecan object (protocol 5): the ndarrays are kept out-of-band,
+    the parent of obj is not pickled and the state of the pyleecan and
+    SciDataTool objects is restored without the property checks (cf loads_pkb)
+
+    Parameters
+    ----------
+    obj: Pyleecan object
+        object to pickle
+    shared_list: list
+        objects to not pickle (the same objects are used by loads_pkb)
+
+    Returns
+    -------
+    data: bytes
+        pickle data
+    buffer_list: list
+        PickleBuffer of the arrays (memory of the arrays of obj)
+    """
+
+    buffer_list = list()
+    file_ = BytesIO()
+    if shared_list:
+        pickler = _PkbSharedPickler(
+            file_, protocol=PKB_PROTOCOL, buffer_callback=buffer_list.append
+        )
+        pickler.shared_dict = {id(val): ii for ii, val in enumerate(shared_list)}
+    else:
+        pickler = _PkbPickler(
+            file_, protocol=PKB_PROTOCOL, buffer_callback=buffer_list.append
+        )
+    pickler.frozen_class = get_frozen_class()
+    # No memo: the objects referenced several times are pickled several times
+    # (same tree as as_dict), the cyclic references raise a ValueError
+    pickler.fast = True
+    pickler.dump(obj)
+    return file_.getvalue(), buffer_list
+
+
+def get_frozen_class():
+    """Return the base classes of the objects pickled without their parent:
+    SciDataTool is not imported for nothing (its objects can only exist if it
+    is already imported)"""
+    SDT_frozen = modules.get("SciDataTool.Classes._frozen")
+    if SDT_frozen is None:
+        return (FrozenClass,)
+    return (FrozenClass, SDT_frozen.FrozenClass)
+
+
+def reduce_frozen(obj):
+    """Reduce a pyleecan (or SciDataTool) object to its state without its
+    parent and cache"""
+    state = obj.__dict__.copy()
+    state.pop("parent", None)
+    state.pop("_cache_dict", None)
+    return build_object, (type(obj), state)
+
+
+def reduce_readonly_array(array):
+    """Reduce a read-only contiguous ndarray to an out-of-band buffer restored
+    writable (cf build_array)"""
+    order = "C" if array.flags.c_contiguous else "F"
+    return build_array, (PickleBuffer(array), array.dtype, array.shape, order)
+
+
+def reduce_function(func):
+    """Reduce the functions that can't be pickled by reference (lambda...) with
+    cloudpickle"""
+    return loads, (dumps(func),)
+
+
+class _PkbPickler(Pickler):
+    """Pickler of the pyleecan objects without their parent"""
+
+    def reducer_override(self, obj):
+        if isinstance(obj, self.frozen_class):
+            return reduce_frozen(obj)
+        if (
+            type(obj) is ndarray
+            and not obj.flags.writeable
+            and not obj.dtype.hasobject
+            and (obj.flags.c_contiguous or obj.flags.f_contiguous)
+        ):
+            return reduce_readonly_array(obj)
+        if type(obj) is FunctionType and (
+            obj.__name__ == "<lambda>" or "<locals>" in obj.__qualname__
+        ):
+            return reduce_function(obj)
+        return NotImplemented
+
+
+class _PkbSharedPickler(_PkbPickler):
+    """Pickler of the pyleecan objects with shared objects"""
+
+    def persistent_id(self, obj):
+        return self.shared_dict.get(id(obj))
@@ -0,0 +1,38 @@
+from numpy import asarray, broadcast_to, errstate, exp, pi, sinc, where
+
+
+def comp_cond_function_harm(alpha_cond, W0, wind_cond, wavenumber):
+    """Space harmonics of the sum of the single conductor winding functions
+    weighted by the winding matrix of the conductors (cf
+    comp_cond_function_sum), computed analytically: the single conductor
+    winding function is a sawtooth with a linear rise over the slot opening
+    so its Fourier coefficients are 2/(pi*r) * sinc(r*W0/2) * pi/(pi-W0/2)
+
+    Parameters
+    ----------
+    alpha_cond : ndarray
+        angular position of the conductors [rad] (Nc,)
+    W0 : float or ndarray
+        slot opening angular width of the conductors [rad] (Nc,)
+    wind_cond : ndarray
+        Number of turns of each phase in each conductor (Nc, qs)
+    wavenumber : ndarray
+        Space harmonic orders (positive integers) (Nr,)
+
+    Returns
+    -------
+    wf_harm: ndarray
+        Complex amplitude of the harmonics of the winding function of each
+        phase (qs, Nr): wf(alpha) = sum_r Re(wf_harm[:, r] * exp(1j*r*alpha))
+    """
+
+    r = asarray(wavenumber, dtype=float)[None, :]
+    W0 = broadcast_to(W0, alpha_cond.shape)[:, None]
+
+    # Fourier coefficients of the single conductor functions [Nc, Nr]
+    with errstate(divide="ignore", invalid="ignore"):
+        coeff = where(
+            r == 0, 0, 2 / (pi * r) * sinc(r * W0 / (2 * pi)) * pi / (pi - W0 / 2)
+        )
+    # wf = -0.5 * sum_c coeff * sin(r*(alpha - alpha_c))
+    return 0.5j * wind_cond.T @ (coeff * exp(-1j * r * alpha_cond[:, None]))
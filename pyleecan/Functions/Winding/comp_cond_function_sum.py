@@ -0,0 +1,49 @@
+from numpy import broadcast_to, nonzero, unique, zeros
+
+from .comp_cond_function import comp_cond_function
+
+# Maximum number of (conductor, angle) values computed at once
+NB_POINT_MAX = 2 ** 18
+
+
+def comp_cond_function_sum(alpha_cond, W0, wind_cond, alpha_rad):
+    """Sum of the single conductor winding functions weighted by the winding
+    matrix of the conductors: wf = wind_cond.T @ (-0.5 * cond_function), the
+    conductors without current are skipped and the angles are split in chunks
+    to limit the memory
+
+    Parameters
+    ----------
+    alpha_cond : ndarray
+        angular position of the conductors [rad] (Nc,)
+    W0 : float or ndarray
+        slot opening angular width of the conductors [rad] (Nc,)
+    wind_cond : ndarray
+        Number of turns of each phase in each conductor (Nc, qs)
+    alpha_rad : ndarray
+        Position vector to compute the winding function (Na,)
+
+    Returns
+    -------
+    wf: ndarray
+        Winding function of each phase (qs, Na)
+    """
+
+    W0 = broadcast_to(W0, alpha_cond.shape)
+    # Only the conductors with turns are needed
+    ind = nonzero((wind_cond != 0).any(axis=1))[0]
+    alpha_cond, W0, wind_cond = alpha_cond[ind], W0[ind], wind_cond[ind, :]
+
+    wf = zeros((wind_cond.shape[1], alpha_rad.size))
+    Nchunk = max(NB_POINT_MAX // max(alpha_cond.size, 1), 1)
+    for W0_ii in unique(W0):
+        # comp_cond_function is called for each slot opening
+        ind = nonzero(W0 == W0_ii)[0]
+        for start in range(0, alpha_rad.size, Nchunk):
+            stop = start + Nchunk
+            # Single conductor winding functions [Nc, Na]
+            cf = comp_cond_function(
+                alpha_cond[ind, None], W0_ii, alpha_rad[None, start:stop]
+            )
+            wf[:, start:stop] -= 0.5 * wind_cond[ind, :].T @ cf
+    return wf
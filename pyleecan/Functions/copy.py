@@ -1,8 +1,34 @@
 from ..Functions.Load.import_class import import_class
+from ..Functions.Load.load_pkb import loads_pkb
+from ..Functions.Save.save_pkb import dumps_pkb
 
 
 def copy(self, **kwargs):
-    """Return a copy of the class"""
+    """Return a copy of the class: the object is pickled (protocol 5, the
+    arrays out-of-band) and restored without the property checks. Objects that
+    can't be pickled are copied with as_dict/init_dict (kwargs of as_dict).
+    The functions are always kept by the pickle copy."""
+
+    # To avoid copying big data in Simulation object
+    shared_list = list()
+    Simulation = import_class("pyleecan.Classes", "Simulation")
+    if isinstance(self, Simulation):
+        if hasattr(self, "elec") and self.elec is not None:
+            # LUT (same object in the copy)
+            if self.elec.LUT_enforced is not None:
+                shared_list.append(self.elec.LUT_enforced)
+
+    try:
+        data, buffer_list = dumps_pkb(self, shared_list=shared_list)
+    except Exception:
+        return copy_dict(self, **kwargs)
+    # The copy has its own arrays
+    buffer_list = [bytearray(buffer.raw()) for buffer in buffer_list]
+    return loads_pkb(data, buffer_list, shared_list=shared_list)
+
+
+def copy_dict(self, **kwargs):
+    """Return a copy of the class with as_dict/init_dict"""
 
     # To avoid copying big data in Simulation object
     Simulation = import_class("pyleecan.Classes", "Simulation")
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+from pickle import HIGHEST_PROTOCOL, dumps, loads
+
+from numpy import ndarray
+
+from ..Classes._frozen import FrozenClass
+
+# Attributes of the objects that are not part of their state
+SKIP_ATTR = ["parent", "_cache_dict"]
+# Attributes that are not used to compute the geometry of a lamination
+# (materials and winding, wedge_mat is kept: the wedges exist only if it is set)
+GEO_SKIP_ATTR = SKIP_ATTR + ["_mat_type", "_winding", "_ring_mat"]
+# Maximum number of results stored per function (different arguments)
+NB_MEMO_MAX = 8
+
+
+def get_memo(obj, func, *args, memo_key=None, skip_attr=SKIP_ATTR, **kwargs):
+    """Return func(obj, *args, **kwargs), computed once for the current state
+    of obj: the result is stored in the cache of obj with the state of its
+    properties (and of the properties of its sub-objects) and computed again
+    when one of them is modified. The last NB_MEMO_MAX results (different
+    arguments) are stored for each function.
+    The calls of get_memo on obj while func is running (for instance the
+    method of the parent class) call their function directly: their result is
+    part of the result of the first call. func is also called directly if the
+    state of obj or the arguments can't be compared (cf comp_state_key).
+
+    Parameters
+    ----------
+    obj : FrozenClass
+        Object to call func on
+    func : function
+        Function to call (the result is copied to be modified safely)
+    *args, **kwargs :
+        Arguments of func (compared by value, cf comp_state_key)
+    memo_key : object
+        Hashable key of the data used by func that are not in the properties
+        of obj (for instance from its parents)
+    skip_attr : list
+        Attributes of obj (and of its sub-objects) that are not used by func
+        (not part of the key)
+
+    Returns
+    -------
+    result : object
+        Copy of func(obj, *args, **kwargs)
+    """
+
+    cache = obj._get_cache()
+    if cache.get("is_memo_run", False):
+        return func(obj, *args, **kwargs)
+
+    try:
+        key = comp_state_key(obj, skip_attr=skip_attr)
+        call_key = comp_state_key((args, tuple(sorted(kwargs.items())), memo_key))
+    except StateKeyError:
+        return func(obj, *args, **kwargs)
+    memo_dict = cache.setdefault("memo", dict())
+    memo = memo_dict.get(func)
+    if memo is None or memo["key"] != key:
+        memo = {"key": key, "data": dict()}
+        memo_dict[func] = memo
+
+    data = memo["data"].pop(call_key, None)
+    if data is not None:
+        memo["data"][call_key] = data  # Last used at the end
+        return loads(data)
+
+    cache["is_memo_run"] = True
+    try:
+        result = func(obj, *args, **kwargs)
+    finally:
+        cache["is_memo_run"] = False
+    # func can set properties computed on demand (e.g. Winding.wind_mat)
+    try:
+        new_key = comp_state_key(obj, skip_attr=skip_attr)
+    except StateKeyError:
+        memo_dict.pop(func)
+        return result
+    if new_key != key:
+        memo = {"key": new_key, "data": dict()}
+        memo_dict[func] = memo
+    if len(memo["data"]) >= NB_MEMO_MAX:
+        memo["data"].pop(next(iter(memo["data"])))
+    # The stored copy is made before the caller can modify the result
+    memo["data"][call_key] = dumps(result, protocol=HIGHEST_PROTOCOL)
+    return result
+
+
+def comp_state_key(obj, skip_attr=SKIP_ATTR):
+    """Compute a hashable key of the state of an object: two objects with the
+    same properties have the same key
+
+    Parameters
+    ----------
+    obj : object
+        Object to compute the key of
+    skip_attr : list
+        Attributes of the objects that are not part of the key
+
+    Returns
+    -------
+    key : object
+        Key of the state of the object
+
+    Raises
+    ------
+    StateKeyError
+        A value of the object can't be hashed (the identity of the value can't
+        be used as a key since it can be reused by another object)
+    """
+
+    if isinstance(obj, FrozenClass):
+        return (type(obj).__name__,) + tuple(
+            (name, comp_state_key(value, skip_attr))
+            for name, value in obj.__dict__.items()
+            if name not in skip_attr
+        )
+    if isinstance(obj, (list, tuple)):
+        return (type(obj).__name__,) + tuple(
+            comp_state_key(value, skip_attr) for value in obj
+        )
+    if isinstance(obj, dict):
+        return ("dict",) + tuple(
+            (name, comp_state_key(value, skip_attr)) for name, value in obj.items()
+        )
+    if isinstance(obj, (set, frozenset)):
+        return ("set", frozenset(comp_state_key(value, skip_attr) for value in obj))
+    if isinstance(obj, ndarray):
+        if obj.dtype.hasobject:
+            # The bytes of an object array are the addresses of its values
+            return ("ndarray", obj.shape) + tuple(
+                comp_state_key(value, skip_attr) for value in obj.ravel()
+            )
+        return ("ndarray", obj.shape, obj.dtype.str, obj.tobytes())
+    try:
+        hash(obj)
+    except TypeError:
+        raise StateKeyError(
+            "Unable to compute the state key of a "
+            + type(obj).__name__
+            + " (unhashable value)"
+        )
+    return obj
+
+
+class StateKeyError(TypeError):
+    """Raised when the state of an object can't be used as a key"""
+
+    pass
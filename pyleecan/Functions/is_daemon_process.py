@@ -0,0 +1,14 @@
+from multiprocessing import current_process
+
+
+def is_daemon_process():
+    """Check if the code runs in a daemon process (for instance a worker of a
+    multiprocessing Pool) that can't start its own process pool
+
+    Returns
+    -------
+    is_daemon : bool
+        True if the current process is a daemon process
+    """
+
+    return current_process().daemon
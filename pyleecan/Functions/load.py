@@ -4,9 +4,15 @@ from os import chdir, getcwd, walk
 from os.path import isdir, join, splitext
 
 from .Load.import_class import import_class
-from .Load.load_hdf5 import load_hdf5
+from .Load.load_hdf5 import (
+    H5PlaceholderError,
+    iter_placeholder,
+    load_hdf5,
+    set_lazy_array,
+)
 from .Load.load_json import load_json
 from .Load.load_pkl import load_pkl
+from .Load.load_pkb import load_pkb
 from .Load.retrocompatibility import convert_init_dict
 
 # Matlib Keys
@@ -15,17 +21,54 @@ MACH_KEY = "MachineMatLib"
 PATH_KEY = "MATLIB_PATH"
 
 
-def load(file_path):
-    """Load a pyleecan object from a json file
+def load(file_path, group_name=None):
+    """Load a pyleecan object from a json, h5, pkl or pkb file
+
+    Warning: the pkl and pkb files are read with pickle, which can execute
+    arbitrary code while loading. Only load them from a trusted source (files
+    saved by yourself), use json or h5 files to exchange data.
 
     Parameters
     ----------
     file_path: str
         path to the file to load
+    group_name: str
+        name of the group of the object in a hdf5 file (None for the full file)
     """
     if file_path.endswith(".pkl"):
         return load_pkl(file_path)
-    file_path, init_dict = load_init_dict(file_path)
+    if file_path.endswith(".pkb"):
+        return load_pkb(file_path)
+    if file_path.endswith("hdf5") or file_path.endswith("h5"):
+        # The big arrays are read on first access (if they are not used to
+        # create the objects)
+        try:
+            return load_file(file_path, is_lazy=True, group_name=group_name)
+        except H5PlaceholderError:
+            pass
+    return load_file(file_path, group_name=group_name)
+
+
+def load_file(file_path, is_lazy=False, group_name=None):
+    """Load a pyleecan object from a json or hdf5 file
+
+    Parameters
+    ----------
+    file_path: str
+        path to the file to load
+    is_lazy: bool
+        True to read the big arrays of a hdf5 file on first access
+    group_name: str
+        name of the group of the object in a hdf5 file (None for the full file)
+
+    Returns
+    -------
+    obj: object
+        Loaded pyleecan object
+    """
+    file_path, init_dict = load_init_dict(
+        file_path, is_lazy=is_lazy, group_name=group_name
+    )
 
     # Check that loaded data are of type dict
     if not isinstance(init_dict, dict):
@@ -41,13 +84,32 @@ def load(file_path):
     # Retrocompatibility
     convert_init_dict(init_dict)
 
-    return init_data(init_dict, file_path)
+    if not is_lazy:
+        return init_data(init_dict, file_path)
+
+    # All the placeholders of the datasets must be found in the objects
+    name_set = set(val.name for _, _, val in iter_placeholder(init_dict))
+    obj = init_data(init_dict, file_path)
+    if not name_set.issubset(set_lazy_array(obj)):
+        raise H5PlaceholderError("Datasets not found in the loaded objects")
+    return obj
+
 
+def load_init_dict(file_path, is_lazy=False, group_name=None):
+    """load the init_dict from a h5 or json file
 
-def load_init_dict(file_path):
-    """load the init_dict from a h5 or json file"""
+    Parameters
+    ----------
+    file_path: str
+        path to the file to load
+    is_lazy: bool
+        True to replace the big arrays of a hdf5 file by placeholders (cf
+        load_hdf5)
+    group_name: str
+        name of the group of the object in a hdf5 file (None for the full file)
+    """
     if file_path.endswith("hdf5") or file_path.endswith("h5"):
-        return load_hdf5(file_path)
+        return load_hdf5(file_path, is_lazy=is_lazy, group_name=group_name)
     elif file_path.endswith((".json", ".json.gz")) or isdir(file_path):
         return load_json(file_path)
     else:
@@ -2,6 +2,7 @@
 from .Save.save_json import save_json
 from .Save.save_hdf5 import save_hdf5
 from .Save.save_pkl import save_pkl
+from .Save.save_pkb import save_pkb
 
 
 class FormatError(Exception):
@@ -22,7 +23,11 @@ def save(self, save_path="", is_folder=False, type_handle_old=2, type_compressio
     type_handle_old : int
         How to handle old file in folder mode (0:Nothing, 1:Delete, 2:Move to "Backup" folder)
     type_compression: int
-        Available only for json, 0: no compression, 1: gzip
+        Available only for json and h5, 0: no compression, 1: gzip
+
+    Warning: the pkl and pkb files are pickle files, loading them can execute
+    arbitrary code. Only load them from a trusted source, use json or h5 files
+    to exchange data.
     """
     # Save in the object.path if it exist and save_path is empty
     if save_path == "" and hasattr(self, "path") and getattr(self, "path") != None:
@@ -31,6 +36,7 @@ def save(self, save_path="", is_folder=False, type_handle_old=2, type_compressio
         not save_path.endswith("json")
         and not save_path.endswith("h5")
         and not save_path.endswith("pkl")
+        and not save_path.endswith("pkb")
         and not is_folder
     ):
         save_path += ".json"  # Default format
@@ -48,10 +54,15 @@ def save(self, save_path="", is_folder=False, type_handle_old=2, type_compressio
         )
     # Save in hdf5
     elif save_path.endswith(".h5"):
-        save_hdf5(self, save_path=save_path)
+        save_hdf5(self, save_path=save_path, type_compression=type_compression)
     # Save in pkl
     elif save_path.endswith(".pkl"):
         save_pkl(self, save_path=save_path)
+    # Save in pkb (pickle with the arrays out-of-band): like pkl, pkb files
+    # can execute arbitrary code when loaded, only load them from a trusted
+    # source
+    elif save_path.endswith(".pkb"):
+        save_pkb(self, save_path=save_path)
     else:
         raise FormatError(
             "Unknown file extension: '{}'".format(save_path.rsplit(".")[-1])
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from os.path import join
 
-from ...Generator import PYTHON_TYPE, TAB, TAB2, TAB3, TAB4, TAB5, TAB6, TAB7
+from ...Generator import PYTHON_TYPE, TAB
 from ...Generator.read_fct import (
     find_import_type,
     get_value_str,
@@ -84,9 +84,9 @@ def generate_class(
         class_file.write("from logging import getLogger\n")
 
     if "ndarray" in import_type_list:
-        class_file.write("from ._check import set_array, " + "check_var, raise_\n")
+        class_file.write("from ._check import set_array, " + "check_var\n")
     else:
-        class_file.write("from ._check import check_var, raise_\n")
+        class_file.write("from ._check import check_var\n")
 
     # Get logger function
     if is_log:
@@ -101,6 +101,13 @@ def generate_class(
     class_file.write("from ..Functions.copy import copy\n")
     class_file.write("from ..Functions.load import load_init_dict\n")
     class_file.write("from ..Functions.Load.import_class import import_class\n")
+    # The methods are imported on first use (cf LazyMethod)
+    if len(class_dict["methods"]) > 0 and "ndarray" in import_type_list:
+        class_file.write("from ._lazy import LazyArray, LazyMethod\n")
+    elif len(class_dict["methods"]) > 0:
+        class_file.write("from ._lazy import LazyMethod\n")
+    elif "ndarray" in import_type_list:
+        class_file.write("from ._lazy import LazyArray\n")
 
     # Import of the mother_class (FrozenClass by default)
     # All the classes file are in the Classes folder (regardless of their main package)
@@ -117,18 +124,6 @@ def generate_class(
     else:
         class_file.write("from ._frozen import FrozenClass\n\n")
 
-    # Import all the methods of the class
-    # The methods are in Methods.<Main package>.<class name>, one file per method
-    if len(class_dict["methods"]) > 0:
-        class_file.write("# Import all class method\n")
-        class_file.write(
-            "# Try/catch to remove unnecessary dependencies in unused method\n"
-        )
-    for meth in class_dict["methods"]:
-        class_file.write(import_method(class_pack, class_name, meth))
-    if len(class_dict["methods"]) > 0:
-        class_file.write("\n")
-
     # ImportMatrixVal for ImportMatrix setter
     if "ImportMatrix" in import_type_list:
         class_file.write("from ..Classes.ImportMatrixVal import ImportMatrixVal\n")
@@ -214,61 +209,13 @@ def generate_class(
     class_file.write("\n")
 
     # Asign all the Methods of the class
-    if len(class_dict["methods"]) > 1:
+    # The methods are in Methods.<Main package>.<class name>, one file per method
+    if len(class_dict["methods"]) > 0:
         class_file.write(
-            TAB
-            + "# Check ImportError to remove unnecessary dependencies in unused method\n"
+            TAB + "# Methods imported on first use to remove unnecessary dependencies\n"
         )
     for meth in class_dict["methods"]:
-        meth_name = meth.split(".")[-1]
-        if class_pack not in ["", None]:
-            class_file.write(
-                TAB
-                + "# cf Methods."
-                + class_pack
-                + "."
-                + class_name
-                + "."
-                + meth
-                + "\n"
-            )
-        else:
-            class_file.write(TAB + "# cf Methods." + class_name + "." + meth + "\n")
-        class_file.write(TAB + "if isinstance(" + meth_name + ", ImportError):\n")
-        class_file.write(TAB2 + meth_name + " = property(\n")
-        class_file.write(TAB3 + "fget=lambda x: raise_(\n")
-        # PEP8 formating
-        if len(class_name) + 2 * len(meth_name) > 39:
-            # 2 lines Import text
-            class_file.write(TAB4 + "ImportError(\n")
-            class_file.write(
-                TAB5 + """"Can't use """ + class_name + " method " + meth_name + ': "\n'
-            )
-            class_file.write(TAB5 + "+ str(" + meth_name + ")\n")
-            class_file.write(TAB4 + ")\n")
-        elif len(class_name) + 2 * len(meth_name) > 29:
-            # Import text on line different line
-            class_file.write(TAB4 + "ImportError(\n")
-            class_file.write(
-                TAB5 + """"Can't use """ + class_name + " method " + meth_name + ': "'
-            )
-            class_file.write(" + str(" + meth_name + ")\n")
-            class_file.write(TAB4 + ")\n")
-        else:  # On one line
-            class_file.write(
-                TAB4
-                + """ImportError("Can't use """
-                + class_name
-                + " method "
-                + meth_name
-                + ': " + str('
-                + meth_name
-                + "))\n"
-            )
-        class_file.write(TAB3 + ")\n")
-        class_file.write(TAB2 + ")\n")
-        class_file.write(TAB + "else:\n")
-        class_file.write(TAB2 + meth_name + " = " + meth_name + "\n")
+        class_file.write(import_method(class_pack, class_name, meth))
     # Save / copy methods
     class_file.write(TAB + "# save and copy methods are available in all object\n")
     if "save" not in class_dict["methods"]:
@@ -2,7 +2,8 @@ from ...Generator import TAB
 
 
 def import_method(class_pack, class_name, meth):
-    """Method to generate the code to import a method (with import check)
+    """Method to generate the code to declare a method in the class body (the
+    method is imported on first use cf LazyMethod)
 
     Parameters
     ----------
@@ -21,14 +22,9 @@ def import_method(class_pack, class_name, meth):
     """
 
     meth_name = meth.split(".")[-1]
-    code = "try:\n"
-
-    code += TAB + "from ..Methods."
+    code = TAB + meth_name + ' = LazyMethod(__package__, "..Methods.'
     if class_pack not in ["", None]:
         code += class_pack + "."
 
-    code += class_name + "." + meth + " import " + meth_name + "\n"
-
-    code += "except ImportError as error:\n"
-    code += TAB + meth_name + " = error\n\n"
+    code += class_name + "." + meth + '")\n'
     return code
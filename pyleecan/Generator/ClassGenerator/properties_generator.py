@@ -47,6 +47,20 @@ def generate_properties(gen_dict, class_dict, soft_name="pyleecan"):
                 prop_str += TAB2 + "return self._" + prop["name"] + "\n\n"
             elif prop["type"] == "function":
                 prop_str += TAB2 + "return self._" + prop["name"] + "_func\n\n"
+            elif prop["type"] == "ndarray":
+                # Array of a file read on first access (cf load)
+                prop_str += (
+                    TAB2 + "if isinstance(self._" + prop["name"] + ", LazyArray):\n"
+                )
+                prop_str += (
+                    TAB3
+                    + "self._"
+                    + prop["name"]
+                    + " = self._"
+                    + prop["name"]
+                    + ".read()\n"
+                )
+                prop_str += TAB2 + "return self._" + prop["name"] + "\n\n"
             else:
                 prop_str += TAB2 + "return self._" + prop["name"] + "\n\n"
 
@@ -71,8 +71,11 @@ def generate_code(root_path, gen_dict=None, soft_name="pyleecan", is_log=True):
     load_file.write('"""File generated by generate_code() - \n')
     load_file.write('WARNING! All changes made in this file will be lost!\n"""\n\n')
 
-    load_file.write("from ..Classes.import_all import *\n\n")
-    load_file.write("load_switch = {\n")
+    # The class modules are imported on first access (cf LazyClassDict)
+    load_file.write("from ..Classes._lazy import LazyClassDict\n\n")
+    load_file.write(
+        'load_switch = LazyClassDict(\n    "' + soft_name + '.Classes",\n    [\n'
+    )
 
     # Read all the csv files
     if gen_dict is None:
@@ -83,13 +86,13 @@ def generate_code(root_path, gen_dict=None, soft_name="pyleecan", is_log=True):
         import_file.write(
             "from ..Classes." + class_name + " import " + class_name + "\n"
         )
-        load_file.write('    "' + class_name + '": ' + class_name + ",\n")
+        load_file.write('        "' + class_name + '",\n')
         print("Generation of " + class_name + " class")
         generate_class(
             gen_dict, class_name, CLASS_DIR, soft_name=soft_name, is_log=is_log
         )
     import_file.close()
-    load_file.write("}\n")
+    load_file.write("    ],\n)\n")
     load_file.close()
 
     print("Generation of load_switch.py")
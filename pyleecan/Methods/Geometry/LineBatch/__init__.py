@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+
+# Type of the lines of a LineBatch (line_type is the index in the list)
+LINE_TYPE_LIST = ["Segment", "Arc1", "Arc2", "Arc3"]
+
+
+class NbPointLineBatchError(Exception):
+    """ """
+
+    pass
+
+
+class AngleRotationLineBatchError(Exception):
+    """ """
+
+    pass
+
+
+class PointTranslateLineBatchError(Exception):
+    """ """
+
+    pass
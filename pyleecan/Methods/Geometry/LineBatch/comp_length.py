@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+from numpy import abs as np_abs, where
+
+
+def comp_length(self):
+    """Compute the length of the lines
+
+    Parameters
+    ----------
+    self : LineBatch
+        A LineBatch object
+
+    Returns
+    -------
+    length: ndarray
+        Length of each line [m]
+    """
+
+    return where(
+        self.line_type == 0,
+        np_abs(self.end - self.begin),
+        np_abs(self.radius) * np_abs(self.angle),
+    )
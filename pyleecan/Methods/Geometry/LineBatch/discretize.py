@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+from numpy import arange, cumsum, exp, full, nonzero, ones, repeat, where, zeros
+
+from ....Methods.Machine import ARC_NPOINT_D, LINE_NPOINT_D
+from ....Methods.Geometry.LineBatch import NbPointLineBatchError
+
+
+def discretize(self, nb_point=None, is_end=True):
+    """Return the discretize version of all the lines (cf Segment.discretize
+    and Arc.discretize): the points of each line are begin, nb_point points
+    and end
+
+    Parameters
+    ----------
+    self : LineBatch
+        A LineBatch object
+    nb_point : int
+        Number of points to add to discretize each line (Default value = None
+        => LINE_NPOINT_D for the segments and ARC_NPOINT_D for the arcs)
+    is_end : bool
+        False to return the end points only for the last line (for a path
+        where the end of each line is the begin of the next line)
+
+    Returns
+    -------
+    point_array : ndarray
+        Complex coordinates of the points of all the lines (line after line)
+
+    Raises
+    ------
+    NbPointLineBatchError
+        nb_point must be an integer >=0
+    """
+
+    if nb_point is None:
+        nb_point = where(self.line_type == 0, LINE_NPOINT_D, ARC_NPOINT_D)
+    else:
+        if not isinstance(nb_point, int):
+            raise NbPointLineBatchError("discretize : nb_point must be an integer")
+        if nb_point < 0:
+            raise NbPointLineBatchError("nb_point must be >=0")
+        nb_point = full(self.line_type.size, nb_point)
+
+    # Line and parameter (from 0 at begin to 1 at end) of each point
+    count = nb_point + 2
+    line = repeat(arange(count.size), count)
+    t = (arange(line.size) - repeat(cumsum(count) - count, count)) / (count[line] - 1)
+
+    if not is_end and line.size > 0:
+        # Remove the last point of each line but the last one
+        is_kept = ones(line.size, dtype=bool)
+        is_kept[cumsum(count)[:-1] - 1] = False
+        line, t = line[is_kept], t[is_kept]
+
+    Z1, Z2 = self.begin[line], self.end[line]
+    point_array = zeros(line.size, dtype=complex)
+    is_arc = self.line_type[line] != 0
+    ind = nonzero(~is_arc)[0]
+    point_array[ind] = Z1[ind] - (Z1[ind] - Z2[ind]) * t[ind]
+    ind = nonzero(is_arc)[0]
+    Zc = self.center[line[ind]]
+    point_array[ind] = (Z1[ind] - Zc) * exp(1j * self.angle[line[ind]] * t[ind]) + Zc
+    return point_array
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+from ....Classes.Arc1 import Arc1
+from ....Classes.Arc2 import Arc2
+from ....Classes.Arc3 import Arc3
+from ....Classes.Segment import Segment
+
+
+def get_lines(self):
+    """Create the line objects of the batch
+
+    Parameters
+    ----------
+    self : LineBatch
+        A LineBatch object
+
+    Returns
+    -------
+    line_list : list
+        List of Segment, Arc1, Arc2 and Arc3 objects
+    """
+
+    line_list = list()
+    for line_type, Z1, Z2, Zc, R, alpha, prop_dict in zip(
+        self.line_type.tolist(),
+        self.begin.tolist(),
+        self.end.tolist(),
+        self.center.tolist(),
+        self.radius.tolist(),
+        self.angle.tolist(),
+        self.prop_dict,
+    ):
+        if prop_dict is not None:
+            prop_dict = prop_dict.copy()
+        if line_type == 0:
+            line = Segment(begin=Z1, end=Z2, prop_dict=prop_dict)
+        elif line_type == 1:
+            line = Arc1(
+                begin=Z1,
+                end=Z2,
+                radius=R,
+                is_trigo_direction=alpha > 0,
+                prop_dict=prop_dict,
+            )
+        elif line_type == 2:
+            line = Arc2(begin=Z1, center=Zc, angle=alpha, prop_dict=prop_dict)
+        else:
+            line = Arc3(
+                begin=Z1, end=Z2, is_trigo_direction=alpha > 0, prop_dict=prop_dict
+            )
+        line_list.append(line)
+    return line_list
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from ....Functions.Geometry.inter_line_line import find_line_eq
+
+
+def intersect_line(self, Z1, Z2):
+    """Return the coordinates of the intersections of all the lines with a
+    line defined by two complex (cf Segment.intersect_line and
+    Arc.intersect_line)
+
+    Parameters
+    ----------
+    self : LineBatch
+        A LineBatch object
+    Z1 : complex
+        Complex coordinate of a point on the line
+    Z2 : complex
+        Complex coordinate of another point on the line
+
+    Returns
+    -------
+    Z_int : ndarray
+        Complex coordinates of the intersections (0, 1 or 2 per line, in the
+        same order as the intersect_line method of the line)
+    line_index : ndarray
+        Index of the line of each intersection
+    """
+
+    N = self.line_type.size
+    Z_cand = np.zeros((N, 2), dtype=complex)
+    is_valid = np.zeros((N, 2), dtype=bool)
+
+    # Segments
+    ind = np.nonzero(self.line_type == 0)[0]
+    Z3, Z4 = self.begin[ind], self.end[ind]
+    Z12, Z13, Z14 = Z1 - Z2, Z1 - Z3, Z1 - Z4
+    # The segments on the line return [begin, end]
+    is_aligned = (Z12.real * Z13.imag - Z12.imag * Z13.real == 0) & (
+        Z12.real * Z14.imag - Z12.imag * Z14.real == 0
+    )
+    (A1, B1, C1) = find_line_eq(Z1, Z2)
+    (A2, B2, C2) = find_line_eq(Z3, Z4)
+    D = A1 * B2 - B1 * A2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Z_inter = (C1 * B2 - B1 * C2) / D + 1j * (A1 * C2 - C1 * A2) / D
+    # Is the intersection between begin and end
+    L = np.abs(Z4 - Z3)
+    D3, D4 = np.abs(Z_inter - Z3), np.abs(Z_inter - Z4)
+    is_on_seg = ((D3 <= L) & (D4 <= L)) | (D3 <= 1e-6) | (D4 <= 1e-6)
+    Z_cand[ind, 0] = np.where(is_aligned, Z3, Z_inter)
+    is_valid[ind, 0] = is_aligned | ((D != 0) & is_on_seg)
+    Z_cand[ind, 1] = Z4
+    is_valid[ind, 1] = is_aligned
+
+    # Arcs: intersections with the full circles (cf inter_line_circle)
+    ind = np.nonzero(self.line_type != 0)[0]
+    Zc = self.center[ind]
+    R = np.abs(self.radius[ind])
+    P1, P2 = Z1 - Zc, Z2 - Zc
+    dx = P2.real - P1.real
+    dy = P2.imag - P1.imag
+    dr2 = dx ** 2 + dy ** 2
+    D = P1.real * P2.imag - P2.real * P1.imag
+    delta = R ** 2 * dr2 - D ** 2
+    sq = np.sqrt(np.maximum(delta, 0))
+    xs1 = np.where(dy < 0, D * dy - dx * sq, D * dy + dx * sq) / dr2
+    xs2 = np.where(dy < 0, D * dy + dx * sq, D * dy - dx * sq) / dr2
+    ys1 = (-D * dx + np.abs(dy) * sq) / dr2
+    ys2 = (-D * dx - np.abs(dy) * sq) / dr2
+    Z_arc = np.stack((xs1 + 1j * ys1 + Zc, xs2 + 1j * ys2 + Zc), axis=1)
+    is_arc_valid = np.stack((delta >= 0, delta > 0), axis=1)
+
+    # Keep only the points actually on the arcs (cf Arc.is_on_line)
+    begin, end = self.begin[ind, None], self.end[ind, None]
+    alpha = self.angle[ind, None]
+    Zc, R = Zc[:, None], R[:, None]
+    rot = np.exp(-1j * np.angle(begin - Zc))
+    A_end = np.angle((end - Zc) * rot) % (2 * np.pi)
+    A_arc = np.angle((Z_arc - Zc) * rot) % (2 * np.pi)
+    is_arc_valid &= np.abs(np.abs(Z_arc - Zc) - R) <= 1e-6
+    is_arc_valid &= (
+        (np.abs(Z_arc - begin) < 1e-6)
+        | (np.abs(Z_arc - end) < 1e-6)
+        | np.where(alpha > 0, A_end > A_arc, A_arc > A_end)
+    )
+
+    # Order the intersection points (begin=>intersect1=>intersection2=>end)
+    is_begin = np.abs(Z_arc - begin) < 1e-6
+    is_swap = np.where(
+        is_begin[:, 0],
+        False,
+        is_begin[:, 1]
+        | np.where(
+            alpha[:, 0] > 0, A_arc[:, 0] > A_arc[:, 1], A_arc[:, 1] > A_arc[:, 0]
+        ),
+    )
+    is_swap &= is_arc_valid[:, 0] & is_arc_valid[:, 1]
+    Z_arc[is_swap] = Z_arc[is_swap, ::-1]
+    Z_cand[ind] = Z_arc
+    is_valid[ind] = is_arc_valid
+
+    line_index = np.nonzero(is_valid)[0]
+    return Z_cand[is_valid], line_index
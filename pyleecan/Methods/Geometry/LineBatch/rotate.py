@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+from numpy import exp
+
+from ....Methods.Geometry.LineBatch import AngleRotationLineBatchError
+
+
+def rotate(self, angle):
+    """Rotation of all the lines of angle
+
+    Parameters
+    ----------
+    self : LineBatch
+        A LineBatch object
+    angle : float
+        the angle of rotation [rad]
+
+    Returns
+    -------
+    None
+    """
+    if not isinstance(angle, float) and not isinstance(angle, int):
+        raise AngleRotationLineBatchError("The angle must be a float or int")
+
+    rot = exp(1j * angle)
+    self.begin = self.begin * rot
+    self.end = self.end * rot
+    self.center = self.center * rot
@@ -0,0 +1,25 @@
+from numpy import where
+
+
+def scale(self, scale_factor):
+    """Scale the coordinates of all the lines
+
+    Parameters
+    ----------
+    self : LineBatch
+        A LineBatch object
+    scale_factor : float
+        the Scale factor [-]
+
+    Returns
+    -------
+    None
+    """
+
+    self.begin = self.begin * scale_factor
+    self.end = self.end * scale_factor
+    self.center = self.center * scale_factor
+    # Arc1 radius is signed (cf Arc1.scale)
+    self.radius = self.radius * where(
+        self.line_type == 1, scale_factor, abs(scale_factor)
+    )
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+from ....Methods.Geometry.LineBatch import PointTranslateLineBatchError
+
+
+def translate(self, Zt):
+    """Translate all the lines
+
+    Parameters
+    ----------
+    self : LineBatch
+        A LineBatch object
+    Zt : complex
+        Complex value for translation
+
+    Returns
+    -------
+    None
+    """
+    if (
+        not isinstance(Zt, complex)
+        and not isinstance(Zt, int)
+        and not isinstance(Zt, float)
+    ):
+        raise PointTranslateLineBatchError(
+            "The point must be a complex number or int or float"
+        )
+
+    self.begin = self.begin + Zt
+    self.end = self.end + Zt
+    # The center of the segments stays 0
+    self.center = self.center + Zt * (self.line_type != 0)
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+from ....Methods.Geometry.LineBatch import LINE_TYPE_LIST
+
+
+def update_lines(self, line_list):
+    """Set the coordinates of the batch in a list of lines of the same types
+    (for instance to apply a transformation of the batch to the lines it was
+    created from)
+
+    Parameters
+    ----------
+    self : LineBatch
+        A LineBatch object
+    line_list : list
+        List of lines to update (same types as the lines of the batch)
+
+    Returns
+    -------
+    None
+    """
+
+    for line, line_type, Z1, Z2, Zc, R in zip(
+        line_list,
+        self.line_type.tolist(),
+        self.begin.tolist(),
+        self.end.tolist(),
+        self.center.tolist(),
+        self.radius.tolist(),
+    ):
+        if type(line).__name__ != LINE_TYPE_LIST[line_type]:
+            raise TypeError(
+                "update_lines: can't update a "
+                + type(line).__name__
+                + " with a "
+                + LINE_TYPE_LIST[line_type]
+            )
+        line.begin = Z1
+        if line_type == 2:  # Arc2
+            line.center = Zc
+        else:
+            line.end = Z2
+        if line_type == 1:  # Arc1
+            line.radius = R
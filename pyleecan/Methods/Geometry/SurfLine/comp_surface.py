@@ -1,16 +1,17 @@
 # -*- coding: utf-8 -*-
-from ....Functions.Geometry.comp_surface_num import comp_surface_num
+from numpy import sin, sum as np_sum
 
 
 def comp_surface(self, Ndisc=200):
-    """Compute the SurfLine surface
+    """Compute the SurfLine surface: shoelace formula on the chords of the
+    lines plus the circular segments between the chords and the arcs
 
     Parameters
     ----------
     self : SurfLine
         A SurfLine object
     Ndisc : int
-        Number of point to discretize the lines
+        Not used (the surface is computed analytically)
 
     Returns
     -------
@@ -19,7 +20,16 @@ def comp_surface(self, Ndisc=200):
 
     """
 
-    # Discretize the surface with lots of points to compute the surface numerically
-    point_list = self.discretize(Ndisc)
+    polyline = self.get_polyline()
+    Z1, Z2 = polyline["begin"], polyline["end"]
+    if Z1.size == 0:
+        return 0
 
-    return comp_surface_num(point_list)
+    # Signed area of the polygon (closed by the last point if needed)
+    S = np_sum(Z1.real * Z2.imag - Z1.imag * Z2.real)
+    S += Z2[-1].real * Z1[0].imag - Z2[-1].imag * Z1[0].real
+    # Signed area of the circular segments (0 for the segments)
+    R, alpha = polyline["radius"], polyline["angle"]
+    S += np_sum(R ** 2 * (alpha - sin(alpha)))
+
+    return abs(S) / 2
@@ -1,4 +1,7 @@
 # -*-- coding: utf-8 -*
+from ....Functions.Geometry.get_line_batch import get_line_batch, is_line_batch
+
+
 def discretize(self, Npoint=-1):
     """Returns the discretize version of the SurfLine
 
@@ -23,6 +26,18 @@ def discretize(self, Npoint=-1):
     else:
         closed = False
 
+    if is_line_batch(lines):
+        # Discretize all the lines at once (the end of each line is the begin
+        # of the next one)
+        batch = get_line_batch(lines)
+        if Npoint == -1:
+            point_array = batch.discretize(is_end=False)
+        else:
+            point_array = batch.discretize(Npoint, is_end=False)
+        if closed:  # if the SurfLine is closed
+            point_array = point_array[:-1]
+        return point_array.tolist()
+
     point_list = list()
     for line in lines:
         if Npoint == -1:
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
+import numpy as np
 from matplotlib.patches import Polygon
 from ....definitions import config_dict
+from ....Functions.Geometry.get_line_batch import get_line_batch, is_line_batch
 
 PATCH_COLOR = config_dict["PLOT"]["COLOR_DICT"]["PATCH_COLOR"]
 PATCH_EDGE = config_dict["PLOT"]["COLOR_DICT"]["PATCH_EDGE"]
@@ -50,20 +52,12 @@ def get_patches(
     if len(line_list) == 0:
         return Polygon([], facecolor=color, edgecolor=edgecolor, hatch=hatch)
 
-    Z_list = list()
-    # For each Line discretize
-    for line in line_list:
-        Z_list += list(line.discretize())
-
-    # abscissa coordinate
-    Zr_list = list()
-    # ordinate coordinate
-    Zi_list = list()
-
-    for ii in range(len(Z_list)):
-        Zr_list.append(Z_list[ii].real)
-        Zi_list.append(Z_list[ii].imag)
-    point_list = list(zip(Zr_list, Zi_list))
+    if is_line_batch(line_list):
+        # Discretize all the lines at once
+        Z_array = get_line_batch(line_list).discretize()
+    else:
+        Z_array = np.concatenate([line.discretize() for line in line_list])
+    point_list = list(zip(Z_array.real.tolist(), Z_array.imag.tolist()))
     return [
         Polygon(
             point_list,
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+from numpy import abs as np_abs, array, ceil, exp, pi
+
+from ....Classes.Arc import Arc
+
+# Maximum angle of the sub-arcs of the polyline [rad]
+ARC_ANGLE_MAX = pi / 2
+
+
+def get_polyline(self):
+    """Return the polyline of the surface: the lines are replaced by their
+    chords, the arcs are split in sub-arcs of angle lower than pi/2 so that the
+    region between each chord and its sub-arc is a convex circular segment.
+    The polyline is computed at the first call and stored in the cache of the
+    surface (it is computed again if the lines are modified).
+
+    Parameters
+    ----------
+    self : Surface
+        A Surface object
+
+    Returns
+    -------
+    polyline : dict
+        "begin", "end": complex coordinates of the chords (Ne,),
+        "is_arc": True if the chord is the chord of a sub-arc (Ne,),
+        "center", "radius", "angle": center, radius and signed angle of the
+        sub-arcs (0 for the segments) (Ne,)
+    """
+
+    line_list = self.get_lines()
+    state = [
+        (line.get_begin(), line.get_end(), line.get_angle())
+        if isinstance(line, Arc)
+        else (line.get_begin(), line.get_end())
+        for line in line_list
+    ]
+    cache = self._get_cache()
+    polyline = cache.get("polyline")
+    if polyline is not None and polyline["state"] == state:
+        return polyline
+
+    begin, end, is_arc, center, radius, alpha = [], [], [], [], [], []
+    for line, line_state in zip(line_list, state):
+        if isinstance(line, Arc):
+            Zc = line.get_center()
+            Z1 = line_state[0] - Zc
+            N = max(int(ceil(abs(line_state[2]) / ARC_ANGLE_MAX)), 1)
+            angle = line_state[2] / N
+            Zlist = [Zc + Z1 * exp(1j * angle * ii) for ii in range(N)]
+            Zlist.append(line_state[1])
+            begin.extend(Zlist[:-1])
+            end.extend(Zlist[1:])
+            is_arc.extend([True] * N)
+            center.extend([Zc] * N)
+            radius.extend([np_abs(Z1)] * N)
+            alpha.extend([angle] * N)
+        else:
+            begin.append(line_state[0])
+            end.append(line_state[1])
+            is_arc.append(False)
+            center.append(0)
+            radius.append(0)
+            alpha.append(0)
+
+    polyline = {
+        "begin": array(begin, dtype=complex),
+        "end": array(end, dtype=complex),
+        "is_arc": array(is_arc, dtype=bool),
+        "center": array(center, dtype=complex),
+        "radius": array(radius, dtype=float),
+        "angle": array(alpha, dtype=float),
+        "state": state,
+    }
+    cache["polyline"] = polyline
+    return polyline
@@ -9,6 +9,7 @@ from ....Classes.Arc1 import Arc1
 from ....Classes.Segment import Segment
 from ....Functions.labels import update_RTS_index
 from ....Functions.Geometry.transform_hole_surf import transform_hole_surf
+from ....Functions.get_memo import get_memo
 
 
 def build_geometry(self, sym=1, alpha=0, delta=0, is_circular_radius=False):
@@ -34,6 +35,20 @@ def build_geometry(self, sym=1, alpha=0, delta=0, is_circular_radius=False):
 
     """
 
+    return get_memo(
+        self,
+        _build_geometry,
+        sym=sym,
+        alpha=alpha,
+        delta=delta,
+        is_circular_radius=is_circular_radius,
+        memo_key=self.get_label(),
+    )
+
+
+def _build_geometry(self, sym=1, alpha=0, delta=0, is_circular_radius=False):
+    """Build the geometry of the lamination (cf build_geometry, without the memo)"""
+
     # getting the Lamination surface
     surf_list = Lamination.build_geometry(
         self, sym=sym, alpha=alpha, delta=delta, is_circular_radius=is_circular_radius
@@ -2,6 +2,7 @@ from ....Functions.Geometry.merge_notch_list import merge_notch_list
 from ....Classes.Arc1 import Arc1
 from numpy import exp, pi
 from ....Classes.Lamination import Lamination
+from ....Functions.Geometry.rotate_copy import rotate_copy
 
 
 def get_bore_desc(self, sym=1, prop_dict=None):
@@ -123,6 +124,17 @@ def get_bore_desc(self, sym=1, prop_dict=None):
         )
         bore_desc.insert(0, bore_dict)
 
+    # Copy the slot lines for all the slots at once
+    copy_dict = dict()
+    slot_desc = [bore for bore in bore_desc if "lines" in bore]
+    for lines in {id(bore["lines"]): bore["lines"] for bore in slot_desc}.values():
+        desc_list = [bore for bore in slot_desc if bore["lines"] is lines]
+        angle_list = [
+            (bore["begin_angle"] + bore["end_angle"]) / 2 for bore in desc_list
+        ]
+        for bore, new_lines in zip(desc_list, rotate_copy(lines, angle_list)):
+            copy_dict[id(bore)] = new_lines
+
     # Convert the description to lines
     bore_lines = list()
     for bore in bore_desc:
@@ -134,9 +146,7 @@ def get_bore_desc(self, sym=1, prop_dict=None):
                 bore["obj"].prop_dict.update(prop_dict)
             bore_lines.append(bore["obj"])
         elif "lines" in bore:  # Duplicated slot
-            for line in bore["lines"]:
-                bore_lines.append(line.copy())
-                bore_lines[-1].rotate((bore["begin_angle"] + bore["end_angle"]) / 2)
+            bore_lines.extend(copy_dict[id(bore)])
         else:  # Notches
             lines = bore["obj"].build_geometry()
             for line in lines:
@@ -2,6 +2,8 @@
 
 from numpy import pi
 from ....Classes.LamSlot import LamSlot
+from ....Functions.get_memo import GEO_SKIP_ATTR, get_memo
+from ....Functions.Geometry.is_surface_num import is_surface_num
 
 
 def comp_surfaces(self):
@@ -19,6 +21,13 @@ def comp_surfaces(self):
 
     """
 
+    if is_surface_num(self):
+        return get_memo(self, _comp_surfaces, skip_attr=GEO_SKIP_ATTR)
+    return _comp_surfaces(self)
+
+
+def _comp_surfaces(self):
+    """Compute the surfaces of the lamination (cf comp_surfaces, without the memo)"""
     S_dict = LamSlot.comp_surfaces(self)
     Smag = self.slot.comp_surface_active()
 
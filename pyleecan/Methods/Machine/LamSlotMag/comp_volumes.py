@@ -2,6 +2,8 @@
 
 from numpy import pi
 from ....Classes.LamSlot import LamSlot
+from ....Functions.get_memo import GEO_SKIP_ATTR, get_memo
+from ....Functions.Geometry.is_surface_num import is_surface_num
 
 
 def comp_volumes(self):
@@ -19,6 +21,13 @@ def comp_volumes(self):
 
     """
 
+    if is_surface_num(self):
+        return get_memo(self, _comp_volumes, skip_attr=GEO_SKIP_ATTR)
+    return _comp_volumes(self)
+
+
+def _comp_volumes(self):
+    """Compute the volumes of the lamination (cf comp_volumes, without the memo)"""
     V_dict = LamSlot.comp_volumes(self)
     Vmag = self.slot.comp_surface_active() * self.magnet.Lmag
 
@@ -1,13 +1,16 @@
 # -*- coding: utf-8 -*-
 
-from numpy import linspace, meshgrid, pi, repeat, sum as np_sum, zeros, mean
+from numpy import array, concatenate, linspace, pi, sum as np_sum, mean
 
-from ....Functions.Winding.comp_cond_function import comp_cond_function
+from ....Functions.get_memo import get_memo
+from ....Functions.Winding.comp_cond_function_sum import comp_cond_function_sum
 
 
 def comp_wind_function(self, angle=None, Na=2048, alpha_mmf0=0, per_a=1):
     """Computation of the winding function for the lamination.
-    By convention a tooth is centered on the X axis
+    By convention a tooth is centered on the X axis. The winding function is
+    stored in the lamination cache (computed again if the lamination or the
+    arguments are modified)
 
     Parameters
     ----------
@@ -28,13 +31,24 @@ def comp_wind_function(self, angle=None, Na=2048, alpha_mmf0=0, per_a=1):
         Winding function Matrix (qs,Na)
     """
 
+    return get_memo(
+        self,
+        _comp_wind_function,
+        angle=angle,
+        Na=Na,
+        alpha_mmf0=alpha_mmf0,
+        per_a=per_a,
+    )
+
+
+def _comp_wind_function(self, angle=None, Na=2048, alpha_mmf0=0, per_a=1):
+    """Computation of the winding function for the lamination (cf
+    comp_wind_function, without the memo)"""
+
     # Space discretization
     if angle is None:
         angle = linspace(0, pi * 2 / per_a, Na, endpoint=False)
-    else:
-        Na = angle.size
 
-    qs = self.winding.qs  # number of phases
     # Number of point on rad and tan direction
     Nrad, Ntan = self.winding.get_dim_wind()
     Zs = self.get_Zs()  # Number of slot
@@ -56,26 +70,23 @@ def comp_wind_function(self, angle=None, Na=2048, alpha_mmf0=0, per_a=1):
     if alpha_mmf0 != 0:
         angle = (angle - alpha_mmf0) % (2 * pi)
 
-    wf = zeros((qs, Na))
-    for ii, slot in enumerate(slot_list):
-        slot_angle = slot.comp_angle_active_eq()
-        slot_opening = slot.comp_angle_opening()
-        for n in range(Ntan):
-            # [Na, Zs]
+    # Angle, slot opening and winding matrix of each conductor (layer n of
+    # each slot)
+    alpha_cond, W0 = list(), list()
+    for n in range(Ntan):
+        for ii, slot in enumerate(slot_list):
+            slot_angle = slot.comp_angle_active_eq()
             alpha_lay = linspace(
                 -slot_angle / 2, slot_angle / 2, Ntan + 1, endpoint=False
             )[1:]
-            Xalpha_slot, Xangle = meshgrid(alpha_slot[ii] + alpha_lay[n], angle)
-
-            Xwind = zeros((1, Zs0, qs))
-            Xwind[0, :, :] = wind_mat[n, 0:Zs0, :]
-            # Extended winding matrix [Na, Zs, qs]
-            Xwind = repeat(Xwind, Na, axis=0)
-            # Single winding function in every slot and angle for nth layer [Na, Zs]
-            Xwf = -0.5 * comp_cond_function(Xalpha_slot, slot_opening, Xangle)
-
-            for q in range(qs):
-                wf[q, :] += np_sum(Xwind[n, ii, q] * Xwf, axis=1)
+            alpha_cond.append(alpha_slot[ii] + alpha_lay[n])
+            W0.append(slot.comp_angle_opening())
+    wind_cond = concatenate(
+        [wind_mat[n, 0 : len(slot_list), :] for n in range(Ntan)], axis=0
+    )
+
+    # Sum of the single conductor winding functions of each phase [qs, Na]
+    wf = comp_cond_function_sum(array(alpha_cond), array(W0), wind_cond, angle)
 
     if per_a > 1:
         wf = wf - mean(wf, axis=1)[:, None]
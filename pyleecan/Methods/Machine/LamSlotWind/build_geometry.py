@@ -5,6 +5,8 @@ from ....Classes.Winding import Winding
 from ....Methods import NotImplementedYetError
 from ....Classes.LamSlot import LamSlot
 from ....Functions.labels import update_RTS_index
+from ....Functions.get_memo import get_memo
+from ....Functions.Geometry.rotate_copy import rotate_copy
 
 
 def build_geometry(self, sym=1, alpha=0, delta=0, is_circular_radius=False):
@@ -29,6 +31,20 @@ def build_geometry(self, sym=1, alpha=0, delta=0, is_circular_radius=False):
         list of surfaces needed to draw the lamination
 
     """
+
+    return get_memo(
+        self,
+        _build_geometry,
+        sym=sym,
+        alpha=alpha,
+        delta=delta,
+        is_circular_radius=is_circular_radius,
+        memo_key=self.get_label(),
+    )
+
+
+def _build_geometry(self, sym=1, alpha=0, delta=0, is_circular_radius=False):
+    """Build the geometry of the lamination (cf build_geometry, without the memo)"""
     # getting the Lamination surface
     surf_lam = LamSlot.build_geometry(
         self, sym=sym, alpha=alpha, delta=delta, is_circular_radius=is_circular_radius
@@ -65,28 +81,20 @@ def build_geometry(self, sym=1, alpha=0, delta=0, is_circular_radius=False):
             + " slots and sym="
             + str(sym)
         )
-        for ii in range(Zs // sym):  # for each slot
-            # for each part of the winding surface in the slot
-            for surf in surf_Wind:
-                new_surf = type(surf)(init_dict=surf.as_dict())
-                # changing the slot reference number
-                new_surf.label = update_RTS_index(label=surf.label, S_id=ii)
-                new_surf.rotate(ii * angle)
-                surf_list.append(new_surf)
-        # Add wedges if any
+        # Copy the winding and wedges surfaces of the first slot for each slot
+        # (shift to have a tooth center on Ox)
+        slot_surf = list(surf_Wind)
         if self.slot.wedge_mat is not None:
-            wedge_list = self.slot.get_surface_wedges()
-            for ii in range(Zs // sym):  # for each slot
-                # for each wedges surface in the slot
-                for surf in wedge_list:
-                    new_surf = type(surf)(init_dict=surf.as_dict())
+            slot_surf.extend(self.slot.get_surface_wedges())
+        angle_list = [ii * angle + pi / Zs for ii in range(Zs // sym)]
+        copy_list = rotate_copy(slot_surf, angle_list)
+        # Winding surfaces first, then the wedges
+        for start, stop in [(0, len(surf_Wind)), (len(surf_Wind), len(slot_surf))]:
+            for ii, new_list in enumerate(copy_list):
+                for new_surf in new_list[start:stop]:
                     # changing the slot reference number
-                    new_surf.label = update_RTS_index(label=surf.label, S_id=ii)
-                    new_surf.rotate(ii * angle)
+                    new_surf.label = update_RTS_index(label=new_surf.label, S_id=ii)
                     surf_list.append(new_surf)
-        # Shift to have a tooth center on Ox
-        for surf in surf_list:
-            surf.rotate(pi / Zs)
 
     surf_list = surf_lam + surf_list
 
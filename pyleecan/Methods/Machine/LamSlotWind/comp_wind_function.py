@@ -1,11 +1,14 @@
-from numpy import linspace, meshgrid, pi, repeat, sum as np_sum, zeros, mean
+from numpy import linspace, pi, sum as np_sum, mean
 
-from ....Functions.Winding.comp_cond_function import comp_cond_function
+from ....Functions.get_memo import get_memo
+from ....Functions.Winding.comp_cond_function_sum import comp_cond_function_sum
 
 
 def comp_wind_function(self, angle=None, Na=2048, alpha_mmf0=0, per_a=1):
     """Computation of the winding function for the lamination.
-    By convention a tooth is centered on the X axis
+    By convention a tooth is centered on the X axis. The winding function is
+    stored in the lamination cache (computed again if the lamination or the
+    arguments are modified)
 
     Parameters
     ----------
@@ -26,11 +29,57 @@ def comp_wind_function(self, angle=None, Na=2048, alpha_mmf0=0, per_a=1):
         Winding function Matrix (qs,Na)
     """
 
+    return get_memo(
+        self,
+        _comp_wind_function,
+        angle=angle,
+        Na=Na,
+        alpha_mmf0=alpha_mmf0,
+        per_a=per_a,
+    )
+
+
+def _comp_wind_function(self, angle=None, Na=2048, alpha_mmf0=0, per_a=1):
+    """Computation of the winding function for the lamination (cf
+    comp_wind_function, without the memo)"""
+
     # Space discretization
     if angle is None:
         angle = linspace(0, pi * 2 / per_a, Na, endpoint=False)
-    else:
-        Na = angle.size
+
+    if alpha_mmf0 != 0:
+        angle = (angle - alpha_mmf0) % (2 * pi)
+
+    # Sum of the single conductor winding functions of each phase [qs, Na]
+    alpha_cond, slot_opening, wind_cond = _comp_cond(self, per_a=per_a)
+    wf = comp_cond_function_sum(alpha_cond, slot_opening, wind_cond, angle)
+
+    if per_a > 1:
+        wf = wf - mean(wf, axis=1)[:, None]
+
+    return wf
+
+
+def _comp_cond(self, per_a=1):
+    """Compute the position, the slot opening and the winding matrix of the
+    conductors (layers in the tangential direction of the slots)
+
+    Parameters
+    ----------
+    self : LamSlotWind
+        A LamSlotWind object
+    per_a : int
+        Spatial periodicity factor (conductors of the first Zs/per_a slots)
+
+    Returns
+    -------
+    alpha_cond : ndarray
+        angular position of the conductors [rad] (Nc,)
+    slot_opening : float
+        slot opening angular width [rad]
+    wind_cond : ndarray
+        Number of turns of each phase in each conductor (Nc, qs)
+    """
 
     qs = self.winding.qs  # number of phases
     # Number of point on rad and tan direction
@@ -52,26 +101,8 @@ def comp_wind_function(self, angle=None, Na=2048, alpha_mmf0=0, per_a=1):
     # angle of the lay in a slot (Nlay point, end and begin excluded)
     alpha_lay = linspace(-slot_angle / 2, slot_angle / 2, Ntan + 1, endpoint=False)[1:]
 
-    if alpha_mmf0 != 0:
-        angle = (angle - alpha_mmf0) % (2 * pi)
-
-    wf = zeros((qs, Na))
-    for n in range(Ntan):
-        # [Na, Zs]
-        Xalpha_slot, Xangle = meshgrid(alpha_slot + alpha_lay[n], angle)
-
-        Xwind = zeros((1, Zs0, qs))
-        Xwind[0, :, :] = wind_mat[n, 0:Zs0, :]
-        # Extended winding matrix [Na, Zs, qs]
-        Xwind = repeat(Xwind, Na, axis=0)
-        # Single winding function in every slot and angle for nth layer [Na, Zs]
-        Xwf = -0.5 * comp_cond_function(Xalpha_slot, slot_opening, Xangle)
-
-        for q in range(qs):
-            # winding function of qth phase (sum over layers) [qs, Na]
-            wf[q, :] += np_sum(Xwind[:, :, q] * Xwf, axis=1)
+    # Conductor of the layer n in the slot z is n*Zs0+z
+    alpha_cond = (alpha_lay[:, None] + alpha_slot[None, :]).ravel()
+    wind_cond = wind_mat[:, 0:Zs0, :].reshape(Ntan * Zs0, qs)
 
-    if per_a > 1:
-        wf = wf - mean(wf, axis=1)[:, None]
-
-    return wf
+    return alpha_cond, slot_opening, wind_cond
@@ -0,0 +1,41 @@
+from numpy import abs as np_abs, asarray, exp, sum as np_sum
+
+from ....Functions.Winding.comp_cond_function_harm import comp_cond_function_harm
+from ....Methods.Machine.LamSlotWind.comp_wind_function import _comp_cond
+
+
+def comp_wind_harmonics(self, wavenumber, alpha_mmf0=0):
+    """Analytic computation of the space harmonics of the winding function
+    (cf comp_wind_function with per_a=1) and of the winding factors, without
+    discretizing the angle (for high harmonic orders / large Na)
+
+    Parameters
+    ----------
+    self : LamSlotWind
+        A LamSlotWind object
+    wavenumber : ndarray
+        Space harmonic orders (positive integers) (Nr,)
+    alpha_mmf0 : float
+        Angle to shift the winding function (Default value = 0)
+
+    Returns
+    -------
+    wf_harm: ndarray
+        Complex amplitude of the harmonics of the winding function of each
+        phase (qs, Nr): wf(angle) = sum_r Re(wf_harm[:, r] * exp(1j*r*angle))
+    ksi: ndarray
+        Winding factor of each phase for each harmonic (qs, Nr)
+    """
+
+    wavenumber = asarray(wavenumber)
+    alpha_cond, slot_opening, wind_cond = _comp_cond(self, per_a=1)
+
+    wf_harm = comp_cond_function_harm(alpha_cond, slot_opening, wind_cond, wavenumber)
+    if alpha_mmf0 != 0:
+        wf_harm = wf_harm * exp(-1j * wavenumber * alpha_mmf0)[None, :]
+
+    # Winding factor: sum of the turns phasors over the total number of turns
+    phasor = exp(-1j * wavenumber[None, :] * alpha_cond[:, None])
+    ksi = np_abs(wind_cond.T @ phasor) / np_sum(np_abs(wind_cond), axis=0)[:, None]
+
+    return wf_harm, ksi
@@ -2,6 +2,7 @@
 from ....Functions.labels import WIND_LAB, BAR_LAB
 
 from ....Classes.LamSlotWind import LamSlotWind
+from ....Functions.get_memo import get_memo
 
 
 def build_geometry(self, sym=1, alpha=0, delta=0, is_circular_radius=False):
@@ -26,6 +27,20 @@ def build_geometry(self, sym=1, alpha=0, delta=0, is_circular_radius=False):
         list of surfaces
 
     """
+
+    return get_memo(
+        self,
+        _build_geometry,
+        sym=sym,
+        alpha=alpha,
+        delta=delta,
+        is_circular_radius=is_circular_radius,
+        memo_key=self.get_label(),
+    )
+
+
+def _build_geometry(self, sym=1, alpha=0, delta=0, is_circular_radius=False):
+    """Build the geometry of the lamination (cf build_geometry, without the memo)"""
     surf_list = LamSlotWind.build_geometry(
         self, sym=sym, is_circular_radius=is_circular_radius, alpha=alpha, delta=delta
     )
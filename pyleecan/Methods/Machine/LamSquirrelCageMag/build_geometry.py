@@ -2,6 +2,8 @@
 from numpy import pi
 from ....Classes.LamSquirrelCage import LamSquirrelCage
 from ....Functions.labels import HOLEV_LAB, HOLEM_LAB, update_RTS_index
+from ....Functions.get_memo import get_memo
+from ....Functions.Geometry.rotate_copy import rotate_copy
 
 
 def build_geometry(self, sym=1, alpha=0, delta=0, is_circular_radius=False):
@@ -27,6 +29,20 @@ def build_geometry(self, sym=1, alpha=0, delta=0, is_circular_radius=False):
 
     """
 
+    return get_memo(
+        self,
+        _build_geometry,
+        sym=sym,
+        alpha=alpha,
+        delta=delta,
+        is_circular_radius=is_circular_radius,
+        memo_key=self.get_label(),
+    )
+
+
+def _build_geometry(self, sym=1, alpha=0, delta=0, is_circular_radius=False):
+    """Build the geometry of the lamination (cf build_geometry, without the memo)"""
+
     # Lamination label
     if self.is_stator:
         label = "Lamination_Stator"
@@ -54,11 +70,10 @@ def build_geometry(self, sym=1, alpha=0, delta=0, is_circular_radius=False):
 
         hole_surf_list = list()
         # Copy the hole for Zh / sym
-        for ii in range(Zh // sym):
-            for surf in surf_hole:
-                new_surf = type(surf)(init_dict=surf.as_dict())
+        copy_list = rotate_copy(surf_hole, [ii * angle for ii in range(Zh // sym)])
+        for ii, new_list in enumerate(copy_list):
+            for new_surf in new_list:
                 new_surf.label = update_RTS_index(label=new_surf.label, S_id=ii)
-                new_surf.rotate(ii * angle)
                 hole_surf_list.append(new_surf)
 
     # Apply the transformations
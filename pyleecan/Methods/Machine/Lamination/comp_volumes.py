@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
 from numpy import pi
+from ....Functions.get_memo import GEO_SKIP_ATTR, get_memo
+from ....Functions.Geometry.is_surface_num import is_surface_num
 
 
 def comp_volumes(self):
@@ -18,6 +20,13 @@ def comp_volumes(self):
 
     """
 
+    if is_surface_num(self):
+        return get_memo(self, _comp_volumes, skip_attr=GEO_SKIP_ATTR)
+    return _comp_volumes(self)
+
+
+def _comp_volumes(self):
+    """Compute the volumes of the lamination (cf comp_volumes, without the memo)"""
     Lf = self.comp_length()  # Include radial ventilation ducts
 
     S_dict = self.comp_surfaces()
@@ -1,6 +1,22 @@
+from os import stat
+
+from ....Functions.get_memo import SKIP_ATTR, StateKeyError, comp_state_key
+from ....Functions.path_tools import abs_file_path
+
+# B(H) curves of the materials (shared by the copies of the materials):
+# {state key: (BH, state of ModelBH after the fit)}
+BH_CACHE = dict()
+# Maximum number of B(H) curves stored
+NB_BH_MAX = 32
+
+
 def get_BH(self):
     """Return the B(H) curve of the material according to the Import object.
     If there is no B(H) curve linear data are computed from mur_lin.
+    The curve (read and fitted once) is stored in a cache shared by all the
+    materials with the same BH_curve, ModelBH and is_BH_extrapolate (for
+    instance the copies of the material in a VarSimu). The curve is not stored
+    if these properties can't be compared (cf comp_state_key).
 
     Parameters
     ----------
@@ -14,6 +30,45 @@ def get_BH(self):
 
     """
 
+    try:
+        key = comp_BH_key(self)
+    except StateKeyError:
+        return comp_BH(self)
+    if key in BH_CACHE:
+        BH, model_state = BH_CACHE.pop(key)
+        BH_CACHE[key] = (BH, model_state)  # Last used at the end
+        if model_state is not None:
+            # fit_model sets the parameters of ModelBH
+            self.ModelBH.__dict__.update(model_state)
+        return BH.copy()
+
+    BH = comp_BH(self)
+
+    if BH is not None:
+        if self.ModelBH is None:
+            model_state = None
+        else:
+            model_state = {
+                name: value
+                for name, value in self.ModelBH.__dict__.items()
+                if name not in SKIP_ATTR
+            }
+        if len(BH_CACHE) >= NB_BH_MAX:
+            BH_CACHE.pop(next(iter(BH_CACHE)))
+        BH_CACHE[key] = (BH.copy(), model_state)
+        # The fit and the import can update their properties
+        try:
+            new_key = comp_BH_key(self)
+        except StateKeyError:
+            new_key = key
+        if new_key != key:
+            BH_CACHE[new_key] = BH_CACHE[key]
+    return BH
+
+
+def comp_BH(self):
+    """Read (and fit) the B(H) curve of the material (cf get_BH)"""
+
     if self.BH_curve is not None:
         BH = self.BH_curve.get_data()
 
@@ -40,6 +95,23 @@ def get_BH(self):
     return BH
 
 
+def comp_BH_key(self):
+    """Compute the key of the B(H) curve of the material in BH_CACHE: state
+    of the properties used by get_BH (and of the imported file if any)"""
+
+    file_key = None
+    file_path = getattr(self.BH_curve, "file_path", None)
+    if file_path:
+        try:
+            file_stat = stat(abs_file_path(file_path, is_check=False))
+            file_key = (file_stat.st_mtime_ns, file_stat.st_size)
+        except OSError:
+            pass
+    return comp_state_key(
+        (self.BH_curve, self.ModelBH, self.is_BH_extrapolate, file_key)
+    )
+
+
 class BHShapeError(Exception):
     """Raised when the BH curve has not the expected shape"""
 
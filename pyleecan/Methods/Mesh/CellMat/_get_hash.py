@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def _get_hash(self):
+    """Return the hash of the cells: the cells are stored in a dict according
+    to their sorted node indices. The connectivity and the indices are stored
+    in buffers with extra capacity to add cells without reallocation.
+
+    The hash is built at the first call and updated by add_cells. It is rebuilt
+    if the connectivity or indice array are replaced (it is not updated if they
+    are modified in place).
+
+    Parameters
+    ----------
+    self : CellMat
+        an CellMat object
+
+    Returns
+    -------
+    hash_dict : dict
+        "key_dict": {sorted node indices tuple: cell position},
+        "connect_buffer" / "indice_buffer": connectivity / indices buffers,
+        "nb_cell": number of cells in the buffers,
+        "connectivity" / "indice": arrays used to build the hash
+    """
+
+    cache = self._get_cache()
+    hash_dict = cache.get("hash")
+    if (
+        hash_dict is not None
+        and hash_dict["connectivity"] is self.connectivity
+        and hash_dict["indice"] is self.indice
+    ):
+        return hash_dict
+
+    # Cells already defined (a single cell can be stored as a 1D array)
+    connect = self.connectivity
+    if connect is None or connect.size == 0:
+        connect = np.zeros((0, self.nb_node_per_cell), dtype=int)
+    elif connect.ndim == 1:
+        connect = connect[None, :]
+    nb_cell = connect.shape[0]
+    if self.indice is None or self.indice.size != nb_cell:
+        indice = np.arange(nb_cell, dtype=int)
+    else:
+        indice = np.array(self.indice, dtype=int).ravel()
+
+    key_list = np.sort(connect, axis=1).tolist()
+    hash_dict = {
+        "key_dict": {tuple(key): pos for pos, key in enumerate(key_list)},
+        "connect_buffer": np.array(connect, dtype=int),
+        "indice_buffer": indice,
+        "nb_cell": nb_cell,
+        "connectivity": self.connectivity,
+        "indice": self.indice,
+    }
+    cache["hash"] = hash_dict
+    return hash_dict
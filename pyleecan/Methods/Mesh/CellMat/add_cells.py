@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def add_cells(self, connectivity, indice):
+    """Add several cells at once. The cells that already exist (same nodes in
+    any order), the duplicated cells of the array and the cells with a wrong
+    number of distinct nodes are not added.
+
+    Parameters
+    ----------
+    self : CellMat
+        an CellMat object
+    connectivity : ndarray
+        Node indices of the cells (N, nb_node_per_cell)
+    indice : ndarray or int
+        Indices of the new cells (N,) or indice of the first created cell (the
+        created cells are numbered successively)
+
+    Returns
+    -------
+    is_created : ndarray
+        False if the cell already exist or if it is not possible to add it (N,)
+    """
+
+    connectivity = np.array(connectivity, dtype=int)
+    if connectivity.ndim == 1:
+        connectivity = connectivity[None, :]
+    N = connectivity.shape[0]
+    is_created = np.zeros(N, dtype=bool)
+    if N == 0 or connectivity.shape[1] != self.nb_node_per_cell:
+        return is_created
+
+    # Cells with distinct nodes
+    key_array = np.sort(connectivity, axis=1)
+    is_valid = np.all(key_array[:, 1:] != key_array[:, :-1], axis=1)
+
+    hash_dict = self._get_hash()
+    key_dict = hash_dict["key_dict"]
+    nb_cell = hash_dict["nb_cell"]
+    for ii, key in enumerate(key_array.tolist()):
+        key = tuple(key)
+        if is_valid[ii] and key not in key_dict:
+            key_dict[key] = nb_cell
+            is_created[ii] = True
+            nb_cell += 1
+    if nb_cell == hash_dict["nb_cell"]:
+        return is_created
+
+    # Grow the buffers (the capacity is doubled)
+    nb_cell_init = hash_dict["nb_cell"]
+    capacity = hash_dict["connect_buffer"].shape[0]
+    if nb_cell > capacity:
+        capacity = max(2 * capacity, nb_cell, 16)
+        for name in ["connect_buffer", "indice_buffer"]:
+            buffer = hash_dict[name]
+            hash_dict[name] = np.zeros(
+                (capacity,) + buffer.shape[1:], dtype=buffer.dtype
+            )
+            hash_dict[name][:nb_cell_init] = buffer[:nb_cell_init]
+    hash_dict["connect_buffer"][nb_cell_init:nb_cell] = connectivity[is_created]
+    if np.ndim(indice) == 0:
+        indice = np.arange(indice, indice + nb_cell - nb_cell_init)
+    else:
+        indice = np.array(indice, dtype=int).ravel()[is_created]
+    hash_dict["indice_buffer"][nb_cell_init:nb_cell] = indice
+    hash_dict["nb_cell"] = nb_cell
+
+    # The properties are views of the buffers (a single cell is stored as a 1D
+    # array)
+    if nb_cell == 1:
+        self.connectivity = hash_dict["connect_buffer"][0]
+    else:
+        self.connectivity = hash_dict["connect_buffer"][:nb_cell]
+    self.indice = hash_dict["indice_buffer"][:nb_cell]
+    self.nb_cell = nb_cell
+    hash_dict["connectivity"] = self.connectivity
+    hash_dict["indice"] = self.indice
+
+    return is_created
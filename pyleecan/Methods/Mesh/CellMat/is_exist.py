@@ -20,16 +20,7 @@ def is_exist(self, connectivity):
             True if the element already exist
     """
 
-    # Check the existence of the element
-    e = np.array([], dtype=int)
-    for nd_tag in connectivity:
-        e = np.concatenate((e, self.get_node2cell(nd_tag)))
-
-    unique, unique_counts = np.unique(e, return_counts=True)
-    for ie in range(len(unique)):
-        if unique_counts[ie] == self.nb_node_per_cell and unique_counts[ie] == len(
-            connectivity
-        ):
-            # If this condition is valid, the element already exist
-            return True
-    return False
+    if len(connectivity) != self.nb_node_per_cell:
+        return False
+    key = tuple(np.sort(np.array(connectivity, dtype=int)).tolist())
+    return key in self._get_hash()["key_dict"]
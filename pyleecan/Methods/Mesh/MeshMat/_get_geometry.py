@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def _get_geometry(self):
+    """Return the geometry cache of the mesh: the vertices of the cells and the
+    quantities computed from them (areas, centers, jacobians, cell locator...).
+    The quantities are computed at the first request and stored in the dict,
+    the arrays of all the cell types are concatenated in the order of the cell
+    dict.
+
+    The cache is emptied if the node coordinates or indices or the cells
+    connectivity or indices are replaced (it is not updated if they are
+    modified in place).
+
+    Parameters
+    ----------
+    self : MeshMat
+        an MeshMat object
+
+    Returns
+    -------
+    geo_dict : dict
+        "vertice": {cell type: vertices (Nc, nb_node_per_cell, dim)},
+        "slice": {cell type: slice of the cell type in the concatenated arrays},
+        "indice": indices of the cells (N,), "coordinate": node coordinates,
+        "state": objects used to build the cache
+    """
+
+    state = [self.node.coordinate, self.node.indice] + [
+        (key, cell.connectivity, cell.indice) for key, cell in self.cell.items()
+    ]
+    cache = self._get_cache()
+    geo_dict = cache.get("geometry")
+    if geo_dict is not None and is_same_state(state, geo_dict["state"]):
+        return geo_dict
+
+    # Position of the nodes from their indices
+    if self.node.coordinate is None or np.size(self.node.coordinate) == 0:
+        coord = np.zeros((0, 2))
+    else:
+        coord = np.atleast_2d(self.node.coordinate)
+    node_indice = self.node.indice
+    if node_indice is not None and np.size(node_indice) == coord.shape[0]:
+        node_indice = np.reshape(node_indice, -1)
+        node_order = np.argsort(node_indice, kind="stable")
+        node_sorted = node_indice[node_order]
+    else:
+        node_order = None
+
+    vertice_dict = dict()
+    slice_dict = dict()
+    indice_list = list()
+    nb_cell = 0
+    for key, cell in self.cell.items():
+        if cell.connectivity is None or np.size(cell.connectivity) == 0:
+            continue
+        connect = np.reshape(cell.connectivity, (-1, cell.nb_node_per_cell))
+        if node_order is not None:
+            connect = node_order[np.searchsorted(node_sorted, connect)]
+        vertice_dict[key] = coord[connect]
+        slice_dict[key] = slice(nb_cell, nb_cell + connect.shape[0])
+        indice_list.append(np.reshape(cell.indice, -1))
+        nb_cell += connect.shape[0]
+
+    if len(indice_list) > 0:
+        indice = np.concatenate(indice_list)
+    else:
+        indice = np.zeros(0, dtype=int)
+
+    geo_dict = {
+        "state": state,
+        "vertice": vertice_dict,
+        "slice": slice_dict,
+        "indice": indice,
+        "indice_order": np.argsort(indice, kind="stable"),
+        "coordinate": coord,
+        "node_order": node_order,
+        "node_sorted": node_sorted if node_order is not None else None,
+    }
+    cache["geometry"] = geo_dict
+    return geo_dict
+
+
+def get_position(geo_dict, indices):
+    """Return the position of cells in the concatenated arrays of the geometry
+    cache (the indices that are not in the mesh are skipped)
+
+    Parameters
+    ----------
+    geo_dict : dict
+        Geometry cache of the mesh (cf _get_geometry)
+    indices : array_like
+        Indices of the cells (e.g. a group of a MeshSolution)
+
+    Returns
+    -------
+    pos : ndarray
+        Position of the cells
+    """
+    indices = np.reshape(np.asarray(indices, dtype=int), -1)
+    order = geo_dict["indice_order"]
+    indice_sorted = geo_dict["indice"][order]
+    if indice_sorted.size == 0:
+        return np.zeros(0, dtype=int)
+    pos = np.minimum(np.searchsorted(indice_sorted, indices), indice_sorted.size - 1)
+    is_found = indice_sorted[pos] == indices
+    return order[pos[is_found]]
+
+
+def get_node_position(geo_dict, node_indice):
+    """Return the position of nodes in the coordinate array from their indices
+
+    Parameters
+    ----------
+    geo_dict : dict
+        Geometry cache of the mesh (cf _get_geometry)
+    node_indice : ndarray
+        Indices of the nodes
+
+    Returns
+    -------
+    pos : ndarray
+        Position of the nodes (same shape as node_indice)
+    """
+    if geo_dict["node_order"] is None:
+        return node_indice
+    return geo_dict["node_order"][np.searchsorted(geo_dict["node_sorted"], node_indice)]
+
+
+def is_same_state(state, state_ref):
+    """Return True if the arrays of the mesh have not been replaced since the
+    state state_ref was stored (identity check)"""
+    if len(state) != len(state_ref):
+        return False
+    for obj, obj_ref in zip(state, state_ref):
+        if isinstance(obj, tuple):
+            if obj[0] != obj_ref[0] or any(
+                o is not o_ref for o, o_ref in zip(obj[1:], obj_ref[1:])
+            ):
+                return False
+        elif obj is not obj_ref:
+            return False
+    return True
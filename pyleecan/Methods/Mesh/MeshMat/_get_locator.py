@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def _get_locator(self):
+    """Return the cell locator of the mesh: for each cell type, the cells are
+    stored in the buckets of a regular grid according to their bounding box
+    (enlarged by the precision criterion of the reference cell). The cells that
+    may contain a point are the cells of the bucket of the point.
+
+    The locator is built at the first call and stored in the geometry cache of
+    the mesh (cf _get_geometry).
+
+    Parameters
+    ----------
+    self : MeshMat
+        an MeshMat object
+
+    Returns
+    -------
+    locator_dict : dict
+        Dict with one dict per cell type with a reference cell: "vertice": cells
+        vertices (Nc, nb_node_per_cell, 2), "indice": cells indices (Nc,),
+        "origin": grid origin (2,), "step": grid step, "shape": number of
+        buckets along x and y, "start": position of the first cell of each
+        bucket in "cell" (nb_bucket + 1,), "cell": cell positions sorted by
+        bucket
+    """
+
+    geo_dict = self._get_geometry()
+    if "locator" in geo_dict:
+        return geo_dict["locator"]
+
+    locator_dict = dict()
+    for key, vertice in geo_dict["vertice"].items():
+        interp = self.cell[key].interpolation
+        if interp is None or interp.ref_cell is None:
+            continue
+        vertice = vertice[:, :, 0:2]
+        Nc = vertice.shape[0]
+
+        # Bounding boxes of the cells with the precision margin
+        bb_min = vertice.min(axis=1)
+        bb_max = vertice.max(axis=1)
+        size = (bb_max - bb_min).max(axis=1)
+        margin = interp.ref_cell.epsilon * 2 * size
+        bb_min = bb_min - margin[:, None]
+        bb_max = bb_max + margin[:, None]
+
+        # Grid step: mean size of the cells, at most 4 buckets per cell
+        origin = bb_min.min(axis=0)
+        length = bb_max.max(axis=0) - origin
+        step = max(size.mean(), np.sqrt(length[0] * length[1] / (4 * Nc)))
+        if step <= 0:
+            step = max(length.max(), 1)
+        shape = (np.floor(length / step) + 1).astype(int)
+
+        # Buckets of each cell (all the buckets of its bounding box)
+        i_min = np.floor((bb_min - origin) / step).astype(int)
+        i_max = np.minimum(np.floor((bb_max - origin) / step).astype(int), shape - 1)
+        nb_x = i_max[:, 0] - i_min[:, 0] + 1
+        nb_bucket = nb_x * (i_max[:, 1] - i_min[:, 1] + 1)
+        cell_rep = np.repeat(np.arange(Nc), nb_bucket)
+        offset = np.arange(cell_rep.size) - np.repeat(
+            np.cumsum(nb_bucket) - nb_bucket, nb_bucket
+        )
+        ix = i_min[cell_rep, 0] + offset % nb_x[cell_rep]
+        iy = i_min[cell_rep, 1] + offset // nb_x[cell_rep]
+        bucket = ix * shape[1] + iy
+        order = np.argsort(bucket, kind="stable")
+
+        locator_dict[key] = {
+            "vertice": vertice,
+            "indice": geo_dict["indice"][geo_dict["slice"][key]],
+            "origin": origin,
+            "step": step,
+            "shape": shape,
+            "start": np.searchsorted(bucket[order], np.arange(shape.prod() + 1)),
+            "cell": cell_rep[order],
+        }
+
+    geo_dict["locator"] = locator_dict
+    return locator_dict
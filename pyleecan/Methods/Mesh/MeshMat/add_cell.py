@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import numpy as np
+
 
 def add_cell(self, node_indices, cell_type):
     """Add a new cell defined by node indices and cell type.
@@ -19,17 +21,8 @@ def add_cell(self, node_indices, cell_type):
         indice of the newly created cell. None if the cell already exists.
     """
 
-    # Create the new element
-    new_ind = 0
-    for key in self.cell:  # There should only one solution
-        if self.cell[key].indice is not None and self.cell[key].indice.size > 0:
-            tmp_ind = max(self.cell[key].indice)
-            new_ind = max(new_ind, tmp_ind)
-            new_ind += 1
-
-    test_exist = self.cell[cell_type].add_cell(node_indices, new_ind)
-
-    if test_exist:
-        return new_ind
-    else:
+    cell = self.cell[cell_type]
+    if node_indices is None or np.size(node_indices) != cell.nb_node_per_cell:
         return None
+    new_ind = self.add_cells(np.reshape(node_indices, (1, -1)), cell_type)[0]
+    return None if new_ind == -1 else int(new_ind)
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def add_cells(self, node_indices, cell_type):
+    """Add several cells of the same type at once. The new cells are numbered
+    after the cells of all the types.
+
+    Parameters
+    ----------
+    self : MeshMat
+        an Mesh object
+    node_indices : ndarray
+        Node indices of the cells (N, nb_node_per_cell)
+    cell_type : str
+        Define the type of cell.
+
+    Returns
+    -------
+    new_ind : ndarray
+        Indices of the newly created cells, -1 if the cell already exists or
+        can not be created (N,)
+    """
+
+    node_indices = np.array(node_indices, dtype=int)
+    if node_indices.ndim == 1:
+        node_indices = node_indices[None, :]
+    N = node_indices.shape[0]
+
+    # The indices of the cells are unique among all the types
+    start = 0
+    for cell in self.cell.values():
+        hash_dict = cell._get_hash()
+        if hash_dict["nb_cell"] > 0:
+            start = max(
+                start, hash_dict["indice_buffer"][: hash_dict["nb_cell"]].max() + 1
+            )
+
+    is_created = self.cell[cell_type].add_cells(node_indices, start)
+    new_ind = np.full(N, -1, dtype=int)
+    new_ind[is_created] = np.arange(start, start + is_created.sum())
+    return new_ind
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from ....Classes.RefSegmentP1 import RefSegmentP1
+from ....Classes.RefTriangle3 import RefTriangle3
+
+
+def find_cells(self, points, normal_t=None):
+    """Return the cells containing the target points and the coordinates of the
+    points in the reference cell. All the points are located at once with the
+    cell locator of the mesh (cf _get_locator). If several cells contain a
+    point, the cell in which the point is the most inside is selected.
+
+    Parameters
+    ----------
+    self : MeshMat
+        an MeshMat object
+    points : ndarray
+        coordinates of the target points (N, 2)
+    normal_t : ndarray
+        (optional) normal vector to check the alignment with the cells normals
+
+    Returns
+    -------
+    cell_type : ndarray
+        Type of the cell containing each point, None if the point is outside
+        the mesh (N,)
+    cell_indice : ndarray
+        Indice of the cell containing each point, -1 if the point is outside the
+        mesh (N,)
+    point_ref : ndarray
+        Coordinates of the points in the reference cell, nan if the point is
+        outside the mesh (N, 2)
+    """
+
+    points = np.atleast_2d(np.asarray(points, dtype=float))[:, 0:2]
+    Np = points.shape[0]
+    cell_type = np.full(Np, None, dtype=object)
+    cell_indice = np.full(Np, -1, dtype=int)
+    point_ref = np.full((Np, 2), np.nan)
+
+    locator_dict = self._get_locator()
+    for key, loc in locator_dict.items():
+        ref_cell = self.cell[key].interpolation.ref_cell
+        is_left = cell_indice == -1
+        if not np.any(is_left):
+            break
+
+        # Candidate cells: cells of the bucket of each point
+        pt_left = np.where(is_left)[0]
+        ixy = np.floor((points[pt_left] - loc["origin"]) / loc["step"]).astype(int)
+        is_grid = np.all((ixy >= 0) & (ixy < loc["shape"]), axis=1)
+        pt_left, ixy = pt_left[is_grid], ixy[is_grid]
+        bucket = ixy[:, 0] * loc["shape"][1] + ixy[:, 1]
+        start = loc["start"][bucket]
+        nb_cand = loc["start"][bucket + 1] - start
+        pt_rep = np.repeat(pt_left, nb_cand)
+        offset = np.arange(pt_rep.size) - np.repeat(
+            np.cumsum(nb_cand) - nb_cand, nb_cand
+        )
+        cand = loc["cell"][np.repeat(start, nb_cand) + offset]
+        if cand.size == 0:
+            continue
+
+        # Test all the candidates at once
+        vertice = loc["vertice"][cand]
+        is_inside = ref_cell.is_inside(vertice, points[pt_rep], normal_t)[0]
+        pt_rep, cand, vertice = pt_rep[is_inside], cand[is_inside], vertice[is_inside]
+        ref_pt = ref_cell.get_ref_point(vertice, points[pt_rep])
+
+        # Distance to the cell boundary (in the reference cell)
+        if isinstance(ref_cell, RefTriangle3):
+            score = np.minimum(
+                np.minimum(ref_pt[:, 0], ref_pt[:, 1]), 1 - ref_pt[:, 0] - ref_pt[:, 1]
+            )
+        elif isinstance(ref_cell, RefSegmentP1):
+            score = 1 - np.abs(ref_pt[:, 0]) - np.abs(ref_pt[:, 1])
+        else:
+            score = np.zeros(pt_rep.size)
+
+        # Best cell for each point
+        order = np.lexsort((-score, pt_rep))
+        pt_found, first = np.unique(pt_rep[order], return_index=True)
+        best = order[first]
+        cell_type[pt_found] = key
+        cell_indice[pt_found] = loc["indice"][cand[best]]
+        point_ref[pt_found] = ref_pt[best]
+
+    return cell_type, cell_indice, point_ref
@@ -1,39 +1,44 @@
 # -*- coding: utf-8 -*-
-from numpy import abs, newaxis, array
+import numpy as np
+
+from ._get_geometry import get_position
 
 
 def get_cell_area(self, indices=None):
     """
-    Return the area of the cells on the outer surface.
+    Return the area of the cells on the outer surface. The areas are computed
+    once and stored in the geometry cache of the mesh.
     #TODO address multiple cell type issue, i.e. distracted indices
     Parameters
     ----------
     self : MeshMat
         a MeshMat object
     indices : list
-        list of the points to extract (optional)
+        list of the cell indices to extract (optional, e.g. a group)
     Returns
     -------
     areas: ndarray
         Area of the cells
     """
-    logger = self.get_logger()
-    area = []
-
-    vertices_dict = self.get_vertice(indices=indices)
 
-    for key, vertices in vertices_dict.items():
-        if len(vertices) != 0:
+    geo_dict = self._get_geometry()
+    if "area" not in geo_dict:
+        logger = self.get_logger()
+        area = np.zeros(geo_dict["indice"].size)
+        for key, vertices in geo_dict["vertice"].items():
             try:
-                A = self.cell[key].interpolation.ref_cell.get_cell_area(vertices)
-                A = A.tolist()
+                area[geo_dict["slice"][key]] = self.cell[
+                    key
+                ].interpolation.ref_cell.get_cell_area(vertices)
             except:
                 logger.warning(
                     f'MeshMat: Reference Cell for "{key}" not found. '
                     + "Respective area set to zero."
                 )
-                A = [0 for i in range(vertices.shape[0])]
-
-            area.extend(A)
+        area.flags.writeable = False
+        geo_dict["area"] = area
 
-    return array(area)
+    if indices is None:
+        return geo_dict["area"]
+    else:
+        return geo_dict["area"][get_position(geo_dict, indices)]
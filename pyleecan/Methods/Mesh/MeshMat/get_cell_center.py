@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from ._get_geometry import get_position
+
+
+def get_cell_center(self, indices=None):
+    """Return the centers of the cells (mean of the vertices). The centers are
+    computed once and stored in the geometry cache of the mesh.
+
+    Parameters
+    ----------
+    self : MeshMat
+        a MeshMat object
+    indices : list
+        list of the cell indices to extract (optional, e.g. a group)
+
+    Returns
+    -------
+    center: ndarray
+        Coordinates of the cell centers (N, dim)
+    """
+
+    geo_dict = self._get_geometry()
+    if "center" not in geo_dict:
+        center = np.zeros((geo_dict["indice"].size, geo_dict["coordinate"].shape[1]))
+        for key, vertices in geo_dict["vertice"].items():
+            center[geo_dict["slice"][key]] = vertices.mean(axis=1)
+        center.flags.writeable = False
+        geo_dict["center"] = center
+
+    if indices is None:
+        return geo_dict["center"]
+    else:
+        return geo_dict["center"][get_position(geo_dict, indices)]
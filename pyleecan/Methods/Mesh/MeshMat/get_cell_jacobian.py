@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from ....Classes.RefTriangle3 import RefTriangle3
+from ._get_geometry import get_position
+
+
+def get_cell_jacobian(self, indices=None):
+    """Return the jacobian of the transformation from the reference cell to
+    the cells (computed at the origin of the reference cell, constant for the
+    linear triangles). The jacobians are computed once and stored in the
+    geometry cache of the mesh.
+
+    Parameters
+    ----------
+    self : MeshMat
+        a MeshMat object
+    indices : list
+        list of the cell indices to extract (optional, e.g. a group)
+
+    Returns
+    -------
+    jacob: ndarray
+        Jacobian matrices of the 2D cells (N, 2, 2), nan for the other cells
+    det_jacob: ndarray
+        Jacobian determinants (N,), nan if the reference cell is not defined
+    """
+
+    geo_dict = self._get_geometry()
+    if "jacobian" not in geo_dict:
+        N = geo_dict["indice"].size
+        jacob = np.full((N, 2, 2), np.nan)
+        det_jacob = np.full(N, np.nan)
+        for key, vertices in geo_dict["vertice"].items():
+            interp = self.cell[key].interpolation
+            if interp is None or interp.ref_cell is None:
+                continue
+            ref_cell = interp.ref_cell
+            cell_slice = geo_dict["slice"][key]
+            point = np.zeros(2)
+            if isinstance(ref_cell, RefTriangle3):
+                # All the cells at once
+                jacob[cell_slice], det_jacob[cell_slice] = ref_cell.jacobian(
+                    point, vertices[:, :, 0:2]
+                )
+            else:
+                for ii, vert in zip(
+                    range(cell_slice.start, cell_slice.stop), vertices[:, :, 0:2]
+                ):
+                    jac, det_jacob[ii] = ref_cell.jacobian(point, vert)
+                    if np.shape(jac) == (2, 2):
+                        jacob[ii] = jac
+        jacob.flags.writeable = False
+        det_jacob.flags.writeable = False
+        geo_dict["jacobian"] = (jacob, det_jacob)
+
+    jacob, det_jacob = geo_dict["jacobian"]
+    if indices is None:
+        return jacob, det_jacob
+    else:
+        pos = get_position(geo_dict, indices)
+        return jacob[pos], det_jacob[pos]
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from ._get_geometry import is_same_state
+
+
+def get_edge2cell(self):
+    """Return the edges of the surface cells (cell types with at least 3 nodes
+    per cell) and the cells on each side of the edges. The adjacency is built
+    once and reused until the cells are modified. The boundary edges are the
+    edges with a single cell (edge2cell[:, 1] == -1).
+
+    Parameters
+    ----------
+    self : MeshMat
+        an MeshMat object
+
+    Returns
+    -------
+    edge : ndarray
+        Node indices of the edges (Ne, 2), oriented as in the first cell
+        containing the edge
+    edge2cell : ndarray
+        Indices of the cells on each side of the edges (Ne, 2), -1 if the edge
+        is on the boundary
+    """
+
+    # The cache is rebuilt if the connectivity or the indices are replaced
+    state = [
+        (key, cell.connectivity, cell.indice)
+        for key, cell in self.cell.items()
+        if cell.nb_node_per_cell is not None and cell.nb_node_per_cell >= 3
+    ]
+    cache = self._get_cache()
+    if "edge2cell" in cache:
+        state_cache, edge, edge2cell = cache["edge2cell"]
+        if is_same_state(state, state_cache):
+            return edge, edge2cell
+
+    # Edges of all the cells (polygon sides)
+    edge_list, cell_list = list(), list()
+    for key, connect, indice in state:
+        nb_node = self.cell[key].nb_node_per_cell
+        if connect is None or np.size(connect) == 0:
+            continue
+        connect = np.reshape(connect, (-1, nb_node))
+        edge_list.append(
+            np.stack((connect, np.roll(connect, -1, axis=1)), axis=2).reshape(-1, 2)
+        )
+        cell_list.append(np.repeat(np.reshape(indice, -1), nb_node))
+
+    if len(edge_list) == 0:
+        edge = np.zeros((0, 2), dtype=int)
+        edge2cell = np.zeros((0, 2), dtype=int)
+    else:
+        edge_all = np.concatenate(edge_list)
+        cell_all = np.concatenate(cell_list)
+
+        # Each edge is identified by the sorted node indices
+        key_all = comp_edge_key(edge_all, edge_all.max() + 1)
+        _, first, inverse, count = np.unique(
+            key_all, return_index=True, return_inverse=True, return_counts=True
+        )
+        edge = edge_all[first]
+        edge2cell = np.full((first.size, 2), -1, dtype=int)
+        edge2cell[:, 0] = cell_all[first]
+        # Second occurrence of the edges shared by several cells
+        order = np.argsort(inverse, kind="stable")
+        start = np.cumsum(count) - count
+        is_shared = count > 1
+        edge2cell[is_shared, 1] = cell_all[order[start[is_shared] + 1]]
+
+    cache["edge2cell"] = (state, edge, edge2cell)
+    return edge, edge2cell
+
+
+def comp_edge_key(edge, nb_key):
+    """Return an integer key for each edge independent of the node order
+
+    Parameters
+    ----------
+    edge : ndarray
+        Node indices of the edges (Ne, 2)
+    nb_key : int
+        Number strictly greater than all the node indices
+
+    Returns
+    -------
+    key : ndarray
+        Keys of the edges (Ne,)
+    """
+    edge = np.sort(edge, axis=1).astype(np.int64)
+    return edge[:, 0] * nb_key + edge[:, 1]
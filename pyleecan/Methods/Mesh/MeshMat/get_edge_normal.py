@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from ._get_geometry import get_node_position, get_position
+
+
+def get_edge_normal(self):
+    """Return the unit normals of the edges of the surface cells (same order as
+    get_edge2cell), pointing out of the first cell of each edge (i.e. out of
+    the mesh for the boundary edges). The normals are computed once and stored
+    in the geometry cache of the mesh.
+
+    Parameters
+    ----------
+    self : MeshMat
+        a MeshMat object
+
+    Returns
+    -------
+    normal: ndarray
+        Unit normals of the edges (Ne, 2)
+    length: ndarray
+        Length of the edges (Ne,)
+    """
+
+    geo_dict = self._get_geometry()
+    edge, edge2cell = self.get_edge2cell()
+    if "edge_normal" in geo_dict and geo_dict["edge_normal"][0] is edge:
+        return geo_dict["edge_normal"][1:]
+
+    # Orientation of the cells (sign of the area from the shoelace formula)
+    orient = np.ones(geo_dict["indice"].size)
+    for key, vertices in geo_dict["vertice"].items():
+        if vertices.shape[1] >= 3:
+            x, y = vertices[:, :, 0], vertices[:, :, 1]
+            area = np.sum(x * np.roll(y, -1, axis=1) - np.roll(x, -1, axis=1) * y, 1)
+            orient[geo_dict["slice"][key]] = np.sign(area)
+
+    coord = geo_dict["coordinate"][get_node_position(geo_dict, edge)][:, :, 0:2]
+    tangent = coord[:, 1] - coord[:, 0]
+    length = np.sqrt(np.sum(tangent ** 2, axis=1))
+    # The interior of a counterclockwise cell is on the left of its edges
+    sign = orient[get_position(geo_dict, edge2cell[:, 0])]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normal = (
+            np.stack((tangent[:, 1], -tangent[:, 0]), axis=1) * (sign / length)[:, None]
+        )
+
+    normal.flags.writeable = False
+    length.flags.writeable = False
+    geo_dict["edge_normal"] = (edge, normal, length)
+    return normal, length
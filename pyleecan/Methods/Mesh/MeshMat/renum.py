@@ -1,10 +1,8 @@
 # -*- coding: utf-8 -*-
-import copy
 
 import numpy as np
 
 from pyleecan.Classes.CellMat import CellMat
-from pyleecan.Classes.NodeMat import NodeMat
 
 
 def renum(self):
@@ -21,28 +19,31 @@ def renum(self):
     """
 
     if self._is_renum:
-        coord_init = self.get_node()
-        node_indice = self.get_node_indice()
-        connect_dict, nb_cell, indices = self.get_cell()
-
+        node_indice = np.array(self.get_node_indice(), dtype=int).ravel()
         nb_node_new = len(node_indice)
-        node_indice_new = np.linspace(0, nb_node_new - 1, nb_node_new, dtype=int)
-        connect_dict_new = copy.deepcopy(connect_dict)
-        for inode in range(nb_node_new):
-            for key in connect_dict:
-                connect_dict_new[key][
-                    connect_dict[key] == node_indice[inode]
-                ] = node_indice_new[inode]
+        node_indice_new = np.arange(nb_node_new, dtype=int)
 
-        self.node.indice = node_indice_new
+        # The node indice node_indice[i] becomes i
+        order = np.argsort(node_indice, kind="stable")
+        node_sorted = node_indice[order]
+
+        for key in self.cell:
+            connect = np.array(self.cell[key].connectivity, dtype=int)
+            connect_new = connect.copy()
+            if nb_node_new > 0 and connect.size > 0:
+                pos = np.searchsorted(node_sorted, connect)
+                pos[pos == nb_node_new] = 0
+                is_node = node_sorted[pos] == connect
+                connect_new[is_node] = order[pos[is_node]]
 
-        for key in connect_dict:
             self.cell[key] = CellMat(
-                connectivity=connect_dict_new[key],
-                nb_cell=len(connect_dict_new[key]),
+                connectivity=connect_new,
+                nb_cell=len(connect_new),
                 nb_node_per_cell=self.cell[key].nb_node_per_cell,
                 indice=self.cell[key].indice,
                 interpolation=self.cell[key].interpolation,
             )
 
+        self.node.indice = node_indice_new
+
         self._is_renum = False
@@ -6,18 +6,30 @@ from pyleecan.Classes.CellMat import CellMat
 from pyleecan.Classes.MeshMat import MeshMat
 from pyleecan.Classes.NodeMat import NodeMat
 from pyleecan.Classes.SolutionMat import SolutionMat
+from pyleecan.Functions.MeshSolution.select_indice import get_indice_pos
 
 
-def get_group(self, group_names):
+def get_group(self, group_names, is_view=False):
     """Return all attributes of a MeshSolution object with only the cells, nodes
     and corresponding solutions of the group.
 
+    With is_view, the group is selected with index arrays without copying the
+    mesh and the solutions: the other axes of the solutions are shared with
+    self and the solutions values are read-only (views of the solutions of self
+    when the group indices are contiguous, copies of the group values
+    otherwise). The view groups must not be modified, and the changes of the
+    solutions of self show through the views of the contiguous groups (copy the
+    group to edit it). The data of the group is only copied when it is saved
+    or copied.
+
     Parameters
     ----------
     self : MeshSolution
         an MeshSolution object
     group_name : [str]
         list of the name of the group(s) (e.g. ["stator"])
+    is_view : bool
+        True to select the group without copying the mesh and the solutions
 
     Returns
     -------
@@ -64,6 +76,11 @@ def get_group(self, group_names):
     node_init = mesh_init.get_node()
     mesh_list = list()
     for sep in sep_list:
+        if is_view:
+            mesh_new, node_indice, indice_dict = get_mesh_view(mesh_init, sep)
+            mesh_new.label = label
+            mesh_list.append(mesh_new)
+            continue
         connect_dict, nb_cell, indice_dict = mesh_init.get_cell(sep)
 
         node_indice = list()
@@ -103,7 +120,14 @@ def get_group(self, group_names):
         type_cell_sol = sol.type_cell
 
         new_sol = None
-        if type_cell_sol == "node":
+        if is_view:
+            if type_cell_sol == "node":
+                new_sol = sol.get_solution(indice=node_indice, is_view=True)
+            elif not is_interface and type_cell_sol in indice_dict:
+                new_sol = sol.get_solution(
+                    indice=indice_dict[type_cell_sol], is_view=True
+                )
+        elif type_cell_sol == "node":
             new_sol = sol.get_solution(indice=node_indice.tolist())
         elif not is_interface:  # Interface is only available for node solution.
             new_sol = sol.get_solution(indice=indice_dict[type_cell_sol])
@@ -115,11 +139,16 @@ def get_group(self, group_names):
     if is_interface:
         mesh_interface.clear_node()
         mesh = mesh_interface
+    elif is_view:
+        mesh = mesh_new  # Only the nodes of the group are selected
     else:
         mesh_new.clear_node()
         mesh = mesh_new
 
-    meshsol_grp = self.copy()
+    if is_view:
+        meshsol_grp = type(self)(path=self.path)
+    else:
+        meshsol_grp = self.copy()
     meshsol_grp.label = label
     meshsol_grp.mesh = [mesh]
     meshsol_grp.is_same_mesh = is_same_mesh
@@ -128,3 +157,64 @@ def get_group(self, group_names):
     meshsol_grp.group = self.group
 
     return meshsol_grp
+
+
+def get_mesh_view(mesh_init, indice):
+    """Return a mesh with only the cells of the given indices and their nodes.
+    The cells and nodes are selected with index arrays (no copy of the mesh).
+
+    Parameters
+    ----------
+    mesh_init : MeshMat
+        a MeshMat object
+    indice : ndarray
+        indices of the cells
+
+    Returns
+    -------
+    mesh_new : MeshMat
+        Mesh of the selected cells
+    node_indice : ndarray
+        Indices of the nodes of the selected cells
+    indice_dict : dict
+        Indices of the selected cells for each cell type
+    """
+    mesh_new = MeshMat(
+        _is_renum=True, sym=mesh_init.sym, is_antiper_a=mesh_init.is_antiper_a
+    )
+    indice_dict = dict()
+    node_list = list()
+    for key, cell in mesh_init.cell.items():
+        if cell.indice is None or np.size(cell.indice) == 0:
+            continue
+        pos, is_found = get_indice_pos(cell.indice, indice)
+        pos = pos[is_found]
+        if pos.size == 0:
+            continue
+        connect = np.reshape(cell.connectivity, (-1, cell.nb_node_per_cell))[pos]
+        indice_dict[key] = np.reshape(cell.indice, -1)[pos]
+        mesh_new.cell[key] = CellMat(
+            connectivity=connect if pos.size > 1 else connect[0],
+            nb_cell=pos.size,
+            nb_node_per_cell=cell.nb_node_per_cell,
+            indice=indice_dict[key],
+            interpolation=cell.interpolation,
+        )
+        node_list.append(connect.ravel())
+
+    # Only the nodes of the selected cells
+    if len(node_list) > 0:
+        node_indice = np.unique(np.concatenate(node_list))
+    else:
+        node_indice = np.zeros(0, dtype=int)
+    coord = np.atleast_2d(mesh_init.node.coordinate)
+    if mesh_init.node.indice is None:
+        node_pos = node_indice
+    else:
+        node_pos = get_indice_pos(mesh_init.node.indice, node_indice)[0]
+    mesh_new.node = NodeMat(
+        coordinate=coord[node_pos],
+        nb_node=node_indice.size,
+        indice=node_indice,
+    )
+    return mesh_new, node_indice, indice_dict
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def interpolate(self, points, *args_list, label=None, index=None):
+    """Return the value of a solution at arbitrary points: the nodal solutions
+    are interpolated with the shape functions of the cells containing the
+    points, the cell solutions take the value of the cell. All the points are
+    located at once (cf MeshMat.find_cells).
+
+    Parameters
+    ----------
+    self : MeshSolution
+        an MeshSolution object
+    points : ndarray
+        coordinates of the points (N, 2)
+    *args_list: list of strings
+        List of axes requested by the user, their units and values (optional)
+    label : str
+        a label
+    index : int
+        an index
+
+    Returns
+    -------
+    result : ndarray
+        field at the points with the "indice" axis replaced by the points
+        (first axis), nan for the points outside the mesh
+    """
+
+    solution = self.get_solution(label=label, index=index)
+    mesh = self.get_mesh(label=label, index=index)
+
+    # The "indice" axis is put in first position
+    axes_list = solution.get_axes_list(*args_list)
+    field = solution.get_field(*args_list, is_squeeze=False)
+    field = np.moveaxis(field, axes_list[0].index("indice"), 0)
+
+    points = np.atleast_2d(points)
+    Np = points.shape[0]
+    cell_type, cell_indice, point_ref = mesh.find_cells(points)
+    if np.iscomplexobj(field):
+        result = np.full((Np,) + field.shape[1:], np.nan, dtype=complex)
+    else:
+        result = np.full((Np,) + field.shape[1:], np.nan)
+
+    # Rows of the field from the indices of the nodes or cells
+    sol_indice = getattr(solution, "indice", None)
+    if solution.type_cell == "node":
+        ent_indice = sol_indice if sol_indice is not None else mesh.node.indice
+    elif solution.type_cell in mesh.cell:
+        ent_indice = (
+            sol_indice
+            if sol_indice is not None
+            else mesh.cell[solution.type_cell].indice
+        )
+    else:
+        return result
+    ent_indice = np.reshape(ent_indice, -1)
+    ent_order = np.argsort(ent_indice, kind="stable")
+    ent_sorted = ent_indice[ent_order]
+
+    def get_row(indice):
+        """Rows of the field of the nodes or cells indices"""
+        pos = np.minimum(np.searchsorted(ent_sorted, indice), ent_sorted.size - 1)
+        return ent_order[pos]
+
+    if solution.type_cell != "node":
+        is_found = cell_type == solution.type_cell
+        result[is_found] = field[get_row(cell_indice[is_found])]
+        return result
+
+    for key in mesh.cell:
+        is_found = cell_type == key
+        nb_found = int(is_found.sum())
+        if nb_found == 0:
+            continue
+        cell = mesh.cell[key]
+        connect = np.reshape(cell.connectivity, (-1, cell.nb_node_per_cell))
+        cell_ind = np.reshape(cell.indice, -1)
+        cell_order = np.argsort(cell_ind, kind="stable")
+        cell_row = cell_order[
+            np.searchsorted(cell_ind[cell_order], cell_indice[is_found])
+        ]
+
+        # Shape functions of the cells nodes at the points (Nfound, nb_node_per_cell)
+        values, _ = cell.interpolation.ref_cell.shape_function(
+            point_ref[is_found], nb_found
+        )
+        node_row = get_row(connect[cell_row])
+        result[is_found] = np.einsum("pn,pn...->p...", values[:, 0, :], field[node_row])
+
+    return result
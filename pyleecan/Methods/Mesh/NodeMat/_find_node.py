@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+from itertools import product
+
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
+
+
+def _find_node(self, coord, is_add=False):
+    """Search the nodes closer than delta to the points with the spatial hash
+
+    Parameters
+    ----------
+    self : NodeMat
+        an NodeMat object
+    coord : ndarray
+        Point coordinates (N, dim)
+    is_add : bool
+        True to add the points not found to the hash buffers (the first point of
+        a group of close points is added, the others refer to it)
+
+    Returns
+    -------
+    pos : ndarray
+        Position of the matching node in the hash buffers, -1 if not found (N,)
+    """
+
+    hash_dict = self._get_hash()
+    key_dict = hash_dict["key_dict"]
+    delta = self.delta if self.delta is not None else 0
+    N, dim = coord.shape
+    if N == 0:
+        return np.zeros(0, dtype=int)
+
+    if hash_dict["coord_buffer"].shape[1] != dim:
+        if hash_dict["nb_node"] > 0:
+            return np.full(N, -1, dtype=int)  # Different dimension: no match
+        hash_dict["coord_buffer"] = np.zeros((0, dim))
+
+    if is_add:
+        # Allocate the buffers for the worst case (all the points are new)
+        nb_node = hash_dict["nb_node"]
+        capacity = hash_dict["coord_buffer"].shape[0]
+        if nb_node + N > capacity:
+            capacity = max(2 * capacity, nb_node + N, 16)
+            coord_buffer = np.zeros((capacity, dim))
+            coord_buffer[:nb_node] = hash_dict["coord_buffer"][:nb_node]
+            indice_buffer = np.zeros(capacity, dtype=int)
+            indice_buffer[:nb_node] = hash_dict["indice_buffer"][:nb_node]
+            hash_dict["coord_buffer"] = coord_buffer
+            hash_dict["indice_buffer"] = indice_buffer
+
+    # The points closer than delta are searched once (groups of close points)
+    if N > 1:
+        coord, inverse = group_points(coord, delta)
+    else:
+        inverse = np.zeros(1, dtype=int)
+
+    # Grid cell of the points, the neighbour cells are only searched for the
+    # points closer than delta to the cell boundary
+    coord_step = coord / hash_dict["step"]
+    key_array = np.floor(coord_step)
+    frac = coord_step - key_array
+    ratio = delta / hash_dict["step"]
+    is_low = frac <= ratio
+    is_high = frac >= 1 - ratio
+    is_boundary = np.any(is_low | is_high, axis=1)
+    key_list = [tuple(key) for key in key_array.astype(np.int64).tolist()]
+
+    pos = [-1] * len(key_list)
+    dist2_max = delta ** 2
+    nb_node = hash_dict["nb_node"]
+    new_list = list()  # Index of the points to add
+    for ii, (key, point) in enumerate(zip(key_list, coord.tolist())):
+        # Closest node in the grid cell (and its neighbours)
+        if is_boundary[ii]:
+            cand_list = list()
+            axis_offset = [
+                [0] + [-1] * low + [1] * high
+                for low, high in zip(is_low[ii].tolist(), is_high[ii].tolist())
+            ]
+            for offset in product(*axis_offset):
+                neighbour = tuple([k + o for k, o in zip(key, offset)])
+                cand_list.extend(key_dict.get(neighbour, []))
+        else:
+            cand_list = key_dict.get(key, [])
+        dist2_min = dist2_max
+        for jj, node in cand_list:
+            dist2 = sum([(a - b) ** 2 for a, b in zip(node, point)])
+            if dist2 <= dist2_min:
+                pos[ii], dist2_min = jj, dist2
+        if pos[ii] == -1 and is_add:
+            pos[ii] = nb_node
+            key_dict.setdefault(key, list()).append((nb_node, point))
+            new_list.append(ii)
+            nb_node += 1
+
+    if len(new_list) > 0:
+        hash_dict["coord_buffer"][hash_dict["nb_node"] : nb_node] = coord[new_list]
+        hash_dict["nb_node"] = nb_node
+    return np.array(pos, dtype=int)[inverse.ravel()]
+
+
+def group_points(coord, delta):
+    """Group the points closer than delta (connected components of the pairs
+    of close points)
+
+    Parameters
+    ----------
+    coord : ndarray
+        Point coordinates (N, dim)
+    delta : float
+        Distance to group the points
+
+    Returns
+    -------
+    coord_group : ndarray
+        Coordinates of the first point of each group (Ng, dim)
+    inverse : ndarray
+        Index of the group of each point (N,)
+    """
+    pair = cKDTree(coord).query_pairs(delta, output_type="ndarray")
+    N = coord.shape[0]
+    graph = coo_matrix((np.ones(pair.shape[0]), (pair[:, 0], pair[:, 1])), (N, N))
+    _, label = connected_components(graph, directed=False)
+    _, index, inverse = np.unique(label, return_index=True, return_inverse=True)
+    return coord[index], inverse
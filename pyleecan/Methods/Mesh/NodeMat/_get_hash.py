@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def _get_hash(self):
+    """Return the spatial hash of the nodes: the nodes are stored in a dict
+    according to the cell of a regular grid (grid step 1000 * delta) that
+    contains them, a node closer than delta to a point is in the grid cell of
+    the point or in one of its neighbours if the point is close to the cell
+    boundary. The coordinates and the indices are stored in buffers with extra
+    capacity to add nodes without reallocation.
+
+    The hash is built at the first call and updated by add_nodes. It is rebuilt
+    if the coordinate or indice array are replaced (it is not updated if they
+    are modified in place).
+
+    Parameters
+    ----------
+    self : NodeMat
+        an NodeMat object
+
+    Returns
+    -------
+    hash_dict : dict
+        "key_dict": {grid cell tuple: list of (node position, coordinates)},
+        "coord_buffer" / "indice_buffer": node coordinates / indices buffers,
+        "nb_node": number of nodes in the buffers, "step": grid step,
+        "coordinate" / "indice": arrays used to build the hash
+    """
+
+    cache = self._get_cache()
+    hash_dict = cache.get("hash")
+    if (
+        hash_dict is not None
+        and hash_dict["coordinate"] is self.coordinate
+        and hash_dict["indice"] is self.indice
+    ):
+        return hash_dict
+
+    # Nodes already defined (a single node can be stored as a 1D array)
+    coord = self.coordinate
+    if coord is None or coord.size == 0:
+        coord = np.zeros((0, 0))
+    elif coord.ndim == 1:
+        coord = coord[None, :]
+    nb_node = coord.shape[0]
+    if self.indice is None or self.indice.size != nb_node:
+        indice = np.arange(nb_node, dtype=int)
+    else:
+        indice = np.array(self.indice, dtype=int).ravel()
+
+    delta = self.delta if self.delta is not None and self.delta > 0 else 1e-10
+    hash_dict = {
+        "key_dict": dict(),
+        "coord_buffer": np.array(coord, dtype=float),
+        "indice_buffer": indice,
+        "nb_node": nb_node,
+        "step": 1000 * delta,
+        "coordinate": self.coordinate,
+        "indice": self.indice,
+    }
+    key_dict = hash_dict["key_dict"]
+    key_list = np.floor(coord / hash_dict["step"]).astype(np.int64).tolist()
+    for pos, (key, point) in enumerate(zip(key_list, coord.tolist())):
+        key_dict.setdefault(tuple(key), list()).append((pos, point))
+
+    cache["hash"] = hash_dict
+    return hash_dict
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def add_nodes(self, coord):
+    """Add several nodes at once. The points closer than delta to an existing
+    node (or to another point of the array) are not added.
+
+    Parameters
+    ----------
+    self : NodeMat
+        an NodeMat object
+    coord : ndarray
+        Coordinates of the nodes to add (N, dim)
+
+    Returns
+    -------
+    node_indice : ndarray
+        Indices of the node of each point (existing or new node) (N,)
+    """
+
+    coord = np.array(coord, dtype=float)
+    if coord.ndim == 1:
+        coord = coord[None, :]
+    hash_dict = self._get_hash()
+    nb_node_init = hash_dict["nb_node"]
+    pos = self._find_node(coord, is_add=True)
+
+    # Indices of the new nodes
+    nb_node = hash_dict["nb_node"]
+    indice_buffer = hash_dict["indice_buffer"]
+    if nb_node > nb_node_init:
+        if nb_node_init > 0:
+            start = indice_buffer[:nb_node_init].max() + 1
+        else:
+            start = 0
+        indice_buffer[nb_node_init:nb_node] = np.arange(
+            start, start + nb_node - nb_node_init
+        )
+
+        # The properties are views of the buffers (a single node is stored as a
+        # 1D array)
+        if nb_node == 1:
+            self.coordinate = hash_dict["coord_buffer"][0]
+        else:
+            self.coordinate = hash_dict["coord_buffer"][:nb_node]
+        self.indice = indice_buffer[:nb_node]
+        self.nb_node = nb_node
+        hash_dict["coordinate"] = self.coordinate
+        hash_dict["indice"] = self.indice
+
+    return indice_buffer[pos]
@@ -4,23 +4,32 @@ import numpy as np
 
 
 def get_indice(self, coord=None):
-    """Return the coordinates of node(s).
+    """Return the indices of the nodes or search the nodes closer than delta
+    to points (spatial hash)
 
     Parameters
     ----------
     self : NodeMat
         an NodeMat object
     coord : ndarray
-        a node coordinate
+        a node coordinate (dim,) or several nodes coordinates (N, dim)
 
     Returns
     -------
-    coord: np.array
-        an array of node coordinates
+    indice: int or ndarray
+        Indices of all the nodes if coord is None, indice of the node (None if
+        not found) for one coordinate, indices of the nodes (-1 if not found)
+        for several coordinates
 
     """
 
     if coord is None:
         return self.indice
-    else:
-        pass  # TODO Search for indice of a node from coordiantes
+
+    coord = np.array(coord, dtype=float)
+    pos = self._find_node(np.atleast_2d(coord))
+    indice = np.full(pos.size, -1, dtype=int)
+    indice[pos >= 0] = self._get_hash()["indice_buffer"][pos[pos >= 0]]
+    if coord.ndim == 1:
+        return None if indice[0] == -1 else int(indice[0])
+    return indice
@@ -11,16 +11,17 @@ def get_normal(self, vertice):
     self : RefSegmentP1
         a RefSegmentP1 object
     vertice : ndarray
-        vertice of the cell
+        vertice of the cell (2, 2) or of N cells (N, 2, 2)
 
     Returns
     -------
     normal: ndarray
-        Normal coordinate
+        Normal coordinate (2,) or (N, 2)
     """
 
-    t = vertice[0, :] - vertice[1, :]
-    n = np.cross([t[0], t[1], 0], [0, 0, 1])[0:2]
-    n = n / np.linalg.norm(n)
+    t = vertice[..., 0, 0:2] - vertice[..., 1, 0:2]
+    # Cross product of (t, 0) with the z axis
+    n = np.stack((t[..., 1], -t[..., 0]), axis=-1)
+    n = n / np.linalg.norm(n, axis=-1, keepdims=True)
 
     return n
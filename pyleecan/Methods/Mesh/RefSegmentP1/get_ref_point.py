@@ -11,26 +11,27 @@ def get_ref_point(self, vertice, point):
     self : RefSegmentP1
         a RefSegmentP1 object
     vertice : ndarray
-        vertice of the cell
+        vertice of the cell (2, 2) or of N cells (N, 2, 2)
     point : ndarray
-        coordinates of a point
+        coordinates of a point (2,) or of one point per cell (N, 2)
 
-        Returns
+    Returns
     -------
     pt1_ref : ndarray
-        coordinates of the ref point
+        coordinates of the ref point (2,) or (N, 2)
     """
 
-    point_ref = np.array([0, 0], dtype=float)
-    point_decal = np.array([-1, 0], dtype=float)
-
-    pt1 = point[0:2] - vertice[0, :]
-    pt2 = vertice[1, :] - vertice[0, :]
-    rho2 = np.sqrt(pt2[0] ** 2 + pt2[1] ** 2)
-    phi2 = np.arctan2(pt2[1], pt2[0])
-    Trot = np.array([[np.cos(phi2), np.sin(phi2)], [-np.sin(phi2), np.cos(phi2)]])
-
-    pt1_ref = 2 * np.dot(Trot, pt1) / rho2 + point_decal
-    # pt2_ref =np.dot(Trot, pt2) / rho2 - point_decal
+    vertice = np.asarray(vertice, dtype=float)
+    pt1 = np.asarray(point, dtype=float)[..., 0:2] - vertice[..., 0, 0:2]
+    pt2 = vertice[..., 1, 0:2] - vertice[..., 0, 0:2]
+    rho2 = np.sqrt(pt2[..., 0] ** 2 + pt2[..., 1] ** 2)
+    phi2 = np.arctan2(pt2[..., 1], pt2[..., 0])
+    cos2, sin2 = np.cos(phi2), np.sin(phi2)
+
+    # Rotation in the segment frame, the segment is [-1, 1] on the first axis
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = 2 * (cos2 * pt1[..., 0] + sin2 * pt1[..., 1]) / rho2 - 1
+        t = 2 * (-sin2 * pt1[..., 0] + cos2 * pt1[..., 1]) / rho2
+    pt1_ref = np.stack((s, t), axis=-1)
 
     return pt1_ref
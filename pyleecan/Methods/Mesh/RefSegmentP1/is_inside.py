@@ -11,23 +11,23 @@ def is_inside(self, vertice, point, normal_t=None):
     self : RefSegmentP1
         a RefSegmentP1 object
     vertice : ndarray
-        vertice of the cell
+        vertice of the cell (2, 2) or of N cells (N, 2, 2)
     point : ndarray
-        coordinates of a point
+        coordinates of a point (2,) or of one point per cell (N, 2)
     normal : ndarray
         normal of another cell. Additional facultative criterion.
 
         Returns
     -------
     is_inside : bool
-        true if the point is inside the cell
+        true if the point is inside the cell (array of N bool for N cells)
     """
 
     epsilon = self.epsilon
 
     point_ref = self.get_ref_point(vertice, point)
-    s = point_ref[0]
-    t = point_ref[1]
+    s = point_ref[..., 0]
+    t = point_ref[..., 1]
 
     a = abs(s) - (1 + epsilon)
     b = abs(t) - (epsilon * ((1 - s ** 2) + 1))
@@ -36,7 +36,7 @@ def is_inside(self, vertice, point, normal_t=None):
     # Check that normals are almost aligned
     if normal_t is not None:
         normal_s = self.get_normal(vertice)
-        scal_st = np.dot(normal_t[0:2], normal_s)
+        scal_st = np.matmul(normal_s, normal_t[0:2])
         is_colinear = abs(scal_st) > 1 - 2 * epsilon
         is_inside = is_inside & is_colinear
 
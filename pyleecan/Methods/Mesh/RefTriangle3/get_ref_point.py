@@ -11,18 +11,27 @@ def get_ref_point(self, vertice, point):
     self : RefTriangle3
         a RefTriangle3 object
     vertice : ndarray
-        vertice of the cell
+        vertice of the cell (3, 2) or of N cells (N, 3, 2)
     point : ndarray
-        coordinates of a point
+        coordinates of a point (2,) or of one point per cell (N, 2)
 
-        Returns
+    Returns
     -------
     pt1_ref : ndarray
-        coordinates of the ref point
+        coordinates of the ref point (2,) or (N, 2), nan for degenerated cells
     """
 
-    [jacob, detJ] = self.jacobian(point, vertice)
-    inv_jacob = np.linalg.inv(jacob)
-    point_ref = np.dot((point - vertice[0, :]), inv_jacob)
+    vert = np.asarray(vertice, dtype=float)[..., 0:2]
+    u = vert[..., 1, :] - vert[..., 0, :]
+    v = vert[..., 2, :] - vert[..., 0, :]
+    w = np.asarray(point, dtype=float)[..., 0:2] - vert[..., 0, :]
+
+    # Inverse of the jacobian [u, v]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        det = u[..., 0] * v[..., 1] - u[..., 1] * v[..., 0]
+        s = (w[..., 0] * v[..., 1] - w[..., 1] * v[..., 0]) / det
+        t = (u[..., 0] * w[..., 1] - u[..., 1] * w[..., 0]) / det
+
+    point_ref = np.stack((s, t), axis=-1)
 
     return point_ref
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from numpy import dot
+from numpy import matmul
 
 
 def is_inside(self, vertice, point, normal_t=None):
@@ -10,21 +10,21 @@ def is_inside(self, vertice, point, normal_t=None):
     self : RefTriangle3
         an RefTriangle3 object
     vertice : ndarray
-        vertices of the cell
+        vertices of the cell (3, 2) or of N cells (N, 3, 2)
     point : ndarray
-        coordinates of the checked point
+        coordinates of the checked point (2,) or of one point per cell (N, 2)
     normal_t : ndarray
         (optional) cell normal vector
 
     Returns
     -------
     is_inside: bool
-        true if the point is inside the cell
+        true if the point is inside the cell (array of N bool for N cells)
 
     """
     point_ref = self.get_ref_point(vertice, point)
-    s = point_ref[0]
-    t = point_ref[1]
+    s = point_ref[..., 0]
+    t = point_ref[..., 1]
     a = s
     b = t
     c = 1 - s - t
@@ -33,7 +33,7 @@ def is_inside(self, vertice, point, normal_t=None):
     # Optional : Check that normals are almost aligned
     if normal_t is not None:
         normal_s = self.get_normal(vertice)
-        scal_st = dot(normal_t[0:2], normal_s)
+        scal_st = matmul(normal_s, normal_t[0:2])
         is_colinear = abs(scal_st) > 1 - 2 * self.epsilon
         is_inside = is_inside & is_colinear
 
@@ -9,6 +9,8 @@ def jacobian(self, point, vertice):
     Parameters
     ----------
     :param self : a RefElement object
+    :param point : ref point
+    :param vertice : vertices of the cell (3, 2) or of several cells (N, 3, 2)
 
     Returns
     -------
@@ -16,7 +18,7 @@ def jacobian(self, point, vertice):
     """
 
     grad_func = self.grad_shape_function(point)
-    jacob = np.dot(grad_func, vertice[:, 0:2])
+    jacob = np.matmul(grad_func, vertice[..., 0:2])
     det_jacob = np.linalg.det(jacob)
 
     return jacob, det_jacob
@@ -2,8 +2,10 @@
 from numpy import take
 from SciDataTool import Data1D
 
+from ....Functions.MeshSolution.select_indice import select_data
 
-def get_solution(self, indice=None):
+
+def get_solution(self, indice=None, is_view=False):
     """Return a copy of the solution with the option to only include specified indice.
 
     Parameters
@@ -12,6 +14,10 @@ def get_solution(self, indice=None):
         a SolutionData object
     indice : list
         list of indice, if list is empty or None all indice are included
+    is_view : bool
+        True to only select the indices without copying the solution: the
+        other axes are shared and the values are read-only (view of the
+        solution values when the indices are contiguous)
 
     Returns
     -------
@@ -21,6 +27,9 @@ def get_solution(self, indice=None):
     """
     logger = self.get_logger()
 
+    if is_view and indice is not None and len(indice) > 0:
+        return get_solution_view(self, indice)
+
     # create copy to directly manipulate data
     solution = self.copy()
 
@@ -65,3 +74,20 @@ def get_solution(self, indice=None):
         solution.field.values = field_dict[self.field.symbol]
 
     return solution
+
+
+def get_solution_view(self, indice):
+    """Return a solution with only the specified indices (cf select_data)"""
+    field, is_missing = select_data(self.field, indice, is_view=True)
+    if is_missing:
+        self.get_logger().warning(
+            "At least one input indice is not part of the solution. "
+            + "Respective indice will be skipped."
+        )
+    return type(self)(
+        type_cell=self.type_cell,
+        label=self.label,
+        dimension=self.dimension,
+        unit=self.unit,
+        field=field,
+    )
@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
-from numpy import take, where, array
+from numpy import arange, asarray, reshape
 
+from ....Functions.MeshSolution.select_indice import get_indice_pos, take_indice
 
-def get_solution(self, indice=None):
+
+def get_solution(self, indice=None, is_view=False):
     """Return a copy of the solution with the option to only include specified indices.
 
     Parameters
@@ -11,6 +13,9 @@ def get_solution(self, indice=None):
         a SolutionMat object
     indices : list
         list of indices, if list is empty or None all indices are included
+    is_view : bool
+        True to select a read-only field (view of the field of the solution
+        instead of a copy when the indices are contiguous)
 
     Returns
     -------
@@ -20,7 +25,7 @@ def get_solution(self, indice=None):
     """
     logger = self.get_logger()
 
-    field_sol = self.get_field()
+    field_sol = self.field
     axis_name, axis_size = self.get_axes_list()
     s_indice = self.indice
 
@@ -28,33 +33,32 @@ def get_solution(self, indice=None):
 
     # create indices of solution if None
     if s_indice is None:
-        s_indice = [i for i in range(field_sol.shape[Iindice])]
+        s_indice = arange(field_sol.shape[Iindice])
 
     # check input indices
-    if not indice:
+    if indice is None or len(indice) == 0:
         indice = s_indice
+    indice = reshape(asarray(indice), -1)
 
-    if set(indice) - set(s_indice):
+    pos, is_found = get_indice_pos(s_indice, indice)
+    if not is_found.all():
         logger.warning(
             "At least one input indice is not part of the solution. "
             + "Respective indice will be skipped."
         )
 
     # skip indice that are not part of the solution
-    new_indice = [ii for ii in indice if ii in s_indice]
-
-    # get array index of new_indice
-    array_indice = [where(array(s_indice) == ii)[0][0] for ii in new_indice]
+    new_indice = indice[is_found]
 
     # setup requested solution
     axis_size[Iindice] = len(new_indice)
-    new_field_sol = take(field_sol, array_indice, axis=Iindice)
+    new_field_sol = take_indice(field_sol, pos[is_found], Iindice, is_view=is_view)
 
     solution = type(self)(
         label=self.label,
         type_cell=self.type_cell,
         field=new_field_sol,
-        indice=indice,
+        indice=new_indice,
         axis_name=axis_name,
         axis_size=axis_size,
         dimension=self.dimension,
@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 from numpy import take
+from copy import copy
+
 from SciDataTool import Data1D
 
+from ....Functions.MeshSolution.select_indice import select_data
+
 
-def get_solution(self, indice=None):
+def get_solution(self, indice=None, is_view=False):
     """Return a copy of the solution with the option to only include specified indices.
 
     Parameters
@@ -12,6 +16,10 @@ def get_solution(self, indice=None):
         a SolutionVector object
     indices : list
         list of indices, if list is empty or None all indices are included
+    is_view : bool
+        True to only select the indices without copying the solution: the
+        other axes are shared and the values are read-only (view of the
+        solution values when the indices are contiguous)
 
     Returns
     -------
@@ -21,6 +29,9 @@ def get_solution(self, indice=None):
     """
     logger = self.get_logger()
 
+    if is_view and indice is not None and len(indice) > 0:
+        return get_solution_view(self, indice)
+
     # create copy to directly manipulate data
     solution = self.copy()
 
@@ -67,3 +78,25 @@ def get_solution(self, indice=None):
             field.values = field_dict[field.symbol]
 
     return solution
+
+
+def get_solution_view(self, indice):
+    """Return a solution with only the specified indices (cf select_data)"""
+    field = copy(self.field)
+    field.components = dict()
+    is_missing = False
+    for name, comp in self.field.components.items():
+        field.components[name], is_miss = select_data(comp, indice, is_view=True)
+        is_missing = is_missing or is_miss
+    if is_missing:
+        self.get_logger().warning(
+            "At least one input indice is not part of the solution. "
+            + "Respective indice will be skipped."
+        )
+    return type(self)(
+        type_cell=self.type_cell,
+        label=self.label,
+        dimension=self.dimension,
+        unit=self.unit,
+        field=field,
+    )
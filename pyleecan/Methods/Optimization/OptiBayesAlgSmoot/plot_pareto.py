@@ -15,6 +15,7 @@ def plot_pareto(
     grid=False,
     is_show_fig=True,
     save_path=None,
+    nb_front=1,
 ):
     """Plot the pareto front for 2 objective functions
 
@@ -33,8 +34,19 @@ def plot_pareto(
         True to show figure after plot
     save_path : str
         full path of the png file where the figure is saved if save_path is not None
+    nb_front : int
+        number of successive non dominated fronts to plot (only the pareto
+        front is available for Bayesian optimization: nb_front must be 1)
     """
 
+    if nb_front != 1:
+        raise ValueError(
+            "OptiBayesAlgSmoot.plot_pareto: only the Pareto front is available "
+            + "(nb_front="
+            + str(nb_front)
+            + " instead of 1)"
+        )
+
     # Pyleecan colors
     pyleecan_color = (230 / 255, 175 / 255, 0)
 
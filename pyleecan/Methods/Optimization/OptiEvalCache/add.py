@@ -0,0 +1,25 @@
+def add(self, key, result):
+    """Add the evaluation results of the design variables to the cache (the
+    least recently used evaluations are removed above size_max)
+
+    Parameters
+    ----------
+    self : OptiEvalCache
+        An OptiEvalCache object
+    key : tuple
+        Key of the design variables (cf get_key)
+    result : dict
+        Evaluation results ("fitness", "cstr_viol", "datakeeper" lists)
+
+    Returns
+    -------
+    None
+    """
+
+    eval_dict = self._get_cache().setdefault("eval_dict", dict())
+    eval_dict.pop(key, None)
+    eval_dict[key] = result
+    if self.size_max > 0:
+        # dict keeps the insertion order: the first keys are the least recently used
+        while len(eval_dict) > self.size_max:
+            del eval_dict[next(iter(eval_dict))]
@@ -0,0 +1,14 @@
+def clear(self):
+    """Remove all the evaluations from the cache and reset the statistics
+
+    Parameters
+    ----------
+    self : OptiEvalCache
+        An OptiEvalCache object
+
+    Returns
+    -------
+    None
+    """
+
+    self._clear_cache()
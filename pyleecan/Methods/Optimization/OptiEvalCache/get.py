@@ -0,0 +1,29 @@
+def get(self, key):
+    """Return the evaluation results of the design variables (and update the
+    hit statistics)
+
+    Parameters
+    ----------
+    self : OptiEvalCache
+        An OptiEvalCache object
+    key : tuple
+        Key of the design variables (cf get_key)
+
+    Returns
+    -------
+    result : dict
+        Evaluation results ("fitness", "cstr_viol", "datakeeper" lists in the
+        order of the problem obj_func and datakeeper_list), None if the design
+        variables are not in the cache
+    """
+
+    cache = self._get_cache()
+    eval_dict = cache.setdefault("eval_dict", dict())
+    result = eval_dict.pop(key, None)
+    if result is None:
+        cache["nb_miss"] = cache.get("nb_miss", 0) + 1
+    else:
+        cache["nb_hit"] = cache.get("nb_hit", 0) + 1
+        # Most recently used at the end
+        eval_dict[key] = result
+    return result
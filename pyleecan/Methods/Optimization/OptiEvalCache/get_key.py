@@ -0,0 +1,30 @@
+def get_key(self, value_list):
+    """Return the cache key of the design variables values: the float values
+    are rounded to multiples of tol
+
+    Parameters
+    ----------
+    self : OptiEvalCache
+        An OptiEvalCache object
+    value_list : list
+        Design variables values (individual)
+
+    Returns
+    -------
+    key : tuple
+        Key of the design variables in the cache
+    """
+
+    key = list()
+    for value in value_list:
+        if hasattr(value, "item"):  # numpy scalar
+            value = value.item()
+        if isinstance(value, float) and self.tol > 0:
+            value = int(round(value / self.tol))
+        else:
+            try:
+                hash(value)
+            except TypeError:  # Design variable from a set of lists/arrays
+                value = repr(value)
+        key.append(value)
+    return tuple(key)
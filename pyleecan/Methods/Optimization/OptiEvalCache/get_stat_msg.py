@@ -0,0 +1,24 @@
+def get_stat_msg(self):
+    """Return a message with the hit statistics of the cache
+
+    Parameters
+    ----------
+    self : OptiEvalCache
+        An OptiEvalCache object
+
+    Returns
+    -------
+    msg : str
+        Hit statistics
+    """
+
+    cache = self._get_cache()
+    nb_hit = cache.get("nb_hit", 0)
+    nb_miss = cache.get("nb_miss", 0)
+    if nb_hit + nb_miss > 0:
+        rate = nb_hit * 100 / (nb_hit + nb_miss)
+    else:
+        rate = 0
+    return "Evaluation cache: {} hits, {} misses ({:.1f}% hit rate), {} evaluations stored".format(
+        nb_hit, nb_miss, rate, len(cache.get("eval_dict", dict()))
+    )
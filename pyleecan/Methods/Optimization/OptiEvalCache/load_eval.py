@@ -0,0 +1,43 @@
+from os.path import isfile
+
+from ....Functions.Load.load_pkl import load_pkl
+
+
+def load_eval(self):
+    """Load the evaluations saved in the save_path pkl file (to resume an
+    interrupted optimization). The file is ignored if it was saved with another
+    tolerance or with other objectives/DataKeepers
+
+    Parameters
+    ----------
+    self : OptiEvalCache
+        An OptiEvalCache object
+
+    Returns
+    -------
+    nb_eval : int
+        Number of evaluations loaded
+    """
+
+    if not self.save_path or not isfile(self.save_path):
+        return 0
+
+    save_dict = load_pkl(self.save_path)
+    problem = self.parent
+    obj_symbol = [obj_func.symbol for obj_func in problem.obj_func]
+    dk_symbol = [dk.symbol for dk in problem.datakeeper_list]
+    if (
+        save_dict["tol"] != self.tol
+        or save_dict["obj_func"] != obj_symbol
+        or save_dict["datakeeper"] != dk_symbol
+    ):
+        self.get_logger().warning(
+            "Evaluation cache "
+            + self.save_path
+            + " doesn't match the optimization problem: cache not loaded"
+        )
+        return 0
+
+    for key, result in save_dict["eval_list"]:
+        self.add(key, result)
+    return len(save_dict["eval_list"])
@@ -0,0 +1,29 @@
+from ....Functions.Save.save_pkl import save_pkl
+
+
+def save_eval(self):
+    """Save the cache in the save_path pkl file (nothing to do if save_path is
+    empty)
+
+    Parameters
+    ----------
+    self : OptiEvalCache
+        An OptiEvalCache object
+
+    Returns
+    -------
+    None
+    """
+
+    if not self.save_path:
+        return
+    problem = self.parent
+    save_pkl(
+        {
+            "tol": self.tol,
+            "obj_func": [obj_func.symbol for obj_func in problem.obj_func],
+            "datakeeper": [dk.symbol for dk in problem.datakeeper_list],
+            "eval_list": list(self._get_cache().get("eval_dict", dict()).items()),
+        },
+        self.save_path,
+    )
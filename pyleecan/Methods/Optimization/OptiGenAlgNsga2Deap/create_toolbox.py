@@ -94,6 +94,9 @@ def create_indiv(create, output, design_var_list):
     # Store the number of constraints violations
     ind.cstr_viol = 0
 
+    # True if the results come from the evaluation cache (output not computed)
+    ind.is_cached = False
+
     # Output with the design variables set
     ind.output = type(output)(simu=output.simu.as_dict())
 
@@ -1,6 +1,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from ....Classes.OptiObjective import OptiObjective
+from ....Functions.Optimization.comp_non_dominated import comp_non_dominated
+from ....Functions.Optimization.comp_pareto_rank import comp_pareto_rank
 from ....Methods.Output.XOutput import _get_symbol_data_
 
 
@@ -15,6 +17,7 @@ def plot_pareto(
     grid=False,
     is_show_fig=True,
     save_path=None,
+    nb_front=1,
 ):
     """Plot the pareto front for 2 objective functions
 
@@ -33,6 +36,9 @@ def plot_pareto(
         True to show figure after plot
     save_path : str
         full path of the png file where the figure is saved if save_path is not None
+    nb_front : int
+        number of successive non dominated fronts to plot (colored by front
+        index if c_symbol is None)
     """
     # Pyleecan colors
     pyleecan_color = (230 / 255, 175 / 255, 0)
@@ -62,19 +68,13 @@ def plot_pareto(
     x_values, x_label = _get_symbol_data_(self.xoutput, x_symbol, indx)
     y_values, y_label = _get_symbol_data_(self.xoutput, y_symbol, indx)
 
-    # Get pareto front
-    pareto = fitness
-
-    # Get dominated values
-    idx_non_dom = list(range(len(pareto)))
-    N = len(pareto)
-    for i in range(N):
-        for j in idx_non_dom:
-            if all(pareto[j] <= pareto[i]) and any(pareto[j] < pareto[i]):
-                idx_non_dom.remove(i)
-                break
+    # Get non dominated fronts
+    if nb_front == 1:
+        rank = np.where(comp_non_dominated(fitness), 0, 1)
+    else:
+        rank = comp_pareto_rank(fitness)
+    idx_non_dom = np.where(rank < nb_front)[0]
 
-    pareto = pareto[idx_non_dom]
     design_var_values = design_var[idx_non_dom]
 
     # Write annotations
@@ -98,7 +98,9 @@ def plot_pareto(
         return_ax = True
         fig = ax.get_figure()
 
-    if c_symbol is None:
+    if c_symbol is None and nb_front > 1:
+        colors = rank[idx_non_dom][:, np.newaxis]
+    elif c_symbol is None:
         colors = pyleecan_color
     else:
         # get the color data
@@ -122,6 +124,9 @@ def plot_pareto(
     if c_symbol is not None:
         legend1 = ax.legend(*sc.legend_elements(), loc="upper right", title=c_symbol)
         ax.add_artist(legend1)
+    elif nb_front > 1:
+        legend1 = ax.legend(*sc.legend_elements(), loc="upper right", title="Front")
+        ax.add_artist(legend1)
 
     ax.autoscale(1, 1)
 
@@ -8,10 +8,10 @@ import numpy as np
 from ....Classes.Output import Output
 from ....Classes.XOutput import XOutput
 from ....Classes.DataKeeper import DataKeeper
+from ....Classes.OptiEvalCache import OptiEvalCache
 from ....Classes.ParamExplorerSet import ParamExplorerSet
-from ....Functions.Optimization.evaluate import evaluate
+from ....Functions.Optimization.evaluate_pop import evaluate_pop
 from ....Functions.Optimization.update import update
-from ....Functions.Optimization.check_cstr import check_cstr
 from ....Functions.Optimization.tournamentDCD import tournamentDCD
 
 
@@ -66,6 +66,16 @@ def solve(self):
         # Create the toolbox
         self.create_toolbox()
 
+        # Load the evaluations of a previous optimization
+        if self.problem.eval_cache is not None:
+            nb_eval = self.problem.eval_cache.load_eval()
+            if nb_eval > 0:
+                logger.info(
+                    str(nb_eval)
+                    + " evaluations loaded from "
+                    + self.problem.eval_cache.save_path
+                )
+
         # Add the reference output to multi_output
         if isinstance(self.problem.simu.parent, Output):
             xoutput = XOutput(init_dict=self.problem.simu.parent.as_dict())
@@ -95,23 +105,38 @@ def solve(self):
             # obj_func is a DataKeeper instance
             xoutput.xoutput_dict[obj_func.symbol] = obj_func
 
+        # Design variables in ParamExplorerSet (values set at the end)
+        design_var_list = list()
+        for param_explorer in self.problem.design_var:
+            if param_explorer._setter_str is None:
+                setter = param_explorer._setter_func
+            else:
+                setter = param_explorer._setter_str
+            design_var_list.append(
+                ParamExplorerSet(
+                    name=param_explorer.name,
+                    unit=param_explorer.unit,
+                    symbol=param_explorer.symbol,
+                    setter=setter,
+                    value=list(),
+                )
+            )
+        xoutput.paramexplorer_list.extend(design_var_list)
+
+        # Save the evaluations in the store (the evaluations of the
+        # interrupted optimization are reused through the evaluation cache)
+        eval_cache = self.problem.eval_cache
+        if self.store is not None:
+            init_store(self, xoutput)
+
         # Create the first population
         pop = self.toolbox.population(self.size_pop)
 
-        # Evaluate the population
-        nb_error = 0
-        for i in range(0, self.size_pop):
-            time = datetime.now().strftime("%H:%M:%S")
-            print_gen_simu(time, 0, i, self.size_pop, nb_error, pop)
-            nb_error += evaluate(self, pop[i])
-            print_obj(self.problem.obj_func, pop[i])
-
-        # Check the constraints violation
-        nb_infeasible = 0
-        if len(self.problem.constraint) > 0:
-            time = datetime.now().strftime("%H:%M:%S")
-            for indiv in pop:
-                nb_infeasible += check_cstr(self, indiv) == False
+        # Evaluate the population and check the constraints violation
+        nb_error, nb_infeasible = evaluate_pop(
+            self, pop, 0, print_gen_simu=print_gen_simu, print_obj=print_obj
+        )
+        time = datetime.now().strftime("%H:%M:%S")
         print(
             "\r{}  gen {:>5}: Finished, {:>4} errors,{:>4} infeasible.\n".format(
                 time, 0, nb_error, nb_infeasible
@@ -124,7 +149,8 @@ def solve(self):
             is_valid = indiv.is_simu_valid and indiv.cstr_viol == 0
 
             if self.is_keep_all_output:
-                xoutput.output_list.append(indiv.output)
+                # No Output for the results taken from the evaluation cache
+                xoutput.output_list.append(get_indiv_output(indiv))
 
             # is_valid
             xoutput.xoutput_dict["is_valid"].result.append(is_valid)
@@ -139,6 +165,9 @@ def solve(self):
             # ngen
             xoutput.xoutput_dict["ngen"].result.append(0)
 
+            if self.store is not None:
+                save_indiv(self, xoutput, indiv)
+
         if self.selector == None:
             pop = selNSGA2(pop, self.size_pop)
         else:
@@ -183,19 +212,11 @@ def solve(self):
 
             shape += len(to_eval)
 
-            nb_error = 0
-            for i in range(len(to_eval)):
-                time = datetime.now().strftime("%H:%M:%S")
-                print_gen_simu(time, ngen, i, self.size_pop, nb_error, to_eval)
-                nb_error += evaluate(self, to_eval[i])
-                print_obj(self.problem.obj_func, to_eval[i])
-
-            # Check the constraints violation
-            nb_infeasible = 0
-            if len(self.problem.constraint) > 0:
-                time = datetime.now().strftime("%H:%M:%S")
-                for indiv in to_eval:
-                    nb_infeasible += check_cstr(self, indiv) == False
+            # Evaluate the children and check the constraints violation
+            nb_error, nb_infeasible = evaluate_pop(
+                self, to_eval, ngen, print_gen_simu=print_gen_simu, print_obj=print_obj
+            )
+            time = datetime.now().strftime("%H:%M:%S")
             print(
                 "\r{}  gen {:>5}: Finished, {:>4} errors,{:>4} infeasible.\n".format(
                     time, ngen, nb_error, nb_infeasible
@@ -208,7 +229,8 @@ def solve(self):
                 is_valid = indiv.is_simu_valid and indiv.cstr_viol == 0
 
                 if self.is_keep_all_output:
-                    xoutput.output_list.append(indiv.output)
+                    # No Output for the results taken from the evaluation cache
+                    xoutput.output_list.append(get_indiv_output(indiv))
 
                 # is_valid
                 xoutput.xoutput_dict["is_valid"].result.append(is_valid)
@@ -222,6 +244,9 @@ def solve(self):
                 # ngen
                 xoutput.xoutput_dict["ngen"].result.append(ngen)
 
+                if self.store is not None:
+                    save_indiv(self, xoutput, indiv)
+
             # Sorting the population according to NSGA2
             if self.selector == None:
                 pop = selNSGA2(pop + children, self.size_pop)
@@ -235,20 +260,9 @@ def solve(self):
         xoutput.nb_simu = shape
 
         # Save design variable values in ParamExplorerSet
-        for i, param_explorer in enumerate(self.problem.design_var):
-            if param_explorer._setter_str is None:
-                setter = param_explorer._setter_func
-            else:
-                setter = param_explorer._setter_str
-            xoutput.paramexplorer_list.append(
-                ParamExplorerSet(
-                    name=param_explorer.name,
-                    unit=param_explorer.unit,
-                    symbol=param_explorer.symbol,
-                    setter=setter,
-                    value=paramexplorer_value[:, i].tolist(),
-                )
-            )
+        for i, param_explorer in enumerate(design_var_list):
+            param_explorer.value = paramexplorer_value[:, i].tolist()
+        self.problem.eval_cache = eval_cache
 
         # Delete toolbox so that classes created with DEAP remains after the optimization
         self.delete_toolbox()
@@ -265,16 +279,9 @@ def solve(self):
         xoutput.nb_simu = shape
 
         # Save design variable values in ParamExplorerSet
-        for i, param_explorer in enumerate(self.problem.design_var):
-            xoutput.paramexplorer_list.append(
-                ParamExplorerSet(
-                    name=param_explorer.name,
-                    unit=param_explorer.unit,
-                    symbol=param_explorer.symbol,
-                    setter=param_explorer.setter,
-                    value=paramexplorer_value[:, i].tolist(),
-                )
-            )
+        for i, param_explorer in enumerate(design_var_list):
+            param_explorer.value = paramexplorer_value[:, i].tolist()
+        self.problem.eval_cache = eval_cache
 
         # Delete toolbox so that classes created with DEAP remains after the optimization
         self.delete_toolbox()
@@ -286,6 +293,95 @@ def solve(self):
         raise err
 
 
+def init_store(solver, xoutput):
+    """Write the XOutput of the optimization in the store. On restart, the
+    valid evaluations already in the store are added to the evaluation cache
+    (an evaluation cache is created if needed) and the store is written again from
+    the first evaluation
+
+    Parameters
+    ----------
+    solver : OptiGenAlgNsga2Deap
+        Solver with a store
+    xoutput : XOutput
+        XOutput of the optimization (without results)
+    """
+
+    store = solver.store
+    problem = solver.problem
+    index_list = store.init_file(xoutput)
+    if len(index_list) == 0:
+        return
+
+    if problem.eval_cache is None:
+        problem.eval_cache = OptiEvalCache(size_max=0)
+    cache = problem.eval_cache
+    for index in index_list:
+        step_dict = store.get_step(index, is_load_output=False)
+        result = step_dict["eval"]
+        if not result["is_simu_valid"]:
+            continue  # Failed evaluations are not stored (cf evaluate_pop)
+        result["datakeeper"] = [
+            step_dict["result"].get(dk.symbol) for dk in problem.datakeeper_list
+        ]
+        cache.add(cache.get_key(step_dict["param"]), result)
+    solver.get_logger().info(
+        str(len(index_list)) + " evaluations loaded from " + store.save_path
+    )
+    store.init_file(xoutput, is_restart=False)
+
+
+def save_indiv(solver, xoutput, indiv):
+    """Save the evaluation of an individual (last results of the XOutput) in
+    the store
+
+    Parameters
+    ----------
+    solver : OptiGenAlgNsga2Deap
+        Solver with a store
+    xoutput : XOutput
+        XOutput of the optimization
+    indiv : individual
+        Individual evaluated
+    """
+
+    index = len(xoutput.xoutput_dict["ngen"].result) - 1
+    solver.store.add_step(
+        index,
+        {symbol: dk.result[index] for symbol, dk in xoutput.xoutput_dict.items()},
+        output=get_indiv_output(indiv),
+        param_list=list(indiv),
+        eval_dict={
+            "fitness": list(indiv.fitness.values),
+            "is_simu_valid": indiv.is_simu_valid,
+            "cstr_viol": indiv.cstr_viol,
+        },
+    )
+    if not solver.is_keep_all_output:
+        # Output kept only to be saved (cf evaluate_pop)
+        indiv.output = type(indiv.output)(simu=indiv.output.simu)
+
+
+def get_indiv_output(indiv):
+    """Return the Output of an evaluated individual (None if its results come
+    from the evaluation cache: the simulation was not run)
+
+    Parameters
+    ----------
+    indiv : individual
+        Individual evaluated
+
+    Returns
+    -------
+    output : Output
+        Output of the individual (None if cached)
+    """
+
+    if getattr(indiv, "is_cached", False):
+        return None
+    return indiv.output
+
+
 def print_gen_simu(time, gen_id, simu_id, size_pop, nb_error, to_eval):
     print(
         "\r{}  gen {:>5}: simu {}/{} ({:>5.2f}%), {:>4} errors.".format(
@@ -0,0 +1,49 @@
+import numpy as np
+
+from ....Functions.Electrical.comp_loss_joule import comp_loss_joule
+
+
+def comp_Ploss_dqh(self, N0):
+    """Compute the losses of each operating point of the LUT for given speed
+
+    Parameters
+    ----------
+    self : LUTdq
+        a LUTdq object
+    N0: float
+        rotation speed [rpm]
+
+    Returns
+    ----------
+    Ploss_dqh : ndarray
+        losses of each operating point (N_OP, 5)
+        - 1st column : Joule losses
+        - 2nd column : stator core losses
+        - 3rd column : magnet losses
+        - 4th column : rotor core losses
+        - 5th column : proximity losses
+    """
+
+    p = self.simu.machine.get_pole_pair_number()
+
+    felec = N0 / 60 * p
+
+    type_skin_effect = self.simu.loss.type_skin_effect
+    Tsta = self.simu.loss.Tsta
+
+    Ploss_dqh = np.zeros((len(self.output_list), 5))
+    for ii, out in enumerate(self.output_list):
+        OP = out.elec.OP.copy()
+        OP.felec = felec
+        Ploss_dqh[ii, 0] = comp_loss_joule(
+            lam=self.simu.machine.stator,
+            OP=OP,
+            T_op=Tsta,
+            type_skin_effect=type_skin_effect,
+        )
+        Ploss_dqh[ii, 1] = out.loss.get_loss_group("stator core", felec)
+        Ploss_dqh[ii, 2] = out.loss.get_loss_group("rotor magnets", felec)
+        Ploss_dqh[ii, 3] = out.loss.get_loss_group("rotor core", felec)
+        Ploss_dqh[ii, 4] = out.loss.get_loss_group("stator winding", felec)
+
+    return Ploss_dqh
@@ -0,0 +1,69 @@
+import numpy as np
+import scipy.interpolate as scp_int
+
+
+def comp_interp(self, values, is_axis_sum=True):
+    """Build an interpolator in dq plane of values given for each operating point
+    of the LUT
+
+    Parameters
+    ----------
+    self : LUTdq
+        a LUTdq object
+    values : ndarray
+        values to interpolate (N_OP, ...) in the same order as OP_matrix
+    is_axis_sum : bool
+        True to rebuild the grid from operating points on Id and Iq axes as
+        V(Id, Iq) = V(Id, 0) + V(0, Iq) - V(0, 0)
+
+    Returns
+    ----------
+    interp : function
+        function (Id, Iq) -> interpolated values (N, ...) where Id and Iq are
+        1D arrays of size N
+    """
+
+    grid_dict = self.get_interp_grid()
+    XId, XIq = grid_dict["XId"], grid_dict["XIq"]
+    jd, jq = grid_dict["jd"], grid_dict["jq"]
+    nd, nq = XId.size, XIq.size
+
+    values = np.asarray(values, dtype=float)
+    values_reg = np.zeros((nd, nq) + values.shape[1:])
+    if grid_dict["is_rect"]:
+        # sort values and reshape to (nd, nq, ...)
+        is_rect_interp = True
+        values_reg[jd, jq] = values
+    elif is_axis_sum and grid_dict["i_0"] is not None:
+        # Rebuild 2D grid from Id and Iq axes: V(Id, Iq) = V(Id, 0) + V(0, Iq) - V(0, 0)
+        is_rect_interp = True
+        i_d, i_q = grid_dict["i_d"], grid_dict["i_q"]
+        values_reg[:] = (
+            values[i_d][:, None] + values[i_q][None, :] - values[grid_dict["i_0"]]
+        )
+        # take values directly from operating points
+        values_reg[jd, jq] = values
+    else:
+        is_rect_interp = False
+
+    if nd == 1:
+        # 1D interpolation along q axis
+        interp_q = scp_int.interp1d(XIq, values_reg[0], kind="linear", axis=0)
+        return lambda Id, Iq: interp_q(Iq)
+    elif nq == 1:
+        # 1D interpolation along d axis
+        interp_d = scp_int.interp1d(XId, values_reg[:, 0], kind="linear", axis=0)
+        return lambda Id, Iq: interp_d(Id)
+    elif is_rect_interp:
+        # 2D regular grid interpolation
+        interp_dq = scp_int.RegularGridInterpolator(
+            (XId, XIq), values_reg, method="linear"
+        )
+    else:
+        # 2D scattered interpolation
+        OP_matrix = self.get_OP_matrix()
+        interp_dq = scp_int.LinearNDInterpolator(
+            (OP_matrix[:, 1], OP_matrix[:, 2]), values
+        )
+
+    return lambda Id, Iq: interp_dq(np.column_stack((Id, Iq)))
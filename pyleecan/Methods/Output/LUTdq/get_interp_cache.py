@@ -0,0 +1,51 @@
+from ....Functions.get_memo import comp_state_key
+
+
+def get_interp_cache(self):
+    """Get the dict storing the interpolators of the LUT. The interpolators are
+    built once and reused by the interp methods, the cache is reset when the
+    output_list of the LUT is replaced or modified (outputs added, removed or
+    replaced) or when the content of the OP_matrix is changed.
+    The cache is not saved nor copied.
+
+    Parameters
+    ----------
+    self : LUTdq
+        a LUTdq object
+
+    Returns
+    ----------
+    interp_dict : dict
+        dict of interpolators (key: quantity name)
+    """
+
+    cache = self._get_cache()
+
+    # Objects the interpolators depend on (the OP_matrix is small)
+    if self.output_list is None:
+        out_list = None
+    else:
+        out_list = tuple(self.output_list)
+    state = (self.output_list, out_list, comp_state_key(self.get_OP_matrix()))
+
+    old_state = cache.get("interp_state")
+    if (
+        old_state is None
+        or old_state[0] is not state[0]
+        or not is_same_output(old_state[1], state[1])
+        or old_state[2] != state[2]
+    ):
+        cache["interp_state"] = state
+        cache["interp_dict"] = dict()
+
+    return cache["interp_dict"]
+
+
+def is_same_output(out_list_1, out_list_2):
+    """Check if two tuples of outputs contain the same objects (identity
+    comparison to avoid comparing the outputs content)"""
+    if out_list_1 is None or out_list_2 is None:
+        return out_list_1 is out_list_2
+    return len(out_list_1) == len(out_list_2) and all(
+        out_1 is out_2 for out_1, out_2 in zip(out_list_1, out_list_2)
+    )
@@ -0,0 +1,62 @@
+import numpy as np
+
+
+def get_interp_grid(self):
+    """Get the regular Id/Iq grid matching the OP_matrix of the LUT
+    (computed once and stored in the interpolator cache)
+
+    Parameters
+    ----------
+    self : LUTdq
+        a LUTdq object
+
+    Returns
+    ----------
+    grid_dict : dict
+        dict with keys:
+        - "XId", "XIq": unique Id, Iq sorted in ascending order
+        - "jd", "jq": position of each operating point on the grid
+        - "is_rect": True if every point of the grid is in OP_matrix
+        - "i_d", "i_q", "i_0": index of the operating points (Id, 0), (0, Iq) and
+        (0, 0) if the grid can be rebuilt from Id and Iq axes (None otherwise)
+    """
+
+    interp_dict = self.get_interp_cache()
+    if "grid" in interp_dict:
+        return interp_dict["grid"]
+
+    # Get unique Id, Iq sorted in ascending order
+    OP_matrix = self.get_OP_matrix()
+    XId, jd = np.unique(OP_matrix[:, 1], return_inverse=True)
+    XIq, jq = np.unique(OP_matrix[:, 2], return_inverse=True)
+    nd, nq = XId.size, XIq.size
+    N_OP = OP_matrix.shape[0]
+
+    grid_dict = {
+        "XId": XId,
+        "XIq": XIq,
+        "jd": jd,
+        "jq": jq,
+        "is_rect": nd * nq == N_OP,
+        "i_d": None,
+        "i_q": None,
+        "i_0": None,
+    }
+
+    if nd * nq != N_OP and nd + nq - 1 == N_OP:
+        # Operating points are on Id and Iq axes: find (Id, 0), (0, Iq) and (0, 0)
+        is_d_axis = OP_matrix[:, 2] == 0
+        is_q_axis = OP_matrix[:, 1] == 0
+        i_d = np.full(nd, -1)
+        i_d[jd[is_d_axis]] = np.where(is_d_axis)[0]
+        i_q = np.full(nq, -1)
+        i_q[jq[is_q_axis]] = np.where(is_q_axis)[0]
+        i_0 = np.where(np.logical_and(is_d_axis, is_q_axis))[0]
+        if i_0.size > 0 and np.all(i_d >= 0) and np.all(i_q >= 0):
+            grid_dict["i_d"] = i_d
+            grid_dict["i_q"] = i_q
+            grid_dict["i_0"] = i_0[0]
+
+    interp_dict["grid"] = grid_dict
+
+    return grid_dict
@@ -0,0 +1,59 @@
+import numpy as np
+
+from .interp_Ploss_dqh import check_loss_OP
+
+
+def interp_Ploss_dqh_vect(self, Id, Iq, N0):
+    """Interpolate losses in function of Id and Iq for operating points with
+    different speeds. The losses of the LUT operating points are computed for
+    all the speeds at once from the loss coefficients and combined with the
+    interpolation weights of each (Id, Iq).
+    Joule losses are not interpolated (they depend on the winding resistance
+    used by the caller).
+
+    Parameters
+    ----------
+    self : LUTdq
+        a LUTdq object
+    Id : ndarray
+        current Id (N,)
+    Iq : ndarray
+        current Iq (N,)
+    N0: float or ndarray
+        rotation speed [rpm] (N,)
+
+    Returns
+    ----------
+    Ploss_dqh : ndarray
+        interpolated losses function of dq currents (N, 4)
+        - 1st column : stator core losses
+        - 2nd column : magnet losses
+        - 3rd column : rotor core losses
+        - 4th column : proximity losses
+    """
+
+    Id, Iq, N0 = np.broadcast_arrays(np.ravel(Id), np.ravel(Iq), np.ravel(N0))
+
+    # Interpolation weights of the LUT operating points (N, N_OP)
+    interp_dict = self.get_interp_cache()
+    if "weights" not in interp_dict:
+        check_loss_OP(self)
+        interp_dict["weights"] = self.comp_interp(np.eye(len(self.output_list)))
+    weights = interp_dict["weights"](Id, Iq)
+
+    felec = N0 / 60 * self.simu.machine.get_pole_pair_number()
+
+    # Losses of the LUT operating points for each frequency (N_OP, N)
+    Ploss_dqh = np.zeros((Id.size, 4))
+    for jj, group in enumerate(
+        ["stator core", "rotor magnets", "rotor core", "stator winding"]
+    ):
+        Ploss_OP = np.array(
+            [
+                out.loss.get_loss_group(group, felec) * np.ones(Id.size)
+                for out in self.output_list
+            ]
+        )
+        Ploss_dqh[:, jj] = np.sum(weights * Ploss_OP.T, axis=1)
+
+    return Ploss_dqh
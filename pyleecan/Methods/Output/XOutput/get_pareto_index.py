@@ -1,6 +1,6 @@
 import numpy as np
-import matplotlib.pyplot as plt
 from ....Classes.OptiObjective import OptiObjective
+from ....Functions.Optimization.comp_non_dominated import comp_non_dominated
 
 
 def get_pareto_index(self):
@@ -13,7 +13,7 @@ def get_pareto_index(self):
     Returns
     -------
     idx_non_dom: list
-        list of index of non dominated individuals
+        list of index of non dominated individuals (among the valid individuals)
     """
 
     # Gather fitness results
@@ -25,22 +25,13 @@ def get_pareto_index(self):
     fitness = np.array(data).T
 
     # Get fitness values and ngen
-    is_valid = np.array(self["is_valid"])
+    is_valid = np.array(self["is_valid"].result)
 
     # Keep only valid values
     indx = np.where(is_valid)
     fitness = fitness[indx]
 
-    # Get pareto front
-    pareto = fitness
-
-    # Get dominated values
-    idx_non_dom = list(range(len(pareto)))
-    N = len(pareto)
-    for i in range(N):
-        for j in idx_non_dom:
-            if all(pareto[j] <= pareto[i]) and any(pareto[j] < pareto[i]):
-                idx_non_dom.remove(i)
-                break
+    # Get non dominated values
+    idx_non_dom = np.where(comp_non_dominated(fitness))[0].tolist()
 
     return idx_non_dom
@@ -0,0 +1,34 @@
+import numpy as np
+from ....Classes.OptiObjective import OptiObjective
+from ....Functions.Optimization.comp_pareto_rank import comp_pareto_rank
+
+
+def get_pareto_rank(self):
+    """Return the index of the non dominated front of each valid individual
+    (0 for the pareto front, 1 for the next front...)
+
+    Parameters
+    ----------
+    self: XOutput
+
+    Returns
+    -------
+    rank: ndarray
+        front index of each valid individual
+    indx: ndarray
+        index of the valid individuals
+    """
+
+    # Gather fitness results
+    data = [
+        val.result
+        for _, val in self.xoutput_dict.items()
+        if isinstance(val, OptiObjective)
+    ]
+    fitness = np.array(data).T
+
+    # Keep only valid values
+    is_valid = np.array(self["is_valid"].result)
+    indx = np.where(is_valid)[0]
+
+    return comp_pareto_rank(fitness[indx]), indx
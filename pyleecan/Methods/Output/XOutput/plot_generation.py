@@ -4,7 +4,7 @@ from matplotlib.colors import LinearSegmentedColormap
 from ....Methods.Output.XOutput import _get_symbol_data_
 
 
-def plot_generation(self, x_symbol, y_symbol, ax=None):
+def plot_generation(self, x_symbol, y_symbol, ax=None, is_rank=False):
     """Plot every fitness values according to the two fitness
 
     Parameters
@@ -14,16 +14,11 @@ def plot_generation(self, x_symbol, y_symbol, ax=None):
         symbol of the ParamExplorer, the OptiObjective or the DataKeeper
     obj2 : str
         symbol of the ParamExplorer, the OptiObjective or the DataKeeper
+    is_rank : bool
+        True to color the individuals according to their non dominated front
+        (rank) instead of their generation
     """
 
-    # TODO define the colormap according to Pyleecan graphical chart
-    # Colormap definition
-    cm = LinearSegmentedColormap.from_list(
-        "colormap",
-        [(35 / 255, 89 / 255, 133 / 255), (250 / 255, 202 / 255, 56 / 255)],
-        N=max(self["ngen"].result) + 1,
-    )
-
     # Get fitness and ngen
     is_valid = np.array(self["is_valid"].result)
     ngen = np.array(self["ngen"].result)
@@ -31,7 +26,21 @@ def plot_generation(self, x_symbol, y_symbol, ax=None):
     # Keep only valid values
     indx = np.where(is_valid)[0]
 
-    ngen = ngen[indx]
+    if is_rank:
+        # Color by non dominated front
+        ngen, indx = self.get_pareto_rank()
+        legend_title = "Front"
+    else:
+        ngen = ngen[indx]
+        legend_title = "Generation"
+
+    # TODO define the colormap according to Pyleecan graphical chart
+    # Colormap definition
+    cm = LinearSegmentedColormap.from_list(
+        "colormap",
+        [(35 / 255, 89 / 255, 133 / 255), (250 / 255, 202 / 255, 56 / 255)],
+        N=max(ngen) + 1,
+    )
 
     # get data and labels
     x_values, x_label = _get_symbol_data_(self, x_symbol, indx)
@@ -45,7 +54,7 @@ def plot_generation(self, x_symbol, y_symbol, ax=None):
 
         # Add legend
         legend1 = ax.legend(
-            *scatter.legend_elements(), loc="upper right", title="Generation"
+            *scatter.legend_elements(), loc="upper right", title=legend_title
         )
         ax.add_artist(legend1)
 
@@ -64,7 +73,7 @@ def plot_generation(self, x_symbol, y_symbol, ax=None):
 
         # Add legend
         legend1 = ax.legend(
-            *scatter.legend_elements(), loc="upper right", title="Generation"
+            *scatter.legend_elements(), loc="upper right", title=legend_title
         )
         ax.add_artist(legend1)
 
@@ -15,6 +15,7 @@ def plot_pareto(
     grid=False,
     is_show_fig=True,
     save_path=None,
+    nb_front=1,
 ):
     """Plot the pareto front for 2 objective functions
 
@@ -33,6 +34,8 @@ def plot_pareto(
         True to show figure after plot
     save_path : str
         full path of the png file where the figure is saved if save_path is not None
+    nb_front : int
+        number of successive non dominated fronts to plot
     """
 
     return self.parent.plot_pareto(
@@ -45,4 +48,5 @@ def plot_pareto(
         grid,
         is_show_fig,
         save_path,
+        nb_front,
     )
@@ -0,0 +1,4 @@
+class XOutputStoreError(Exception):
+    """Raised when the store file doesn't match the multi-simulation"""
+
+    pass
@@ -0,0 +1,48 @@
+from h5py import File
+
+from ....Functions.Save.save_hdf5 import object_to_hdf5, variable_to_hdf5
+
+
+def add_step(self, index, result_dict, output=None, param_list=None, eval_dict=None):
+    """Write the results of a step in the file (opened and closed at each
+    step: the steps already written are kept if the run is interrupted)
+
+    Parameters
+    ----------
+    self : XOutputStore
+        An XOutputStore object
+    index : int
+        Index of the step (simulation or evaluation index)
+    result_dict : dict
+        DataKeeper results of the step (key: symbol)
+    output : Output
+        Output of the step (written only if is_save_output)
+    param_list : list
+        Design variable values of the step (optimization only, the values of
+        the VarSimu ParamExplorers are in the XOutput)
+    eval_dict : dict
+        Evaluation results of the step to restart an optimization ("fitness",
+        "is_simu_valid" and "cstr_viol")
+
+    Returns
+    -------
+    None
+    """
+
+    group_name = "/step/" + str(index)
+    data_dict = {"result": result_dict}
+    if param_list is not None:
+        data_dict["param"] = list(param_list)
+    if eval_dict is not None:
+        data_dict["eval"] = eval_dict
+
+    with File(self.save_path, "a") as file:
+        if group_name in file:  # Step written again
+            del file[group_name]
+        group = file.create_group(group_name)
+        variable_to_hdf5(file, group_name, data_dict, "data")
+        if self.is_save_output and output is not None:
+            object_to_hdf5(file, "output", output, prefix=group_name)
+        # Written last: the step is skipped on restart if the run is
+        # interrupted while writing it
+        group.attrs["is_complete"] = True
@@ -0,0 +1,46 @@
+from h5py import File
+
+from ....Functions.Load.load_hdf5 import construct_dict_from_group
+from ....Functions.load import load
+from . import XOutputStoreError
+
+
+def get_step(self, index, is_load_output=True):
+    """Load the results of a step from the file
+
+    Parameters
+    ----------
+    self : XOutputStore
+        An XOutputStore object
+    index : int
+        Index of the step
+    is_load_output : bool
+        False to skip the Output of the step
+
+    Returns
+    -------
+    step_dict : dict
+        "result": DataKeeper results (key: symbol), "param": design variable
+        values, "eval": evaluation results (optimization only), "output":
+        Output of the step with the big arrays read on first access (None if
+        not saved)
+    """
+
+    group_name = "step/" + str(index)
+    with File(self.save_path, "r") as file:
+        if group_name not in file or not file[group_name].attrs.get(
+            "is_complete", False
+        ):
+            raise XOutputStoreError(
+                "Step " + str(index) + " not found in " + self.save_path
+            )
+        step_dict = construct_dict_from_group(file[group_name]["data"])
+        is_output = "output" in file[group_name]
+    # Empty dict are not saved
+    step_dict.setdefault("result", dict())
+
+    if is_load_output and is_output:
+        step_dict["output"] = load(self.save_path, group_name=group_name + "/output")
+    else:
+        step_dict["output"] = None
+    return step_dict
@@ -0,0 +1,30 @@
+from os.path import isfile
+
+from h5py import File
+
+
+def get_step_index(self):
+    """Return the indices of the steps in the file (only the steps that were
+    completely written)
+
+    Parameters
+    ----------
+    self : XOutputStore
+        An XOutputStore object
+
+    Returns
+    -------
+    index_list : list
+        Sorted indices of the steps
+    """
+
+    if not isfile(self.save_path):
+        return list()
+    with File(self.save_path, "r") as file:
+        if "step" not in file:
+            return list()
+        return sorted(
+            int(name)
+            for name, group in file["step"].items()
+            if group.attrs.get("is_complete", False)
+        )
@@ -0,0 +1,43 @@
+from ....Functions.load import load
+
+
+def get_xoutput(self):
+    """Rebuild the XOutput of the multi-simulation from the steps in the file
+    (the results of the missing steps are None). The big arrays of the saved
+    Outputs are read on first access.
+
+    Parameters
+    ----------
+    self : XOutputStore
+        An XOutputStore object
+
+    Returns
+    -------
+    xoutput : XOutput
+        XOutput of the steps in the file
+    """
+
+    xoutput = load(self.save_path, group_name="xoutput")
+    index_list = self.get_step_index()
+    nb_simu = max([int(xoutput.nb_simu)] + [index + 1 for index in index_list])
+    xoutput.nb_simu = nb_simu
+
+    for keeper in xoutput.xoutput_dict.values():
+        keeper.result = [None] * nb_simu
+    if self.is_save_output:
+        xoutput.output_list = [None] * nb_simu
+    for index in index_list:
+        step_dict = self.get_step(index, is_load_output=self.is_save_output)
+        for symbol, value in step_dict["result"].items():
+            xoutput.xoutput_dict[symbol].result[index] = value
+        if "param" in step_dict:
+            # Optimization: the design variable values are saved in the steps
+            for paramexplorer, value in zip(
+                xoutput.paramexplorer_list, step_dict["param"]
+            ):
+                if len(paramexplorer.value) != nb_simu:
+                    paramexplorer.value = [None] * nb_simu
+                paramexplorer.value[index] = value
+        if self.is_save_output:
+            xoutput.output_list[index] = step_dict["output"]
+    return xoutput
@@ -0,0 +1,115 @@
+from hashlib import sha256
+from os.path import isfile
+
+from h5py import File
+
+from ....Functions.get_memo import SKIP_ATTR, StateKeyError, comp_state_key
+from ....Functions.Load.load_hdf5 import read_lazy_array
+from ....Functions.Save.save_hdf5 import (
+    add_save_info,
+    get_prop_list,
+    properties_to_hdf5,
+)
+from . import XOutputStoreError
+
+# Functions of the ParamExplorer (compared with their string if any)
+FUNC_ATTR = ["_setter_func", "_getter_func", "_get_value_func"]
+
+
+def init_file(self, xoutput, is_restart=None):
+    """Write the XOutput of the multi-simulation (without the results of the
+    steps) at the beginning of the file. On restart, the steps already in the
+    file are kept (the steps that were not completely written are removed)
+    if the file comes from the same multi-simulation (DataKeepers, number of
+    simulations and values of the ParamExplorers)
+
+    Parameters
+    ----------
+    self : XOutputStore
+        An XOutputStore object
+    xoutput : XOutput
+        XOutput of the multi-simulation (DataKeepers, ParamExplorers and
+        results of the reference simulation)
+    is_restart : bool
+        To overwrite self.is_restart
+
+    Returns
+    -------
+    index_list : list
+        Indices of the steps already in the file (to skip)
+
+    Raises
+    ------
+    XOutputStoreError
+        The file doesn't match the multi-simulation (on restart)
+    """
+
+    if is_restart is None:
+        is_restart = self.is_restart
+    symbol_list = [str(symbol) for symbol in xoutput.xoutput_dict.keys()]
+    param_hash = comp_param_hash(xoutput)
+
+    if is_restart and isfile(self.save_path):
+        with File(self.save_path, "a") as file:
+            # The steps must come from the same multi-simulation
+            if (
+                not param_hash
+                or list(file.attrs["symbol_list"]) != symbol_list
+                or file.attrs["nb_simu"] != xoutput.nb_simu
+                or file.attrs.get("param_hash") != param_hash
+            ):
+                raise XOutputStoreError(
+                    "File "
+                    + self.save_path
+                    + " doesn't match the multi-simulation: unable to restart"
+                )
+            for name, group in list(file["step"].items()):
+                if not group.attrs.get("is_complete", False):
+                    del file["step"][name]
+        return self.get_step_index()
+
+    # The arrays of the objects loaded from save_path must be read before
+    # overwriting the file
+    read_lazy_array(self.save_path)
+    with File(self.save_path, "w") as file:
+        file.attrs["__compression__"] = self.type_compression
+        file.attrs["symbol_list"] = symbol_list
+        file.attrs["nb_simu"] = xoutput.nb_simu
+        file.attrs["param_hash"] = param_hash
+        # The outputs are saved in the steps
+        prop_list = [
+            prop
+            for prop in get_prop_list(xoutput)
+            if prop[0] not in ["output_list", "xoutput_ref"]
+        ]
+        file.create_group("xoutput")
+        properties_to_hdf5(file, xoutput, prefix="/xoutput", prop_list=prop_list)
+        file.create_group("step")
+        add_save_info(file)
+    return list()
+
+
+def comp_param_hash(xoutput):
+    """Compute the hash of the ParamExplorers of the multi-simulation (values
+    of all the steps): the steps of a file are skipped on restart only if the
+    parameters of the multi-simulation are the same
+
+    Parameters
+    ----------
+    xoutput : XOutput
+        XOutput of the multi-simulation
+
+    Returns
+    -------
+    param_hash : str
+        Hash of the ParamExplorers (empty if their values can't be compared:
+        the file can't be used to restart)
+    """
+
+    try:
+        key = comp_state_key(
+            xoutput.paramexplorer_list, skip_attr=SKIP_ATTR + FUNC_ATTR
+        )
+    except StateKeyError:
+        return ""
+    return sha256(repr(key).encode()).hexdigest()
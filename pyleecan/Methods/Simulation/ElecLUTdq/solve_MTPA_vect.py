@@ -0,0 +1,313 @@
+import numpy as np
+
+
+def solve_MTPA_vect(self, LUT, N0, load_rate=None, nb_point_max=1e6):
+    """Solve EEC using Maximum Torque Per Ampere strategy with respect to voltage
+    and current constraints for several speeds / load rates at once.
+    Same iterative zoom-in search on the Id/Iq grid as solve_MTPA but all the
+    operating points are solved together (the first grid is shared by all the
+    operating points, then each operating point zooms on its own grid).
+
+    Parameters
+    ----------
+    self : ElecLUTdq
+        a ElecLUTdq object
+    LUT : LUTdq
+        Calculated look-up table
+    N0 : float or ndarray
+        Rotation speed [rpm]
+    load_rate : float or ndarray
+        Load rate between 0 and 1 (same size as N0 if array, None to use self.load_rate)
+    nb_point_max : int
+        Maximum number of Id/Iq points to interpolate at once (the operating
+        points are split into chunks accordingly)
+
+    Returns
+    ----------
+    out_dict: dict
+        Dict containing all output quantities (one value per operating point)
+
+    """
+
+    if load_rate is None:
+        load_rate = self.load_rate
+    N0, load_rate = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(N0, dtype=float)),
+        np.atleast_1d(np.asarray(load_rate, dtype=float)),
+    )
+    N0, load_rate = N0.ravel(), load_rate.ravel()
+    N_OP = N0.size
+
+    machine = LUT.simu.machine
+    # Stator winding number of phases
+    qs = machine.stator.winding.qs
+    # Number of pole pair
+    p = machine.get_pole_pair_number()
+    # Electrical frequency
+    felec = N0 / 60 * p
+    # Electrical pulsation
+    ws = 2 * np.pi * felec
+
+    # Winding resistance (for each speed)
+    Rs = machine.stator.comp_resistance_wind(T=self.Tsta) * np.ones(N_OP)
+    if self.type_skin_effect > 0:
+        # Account for skin effect
+        Rs *= machine.stator.winding.conductor.comp_skin_effect_resistance(
+            T_op=self.Tsta, freq=felec
+        )
+
+    # Maximum voltage
+    Urms_max = self.Urms_max
+    # Maximum current
+    Irms_max = self.Irms_max
+    if Irms_max is None:
+        if self.Jrms_max is None:
+            raise Exception("Irms_max and Jrms_max cannot be both None")
+        # Calculate maximum current function of current density
+        Swire = machine.stator.winding.conductor.comp_surface_active()
+        Irms_max = self.Jrms_max * Swire * machine.stator.winding.Npcp
+
+    # Initial Id/Iq grid (LUT boundaries by default)
+    OP_matrix = LUT.get_OP_matrix()
+    bound_list = [
+        OP_matrix[:, 1].min() if self.Id_min is None else self.Id_min,
+        OP_matrix[:, 1].max() if self.Id_max is None else self.Id_max,
+        OP_matrix[:, 2].min() if self.Iq_min is None else self.Iq_min,
+        OP_matrix[:, 2].max() if self.Iq_max is None else self.Iq_max,
+    ]
+    Nd = (
+        self.n_Id
+        if self.n_Id == 1
+        else int(self.n_Id * self.n_interp / (self.n_Id + self.n_Iq))
+    )
+    Nq = (
+        self.n_Iq
+        if self.n_Iq == 1
+        else int(self.n_Iq * self.n_interp / (self.n_Id + self.n_Iq))
+    )
+    N_chunk = max(int(nb_point_max // (Nd * Nq)), 1)
+
+    param_dict = {
+        "LUT": LUT,
+        "qs": qs,
+        "p": p,
+        "Urms_max": Urms_max,
+        "Irms_max": Irms_max,
+        "Nd": Nd,
+        "Nq": Nq,
+    }
+
+    res_dict = {
+        key: np.zeros(N_OP)
+        for key in ["Id", "Iq", "Ud", "Uq", "Phid", "Phiq", "Tem", "U", "I"]
+    }
+    for start in range(0, N_OP, N_chunk):
+        ind = np.arange(start, min(start + N_chunk, N_OP))
+        bounds = [val * np.ones(ind.size) for val in bound_list]
+
+        # Maximum torque for each speed
+        is_load = load_rate[ind] > 0
+        res_max = _search_grid(
+            param_dict,
+            ws[ind][is_load],
+            Rs[ind][is_load],
+            [b[is_load] for b in bounds],
+            Tem_target=None,
+        )
+        for key in res_dict:
+            res_dict[key][ind[is_load]] = res_max[key]
+
+        # Minimum current to reach the load rate (Iq=0 for no-load)
+        is_part = load_rate[ind] < 1
+        Tem_target = np.full(ind.size, -np.inf)
+        Tem_target[is_load] = load_rate[ind][is_load] * res_max["Tem"]
+        Iq_zero = np.logical_not(is_load)
+        bounds[2][Iq_zero] = 0
+        bounds[3][Iq_zero] = 0
+        res_part = _search_grid(
+            param_dict,
+            ws[ind][is_part],
+            Rs[ind][is_part],
+            [b[is_part] for b in bounds],
+            Tem_target=Tem_target[is_part],
+        )
+        for key in res_dict:
+            res_dict[key][ind[is_part]] = res_part[key]
+
+    # Launch warnings
+    nb_U = np.sum(res_dict["U"] > Urms_max * (1 + 1e-9))
+    if nb_U > 0:
+        self.get_logger().warning(
+            "Voltage constraint cannot be reached for "
+            + str(nb_U)
+            + " operating points"
+        )
+    nb_I = np.sum(res_dict["I"] > Irms_max * (1 + 1e-9))
+    if nb_I > 0:
+        self.get_logger().warning(
+            "Current constraint cannot be reached for "
+            + str(nb_I)
+            + " operating points"
+        )
+
+    out_dict = dict()
+    out_dict["N0"] = N0
+    out_dict["load_rate"] = load_rate
+
+    # Store torque, voltage and currents
+    out_dict["Tem_av"] = res_dict["Tem"]
+    out_dict["Id"] = res_dict["Id"]
+    out_dict["Iq"] = res_dict["Iq"]
+    out_dict["Ud"] = res_dict["Ud"]
+    out_dict["Uq"] = res_dict["Uq"]
+
+    # Store dq fluxes
+    out_dict["Phid"] = res_dict["Phid"]
+    out_dict["Phiq"] = res_dict["Phiq"]
+
+    # Calculate flux linkage and back-emf
+    Phidqh_mag = LUT.get_Phi_dqh_mag_mean()
+    out_dict["Phid_mag"] = Phidqh_mag[0]
+    out_dict["Phiq_mag"] = Phidqh_mag[1]
+    out_dict["Erms"] = ws * Phidqh_mag[0]
+
+    # Calculate losses
+    out_dict["Pjoule"] = qs * Rs * (res_dict["Id"] ** 2 + res_dict["Iq"] ** 2)
+    if LUT.output_list[0].loss is not None:
+        Ploss_dqh = LUT.interp_Ploss_dqh_vect(res_dict["Id"], res_dict["Iq"], N0)
+        out_dict["Pstator"] = Ploss_dqh[:, 0]
+        out_dict["Pmagnet"] = Ploss_dqh[:, 1]
+        out_dict["Protor"] = Ploss_dqh[:, 2]
+        out_dict["Pprox"] = Ploss_dqh[:, 3]
+
+    # Calculate torque ripple
+    Tem_rip_pp = LUT.interp_Tem_rip_dqh(res_dict["Id"], res_dict["Iq"])
+    if Tem_rip_pp is not None:
+        out_dict["Tem_rip_pp"] = Tem_rip_pp
+        Tem_av = np.where(res_dict["Tem"] == 0, np.inf, res_dict["Tem"])
+        out_dict["Tem_rip_norm"] = np.abs(Tem_rip_pp / Tem_av)
+
+    return out_dict
+
+
+def _search_grid(param_dict, ws, Rs, bounds, Tem_target, Nmax=20, delta_Tem_max=0.1):
+    """Iterative zoom-in search on the Id/Iq grid of each operating point
+
+    Parameters
+    ----------
+    param_dict : dict
+        Parameters of the search (LUT, qs, p, Urms_max, Irms_max, Nd, Nq)
+    ws : ndarray
+        Electrical pulsation of each operating point
+    Rs : ndarray
+        Stator phase resistance of each operating point
+    bounds : list
+        Id_min, Id_max, Iq_min, Iq_max arrays (one value per operating point)
+    Tem_target : ndarray
+        None to find the maximum torque under voltage and current constraints,
+        else minimum torque to reach with the minimum current under voltage
+        constraint (-inf for no-load)
+    Nmax : int
+        Maximum number of iterations
+    delta_Tem_max : float
+        Torque tolerance to stop the zoom-in [Nm]
+
+    Returns
+    ----------
+    res_dict: dict
+        Dict containing the quantities of the selected grid point of each operating point
+    """
+
+    LUT = param_dict["LUT"]
+    qs, p = param_dict["qs"], param_dict["p"]
+    Nd, Nq = param_dict["Nd"], param_dict["Nq"]
+    Urms_max, Irms_max = param_dict["Urms_max"], param_dict["Irms_max"]
+    delta_I_max = 1e-3 * Irms_max
+
+    N_OP = ws.size
+    res_dict = {
+        key: np.zeros(N_OP)
+        for key in ["Id", "Iq", "Ud", "Uq", "Phid", "Phiq", "Tem", "U", "I"]
+    }
+    if N_OP == 0:
+        return res_dict
+    Id_min, Id_max, Iq_min, Iq_max = [b.copy() for b in bounds]
+    xd = np.linspace(0, 1, Nd)
+    xq = np.linspace(0, 1, Nq)
+    crit_old = np.zeros(N_OP)
+
+    active = np.arange(N_OP)  # Operating points not converged yet
+    niter = 1
+    while active.size > 0:
+        N_act = active.size
+        # Refine Id/Iq mesh of each active operating point
+        Id_vect = Id_min[active, None] * (1 - xd) + Id_max[active, None] * xd
+        Iq_vect = Iq_min[active, None] * (1 - xq) + Iq_max[active, None] * xq
+        Id = np.broadcast_to(Id_vect[:, :, None], (N_act, Nd, Nq)).reshape(N_act, -1)
+        Iq = np.broadcast_to(Iq_vect[:, None, :], (N_act, Nd, Nq)).reshape(N_act, -1)
+
+        # Interpolate Phid/Phiq on the refined meshes
+        Phi_dqh = LUT.interp_Phi_dqh(Id.ravel(), Iq.ravel())
+        Phid = Phi_dqh[0].reshape(N_act, -1)
+        Phiq = Phi_dqh[1].reshape(N_act, -1)
+
+        # Calculate voltage (Ud/Uq), current and torque
+        w = ws[active, None]
+        R = Rs[active, None]
+        Ud = R * Id - Phiq * w
+        Uq = R * Iq + Phid * w
+        U = np.sqrt(Ud ** 2 + Uq ** 2)
+        I = np.sqrt(Id ** 2 + Iq ** 2)
+        Tem = qs * p * (Phid * Iq - Phiq * Id)
+
+        # Set maximum voltage condition
+        U_cond = U <= Urms_max
+        if Tem_target is None:
+            # Maximum positive torque under voltage and current constraints
+            is_OK = np.logical_and(U_cond, I <= Irms_max)
+            score = np.where(is_OK, Tem, -np.inf)
+        else:
+            # Lowest current reaching torque level under voltage constraint
+            is_OK = np.logical_and(U_cond, Tem >= Tem_target[active, None])
+            score = np.where(is_OK, -I, -np.inf)
+        imin = np.argmax(score, axis=1)
+        # Closest point to the voltage constraint if no feasible point
+        is_none = np.logical_not(np.any(is_OK, axis=1))
+        imin[is_none] = np.argmin(U[is_none], axis=1)
+
+        row = np.arange(N_act)
+        for key, val in zip(
+            ["Id", "Iq", "Ud", "Uq", "Phid", "Phiq", "Tem", "U", "I"],
+            [Id, Iq, Ud, Uq, Phid, Phiq, Tem, U, I],
+        ):
+            res_dict[key][active] = val[row, imin]
+
+        # Check convergence
+        if Tem_target is None:
+            # Check if maximum torque changes depending on Id/Iq discretization
+            crit = res_dict["Tem"][active]
+            is_conv = np.abs(crit - crit_old[active]) <= delta_Tem_max
+        else:
+            crit = res_dict["I"][active]
+            target = Tem_target[active]
+            is_conv = np.where(
+                np.isinf(target),
+                np.abs(crit - crit_old[active]) <= delta_I_max,
+                np.abs(target - res_dict["Tem"][active]) <= delta_Tem_max,
+            )
+        crit_old[active] = crit
+        niter += 1
+        if niter >= Nmax:
+            break
+
+        # Zoom in Id / Iq grid to achieve better accuracy on output values
+        is_zoom = np.logical_not(is_conv)
+        jd, jq = np.divmod(imin[is_zoom], Nq)
+        row = row[is_zoom]
+        active = active[is_zoom]
+        Id_min[active] = Id_vect[row, np.maximum(jd - 1, 0)]
+        Id_max[active] = Id_vect[row, np.minimum(jd + 1, Nd - 1)]
+        Iq_min[active] = Iq_vect[row, np.maximum(jq - 1, 0)]
+        Iq_max[active] = Iq_vect[row, np.minimum(jq + 1, Nq - 1)]
+
+    return res_dict
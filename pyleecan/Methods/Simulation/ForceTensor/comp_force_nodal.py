@@ -29,7 +29,7 @@ def comp_force_nodal(self, output, axes_dict):
     meshsolution_mag = output.mag.meshsolution  # Comes from FEMM simulation
 
     # Select the target group (stator, rotor ...)
-    meshsolution_group = meshsolution_mag.get_group(self.group)
+    meshsolution_group = meshsolution_mag.get_group(self.group, is_view=True)
 
     # TODO before: Check if is_same_mesh is True
     mesh = meshsolution_group.get_mesh()
@@ -88,8 +88,11 @@ def comp_force_nodal(self, output, axes_dict):
     H = np.moveaxis(H, 0, -1)
     mu = np.moveaxis(mu, 0, -1)
 
-    # Loop on elements and nodes for nodal forces
-    f, connect = self.element_loop(mesh, B, H, mu, indice, dim, Nt_tot)
+    # Nodal forces computation on all the elements
+    if self.is_vectorized:
+        f, connect = self.element_loop_vect(mesh, B, H, mu, indice, dim, Nt_tot)
+    else:  # Loop on elements and nodes
+        f, connect = self.element_loop(mesh, B, H, mu, indice, dim, Nt_tot)
 
     indices_nodes = mesh.node.indice.copy()
     Indices_Point = Data1D(name="indice", values=indices_nodes, is_components=True)
@@ -0,0 +1,147 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+
+
+def element_loop_vect(
+    self,
+    mesh,
+    B,
+    H,
+    mu,
+    indice,
+    dim,
+    Nt_tot,
+    polynomial_coeffs=[[0.719, -0.078, -0.042], [-0.391, 0.114, 0.004]],
+):
+    """compute nodal forces with array operations on all the elements at once
+    (same result as element_loop)
+
+    The edge normals and the node indices of every element are computed once,
+    then the element contributions are assembled on the nodes with a sparse
+    assembly matrix shared by all the time steps.
+
+    Parameters
+    ----------
+    self : ForceTensor
+        A ForceTensor object
+    mesh : MeshMat
+        A MeshMat object
+    B : ndarray
+        magnetic flux density in the elements (nb_elem, dim, Nt_tot)
+    H : ndarray
+        magnetic field in the elements (nb_elem, dim, Nt_tot)
+    mu : ndarray
+        permeability in the elements (nb_elem, Nt_tot)
+    indice : ndarray
+        element indices (same order as B, H and mu first axis)
+    dim : int
+        Dimension of the problem
+    Nt_tot : int
+        Number of time steps
+    polynomial_coeffs : 2x3 List, optional
+        alpha(i,j) coeffs for polynomal expression of alpha1 and alpha2
+
+    Return
+    ----------
+    f : (nb_nodes*dim*Nt_tot) array
+        nodal forces
+
+    connect : (nb_element*nb_node_per_cell) array
+        table of mesh connectivity
+
+    """
+
+    mu_0 = 4 * np.pi * 1e-7
+    indice = np.asarray(indice)
+
+    nb_node = mesh.node.nb_node  # Total nodes number
+    node_indice = np.asarray(mesh.node.indice)
+    node_sorter = np.argsort(node_indice)
+
+    # Nodal forces init
+    f = np.zeros((nb_node, dim, Nt_tot), dtype=float)
+
+    # Magnetization of all the elements (nb_elem, dim, Nt_tot)
+    M = B / mu_0 - H
+
+    if self.tensor["magnetostriction"]:
+        # Coeffs from a reference material in IEEETranMagn2004
+        # (cf comp_magnetostrictive_tensor)
+        (a10, a12, a14), (a20, a22, a24) = polynomial_coeffs
+        M_norm_squared = np.sum(M ** 2, axis=1)  # (nb_elem, Nt_tot)
+        mu_times_Mnorm_squared = mu_0 ** 2 * M_norm_squared
+        alpha1 = a10 + a12 * mu_times_Mnorm_squared + a14 * mu_times_Mnorm_squared ** 2
+        alpha2 = a20 + a22 * mu_times_Mnorm_squared + a24 * mu_times_Mnorm_squared ** 2
+        # Tensor is -alpha1*mu_0*M.M' - alpha2*mu_0*|M|²*I
+        coeff_MM = -alpha1 * mu_0  # (nb_elem, Nt_tot)
+        coeff_I = -alpha2 * mu_0 * M_norm_squared  # (nb_elem, Nt_tot)
+    else:
+        coeff_MM = np.zeros(M.shape[0::2])
+        coeff_I = np.zeros(M.shape[0::2])
+
+    # For every type of element (now only Triangle3, TO BE extended)
+    connect = None
+    for key in mesh.cell:
+        mesh_cell_key = mesh.cell[key]
+        nb_node_per_cell = mesh_cell_key.nb_node_per_cell
+        connect = mesh_cell_key.get_connectivity()  # Each row of connect is an element
+        if connect is None or mesh_cell_key.nb_cell == 0:
+            continue
+        connect = np.reshape(connect, (-1, nb_node_per_cell))
+        cell_indice = np.asarray(mesh_cell_key.indice)
+
+        # Position of the requested elements in the connectivity matrix
+        cell_sorter = np.argsort(cell_indice)
+        pos = np.searchsorted(cell_indice, indice, sorter=cell_sorter)
+        pos[pos >= cell_indice.size] = 0
+        row = cell_sorter[pos]
+        is_cell = cell_indice[row] == indice
+        if not np.any(is_cell):
+            continue
+        elt_indice = np.where(is_cell)[0]  # Position in B, H and mu
+        elt_connect = connect[row[is_cell], :]
+
+        # Node numbers (can differ from indices) => position in the node arrays
+        node_pos = node_sorter[
+            np.searchsorted(node_indice, elt_connect, sorter=node_sorter)
+        ]
+        vertice = mesh.node.coordinate[node_pos, :dim]  # (nb_elem, nb_node, dim)
+
+        # Triangle orientation, needed for normal orientation. 1 if trigo oriented, -1 otherwise
+        orientation_sign = np.sign(
+            np.cross(vertice[:, 1] - vertice[:, 0], vertice[:, 2] - vertice[:, 0])
+        )
+
+        # Outward normals multiplied by the edge length (Green Ostrogradski),
+        # edge n goes from node n to node n+1
+        edge_vector = np.roll(vertice, -1, axis=1) - vertice
+        normal_to_edge = (
+            np.stack((edge_vector[..., 1], -edge_vector[..., 0]), axis=-1)
+            * orientation_sign[:, None, None]
+        )
+
+        # Each node receives half of the force of its two edges
+        normal_node = (normal_to_edge + np.roll(normal_to_edge, 1, axis=1)) / 2
+
+        M_elt = M[elt_indice]  # (nb_elem, dim, Nt_tot)
+        coeff_MM_elt = coeff_MM[elt_indice]
+        coeff_I_elt = coeff_I[elt_indice]
+        nb_elem = elt_indice.size
+        for n in range(nb_node_per_cell):
+            normal_n = normal_node[:, n, :]  # (nb_elem, dim)
+            # - <tensor, normal> scalar product
+            M_dot_n = np.einsum("eit,ei->et", M_elt, normal_n)
+            fe = -(
+                (coeff_MM_elt * M_dot_n)[:, None, :] * M_elt
+                + coeff_I_elt[:, None, :] * normal_n[:, :, None]
+            )
+            # Sparse assembly of the elements contributions on the nodes
+            assembly = csr_matrix(
+                (np.ones(nb_elem), (node_pos[:, n], np.arange(nb_elem))),
+                shape=(nb_node, nb_elem),
+            )
+            f += (assembly @ fe.reshape(nb_elem, dim * Nt_tot)).reshape(
+                nb_node, dim, Nt_tot
+            )
+
+    return f, connect
@@ -68,7 +68,7 @@ def comp_loss(self, output, part_label):
     group_name = part_label.lower() + " " + self.group  # TODO unifiy FEA names
 
     # setup meshsolution and solution list
-    meshsolution = output.mag.meshsolution.get_group(group_name)
+    meshsolution = output.mag.meshsolution.get_group(group_name, is_view=True)
 
     # compute needed model parameter from material data
     success = self.comp_coeff_Bertotti(mat_type)
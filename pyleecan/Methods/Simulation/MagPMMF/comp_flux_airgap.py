@@ -0,0 +1,231 @@
+from numpy import arange, exp, newaxis, pi, real
+from numpy.fft import fft
+from scipy.constants import mu_0
+
+from ....Classes.LamSlotMag import LamSlotMag
+from ....Functions.labels import STATOR_LAB
+from ....Methods import NotImplementedYetError
+
+
+def comp_flux_airgap(self, output, axes_dict, Is_val=None, Ir_val=None):
+    """Compute the airgap flux density, the torque and the winding flux with
+    the analytical model: exact 2D harmonic solution of the slotless airgap
+    (magnets and winding current sheets) multiplied by the relative permeance
+    functions of the slot openings. All the time steps and all the spatial
+    harmonics are solved at once.
+
+    Parameters
+    ----------
+    self : MagPMMF
+        a MagPMMF object
+    output : Output
+        an Output object
+    axes_dict: {Data}
+        Dict of axes used for magnetic calculation
+    Is_val : ndarray
+        Stator current matrix (qs,Nt) [A]
+    Ir_val : ndarray
+        Rotor current matrix (qr,Nt) [A]
+
+    Returns
+    -------
+    out_dict: dict
+        Dict containing the following quantities:
+            B_{rad} : ndarray
+                Airgap radial flux density (Nt,Na) [T]
+            B_{circ} : ndarray
+                Airgap tangential flux density (Nt,Na) [T]
+            Tem : ndarray
+                Electromagnetic torque over time (Nt,) [Nm]
+            Phi_wind_stator : ndarray
+                Stator winding flux (Nt,qs) [Wb]
+            Phi_wind : dict
+                Dict of winding fluxlinkage with respect to Machine.get_lam_list_label (Nt,qs) [Wb]
+            Rag : float
+                Radius of the airgap outputs [m]
+    """
+
+    machine = output.simu.machine
+    stator, rotor = machine.stator, machine.rotor
+
+    # Get time and angular axes
+    Angle = axes_dict["angle"]
+    Time = axes_dict["time"]
+    _, is_antiper_a = Angle.get_periodicity()
+    angle = Angle.get_values(
+        is_oneperiod=self.is_periodicity_a,
+        is_antiperiod=is_antiper_a and self.is_periodicity_a,
+    )
+    _, is_antiper_t = Time.get_periodicity()
+    time = Time.get_values(
+        is_oneperiod=self.is_periodicity_t,
+        is_antiperiod=is_antiper_t and self.is_periodicity_t,
+    )
+    Nt = time.size
+
+    # Rotor angular position in the stator frame
+    angle_rotor = output.get_angle_rotor()[0:Nt] + self.angle_rotor_shift
+
+    # The sources are decomposed on the whole circumference
+    angle_full = Angle.get_values(is_oneperiod=False)
+    N = angle_full.size
+    Nk = N // 2 - 1
+    if self.Nharm_max is not None:
+        Nk = min(Nk, self.Nharm_max)
+    k = arange(1, Nk + 1)
+    # Shift from the rotor frame to the stator frame (Nk,Nt)
+    rot_shift = exp(-1j * k[:, newaxis] * angle_rotor[newaxis, :])
+
+    def comp_harm(field):
+        """Complex harmonics 1 to Nk of fields on angle_full (...,N)"""
+        return fft(field, axis=-1)[..., 1 : Nk + 1] / N
+
+    # Magnetization of the magnets in the stator frame
+    if isinstance(rotor, LamSlotMag) and rotor.magnet is not None:
+        Mr, Mt = self.comp_magnetization(
+            rotor, (angle_full - self.angle_rotor_shift) % (2 * pi)
+        )
+        M_harm = (
+            comp_harm(Mr)[:, newaxis] * rot_shift,
+            comp_harm(Mt)[:, newaxis] * rot_shift,
+        )
+        if not self.is_mmfr:
+            M_harm = None
+        hm = rotor.slot.comp_height_active()
+        mur_mag = rotor.magnet.mat_type.mag.mur_lin
+    elif hasattr(rotor, "has_magnet") and rotor.has_magnet():
+        raise NotImplementedYetError("MagPMMF is only available for surface magnets")
+    else:
+        M_harm, hm, mur_mag = None, 0, 1
+
+    # Winding functions in their lamination frame (qs,N) and their complex
+    # harmonics (Nk,qs)
+    wf_dict, wf_harm_dict = dict(), dict()
+    for lam, shift in [
+        (stator, self.angle_stator_shift),
+        (rotor, self.angle_rotor_shift),
+    ]:
+        if getattr(lam, "winding", None) is not None:
+            wf_dict[lam.is_stator] = lam.comp_wind_function(
+                angle=(angle_full - shift) % (2 * pi)
+            )
+            wf_harm_dict[lam.is_stator] = comp_harm(wf_dict[lam.is_stator]).T
+
+    # Current sheets of the windings: K = -1/R dF/dtheta (Nk,Nt)
+    K_dict = dict()
+    for lam, I in [(stator, Is_val), (rotor, Ir_val)]:
+        if I is not None and lam.is_stator in wf_harm_dict:
+            F = wf_harm_dict[lam.is_stator] @ I[:, :Nt]
+            if lam.is_stator:
+                K_dict[lam.is_stator] = -1j * k[:, newaxis] / lam.get_Rbo() * F
+            else:
+                K_dict[lam.is_stator] = (
+                    -1j * k[:, newaxis] / lam.get_Rbo() * F * rot_shift
+                )
+
+    # Layers from the inner lamination bore to the outer lamination bore
+    Rrbo, Rsbo = rotor.get_Rbo(), stator.get_Rbo()
+    if rotor.is_internal:
+        lam_in, lam_out = rotor, stator
+        if hm > 0:
+            radius_list = [Rrbo, Rrbo + hm, Rsbo]
+            mur_list = [mur_mag, 1]
+            M_list = [M_harm, None]
+        else:
+            radius_list, mur_list, M_list = [Rrbo, Rsbo], [1], [None]
+    else:
+        lam_in, lam_out = stator, rotor
+        if hm > 0:
+            radius_list = [Rsbo, Rrbo - hm, Rrbo]
+            mur_list = [1, mur_mag]
+            M_list = [None, M_harm]
+        else:
+            radius_list, mur_list, M_list = [Rsbo, Rrbo], [1], [None]
+
+    if self.Rag_enforced is not None:
+        Rag = self.Rag_enforced
+    else:
+        Rag = machine.comp_Rgap_mec()
+
+    B_list = self.solve_field_harm(
+        k,
+        radius_list,
+        mur_list,
+        M_list,
+        K_in=K_dict.get(lam_in.is_stator),
+        K_out=K_dict.get(lam_out.is_stator),
+        r_eval=[Rag, Rsbo, Rrbo],
+    )
+
+    # Relative permeance of the slot openings (magnets in the effective airgap)
+    g_eff = abs(Rsbo - Rrbo) - hm + hm / mur_mag
+
+    def comp_perm(theta):
+        """Relative permeance in the stator frame for the stator angles theta
+        (...,Na) and the rotor angles theta - angle_rotor (Nt,Na)"""
+        perm = 1
+        if not self.is_remove_slotS:
+            perm = perm * self.comp_permeance_slot(
+                stator, theta - self.angle_stator_shift, g_eff
+            )
+        if not self.is_remove_slotR and getattr(rotor, "winding", None) is not None:
+            perm = perm * self.comp_permeance_slot(
+                rotor, theta - angle_rotor[:, newaxis], g_eff
+            )
+        return perm
+
+    def comp_field(B_harm, theta):
+        """Field in the stator frame on the angles theta (Na,) from its complex
+        harmonics (Nk,Nt)"""
+        return 2 * real(B_harm.T @ exp(1j * k[:, newaxis] * theta[newaxis, :]))
+
+    out_dict = dict()
+    perm = comp_perm(angle[newaxis, :])
+    out_dict["B_{rad}"] = comp_field(B_list[0][0], angle) * perm
+    out_dict["B_{circ}"] = comp_field(B_list[0][1], angle) * perm
+    out_dict["Rag"] = Rag
+
+    # Maxwell stress tensor on the whole circumference
+    perm_full = comp_perm(angle_full[newaxis, :])
+    BrBt = (
+        comp_field(B_list[0][0], angle_full)
+        * comp_field(B_list[0][1], angle_full)
+        * perm_full ** 2
+    )
+    sign = 1 if rotor.is_internal else -1
+    out_dict["Tem"] = sign * rotor.L1 * Rag ** 2 / mu_0 * 2 * pi * BrBt.mean(axis=1)
+
+    # Winding flux: integral of the radial flux density on the bore weighted
+    # by the winding function (Nt,qs)
+    out_dict["Phi_wind"] = dict()
+    axes_dict_elec = output.elec.axes_dict
+    for lam, B_bore in [(stator, B_list[1]), (rotor, B_list[2])]:
+        label = lam.get_label()
+        if (
+            "phase_" + label not in axes_dict_elec
+            or getattr(lam, "winding", None) is None
+        ):
+            continue
+        qs = axes_dict_elec["phase_" + label].get_length(is_smallestperiod=True)
+        Br = comp_field(B_bore[0], angle_full) * perm_full
+        wf = wf_dict[lam.is_stator]
+        if lam.is_stator:
+            Phi = Br @ wf.T
+        else:
+            # Rotor winding function moved to the stator frame with its
+            # harmonics (as the rotor current sheet):
+            # wf(theta) = wf_0 + 2 Re(sum_k W_k rot_shift e^(ik theta))
+            E = exp(1j * k[:, newaxis] * angle_full[newaxis, :])
+            Br_harm = (Br @ E.T) * rot_shift.T  # (Nt,Nk)
+            Phi = Br.sum(axis=1)[:, newaxis] * wf.mean(axis=1)[newaxis, :]
+            Phi += 2 * real(Br_harm @ wf_harm_dict[lam.is_stator])
+        Npcp = lam.winding.Npcp if lam.winding.Npcp is not None else 1
+        Phi *= stator.L1 * lam.get_Rbo() * 2 * pi / N / Npcp
+        out_dict["Phi_wind"][label] = Phi[:, :qs]
+
+    if STATOR_LAB + "-0" in out_dict["Phi_wind"]:
+        out_dict["Phi_wind_stator"] = out_dict["Phi_wind"][STATOR_LAB + "-0"]
+    if len(out_dict["Phi_wind"]) == 0:
+        out_dict.pop("Phi_wind")
+
+    return out_dict
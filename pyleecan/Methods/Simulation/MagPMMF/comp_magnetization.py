@@ -0,0 +1,61 @@
+from numpy import pi, floor, zeros_like, cos, sin
+from scipy.constants import mu_0
+
+from ....Methods import NotImplementedYetError
+
+
+def comp_magnetization(self, lam, angle):
+    """Compute the magnetization of the magnets of a LamSlotMag in the
+    lamination frame (equivalent polar magnets with the same height and
+    surface, the first magnet is a North pole)
+
+    Parameters
+    ----------
+    self : MagPMMF
+        a MagPMMF object
+    lam : LamSlotMag
+        Lamination with the magnets
+    angle : ndarray
+        Angles in the lamination frame (Na,) [rad]
+
+    Returns
+    -------
+    Mr : ndarray
+        Radial magnetization (Na,) [A/m]
+    Mt : ndarray
+        Tangential magnetization (Na,) [A/m]
+    """
+
+    magnet = lam.magnet
+    Zs = lam.slot.Zs
+    alpha_mag = lam.slot.comp_angle_active_eq()
+    M = magnet.mat_type.mag.get_Brm(T_op=self.T_mag) / mu_0
+
+    # Index and center angle of the magnet (slot pitch) of each angle
+    slot_pitch = 2 * pi / Zs
+    index = floor((angle % (2 * pi)) / slot_pitch)
+    alpha_center = (index + 0.5) * slot_pitch
+    offset = (angle % (2 * pi)) - alpha_center
+    is_magnet = abs(offset) <= alpha_mag / 2
+    is_south = (index % 2) == 1
+
+    # Direction of the magnetization
+    type_mag = magnet.type_magnetization
+    if type_mag == 0:  # Radial
+        direction = angle + pi * is_south
+    elif type_mag == 1:  # Parallel
+        direction = alpha_center + pi * is_south
+    elif type_mag == 2:  # Hallbach
+        direction = -(Zs / 2 - 1) * angle + pi / 2
+    elif type_mag == 3:  # Tangential
+        direction = alpha_center - pi / 2 + pi * is_south
+    else:
+        raise NotImplementedYetError(
+            "Magnetization type " + str(type_mag) + " is not available in MagPMMF"
+        )
+
+    Mr = zeros_like(angle)
+    Mt = zeros_like(angle)
+    Mr[is_magnet] = M * cos(direction - angle)[is_magnet]
+    Mt[is_magnet] = M * sin(direction - angle)[is_magnet]
+    return Mr, Mt
@@ -0,0 +1,48 @@
+from numpy import pi, sqrt, cos, ones_like, minimum
+
+
+def comp_permeance_slot(self, lam, angle, g_eff):
+    """Compute the relative permeance function of the slot openings of a
+    lamination (slots centered between the teeth, the first tooth is centered
+    on the X axis):
+    lambda = 1 - beta - beta * cos(pi * x / (0.8 * alpha_0)) for |x| < 0.8 * alpha_0
+    with x the angle from the slot center, alpha_0 the slot opening angle and
+    beta = (1 - 1 / sqrt(1 + (b0 / (2 * g_eff)) ** 2)) / 2 (Carter)
+
+    Parameters
+    ----------
+    self : MagPMMF
+        a MagPMMF object
+    lam : Lamination
+        Lamination with slots
+    angle : ndarray
+        Angles in the lamination frame [rad]
+    g_eff : float
+        Effective airgap width (magnets included) [m]
+
+    Returns
+    -------
+    perm : ndarray
+        Relative permeance function (same shape as angle)
+    """
+
+    perm = ones_like(angle)
+    slot = getattr(lam, "slot", None)
+    if slot is None:
+        return perm
+    alpha_0 = slot.comp_angle_opening()
+    if alpha_0 <= 0:  # Closed slots
+        return perm
+
+    Zs = slot.Zs
+    slot_pitch = 2 * pi / Zs
+    b0 = alpha_0 * lam.get_Rbo()
+    beta = (1 - 1 / sqrt(1 + (b0 / (2 * g_eff)) ** 2)) / 2
+    alpha_lim = minimum(0.8 * alpha_0, slot_pitch / 2)
+
+    # Angle from the closest slot center
+    x = (angle - slot_pitch / 2) % slot_pitch
+    x[x > slot_pitch / 2] -= slot_pitch
+    is_slot = abs(x) < alpha_lim
+    perm[is_slot] = 1 - beta - beta * cos(pi * x[is_slot] / alpha_lim)
+    return perm
@@ -0,0 +1,137 @@
+from numpy import zeros, log, newaxis
+from numpy.linalg import solve
+from scipy.constants import mu_0
+
+
+def solve_field_harm(
+    self, k, radius_list, mur_list, M_list, K_in=None, K_out=None, r_eval=None
+):
+    """Solve the 2D magnetostatic field of the airgap for each spatial harmonic:
+    the layers between the two (infinitely permeable) laminations are
+    concentric rings of uniform permeability (airgap, magnets) with a
+    magnetization source and the windings are current sheets on the
+    lamination bores. The vector potential of the harmonic k in each layer is
+    C (r/Rb)^k + D (Ra/r)^k + particular solution of the magnetization.
+
+    Parameters
+    ----------
+    self : MagPMMF
+        a MagPMMF object
+    k : ndarray
+        Spatial harmonic orders (Nk,) (>= 1)
+    radius_list : list
+        Radius of the layer boundaries from the inner lamination bore to the
+        outer lamination bore (L+1) [m]
+    mur_list : list
+        Relative permeability of each layer (L)
+    M_list : list
+        For each layer, None or a tuple of the complex harmonics of the radial
+        and tangential magnetization (Nk,Nt) [A/m]
+    K_in : ndarray
+        Complex harmonics of the current sheet on the inner lamination bore
+        (Nk,Nt) [A/m]
+    K_out : ndarray
+        Complex harmonics of the current sheet on the outer lamination bore
+        (Nk,Nt) [A/m]
+    r_eval : list
+        Radius to evaluate the flux density at [m]
+
+    Returns
+    -------
+    B_list : list
+        For each radius of r_eval, tuple of the complex harmonics of the radial
+        and tangential flux density (Nk,Nt) [T]
+    """
+
+    L = len(mur_list)
+    Nk = k.size
+    Nt = 1
+    for source in M_list + [K_in, K_out]:
+        if source is not None:
+            Nt = (source[0] if isinstance(source, tuple) else source).shape[1]
+    kc = k[:, newaxis]
+
+    def comp_part(ll, r):
+        """Particular solution of the layer ll (vector potential, derivative
+        and mu_0 * tangential magnetization)"""
+        if M_list[ll] is None:
+            z = zeros((Nk, Nt), dtype=complex)
+            return z, z, z
+        Mr, Mt = M_list[ll]
+        S = -mu_0 * (Mt - 1j * kc * Mr)
+        A = zeros((Nk, Nt), dtype=complex)
+        dA = zeros((Nk, Nt), dtype=complex)
+        is_one = k == 1
+        coeff = 1 / (1 - k[~is_one] ** 2)
+        A[~is_one] = S[~is_one] * r * coeff[:, newaxis]
+        dA[~is_one] = S[~is_one] * coeff[:, newaxis]
+        A[is_one] = S[is_one] / 2 * r * log(r)
+        dA[is_one] = S[is_one] / 2 * (log(r) + 1)
+        return A, dA, mu_0 * Mt
+
+    def comp_base(ll, r):
+        """Homogeneous solutions of the layer ll at radius r (Nk,)"""
+        Ra, Rb = radius_list[ll], radius_list[ll + 1]
+        return (r / Rb) ** k, (Ra / r) ** k
+
+    # mu_0 * Htan = (-dA/dr - mu_0 * Mt) / mur
+    mat = zeros((Nk, 2 * L, 2 * L))
+    rhs = zeros((Nk, 2 * L, Nt), dtype=complex)
+
+    # Inner bore: Htan = K_in
+    R = radius_list[0]
+    u1, u2 = comp_base(0, R)
+    _, dAp, Mt = comp_part(0, R)
+    mat[:, 0, 0] = -k / R * u1 / mur_list[0]
+    mat[:, 0, 1] = k / R * u2 / mur_list[0]
+    rhs[:, 0] = (dAp + Mt) / mur_list[0]
+    if K_in is not None:
+        rhs[:, 0] += mu_0 * K_in
+
+    # Interfaces: continuity of the vector potential and of Htan
+    for ll in range(L - 1):
+        R = radius_list[ll + 1]
+        u1, u2 = comp_base(ll, R)
+        v1, v2 = comp_base(ll + 1, R)
+        Ap1, dAp1, Mt1 = comp_part(ll, R)
+        Ap2, dAp2, Mt2 = comp_part(ll + 1, R)
+        row = 2 * ll + 1
+        mat[:, row, 2 * ll] = u1
+        mat[:, row, 2 * ll + 1] = u2
+        mat[:, row, 2 * ll + 2] = -v1
+        mat[:, row, 2 * ll + 3] = -v2
+        rhs[:, row] = Ap2 - Ap1
+        row += 1
+        mat[:, row, 2 * ll] = -k / R * u1 / mur_list[ll]
+        mat[:, row, 2 * ll + 1] = k / R * u2 / mur_list[ll]
+        mat[:, row, 2 * ll + 2] = k / R * v1 / mur_list[ll + 1]
+        mat[:, row, 2 * ll + 3] = -k / R * v2 / mur_list[ll + 1]
+        rhs[:, row] = (dAp1 + Mt1) / mur_list[ll] - (dAp2 + Mt2) / mur_list[ll + 1]
+
+    # Outer bore: Htan = -K_out
+    R = radius_list[-1]
+    u1, u2 = comp_base(L - 1, R)
+    _, dAp, Mt = comp_part(L - 1, R)
+    mat[:, -1, -2] = -k / R * u1 / mur_list[-1]
+    mat[:, -1, -1] = k / R * u2 / mur_list[-1]
+    rhs[:, -1] = (dAp + Mt) / mur_list[-1]
+    if K_out is not None:
+        rhs[:, -1] -= mu_0 * K_out
+
+    # Solve all the harmonics at once (Nk,2L,Nt)
+    coeff = solve(mat, rhs)
+
+    # Flux density: Br = 1/r dA/dtheta, Bt = -dA/dr
+    B_list = list()
+    for r in r_eval:
+        ll = 0
+        while ll < L - 1 and r > radius_list[ll + 1]:
+            ll += 1
+        u1, u2 = comp_base(ll, r)
+        Ap, dAp, _ = comp_part(ll, r)
+        C, D = coeff[:, 2 * ll], coeff[:, 2 * ll + 1]
+        A = C * u1[:, newaxis] + D * u2[:, newaxis] + Ap
+        dA = kc / r * (C * u1[:, newaxis] - D * u2[:, newaxis]) + dAp
+        B_list.append((1j * kc * A / r, -dA))
+
+    return B_list
@@ -0,0 +1,138 @@
+from multiprocessing import Pool, cpu_count
+from os import makedirs
+from os.path import abspath, basename, isdir, isfile, join
+from shutil import copyfile, copytree
+
+from cloudpickle import dumps, loads
+
+
+def comp_flux_airgap_parallel(
+    self, output, axes_dict, slice_index, Is_val=None, Ir_val=None
+):
+    """Run comp_flux_airgap on several slices with a process pool
+    (one comp_flux_airgap call per slice, nb_worker_slice processes).
+    Each slice is solved in its own result folder (Slice_<index>) with its
+    own copy of the reused files (import_file): the FEA files (.fem, .ans,
+    mesh...) are not shared by the workers.
+
+    Parameters
+    ----------
+    self : Magnetics
+        a Magnetics object
+    output : Output
+        an Output object
+    axes_dict: {Data}
+        Dict of axes used for magnetic calculation
+    slice_index : list
+        Indices of the slices to solve (in output.mag.Slice)
+    Is_val : ndarray
+        Stator current (qs,Nt)
+    Ir_val : ndarray
+        Rotor current (qr,Nt)
+
+    Returns
+    -------
+    out_dict_list: [dict]
+        List of the comp_flux_airgap out_dict (same order as slice_index)
+    """
+
+    logger = self.get_logger()
+    slice_model = output.mag.Slice
+    Nslices = len(slice_index)
+
+    # Check method parameters
+    nb_worker = self.nb_worker_slice
+    if nb_worker > cpu_count():
+        logger.warning(
+            f"Parallelization is set on {nb_worker} processes while "
+            + f"your computer only has {cpu_count()}."
+        )
+    if nb_worker > Nslices:
+        logger.debug(
+            f"{nb_worker} workers requested for {Nslices} slices. "
+            + f"Using {Nslices} workers instead"
+        )
+        nb_worker = Nslices
+
+    # Folder of the files of the solver to copy in the slice folders
+    path_result = output.get_path_result()
+    if getattr(self, "import_file", None) and hasattr(self, "get_path_save"):
+        save_dir = self.get_path_save(output)
+    else:
+        save_dir = None
+
+    # Serialize the common data only once (cloudpickle to support functions)
+    common = dumps((self, output, axes_dict, Is_val, Ir_val))
+    args = [
+        (
+            common,
+            join(path_result, "Slice_" + str(index)),
+            save_dir,
+            float(slice_model.angle_stator[index]),
+            float(slice_model.angle_rotor[index]),
+        )
+        for index in slice_index
+    ]
+
+    logger.info(
+        "Solving " + str(Nslices) + " slices on " + str(nb_worker) + " processes"
+    )
+    # Creating processes pool (results are returned in the slice order)
+    with Pool(nb_worker) as p:
+        out_dict_list = p.starmap(_comp_flux_airgap_slice, args)
+
+    # Same state as after the sequential slice loop
+    self.angle_stator_shift = args[-1][3]
+    self.angle_rotor_shift = args[-1][4]
+
+    return [loads(out_dict) for out_dict in out_dict_list]
+
+
+def _comp_flux_airgap_slice(
+    common, slice_path, save_dir, angle_stator_shift, angle_rotor_shift
+):
+    """Solve one slice in a worker process (self and output are copies) in the
+    folder slice_path"""
+
+    mag, output, axes_dict, Is_val, Ir_val = loads(common)
+    set_slice_path(mag, output, slice_path, save_dir)
+    # Assign stator and rotor angle shifts
+    mag.angle_stator_shift = angle_stator_shift
+    mag.angle_rotor_shift = angle_rotor_shift
+
+    out_dict = mag.comp_flux_airgap(output, axes_dict, Is_val=Is_val, Ir_val=Ir_val)
+    return dumps(out_dict)
+
+
+def set_slice_path(mag, output, slice_path, save_dir=None):
+    """Set the result folder of the slice and copy the files of the solver
+    reused by the slice (import_file)
+
+    Parameters
+    ----------
+    mag : Magnetics
+        Magnetics object of the slice (copy)
+    output : Output
+        Output of the slice (copy)
+    slice_path : str
+        Result folder of the slice
+    save_dir : str
+        Folder of the solver files to copy (None to copy nothing)
+    """
+
+    if not isdir(slice_path):
+        makedirs(slice_path)
+    output.path_result = slice_path
+    if save_dir is None:
+        return
+    # Copy of the solver folder (FEMM .fem, Elmer mesh...)
+    slice_dir = mag.get_path_save(output)
+    if isdir(save_dir):
+        copytree(save_dir, slice_dir, dirs_exist_ok=True)
+    import_file = abspath(mag.import_file).replace("\\", "/")
+    save_dir = abspath(save_dir).replace("\\", "/")
+    if import_file.startswith(save_dir + "/"):
+        mag.import_file = slice_dir + import_file[len(save_dir) :]
+    elif isfile(import_file):
+        mag.import_file = join(slice_dir, basename(import_file))
+        copyfile(import_file, mag.import_file)
@@ -1,5 +1,6 @@
 from numpy import zeros, ndarray, iscomplexobj, tile
 
+from ....Functions.is_daemon_process import is_daemon_process
 from ....Methods.Simulation.Input import InputError
 
 
@@ -103,22 +104,43 @@ def run(self):
                             tuple([s for s in field.shape] + [Nslices]), dtype=dtype
                         )
                         out_dict[key][key2][..., 0] = field
-        # Loop over other slices
-        for ii, index in enumerate(unique_indices[1:]):
+        # Solve other slices in parallel (if requested)
+        is_parallel = self.nb_worker_slice > 1
+        if is_parallel and is_daemon_process():
+            # A worker process can't start a process pool (nested VarSimu...)
             self.get_logger().info(
-                "Solving slice " + str(ii + 2) + " / " + str(Nslices)
+                "Already in a worker process: solving the slices sequentially"
             )
-            # Assign stator and rotor angle shifts
-            self.angle_stator_shift = float(slice_model.angle_stator[index])
-            self.angle_rotor_shift = float(slice_model.angle_rotor[index])
-
-            # Calculate airgap flux
-            out_dict_index = self.comp_flux_airgap(
+            is_parallel = False
+        if is_parallel:
+            out_dict_list = self.comp_flux_airgap_parallel(
                 output,
                 axes_dict,
+                slice_index=unique_indices[1:],
                 Is_val=Is_val,
                 Ir_val=Ir_val,
             )
+        else:
+            out_dict_list = None
+        # Loop over other slices
+        for ii, index in enumerate(unique_indices[1:]):
+            if out_dict_list is not None:
+                out_dict_index = out_dict_list[ii]
+            else:
+                self.get_logger().info(
+                    "Solving slice " + str(ii + 2) + " / " + str(Nslices)
+                )
+                # Assign stator and rotor angle shifts
+                self.angle_stator_shift = float(slice_model.angle_stator[index])
+                self.angle_rotor_shift = float(slice_model.angle_rotor[index])
+
+                # Calculate airgap flux
+                out_dict_index = self.comp_flux_airgap(
+                    output,
+                    axes_dict,
+                    Is_val=Is_val,
+                    Ir_val=Ir_val,
+                )
 
             # Store in out_dict matrices
             for key in out_dict_index:
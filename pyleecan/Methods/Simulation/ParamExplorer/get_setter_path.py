@@ -0,0 +1,29 @@
+import re
+
+# Lambda generated by _set_setter from a path (e.g. simu.machine.rotor.slot.W0)
+SETTER_PATH_PATTERN = re.compile(
+    r"^lambda simu, val: setattr\(eval\('(.+)'\), '(.+)', val\)$"
+)
+
+
+def get_setter_path(self):
+    """Return the path of the property modified by the setter
+    (only if the setter was defined with a path like "simu.machine.rotor.slot.W0")
+
+    Parameters
+    ----------
+    self : ParamExplorer
+        A ParamExplorer object
+
+    Returns
+    -------
+    path : str
+        Path of the modified property (None if the setter is a function)
+    """
+
+    if self._setter_str is None:
+        return None
+    match = SETTER_PATH_PATTERN.match(self._setter_str)
+    if match is None:
+        return None
+    return match.group(1) + "." + match.group(2)
@@ -0,0 +1,153 @@
+from ....Classes._frozen import FrozenClass
+from ....Classes.Material import Material
+from ....Functions.get_memo import SKIP_ATTR
+from ....Functions.Load.load_pkb import loads_pkb
+from ....Functions.Save.save_pkb import dumps_pkb
+
+
+def copy_shared(self, path_list=None, **kwargs):
+    """Return a copy of the simulation that shares the machine with the
+    original one (copy-on-write): the machine is shared if the path_list
+    doesn't modify it. Otherwise the machine is copied (so that every object
+    of the copy reaches the modified objects through its parent) but the
+    materials that are not modified by the path_list are shared (the material
+    methods don't use the parent).
+    The other simulation objects (input, modules...) are always copied.
+    The full simulation is copied if it has post-processings (that can modify
+    the machine).
+
+    Parameters
+    ----------
+    self : Simulation
+        A Simulation object
+    path_list : [str]
+        List of the properties that will be modified on the copy
+        (ex: ["simu.machine.rotor.slot.W0", "simu.input"]).
+        None to copy the full simulation
+    **kwargs : dict
+        Parameters of copy/as_dict (ex: keep_function=True)
+
+    Returns
+    -------
+    other : Simulation
+        Copy of the simulation
+    """
+
+    if path_list is None or self.machine is None or self.postproc_list:
+        return self.copy(**kwargs)
+
+    # Find the machine properties to modify
+    machine_path_list = list()
+    for path in path_list:
+        path_split = path.split(".")
+        if path_split[0] == "simu":
+            path_split = path_split[1:]
+        if len(path_split) == 0:  # Whole simulation modified
+            return self.copy(**kwargs)
+        if path_split[0].split("[")[0] == "machine":
+            machine_path_list.append(path_split)
+
+    # Copy everything but the machine
+    machine = self.machine
+    self._machine = None
+    try:
+        other = self.copy(**kwargs)
+    finally:
+        self._machine = machine
+
+    if not machine_path_list:
+        # Shared machine (parent is still the original simulation, the machine
+        # methods don't use it)
+        other._machine = machine
+    else:
+        other.machine = copy_machine(self, machine_path_list, **kwargs)
+
+    return other
+
+
+def copy_machine(simu, machine_path_list, **kwargs):
+    """Copy the machine of the simulation with the materials that are not
+    modified by machine_path_list (the copy uses the same material objects)
+
+    Parameters
+    ----------
+    simu : Simulation
+        A Simulation object
+    machine_path_list : [[str]]
+        Split path of the modified machine properties
+        (ex: [["machine", "rotor", "hole[0]", "W1"]])
+    **kwargs : dict
+        Parameters of copy/as_dict (ex: keep_function=True)
+
+    Returns
+    -------
+    other_machine : Machine
+        Copy of the machine
+    """
+
+    machine = simu.machine
+    modified_list = list()  # Objects on the modified paths
+    for path_split in machine_path_list:
+        obj = simu
+        try:
+            for name in path_split[:-1]:
+                obj = getattr(obj, name.split("[")[0])
+                for index in name.split("[")[1:]:
+                    obj = obj[int(index[:-1])]
+                modified_list.append(id(obj))
+        except (AttributeError, IndexError, TypeError, ValueError):
+            return machine.copy(**kwargs)  # Unknown path: nothing is shared
+
+    shared_list = [
+        mat for mat in get_material_list(machine) if id(mat) not in modified_list
+    ]
+    if not shared_list:
+        return machine.copy(**kwargs)
+    # The copy of the parent objects sets the parent of the shared materials
+    parent_list = [mat.parent for mat in shared_list]
+    try:
+        data, buffer_list = dumps_pkb(machine, shared_list=shared_list)
+    except Exception:
+        return machine.copy(**kwargs)
+    # The copy has its own arrays
+    buffer_list = [bytearray(buffer.raw()) for buffer in buffer_list]
+    other_machine = loads_pkb(data, buffer_list, shared_list=shared_list)
+    for mat, parent in zip(shared_list, parent_list):
+        mat.__dict__["parent"] = parent
+    return other_machine
+
+
+def get_material_list(obj, mat_list=None):
+    """Return the materials of a pyleecan object and of its sub-objects
+    (each material once)
+
+    Parameters
+    ----------
+    obj : FrozenClass
+        A pyleecan object
+    mat_list : list
+        Materials already found
+
+    Returns
+    -------
+    mat_list : [Material]
+        Materials of the object
+    """
+
+    if mat_list is None:
+        mat_list = list()
+    if isinstance(obj, Material):
+        if all(mat is not obj for mat in mat_list):
+            mat_list.append(obj)
+        return mat_list
+    for name, value in obj.__dict__.items():
+        if name in SKIP_ATTR:
+            continue
+        if isinstance(value, dict):
+            value = list(value.values())
+        if not isinstance(value, list):
+            value = [value]
+        for val in value:
+            if isinstance(val, FrozenClass):
+                get_material_list(val, mat_list)
+    return mat_list
@@ -27,8 +27,15 @@ def generate_simulation_list(self, ref_simu=None):
 
     # Create Simulations 1 per load
     for input_obj in list_input:
-        # Generate the simulation
-        new_simu = ref_simu.copy(keep_function=True)
+        # Generate the simulation (only the input is modified)
+        if (
+            self.is_reuse_machine
+            and not self.pre_keeper_postproc_list
+            and not self.post_keeper_postproc_list
+        ):
+            new_simu = ref_simu.copy_shared(["simu.input"], keep_function=True)
+        else:
+            new_simu = ref_simu.copy(keep_function=True)
 
         # Edit simulation
         new_simu.input = input_obj
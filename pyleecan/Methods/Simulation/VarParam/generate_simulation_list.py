@@ -44,10 +44,22 @@ def generate_simulation_list(self, ref_simu=None):
         "simulation_list": [],
     }
 
+    # Properties modified by the setters (to share the rest of the machine)
+    path_list = [
+        param_explorer.get_setter_path() for param_explorer in self.paramexplorer_list
+    ]
+    if (
+        not self.is_reuse_machine
+        or None in path_list
+        or self.pre_keeper_postproc_list
+        or self.post_keeper_postproc_list
+    ):
+        path_list = None  # Unknown modifications => full copy
+
     # Cartesian product to generate every simulation
     for simu_param_values in itertools.product(*params_value_list):
         # Generate the simulation
-        new_simu = ref_simu.copy(keep_function=True)
+        new_simu = ref_simu.copy_shared(path_list, keep_function=True)
 
         # Edit it using setter
         for setter, value, symbol in zip(
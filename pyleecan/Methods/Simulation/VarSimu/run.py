@@ -5,6 +5,7 @@ from ....Functions.Simulation.VarSimu.log_datakeeper_step_result import (
     log_datakeeper_step_result,
 )
 from ....Functions.Load.import_class import import_class
+from ....Functions.is_daemon_process import is_daemon_process
 
 
 def run(self):
@@ -112,40 +113,71 @@ def run(self):
         for simu in simulation_list:
             simu.postproc_list = self.pre_keeper_postproc_list
 
+    # Store the results of each simulation as soon as it is done (the
+    # simulations already in the store are skipped on restart)
+    skip_index = init_store(
+        self.store, xoutput, keeper_list, self.is_keep_all_output, logger
+    )
+
     # Execute the simulation list
-    for idx, simu_step in enumerate(simulation_list):
-        # Display simulation progress
-        log_step_simu(
-            idx, self.nb_simu, xoutput.paramexplorer_list, logger, simu_step.layer
+    is_parallel = self.nb_worker > 1
+    if is_parallel and is_daemon_process():
+        # A worker process can't start a process pool (nested VarSimu...)
+        logger.info("Already in a worker process: running the simulations sequentially")
+        is_parallel = False
+    if is_parallel:
+        for idx, simu_step in enumerate(simulation_list):
+            simu_step.index = idx
+        self.run_parallel(
+            simulation_list,
+            keeper_list,
+            ref_simu_index,
+            xoutput,
+            xoutput_ref,
+            skip_index=skip_index,
         )
-        simu_step.index = idx
-        if idx != ref_simu_index:
-            # Run the simulation & call DataKeeper and post-proc handling errors
-            xoutput_step = run_multisim_step(
-                simu_step,
-                keeper_list,  # datakeeper.result will be updated (if needed)
-                self.stop_if_error,
-                post_keeper_postproc_list=self.post_keeper_postproc_list,
-                simu_type=self.NAME,
+    else:
+        for idx, simu_step in enumerate(simulation_list):
+            simu_step.index = idx
+            if idx in skip_index:
+                progress += 1
+                print_progress_bar(nb_simu, progress, simu_step.layer)
+                continue
+            # Display simulation progress
+            log_step_simu(
+                idx, self.nb_simu, xoutput.paramexplorer_list, logger, simu_step.layer
             )
-            if self.is_keep_all_output:
-                xoutput.output_list[idx] = xoutput_step
-        else:
-            if simu_step.layer == 2:
-                logger.info(
-                    "    Simulation matches reference one: Skipping computation"
+            if idx != ref_simu_index:
+                # Run the simulation & call DataKeeper and post-proc handling errors
+                xoutput_step = run_multisim_step(
+                    simu_step,
+                    keeper_list,  # datakeeper.result will be updated (if needed)
+                    self.stop_if_error,
+                    post_keeper_postproc_list=self.post_keeper_postproc_list,
+                    simu_type=self.NAME,
                 )
+                if self.is_keep_all_output:
+                    xoutput.output_list[idx] = xoutput_step
             else:
-                logger.info("Simulation matches reference one: Skipping computation")
-            # Copy results from reference
-            for keeper in keeper_list:
-                keeper.result[idx] = keeper.result_ref
-            if self.is_keep_all_output:
-                xoutput.output_list[idx] = xoutput_ref
-            # Print DataKeeper content
-            log_datakeeper_step_result(simu_step, keeper_list, idx, self.NAME)
-        progress += 1
-        print_progress_bar(nb_simu, progress, simu_step.layer)
+                if simu_step.layer == 2:
+                    logger.info(
+                        "    Simulation matches reference one: Skipping computation"
+                    )
+                else:
+                    logger.info(
+                        "Simulation matches reference one: Skipping computation"
+                    )
+                # Copy results from reference
+                for keeper in keeper_list:
+                    keeper.result[idx] = keeper.result_ref
+                if self.is_keep_all_output:
+                    xoutput.output_list[idx] = xoutput_ref
+                xoutput_step = xoutput_ref
+                # Print DataKeeper content
+                log_datakeeper_step_result(simu_step, keeper_list, idx, self.NAME)
+            save_step(self.store, keeper_list, idx, xoutput_step)
+            progress += 1
+            print_progress_bar(nb_simu, progress, simu_step.layer)
 
     # Running postprocessings
     if self.postproc_list:
@@ -154,6 +186,69 @@ def run(self):
             postproc.run(xoutput)
 
 
+def init_store(store, xoutput, keeper_list, is_keep_all_output, logger):
+    """Initialize the store of the multi-simulation (if any) and load the
+    results of the simulations already in the store (restart)
+
+    Parameters
+    ----------
+    store : XOutputStore
+        Store of the multi-simulation (None to skip)
+    xoutput : XOutput
+        XOutput of the multi-simulation
+    keeper_list : [DataKeeper]
+        List of DataKeeper to update (result list)
+    is_keep_all_output : bool
+        True to load the Output of the simulations
+    logger : Logger
+        Logger to use (info)
+
+    Returns
+    -------
+    skip_index : set
+        Indices of the simulations already in the store (to skip)
+    """
+
+    if store is None:
+        return set()
+    skip_index = set(store.init_file(xoutput))
+    if len(skip_index) > 0:
+        logger.info(
+            str(len(skip_index)) + " simulations loaded from " + store.save_path
+        )
+    for idx in skip_index:
+        step_dict = store.get_step(idx, is_load_output=is_keep_all_output)
+        for keeper in keeper_list:
+            keeper.result[idx] = step_dict["result"].get(keeper.symbol)
+        if is_keep_all_output:
+            xoutput.output_list[idx] = step_dict["output"]
+    return skip_index
+
+
+def save_step(store, keeper_list, index, output):
+    """Save the DataKeeper results (and the Output) of a simulation in the
+    store (if any)
+
+    Parameters
+    ----------
+    store : XOutputStore
+        Store of the multi-simulation (None to skip)
+    keeper_list : [DataKeeper]
+        List of DataKeeper with the results of the simulation
+    index : int
+        Index of the simulation
+    output : Output
+        Output of the simulation
+    """
+
+    if store is not None:
+        store.add_step(
+            index,
+            {keeper.symbol: keeper.result[index] for keeper in keeper_list},
+            output=output,
+        )
+
+
 def log_step_simu(index, nb_simu, paramexplorer_list, logger, layer):
     """Add in the log some information about the simulation about to run
     Ex: "Running simulation 3/4 with Id=-135.41881, Iq=113.62987"
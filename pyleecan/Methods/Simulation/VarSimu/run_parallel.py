@@ -0,0 +1,240 @@
+from multiprocessing import Pool, cpu_count
+from os import makedirs
+from os.path import basename, isdir, isfile, join
+from shutil import copyfile
+from traceback import format_exc
+
+from cloudpickle import dumps, loads
+
+from ....Functions.Simulation.VarSimu.run_multisim_step import run_multisim_step
+from ....Functions.Simulation.VarSimu.log_datakeeper_step_result import (
+    log_datakeeper_step_result,
+)
+from .run import log_step_simu, print_progress_bar, save_step
+
+# Data shared by all the simulations of a worker process (set by _init_worker)
+_worker_dict = dict()
+
+
+def run_parallel(
+    self,
+    simulation_list,
+    keeper_list,
+    ref_simu_index,
+    xoutput,
+    xoutput_ref,
+    skip_index=None,
+):
+    """Run the simulation list of the multi-simulation with a process pool
+    (nb_worker processes). Only the datakeeper results (and the Output if
+    is_keep_all_output or saved in the store) are sent back by the workers.
+    The results are saved in the store by the main process.
+    Each simulation is run in its own result folder (Step_<index>) with its
+    own copy of the reused FEA file (cf is_reuse_femm_file): the FEMM/Elmer
+    files are not shared by the workers.
+
+    Parameters
+    ----------
+    self : VarSimu
+        A VarSimu object
+    simulation_list : [Simulation]
+        List of the simulations to run (simu.index must be set)
+    keeper_list : [DataKeeper]
+        List of DataKeeper to update (result list)
+    ref_simu_index : int
+        Index of the simulation matching the reference one (None if no match)
+    xoutput : XOutput
+        XOutput to store the results
+    xoutput_ref : Output
+        Output of the reference simulation
+    skip_index : set
+        Indices of the simulations to skip (already in the store)
+
+    Returns
+    -------
+    None
+    """
+
+    logger = self.get_logger()
+    nb_simu = self.nb_simu + 1  # Count reference simulation in progress bar
+    progress = 1  # Reference simulation is already done
+    layer = simulation_list[0].layer if len(simulation_list) > 0 else 1
+    if skip_index is None:
+        skip_index = set()
+    # The Output are sent back to be kept or saved in the store
+    is_send_output = self.is_keep_all_output or (
+        self.store is not None and self.store.is_save_output
+    )
+
+    # Simulation matching the reference one: copy results from reference
+    task_list = list()
+    for idx, simu_step in enumerate(simulation_list):
+        if idx in skip_index:
+            progress += 1
+            print_progress_bar(nb_simu, progress, layer)
+        elif idx == ref_simu_index:
+            log_step_simu(
+                idx, self.nb_simu, xoutput.paramexplorer_list, logger, simu_step.layer
+            )
+            if simu_step.layer == 2:
+                logger.info(
+                    "    Simulation matches reference one: Skipping computation"
+                )
+            else:
+                logger.info("Simulation matches reference one: Skipping computation")
+            for keeper in keeper_list:
+                keeper.result[idx] = keeper.result_ref
+            if self.is_keep_all_output:
+                xoutput.output_list[idx] = xoutput_ref
+            log_datakeeper_step_result(simu_step, keeper_list, idx, self.NAME)
+            save_step(self.store, keeper_list, idx, xoutput_ref)
+            progress += 1
+            print_progress_bar(nb_simu, progress, layer)
+        else:
+            task_list.append(idx)
+
+    if len(task_list) == 0:
+        return
+
+    # Check method parameters
+    nb_worker = self.nb_worker
+    if nb_worker > cpu_count():
+        logger.warning(
+            f"Parallelization is set on {nb_worker} processes while "
+            + f"your computer only has {cpu_count()}."
+        )
+    if nb_worker > len(task_list):
+        nb_worker = len(task_list)
+    logger.info(
+        "Running "
+        + str(len(task_list))
+        + " simulations on "
+        + str(nb_worker)
+        + " processes"
+    )
+
+    # Data common to all the simulations (serialized once per worker)
+    common = dumps(
+        (
+            keeper_list,
+            self.stop_if_error,
+            self.post_keeper_postproc_list,
+            self.NAME,
+            is_send_output,
+        )
+    )
+    path_result = xoutput.get_path_result()
+    args = list()
+    for idx in task_list:
+        # Parameters of the simulations (logged when submitted)
+        log_step_simu(
+            idx,
+            self.nb_simu,
+            xoutput.paramexplorer_list,
+            logger,
+            simulation_list[idx].layer,
+        )
+        args.append(
+            (idx, dumps(simulation_list[idx]), join(path_result, "Step_" + str(idx)))
+        )
+
+    with Pool(nb_worker, initializer=_init_worker, initargs=(common,)) as p:
+        # Results are collected in completion order and stored by index
+        for idx, result_list, output, error in p.imap_unordered(_run_step_worker, args):
+            simu_step = simulation_list[idx]
+            if error is not None:
+                logger.error(
+                    "ERROR while running simulation " + str(idx) + ":\n" + error
+                )
+                if self.stop_if_error:
+                    raise RuntimeError(
+                        "Simulation "
+                        + str(idx)
+                        + " failed in worker process:\n"
+                        + error
+                    )
+                # Isolate the error on the step
+                for keeper in keeper_list:
+                    if keeper.error_keeper is None:
+                        keeper.result[idx] = None
+                    else:
+                        keeper.result[idx] = keeper.error_keeper(simu_step)
+            else:
+                for keeper, value in zip(keeper_list, result_list):
+                    keeper.result[idx] = value
+                if output is not None:
+                    output = loads(output)
+                if self.is_keep_all_output:
+                    xoutput.output_list[idx] = output
+            save_step(self.store, keeper_list, idx, output)
+            progress += 1
+            print_progress_bar(nb_simu, progress, layer)
+
+
+def _init_worker(common):
+    """Load the data shared by all the simulations of the worker"""
+    _worker_dict["common"] = loads(common)
+
+
+def _run_step_worker(args):
+    """Run one simulation of the multi-simulation in a worker process
+
+    Returns
+    -------
+    idx : int
+        Index of the simulation
+    result_list : list
+        Datakeeper results (same order as keeper_list)
+    output : bytes
+        Serialized Output (None if not sent back or error)
+    error : str
+        Traceback of the error (None if no error)
+    """
+    idx, simu_bytes, step_path = args
+    (
+        keeper_list,
+        stop_if_error,
+        post_keeper_postproc_list,
+        simu_type,
+        is_send_output,
+    ) = _worker_dict["common"]
+    try:
+        simu_step = loads(simu_bytes)
+        set_step_path(simu_step, step_path)
+        # Run the simulation & call DataKeeper and post-proc handling errors
+        output = run_multisim_step(
+            simu_step,
+            keeper_list,  # datakeeper.result[idx] will be updated
+            stop_if_error,
+            post_keeper_postproc_list=post_keeper_postproc_list,
+            simu_type=simu_type,
+        )
+        result_list = [keeper.result[idx] for keeper in keeper_list]
+        if is_send_output and output is not None:
+            output = dumps(output)
+        else:
+            output = None
+        return idx, result_list, output, None
+    except Exception:
+        return idx, None, None, format_exc()
+
+
+def set_step_path(simu, step_path):
+    """Set the result folder of a simulation run by a worker and copy the FEA
+    file reused by the simulation (import_file) in this folder
+
+    Parameters
+    ----------
+    simu : Simulation
+        Simulation to run in a worker
+    step_path : str
+        Result folder of the simulation
+    """
+
+    if not isdir(step_path):
+        makedirs(step_path)
+    simu.path_result = step_path
+    import_file = getattr(simu.mag, "import_file", None)
+    if import_file and isfile(import_file):
+        simu.mag.import_file = join(step_path, basename(import_file))
+        copyfile(import_file, simu.mag.import_file)
@@ -2,7 +2,7 @@
 
 
 def comp_surface(self, Ndisc=200):
-    """Compute the Slot total surface (by numerical computation).
+    """Compute the Slot total surface (from the surface of get_surface).
     Caution, the bottom of the Slot is an Arc
 
     Parameters
@@ -10,7 +10,7 @@ def comp_surface(self, Ndisc=200):
     self : Slot
         A Slot object
     Ndisc : int
-        Number of point to discretize the lines
+        Not used (cf SurfLine.comp_surface)
 
     Returns
     -------